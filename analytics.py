@@ -1,15 +1,33 @@
+import os
+
+import streamlit as st
 import streamlit.components.v1 as components
 
+# ID projektu Clarity; pusty / "0" / "off" wyłącza analitykę (np. w testach obciążenia)
+CLARITY_ID = os.environ.get('ADYEN_CLARITY_ID', 'vipt8ozvdk')
+
+
+def clarity_enabled():
+    return CLARITY_ID.strip().lower() not in ('', '0', 'off', 'false')
+
+
 def inject_clarity():
-    # Zmodyfikowany kod dla ID: vipt8ozvdk
-    # Używamy window.parent, aby wyjść z iframe Streamlit
-    clarity_js = """
+    # Tag ładuje się do window.parent, więc wystarczy raz na sesję przeglądarki:
+    # kolejne reruny nie montują już ukrytego iframe'a
+    if not clarity_enabled() or st.session_state.get('_clarity_injected'):
+        return
+    st.session_state['_clarity_injected'] = True
+
+    # Używamy window.parent, aby wyjść z iframe Streamlit; guard chroni przed
+    # podwójnym ładowaniem po ponownym połączeniu sesji
+    clarity_js = f"""
     <script type="text/javascript">
-        (function(c,l,a,r,i,t,y){
-            c[a]=c[a]||function(){(c[a].q=c[a].q||[]).push(arguments)};
+        (function(c,l,a,r,i,t,y){{
+            if(c[a]){{return;}}
+            c[a]=c[a]||function(){{(c[a].q=c[a].q||[]).push(arguments)}};
             t=l.createElement(r);t.async=1;t.src="https://www.clarity.ms/tag/"+i;
             y=l.getElementsByTagName(r)[0];y.parentNode.insertBefore(t,y);
-        })(window.parent, window.parent.document, "clarity", "script", "vipt8ozvdk");
+        }})(window.parent, window.parent.document, "clarity", "script", "{CLARITY_ID.strip()}");
     </script>
     """
     components.html(clarity_js, height=0, width=0)
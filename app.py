@@ -4,19 +4,26 @@ Focus: 2024-2026 Data Only
 Streamlit Application with Adyen Brand Identity (Dutch Design)
 """
 
+import os
+
 import streamlit as st
 
+import instrumentation
 from analytics import inject_clarity
 
+instrumentation.begin_rerun()
+
 # 1. Konfiguracja strony (musi być pierwsza)
-st.set_page_config(
-    page_title="Adyen Onboarding Research Dashboard",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="collapsed"
-)
+with instrumentation.stage("page_config"):
+    st.set_page_config(
+        page_title="Adyen Onboarding Research Dashboard",
+        page_icon="📊",
+        layout="wide",
+        initial_sidebar_state="collapsed"
+    )
 
-inject_clarity()
+with instrumentation.stage("inject_clarity"):
+    inject_clarity()
 
 # Mobile viewport meta tag — injected via JS since Streamlit controls <head>
 st.markdown("""
@@ -29,290 +36,408 @@ st.markdown("""
 </script>
 """, unsafe_allow_html=True)
 
-_adyen_pm_sim_html_b64 = "PCFET0NUWVBFIGh0bWw+CjxodG1sIGxhbmc9ImVuIj4KPGhlYWQ+CjxtZXRhIGNoYXJzZXQ9IlVURi04Ij4KPG1ldGEgbmFtZT0idmlld3BvcnQiIGNvbnRlbnQ9IndpZHRoPWRldmljZS13aWR0aCwgaW5pdGlhbC1zY2FsZT0xLjAiPgo8dGl0bGU+QWR5ZW4gUE0gU2ltdWxhdGlvbjwvdGl0bGU+CjxzdHlsZT4KQGltcG9ydCB1cmwoJ2h0dHBzOi8vZm9udHMuZ29vZ2xlYXBpcy5jb20vY3NzMj9mYW1pbHk9UGx1cytKYWthcnRhK1NhbnM6d2dodEAzMDA7NDAwOzUwMDs2MDA7NzAwJmRpc3BsYXk9c3dhcCcpOwo6cm9vdCB7CiAgLS1iZzojZjdmN2Y4OyAtLXdoaXRlOiNmZmZmZmY7IC0tbWlkbmlnaHQ6IzAwMTEyYzsgLS1zZWNvbmRhcnk6IzVjNjg3YzsKICAtLWJvcmRlcjpyZ2JhKDAsMTcsNDQsLjEwKTsgLS1ib3JkZXItc3Ryb25nOnJnYmEoMCwxNyw0NCwuMTYpOyAtLWZhaW50OnJnYmEoMCwxNyw0NCwuMDUpOwogIC0tZ3JlZW46IzBhYmY1MzsgLS1ncmVlbi1kaW06cmdiYSgxMCwxOTEsODMsLjA5KTsgLS1ncmVlbi1yaW5nOnJnYmEoMTAsMTkxLDgzLC4xOCk7CiAgLS1ibHVlOiMwMDcwZjU7IC0tYmx1ZS1kaW06cmdiYSgwLDExMiwyNDUsLjA4KTsKICAtLXJlZDojZTIyZDJkOyAtLXJlZC1kaW06cmdiYSgyMjYsNDUsNDUsLjA4KTsKICAtLW9yYW5nZTojZjU4MjBhOyAtLW9yYW5nZS1kaW06cmdiYSgyNDUsMTMwLDEwLC4xMCk7CiAgLS1wdXJwbGU6IzdjM2FlZDsgLS1wdXJwbGUtZGltOnJnYmEoMTI0LDU4LDIzNywuMDkpOwp9Cip7Ym94LXNpemluZzpib3JkZXItYm94O21hcmdpbjowO3BhZGRpbmc6MDt9CmJvZHl7YmFja2dyb3VuZDp2YXIoLS1iZyk7Y29sb3I6dmFyKC0tbWlkbmlnaHQpO2ZvbnQtZmFtaWx5OidQbHVzIEpha2FydGEgU2FucycsSGVsdmV0aWNhLEFyaWFsLHNhbnMtc2VyaWY7bWluLWhlaWdodDoxMDB2aDt9CgovKiBOQVYgKi8KbmF2e2JhY2tncm91bmQ6dmFyKC0td2hpdGUpO2JvcmRlci1ib3R0b206MXB4IHNvbGlkIHZhcigtLWJvcmRlcik7cGFkZGluZzowIDQ0cHg7ZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOnN0cmV0Y2g7cG9zaXRpb246c3RpY2t5O3RvcDowO3otaW5kZXg6MTAwO2dhcDowO30KLm5hdi1sb2dve2ZvbnQtc2l6ZToxM3B4O2ZvbnQtd2VpZ2h0OjcwMDtsZXR0ZXItc3BhY2luZzotLjAxZW07Y29sb3I6dmFyKC0tbWlkbmlnaHQpO3BhZGRpbmc6MTdweCAyOHB4IDE3cHggMDtib3JkZXItcmlnaHQ6MXB4IHNvbGlkIHZhcigtLWJvcmRlcik7bWFyZ2luLXJpZ2h0OjRweDtkaXNwbGF5OmZsZXg7YWxpZ24taXRlbXM6Y2VudGVyO2dhcDo4cHg7fQoubmF2LWxvZ28gLmRvdHt3aWR0aDo4cHg7aGVpZ2h0OjhweDtib3JkZXItcmFkaXVzOjUwJTtiYWNrZ3JvdW5kOnZhcigtLWdyZWVuKTt9Ci5uYXYtdGFie2ZvbnQtc2l6ZToxMS41cHg7Zm9udC13ZWlnaHQ6NTAwO2NvbG9yOnZhcigtLXNlY29uZGFyeSk7cGFkZGluZzowIDE2cHg7Ym9yZGVyOm5vbmU7YmFja2dyb3VuZDpub25lO2N1cnNvcjpwb2ludGVyO2JvcmRlci1ib3R0b206MnB4IHNvbGlkIHRyYW5zcGFyZW50O3RyYW5zaXRpb246YWxsIC4xOHM7Zm9udC1mYW1pbHk6aW5oZXJpdDt3aGl0ZS1zcGFjZTpub3dyYXA7fQoubmF2LXRhYjpob3Zlcntjb2xvcjp2YXIoLS1taWRuaWdodCk7fQoubmF2LXRhYi5hY3RpdmV7Y29sb3I6dmFyKC0tbWlkbmlnaHQpO2JvcmRlci1ib3R0b20tY29sb3I6dmFyKC0tZ3JlZW4pO2ZvbnQtd2VpZ2h0OjYwMDt9Ci5uYXYtcmlnaHR7bWFyZ2luLWxlZnQ6YXV0bztkaXNwbGF5OmZsZXg7YWxpZ24taXRlbXM6Y2VudGVyO2dhcDoxMHB4O2ZvbnQtc2l6ZToxMXB4O2NvbG9yOnZhcigtLXNlY29uZGFyeSk7fQouc2NvcmUtYmFkZ2V7YmFja2dyb3VuZDp2YXIoLS1ncmVlbi1kaW0pO2NvbG9yOnZhcigtLWdyZWVuKTtib3JkZXI6MXB4IHNvbGlkIHJnYmEoMTAsMTkxLDgzLC4yNSk7Ym9yZGVyLXJhZGl1czozcHg7cGFkZGluZzo0cHggMTBweDtmb250LXdlaWdodDo3MDA7Zm9udC1zaXplOjExcHg7bGV0dGVyLXNwYWNpbmc6LjA0ZW07dHJhbnNpdGlvbjphbGwgLjNzO30KCi8qIERJRkZJQ1VMVFkgU0VMRUNUT1IgKi8KI2RpZmZpY3VsdHktc2NyZWVue2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7anVzdGlmeS1jb250ZW50OmNlbnRlcjttaW4taGVpZ2h0OmNhbGMoMTAwdmggLSA1NXB4KTtwYWRkaW5nOjI0cHg7fQouZGlmZi13cmFwe21heC13aWR0aDo3MDBweDt3aWR0aDoxMDAlO30KLmRpZmYtZXllYnJvd3tmb250LXNpemU6MTBweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LjE0ZW07dGV4dC10cmFuc2Zvcm06dXBwZXJjYXNlO2NvbG9yOnZhcigtLWdyZWVuKTttYXJnaW4tYm90dG9tOjEwcHg7fQouZGlmZi10aXRsZXtmb250LXNpemU6MjhweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LS4wMjVlbTtjb2xvcjp2YXIoLS1taWRuaWdodCk7bWFyZ2luLWJvdHRvbTo4cHg7bGluZS1oZWlnaHQ6MS4yO30KLmRpZmYtc3Vie2ZvbnQtc2l6ZToxNHB4O2NvbG9yOnZhcigtLXNlY29uZGFyeSk7bGluZS1oZWlnaHQ6MS42O21hcmdpbi1ib3R0b206MzZweDt9Ci5kaWZmLWNhcmRze2Rpc3BsYXk6Z3JpZDtncmlkLXRlbXBsYXRlLWNvbHVtbnM6MWZyIDFmciAxZnI7Z2FwOjE0cHg7fQpAbWVkaWEobWF4LXdpZHRoOjYwMHB4KXsuZGlmZi1jYXJkc3tncmlkLXRlbXBsYXRlLWNvbHVtbnM6MWZyO319Ci5kaWZmLWNhcmR7YmFja2dyb3VuZDp2YXIoLS13aGl0ZSk7Ym9yZGVyOjEuNXB4IHNvbGlkIHZhcigtLWJvcmRlci1zdHJvbmcpO2JvcmRlci1yYWRpdXM6OHB4O3BhZGRpbmc6MjRweCAyMnB4O2N1cnNvcjpwb2ludGVyO3RyYW5zaXRpb246YWxsIC4yczt0ZXh0LWFsaWduOmxlZnQ7fQouZGlmZi1jYXJkOmhvdmVye2JvcmRlci1jb2xvcjp2YXIoLS1ncmVlbik7dHJhbnNmb3JtOnRyYW5zbGF0ZVkoLTJweCk7Ym94LXNoYWRvdzowIDhweCAyNHB4IHJnYmEoMCwxNyw0NCwuMDgpO30KLmRpZmYtY2FyZC5sZXZlbC0xOmhvdmVyLC5kaWZmLWNhcmQubGV2ZWwtMS5waWNrZWR7Ym9yZGVyLWNvbG9yOnZhcigtLWdyZWVuKTtiYWNrZ3JvdW5kOnZhcigtLWdyZWVuLWRpbSk7fQouZGlmZi1jYXJkLmxldmVsLTI6aG92ZXIsLmRpZmYtY2FyZC5sZXZlbC0yLnBpY2tlZHtib3JkZXItY29sb3I6dmFyKC0tYmx1ZSk7YmFja2dyb3VuZDp2YXIoLS1ibHVlLWRpbSk7fQouZGlmZi1jYXJkLmxldmVsLTM6aG92ZXIsLmRpZmYtY2FyZC5sZXZlbC0zLnBpY2tlZHtib3JkZXItY29sb3I6dmFyKC0tcHVycGxlKTtiYWNrZ3JvdW5kOnZhcigtLXB1cnBsZS1kaW0pO30KLmRpZmYtbnVte2ZvbnQtc2l6ZToxMXB4O2ZvbnQtd2VpZ2h0OjcwMDtsZXR0ZXItc3BhY2luZzouMTJlbTt0ZXh0LXRyYW5zZm9ybTp1cHBlcmNhc2U7bWFyZ2luLWJvdHRvbToxMHB4O30KLmxldmVsLTEgLmRpZmYtbnVte2NvbG9yOnZhcigtLWdyZWVuKTt9Ci5sZXZlbC0yIC5kaWZmLW51bXtjb2xvcjp2YXIoLS1ibHVlKTt9Ci5sZXZlbC0zIC5kaWZmLW51bXtjb2xvcjp2YXIoLS1wdXJwbGUpO30KLmRpZmYtbmFtZXtmb250LXNpemU6MTZweDtmb250LXdlaWdodDo3MDA7Y29sb3I6dmFyKC0tbWlkbmlnaHQpO21hcmdpbi1ib3R0b206OHB4O30KLmRpZmYtZGVzY3tmb250LXNpemU6MTIuNXB4O2NvbG9yOnZhcigtLXNlY29uZGFyeSk7bGluZS1oZWlnaHQ6MS42O30KLmRpZmYtdGFnc3ttYXJnaW4tdG9wOjE0cHg7ZGlzcGxheTpmbGV4O2ZsZXgtd3JhcDp3cmFwO2dhcDo1cHg7fQouZGlmZi10YWd7Zm9udC1zaXplOjlweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LjA4ZW07dGV4dC10cmFuc2Zvcm06dXBwZXJjYXNlO2JvcmRlci1yYWRpdXM6M3B4O3BhZGRpbmc6M3B4IDhweDtib3JkZXI6MXB4IHNvbGlkO30KLnRhZy1ncmVlbntiYWNrZ3JvdW5kOnZhcigtLWdyZWVuLWRpbSk7Y29sb3I6dmFyKC0tZ3JlZW4pO2JvcmRlci1jb2xvcjpyZ2JhKDEwLDE5MSw4MywuMik7fQoudGFnLWJsdWV7YmFja2dyb3VuZDp2YXIoLS1ibHVlLWRpbSk7Y29sb3I6dmFyKC0tYmx1ZSk7Ym9yZGVyLWNvbG9yOnJnYmEoMCwxMTIsMjQ1LC4yKTt9Ci50YWctcHVycGxle2JhY2tncm91bmQ6dmFyKC0tcHVycGxlLWRpbSk7Y29sb3I6dmFyKC0tcHVycGxlKTtib3JkZXItY29sb3I6cmdiYSgxMjQsNTgsMjM3LC4yKTt9Ci5zdGFydC1idG57ZGlzcGxheTpub25lO21hcmdpbi10b3A6MjRweDtiYWNrZ3JvdW5kOnZhcigtLW1pZG5pZ2h0KTtjb2xvcjojZmZmO2JvcmRlcjpub25lO2JvcmRlci1yYWRpdXM6NHB4O3BhZGRpbmc6MTNweCAyOHB4O2ZvbnQtZmFtaWx5OmluaGVyaXQ7Zm9udC1zaXplOjEycHg7Zm9udC13ZWlnaHQ6NzAwO2xldHRlci1zcGFjaW5nOi4wOGVtO3RleHQtdHJhbnNmb3JtOnVwcGVyY2FzZTtjdXJzb3I6cG9pbnRlcjt0cmFuc2l0aW9uOmJhY2tncm91bmQgLjE4czt9Ci5zdGFydC1idG46aG92ZXJ7YmFja2dyb3VuZDojMDAyMDYwO30KLnN0YXJ0LWJ0bi5zaG93e2Rpc3BsYXk6aW5saW5lLWJsb2NrO30KCi8qIE1BSU4gKi8KbWFpbnttYXgtd2lkdGg6ODYwcHg7bWFyZ2luOjAgYXV0bztwYWRkaW5nOjQ0cHggMjRweCA4MHB4O2Rpc3BsYXk6bm9uZTt9Cm1haW4uc2hvd3tkaXNwbGF5OmJsb2NrO30KCi8qIFNDRU5BUklPICovCi5zY2VuYXJpb3tkaXNwbGF5Om5vbmU7fQouc2NlbmFyaW8uYWN0aXZle2Rpc3BsYXk6YmxvY2s7fQoucHJvZ3Jlc3MtYmFye2hlaWdodDozcHg7YmFja2dyb3VuZDp2YXIoLS1mYWludCk7Ym9yZGVyLXJhZGl1czoycHg7b3ZlcmZsb3c6aGlkZGVuO21hcmdpbi1ib3R0b206MzZweDt9Ci5wcm9ncmVzcy1maWxse2hlaWdodDoxMDAlO2JhY2tncm91bmQ6dmFyKC0tZ3JlZW4pO2JvcmRlci1yYWRpdXM6MnB4O3RyYW5zaXRpb246d2lkdGggLjRzIGVhc2U7fQouZXllYnJvd3tmb250LXNpemU6MTBweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LjE0ZW07dGV4dC10cmFuc2Zvcm06dXBwZXJjYXNlO2NvbG9yOnZhcigtLWdyZWVuKTttYXJnaW4tYm90dG9tOjhweDt9Ci5zYy10aXRsZXtmb250LXNpemU6MjVweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LS4wMjVlbTtjb2xvcjp2YXIoLS1taWRuaWdodCk7bWFyZ2luLWJvdHRvbTo4cHg7bGluZS1oZWlnaHQ6MS4yO30KLnNjLXN1Yntmb250LXNpemU6MTMuNXB4O2NvbG9yOnZhcigtLXNlY29uZGFyeSk7bGluZS1oZWlnaHQ6MS42O21hcmdpbi1ib3R0b206MjhweDt9CgovKiBESUZGSUNVTFRZIEJBREdFICovCi5sZXZlbC1pbmRpY2F0b3J7ZGlzcGxheTppbmxpbmUtZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjdweDtwYWRkaW5nOjVweCAxMnB4O2JvcmRlci1yYWRpdXM6NHB4O2ZvbnQtc2l6ZToxMHB4O2ZvbnQtd2VpZ2h0OjcwMDtsZXR0ZXItc3BhY2luZzouMWVtO3RleHQtdHJhbnNmb3JtOnVwcGVyY2FzZTttYXJnaW4tYm90dG9tOjIwcHg7Ym9yZGVyOjFweCBzb2xpZDt9Ci5saS0xe2JhY2tncm91bmQ6dmFyKC0tZ3JlZW4tZGltKTtjb2xvcjp2YXIoLS1ncmVlbik7Ym9yZGVyLWNvbG9yOnJnYmEoMTAsMTkxLDgzLC4yKTt9Ci5saS0ye2JhY2tncm91bmQ6dmFyKC0tYmx1ZS1kaW0pO2NvbG9yOnZhcigtLWJsdWUpO2JvcmRlci1jb2xvcjpyZ2JhKDAsMTEyLDI0NSwuMik7fQoubGktM3tiYWNrZ3JvdW5kOnZhcigtLXB1cnBsZS1kaW0pO2NvbG9yOnZhcigtLXB1cnBsZSk7Ym9yZGVyLWNvbG9yOnJnYmEoMTI0LDU4LDIzNywuMik7fQoKLyogQ0FSRCAqLwouY2FyZHtiYWNrZ3JvdW5kOnZhcigtLXdoaXRlKTtib3JkZXI6MXB4IHNvbGlkIHZhcigtLWJvcmRlcik7Ym9yZGVyLXJhZGl1czo2cHg7cGFkZGluZzoyMnB4IDI2cHg7bWFyZ2luLWJvdHRvbToyMHB4O30KLmNhcmQtbGFiZWx7Zm9udC1zaXplOjkuNXB4O2ZvbnQtd2VpZ2h0OjcwMDtsZXR0ZXItc3BhY2luZzouMTRlbTt0ZXh0LXRyYW5zZm9ybTp1cHBlcmNhc2U7Y29sb3I6dmFyKC0tc2Vjb25kYXJ5KTttYXJnaW4tYm90dG9tOjEycHg7ZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmNlbnRlcjtnYXA6OHB4O30KLmNhcmQtbGFiZWw6OmJlZm9yZXtjb250ZW50OicnO2Rpc3BsYXk6YmxvY2s7d2lkdGg6M3B4O2hlaWdodDoxNHB4O2JvcmRlci1yYWRpdXM6MnB4O2JhY2tncm91bmQ6dmFyKC0tZ3JlZW4pO2ZsZXgtc2hyaW5rOjA7fQouY2FyZCBwe2ZvbnQtc2l6ZToxNHB4O2xpbmUtaGVpZ2h0OjEuNzU7Y29sb3I6dmFyKC0tbWlkbmlnaHQpO30KCi8qIElOVEVMIEdSSUQgKi8KLmludGVsLWdyaWR7ZGlzcGxheTpncmlkO2dyaWQtdGVtcGxhdGUtY29sdW1uczoxZnIgMWZyO2dhcDoxMnB4O21hcmdpbi1ib3R0b206MjBweDt9CkBtZWRpYShtYXgtd2lkdGg6NjAwcHgpey5pbnRlbC1ncmlke2dyaWQtdGVtcGxhdGUtY29sdW1uczoxZnI7fX0KLmludGVsLWl0ZW17YmFja2dyb3VuZDp2YXIoLS13aGl0ZSk7Ym9yZGVyOjFweCBzb2xpZCB2YXIoLS1ib3JkZXIpO2JvcmRlci1yYWRpdXM6NnB4O3BhZGRpbmc6MTZweCAxOHB4O30KCi8qIExFVkVMIDM6IGludGVsIGl0ZW1zIGFyZSBoaWRkZW4vYmx1cnJlZCBpbml0aWFsbHkgKi8KLmludGVsLWl0ZW0ubG9ja2Vke2ZpbHRlcjpibHVyKDRweCk7dXNlci1zZWxlY3Q6bm9uZTtwb2ludGVyLWV2ZW50czpub25lO3RyYW5zaXRpb246ZmlsdGVyIC40czt9Ci5pbnRlbC1pdGVtLnVubG9ja2Vke2ZpbHRlcjpub25lO30KCi5pbnRlbC1zb3VyY2V7Zm9udC1zaXplOjlweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LjEyZW07dGV4dC10cmFuc2Zvcm06dXBwZXJjYXNlO21hcmdpbi1ib3R0b206OHB4O30KLnRhZ3twYWRkaW5nOjJweCA4cHg7Ym9yZGVyLXJhZGl1czozcHg7Zm9udC1zaXplOjlweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LjA4ZW07fQoudGFnLWVuZ3tiYWNrZ3JvdW5kOnZhcigtLWJsdWUtZGltKTtjb2xvcjp2YXIoLS1ibHVlKTt9Ci50YWctbGVnYWx7YmFja2dyb3VuZDp2YXIoLS1vcmFuZ2UtZGltKTtjb2xvcjp2YXIoLS1vcmFuZ2UpO30KLnRhZy1mb3JtdWxhe2JhY2tncm91bmQ6dmFyKC0tZ3JlZW4tZGltKTtjb2xvcjp2YXIoLS1ncmVlbik7fQoudGFnLWRhdGF7YmFja2dyb3VuZDpyZ2JhKDkyLDEwNCwxMjQsLjEwKTtjb2xvcjp2YXIoLS1zZWNvbmRhcnkpO30KLnRhZy1yaXNre2JhY2tncm91bmQ6dmFyKC0tcmVkLWRpbSk7Y29sb3I6dmFyKC0tcmVkKTt9Ci5pbnRlbC10ZXh0e2ZvbnQtc2l6ZToxM3B4O2xpbmUtaGVpZ2h0OjEuNjU7Y29sb3I6dmFyKC0tbWlkbmlnaHQpO30KCi8qIExFVkVMIDM6IGludGVsIHVubG9jayBVSSAqLwouaW50ZWwtdW5sb2NrLXNlY3Rpb257ZGlzcGxheTpub25lO21hcmdpbi1ib3R0b206MjBweDt9Ci5pbnRlbC11bmxvY2stc2VjdGlvbi5zaG93e2Rpc3BsYXk6YmxvY2s7fQoudW5sb2NrLXByb21wdHtmb250LXNpemU6MTFweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LjFlbTt0ZXh0LXRyYW5zZm9ybTp1cHBlcmNhc2U7Y29sb3I6dmFyKC0tcHVycGxlKTttYXJnaW4tYm90dG9tOjEycHg7fQoudW5sb2NrLWdyaWR7ZGlzcGxheTpncmlkO2dyaWQtdGVtcGxhdGUtY29sdW1uczoxZnIgMWZyO2dhcDoxMHB4O30KQG1lZGlhKG1heC13aWR0aDo2MDBweCl7LnVubG9jay1ncmlke2dyaWQtdGVtcGxhdGUtY29sdW1uczoxZnI7fX0KLnVubG9jay1pdGVte2JhY2tncm91bmQ6dmFyKC0td2hpdGUpO2JvcmRlcjoxLjVweCBzb2xpZCB2YXIoLS1ib3JkZXItc3Ryb25nKTtib3JkZXItcmFkaXVzOjZweDtwYWRkaW5nOjE0cHggMTZweDt9Ci51bmxvY2staXRlbS1sYWJlbHtmb250LXNpemU6OXB4O2ZvbnQtd2VpZ2h0OjcwMDtsZXR0ZXItc3BhY2luZzouMTJlbTt0ZXh0LXRyYW5zZm9ybTp1cHBlcmNhc2U7bWFyZ2luLWJvdHRvbTo4cHg7fQoudW5sb2NrLWl0ZW0gdGV4dGFyZWF7d2lkdGg6MTAwJTtib3JkZXI6MXB4IHNvbGlkIHZhcigtLWJvcmRlcik7Ym9yZGVyLXJhZGl1czo0cHg7cGFkZGluZzoxMHB4IDEycHg7Zm9udC1mYW1pbHk6aW5oZXJpdDtmb250LXNpemU6MTIuNXB4O2xpbmUtaGVpZ2h0OjEuNjtjb2xvcjp2YXIoLS1taWRuaWdodCk7cmVzaXplOnZlcnRpY2FsO21pbi1oZWlnaHQ6NzJweDt0cmFuc2l0aW9uOmJvcmRlciAuMThzO2JhY2tncm91bmQ6dmFyKC0tYmcpO30KLnVubG9jay1pdGVtIHRleHRhcmVhOmZvY3Vze291dGxpbmU6bm9uZTtib3JkZXItY29sb3I6dmFyKC0tcHVycGxlKTt9Ci51bmxvY2staXRlbSB0ZXh0YXJlYS5maWxsZWR7Ym9yZGVyLWNvbG9yOnZhcigtLWdyZWVuKTt9Ci51bmxvY2stYnRue21hcmdpbi10b3A6MTBweDtiYWNrZ3JvdW5kOnZhcigtLXB1cnBsZSk7Y29sb3I6I2ZmZjtib3JkZXI6bm9uZTtib3JkZXItcmFkaXVzOjRweDtwYWRkaW5nOjlweCAyMHB4O2ZvbnQtZmFtaWx5OmluaGVyaXQ7Zm9udC1zaXplOjExcHg7Zm9udC13ZWlnaHQ6NzAwO2xldHRlci1zcGFjaW5nOi4wOGVtO3RleHQtdHJhbnNmb3JtOnVwcGVyY2FzZTtjdXJzb3I6cG9pbnRlcjt0cmFuc2l0aW9uOmJhY2tncm91bmQgLjE4cztvcGFjaXR5Oi40O3BvaW50ZXItZXZlbnRzOm5vbmU7fQoudW5sb2NrLWJ0bi5yZWFkeXtvcGFjaXR5OjE7cG9pbnRlci1ldmVudHM6YWxsO30KLnVubG9jay1idG4ucmVhZHk6aG92ZXJ7YmFja2dyb3VuZDojNmQyOGQ5O30KCi8qIExFVkVMIDI6IG9wZW4gdGV4dCBhbnN3ZXIgKi8KLm9wZW4tYW5zd2VyLXNlY3Rpb257ZGlzcGxheTpub25lO21hcmdpbi1ib3R0b206MjBweDt9Ci5vcGVuLWFuc3dlci1zZWN0aW9uLnNob3d7ZGlzcGxheTpibG9jazt9Ci5vcGVuLWxhYmVse2ZvbnQtc2l6ZToxMXB4O2ZvbnQtd2VpZ2h0OjcwMDtsZXR0ZXItc3BhY2luZzouMTBlbTt0ZXh0LXRyYW5zZm9ybTp1cHBlcmNhc2U7Y29sb3I6dmFyKC0tYmx1ZSk7bWFyZ2luLWJvdHRvbToxMHB4O30KLm9wZW4taW5wdXR7d2lkdGg6MTAwJTtib3JkZXI6MS41cHggc29saWQgdmFyKC0tYm9yZGVyLXN0cm9uZyk7Ym9yZGVyLXJhZGl1czo2cHg7cGFkZGluZzoxNHB4IDE4cHg7Zm9udC1mYW1pbHk6aW5oZXJpdDtmb250LXNpemU6MTMuNXB4O2xpbmUtaGVpZ2h0OjEuNztjb2xvcjp2YXIoLS1taWRuaWdodCk7cmVzaXplOnZlcnRpY2FsO21pbi1oZWlnaHQ6OTBweDt0cmFuc2l0aW9uOmJvcmRlciAuMThzO2JhY2tncm91bmQ6dmFyKC0td2hpdGUpO30KLm9wZW4taW5wdXQ6Zm9jdXN7b3V0bGluZTpub25lO2JvcmRlci1jb2xvcjp2YXIoLS1ibHVlKTt9Ci5vcGVuLWlucHV0LmZpbGxlZHtib3JkZXItY29sb3I6dmFyKC0tZ3JlZW4pO30KLm9wZW4tc3VibWl0e2Rpc3BsYXk6bm9uZTttYXJnaW4tdG9wOjEwcHg7YmFja2dyb3VuZDp2YXIoLS1ibHVlKTtjb2xvcjojZmZmO2JvcmRlcjpub25lO2JvcmRlci1yYWRpdXM6NHB4O3BhZGRpbmc6MTBweCAyMnB4O2ZvbnQtZmFtaWx5OmluaGVyaXQ7Zm9udC1zaXplOjExcHg7Zm9udC13ZWlnaHQ6NzAwO2xldHRlci1zcGFjaW5nOi4wOGVtO3RleHQtdHJhbnNmb3JtOnVwcGVyY2FzZTtjdXJzb3I6cG9pbnRlcjt0cmFuc2l0aW9uOmJhY2tncm91bmQgLjE4czt9Ci5vcGVuLXN1Ym1pdC5zaG93e2Rpc3BsYXk6aW5saW5lLWJsb2NrO30KLm9wZW4tc3VibWl0OmhvdmVye2JhY2tncm91bmQ6IzAwNWZjYzt9CgovKiBMRVZFTCAxOiBtdWx0aXBsZSBjaG9pY2UgKi8KLmNob2ljZXMtc2VjdGlvbntkaXNwbGF5Om5vbmU7bWFyZ2luLWJvdHRvbTowO30KLmNob2ljZXMtc2VjdGlvbi5zaG93e2Rpc3BsYXk6YmxvY2s7fQouY2hvaWNlcy1sYWJlbHtmb250LXNpemU6MTFweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LjEwZW07dGV4dC10cmFuc2Zvcm06dXBwZXJjYXNlO2NvbG9yOnZhcigtLXNlY29uZGFyeSk7bWFyZ2luLWJvdHRvbToxNHB4O30KLmNob2ljZS1idG57d2lkdGg6MTAwJTtiYWNrZ3JvdW5kOnZhcigtLXdoaXRlKTtib3JkZXI6MS41cHggc29saWQgdmFyKC0tYm9yZGVyLXN0cm9uZyk7Ym9yZGVyLXJhZGl1czo2cHg7cGFkZGluZzoxN3B4IDIwcHg7bWFyZ2luLWJvdHRvbToxMHB4O2N1cnNvcjpwb2ludGVyO3RleHQtYWxpZ246bGVmdDt0cmFuc2l0aW9uOmFsbCAuMThzO2ZvbnQtZmFtaWx5OmluaGVyaXQ7ZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmZsZXgtc3RhcnQ7Z2FwOjE0cHg7fQouY2hvaWNlLWJ0bjpob3Zlcntib3JkZXItY29sb3I6dmFyKC0tZ3JlZW4pO2JhY2tncm91bmQ6dmFyKC0tZ3JlZW4tZGltKTt0cmFuc2Zvcm06dHJhbnNsYXRlWCgzcHgpO30KLmNob2ljZS1idG4uc2VsLXJpZ2h0e2JvcmRlci1jb2xvcjp2YXIoLS1ncmVlbik7YmFja2dyb3VuZDp2YXIoLS1ncmVlbi1kaW0pO30KLmNob2ljZS1idG4uc2VsLXBhcnRpYWx7Ym9yZGVyLWNvbG9yOnZhcigtLW9yYW5nZSk7YmFja2dyb3VuZDp2YXIoLS1vcmFuZ2UtZGltKTt9Ci5jaG9pY2UtYnRuLnNlbC13cm9uZ3tib3JkZXItY29sb3I6dmFyKC0tcmVkKTtiYWNrZ3JvdW5kOnZhcigtLXJlZC1kaW0pO30KLmNob2ljZS1idG46ZGlzYWJsZWR7Y3Vyc29yOmRlZmF1bHQ7dHJhbnNmb3JtOm5vbmU7fQouY2hvaWNlLWtleXt3aWR0aDoyNHB4O2hlaWdodDoyNHB4O2JvcmRlci1yYWRpdXM6NHB4O2ZsZXgtc2hyaW5rOjA7Ym9yZGVyOjEuNXB4IHNvbGlkIHZhcigtLWJvcmRlci1zdHJvbmcpO2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7anVzdGlmeS1jb250ZW50OmNlbnRlcjtmb250LXNpemU6MTBweDtmb250LXdlaWdodDo3MDA7Y29sb3I6dmFyKC0tc2Vjb25kYXJ5KTt0cmFuc2l0aW9uOmFsbCAuMThzO21hcmdpbi10b3A6MXB4O30KLmNob2ljZS1idG46aG92ZXIgLmNob2ljZS1rZXksLmNob2ljZS1idG4uc2VsLXJpZ2h0IC5jaG9pY2Uta2V5e2JvcmRlci1jb2xvcjp2YXIoLS1ncmVlbik7Y29sb3I6dmFyKC0tZ3JlZW4pO30KLmNob2ljZS1idG4uc2VsLXdyb25nIC5jaG9pY2Uta2V5e2JvcmRlci1jb2xvcjp2YXIoLS1yZWQpO2NvbG9yOnZhcigtLXJlZCk7fQouY2hvaWNlLWJ0bi5zZWwtcGFydGlhbCAuY2hvaWNlLWtleXtib3JkZXItY29sb3I6dmFyKC0tb3JhbmdlKTtjb2xvcjp2YXIoLS1vcmFuZ2UpO30KLmNob2ljZS10aXRsZXtmb250LXNpemU6MTRweDtmb250LXdlaWdodDo2MDA7Y29sb3I6dmFyKC0tbWlkbmlnaHQpO21hcmdpbi1ib3R0b206M3B4O30KLmNob2ljZS1kZXNje2ZvbnQtc2l6ZToxMi41cHg7Y29sb3I6dmFyKC0tc2Vjb25kYXJ5KTtsaW5lLWhlaWdodDoxLjU1O30KCi8qIEZFRURCQUNLICovCi5mZWVkYmFja3tkaXNwbGF5Om5vbmU7Ym9yZGVyLXJhZGl1czo2cHg7cGFkZGluZzoyMHB4IDI0cHg7bWFyZ2luLXRvcDoxNnB4O2JvcmRlcjoxcHggc29saWQ7fQouZmVlZGJhY2suc2hvd3tkaXNwbGF5OmJsb2NrO30KLmZlZWRiYWNrLnJpZ2h0e2JhY2tncm91bmQ6dmFyKC0tZ3JlZW4tZGltKTtib3JkZXItY29sb3I6cmdiYSgxMCwxOTEsODMsLjI1KTt9Ci5mZWVkYmFjay53cm9uZ3tiYWNrZ3JvdW5kOnZhcigtLXJlZC1kaW0pO2JvcmRlci1jb2xvcjpyZ2JhKDIyNiw0NSw0NSwuMjApO30KLmZlZWRiYWNrLnBhcnRpYWx7YmFja2dyb3VuZDp2YXIoLS1vcmFuZ2UtZGltKTtib3JkZXItY29sb3I6cmdiYSgyNDUsMTMwLDEwLC4yMCk7fQouZmVlZGJhY2sub3Blbi1ldmFse2JhY2tncm91bmQ6dmFyKC0tYmx1ZS1kaW0pO2JvcmRlci1jb2xvcjpyZ2JhKDAsMTEyLDI0NSwuMjApO30KLmZiLWhlYWR7Zm9udC1zaXplOjExcHg7Zm9udC13ZWlnaHQ6NzAwO2xldHRlci1zcGFjaW5nOi4xMGVtO3RleHQtdHJhbnNmb3JtOnVwcGVyY2FzZTttYXJnaW4tYm90dG9tOjhweDt9Ci5mZWVkYmFjay5yaWdodCAuZmItaGVhZHtjb2xvcjp2YXIoLS1ncmVlbik7fQouZmVlZGJhY2sud3JvbmcgLmZiLWhlYWR7Y29sb3I6dmFyKC0tcmVkKTt9Ci5mZWVkYmFjay5wYXJ0aWFsIC5mYi1oZWFke2NvbG9yOnZhcigtLW9yYW5nZSk7fQouZmVlZGJhY2sub3Blbi1ldmFsIC5mYi1oZWFke2NvbG9yOnZhcigtLWJsdWUpO30KLmZlZWRiYWNrIHB7Zm9udC1zaXplOjEzLjVweDtsaW5lLWhlaWdodDoxLjc7Y29sb3I6dmFyKC0tbWlkbmlnaHQpO30KLmlkZWFsLWFuc3dlcnttYXJnaW4tdG9wOjE0cHg7cGFkZGluZzoxNHB4IDE2cHg7YmFja2dyb3VuZDpyZ2JhKDAsMTcsNDQsLjA0KTtib3JkZXItcmFkaXVzOjRweDtib3JkZXItbGVmdDozcHggc29saWQgdmFyKC0tZ3JlZW4pO30KLmlkZWFsLWxhYmVse2ZvbnQtc2l6ZTo5cHg7Zm9udC13ZWlnaHQ6NzAwO2xldHRlci1zcGFjaW5nOi4xMmVtO3RleHQtdHJhbnNmb3JtOnVwcGVyY2FzZTtjb2xvcjp2YXIoLS1zZWNvbmRhcnkpO21hcmdpbi1ib3R0b206NnB4O30KLmlkZWFsLXRleHR7Zm9udC1zaXplOjEzcHg7bGluZS1oZWlnaHQ6MS42NTtjb2xvcjp2YXIoLS1taWRuaWdodCk7fQouZm9ybXVsYS10YWd7ZGlzcGxheTppbmxpbmUtZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjVweDtiYWNrZ3JvdW5kOnZhcigtLWdyZWVuLWRpbSk7Ym9yZGVyOjFweCBzb2xpZCByZ2JhKDEwLDE5MSw4MywuMjUpO2JvcmRlci1yYWRpdXM6M3B4O3BhZGRpbmc6M3B4IDEwcHg7Zm9udC1zaXplOjEwcHg7Zm9udC13ZWlnaHQ6NzAwO2NvbG9yOnZhcigtLWdyZWVuKTtsZXR0ZXItc3BhY2luZzouMDZlbTt0ZXh0LXRyYW5zZm9ybTp1cHBlcmNhc2U7bWFyZ2luLXRvcDoxMHB4O30KCi8qIEwzIGludGVsIGZlZWRiYWNrICovCi5pbnRlbC1ldmFse2Rpc3BsYXk6bm9uZTttYXJnaW4tYm90dG9tOjE2cHg7fQouaW50ZWwtZXZhbC5zaG93e2Rpc3BsYXk6YmxvY2s7fQouaW50ZWwtZXZhbC1ncmlke2Rpc3BsYXk6Z3JpZDtncmlkLXRlbXBsYXRlLWNvbHVtbnM6MWZyIDFmcjtnYXA6MTBweDt9CkBtZWRpYShtYXgtd2lkdGg6NjAwcHgpey5pbnRlbC1ldmFsLWdyaWR7Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOjFmcjt9fQouaW50ZWwtZXZhbC1pdGVte2JhY2tncm91bmQ6dmFyKC0td2hpdGUpO2JvcmRlcjoxcHggc29saWQgdmFyKC0tYm9yZGVyKTtib3JkZXItcmFkaXVzOjVweDtwYWRkaW5nOjEycHggMTRweDt9Ci5pZS1sYWJlbHtmb250LXNpemU6OXB4O2ZvbnQtd2VpZ2h0OjcwMDtsZXR0ZXItc3BhY2luZzouMWVtO3RleHQtdHJhbnNmb3JtOnVwcGVyY2FzZTttYXJnaW4tYm90dG9tOjVweDt9Ci5pZS1jaGVja3tmb250LXNpemU6MTFweDtsaW5lLWhlaWdodDoxLjU1O2NvbG9yOnZhcigtLXNlY29uZGFyeSk7fQouaWUtY2hlY2suZ29vZHtjb2xvcjp2YXIoLS1ncmVlbik7fQouaWUtY2hlY2subWlzc3tjb2xvcjp2YXIoLS1vcmFuZ2UpO30KCi8qIE5FWFQgQlROICovCi5uZXh0LWJ0bntkaXNwbGF5Om5vbmU7bWFyZ2luLXRvcDoyMHB4O2JhY2tncm91bmQ6dmFyKC0tbWlkbmlnaHQpO2NvbG9yOiNmZmY7Ym9yZGVyOm5vbmU7Ym9yZGVyLXJhZGl1czo0cHg7cGFkZGluZzoxMnB4IDI0cHg7Zm9udC1mYW1pbHk6aW5oZXJpdDtmb250LXNpemU6MTJweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LjA4ZW07dGV4dC10cmFuc2Zvcm06dXBwZXJjYXNlO2N1cnNvcjpwb2ludGVyO3RyYW5zaXRpb246YmFja2dyb3VuZCAuMThzO30KLm5leHQtYnRuOmhvdmVye2JhY2tncm91bmQ6IzAwMjA2MDt9Ci5uZXh0LWJ0bi5zaG93e2Rpc3BsYXk6aW5saW5lLWJsb2NrO30KCi8qIFJFU1VMVFMgKi8KI3Jlc3VsdHN7ZGlzcGxheTpub25lO30KI3Jlc3VsdHMuc2hvd3tkaXNwbGF5OmJsb2NrO30KLnJlc3VsdHMtZ3JpZHtkaXNwbGF5OmdyaWQ7Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOjFmciAxZnI7Z2FwOjE2cHg7bWFyZ2luOjI4cHggMDt9CkBtZWRpYShtYXgtd2lkdGg6NjAwcHgpey5yZXN1bHRzLWdyaWR7Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOjFmcjt9fQoucmVzdWx0LWl0ZW17YmFja2dyb3VuZDp2YXIoLS13aGl0ZSk7Ym9yZGVyOjFweCBzb2xpZCB2YXIoLS1ib3JkZXIpO2JvcmRlci1yYWRpdXM6NnB4O3BhZGRpbmc6MjBweCAyMnB4O30KLnItc2N7Zm9udC1zaXplOjEwcHg7Zm9udC13ZWlnaHQ6NjAwO2xldHRlci1zcGFjaW5nOi4xZW07dGV4dC10cmFuc2Zvcm06dXBwZXJjYXNlO2NvbG9yOnZhcigtLXNlY29uZGFyeSk7bWFyZ2luLWJvdHRvbTo4cHg7fQouci1zY29yZXtmb250LXNpemU6MjhweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LS4wMmVtO21hcmdpbi1ib3R0b206NHB4O30KLnItbGFiZWx7Zm9udC1zaXplOjEycHg7Y29sb3I6dmFyKC0tc2Vjb25kYXJ5KTt9Ci5zMTAwe2NvbG9yOnZhcigtLWdyZWVuKTt9Ci5zNTB7Y29sb3I6dmFyKC0tb3JhbmdlKTt9Ci5zMHtjb2xvcjp2YXIoLS1yZWQpO30KLnJlc3RhcnQtYnRue2JhY2tncm91bmQ6dmFyKC0tZ3JlZW4pO2NvbG9yOiNmZmY7Ym9yZGVyOm5vbmU7Ym9yZGVyLXJhZGl1czo0cHg7cGFkZGluZzoxM3B4IDI4cHg7Zm9udC1mYW1pbHk6aW5oZXJpdDtmb250LXNpemU6MTJweDtmb250LXdlaWdodDo3MDA7bGV0dGVyLXNwYWNpbmc6LjA4ZW07dGV4dC10cmFuc2Zvcm06dXBwZXJjYXNlO2N1cnNvcjpwb2ludGVyO3RyYW5zaXRpb246YmFja2dyb3VuZCAuMThzO21hcmdpbi10b3A6OHB4O30KLnJlc3RhcnQtYnRuOmhvdmVye2JhY2tncm91bmQ6IzA4YTg0NTt9Cjwvc3R5bGU+CjwvaGVhZD4KPGJvZHk+Cgo8bmF2PgogIDxkaXYgY2xhc3M9Im5hdi1sb2dvIj48ZGl2IGNsYXNzPSJkb3QiPjwvZGl2PkFkeWVuIFBNIFNpbXVsYXRpb248L2Rpdj4KICA8YnV0dG9uIGNsYXNzPSJuYXYtdGFiIiBpZD0ibnQwIiBvbmNsaWNrPSJuYXZHbygwKSI+TWFya2V0cGxhY2U8L2J1dHRvbj4KICA8YnV0dG9uIGNsYXNzPSJuYXYtdGFiIiBpZD0ibnQxIiBvbmNsaWNrPSJuYXZHbygxKSI+SW5kaWEgQXN5bmM8L2J1dHRvbj4KICA8YnV0dG9uIGNsYXNzPSJuYXYtdGFiIiBpZD0ibnQyIiBvbmNsaWNrPSJuYXZHbygyKSI+VExTIFN1bnNldDwvYnV0dG9uPgogIDxidXR0b24gY2xhc3M9Im5hdi10YWIiIGlkPSJudDMiIG9uY2xpY2s9Im5hdkdvKDMpIj5Qb3N0Z3JlU1FMPC9idXR0b24+CiAgPGRpdiBjbGFzcz0ibmF2LXJpZ2h0Ij4KICAgIDxzcGFuPkZvcm11bGE6PC9zcGFuPgogICAgPHNwYW4gY2xhc3M9InNjb3JlLWJhZGdlIiBpZD0ic2NvcmUtYmFkZ2UiPuKAlDwvc3Bhbj4KICA8L2Rpdj4KPC9uYXY+Cgo8IS0tIERJRkZJQ1VMVFkgU0NSRUVOIC0tPgo8ZGl2IGlkPSJkaWZmaWN1bHR5LXNjcmVlbiI+CiAgPGRpdiBjbGFzcz0iZGlmZi13cmFwIj4KICAgIDxkaXYgY2xhc3M9ImRpZmYtZXllYnJvdyI+QWR5ZW4gUE0gU2ltdWxhdGlvbiDCtyA0IFNjZW5hcmlvczwvZGl2PgogICAgPGRpdiBjbGFzcz0iZGlmZi10aXRsZSI+Q2hvb3NlIGRpZmZpY3VsdHkgbGV2ZWw8L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImRpZmYtc3ViIj5FYWNoIGxldmVsIHRlc3RzIGEgZGlmZmVyZW50IGxheWVyIG9mIHByb2R1Y3QgdGhpbmtpbmcuIFN0YXJ0IHdpdGggTGV2ZWwgMSBpZiB5b3UncmUgbmV3IHRvIEFkeWVuJ3MgZGVjaXNpb24gZnJhbWV3b3JrLCBvciBqdW1wIHN0cmFpZ2h0IHRvIExldmVsIDMgaWYgeW91IHdhbnQgYSByZWFsIGNoYWxsZW5nZS48L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImRpZmYtY2FyZHMiPgoKICAgICAgPGRpdiBjbGFzcz0iZGlmZi1jYXJkIGxldmVsLTEiIG9uY2xpY2s9InBpY2tMZXZlbCgxKSI+CiAgICAgICAgPGRpdiBjbGFzcz0iZGlmZi1udW0iPkxldmVsIDAxPC9kaXY+CiAgICAgICAgPGRpdiBjbGFzcz0iZGlmZi1uYW1lIj5NdWx0aXBsZSBDaG9pY2U8L2Rpdj4KICAgICAgICA8ZGl2IGNsYXNzPSJkaWZmLWRlc2MiPlJlYWQgdGhlIGludGVsLCBwaWNrIHRoZSBiZXN0IGFuc3dlciBmcm9tIHRocmVlIG9wdGlvbnMuIEltbWVkaWF0ZSBmZWVkYmFjayBhZnRlciBlYWNoIGNob2ljZS48L2Rpdj4KICAgICAgICA8ZGl2IGNsYXNzPSJkaWZmLXRhZ3MiPgogICAgICAgICAgPHNwYW4gY2xhc3M9ImRpZmYtdGFnIHRhZy1ncmVlbiI+Q2hvb3NlIEEgLyBCIC8gQzwvc3Bhbj4KICAgICAgICAgIDxzcGFuIGNsYXNzPSJkaWZmLXRhZyB0YWctZ3JlZW4iPkluc3RhbnQgZmVlZGJhY2s8L3NwYW4+CiAgICAgICAgPC9kaXY+CiAgICAgIDwvZGl2PgoKICAgICAgPGRpdiBjbGFzcz0iZGlmZi1jYXJkIGxldmVsLTIiIG9uY2xpY2s9InBpY2tMZXZlbCgyKSI+CiAgICAgICAgPGRpdiBjbGFzcz0iZGlmZi1udW0iPkxldmVsIDAyPC9kaXY+CiAgICAgICAgPGRpdiBjbGFzcz0iZGlmZi1uYW1lIj5PcGVuIEFuc3dlcjwvZGl2PgogICAgICAgIDxkaXYgY2xhc3M9ImRpZmYtZGVzYyI+UmVhZCB0aGUgaW50ZWwsIHRoZW4gd3JpdGUgeW91ciBvd24gZGVjaXNpb24gYW5kIHJhdGlvbmFsZSBpbiBmcmVlIHRleHQuIE5vIG11bHRpcGxlIGNob2ljZSBjcnV0Y2guPC9kaXY+CiAgICAgICAgPGRpdiBjbGFzcz0iZGlmZi10YWdzIj4KICAgICAgICAgIDxzcGFuIGNsYXNzPSJkaWZmLXRhZyB0YWctYmx1ZSI+V3JpdGUgeW91ciBkZWNpc2lvbjwvc3Bhbj4KICAgICAgICAgIDxzcGFuIGNsYXNzPSJkaWZmLXRhZyB0YWctYmx1ZSI+QUktc3R5bGUgc2NvcmluZzwvc3Bhbj4KICAgICAgICA8L2Rpdj4KICAgICAgPC9kaXY+CgogICAgICA8ZGl2IGNsYXNzPSJkaWZmLWNhcmQgbGV2ZWwtMyIgb25jbGljaz0icGlja0xldmVsKDMpIj4KICAgICAgICA8ZGl2IGNsYXNzPSJkaWZmLW51bSI+TGV2ZWwgMDM8L2Rpdj4KICAgICAgICA8ZGl2IGNsYXNzPSJkaWZmLW5hbWUiPkludGVsbGlnZW5jZSBBbmFseXNpczwvZGl2PgogICAgICAgIDxkaXYgY2xhc3M9ImRpZmYtZGVzYyI+SW50ZWwgY2FyZHMgYXJlIGJsdXJyZWQuIFlvdSBtdXN0IGZpcnN0IGRlc2NyaWJlIHdoYXQgeW91IGV4cGVjdCB0byBmaW5kIGluIGVhY2ggY2F0ZWdvcnkgYmVmb3JlIHRoZXkgdW5sb2NrLjwvZGl2PgogICAgICAgIDxkaXYgY2xhc3M9ImRpZmYtdGFncyI+CiAgICAgICAgICA8c3BhbiBjbGFzcz0iZGlmZi10YWcgdGFnLXB1cnBsZSI+TG9ja2VkIGludGVsPC9zcGFuPgogICAgICAgICAgPHNwYW4gY2xhc3M9ImRpZmYtdGFnIHRhZy1wdXJwbGUiPldyaXRlIGludGVsIGZpcnN0PC9zcGFuPgogICAgICAgICAgPHNwYW4gY2xhc3M9ImRpZmYtdGFnIHRhZy1wdXJwbGUiPlRoZW4gYW5zd2VyPC9zcGFuPgogICAgICAgIDwvZGl2PgogICAgICA8L2Rpdj4KCiAgICA8L2Rpdj4KICAgIDxidXR0b24gY2xhc3M9InN0YXJ0LWJ0biIgaWQ9InN0YXJ0LWJ0biIgb25jbGljaz0ic3RhcnRTaW0oKSI+U3RhcnQgU2ltdWxhdGlvbiDihpI8L2J1dHRvbj4KICA8L2Rpdj4KPC9kaXY+Cgo8IS0tIE1BSU4gU0lNIC0tPgo8bWFpbiBpZD0ibWFpbi1zaW0iPgoKPCEtLSBTMCAtLT4KPGRpdiBjbGFzcz0ic2NlbmFyaW8iIGlkPSJzMCI+CiAgPGRpdiBjbGFzcz0icHJvZ3Jlc3MtYmFyIj48ZGl2IGNsYXNzPSJwcm9ncmVzcy1maWxsIiBzdHlsZT0id2lkdGg6MjUlIj48L2Rpdj48L2Rpdj4KICA8ZGl2IGNsYXNzPSJsZXZlbC1pbmRpY2F0b3IiIGlkPSJsaTAiPjwvZGl2PgogIDxkaXYgY2xhc3M9ImV5ZWJyb3ciPlNjZW5hcmlvIDAxIC8gMDQg4oCUIFBsYXRmb3JtIEdyb3d0aDwvZGl2PgogIDxkaXYgY2xhc3M9InNjLXRpdGxlIj5UaGUgTWFya2V0cGxhY2UgRGlsZW1tYTwvZGl2PgogIDxkaXYgY2xhc3M9InNjLXN1YiI+SW5zcGlyZWQgYnk6IEFkeWVuJ3MgbWlncmF0aW9uIG9mIGVCYXkgYW5kIHRoZSBjcmVhdGlvbiBvZiBBZHllbiBmb3IgUGxhdGZvcm1zPC9kaXY+CgogIDxkaXYgY2xhc3M9ImNhcmQiPgogICAgPGRpdiBjbGFzcz0iY2FyZC1sYWJlbCI+QnJpZWZpbmc8L2Rpdj4KICAgIDxwPllvdSdyZSB0aGUgUE0gcmVzcG9uc2libGUgZm9yIG9uYm9hcmRpbmcgYSBtYWpvciBuZXcgbWFya2V0cGxhY2UgY2FsbGVkIEdsb2JhbC1TaG9wLiBUaGUgU2FsZXMgRGlyZWN0b3Igd2Fsa3MgaW46IDxlbT4iR2xvYmFsLVNob3Agd2lsbCBzaWduIGEg4oKsMTBCIHZvbHVtZSBjb250cmFjdCDigJQgYnV0IHRoZWlyIENGTyB3YW50cyBhIGRlZGljYXRlZCBwYXlvdXQgc3lzdGVtIHdpdGggYSA0NS1kYXkgc2V0dGxlbWVudCBjeWNsZSBmb3IgdGhlaXIgQ2hpbmVzZSBzdXBwbGllcnMuIEl0J3MganVzdCBvbmUgYnJhbmNoIGluIHRoZSBjb2RlLCBub2JvZHkgd2lsbCBub3RpY2UuIjwvZW0+PC9wPgogIDwvZGl2PgoKICA8IS0tIExFVkVMIDM6IHdyaXRlIGludGVsIGZpcnN0IC0tPgogIDxkaXYgY2xhc3M9ImludGVsLXVubG9jay1zZWN0aW9uIiBpZD0iczAtdW5sb2NrIj4KICAgIDxkaXYgY2xhc3M9InVubG9jay1wcm9tcHQiPkxldmVsIDAzIOKAlCBEZXNjcmliZSB3aGF0IHlvdSBleHBlY3QgdG8gZmluZCBpbiBlYWNoIGludGVsbGlnZW5jZSBzb3VyY2UgYmVmb3JlIHVubG9ja2luZyB0aGUgYWN0dWFsIGRhdGE8L2Rpdj4KICAgIDxkaXYgY2xhc3M9InVubG9jay1ncmlkIj4KICAgICAgPGRpdiBjbGFzcz0idW5sb2NrLWl0ZW0iPgogICAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtLWxhYmVsIj48c3BhbiBjbGFzcz0idGFnIHRhZy1lbmciPkVuZ2luZWVyaW5nPC9zcGFuPjwvZGl2PgogICAgICAgIDx0ZXh0YXJlYSBpZD0iczAtdS1lbmciIHBsYWNlaG9sZGVyPSJXaGF0IGRvIHlvdSB0aGluayBFbmdpbmVlcmluZyB3aWxsIHNheSBhYm91dCBidWlsZGluZyBhIGN1c3RvbSBwYXlvdXQgZm9yaz8iIG9uaW5wdXQ9ImNoZWNrVW5sb2NrKDApIj48L3RleHRhcmVhPgogICAgICA8L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idW5sb2NrLWl0ZW0iPgogICAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtLWxhYmVsIj48c3BhbiBjbGFzcz0idGFnIHRhZy1mb3JtdWxhIj5UaGUgRm9ybXVsYTwvc3Bhbj48L2Rpdj4KICAgICAgICA8dGV4dGFyZWEgaWQ9InMwLXUtZm9ybXVsYSIgcGxhY2Vob2xkZXI9IldoYXQgZG9lcyBBZHllbidzIEZvcm11bGEgc2F5IGFib3V0IGN1c3RvbSBjbGllbnQgbW9kaWZpY2F0aW9ucz8iIG9uaW5wdXQ9ImNoZWNrVW5sb2NrKDApIj48L3RleHRhcmVhPgogICAgICA8L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idW5sb2NrLWl0ZW0iPgogICAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtLWxhYmVsIj48c3BhbiBjbGFzcz0idGFnIHRhZy1kYXRhIj5CYWNrbG9nPC9zcGFuPjwvZGl2PgogICAgICAgIDx0ZXh0YXJlYSBpZD0iczAtdS1iYWNrbG9nIiBwbGFjZWhvbGRlcj0iV2hhdCBtaWdodCBhbHJlYWR5IGV4aXN0IGluIHRoZSBwcm9kdWN0IGJhY2tsb2cgdGhhdCdzIHJlbGV2YW50IGhlcmU/IiBvbmlucHV0PSJjaGVja1VubG9jaygwKSI+PC90ZXh0YXJlYT4KICAgICAgPC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtIj4KICAgICAgICA8ZGl2IGNsYXNzPSJ1bmxvY2staXRlbS1sYWJlbCI+PHNwYW4gY2xhc3M9InRhZyB0YWctcmlzayI+Umlzazwvc3Bhbj48L2Rpdj4KICAgICAgICA8dGV4dGFyZWEgaWQ9InMwLXUtcmlzayIgcGxhY2Vob2xkZXI9IldoYXQgYXJlIHRoZSBsb25nLXRlcm0gcmlza3Mgb2YgdGhlIGZvcmsgYXBwcm9hY2ggZm9yIHBsYXRmb3JtIGFyY2hpdGVjdHVyZT8iIG9uaW5wdXQ9ImNoZWNrVW5sb2NrKDApIj48L3RleHRhcmVhPgogICAgICA8L2Rpdj4KICAgIDwvZGl2PgogICAgPGJ1dHRvbiBjbGFzcz0idW5sb2NrLWJ0biIgaWQ9InMwLXVubG9jay1idG4iIG9uY2xpY2s9InVubG9ja0ludGVsKDApIj5VbmxvY2sgSW50ZWwgQ2FyZHMg4oaSPC9idXR0b24+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9ImludGVsLWdyaWQiIGlkPSJzMC1pbnRlbCI+CiAgICA8ZGl2IGNsYXNzPSJpbnRlbC1pdGVtIiBpZD0iczAtaTAiPjxkaXYgY2xhc3M9ImludGVsLXNvdXJjZSI+PHNwYW4gY2xhc3M9InRhZyB0YWctZW5nIj5FbmdpbmVlcmluZzwvc3Bhbj48L2Rpdj48ZGl2IGNsYXNzPSJpbnRlbC10ZXh0Ij4iQnVpbGRpbmcgdGhpcyAnb24gdGhlIHNpZGUnIHRha2VzIDIgd2Vla3MsIGJ1dCB3aWxsIGJsb2NrIHVwZGF0ZXMgdG8gdGhlIGdsb2JhbCBwYXlvdXQgZW5naW5lIGZvciA2IG1vbnRocy4iPC9kaXY+PC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJpbnRlbC1pdGVtIiBpZD0iczAtaTEiPjxkaXYgY2xhc3M9ImludGVsLXNvdXJjZSI+PHNwYW4gY2xhc3M9InRhZyB0YWctZm9ybXVsYSI+VGhlIEZvcm11bGE8L3NwYW4+PC9kaXY+PGRpdiBjbGFzcz0iaW50ZWwtdGV4dCI+Ik5vIGluZGl2aWR1YWwgbW9kaWZpY2F0aW9ucyBmb3Igc2luZ2xlIGN1c3RvbWVycy4gT25lIHBsYXRmb3JtLCBhbGwgbWVyY2hhbnRzLiI8L2Rpdj48L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImludGVsLWl0ZW0iIGlkPSJzMC1pMiI+PGRpdiBjbGFzcz0iaW50ZWwtc291cmNlIj48c3BhbiBjbGFzcz0idGFnIHRhZy1kYXRhIj5CYWNrbG9nPC9zcGFuPjwvZGl2PjxkaXYgY2xhc3M9ImludGVsLXRleHQiPiJHZW5lcmljIE11bHRpLVBhcnR5IFBheW91dHMgbW9kdWxlIGF2YWlsYWJsZSBpbiA5IG1vbnRocyBhcyBhIHBsYXRmb3JtLXdpZGUgZmVhdHVyZS4iPC9kaXY+PC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJpbnRlbC1pdGVtIiBpZD0iczAtaTMiPjxkaXYgY2xhc3M9ImludGVsLXNvdXJjZSI+PHNwYW4gY2xhc3M9InRhZyB0YWctcmlzayI+Umlzazwvc3Bhbj48L2Rpdj48ZGl2IGNsYXNzPSJpbnRlbC10ZXh0Ij4iQSBwcml2YXRlIGZvcmsgY3JlYXRlcyBhIGRlcGVuZGVuY3k6IEdsb2JhbC1TaG9wIGNhbiBibG9jayBmdXR1cmUgZ2xvYmFsIEFQSSBjaGFuZ2VzLiI8L2Rpdj48L2Rpdj4KICA8L2Rpdj4KCiAgPCEtLSBMMyBpbnRlbCBldmFsIC0tPgogIDxkaXYgY2xhc3M9ImludGVsLWV2YWwiIGlkPSJzMC1pbnRlbC1ldmFsIj4KICAgIDxkaXYgY2xhc3M9ImludGVsLWV2YWwtZ3JpZCIgaWQ9InMwLWV2YWwtZ3JpZCI+PC9kaXY+CiAgPC9kaXY+CgogIDwhLS0gTDI6IG9wZW4gYW5zd2VyIC0tPgogIDxkaXYgY2xhc3M9Im9wZW4tYW5zd2VyLXNlY3Rpb24iIGlkPSJzMC1vcGVuIj4KICAgIDxkaXYgY2xhc3M9Im9wZW4tbGFiZWwiPldoYXQgaXMgeW91ciBkZWNpc2lvbiBhbmQgcmF0aW9uYWxlPzwvZGl2PgogICAgPHRleHRhcmVhIGNsYXNzPSJvcGVuLWlucHV0IiBpZD0iczAtb3Blbi1pbnB1dCIgcGxhY2Vob2xkZXI9IkRlc2NyaWJlIHdoYXQgeW91IHdvdWxkIGRvIGFzIFBNIGFuZCB3aHkg4oCUIGNvbnNpZGVyIFRoZSBGb3JtdWxhLCB0ZWNobmljYWwgZGVidCwgYW5kIHRoZSBjbGllbnQgcmVsYXRpb25zaGlwLi4uIiBvbmlucHV0PSJvbk9wZW5JbnB1dCgwKSI+PC90ZXh0YXJlYT4KICAgIDxidXR0b24gY2xhc3M9Im9wZW4tc3VibWl0IiBpZD0iczAtb3Blbi1zdWJtaXQiIG9uY2xpY2s9ImV2YWxPcGVuKDApIj5TdWJtaXQgQW5zd2VyPC9idXR0b24+CiAgPC9kaXY+CgogIDwhLS0gTDE6IGNob2ljZXMgLS0+CiAgPGRpdiBjbGFzcz0iY2hvaWNlcy1zZWN0aW9uIiBpZD0iczAtY2hvaWNlcyI+CiAgICA8ZGl2IGNsYXNzPSJjaG9pY2VzLWxhYmVsIj5XaGF0IGRvIHlvdSBkZWNpZGU/PC9kaXY+CiAgICA8YnV0dG9uIGNsYXNzPSJjaG9pY2UtYnRuIiBpZD0iczAtYzAiIG9uY2xpY2s9ImNob29zZSgwLDAsJ3dyb25nJywnQScpIj48ZGl2IGNsYXNzPSJjaG9pY2Uta2V5Ij5BPC9kaXY+PGRpdj48ZGl2IGNsYXNzPSJjaG9pY2UtdGl0bGUiPkJ1aWxkIGl0IGZvciB0aGVtIG5vdzwvZGl2PjxkaXYgY2xhc3M9ImNob2ljZS1kZXNjIj5JbW1lZGlhdGUgY29udHJhY3Qgc2lnbmVkLiBFbmdpbmVlcmluZyBidWlsZHMgdGhlIGN1c3RvbSBmb3JrIGluIDIgd2Vla3MuPC9kaXY+PC9kaXY+PC9idXR0b24+CiAgICA8YnV0dG9uIGNsYXNzPSJjaG9pY2UtYnRuIiBpZD0iczAtYzEiIG9uY2xpY2s9ImNob29zZSgwLDEsJ3BhcnRpYWwnLCdCJykiPjxkaXYgY2xhc3M9ImNob2ljZS1rZXkiPkI8L2Rpdj48ZGl2PjxkaXYgY2xhc3M9ImNob2ljZS10aXRsZSI+UmVmdXNlIOKAlCB3YWl0IDkgbW9udGhzPC9kaXY+PGRpdiBjbGFzcz0iY2hvaWNlLWRlc2MiPkNsZWFuIGNvZGViYXNlLCB6ZXJvIGRlYnQuIFJpc2s6IEdsb2JhbC1TaG9wIGdvZXMgdG8gU3RyaXBlLjwvZGl2PjwvZGl2PjwvYnV0dG9uPgogICAgPGJ1dHRvbiBjbGFzcz0iY2hvaWNlLWJ0biIgaWQ9InMwLWMyIiBvbmNsaWNrPSJjaG9vc2UoMCwyLCdyaWdodCcsJ0MnKSI+PGRpdiBjbGFzcz0iY2hvaWNlLWtleSI+QzwvZGl2PjxkaXY+PGRpdiBjbGFzcz0iY2hvaWNlLXRpdGxlIj5Qcm9kdWN0aXplIHRoZSByZXF1ZXN0PC9kaXY+PGRpdiBjbGFzcz0iY2hvaWNlLWRlc2MiPk5lZ290aWF0ZTogZGVsaXZlciBpbiA0IG1vbnRocyBhcyBhIHN0YW5kYXJkIEFQSSBtb2R1bGUgZm9yIGFsbCBtZXJjaGFudHMuPC9kaXY+PC9kaXY+PC9idXR0b24+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9ImZlZWRiYWNrIHJpZ2h0IiBpZD0iczAtZmItcmlnaHQiPjxkaXYgY2xhc3M9ImZiLWhlYWQiPkNvcnJlY3Qg4oCUIDgwJSBGb3JtdWxhIGFsaWdubWVudDwvZGl2PjxwPllvdSB0dXJuIGEgY2xpZW50LXNwZWNpZmljIHJlcXVlc3QgaW50byBhIHBsYXRmb3JtIGZlYXR1cmUuIEVuZ2luZWVyaW5nIGFjY2VsZXJhdGVzIHRoZSBnbG9iYWwgcHJvZHVjdDsgY29kZWJhc2Ugc3RheXMgY2xlYW4uIFRoaXMgaXMgZXhhY3RseSBob3cgQWR5ZW4gZm9yIFBsYXRmb3JtcyB3YXMgYm9ybiBmcm9tIHRoZSBlQmF5IG5lZ290aWF0aW9uLjwvcD48ZGl2IGNsYXNzPSJmb3JtdWxhLXRhZyI+T25lIHBsYXRmb3JtLCBhbGwgbWVyY2hhbnRzPC9kaXY+PC9kaXY+CiAgPGRpdiBjbGFzcz0iZmVlZGJhY2sgcGFydGlhbCIgaWQ9InMwLWZiLXBhcnRpYWwiPjxkaXYgY2xhc3M9ImZiLWhlYWQiPlRvbyBjb25zZXJ2YXRpdmU8L2Rpdj48cD5DbGVhbiBjb2RlLCBidXQgcG90ZW50aWFsbHkgYSBsb3N0IGNvbnRyYWN0LiBPcHRpb24gQyBkZWxpdmVycyB0aGUgc2FtZSBvdXRjb21lIOKAlCBubyBmb3JrLCBjbGVhbiBwbGF0Zm9ybSDigJQgd2hpbGUga2VlcGluZyB0aGUgY2xpZW50LiBQdXJlIHB1cmlzbSB3aXRob3V0IGZpbmRpbmcgYSB0aGlyZCBwYXRoIGlzIG5vdCBwcm9kdWN0IGxlYWRlcnNoaXAuPC9wPjwvZGl2PgogIDxkaXYgY2xhc3M9ImZlZWRiYWNrIHdyb25nIiBpZD0iczAtZmItd3JvbmciPjxkaXYgY2xhc3M9ImZiLWhlYWQiPkZvcm11bGEgdmlvbGF0aW9uIOKAlCAwJTwvZGl2PjxwPlRoZSBwcml2YXRlIGZvcmsgbWVhbnMgR2xvYmFsLVNob3AgY2FuIGJsb2NrIGV2ZXJ5IGZ1dHVyZSBnbG9iYWwgQVBJIGNoYW5nZS4gSW4gMTIgbW9udGhzIHlvdXIgZW5naW5lZXJpbmcgdGVhbSB3aWxsIGhhdGUgeW91LiBBZHllbidzIGNvbXBldGl0aXZlIGFkdmFudGFnZSBpcyBpdHMgc2luZ2xlIHBsYXRmb3JtIOKAlCBmcmFnbWVudGluZyBpdCBjcmVhdGVzIGEgbGlhYmlsaXR5IHdvcnRoIG1vcmUgdGhhbiB0aGUg4oKsMTBCIHZvbHVtZSBnYWluLjwvcD48L2Rpdj4KICA8ZGl2IGNsYXNzPSJmZWVkYmFjayBvcGVuLWV2YWwiIGlkPSJzMC1mYi1vcGVuIj48ZGl2IGNsYXNzPSJmYi1oZWFkIj5BbnN3ZXIgZXZhbHVhdGVkPC9kaXY+PHAgaWQ9InMwLW9wZW4tZXZhbC10ZXh0Ij48L3A+PGRpdiBjbGFzcz0iaWRlYWwtYW5zd2VyIj48ZGl2IGNsYXNzPSJpZGVhbC1sYWJlbCI+SWRlYWwgYW5zd2VyPC9kaXY+PGRpdiBjbGFzcz0iaWRlYWwtdGV4dCI+UHJvZHVjdGl6ZSB0aGUgcmVxdWVzdDogbmVnb3RpYXRlIGEgNC1tb250aCB0aW1lbGluZSB0byBkZWxpdmVyIGEgc3RhbmRhcmQgbXVsdGktcGFydHkgcGF5b3V0cyBtb2R1bGUgYWNjZXNzaWJsZSB0byBhbGwgbWVyY2hhbnRzIHZpYSBBUEkuIE5vIGZvcmssIG5vIGN1c3RvbSBjb2RlIOKAlCBqdXN0IGFuIGFjY2VsZXJhdGVkIGJhY2tsb2cgaXRlbS4gVGhpcyBwcmVzZXJ2ZXMgVGhlIEZvcm11bGEsIGVsaW1pbmF0ZXMgdGhlIGFyY2hpdGVjdHVyZSByaXNrLCBhbmQga2VlcHMgdGhlIOKCrDEwQiBjb250cmFjdC48L2Rpdj48L2Rpdj48L2Rpdj4KCiAgPGJ1dHRvbiBjbGFzcz0ibmV4dC1idG4iIGlkPSJzMC1uZXh0IiBvbmNsaWNrPSJuYXZHbygxKSI+TmV4dCBTY2VuYXJpbyDihpI8L2J1dHRvbj4KPC9kaXY+Cgo8IS0tIFMxIC0tPgo8ZGl2IGNsYXNzPSJzY2VuYXJpbyIgaWQ9InMxIj4KICA8ZGl2IGNsYXNzPSJwcm9ncmVzcy1iYXIiPjxkaXYgY2xhc3M9InByb2dyZXNzLWZpbGwiIHN0eWxlPSJ3aWR0aDo1MCUiPjwvZGl2PjwvZGl2PgogIDxkaXYgY2xhc3M9ImxldmVsLWluZGljYXRvciIgaWQ9ImxpMSI+PC9kaXY+CiAgPGRpdiBjbGFzcz0iZXllYnJvdyI+U2NlbmFyaW8gMDIgLyAwNCDigJQgUmVndWxhdG9yeSBDb21wbGlhbmNlPC9kaXY+CiAgPGRpdiBjbGFzcz0ic2MtdGl0bGUiPlRoZSBJbmRpYSBBc3luYyBUcmFwPC9kaXY+CiAgPGRpdiBjbGFzcz0ic2Mtc3ViIj5JbnNwaXJlZCBieTogUkJJIGUtTWFuZGF0ZSByZWd1bGF0aW9ucyBhbmQgQWR5ZW4ncyA0OC1ob3VyIHByZS1ub3RpZmljYXRpb24gcmVxdWlyZW1lbnQ8L2Rpdj4KCiAgPGRpdiBjbGFzcz0iY2FyZCI+CiAgICA8ZGl2IGNsYXNzPSJjYXJkLWxhYmVsIj5CcmllZmluZzwvZGl2PgogICAgPHA+VGhlIFJlc2VydmUgQmFuayBvZiBJbmRpYSBqdXN0IGFubm91bmNlZDogbm8gbW9yZSBzaWxlbnQgc3Vic2NyaXB0aW9uIHJlbmV3YWxzLiBZb3UgbXVzdCBzZW5kIGEgbm90aWZpY2F0aW9uIDQ4IGhvdXJzIGJlZm9yZSBlYWNoIHRyYW5zYWN0aW9uLiBZb3VyIGJpZ2dlc3QgY2xpZW50IOKAlCBhIHN0cmVhbWluZyBnaWFudCDigJQgcGFuaWNzOiA8ZW0+Ik91ciBjb252ZXJzaW9uIHdpbGwgZHJvcCAzMCUhIENhbiB5b3Ugcm91dGUgdGhpcyB0aHJvdWdoIG91ciBEdWJhaSBvZmZpY2UgYXMgYSBjcm9zcy1ib3JkZXIgdHJhbnNhY3Rpb24gdG8gYXZvaWQgdGhlIHJ1bGU/IjwvZW0+PC9wPgogIDwvZGl2PgoKICA8ZGl2IGNsYXNzPSJpbnRlbC11bmxvY2stc2VjdGlvbiIgaWQ9InMxLXVubG9jayI+CiAgICA8ZGl2IGNsYXNzPSJ1bmxvY2stcHJvbXB0Ij5MZXZlbCAwMyDigJQgRGVzY3JpYmUgd2hhdCB5b3UgZXhwZWN0IHRvIGZpbmQgaW4gZWFjaCBpbnRlbGxpZ2VuY2Ugc291cmNlPC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJ1bmxvY2stZ3JpZCI+CiAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtIj48ZGl2IGNsYXNzPSJ1bmxvY2staXRlbS1sYWJlbCI+PHNwYW4gY2xhc3M9InRhZyB0YWctbGVnYWwiPkNvbXBsaWFuY2U8L3NwYW4+PC9kaXY+PHRleHRhcmVhIGlkPSJzMS11LWVuZyIgcGxhY2Vob2xkZXI9IldoYXQgZG9lcyBDb21wbGlhbmNlIHNheSBhYm91dCByb3V0aW5nIEluZGlhbiB0cmFuc2FjdGlvbnMgdmlhIER1YmFpPyIgb25pbnB1dD0iY2hlY2tVbmxvY2soMSkiPjwvdGV4dGFyZWE+PC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtIj48ZGl2IGNsYXNzPSJ1bmxvY2staXRlbS1sYWJlbCI+PHNwYW4gY2xhc3M9InRhZyB0YWctZm9ybXVsYSI+VGhlIEZvcm11bGE8L3NwYW4+PC9kaXY+PHRleHRhcmVhIGlkPSJzMS11LWZvcm11bGEiIHBsYWNlaG9sZGVyPSJXaGF0IGlzIEFkeWVuJ3MgRm9ybXVsYSBzdGFuY2Ugb24gbG9jYWwgZmluYW5jaWFsIHJlZ3VsYXRpb24/IiBvbmlucHV0PSJjaGVja1VubG9jaygxKSI+PC90ZXh0YXJlYT48L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idW5sb2NrLWl0ZW0iPjxkaXYgY2xhc3M9InVubG9jay1pdGVtLWxhYmVsIj48c3BhbiBjbGFzcz0idGFnIHRhZy1kYXRhIj5EYXRhIERhc2hib2FyZDwvc3Bhbj48L2Rpdj48dGV4dGFyZWEgaWQ9InMxLXUtYmFja2xvZyIgcGxhY2Vob2xkZXI9IldoYXQgZGF0YSB3b3VsZCB5b3UgbG9vayBhdCB0byB1bmRlcnN0YW5kIHRoZSBpbXBhY3Qgb24gdHJhbnNhY3Rpb25zPyIgb25pbnB1dD0iY2hlY2tVbmxvY2soMSkiPjwvdGV4dGFyZWE+PC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtIj48ZGl2IGNsYXNzPSJ1bmxvY2staXRlbS1sYWJlbCI+PHNwYW4gY2xhc3M9InRhZyB0YWctZW5nIj5FbmdpbmVlcmluZzwvc3Bhbj48L2Rpdj48dGV4dGFyZWEgaWQ9InMxLXUtcmlzayIgcGxhY2Vob2xkZXI9IldoYXQgdGVjaG5pY2FsIHNvbHV0aW9uIGNvdWxkIGNvbXBseSB3aXRoIHRoZSByZWd1bGF0aW9uIHdoaWxlIG1pbmltaXNpbmcgY29udmVyc2lvbiBsb3NzPyIgb25pbnB1dD0iY2hlY2tVbmxvY2soMSkiPjwvdGV4dGFyZWE+PC9kaXY+CiAgICA8L2Rpdj4KICAgIDxidXR0b24gY2xhc3M9InVubG9jay1idG4iIGlkPSJzMS11bmxvY2stYnRuIiBvbmNsaWNrPSJ1bmxvY2tJbnRlbCgxKSI+VW5sb2NrIEludGVsIENhcmRzIOKGkjwvYnV0dG9uPgogIDwvZGl2PgoKICA8ZGl2IGNsYXNzPSJpbnRlbC1ncmlkIiBpZD0iczEtaW50ZWwiPgogICAgPGRpdiBjbGFzcz0iaW50ZWwtaXRlbSIgaWQ9InMxLWkwIj48ZGl2IGNsYXNzPSJpbnRlbC1zb3VyY2UiPjxzcGFuIGNsYXNzPSJ0YWcgdGFnLWxlZ2FsIj5Db21wbGlhbmNlPC9zcGFuPjwvZGl2PjxkaXYgY2xhc3M9ImludGVsLXRleHQiPiJDcm9zcy1ib3JkZXIgcm91dGluZyB3aXRob3V0IGEgbG9jYWwgbWFuZGF0ZSBtYXkgYmUgY2xhc3NpZmllZCBhcyByZWd1bGF0b3J5IGNpcmN1bXZlbnRpb24uIFdlIHJpc2sgb3VyIEluZGlhbiBiYW5raW5nIGxpY2Vuc2UuIjwvZGl2PjwvZGl2PgogICAgPGRpdiBjbGFzcz0iaW50ZWwtaXRlbSIgaWQ9InMxLWkxIj48ZGl2IGNsYXNzPSJpbnRlbC1zb3VyY2UiPjxzcGFuIGNsYXNzPSJ0YWcgdGFnLWZvcm11bGEiPlRoZSBGb3JtdWxhPC9zcGFuPjwvZGl2PjxkaXYgY2xhc3M9ImludGVsLXRleHQiPiJXZSBmb2xsb3cgbG9jYWwgZmluYW5jaWFsIHJlZ3VsYXRpb25zIGluIGV2ZXJ5IG1hcmtldCB3ZSBvcGVyYXRlIGluLiBOb24tbmVnb3RpYWJsZS4iPC9kaXY+PC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJpbnRlbC1pdGVtIiBpZD0iczEtaTIiPjxkaXYgY2xhc3M9ImludGVsLXNvdXJjZSI+PHNwYW4gY2xhc3M9InRhZyB0YWctZGF0YSI+RGF0YSBEYXNoYm9hcmQ8L3NwYW4+PC9kaXY+PGRpdiBjbGFzcz0iaW50ZWwtdGV4dCI+IjQwJSBvZiB0cmFuc2FjdGlvbnMgYWJvdmUg4oK5MTUsMDAwIGFyZSBwcmVtaXVtIHN1YnNjcmlwdGlvbnMg4oCUIGFsbCByZXF1aXJlIEFGQSBhbmQgdGhlIDQ4aCB3aW5kb3cuIjwvZGl2PjwvZGl2PgogICAgPGRpdiBjbGFzcz0iaW50ZWwtaXRlbSIgaWQ9InMxLWkzIj48ZGl2IGNsYXNzPSJpbnRlbC1zb3VyY2UiPjxzcGFuIGNsYXNzPSJ0YWcgdGFnLWVuZyI+RW5naW5lZXJpbmc8L3NwYW4+PC9kaXY+PGRpdiBjbGFzcz0iaW50ZWwtdGV4dCI+IldlIGNhbiBidWlsZCBhIFdhaXRpbmcgUm9vbSB0aGF0IHF1ZXVlcyByZW5ld2FscyB1bnRpbCB0aGUgNDhoIHdpbmRvdyBjbGVhcnMgYW5kIHJldHJpZXMgYXV0b21hdGljYWxseS4iPC9kaXY+PC9kaXY+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9ImludGVsLWV2YWwiIGlkPSJzMS1pbnRlbC1ldmFsIj48ZGl2IGNsYXNzPSJpbnRlbC1ldmFsLWdyaWQiIGlkPSJzMS1ldmFsLWdyaWQiPjwvZGl2PjwvZGl2PgoKICA8ZGl2IGNsYXNzPSJvcGVuLWFuc3dlci1zZWN0aW9uIiBpZD0iczEtb3BlbiI+CiAgICA8ZGl2IGNsYXNzPSJvcGVuLWxhYmVsIj5XaGF0IGlzIHlvdXIgZGVjaXNpb24gYW5kIHJhdGlvbmFsZT88L2Rpdj4KICAgIDx0ZXh0YXJlYSBjbGFzcz0ib3Blbi1pbnB1dCIgaWQ9InMxLW9wZW4taW5wdXQiIHBsYWNlaG9sZGVyPSJEZXNjcmliZSB3aGF0IHlvdSB3b3VsZCBkbyBhcyBQTSDigJQgZG8geW91IGNvbXBseSwgZmluZCBhIHdvcmthcm91bmQsIG9yIGJ1aWxkIGEgcHJvZHVjdCBzb2x1dGlvbj8iIG9uaW5wdXQ9Im9uT3BlbklucHV0KDEpIj48L3RleHRhcmVhPgogICAgPGJ1dHRvbiBjbGFzcz0ib3Blbi1zdWJtaXQiIGlkPSJzMS1vcGVuLXN1Ym1pdCIgb25jbGljaz0iZXZhbE9wZW4oMSkiPlN1Ym1pdCBBbnN3ZXI8L2J1dHRvbj4KICA8L2Rpdj4KCiAgPGRpdiBjbGFzcz0iY2hvaWNlcy1zZWN0aW9uIiBpZD0iczEtY2hvaWNlcyI+CiAgICA8ZGl2IGNsYXNzPSJjaG9pY2VzLWxhYmVsIj5XaGF0IGRvIHlvdSBkZWNpZGU/PC9kaXY+CiAgICA8YnV0dG9uIGNsYXNzPSJjaG9pY2UtYnRuIiBpZD0iczEtYzAiIG9uY2xpY2s9ImNob29zZSgxLDAsJ3dyb25nJywnQScpIj48ZGl2IGNsYXNzPSJjaG9pY2Uta2V5Ij5BPC9kaXY+PGRpdj48ZGl2IGNsYXNzPSJjaG9pY2UtdGl0bGUiPlJvdXRlIHZpYSBEdWJhaSBhcyBjcm9zcy1ib3JkZXI8L2Rpdj48ZGl2IGNsYXNzPSJjaG9pY2UtZGVzYyI+VGhlIGNsaWVudCBrZWVwcyB0aGVpciBjb252ZXJzaW9uIHJhdGUuIEFwcGVhcnMgYXMgY3Jvc3MtYm9yZGVyLCBieXBhc3NpbmcgUkJJIHJ1bGUuPC9kaXY+PC9kaXY+PC9idXR0b24+CiAgICA8YnV0dG9uIGNsYXNzPSJjaG9pY2UtYnRuIiBpZD0iczEtYzEiIG9uY2xpY2s9ImNob29zZSgxLDEsJ3JpZ2h0JywnQicpIj48ZGl2IGNsYXNzPSJjaG9pY2Uta2V5Ij5CPC9kaXY+PGRpdj48ZGl2IGNsYXNzPSJjaG9pY2UtdGl0bGUiPkJ1aWxkIHRoZSBXYWl0aW5nIFJvb208L2Rpdj48ZGl2IGNsYXNzPSJjaG9pY2UtZGVzYyI+RW5naW5lZXIgYSBjb21wbGlhbnQgcXVldWU6IHNlbmQgdGhlIHByZS1ub3RpZmljYXRpb24gYXQgVC00OGgsIHJldHJ5IG9uIGZhaWx1cmUsIG1heGltaXNlIGNvbnZlcnNpb24gd2l0aGluIHRoZSByZWd1bGF0aW9uLjwvZGl2PjwvZGl2PjwvYnV0dG9uPgogICAgPGJ1dHRvbiBjbGFzcz0iY2hvaWNlLWJ0biIgaWQ9InMxLWMyIiBvbmNsaWNrPSJjaG9vc2UoMSwyLCdwYXJ0aWFsJywnQycpIj48ZGl2IGNsYXNzPSJjaG9pY2Uta2V5Ij5DPC9kaXY+PGRpdj48ZGl2IGNsYXNzPSJjaG9pY2UtdGl0bGUiPlN1c3BlbmQgSW5kaWEgcHJvY2Vzc2luZyB0ZW1wb3JhcmlseTwvZGl2PjxkaXYgY2xhc3M9ImNob2ljZS1kZXNjIj5IYWx0IEluZGlhIHVudGlsIGEgZnVsbHkgY29tcGxpYW50IHNvbHV0aW9uIGlzIHJlYWR5LiBaZXJvIHJpc2ssIHplcm8gSW5kaWEgcmV2ZW51ZS48L2Rpdj48L2Rpdj48L2J1dHRvbj4KICA8L2Rpdj4KCiAgPGRpdiBjbGFzcz0iZmVlZGJhY2sgcmlnaHQiIGlkPSJzMS1mYi1yaWdodCI+PGRpdiBjbGFzcz0iZmItaGVhZCI+Q29ycmVjdCDigJQgMTAwJSBGb3JtdWxhIGFsaWdubWVudDwvZGl2PjxwPlRoZSBXYWl0aW5nIFJvb20gaXMgZXhhY3RseSB0aGUgc29sdXRpb24gQWR5ZW4gYnVpbHQgZm9yIHRoZSBSQkkgY3Jpc2lzLiBZb3UgY29tcGx5IHdpdGggdGhlIHJlZ3VsYXRpb24gd2l0aG91dCBhYmFuZG9uaW5nIHlvdXIgY2xpZW50LiBXb3JrIDxlbT53aXRoPC9lbT4gdGhlIHJlZ3VsYXRpb24sIG5vdCBhcm91bmQgaXQuPC9wPjxkaXYgY2xhc3M9ImZvcm11bGEtdGFnIj5Db21wbGlhbmNlIMK3IFByb2R1Y3Qgc29sdXRpb24gwrcgQ2xpZW50IHByZXNlcnZlZDwvZGl2PjwvZGl2PgogIDxkaXYgY2xhc3M9ImZlZWRiYWNrIHdyb25nIiBpZD0iczEtZmItd3JvbmciPjxkaXYgY2xhc3M9ImZiLWhlYWQiPkxpY2Vuc2UgcmlzazogY3JpdGljYWw8L2Rpdj48cD5JZiBSQkkgY2xhc3NpZmllcyB0aGUgRHViYWkgcm91dGluZyBhcyBjaXJjdW12ZW50aW9uLCBBZHllbiBsb3NlcyBpdHMgSW5kaWFuIGxpY2Vuc2UuIEluZGlhIGlzIGEgc3RyYXRlZ2ljIG1hcmtldC4gWW91J3ZlIHRyYWRlZCBhIGNsaWVudCdzIGNodXJuIHJpc2sgZm9yIGEgcG90ZW50aWFsIOKCrDFCKyBtYXJrZXQgZXhjbHVzaW9uLjwvcD48L2Rpdj4KICA8ZGl2IGNsYXNzPSJmZWVkYmFjayBwYXJ0aWFsIiBpZD0iczEtZmItcGFydGlhbCI+PGRpdiBjbGFzcz0iZmItaGVhZCI+VG9vIGNvbnNlcnZhdGl2ZTwvZGl2PjxwPlNhZmUsIGJ1dCBub3QgbGVhZGVyc2hpcC4gVGhlIFdhaXRpbmcgUm9vbSBhY2hpZXZlcyB0aGUgc2FtZSBjb21wbGlhbmNlIG91dGNvbWUgd2hpbGUga2VlcGluZyB0aGUgY2xpZW50IHJ1bm5pbmcuIEFkeWVuJ3MgdmFsdWUgaXMgbWFraW5nIGNvbXBsaWFuY2UgaW52aXNpYmxlIHRvIG1lcmNoYW50cy48L3A+PC9kaXY+CiAgPGRpdiBjbGFzcz0iZmVlZGJhY2sgb3Blbi1ldmFsIiBpZD0iczEtZmItb3BlbiI+PGRpdiBjbGFzcz0iZmItaGVhZCI+QW5zd2VyIGV2YWx1YXRlZDwvZGl2PjxwIGlkPSJzMS1vcGVuLWV2YWwtdGV4dCI+PC9wPjxkaXYgY2xhc3M9ImlkZWFsLWFuc3dlciI+PGRpdiBjbGFzcz0iaWRlYWwtbGFiZWwiPklkZWFsIGFuc3dlcjwvZGl2PjxkaXYgY2xhc3M9ImlkZWFsLXRleHQiPkJ1aWxkIHRoZSBXYWl0aW5nIFJvb206IGEgY29tcGxpYW50IHF1ZXVlIHRoYXQgc2VuZHMgdGhlIFJCSS1yZXF1aXJlZCBwcmUtbm90aWZpY2F0aW9uIGF0IFQtNDhoLCByZXRyaWVzIG9uIGJhbmsgZGVsYXksIGFuZCBtYXhpbWlzZXMgc3Vic2NyaXB0aW9uIGNvbnZlcnNpb24gd2l0aGluIHRoZSByZWd1bGF0aW9uLiBObyBjaXJjdW12ZW50aW9uLCBubyBzdXNwZW5zaW9uIOKAlCBhIHByb2R1Y3QgdGhhdCB0dXJucyB0aGUgcmVndWxhdGlvbiBpbnRvIGEgZmVhdHVyZS48L2Rpdj48L2Rpdj48L2Rpdj4KCiAgPGJ1dHRvbiBjbGFzcz0ibmV4dC1idG4iIGlkPSJzMS1uZXh0IiBvbmNsaWNrPSJuYXZHbygyKSI+TmV4dCBTY2VuYXJpbyDihpI8L2J1dHRvbj4KPC9kaXY+Cgo8IS0tIFMyIC0tPgo8ZGl2IGNsYXNzPSJzY2VuYXJpbyIgaWQ9InMyIj4KICA8ZGl2IGNsYXNzPSJwcm9ncmVzcy1iYXIiPjxkaXYgY2xhc3M9InByb2dyZXNzLWZpbGwiIHN0eWxlPSJ3aWR0aDo3NSUiPjwvZGl2PjwvZGl2PgogIDxkaXYgY2xhc3M9ImxldmVsLWluZGljYXRvciIgaWQ9ImxpMiI+PC9kaXY+CiAgPGRpdiBjbGFzcz0iZXllYnJvdyI+U2NlbmFyaW8gMDMgLyAwNCDigJQgU2VjdXJpdHkgJmFtcDsgT3BlcmF0aW9uczwvZGl2PgogIDxkaXYgY2xhc3M9InNjLXRpdGxlIj5UaGUgVExTIFN1bnNldDwvZGl2PgogIDxkaXYgY2xhc3M9InNjLXN1YiI+SW5zcGlyZWQgYnk6IEFkeWVuJ3MgZGVwcmVjYXRpb24gb2YgVExTIDEuMC8xLjEgYWNyb3NzIFVuaWZpZWQgQ29tbWVyY2U8L2Rpdj4KCiAgPGRpdiBjbGFzcz0iY2FyZCI+CiAgICA8ZGl2IGNsYXNzPSJjYXJkLWxhYmVsIj5CcmllZmluZzwvZGl2PgogICAgPHA+SXQncyBTZXB0ZW1iZXIuIFBlYWsgc2FsZXMgc2Vhc29uIGlzIGFwcHJvYWNoaW5nLiBFbmdpbmVlcmluZyBhbm5vdW5jZXM6IDxlbT4iV2UncmUgZGlzYWJsaW5nIFRMUyAxLjEgbmV4dCBUdWVzZGF5LiBQQ0ktRFNTIHJlcXVpcmVzIGl0LiI8L2VtPiBBIGtleSBjbGllbnQg4oCUIGEgNTAwLXN0b3JlIGZhc2hpb24gY2hhaW4g4oCUIGNhbGxzOiA8ZW0+Ik91ciB0ZXJtaW5hbCBmaXJtd2FyZSBpcyBvbGQuIElmIHlvdSBmbGlwIHRoZSBzd2l0Y2ggVHVlc2RheSwgd2UgY2FuJ3Qgc2VsbCBhIHNpbmdsZSBpdGVtLiBXZSBuZWVkIGEgMy1tb250aCBleGNlcHRpb24uIjwvZW0+PC9wPgogIDwvZGl2PgoKICA8ZGl2IGNsYXNzPSJpbnRlbC11bmxvY2stc2VjdGlvbiIgaWQ9InMyLXVubG9jayI+CiAgICA8ZGl2IGNsYXNzPSJ1bmxvY2stcHJvbXB0Ij5MZXZlbCAwMyDigJQgRGVzY3JpYmUgd2hhdCB5b3UgZXhwZWN0IHRvIGZpbmQgaW4gZWFjaCBpbnRlbGxpZ2VuY2Ugc291cmNlPC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJ1bmxvY2stZ3JpZCI+CiAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtIj48ZGl2IGNsYXNzPSJ1bmxvY2staXRlbS1sYWJlbCI+PHNwYW4gY2xhc3M9InRhZyB0YWctcmlzayI+U2VjdXJpdHkgLyBSaXNrPC9zcGFuPjwvZGl2Pjx0ZXh0YXJlYSBpZD0iczItdS1lbmciIHBsYWNlaG9sZGVyPSJXaGF0IGFyZSB0aGUgc2VjdXJpdHkgcmlza3Mgb2YgbWFpbnRhaW5pbmcgVExTIDEuMSBldmVuIHRlbXBvcmFyaWx5PyIgb25pbnB1dD0iY2hlY2tVbmxvY2soMikiPjwvdGV4dGFyZWE+PC9kaXY+CiAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtIj48ZGl2IGNsYXNzPSJ1bmxvY2staXRlbS1sYWJlbCI+PHNwYW4gY2xhc3M9InRhZyB0YWctZm9ybXVsYSI+VGhlIEZvcm11bGE8L3NwYW4+PC9kaXY+PHRleHRhcmVhIGlkPSJzMi11LWZvcm11bGEiIHBsYWNlaG9sZGVyPSJXaGF0IGRvZXMgVGhlIEZvcm11bGEgc2F5IGFib3V0IFBDSS1EU1MgY29tcGxpYW5jZT8iIG9uaW5wdXQ9ImNoZWNrVW5sb2NrKDIpIj48L3RleHRhcmVhPjwvZGl2PgogICAgICA8ZGl2IGNsYXNzPSJ1bmxvY2staXRlbSI+PGRpdiBjbGFzcz0idW5sb2NrLWl0ZW0tbGFiZWwiPjxzcGFuIGNsYXNzPSJ0YWcgdGFnLWVuZyI+TG9naXN0aWNzPC9zcGFuPjwvZGl2Pjx0ZXh0YXJlYSBpZD0iczItdS1iYWNrbG9nIiBwbGFjZWhvbGRlcj0iV2hhdCBoYXJkd2FyZSBvciBsb2dpc3RpY3MgcmVzb3VyY2VzIG1pZ2h0IGJlIGF2YWlsYWJsZSB0byByZXNvbHZlIHRoZSB0ZXJtaW5hbCBpc3N1ZT8iIG9uaW5wdXQ9ImNoZWNrVW5sb2NrKDIpIj48L3RleHRhcmVhPjwvZGl2PgogICAgICA8ZGl2IGNsYXNzPSJ1bmxvY2staXRlbSI+PGRpdiBjbGFzcz0idW5sb2NrLWl0ZW0tbGFiZWwiPjxzcGFuIGNsYXNzPSJ0YWcgdGFnLWRhdGEiPkNsaWVudCBkYXRhPC9zcGFuPjwvZGl2Pjx0ZXh0YXJlYSBpZD0iczItdS1yaXNrIiBwbGFjZWhvbGRlcj0iSG93IHNpZ25pZmljYW50IGlzIHRoaXMgY2xpZW50IHRvIEFkeWVuJ3Mgb3ZlcmFsbCB2b2x1bWU/IFdoYXQgZG9lcyB0aGUgcmV2ZW51ZSBtYXRoIGxvb2sgbGlrZT8iIG9uaW5wdXQ9ImNoZWNrVW5sb2NrKDIpIj48L3RleHRhcmVhPjwvZGl2PgogICAgPC9kaXY+CiAgICA8YnV0dG9uIGNsYXNzPSJ1bmxvY2stYnRuIiBpZD0iczItdW5sb2NrLWJ0biIgb25jbGljaz0idW5sb2NrSW50ZWwoMikiPlVubG9jayBJbnRlbCBDYXJkcyDihpI8L2J1dHRvbj4KICA8L2Rpdj4KCiAgPGRpdiBjbGFzcz0iaW50ZWwtZ3JpZCIgaWQ9InMyLWludGVsIj4KICAgIDxkaXYgY2xhc3M9ImludGVsLWl0ZW0iIGlkPSJzMi1pMCI+PGRpdiBjbGFzcz0iaW50ZWwtc291cmNlIj48c3BhbiBjbGFzcz0idGFnIHRhZy1yaXNrIj5TZWN1cml0eTwvc3Bhbj48L2Rpdj48ZGl2IGNsYXNzPSJpbnRlbC10ZXh0Ij4iS2VlcGluZyBUTFMgMS4xIGFjdGl2ZSBpcyBhbiBvcGVuIGRvb3IgZm9yIE1hbi1pbi10aGUtTWlkZGxlIGF0dGFja3MuIE9uZSBpbmNpZGVudCBhbmQgQWR5ZW4gbG9zZXMgaXRzICdtb3N0IHNlY3VyZSBwbGF0Zm9ybScgcmVwdXRhdGlvbi4iPC9kaXY+PC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJpbnRlbC1pdGVtIiBpZD0iczItaTEiPjxkaXYgY2xhc3M9ImludGVsLXNvdXJjZSI+PHNwYW4gY2xhc3M9InRhZyB0YWctZm9ybXVsYSI+VGhlIEZvcm11bGE8L3NwYW4+PC9kaXY+PGRpdiBjbGFzcz0iaW50ZWwtdGV4dCI+IlBDSS1EU1MgY29tcGxpYW5jZSBpcyBub24tbmVnb3RpYWJsZS4gT3VyIGxpY2Vuc2UgZGVwZW5kcyBvbiBpdC4iPC9kaXY+PC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJpbnRlbC1pdGVtIiBpZD0iczItaTIiPjxkaXYgY2xhc3M9ImludGVsLXNvdXJjZSI+PHNwYW4gY2xhc3M9InRhZyB0YWctZW5nIj5Mb2dpc3RpY3M8L3NwYW4+PC9kaXY+PGRpdiBjbGFzcz0iaW50ZWwtdGV4dCI+IjIsMDAwIG5ldyB0ZXJtaW5hbHMgaW4gd2FyZWhvdXNlIHN0b2NrLiBDb3VyaWVyIGxvZ2lzdGljcyBjYW5ub3QgZGVsaXZlciBhbGwgNTAwIHN0b3JlcyBpbiBvbmUgd2VlayDigJQgYnV0IGVtZXJnZW5jeSBkaXNwYXRjaCBjb3VsZCBjb3ZlciB0aGVtIGluIDEwIGRheXMuIjwvZGl2PjwvZGl2PgogICAgPGRpdiBjbGFzcz0iaW50ZWwtaXRlbSIgaWQ9InMyLWkzIj48ZGl2IGNsYXNzPSJpbnRlbC1zb3VyY2UiPjxzcGFuIGNsYXNzPSJ0YWcgdGFnLWRhdGEiPkNsaWVudCBkYXRhPC9zcGFuPjwvZGl2PjxkaXYgY2xhc3M9ImludGVsLXRleHQiPiJUaGUgZmFzaGlvbiBjaGFpbiBpcyAwLjQlIG9mIHZvbHVtZS4gVGhlaXIgMy1tb250aCByZXZlbnVlIGxvc3M6IH7igqwyTS4gQWR5ZW4ncyBJbmRpYW4gbGljZW5zZSB2YWx1ZTogfuKCrDFCKy4gT25lIHByZWNlZGVudCBleGNlcHRpb24gaW52aXRlcyBkb3plbnMgbW9yZS4iPC9kaXY+PC9kaXY+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9ImludGVsLWV2YWwiIGlkPSJzMi1pbnRlbC1ldmFsIj48ZGl2IGNsYXNzPSJpbnRlbC1ldmFsLWdyaWQiIGlkPSJzMi1ldmFsLWdyaWQiPjwvZGl2PjwvZGl2PgoKICA8ZGl2IGNsYXNzPSJvcGVuLWFuc3dlci1zZWN0aW9uIiBpZD0iczItb3BlbiI+CiAgICA8ZGl2IGNsYXNzPSJvcGVuLWxhYmVsIj5XaGF0IGlzIHlvdXIgZGVjaXNpb24gYW5kIHJhdGlvbmFsZT88L2Rpdj4KICAgIDx0ZXh0YXJlYSBjbGFzcz0ib3Blbi1pbnB1dCIgaWQ9InMyLW9wZW4taW5wdXQiIHBsYWNlaG9sZGVyPSJIb3cgZG8geW91IGJhbGFuY2UgUENJLURTUyBjb21wbGlhbmNlIHdpdGggdGhlIGNsaWVudCdzIGJ1c2luZXNzIGNvbnRpbnVpdHk/IiBvbmlucHV0PSJvbk9wZW5JbnB1dCgyKSI+PC90ZXh0YXJlYT4KICAgIDxidXR0b24gY2xhc3M9Im9wZW4tc3VibWl0IiBpZD0iczItb3Blbi1zdWJtaXQiIG9uY2xpY2s9ImV2YWxPcGVuKDIpIj5TdWJtaXQgQW5zd2VyPC9idXR0b24+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9ImNob2ljZXMtc2VjdGlvbiIgaWQ9InMyLWNob2ljZXMiPgogICAgPGRpdiBjbGFzcz0iY2hvaWNlcy1sYWJlbCI+V2hhdCdzIHlvdXIgY2FsbD88L2Rpdj4KICAgIDxidXR0b24gY2xhc3M9ImNob2ljZS1idG4iIGlkPSJzMi1jMCIgb25jbGljaz0iY2hvb3NlKDIsMCwnd3JvbmcnLCdBJykiPjxkaXYgY2xhc3M9ImNob2ljZS1rZXkiPkE8L2Rpdj48ZGl2PjxkaXYgY2xhc3M9ImNob2ljZS10aXRsZSI+R3JhbnQgdGhlIDMtbW9udGggZXhjZXB0aW9uPC9kaXY+PGRpdiBjbGFzcz0iY2hvaWNlLWRlc2MiPk1haW50YWluIFRMUyAxLjEgZm9yIHRoaXMgb25lIGNsaWVudC4gVGhleSBrZWVwIHNlbGxpbmcuIEFkeWVuIGtlZXBzIHRoZSByZWxhdGlvbnNoaXAuPC9kaXY+PC9kaXY+PC9idXR0b24+CiAgICA8YnV0dG9uIGNsYXNzPSJjaG9pY2UtYnRuIiBpZD0iczItYzEiIG9uY2xpY2s9ImNob29zZSgyLDEsJ3JpZ2h0JywnQicpIj48ZGl2IGNsYXNzPSJjaG9pY2Uta2V5Ij5CPC9kaXY+PGRpdj48ZGl2IGNsYXNzPSJjaG9pY2UtdGl0bGUiPldhciBSb29tOiBzZWN1cmUgdHVubmVsICsgZW1lcmdlbmN5IGxvZ2lzdGljczwvZGl2PjxkaXYgY2xhc3M9ImNob2ljZS1kZXNjIj5TZXQgdXAgYSBUTFMgMS4yIHByb3h5IGZvciB0aGlzIGNsaWVudCBvbmx5LCB3aGlsZSBjb29yZGluYXRpbmcgZW1lcmdlbmN5IHRlcm1pbmFsIGRlbGl2ZXJ5IGluIDEwIGRheXMuIFN1bnNldCB0aGUgdHVubmVsIHdoZW4gaGFyZHdhcmUgaXMgbGl2ZS48L2Rpdj48L2Rpdj48L2J1dHRvbj4KICAgIDxidXR0b24gY2xhc3M9ImNob2ljZS1idG4iIGlkPSJzMi1jMiIgb25jbGljaz0iY2hvb3NlKDIsMiwncGFydGlhbCcsJ0MnKSI+PGRpdiBjbGFzcz0iY2hvaWNlLWtleSI+QzwvZGl2PjxkaXY+PGRpdiBjbGFzcz0iY2hvaWNlLXRpdGxlIj5Gb3JjZSBvZmZsaW5lIHVudGlsIGhhcmR3YXJlIGFycml2ZXM8L2Rpdj48ZGl2IGNsYXNzPSJjaG9pY2UtZGVzYyI+Q2xpZW50IGdvZXMgb2ZmbGluZSBmb3IgdGhlIHRyYW5zaXRpb24gcGVyaW9kLiBObyBzZWN1cml0eSBleGNlcHRpb24uIFBsYXRmb3JtIHN0YXlzIGNsZWFuLjwvZGl2PjwvZGl2PjwvYnV0dG9uPgogIDwvZGl2PgoKICA8ZGl2IGNsYXNzPSJmZWVkYmFjayByaWdodCIgaWQ9InMyLWZiLXJpZ2h0Ij48ZGl2IGNsYXNzPSJmYi1oZWFkIj5Db3JyZWN0IOKAlCBwcmFnbWF0aWMgc2VjdXJpdHkgbGVhZGVyc2hpcDwvZGl2PjxwPlRoZSBMZWdhY3kgVHVubmVsIHJ1bnMgVExTIDEuMiBhdCB0aGUgcHJveHkgbGF5ZXIg4oCUIHRoZSBBZHllbiBwbGF0Zm9ybSBuZXZlciB0b3VjaGVzIFRMUyAxLjEuIFlvdSBzaW11bHRhbmVvdXNseSBtb2JpbGlzZSBlbWVyZ2VuY3kgbG9naXN0aWNzLiBUaGlzIGlzIFdhciBSb29tIHRoaW5raW5nOiBtYWludGFpbiBjb21wbGlhbmNlLCBtaW5pbWlzZSBjbGllbnQgZGFtYWdlLCBoYXJkIGRlYWRsaW5lIHRvIGNsb3NlIHRoZSB0dW5uZWwuPC9wPjxkaXYgY2xhc3M9ImZvcm11bGEtdGFnIj5QQ0ktRFNTIGNvbXBsaWFudCDCtyBUaW1lLWJveGVkIMK3IENsaWVudCBwcmVzZXJ2ZWQ8L2Rpdj48L2Rpdj4KICA8ZGl2IGNsYXNzPSJmZWVkYmFjayB3cm9uZyIgaWQ9InMyLWZiLXdyb25nIj48ZGl2IGNsYXNzPSJmYi1oZWFkIj5QQ0ktRFNTIHZpb2xhdGlvbjwvZGl2PjxwPkEgZm9ybWFsIGV4Y2VwdGlvbiB0byBhIFBDSS1EU1MgcmVxdWlyZW1lbnQgcmlza3MgQWR5ZW4ncyBMZXZlbCAxIGNlcnRpZmljYXRpb24uIE9uZSBleGNlcHRpb24gYmVjb21lcyBhIHByZWNlZGVudC4gIkp1c3QgdGhpcyBvbmUgY2xpZW50IiBpcyBob3cgY29tcGxpYW5jZSByZWdpbWVzIGNvbGxhcHNlLjwvcD48L2Rpdj4KICA8ZGl2IGNsYXNzPSJmZWVkYmFjayBwYXJ0aWFsIiBpZD0iczItZmItcGFydGlhbCI+PGRpdiBjbGFzcz0iZmItaGVhZCI+Q2xlYW4sIGJ1dCBubyBjbGllbnQgZW1wYXRoeTwvZGl2PjxwPlBsYXRmb3JtIHN0YXlzIGZ1bGx5IGNvbXBsaWFudC4gQnV0IHlvdSd2ZSBhYmFuZG9uZWQgYSBsb25nLXRlcm0gY2xpZW50IGR1cmluZyBwZWFrIHNlYXNvbiB3aXRob3V0IG9mZmVyaW5nIGEgc29sdXRpb24uIFRoZSBMZWdhY3kgVHVubmVsIGFjaGlldmVzIHRoZSBzYW1lIGNvbXBsaWFuY2Ugb3V0Y29tZSB3aGlsZSBwcm90ZWN0aW5nIHRoZSByZWxhdGlvbnNoaXAuPC9wPjwvZGl2PgogIDxkaXYgY2xhc3M9ImZlZWRiYWNrIG9wZW4tZXZhbCIgaWQ9InMyLWZiLW9wZW4iPjxkaXYgY2xhc3M9ImZiLWhlYWQiPkFuc3dlciBldmFsdWF0ZWQ8L2Rpdj48cCBpZD0iczItb3Blbi1ldmFsLXRleHQiPjwvcD48ZGl2IGNsYXNzPSJpZGVhbC1hbnN3ZXIiPjxkaXYgY2xhc3M9ImlkZWFsLWxhYmVsIj5JZGVhbCBhbnN3ZXI8L2Rpdj48ZGl2IGNsYXNzPSJpZGVhbC10ZXh0Ij5XYXIgUm9vbSBhcHByb2FjaDogZGVwbG95IGEgVExTIDEuMiB0ZXJtaW5hdGlvbiBwcm94eSBmb3IgdGhlIGNsaWVudCAocGxhdGZvcm0gc3RheXMgUENJLWNvbXBsaWFudCksIGNvb3JkaW5hdGUgZW1lcmdlbmN5IHRlcm1pbmFsIGRlbGl2ZXJ5IGluIDEwIGRheXMsIHRoZW4gc2h1dCBkb3duIHRoZSBwcm94eS4gTWFpbnRhaW4gY29tcGxpYW5jZSwgcHJvdGVjdCB0aGUgY2xpZW50LCBzZXQgYSBoYXJkIGRlYWRsaW5lLjwvZGl2PjwvZGl2PjwvZGl2PgoKICA8YnV0dG9uIGNsYXNzPSJuZXh0LWJ0biIgaWQ9InMyLW5leHQiIG9uY2xpY2s9Im5hdkdvKDMpIj5OZXh0IFNjZW5hcmlvIOKGkjwvYnV0dG9uPgo8L2Rpdj4KCjwhLS0gUzMgLS0+CjxkaXYgY2xhc3M9InNjZW5hcmlvIiBpZD0iczMiPgogIDxkaXYgY2xhc3M9InByb2dyZXNzLWJhciI+PGRpdiBjbGFzcz0icHJvZ3Jlc3MtZmlsbCIgc3R5bGU9IndpZHRoOjEwMCUiPjwvZGl2PjwvZGl2PgogIDxkaXYgY2xhc3M9ImxldmVsLWluZGljYXRvciIgaWQ9ImxpMyI+PC9kaXY+CiAgPGRpdiBjbGFzcz0iZXllYnJvdyI+U2NlbmFyaW8gMDQgLyAwNCDigJQgSW5mcmFzdHJ1Y3R1cmUgwrcgQm9udXM8L2Rpdj4KICA8ZGl2IGNsYXNzPSJzYy10aXRsZSI+VGhlIFBvc3RncmVTUUwgVE9BU1QgQ3Jpc2lzPC9kaXY+CiAgPGRpdiBjbGFzcz0ic2Mtc3ViIj5JbnNwaXJlZCBieTogQWR5ZW4ncyBQb3N0Z3JlU1FMIFRPQVNUIGNvcnJ1cHRpb24gaW5jaWRlbnQgKDIwMjUpPC9kaXY+CgogIDxkaXYgY2xhc3M9ImNhcmQiPgogICAgPGRpdiBjbGFzcz0iY2FyZC1sYWJlbCI+QnJpZWZpbmc8L2Rpdj4KICAgIDxwPllvdSBhcmUgdGhlIFBNIGZvciBJbmZyYXN0cnVjdHVyZSBQZXJmb3JtYW5jZS4gRW5naW5lZXJzIGFycml2ZTogPGVtPiJXZSBoYXZlIHNpbGVudCBkYXRhIGNvcnJ1cHRpb24gaW4gUG9zdGdyZVNRTCdzIFRPQVNUIG1lY2hhbmlzbS4gV2UgbmVlZCB0byBoYWx0IGFsbCBuZXcgZGVwbG95bWVudHMg4oCUIGluY2x1ZGluZyB0aGUgQnV5IE5vdyBQYXkgTGF0ZXIgbGF1bmNoIFNhbGVzIGhhcyBiZWVuIHdhaXRpbmcgNiBtb250aHMgZm9yIOKAlCB0byBzY2FuIGJpbGxpb25zIG9mIHJvd3MuIjwvZW0+PC9wPgogIDwvZGl2PgoKICA8ZGl2IGNsYXNzPSJpbnRlbC11bmxvY2stc2VjdGlvbiIgaWQ9InMzLXVubG9jayI+CiAgICA8ZGl2IGNsYXNzPSJ1bmxvY2stcHJvbXB0Ij5MZXZlbCAwMyDigJQgRGVzY3JpYmUgd2hhdCB5b3UgZXhwZWN0IHRvIGZpbmQgaW4gZWFjaCBpbnRlbGxpZ2VuY2Ugc291cmNlPC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJ1bmxvY2stZ3JpZCI+CiAgICAgIDxkaXYgY2xhc3M9InVubG9jay1pdGVtIj48ZGl2IGNsYXNzPSJ1bmxvY2staXRlbS1sYWJlbCI+PHNwYW4gY2xhc3M9InRhZyB0YWctZW5nIj5FbmdpbmVlcmluZzwvc3Bhbj48L2Rpdj48dGV4dGFyZWEgaWQ9InMzLXUtZW5nIiBwbGFjZWhvbGRlcj0iV2hhdCBkb2VzIEVuZ2luZWVyaW5nIHNheSBhYm91dCB0aGUgc2NhbiBwcm9jZXNzIOKAlCBob3cgbG9uZywgd2hhdCdzIGJsb2NrZWQ/IiBvbmlucHV0PSJjaGVja1VubG9jaygzKSI+PC90ZXh0YXJlYT48L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idW5sb2NrLWl0ZW0iPjxkaXYgY2xhc3M9InVubG9jay1pdGVtLWxhYmVsIj48c3BhbiBjbGFzcz0idGFnIHRhZy1mb3JtdWxhIj5UaGUgRm9ybXVsYTwvc3Bhbj48L2Rpdj48dGV4dGFyZWEgaWQ9InMzLXUtZm9ybXVsYSIgcGxhY2Vob2xkZXI9IldoYXQgZG9lcyBBZHllbidzIEZvcm11bGEgc2F5IGFib3V0IGRhdGEgaW50ZWdyaXR5IHZzIGZlYXR1cmUgdmVsb2NpdHk/IiBvbmlucHV0PSJjaGVja1VubG9jaygzKSI+PC90ZXh0YXJlYT48L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idW5sb2NrLWl0ZW0iPjxkaXYgY2xhc3M9InVubG9jay1pdGVtLWxhYmVsIj48c3BhbiBjbGFzcz0idGFnIHRhZy1kYXRhIj5TYWxlcyAvIFJldmVudWU8L3NwYW4+PC9kaXY+PHRleHRhcmVhIGlkPSJzMy11LWJhY2tsb2ciIHBsYWNlaG9sZGVyPSJXaGF0IGlzIHRoZSByZXZlbnVlIHByZXNzdXJlIGZyb20gdGhlIGRlbGF5ZWQgQk5QTCBsYXVuY2g/IiBvbmlucHV0PSJjaGVja1VubG9jaygzKSI+PC90ZXh0YXJlYT48L2Rpdj4KICAgICAgPGRpdiBjbGFzcz0idW5sb2NrLWl0ZW0iPjxkaXYgY2xhc3M9InVubG9jay1pdGVtLWxhYmVsIj48c3BhbiBjbGFzcz0idGFnIHRhZy1yaXNrIj5SaXNrPC9zcGFuPjwvZGl2Pjx0ZXh0YXJlYSBpZD0iczMtdS1yaXNrIiBwbGFjZWhvbGRlcj0iV2hhdCBoYXBwZW5zIGlmIHlvdSBsYXVuY2ggQk5QTCBvbiB0b3Agb2YgYSBrbm93biBkYXRhIGNvcnJ1cHRpb24/IiBvbmlucHV0PSJjaGVja1VubG9jaygzKSI+PC90ZXh0YXJlYT48L2Rpdj4KICAgIDwvZGl2PgogICAgPGJ1dHRvbiBjbGFzcz0idW5sb2NrLWJ0biIgaWQ9InMzLXVubG9jay1idG4iIG9uY2xpY2s9InVubG9ja0ludGVsKDMpIj5VbmxvY2sgSW50ZWwgQ2FyZHMg4oaSPC9idXR0b24+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9ImludGVsLWdyaWQiIGlkPSJzMy1pbnRlbCI+CiAgICA8ZGl2IGNsYXNzPSJpbnRlbC1pdGVtIiBpZD0iczMtaTAiPjxkaXYgY2xhc3M9ImludGVsLXNvdXJjZSI+PHNwYW4gY2xhc3M9InRhZyB0YWctZW5nIj5FbmdpbmVlcmluZzwvc3Bhbj48L2Rpdj48ZGl2IGNsYXNzPSJpbnRlbC10ZXh0Ij4iVE9BU1QgY29ycnVwdGlvbiBpcyBzaWxlbnQg4oCUIGxvb2tzIHZhbGlkIHVudGlsIHJlYWQuIEZ1bGwgcHJvZHVjdGlvbiBEQiBzY2FuOiB+NzIgaG91cnMuIENhbm5vdCBzYWZlbHkgZGVwbG95IGR1cmluZyBzY2FuLiI8L2Rpdj48L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImludGVsLWl0ZW0iIGlkPSJzMy1pMSI+PGRpdiBjbGFzcz0iaW50ZWwtc291cmNlIj48c3BhbiBjbGFzcz0idGFnIHRhZy1mb3JtdWxhIj5UaGUgRm9ybXVsYTwvc3Bhbj48L2Rpdj48ZGl2IGNsYXNzPSJpbnRlbC10ZXh0Ij4iRGF0YSBpbnRlZ3JpdHkgaXMgdGhlIGZvdW5kYXRpb24gb2YgdHJ1c3QuIFdlIG5ldmVyIHNoaXAgb24gdG9wIG9mIGEga25vd24gZGF0YSByaXNrLiI8L2Rpdj48L2Rpdj4KICAgIDxkaXYgY2xhc3M9ImludGVsLWl0ZW0iIGlkPSJzMy1pMiI+PGRpdiBjbGFzcz0iaW50ZWwtc291cmNlIj48c3BhbiBjbGFzcz0idGFnIHRhZy1kYXRhIj5TYWxlczwvc3Bhbj48L2Rpdj48ZGl2IGNsYXNzPSJpbnRlbC10ZXh0Ij4iQk5QTCBoYXMgMyBzaWduZWQgZW50ZXJwcmlzZSBjbGllbnRzIHdhaXRpbmcuIEV2ZXJ5IHdlZWsgb2YgZGVsYXkgY29zdHMgfuKCrDQwMEsgaW4gY29tbWl0dGVkIHJldmVudWUuIjwvZGl2PjwvZGl2PgogICAgPGRpdiBjbGFzcz0iaW50ZWwtaXRlbSIgaWQ9InMzLWkzIj48ZGl2IGNsYXNzPSJpbnRlbC1zb3VyY2UiPjxzcGFuIGNsYXNzPSJ0YWcgdGFnLXJpc2siPlJpc2s8L3NwYW4+PC9kaXY+PGRpdiBjbGFzcz0iaW50ZWwtdGV4dCI+IklmIGNvcnJ1cHRlZCBkYXRhIHJlYWNoZXMgYSBsaXZlIEJOUEwgdHJhbnNhY3Rpb24sIHdlIG1heSBwcm9jZXNzIGluY29ycmVjdCBhbW91bnRzLiBSZWd1bGF0b3J5IGV4cG9zdXJlOiBzaWduaWZpY2FudC4iPC9kaXY+PC9kaXY+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9ImludGVsLWV2YWwiIGlkPSJzMy1pbnRlbC1ldmFsIj48ZGl2IGNsYXNzPSJpbnRlbC1ldmFsLWdyaWQiIGlkPSJzMy1ldmFsLWdyaWQiPjwvZGl2PjwvZGl2PgoKICA8ZGl2IGNsYXNzPSJvcGVuLWFuc3dlci1zZWN0aW9uIiBpZD0iczMtb3BlbiI+CiAgICA8ZGl2IGNsYXNzPSJvcGVuLWxhYmVsIj5XaGF0IGlzIHlvdXIgZGVjaXNpb24gYW5kIHJhdGlvbmFsZT88L2Rpdj4KICAgIDx0ZXh0YXJlYSBjbGFzcz0ib3Blbi1pbnB1dCIgaWQ9InMzLW9wZW4taW5wdXQiIHBsYWNlaG9sZGVyPSJIb3cgZG8geW91IHByaW9yaXRpc2UgZGF0YSBpbnRlZ3JpdHkgdnMuIHRoZSBCTlBMIGxhdW5jaD8gV2hhdCBkbyB5b3UgY29tbXVuaWNhdGUgdG8gU2FsZXMgYW5kIHN0YWtlaG9sZGVycz8iIG9uaW5wdXQ9Im9uT3BlbklucHV0KDMpIj48L3RleHRhcmVhPgogICAgPGJ1dHRvbiBjbGFzcz0ib3Blbi1zdWJtaXQiIGlkPSJzMy1vcGVuLXN1Ym1pdCIgb25jbGljaz0iZXZhbE9wZW4oMykiPlN1Ym1pdCBBbnN3ZXI8L2J1dHRvbj4KICA8L2Rpdj4KCiAgPGRpdiBjbGFzcz0iY2hvaWNlcy1zZWN0aW9uIiBpZD0iczMtY2hvaWNlcyI+CiAgICA8ZGl2IGNsYXNzPSJjaG9pY2VzLWxhYmVsIj5TYWxlcyBpcyBmdXJpb3VzLiBXaGF0IGRvIHlvdSBwcmlvcml0aXplPzwvZGl2PgogICAgPGJ1dHRvbiBjbGFzcz0iY2hvaWNlLWJ0biIgaWQ9InMzLWMwIiBvbmNsaWNrPSJjaG9vc2UoMywwLCd3cm9uZycsJ0EnKSI+PGRpdiBjbGFzcz0iY2hvaWNlLWtleSI+QTwvZGl2PjxkaXY+PGRpdiBjbGFzcz0iY2hvaWNlLXRpdGxlIj5MYXVuY2ggQk5QTCBub3csIHNjYW4gaW4gcGFyYWxsZWw8L2Rpdj48ZGl2IGNsYXNzPSJjaG9pY2UtZGVzYyI+U2hpcCBCTlBMIHdoaWxlIHJ1bm5pbmcgdGhlIERCIHNjYW4gaW4gYmFja2dyb3VuZC4gS2VlcCB0aGUgcmV2ZW51ZS4gRml4IGlmIHNvbWV0aGluZyBicmVha3MuPC9kaXY+PC9kaXY+PC9idXR0b24+CiAgICA8YnV0dG9uIGNsYXNzPSJjaG9pY2UtYnRuIiBpZD0iczMtYzEiIG9uY2xpY2s9ImNob29zZSgzLDEsJ3JpZ2h0JywnQicpIj48ZGl2IGNsYXNzPSJjaG9pY2Uta2V5Ij5CPC9kaXY+PGRpdj48ZGl2IGNsYXNzPSJjaG9pY2UtdGl0bGUiPkZ1bGwgZnJlZXplIOKAlCBzY2FuIGZpcnN0LCB0aGVuIGxhdW5jaDwvZGl2PjxkaXYgY2xhc3M9ImNob2ljZS1kZXNjIj5IYWx0IGFsbCBkZXBsb3ltZW50cy4gQ29tcGxldGUgdGhlIFRPQVNUIHNjYW4uIENvbW11bmljYXRlIHByb2FjdGl2ZWx5IHdpdGggYSBjbGVhciA3Mi1ob3VyIHRpbWVsaW5lLjwvZGl2PjwvZGl2PjwvYnV0dG9uPgogICAgPGJ1dHRvbiBjbGFzcz0iY2hvaWNlLWJ0biIgaWQ9InMzLWMyIiBvbmNsaWNrPSJjaG9vc2UoMywyLCdwYXJ0aWFsJywnQycpIj48ZGl2IGNsYXNzPSJjaG9pY2Uta2V5Ij5DPC9kaXY+PGRpdj48ZGl2IGNsYXNzPSJjaG9pY2UtdGl0bGUiPkxhdW5jaCBCTlBMIG9uIGlzb2xhdGVkIG5ldyBEQjwvZGl2PjxkaXYgY2xhc3M9ImNob2ljZS1kZXNjIj5TdGFuZCB1cCBhIGNsZWFuIFBvc3RncmVTUUwgaW5zdGFuY2UgZm9yIEJOUEwgb25seS4gSXNvbGF0ZSB0aGUgcmlzay4gU2NhbiBtYWluIERCIHNlcGFyYXRlbHkuPC9kaXY+PC9kaXY+PC9idXR0b24+CiAgPC9kaXY+CgogIDxkaXYgY2xhc3M9ImZlZWRiYWNrIHJpZ2h0IiBpZD0iczMtZmItcmlnaHQiPjxkaXYgY2xhc3M9ImZiLWhlYWQiPkNvcnJlY3Qg4oCUIERhdGEgaW50ZWdyaXR5IGZpcnN0PC9kaXY+PHA+QSA3Mi1ob3VyIGRlbGF5IGlzIGEgc3RvcnkgeW91IGNhbiB0ZWxsLiBBIGNvcnJ1cHRlZCBCTlBMIHRyYW5zYWN0aW9uIHRyaWdnZXJzIHJlZ3VsYXRvcnkgaW52ZXN0aWdhdGlvbiwgY2xpZW50IGluY2lkZW50cywgYW5kIGFuIGVuZ2luZWVyaW5nIGNyaXNpcyBzaW11bHRhbmVvdXNseS4gUHJvYWN0aXZlIGNvbW11bmljYXRpb24gdHJhbnNmb3JtcyB0aGlzIGZyb20gY3Jpc2lzIGludG8gcHJvZmVzc2lvbmFsIGV4ZWN1dGlvbi48L3A+PGRpdiBjbGFzcz0iZm9ybXVsYS10YWciPkRhdGEgaW50ZWdyaXR5IMK3IFByb2FjdGl2ZSBjb21tdW5pY2F0aW9uIMK3IExhdW5jaCBjb25maWRlbmNlPC9kaXY+PC9kaXY+CiAgPGRpdiBjbGFzcz0iZmVlZGJhY2sgd3JvbmciIGlkPSJzMy1mYi13cm9uZyI+PGRpdiBjbGFzcz0iZmItaGVhZCI+WW91IGJ1aWx0IG9uIHNhbmQ8L2Rpdj48cD5Zb3UgbGF1bmNoZWQgYSBmaW5hbmNpYWwgcHJvZHVjdCBvbiB0b3Agb2YgYSBrbm93biBkYXRhIGludGVncml0eSBpc3N1ZS4gVE9BU1QgY29ycnVwdGlvbiBpcyBhIGZvdW5kYXRpb24gcHJvYmxlbSDigJQgeW91IGNhbm5vdCBidWlsZCBvbiBpdCBhbmQgZml4IGxhdGVyIGluIHBheW1lbnRzIGluZnJhc3RydWN0dXJlLjwvcD48L2Rpdj4KICA8ZGl2IGNsYXNzPSJmZWVkYmFjayBwYXJ0aWFsIiBpZD0iczMtZmItcGFydGlhbCI+PGRpdiBjbGFzcz0iZmItaGVhZCI+Q3JlYXRpdmUgYnV0IGFkZHMgY29tcGxleGl0eSByaXNrPC9kaXY+PHA+VGhlIGlzb2xhdGlvbiBhcHByb2FjaCBoYXMgbWVyaXQsIGJ1dCBzdGFuZGluZyB1cCBhIHNlcGFyYXRlIHByb2R1Y3Rpb24gREIgaW50cm9kdWNlcyBuZXcgcmlza3M6IGRpZmZlcmVudCBjb25maWcsIG5vIGJhdHRsZS10ZXN0aW5nLCBtaWdyYXRpb24gcGF0aHMuIEluIGEgY3Jpc2lzLCBzaW1wbGUgd2lucyBvdmVyIGNsZXZlci4gRnVsbCBmcmVlemUgaXMgNzIgaG91cnMg4oCUIHRha2UgaXQuPC9wPjwvZGl2PgogIDxkaXYgY2xhc3M9ImZlZWRiYWNrIG9wZW4tZXZhbCIgaWQ9InMzLWZiLW9wZW4iPjxkaXYgY2xhc3M9ImZiLWhlYWQiPkFuc3dlciBldmFsdWF0ZWQ8L2Rpdj48cCBpZD0iczMtb3Blbi1ldmFsLXRleHQiPjwvcD48ZGl2IGNsYXNzPSJpZGVhbC1hbnN3ZXIiPjxkaXYgY2xhc3M9ImlkZWFsLWxhYmVsIj5JZGVhbCBhbnN3ZXI8L2Rpdj48ZGl2IGNsYXNzPSJpZGVhbC10ZXh0Ij5GdWxsIGZyZWV6ZTogaGFsdCBhbGwgZGVwbG95bWVudHMsIGNvbXBsZXRlIHRoZSA3Mi1ob3VyIFRPQVNUIHNjYW4sIGNvbW11bmljYXRlIGEgcHJlY2lzZSByZXN1bXB0aW9uIHRpbWVsaW5lIHRvIFNhbGVzIGFuZCBCTlBMIGNsaWVudHMuIEZyYW1lIGl0IGFzOiAibm8gbmV3cyBpcyB0aGUgYmVzdCBuZXdzIOKAlCB3ZSBsYXVuY2ggb24gY2xlYW4gZGF0YS4iIERhdGEgaW50ZWdyaXR5IGlzIHRoZSBmb3VuZGF0aW9uOyBhIDcyaCBkZWxheSBjb3N0cyDigqw4MEssIGEgY29ycnVwdGVkIGxhdW5jaCBjb3N0cyB0aGUgbGljZW5zZS48L2Rpdj48L2Rpdj48L2Rpdj4KCiAgPGJ1dHRvbiBjbGFzcz0ibmV4dC1idG4iIGlkPSJzMy1uZXh0IiBvbmNsaWNrPSJzaG93UmVzdWx0cygpIj5TZWUgUmVzdWx0cyDihpI8L2J1dHRvbj4KPC9kaXY+Cgo8IS0tIFJFU1VMVFMgLS0+CjxkaXYgaWQ9InJlc3VsdHMiPgogIDxkaXYgY2xhc3M9InByb2dyZXNzLWJhciI+PGRpdiBjbGFzcz0icHJvZ3Jlc3MtZmlsbCIgc3R5bGU9IndpZHRoOjEwMCUiPjwvZGl2PjwvZGl2PgogIDxkaXYgY2xhc3M9ImV5ZWJyb3ciPlNpbXVsYXRpb24gQ29tcGxldGU8L2Rpdj4KICA8ZGl2IGNsYXNzPSJzYy10aXRsZSI+WW91ciBGb3JtdWxhIEFsaWdubWVudDwvZGl2PgogIDxkaXYgY2xhc3M9InNjLXN1YiI+UmVzdWx0cyBmb3IgYWxsIDQgc2NlbmFyaW9zIGF0IHlvdXIgc2VsZWN0ZWQgZGlmZmljdWx0eSBsZXZlbC48L2Rpdj4KICA8ZGl2IGNsYXNzPSJyZXN1bHRzLWdyaWQiIGlkPSJyZXN1bHRzLWdyaWQiPjwvZGl2PgogIDxkaXYgY2xhc3M9ImNhcmQiPjxkaXYgY2xhc3M9ImNhcmQtbGFiZWwiPk92ZXJhbGwgQXNzZXNzbWVudDwvZGl2PjxwIGlkPSJvdmVyYWxsLXRleHQiIHN0eWxlPSJmb250LXNpemU6MTRweDtsaW5lLWhlaWdodDoxLjc1OyI+PC9wPjwvZGl2PgogIDxicj4KICA8YnV0dG9uIGNsYXNzPSJyZXN0YXJ0LWJ0biIgb25jbGljaz0icmVzdGFydCgpIj5TdGFydCBBZ2FpbjwvYnV0dG9uPgo8L2Rpdj4KCjwvbWFpbj4KCjxzY3JpcHQ+CmxldCBMRVZFTCA9IDA7CmNvbnN0IHNjb3JlcyA9IFtudWxsLG51bGwsbnVsbCxudWxsXTsKY29uc3QgU0NfTkFNRVMgPSBbJ01hcmtldHBsYWNlIERpbGVtbWEnLCdJbmRpYSBBc3luYyBUcmFwJywnVExTIFN1bnNldCcsJ1Bvc3RncmVTUUwgQ3Jpc2lzJ107CmNvbnN0IFNDT1JFX01BUCA9IHtyaWdodDoxMDAsIHBhcnRpYWw6NTAsIHdyb25nOjB9OwoKLy8g4pSA4pSAIERJRkZJQ1VMVFkgU0VMRUNUSU9OIOKUgOKUgApmdW5jdGlvbiBwaWNrTGV2ZWwobikgewogIExFVkVMID0gbjsKICBkb2N1bWVudC5xdWVyeVNlbGVjdG9yQWxsKCcuZGlmZi1jYXJkJykuZm9yRWFjaChjID0+IGMuY2xhc3NMaXN0LnJlbW92ZSgncGlja2VkJykpOwogIGRvY3VtZW50LnF1ZXJ5U2VsZWN0b3JBbGwoJy5kaWZmLWNhcmQnKVtuLTFdLmNsYXNzTGlzdC5hZGQoJ3BpY2tlZCcpOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzdGFydC1idG4nKS5jbGFzc0xpc3QuYWRkKCdzaG93Jyk7Cn0KCmZ1bmN0aW9uIHN0YXJ0U2ltKCkgewogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdkaWZmaWN1bHR5LXNjcmVlbicpLnN0eWxlLmRpc3BsYXkgPSAnbm9uZSc7CiAgY29uc3QgbWFpbiA9IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdtYWluLXNpbScpOwogIG1haW4uY2xhc3NMaXN0LmFkZCgnc2hvdycpOwogIHNldHVwTGV2ZWwoKTsKICBuYXZHbygwKTsKICBkb2N1bWVudC5xdWVyeVNlbGVjdG9yQWxsKCcubmF2LXRhYicpLmZvckVhY2godCA9PiB0LnN0eWxlLmRpc3BsYXkgPSAnaW5saW5lLWZsZXgnKTsKfQoKZnVuY3Rpb24gc2V0dXBMZXZlbCgpIHsKICBjb25zdCBsaVRleHQgPSBbJycsJ0xldmVsIDAxIOKAlCBNdWx0aXBsZSBDaG9pY2UnLCdMZXZlbCAwMiDigJQgT3BlbiBBbnN3ZXInLCdMZXZlbCAwMyDigJQgSW50ZWxsaWdlbmNlIEFuYWx5c2lzJ107CiAgY29uc3QgbGlDbGFzcyA9IFsnJywnbGktMScsJ2xpLTInLCdsaS0zJ107CiAgZm9yIChsZXQgaT0wO2k8NDtpKyspIHsKICAgIGNvbnN0IGxpID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2xpJytpKTsKICAgIGxpLnRleHRDb250ZW50ID0gbGlUZXh0W0xFVkVMXTsKICAgIGxpLmNsYXNzTmFtZSA9ICdsZXZlbC1pbmRpY2F0b3IgJyArIGxpQ2xhc3NbTEVWRUxdOwoKICAgIGNvbnN0IGludGVsID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK2krJy1pbnRlbCcpOwogICAgY29uc3QgdW5sb2NrID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK2krJy11bmxvY2snKTsKICAgIGNvbnN0IG9wZW5TZWMgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycraSsnLW9wZW4nKTsKICAgIGNvbnN0IGNob2ljZXMgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycraSsnLWNob2ljZXMnKTsKCiAgICAvLyBSZXNldCBhbGwKICAgIGludGVsLnF1ZXJ5U2VsZWN0b3JBbGwoJy5pbnRlbC1pdGVtJykuZm9yRWFjaChpdGVtID0+IHsKICAgICAgaXRlbS5jbGFzc0xpc3QucmVtb3ZlKCdsb2NrZWQnLCd1bmxvY2tlZCcpOwogICAgfSk7CgogICAgaWYgKExFVkVMID09PSAxKSB7CiAgICAgIGlmICh1bmxvY2spIHVubG9jay5jbGFzc0xpc3QucmVtb3ZlKCdzaG93Jyk7CiAgICAgIGlmIChvcGVuU2VjKSBvcGVuU2VjLmNsYXNzTGlzdC5yZW1vdmUoJ3Nob3cnKTsKICAgICAgaWYgKGNob2ljZXMpIGNob2ljZXMuY2xhc3NMaXN0LmFkZCgnc2hvdycpOwogICAgfSBlbHNlIGlmIChMRVZFTCA9PT0gMikgewogICAgICBpZiAodW5sb2NrKSB1bmxvY2suY2xhc3NMaXN0LnJlbW92ZSgnc2hvdycpOwogICAgICBpZiAob3BlblNlYykgb3BlblNlYy5jbGFzc0xpc3QuYWRkKCdzaG93Jyk7CiAgICAgIGlmIChjaG9pY2VzKSBjaG9pY2VzLmNsYXNzTGlzdC5yZW1vdmUoJ3Nob3cnKTsKICAgIH0gZWxzZSBpZiAoTEVWRUwgPT09IDMpIHsKICAgICAgaWYgKHVubG9jaykgdW5sb2NrLmNsYXNzTGlzdC5hZGQoJ3Nob3cnKTsKICAgICAgaWYgKG9wZW5TZWMpIG9wZW5TZWMuY2xhc3NMaXN0LmFkZCgnc2hvdycpOyAvLyBzaG93biBhZnRlciB1bmxvY2sKICAgICAgaWYgKGNob2ljZXMpIGNob2ljZXMuY2xhc3NMaXN0LnJlbW92ZSgnc2hvdycpOwogICAgICAvLyBMb2NrIGFsbCBpbnRlbCBpdGVtcwogICAgICBpbnRlbC5xdWVyeVNlbGVjdG9yQWxsKCcuaW50ZWwtaXRlbScpLmZvckVhY2goaXRlbSA9PiBpdGVtLmNsYXNzTGlzdC5hZGQoJ2xvY2tlZCcpKTsKICAgICAgLy8gSGlkZSBvcGVuIHNlY3Rpb24gdW50aWwgdW5sb2NrZWQKICAgICAgaWYgKG9wZW5TZWMpIG9wZW5TZWMuY2xhc3NMaXN0LnJlbW92ZSgnc2hvdycpOwogICAgfQogIH0KfQoKLy8g4pSA4pSAIExFVkVMIDM6IGNoZWNrIGFsbCA0IGZpZWxkcyBmaWxsZWQg4pSA4pSACmZ1bmN0aW9uIGNoZWNrVW5sb2NrKHNpKSB7CiAgY29uc3QgZmllbGRzID0gWydzJytzaSsnLXUtZW5nJywncycrc2krJy11LWZvcm11bGEnLCdzJytzaSsnLXUtYmFja2xvZycsJ3MnK3NpKyctdS1yaXNrJ107CiAgY29uc3QgYWxsRmlsbGVkID0gZmllbGRzLmV2ZXJ5KGlkID0+IHsKICAgIGNvbnN0IGVsID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoaWQpOwogICAgcmV0dXJuIGVsICYmIGVsLnZhbHVlLnRyaW0oKS5sZW5ndGggPiAxNTsKICB9KTsKICBjb25zdCBidG4gPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycrc2krJy11bmxvY2stYnRuJyk7CiAgaWYgKGFsbEZpbGxlZCkgYnRuLmNsYXNzTGlzdC5hZGQoJ3JlYWR5Jyk7CiAgZWxzZSBidG4uY2xhc3NMaXN0LnJlbW92ZSgncmVhZHknKTsKfQoKZnVuY3Rpb24gdW5sb2NrSW50ZWwoc2kpIHsKICAvLyBVbmxvY2sgdmlzdWFsCiAgY29uc3QgaW50ZWwgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycrc2krJy1pbnRlbCcpOwogIGludGVsLnF1ZXJ5U2VsZWN0b3JBbGwoJy5pbnRlbC1pdGVtJykuZm9yRWFjaCgoaXRlbSwgaWR4KSA9PiB7CiAgICBzZXRUaW1lb3V0KCgpID0+IGl0ZW0uY2xhc3NMaXN0LnJlcGxhY2UoJ2xvY2tlZCcsJ3VubG9ja2VkJyksIGlkeCAqIDEyMCk7CiAgfSk7CgogIC8vIFNob3cgZXZhbCBvZiB0aGVpciBpbnRlbCBndWVzc2VzCiAgZXZhbHVhdGVJbnRlbEd1ZXNzZXMoc2kpOwoKICAvLyBIaWRlIHVubG9jayBzZWN0aW9uCiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK3NpKyctdW5sb2NrJykuY2xhc3NMaXN0LnJlbW92ZSgnc2hvdycpOwoKICAvLyBTaG93IG9wZW4gYW5zd2VyIGZvciBsZXZlbCAzCiAgc2V0VGltZW91dCgoKSA9PiB7CiAgICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycrc2krJy1vcGVuJykuY2xhc3NMaXN0LmFkZCgnc2hvdycpOwogIH0sIDYwMCk7Cn0KCmNvbnN0IElOVEVMX0tFWVdPUkRTID0gewogIDA6IHsKICAgIGVuZzogWydibG9jaycsJzYgbW9udGgnLCdnbG9iYWwnLCdmcmVlemUnLCd1cGRhdGUnLCdkZWxheSddLAogICAgZm9ybXVsYTogWydubyBjdXN0b20nLCdubyBtb2RpZmljYXRpb24nLCdvbmUgcGxhdGZvcm0nLCdzaW5nbGUgcGxhdGZvcm0nLCdhbGwgbWVyY2hhbnQnXSwKICAgIGJhY2tsb2c6IFsnOSBtb250aCcsJ2dlbmVyaWMnLCdtdWx0aS1wYXJ0eScsJ3BheW91dHMnLCdtb2R1bGUnLCdiYWNrbG9nJ10sCiAgICByaXNrOiBbJ2ZvcmsnLCdkZXBlbmRlbmN5JywnYmxvY2snLCdBUEknLCdmdXR1cmUnLCdsb2NrJywnaG9zdGFnZSddCiAgfSwKICAxOiB7CiAgICBlbmc6IFsnbGljZW5zZScsJ2luZGlhJywnY2lyY3VtdmVudGlvbicsJ1JCSScsJ2lsbGVnYWwnLCdyaXNrJ10sCiAgICBmb3JtdWxhOiBbJ2ZvbGxvdycsJ2xvY2FsJywncmVndWxhdGlvbicsJ2xhdycsJ25vbi1uZWdvdGlhYmxlJ10sCiAgICBiYWNrbG9nOiBbJzQwJScsJ3N1YnNjcmlwdGlvbicsJ3ByZW1pdW0nLCcxNWsnLCdJTlInLCdjb252ZXJzaW9uJywnaW1wYWN0J10sCiAgICByaXNrOiBbJ3dhaXRpbmcgcm9vbScsJ3F1ZXVlJywnbm90aWZ5JywnNDhoJywncmV0cnknLCdhdXRvJ10KICB9LAogIDI6IHsKICAgIGVuZzogWydNaXRNJywnbWFuLWluLXRoZS1taWRkbGUnLCdhdHRhY2snLCd2dWxuZXJhYmlsaXR5JywnVExTIDEuMScsJ3NlY3VyaXR5J10sCiAgICBmb3JtdWxhOiBbJ1BDSScsJ2NvbXBsaWFuY2UnLCdsaWNlbnNlJywnbm9uLW5lZ290aWFibGUnLCdtYW5kYXRvcnknXSwKICAgIGJhY2tsb2c6IFsndGVybWluYWwnLCd3YXJlaG91c2UnLCdjb3VyaWVyJywnZGVsaXZlcnknLCdoYXJkd2FyZScsJ3N0b2NrJ10sCiAgICByaXNrOiBbJzAuNCUnLCd2b2x1bWUnLCdyZXZlbnVlJywncHJlY2VkZW50JywnZXhjZXB0aW9uJywnc21hbGwnXQogIH0sCiAgMzogewogICAgZW5nOiBbJzcyIGhvdXInLCdzY2FuJywnaGFsdCcsJ2RlcGxveScsJ3NpbGVudCcsJ2NvcnJ1cHQnXSwKICAgIGZvcm11bGE6IFsnaW50ZWdyaXR5JywndHJ1c3QnLCduZXZlciBzaGlwJywnZGF0YScsJ2ZvdW5kYXRpb24nXSwKICAgIGJhY2tsb2c6IFsnNDAwaycsJ3JldmVudWUnLCdCTlBMJywnZGVsYXknLCdzYWxlcycsJ2NsaWVudHMnXSwKICAgIHJpc2s6IFsncmVndWxhdG9yeScsJ2xhdW5jaCcsJ2luY29ycmVjdCcsJ2V4cG9zZScsJ2ZpbmFuY2lhbCcsJ2xpYWJpbGl0eSddCiAgfQp9OwoKZnVuY3Rpb24gZXZhbHVhdGVJbnRlbEd1ZXNzZXMoc2kpIHsKICBjb25zdCBmaWVsZHMgPSBbJ2VuZycsJ2Zvcm11bGEnLCdiYWNrbG9nJywncmlzayddOwogIGNvbnN0IGxhYmVscyA9IFsnRW5naW5lZXJpbmcgLyBDb21wbGlhbmNlJywnVGhlIEZvcm11bGEnLCdCYWNrbG9nIC8gRGF0YScsJ1Jpc2snXTsKICBjb25zdCBrZXlzID0gSU5URUxfS0VZV09SRFNbc2ldOwogIGNvbnN0IGV2YWxHcmlkID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK3NpKyctZXZhbC1ncmlkJyk7CiAgY29uc3QgZXZhbFNlY3Rpb24gPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycrc2krJy1pbnRlbC1ldmFsJyk7CgogIGxldCBodG1sID0gJyc7CiAgZmllbGRzLmZvckVhY2goKGYsIGlkeCkgPT4gewogICAgY29uc3QgdmFsID0gKGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzJytzaSsnLXUtJytmKXx8e3ZhbHVlOicnfSkudmFsdWUudG9Mb3dlckNhc2UoKTsKICAgIGNvbnN0IGt3cyA9IGtleXNbZl0gfHwgW107CiAgICBjb25zdCBtYXRjaGVzID0ga3dzLmZpbHRlcihrID0+IHZhbC5pbmNsdWRlcyhrKSk7CiAgICBjb25zdCBxdWFsaXR5ID0gbWF0Y2hlcy5sZW5ndGggPj0gMiA/ICdnb29kJyA6IG1hdGNoZXMubGVuZ3RoID09PSAxID8gJ3BhcnRpYWwnIDogJ21pc3MnOwogICAgY29uc3QgaWNvbiA9IHF1YWxpdHkgPT09ICdnb29kJyA/ICfinJMnIDogcXVhbGl0eSA9PT0gJ3BhcnRpYWwnID8gJ34nIDogJ+Kclyc7CiAgICBjb25zdCBtc2cgPSBxdWFsaXR5ID09PSAnZ29vZCcKICAgICAgPyAnR29vZCDigJQgeW91IGFudGljaXBhdGVkIHRoZSBrZXkgcmlzay4nCiAgICAgIDogcXVhbGl0eSA9PT0gJ3BhcnRpYWwnCiAgICAgID8gJ1BhcnRpYWwg4oCUIHlvdSB3ZXJlIG9uIHRoZSByaWdodCB0cmFjayBidXQgbWlzc2VkIHNwZWNpZmljcy4nCiAgICAgIDogJ01pc3NlZCDigJQgdGhlIGFjdHVhbCBpbnRlbCByZXZlYWxzIHNvbWV0aGluZyB5b3UgZGlkblwndCBjb25zaWRlci4nOwogICAgaHRtbCArPSBgPGRpdiBjbGFzcz0iaW50ZWwtZXZhbC1pdGVtIj48ZGl2IGNsYXNzPSJpZS1sYWJlbCI+JHtsYWJlbHNbaWR4XX08L2Rpdj48ZGl2IGNsYXNzPSJpZS1jaGVjayAke3F1YWxpdHkgPT09ICdnb29kJyA/ICdnb29kJyA6IHF1YWxpdHkgPT09ICdwYXJ0aWFsJyA/ICcnIDogJ21pc3MnfSI+JHtpY29ufSAke21zZ308L2Rpdj48L2Rpdj5gOwogIH0pOwogIGV2YWxHcmlkLmlubmVySFRNTCA9IGh0bWw7CiAgZXZhbFNlY3Rpb24uY2xhc3NMaXN0LmFkZCgnc2hvdycpOwp9CgovLyDilIDilIAgTEVWRUwgMjogb3BlbiBhbnN3ZXIga2V5d29yZHMg4pSA4pSACmNvbnN0IE9QRU5fS0VZV09SRFMgPSB7CiAgMDogeyBnb29kOiBbJ3Byb2R1Y3RpemUnLCdwbGF0Zm9ybScsJ2FsbCBtZXJjaGFudCcsJ3N0YW5kYXJkJywnYXBpJywnNCBtb250aCcsJ2FjY2VsZXJhdGUnLCdiYWNrbG9nJ10sIGJhZDogWydmb3JrJywnY3VzdG9tJywnZXhjZXB0aW9uJywnanVzdCBmb3IgdGhlbSddIH0sCiAgMTogeyBnb29kOiBbJ3dhaXRpbmcgcm9vbScsJ3F1ZXVlJywnNDhoJywnY29tcGx5JywncmVndWxhdGlvbicsJ25vdGlmeScsJ3JldHJ5J10sIGJhZDogWydkdWJhaScsJ2Nyb3NzLWJvcmRlcicsJ2J5cGFzcycsJ2F2b2lkJywnY2lyY3VtdmVudCddIH0sCiAgMjogeyBnb29kOiBbJ3Byb3h5JywndHVubmVsJywndGxzIDEuMicsJ2VtZXJnZW5jeScsJzEwIGRheScsJ2xvZ2lzdGljcycsJ2hhcmR3YXJlJywnZGVsaXZlciddLCBiYWQ6IFsnZXhjZXB0aW9uJywnMyBtb250aCcsJ2tlZXAgdGxzIDEuMScsJ21haW50YWluIHRscyddIH0sCiAgMzogeyBnb29kOiBbJ2ZyZWV6ZScsJ2hhbHQnLCdzY2FuJywnNzIgaG91cicsJ2ludGVncml0eScsJ2NvbW11bmljYXRlJywndGltZWxpbmUnXSwgYmFkOiBbJ3BhcmFsbGVsJywnbGF1bmNoIGFueXdheScsJ3NoaXAgbm93Jywnc2lkZSBieSBzaWRlJ10gfQp9OwoKZnVuY3Rpb24gb25PcGVuSW5wdXQoc2kpIHsKICBjb25zdCBpbnAgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycrc2krJy1vcGVuLWlucHV0Jyk7CiAgY29uc3Qgc3ViID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK3NpKyctb3Blbi1zdWJtaXQnKTsKICBjb25zdCBmaWxsZWQgPSBpbnAudmFsdWUudHJpbSgpLmxlbmd0aCA+IDMwOwogIGlucC5jbGFzc0xpc3QudG9nZ2xlKCdmaWxsZWQnLCBmaWxsZWQpOwogIHN1Yi5jbGFzc0xpc3QudG9nZ2xlKCdzaG93JywgZmlsbGVkKTsKfQoKZnVuY3Rpb24gZXZhbE9wZW4oc2kpIHsKICBjb25zdCB2YWwgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycrc2krJy1vcGVuLWlucHV0JykudmFsdWUudG9Mb3dlckNhc2UoKTsKICBjb25zdCBrdyA9IE9QRU5fS0VZV09SRFNbc2ldOwogIGNvbnN0IGdvb2RIaXRzID0ga3cuZ29vZC5maWx0ZXIoayA9PiB2YWwuaW5jbHVkZXMoaykpLmxlbmd0aDsKICBjb25zdCBiYWRIaXRzID0ga3cuYmFkLmZpbHRlcihrID0+IHZhbC5pbmNsdWRlcyhrKSkubGVuZ3RoOwoKICBsZXQgc2NvcmUsIG1zZzsKICBpZiAoYmFkSGl0cyA+IDAgJiYgZ29vZEhpdHMgPCAyKSB7CiAgICBzY29yZSA9IDA7CiAgICBtc2cgPSAnWW91ciBhbnN3ZXIgY29udGFpbnMgcmVhc29uaW5nIHRoYXQgY29uZmxpY3RzIHdpdGggVGhlIEZvcm11bGEg4oCUIHlvdSBzZWVtIHRvIGJlIGxvb2tpbmcgZm9yIGEgd29ya2Fyb3VuZCByYXRoZXIgdGhhbiBhIHN0cnVjdHVyYWwgc29sdXRpb24uIFNlZSB0aGUgaWRlYWwgYW5zd2VyIGJlbG93Lic7CiAgfSBlbHNlIGlmIChnb29kSGl0cyA+PSAzICYmIGJhZEhpdHMgPT09IDApIHsKICAgIHNjb3JlID0gMTAwOwogICAgbXNnID0gJ1N0cm9uZyBhbnN3ZXIuIFlvdSBpZGVudGlmaWVkIHRoZSBjb3JlIHN0cnVjdHVyYWwgc29sdXRpb24sIGF2b2lkZWQgdGhlIGNvbXBsaWFuY2UgdHJhcCwgYW5kIHNob3dlZCBwcm9kdWN0IHRoaW5raW5nIGFsaWduZWQgd2l0aCBUaGUgRm9ybXVsYS4nOwogIH0gZWxzZSBpZiAoZ29vZEhpdHMgPj0gMSkgewogICAgc2NvcmUgPSA1MDsKICAgIG1zZyA9ICdQYXJ0aWFsbHkgY29ycmVjdC4gWW91IGlkZW50aWZpZWQgc29tZSBvZiB0aGUgcmlnaHQgZWxlbWVudHMsIGJ1dCB0aGUgZnVsbCBzb2x1dGlvbiByZXF1aXJlcyBhIG1vcmUgc3RydWN0dXJlZCBwcm9kdWN0IHJlc3BvbnNlLiBTZWUgdGhlIGlkZWFsIGFuc3dlciBiZWxvdy4nOwogIH0gZWxzZSB7CiAgICBzY29yZSA9IDI1OwogICAgbXNnID0gJ1lvdXIgYW5zd2VyIGlzIGluY29tcGxldGUgb3IgdG9vIHZhZ3VlIHRvIGV2YWx1YXRlIGNsZWFybHkuIFRoZSBpZGVhbCBhbnN3ZXIgYmVsb3cgc2hvd3MgdGhlIGZ1bGwgcmVhc29uaW5nIGV4cGVjdGVkIG9mIGFuIEFkeWVuIFBNLic7CiAgfQoKICBzY29yZXNbc2ldID0gc2NvcmU7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK3NpKyctb3Blbi1ldmFsLXRleHQnKS50ZXh0Q29udGVudCA9IG1zZzsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycrc2krJy1mYi1vcGVuJykuY2xhc3NMaXN0LmFkZCgnc2hvdycpOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzJytzaSsnLW9wZW4tc3VibWl0JykuZGlzYWJsZWQgPSB0cnVlOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzJytzaSsnLW9wZW4taW5wdXQnKS5kaXNhYmxlZCA9IHRydWU7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK3NpKyctbmV4dCcpLmNsYXNzTGlzdC5hZGQoJ3Nob3cnKTsKICB1cGRhdGVCYWRnZSgpOwp9CgovLyDilIDilIAgTEVWRUwgMTogbXVsdGlwbGUgY2hvaWNlIOKUgOKUgApmdW5jdGlvbiBjaG9vc2Uoc2ksIGNpLCBvdXRjb21lLCBsZXR0ZXIpIHsKICBpZiAoc2NvcmVzW3NpXSAhPT0gbnVsbCkgcmV0dXJuOwogIFsnMCcsJzEnLCcyJ10uZm9yRWFjaChqID0+IHsKICAgIGNvbnN0IGIgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycrc2krJy1jJytqKTsKICAgIGlmIChiKSBiLmRpc2FibGVkID0gdHJ1ZTsKICB9KTsKICBjb25zdCBidG4gPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycrc2krJy1jJytjaSk7CiAgYnRuLmNsYXNzTGlzdC5hZGQob3V0Y29tZSA9PT0gJ3JpZ2h0JyA/ICdzZWwtcmlnaHQnIDogb3V0Y29tZSA9PT0gJ3BhcnRpYWwnID8gJ3NlbC1wYXJ0aWFsJyA6ICdzZWwtd3JvbmcnKTsKICBjb25zdCBmYklkID0gb3V0Y29tZSA9PT0gJ3JpZ2h0JyA/ICdzJytzaSsnLWZiLXJpZ2h0JyA6IG91dGNvbWUgPT09ICdwYXJ0aWFsJyA/ICdzJytzaSsnLWZiLXBhcnRpYWwnIDogJ3MnK3NpKyctZmItd3JvbmcnOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKGZiSWQpLmNsYXNzTGlzdC5hZGQoJ3Nob3cnKTsKICBzY29yZXNbc2ldID0gU0NPUkVfTUFQW291dGNvbWVdOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzJytzaSsnLW5leHQnKS5jbGFzc0xpc3QuYWRkKCdzaG93Jyk7CiAgdXBkYXRlQmFkZ2UoKTsKfQoKLy8g4pSA4pSAIEJBREdFIOKUgOKUgApmdW5jdGlvbiB1cGRhdGVCYWRnZSgpIHsKICBjb25zdCBhbnN3ZXJlZCA9IHNjb3Jlcy5maWx0ZXIocyA9PiBzICE9PSBudWxsKTsKICBpZiAoIWFuc3dlcmVkLmxlbmd0aCkgcmV0dXJuOwogIGNvbnN0IGF2ZyA9IE1hdGgucm91bmQoYW5zd2VyZWQucmVkdWNlKChhLGIpPT5hK2IsMCkvYW5zd2VyZWQubGVuZ3RoKTsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc2NvcmUtYmFkZ2UnKS50ZXh0Q29udGVudCA9IGF2ZysnJSc7Cn0KCi8vIOKUgOKUgCBOQVZJR0FUSU9OIOKUgOKUgApmdW5jdGlvbiBuYXZHbyhpZHgpIHsKICBmb3IgKGxldCBpPTA7aTw0O2krKykgewogICAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK2kpLmNsYXNzTGlzdC50b2dnbGUoJ2FjdGl2ZScsIGk9PT1pZHgpOwogICAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ250JytpKS5jbGFzc0xpc3QudG9nZ2xlKCdhY3RpdmUnLCBpPT09aWR4KTsKICB9CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3Jlc3VsdHMnKS5zdHlsZS5kaXNwbGF5ID0gJ25vbmUnOwogIHdpbmRvdy5zY3JvbGxUbygwLDApOwp9CgovLyDilIDilIAgUkVTVUxUUyDilIDilIAKZnVuY3Rpb24gc2hvd1Jlc3VsdHMoKSB7CiAgZm9yIChsZXQgaT0wO2k8NDtpKyspIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzJytpKS5jbGFzc0xpc3QucmVtb3ZlKCdhY3RpdmUnKTsKICBkb2N1bWVudC5xdWVyeVNlbGVjdG9yQWxsKCcubmF2LXRhYicpLmZvckVhY2godD0+dC5jbGFzc0xpc3QucmVtb3ZlKCdhY3RpdmUnKSk7CiAgY29uc3QgcmVzID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3Jlc3VsdHMnKTsKICByZXMuc3R5bGUuZGlzcGxheSA9ICdibG9jayc7CgogIGNvbnN0IGdyaWQgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncmVzdWx0cy1ncmlkJyk7CiAgbGV0IHRvdGFsID0gMDsKICBncmlkLmlubmVySFRNTCA9ICcnOwogIHNjb3Jlcy5mb3JFYWNoKChzLGkpID0+IHsKICAgIGNvbnN0IHNjb3JlID0gcyA/PyAwOyB0b3RhbCArPSBzY29yZTsKICAgIGNvbnN0IGNscyA9IHNjb3JlID49IDgwID8gJ3MxMDAnIDogc2NvcmUgPj0gNTAgPyAnczUwJyA6ICdzMCc7CiAgICBjb25zdCBsYmwgPSBzY29yZSA+PSA4MCA/ICdGb3JtdWxhIGFsaWduZWQnIDogc2NvcmUgPj0gNTAgPyAnQ29tcHJvbWlzZScgOiAnRm9ybXVsYSB2aW9sYXRpb24nOwogICAgZ3JpZC5pbm5lckhUTUwgKz0gYDxkaXYgY2xhc3M9InJlc3VsdC1pdGVtIj48ZGl2IGNsYXNzPSJyLXNjIj5TY2VuYXJpbyAke2krMX0g4oCUICR7U0NfTkFNRVNbaV19PC9kaXY+PGRpdiBjbGFzcz0ici1zY29yZSAke2Nsc30iPiR7c2NvcmV9JTwvZGl2PjxkaXYgY2xhc3M9InItbGFiZWwiPiR7bGJsfTwvZGl2PjwvZGl2PmA7CiAgfSk7CgogIGNvbnN0IGF2ZyA9IE1hdGgucm91bmQodG90YWwvNCk7CiAgY29uc3QgbGV2ZWxOYW1lID0gTEVWRUw9PT0xPydNdWx0aXBsZSBDaG9pY2UnOkxFVkVMPT09Mj8nT3BlbiBBbnN3ZXInOidJbnRlbGxpZ2VuY2UgQW5hbHlzaXMnOwogIGxldCBvdmVyYWxsOwogIGlmIChhdmcgPj0gOTApIG92ZXJhbGwgPSBgT3V0c3RhbmRpbmcgcGVyZm9ybWFuY2UgYXQgJHtsZXZlbE5hbWV9IGxldmVsLiBZb3UgdGhpbmsgbGlrZSBBZHllbiB0aGlua3Mg4oCUIHBsYXRmb3JtIGludGVncml0eSBvdmVyIHNob3J0LXRlcm0gYXBwZWFzZW1lbnQsIGNvbXBsaWFudCBwcm9kdWN0IHNvbHV0aW9ucyBvdmVyIHdvcmthcm91bmRzLiBUaGUgRm9ybXVsYSBpcyBmdWxseSBpbnRlcm5hbGl6ZWQuYDsKICBlbHNlIGlmIChhdmcgPj0gNzApIG92ZXJhbGwgPSBgU3Ryb25nIHByb2R1Y3QgaW5zdGluY3RzIGF0ICR7bGV2ZWxOYW1lfSBsZXZlbC4gWW91IGFwcGxpZWQgVGhlIEZvcm11bGEgaW4gbW9zdCBjYXNlcy4gQSBmZXcgZGVjaXNpb25zIGxlYW5lZCB0b28gY29uc2VydmF0aXZlIG9yIHRvbyBwZXJtaXNzaXZlIOKAlCB0aGUgYmVzdCBBZHllbiBQTXMgYWx3YXlzIGZpbmQgdGhlIHN0cnVjdHVyZWQgdGhpcmQgcGF0aC5gOwogIGVsc2UgaWYgKGF2ZyA+PSA0NSkgb3ZlcmFsbCA9IGBNb2RlcmF0ZSBhbGlnbm1lbnQgYXQgJHtsZXZlbE5hbWV9IGxldmVsLiBZb3UgaWRlbnRpZmllZCBzb21lIGNvcnJlY3QgZGlyZWN0aW9ucywgYnV0IHRoZSBmdWxsIHNvbHV0aW9ucyByZXF1aXJlIG1vcmUgc3RydWN0dXJlZCBwcm9kdWN0IHRoaW5raW5nLiBSZXZpZXcgdGhlIGlkZWFsIGFuc3dlcnMgYW5kIGZvY3VzIG9uICJwcm9kdWN0aXplLCBkb24ndCByZWZ1c2Ugb3Igd29ya2Fyb3VuZC4iYDsKICBlbHNlIG92ZXJhbGwgPSBgVGhlIEZvcm11bGEgbmVlZHMgZnVydGhlciBpbnRlcm5hbGl6YXRpb24gYXQgJHtsZXZlbE5hbWV9IGxldmVsLiBNdWx0aXBsZSBkZWNpc2lvbnMgcHJpb3JpdGlzZWQgc2hvcnQtdGVybSBmaXhlcyBvciByZWZ1c2FscyBvdmVyIHN0cnVjdHVyZWQgcHJvZHVjdCBzb2x1dGlvbnMuIEFkeWVuIFBNcyBidWlsZCBzb2x1dGlvbnMgdGhhdCBtYWtlIGNvbXBsaWFuY2UgaW52aXNpYmxlIOKAlCB0aGF0IHJlcXVpcmVzIHByb2R1Y3Qgd29yaywgbm90IGp1c3QgeWVzL25vIGRlY2lzaW9ucy5gOwoKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnb3ZlcmFsbC10ZXh0JykudGV4dENvbnRlbnQgPSBvdmVyYWxsOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzY29yZS1iYWRnZScpLnRleHRDb250ZW50ID0gYXZnKyclJzsKICB3aW5kb3cuc2Nyb2xsVG8oMCwwKTsKfQoKLy8g4pSA4pSAIFJFU1RBUlQg4pSA4pSACmZ1bmN0aW9uIHJlc3RhcnQoKSB7CiAgc2NvcmVzLmZpbGwobnVsbCk7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3Njb3JlLWJhZGdlJykudGV4dENvbnRlbnQgPSAn4oCUJzsKICBMRVZFTCA9IDA7CgogIGZvciAobGV0IGk9MDtpPDQ7aSsrKSB7CiAgICBbJzAnLCcxJywnMiddLmZvckVhY2goaj0+ewogICAgICBjb25zdCBiID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK2krJy1jJytqKTsKICAgICAgaWYoYil7Yi5kaXNhYmxlZD1mYWxzZTtiLmNsYXNzTGlzdC5yZW1vdmUoJ3NlbC1yaWdodCcsJ3NlbC1wYXJ0aWFsJywnc2VsLXdyb25nJyk7fQogICAgfSk7CiAgICBkb2N1bWVudC5xdWVyeVNlbGVjdG9yQWxsKCcjcycraSsnIC5mZWVkYmFjaycpLmZvckVhY2goZj0+Zi5jbGFzc0xpc3QucmVtb3ZlKCdzaG93JykpOwogICAgY29uc3QgbmIgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycraSsnLW5leHQnKTsKICAgIGlmKG5iKSBuYi5jbGFzc0xpc3QucmVtb3ZlKCdzaG93Jyk7CiAgICBjb25zdCBvaSA9IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzJytpKyctb3Blbi1pbnB1dCcpOwogICAgaWYob2kpe29pLnZhbHVlPScnO29pLmRpc2FibGVkPWZhbHNlO29pLmNsYXNzTGlzdC5yZW1vdmUoJ2ZpbGxlZCcpO30KICAgIGNvbnN0IG9zID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK2krJy1vcGVuLXN1Ym1pdCcpOwogICAgaWYob3Mpe29zLmRpc2FibGVkPWZhbHNlO29zLmNsYXNzTGlzdC5yZW1vdmUoJ3Nob3cnKTt9CiAgICBbJ2VuZycsJ2Zvcm11bGEnLCdiYWNrbG9nJywncmlzayddLmZvckVhY2goZj0+ewogICAgICBjb25zdCB0YT1kb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycraSsnLXUtJytmKTsKICAgICAgaWYodGEpIHRhLnZhbHVlPScnOwogICAgfSk7CiAgICBjb25zdCB1Yj1kb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycraSsnLXVubG9jay1idG4nKTsKICAgIGlmKHViKSB1Yi5jbGFzc0xpc3QucmVtb3ZlKCdyZWFkeScpOwogICAgY29uc3QgaWU9ZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3MnK2krJy1pbnRlbC1ldmFsJyk7CiAgICBpZihpZSkgaWUuY2xhc3NMaXN0LnJlbW92ZSgnc2hvdycpOwogICAgY29uc3QgaWVnPWRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdzJytpKyctZXZhbC1ncmlkJyk7CiAgICBpZihpZWcpIGllZy5pbm5lckhUTUw9Jyc7CiAgICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncycraSkuY2xhc3NMaXN0LnJlbW92ZSgnYWN0aXZlJyk7CiAgfQoKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgncmVzdWx0cycpLnN0eWxlLmRpc3BsYXk9J25vbmUnOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdtYWluLXNpbScpLmNsYXNzTGlzdC5yZW1vdmUoJ3Nob3cnKTsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnZGlmZmljdWx0eS1zY3JlZW4nKS5zdHlsZS5kaXNwbGF5PSdmbGV4JzsKICBkb2N1bWVudC5xdWVyeVNlbGVjdG9yQWxsKCcuZGlmZi1jYXJkJykuZm9yRWFjaChjPT5jLmNsYXNzTGlzdC5yZW1vdmUoJ3BpY2tlZCcpKTsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnc3RhcnQtYnRuJykuY2xhc3NMaXN0LnJlbW92ZSgnc2hvdycpOwp9Cjwvc2NyaXB0Pgo8L2JvZHk+CjwvaHRtbD4K"
-
-_adyen_chart4_html_b64 = "PCFET0NUWVBFIGh0bWw+CjxodG1sIGxhbmc9ImVuIj4KPGhlYWQ+CjxtZXRhIGNoYXJzZXQ9IlVURi04Ij4KPG1ldGEgbmFtZT0idmlld3BvcnQiIGNvbnRlbnQ9IndpZHRoPWRldmljZS13aWR0aCwgaW5pdGlhbC1zY2FsZT0xLjAiPgo8dGl0bGU+QWR5ZW4gT25ib2FyZGluZyDigJQgQ3VycmVudCBTdGF0ZTwvdGl0bGU+CjxzdHlsZT4KICBAaW1wb3J0IHVybCgnaHR0cHM6Ly9mb250cy5nb29nbGVhcGlzLmNvbS9jc3MyP2ZhbWlseT1QbHVzK0pha2FydGErU2FuczppdGFsLHdnaHRAMCwzMDA7MCw0MDA7MCw1MDA7MCw2MDA7MCw3MDA7MSw0MDAmZGlzcGxheT1zd2FwJyk7CgogIDpyb290IHsKICAgIC0tYmc6ICNmMGYyZjU7CiAgICAtLWJnLXN1YnRsZTogI2Y3ZjdmODsKICAgIC0tbWlkbmlnaHQ6ICMwMDExMmM7CiAgICAtLXNlY29uZGFyeTogIzVjNjg3YzsKICAgIC0tYm9yZGVyOiByZ2JhKDAsMTcsNDQsMC4xMCk7CiAgICAtLWJvcmRlci1zdHJvbmc6IHJnYmEoMCwxNyw0NCwwLjE2KTsKICAgIC0tbWlkbmlnaHQtZmFpbnQ6IHJnYmEoMCwxNyw0NCwwLjA1KTsKICAgIC0tbWlkbmlnaHQtZmFpbnRlc3Q6IHJnYmEoMCwxNyw0NCwwLjAyNSk7CiAgICAtLWdyZWVuOiAjMGFiZjUzOwogICAgLS1ncmVlbi1kaW06IHJnYmEoMTAsMTkxLDgzLDAuMDkpOwogICAgLS1ncmVlbi1yaW5nOiByZ2JhKDEwLDE5MSw4MywwLjIwKTsKICB9CgogICogeyBib3gtc2l6aW5nOiBib3JkZXItYm94OyBtYXJnaW46IDA7IHBhZGRpbmc6IDA7IH0KCiAgYm9keSB7CiAgICBiYWNrZ3JvdW5kOiAjZWVmMGY0OwogICAgY29sb3I6IHZhcigtLW1pZG5pZ2h0KTsKICAgIGZvbnQtZmFtaWx5OiAnUGx1cyBKYWthcnRhIFNhbnMnLCBIZWx2ZXRpY2EsIEFyaWFsLCBzYW5zLXNlcmlmOwogICAgaGVpZ2h0OiAxMDB2aDsKICAgIG92ZXJmbG93OiBoaWRkZW47CiAgICB1c2VyLXNlbGVjdDogbm9uZTsKICB9CgoKCgoKICAvKiBTVkcgZG90LW1hdHJpeCBvdmVybGF5ICovCiAgI2JnLXBhdHRlcm4gewogICAgcG9zaXRpb246IGZpeGVkOyBpbnNldDogMDsgei1pbmRleDogMDsKICAgIHBvaW50ZXItZXZlbnRzOiBub25lOwogICAgd2lkdGg6IDEwMHZ3OwogICAgaGVpZ2h0OiAxMDB2aDsKICB9CgoKCgogIGhlYWRlciB7CiAgICBwb3NpdGlvbjogZml4ZWQ7IHRvcDogMDsgbGVmdDogMDsgcmlnaHQ6IDA7CiAgICBwYWRkaW5nOiAyNnB4IDQ0cHggMjBweDsKICAgIHotaW5kZXg6IDMwMDsKICAgIGRpc3BsYXk6IGZsZXg7CiAgICBhbGlnbi1pdGVtczogZmxleC1lbmQ7CiAgICBqdXN0aWZ5LWNvbnRlbnQ6IHNwYWNlLWJldHdlZW47CiAgICBiYWNrZ3JvdW5kOiByZ2JhKDI1NSwyNTUsMjU1LDAuOTQpOwogICAgYmFja2Ryb3AtZmlsdGVyOiBibHVyKDEwcHgpOwogICAgYm9yZGVyLWJvdHRvbTogMXB4IHNvbGlkIHZhcigtLWJvcmRlcik7CiAgfQoKICAuZXllYnJvdyB7CiAgICBmb250LXNpemU6IDkuNXB4OwogICAgZm9udC13ZWlnaHQ6IDYwMDsKICAgIGxldHRlci1zcGFjaW5nOiAwLjE1ZW07CiAgICB0ZXh0LXRyYW5zZm9ybTogdXBwZXJjYXNlOwogICAgY29sb3I6IHZhcigtLWdyZWVuKTsKICAgIG1hcmdpbi1ib3R0b206IDVweDsKICB9CgogIGhlYWRlciBoMSB7CiAgICBmb250LXNpemU6IDE5cHg7CiAgICBmb250LXdlaWdodDogNzAwOwogICAgbGV0dGVyLXNwYWNpbmc6IC0wLjAyNWVtOwogICAgY29sb3I6IHZhcigtLW1pZG5pZ2h0KTsKICAgIGxpbmUtaGVpZ2h0OiAxLjE1OwogIH0KCiAgaGVhZGVyIGgxIGVtIHsKICAgIGZvbnQtc3R5bGU6IG5vcm1hbDsKICAgIGZvbnQtd2VpZ2h0OiAzMDA7CiAgICBjb2xvcjogdmFyKC0tc2Vjb25kYXJ5KTsKICB9CgogIC5zb3VyY2UtdGFnIHsKICAgIGZvbnQtc2l6ZTogMTBweDsKICAgIGZvbnQtd2VpZ2h0OiA0MDA7CiAgICBjb2xvcjogdmFyKC0tc2Vjb25kYXJ5KTsKICAgIGJvcmRlcjogMXB4IHNvbGlkIHZhcigtLWJvcmRlcik7CiAgICBwYWRkaW5nOiA3cHggMTNweDsKICAgIGJvcmRlci1yYWRpdXM6IDNweDsKICAgIGJhY2tncm91bmQ6IHZhcigtLWJnLXN1YnRsZSk7CiAgICBsaW5lLWhlaWdodDogMS43NTsKICAgIHRleHQtYWxpZ246IHJpZ2h0OwogIH0KCiAgZm9vdGVyIHsKICAgIHBvc2l0aW9uOiBmaXhlZDsgYm90dG9tOiAwOyBsZWZ0OiAwOyByaWdodDogMDsKICAgIHBhZGRpbmc6IDE2cHggNDRweDsKICAgIHotaW5kZXg6IDMwMDsKICAgIGRpc3BsYXk6IGZsZXg7CiAgICBhbGlnbi1pdGVtczogY2VudGVyOwogICAganVzdGlmeS1jb250ZW50OiBzcGFjZS1iZXR3ZWVuOwogICAgYm9yZGVyLXRvcDogMXB4IHNvbGlkIHZhcigtLWJvcmRlcik7CiAgICBiYWNrZ3JvdW5kOiByZ2JhKDI1NSwyNTUsMjU1LDAuOTYpOwogICAgYmFja2Ryb3AtZmlsdGVyOiBibHVyKDEwcHgpOwogIH0KCiAgLmhpbnQgewogICAgZm9udC1zaXplOiAxMC41cHg7CiAgICBmb250LXdlaWdodDogNDAwOwogICAgY29sb3I6IHZhcigtLXNlY29uZGFyeSk7CiAgICBkaXNwbGF5OiBmbGV4OwogICAgZ2FwOiAyMnB4OwogICAgYWxpZ24taXRlbXM6IGNlbnRlcjsKICB9CgogIC5oaW50IHNwYW4gewogICAgZGlzcGxheTogZmxleDsKICAgIGFsaWduLWl0ZW1zOiBjZW50ZXI7CiAgICBnYXA6IDdweDsKICB9CgogIC5oaW50IHNwYW46OmJlZm9yZSB7CiAgICBjb250ZW50OiAnJzsKICAgIGRpc3BsYXk6IGlubGluZS1ibG9jazsKICAgIHdpZHRoOiA1cHg7IGhlaWdodDogNXB4OwogICAgYm9yZGVyLXJhZGl1czogNTAlOwogICAgYmFja2dyb3VuZDogdmFyKC0tZ3JlZW4pOwogICAgZmxleC1zaHJpbms6IDA7CiAgfQoKICAuY29udHJvbHMgewogICAgZGlzcGxheTogZmxleDsKICAgIGFsaWduLWl0ZW1zOiBjZW50ZXI7CiAgICBnYXA6IDE0cHg7CiAgfQoKICAuY291bnRlciB7CiAgICBmb250LXNpemU6IDEwLjVweDsKICAgIGZvbnQtd2VpZ2h0OiA2MDA7CiAgICBjb2xvcjogdmFyKC0tc2Vjb25kYXJ5KTsKICAgIGxldHRlci1zcGFjaW5nOiAwLjA0ZW07CiAgICB0cmFuc2l0aW9uOiBjb2xvciAwLjI1czsKICB9CgogIC5jb3VudGVyLmFjdGl2ZSB7IGNvbG9yOiB2YXIoLS1ncmVlbik7IH0KCiAgLnJlc2V0LWJ0biB7CiAgICBmb250LWZhbWlseTogaW5oZXJpdDsKICAgIGZvbnQtc2l6ZTogMTBweDsKICAgIGZvbnQtd2VpZ2h0OiA3MDA7CiAgICBsZXR0ZXItc3BhY2luZzogMC4xZW07CiAgICB0ZXh0LXRyYW5zZm9ybTogdXBwZXJjYXNlOwogICAgY29sb3I6IHZhcigtLXNlY29uZGFyeSk7CiAgICBiYWNrZ3JvdW5kOiBub25lOwogICAgYm9yZGVyOiAxLjVweCBzb2xpZCB2YXIoLS1ib3JkZXItc3Ryb25nKTsKICAgIHBhZGRpbmc6IDdweCAxNXB4OwogICAgYm9yZGVyLXJhZGl1czogM3B4OwogICAgY3Vyc29yOiBwb2ludGVyOwogICAgdHJhbnNpdGlvbjogYWxsIDAuMThzOwogIH0KCiAgLnJlc2V0LWJ0bjpob3ZlciB7CiAgICBjb2xvcjogdmFyKC0tbWlkbmlnaHQpOwogICAgYm9yZGVyLWNvbG9yOiB2YXIoLS1taWRuaWdodCk7CiAgICBiYWNrZ3JvdW5kOiB2YXIoLS1taWRuaWdodC1mYWludCk7CiAgfQoKICAjY2FudmFzIHsKICAgIHBvc2l0aW9uOiBhYnNvbHV0ZTsKICAgIHRvcDogMDsgbGVmdDogMDsgYm90dG9tOiAwOwogICAgcmlnaHQ6IDIyMHB4OwogICAgei1pbmRleDogMTsKICB9CgogIHN2ZyNsaW5lcyB7CiAgICBwb3NpdGlvbjogYWJzb2x1dGU7IGluc2V0OiAwOwogICAgcG9pbnRlci1ldmVudHM6IG5vbmU7CiAgICB6LWluZGV4OiAyOwogIH0KCiAgLmJ1YmJsZSB7CiAgICBwb3NpdGlvbjogYWJzb2x1dGU7CiAgICB0cmFuc2Zvcm06IHRyYW5zbGF0ZSgtNTAlLCAtNTAlKTsKICAgIHotaW5kZXg6IDEwOwogICAgY3Vyc29yOiBwb2ludGVyOwogICAgYW5pbWF0aW9uOiBwb3AtaW4gMC40MnMgY3ViaWMtYmV6aWVyKDAuMzQsIDEuNDUsIDAuNjQsIDEpIGJvdGg7CiAgfQoKICBAa2V5ZnJhbWVzIHBvcC1pbiB7CiAgICBmcm9tIHsgb3BhY2l0eTogMDsgdHJhbnNmb3JtOiB0cmFuc2xhdGUoLTUwJSwgLTUwJSkgc2NhbGUoMC41KTsgfQogICAgdG8gICB7IG9wYWNpdHk6IDE7IHRyYW5zZm9ybTogdHJhbnNsYXRlKC01MCUsIC01MCUpIHNjYWxlKDEpOyB9CiAgfQoKICAuYnViYmxlLWRpc2sgewogICAgYm9yZGVyLXJhZGl1czogNTAlOwogICAgYmFja2dyb3VuZDogI2ZmZmZmZjsKICAgIGJvcmRlcjogMS41cHggc29saWQgdmFyKC0tYm9yZGVyLXN0cm9uZyk7CiAgICBkaXNwbGF5OiBmbGV4OwogICAgZmxleC1kaXJlY3Rpb246IGNvbHVtbjsKICAgIGFsaWduLWl0ZW1zOiBjZW50ZXI7CiAgICBqdXN0aWZ5LWNvbnRlbnQ6IGNlbnRlcjsKICAgIGdhcDogMDsKICAgIHRyYW5zaXRpb246IGFsbCAwLjIwcyBjdWJpYy1iZXppZXIoMC4zNCwgMS40NSwgMC42NCwgMSk7CiAgICBib3gtc2hhZG93OiAwIDFweCA2cHggcmdiYSgwLDE3LDQ0LDAuMDcpLCAwIDNweCAxNHB4IHJnYmEoMCwxNyw0NCwwLjA0KTsKICAgIHBvc2l0aW9uOiByZWxhdGl2ZTsKICB9CgogIC5idWJibGU6aG92ZXIgLmJ1YmJsZS1kaXNrIHsKICAgIGJvcmRlci1jb2xvcjogdmFyKC0tZ3JlZW4pOwogICAgdHJhbnNmb3JtOiBzY2FsZSgxLjA1NSk7CiAgICBib3gtc2hhZG93OiAwIDAgMCA1cHggdmFyKC0tZ3JlZW4tZGltKSwgMCA0cHggMThweCByZ2JhKDAsMTcsNDQsMC4xMCk7CiAgfQoKICAuYnViYmxlLnNlbGVjdGVkIC5idWJibGUtZGlzayB7CiAgICBiYWNrZ3JvdW5kOiB2YXIoLS1ncmVlbi1kaW0pOwogICAgYm9yZGVyLWNvbG9yOiB2YXIoLS1ncmVlbik7CiAgICBib3JkZXItd2lkdGg6IDJweDsKICAgIHRyYW5zZm9ybTogc2NhbGUoMS4wNyk7CiAgICBib3gtc2hhZG93OiAwIDAgMCA3cHggdmFyKC0tZ3JlZW4tcmluZyksIDAgNHB4IDIycHggcmdiYSgwLDE3LDQ0LDAuMTIpOwogIH0KCiAgLmJ1YmJsZS5jb25uZWN0ZWQgLmJ1YmJsZS1kaXNrIHsKICAgIGJvcmRlci1jb2xvcjogdmFyKC0tZ3JlZW4pOwogICAgYm94LXNoYWRvdzogMCAwIDAgM3B4IHZhcigtLWdyZWVuLWRpbSksIDAgMnB4IDEwcHggcmdiYSgwLDE3LDQ0LDAuMDcpOwogIH0KCiAgLmJ1YmJsZS1uYW1lIHsKICAgIGZvbnQtc2l6ZTogMTBweDsKICAgIGZvbnQtd2VpZ2h0OiA3MDA7CiAgICBsZXR0ZXItc3BhY2luZzogMC4wNTVlbTsKICAgIHRleHQtdHJhbnNmb3JtOiB1cHBlcmNhc2U7CiAgICBjb2xvcjogdmFyKC0tbWlkbmlnaHQpOwogICAgdGV4dC1hbGlnbjogY2VudGVyOwogICAgbGluZS1oZWlnaHQ6IDEuMjU7CiAgICBwb2ludGVyLWV2ZW50czogbm9uZTsKICAgIG1heC13aWR0aDogNzhweDsKICAgIHBhZGRpbmc6IDAgNnB4OwogIH0KCiAgLmJ1YmJsZS1zdWIgewogICAgZm9udC1zaXplOiA4LjVweDsKICAgIGZvbnQtd2VpZ2h0OiA0MDA7CiAgICBjb2xvcjogdmFyKC0tc2Vjb25kYXJ5KTsKICAgIHRleHQtYWxpZ246IGNlbnRlcjsKICAgIG1hcmdpbi10b3A6IDRweDsKICAgIHBvaW50ZXItZXZlbnRzOiBub25lOwogICAgbWF4LXdpZHRoOiA3OHB4OwogICAgcGFkZGluZzogMCA0cHg7CiAgICBsaW5lLWhlaWdodDogMS4zOwogIH0KCiAgLyogR3JlZW4gZG90IGluZGljYXRvciAqLwogIC5idWJibGUtZG90IHsKICAgIHdpZHRoOiA1cHg7IGhlaWdodDogNXB4OwogICAgYm9yZGVyLXJhZGl1czogNTAlOwogICAgYmFja2dyb3VuZDogdmFyKC0tYm9yZGVyLXN0cm9uZyk7CiAgICBtYXJnaW4tdG9wOiA2cHg7CiAgICB0cmFuc2l0aW9uOiBiYWNrZ3JvdW5kIDAuMnM7CiAgICBwb2ludGVyLWV2ZW50czogbm9uZTsKICAgIG9wYWNpdHk6IDAuNTsKICB9CgogIC5idWJibGU6aG92ZXIgLmJ1YmJsZS1kb3QsCiAgLmJ1YmJsZS5zZWxlY3RlZCAuYnViYmxlLWRvdCwKICAuYnViYmxlLmNvbm5lY3RlZCAuYnViYmxlLWRvdCB7CiAgICBiYWNrZ3JvdW5kOiB2YXIoLS1ncmVlbik7CiAgICBvcGFjaXR5OiAxOwogIH0KCiAgLyogU3VidGxlIGlkbGUgYnJlYXRoZSAqLwogIC5idWJibGU6bm90KC5jb25uZWN0ZWQpOm5vdCguc2VsZWN0ZWQpIC5idWJibGUtZGlzayB7CiAgICBhbmltYXRpb246IGJyZWF0aGUgMy41cyBlYXNlLWluLW91dCBpbmZpbml0ZTsKICB9CgogIEBrZXlmcmFtZXMgYnJlYXRoZSB7CiAgICAwJSwxMDAlIHsgYm94LXNoYWRvdzogMCAxcHggNnB4IHJnYmEoMCwxNyw0NCwwLjA3KSwgMCAzcHggMTRweCByZ2JhKDAsMTcsNDQsMC4wNCk7IH0KICAgIDUwJSAgICAgIHsgYm94LXNoYWRvdzogMCAycHggMTBweCByZ2JhKDAsMTcsNDQsMC4xMCksIDAgM3B4IDE4cHggcmdiYSgwLDE3LDQ0LDAuMDYpOyB9CiAgfQoKICAuYnViYmxlOmhvdmVyIC5idWJibGUtZGlzaywKICAuYnViYmxlLnNlbGVjdGVkIC5idWJibGUtZGlzaywKICAuYnViYmxlLmNvbm5lY3RlZCAuYnViYmxlLWRpc2sgeyBhbmltYXRpb246IG5vbmU7IH0KCiAgLyogQXJyb3cgKi8KICAuYXJyb3ctbGluZSB7CiAgICBmaWxsOiBub25lOwogICAgc3Ryb2tlOiB2YXIoLS1ncmVlbik7CiAgICBzdHJva2Utd2lkdGg6IDEuNTsKICAgIHN0cm9rZS1kYXNoYXJyYXk6IDUgMy41OwogICAgc3Ryb2tlLWxpbmVjYXA6IHJvdW5kOwogICAgYW5pbWF0aW9uOiBmbG93IDAuNTVzIGxpbmVhciBpbmZpbml0ZTsKICB9CgogIEBrZXlmcmFtZXMgZmxvdyB7CiAgICB0byB7IHN0cm9rZS1kYXNob2Zmc2V0OiAtOC41OyB9CiAgfQoKICAuYXJyb3ctdGlwIHsgZmlsbDogdmFyKC0tZ3JlZW4pOyB9CgogIC8qIFRvb2x0aXAgKi8KICAudHQgewogICAgcG9zaXRpb246IGZpeGVkOwogICAgYmFja2dyb3VuZDogdmFyKC0tbWlkbmlnaHQpOwogICAgYm9yZGVyLXJhZGl1czogNHB4OwogICAgcGFkZGluZzogMTFweCAxNXB4OwogICAgZm9udC1zaXplOiAxMXB4OwogICAgbGluZS1oZWlnaHQ6IDEuNjsKICAgIGNvbG9yOiByZ2JhKDI1NSwyNTUsMjU1LDAuNzIpOwogICAgbWF4LXdpZHRoOiAyMThweDsKICAgIHBvaW50ZXItZXZlbnRzOiBub25lOwogICAgei1pbmRleDogOTk5OwogICAgb3BhY2l0eTogMDsKICAgIHRyYW5zZm9ybTogdHJhbnNsYXRlWSg1cHgpOwogICAgdHJhbnNpdGlvbjogb3BhY2l0eSAwLjEzcywgdHJhbnNmb3JtIDAuMTNzOwogICAgYm94LXNoYWRvdzogMCA2cHggMjhweCByZ2JhKDAsMTcsNDQsMC4yMik7CiAgfQoKICAudHQuc2hvdyB7IG9wYWNpdHk6IDE7IHRyYW5zZm9ybTogdHJhbnNsYXRlWSgwKTsgfQoKICAudHQgYiB7CiAgICBkaXNwbGF5OiBibG9jazsKICAgIGNvbG9yOiAjZmZmOwogICAgZm9udC1zaXplOiAxMHB4OwogICAgZm9udC13ZWlnaHQ6IDcwMDsKICAgIGxldHRlci1zcGFjaW5nOiAwLjA4ZW07CiAgICB0ZXh0LXRyYW5zZm9ybTogdXBwZXJjYXNlOwogICAgbWFyZ2luLWJvdHRvbTogNXB4OwogIH0KCiAgLyogV2F0ZXJtYXJrIC0gaGlkZGVuLCByZXBsYWNlZCBieSBiYWNrZ3JvdW5kICovCiAgLndtIHsKICAgIGRpc3BsYXk6IG5vbmU7CiAgfQoKICAvKiBQQUlOIFBPSU5UUyBQQU5FTCAqLwogIC5wYWluLXBhbmVsIHsKICAgIHBvc2l0aW9uOiBmaXhlZDsKICAgIHJpZ2h0OiAxNHB4OwogICAgdG9wOiA1MCU7CiAgICB0cmFuc2Zvcm06IHRyYW5zbGF0ZVkoLTUwJSk7CiAgICBtYXJnaW4tdG9wOiAyNnB4OwogICAgd2lkdGg6IDMxMHB4OwogICAgei1pbmRleDogMjAwOwogICAgYW5pbWF0aW9uOiBzbGlkZS1pbi1yaWdodCAwLjVzIGN1YmljLWJlemllcigwLjIyLDEsMC4zNiwxKSAwLjM1cyBib3RoOwogIH0KICBAa2V5ZnJhbWVzIHNsaWRlLWluLXJpZ2h0IHsKICAgIGZyb20geyBvcGFjaXR5OjA7IHRyYW5zZm9ybTp0cmFuc2xhdGVZKC01MCUpIHRyYW5zbGF0ZVgoMThweCk7IH0KICAgIHRvICAgeyBvcGFjaXR5OjE7IHRyYW5zZm9ybTp0cmFuc2xhdGVZKC01MCUpIHRyYW5zbGF0ZVgoMCk7IH0KICB9CiAgLnBhaW4taGVhZGVyIHsKICAgIGZvbnQtc2l6ZTogOXB4OyBmb250LXdlaWdodDogNzAwOyBsZXR0ZXItc3BhY2luZzogMC4xNWVtOwogICAgdGV4dC10cmFuc2Zvcm06IHVwcGVyY2FzZTsgY29sb3I6ICNlMjJkMmQ7CiAgICBtYXJnaW4tYm90dG9tOiAxMHB4OwogICAgZGlzcGxheTogZmxleDsgYWxpZ24taXRlbXM6IGNlbnRlcjsgZ2FwOiA3cHg7CiAgfQogIC5wYWluLWhlYWRlcjo6YmVmb3JlIHsKICAgIGNvbnRlbnQ6ICcnOyBkaXNwbGF5OiBibG9jazsKICAgIHdpZHRoOiAzcHg7IGhlaWdodDogMTNweDsgYm9yZGVyLXJhZGl1czogMnB4OwogICAgYmFja2dyb3VuZDogI2UyMmQyZDsgZmxleC1zaHJpbms6IDA7CiAgfQogIC5wYWluLWl0ZW0gewogICAgYmFja2dyb3VuZDogcmdiYSgyNTUsMjU1LDI1NSwwLjkzKTsKICAgIGJhY2tkcm9wLWZpbHRlcjogYmx1cigxMnB4KTsKICAgIC13ZWJraXQtYmFja2Ryb3AtZmlsdGVyOiBibHVyKDEycHgpOwogICAgYm9yZGVyOiAxcHggc29saWQgcmdiYSgyMjYsNDUsNDUsMC4xNSk7CiAgICBib3JkZXItbGVmdDogM3B4IHNvbGlkICNlMjJkMmQ7CiAgICBib3JkZXItcmFkaXVzOiA1cHg7CiAgICBwYWRkaW5nOiAxMnB4IDE0cHggMTJweCAxM3B4OwogICAgbWFyZ2luLWJvdHRvbTogOXB4OwogICAgZGlzcGxheTogZmxleDsgYWxpZ24taXRlbXM6IGZsZXgtc3RhcnQ7IGdhcDogOXB4OwogICAgYW5pbWF0aW9uOiBmYWRlLXVwIDAuNHMgZWFzZSBib3RoOwogICAgdHJhbnNpdGlvbjogYm94LXNoYWRvdyAuMThzLCB0cmFuc2Zvcm0gLjE4czsKICAgIGN1cnNvcjogZGVmYXVsdDsKICAgIGJveC1zaGFkb3c6IDAgMXB4IDZweCByZ2JhKDIyNiw0NSw0NSwwLjA2KSwgMCAycHggMTBweCByZ2JhKDAsMCwwLDAuMDUpOwogIH0KICAucGFpbi1pdGVtOmhvdmVyIHsKICAgIGJveC1zaGFkb3c6IDAgM3B4IDE2cHggcmdiYSgyMjYsNDUsNDUsMC4xNCk7CiAgICB0cmFuc2Zvcm06IHRyYW5zbGF0ZVgoLTJweCk7CiAgfQogIC5wYWluLWl0ZW06bnRoLWNoaWxkKDIpe2FuaW1hdGlvbi1kZWxheTouNDJzfQogIC5wYWluLWl0ZW06bnRoLWNoaWxkKDMpe2FuaW1hdGlvbi1kZWxheTouNTRzfQogIC5wYWluLWl0ZW06bnRoLWNoaWxkKDQpe2FuaW1hdGlvbi1kZWxheTouNjZzfQogIC5wYWluLWl0ZW06bnRoLWNoaWxkKDUpe2FuaW1hdGlvbi1kZWxheTouNzhzfQogIC5wYWluLWl0ZW06bnRoLWNoaWxkKDYpe2FuaW1hdGlvbi1kZWxheTouOTBzfQogIEBrZXlmcmFtZXMgZmFkZS11cCB7CiAgICBmcm9tIHsgb3BhY2l0eTowOyB0cmFuc2Zvcm06dHJhbnNsYXRlWSg3cHgpOyB9CiAgICB0byAgIHsgb3BhY2l0eToxOyB0cmFuc2Zvcm06dHJhbnNsYXRlWSgwKTsgfQogIH0KICAucGFpbi1idWxsZXQgewogICAgd2lkdGg6IDE2cHg7IGhlaWdodDogMTZweDsgYm9yZGVyLXJhZGl1czogM3B4OwogICAgYmFja2dyb3VuZDogcmdiYSgyMjYsNDUsNDUsMC4xMik7CiAgICBkaXNwbGF5OiBmbGV4OyBhbGlnbi1pdGVtczogY2VudGVyOyBqdXN0aWZ5LWNvbnRlbnQ6IGNlbnRlcjsKICAgIGZsZXgtc2hyaW5rOiAwOyBtYXJnaW4tdG9wOiAxcHg7CiAgICBmb250LXNpemU6IDlweDsgZm9udC13ZWlnaHQ6IDgwMDsgY29sb3I6ICNlMjJkMmQ7CiAgICBsaW5lLWhlaWdodDogMTsKICB9CiAgLnBhaW4tdGV4dCB7CiAgICBmb250LXNpemU6IDEycHg7IGZvbnQtd2VpZ2h0OiA1MDA7IGNvbG9yOiB2YXIoLS1taWRuaWdodCk7CiAgICBsaW5lLWhlaWdodDogMS41NTsgbGV0dGVyLXNwYWNpbmc6IC0wLjAwNWVtOwogIH0KICAucGFpbi1oaWdobGlnaHQgeyBjb2xvcjogI2UyMmQyZDsgZm9udC13ZWlnaHQ6IDcwMDsgZm9udC1zdHlsZTogbm9ybWFsOyB9CgoKICAvKiDilIDilIAgTU9EQUwgT1ZFUkxBWSDilIDilIAgKi8KICAubW9kYWwtb3ZlcmxheSB7CiAgICBkaXNwbGF5OiBub25lOwogICAgcG9zaXRpb246IGZpeGVkOyBpbnNldDogMDsKICAgIGJhY2tncm91bmQ6IHJnYmEoMCwxNyw0NCwwLjcyKTsKICAgIGJhY2tkcm9wLWZpbHRlcjogYmx1cig2cHgpOwogICAgei1pbmRleDogMTAwMDsKICAgIGFsaWduLWl0ZW1zOiBjZW50ZXI7CiAgICBqdXN0aWZ5LWNvbnRlbnQ6IGNlbnRlcjsKICAgIGFuaW1hdGlvbjogbW9kYWwtYmctaW4gMC4yNXMgZWFzZSBib3RoOwogIH0KICAubW9kYWwtb3ZlcmxheS5vcGVuIHsKICAgIGRpc3BsYXk6IGZsZXg7CiAgfQogIEBrZXlmcmFtZXMgbW9kYWwtYmctaW4gewogICAgZnJvbSB7IG9wYWNpdHk6IDA7IH0KICAgIHRvICAgeyBvcGFjaXR5OiAxOyB9CiAgfQogIC5tb2RhbC13aW5kb3cgewogICAgd2lkdGg6IDkydnc7CiAgICBoZWlnaHQ6IDg4dmg7CiAgICBiYWNrZ3JvdW5kOiAjZmZmOwogICAgYm9yZGVyLXJhZGl1czogMTBweDsKICAgIG92ZXJmbG93OiBoaWRkZW47CiAgICBib3gtc2hhZG93OiAwIDMycHggODBweCByZ2JhKDAsMTcsNDQsMC40NSk7CiAgICBkaXNwbGF5OiBmbGV4OwogICAgZmxleC1kaXJlY3Rpb246IGNvbHVtbjsKICAgIGFuaW1hdGlvbjogbW9kYWwtaW4gMC4zcyBjdWJpYy1iZXppZXIoMC4yMiwxLDAuMzYsMSkgYm90aDsKICB9CiAgQGtleWZyYW1lcyBtb2RhbC1pbiB7CiAgICBmcm9tIHsgb3BhY2l0eTogMDsgdHJhbnNmb3JtOiBzY2FsZSgwLjk0KSB0cmFuc2xhdGVZKDIwcHgpOyB9CiAgICB0byAgIHsgb3BhY2l0eTogMTsgdHJhbnNmb3JtOiBzY2FsZSgxKSB0cmFuc2xhdGVZKDApOyB9CiAgfQogIC5tb2RhbC1iYXIgewogICAgYmFja2dyb3VuZDogIzAwMTEyYzsKICAgIHBhZGRpbmc6IDExcHggMjBweDsKICAgIGRpc3BsYXk6IGZsZXg7CiAgICBhbGlnbi1pdGVtczogY2VudGVyOwogICAganVzdGlmeS1jb250ZW50OiBzcGFjZS1iZXR3ZWVuOwogICAgZmxleC1zaHJpbms6IDA7CiAgfQogIC5tb2RhbC10aXRsZSB7CiAgICBmb250LXNpemU6IDExcHg7IGZvbnQtd2VpZ2h0OiA3MDA7CiAgICBsZXR0ZXItc3BhY2luZzogLjFlbTsgdGV4dC10cmFuc2Zvcm06IHVwcGVyY2FzZTsKICAgIGNvbG9yOiByZ2JhKDI1NSwyNTUsMjU1LC43KTsKICAgIGRpc3BsYXk6IGZsZXg7IGFsaWduLWl0ZW1zOiBjZW50ZXI7IGdhcDogOHB4OwogIH0KICAubW9kYWwtdGl0bGU6OmJlZm9yZSB7CiAgICBjb250ZW50OiAnJzsKICAgIHdpZHRoOiA2cHg7IGhlaWdodDogNnB4OyBib3JkZXItcmFkaXVzOiA1MCU7CiAgICBiYWNrZ3JvdW5kOiAjMGFiZjUzOwogICAgZmxleC1zaHJpbms6IDA7CiAgfQogIC5tb2RhbC1jbG9zZSB7CiAgICBiYWNrZ3JvdW5kOiByZ2JhKDI1NSwyNTUsMjU1LC4xKTsKICAgIGJvcmRlcjogMXB4IHNvbGlkIHJnYmEoMjU1LDI1NSwyNTUsLjE1KTsKICAgIGNvbG9yOiByZ2JhKDI1NSwyNTUsMjU1LC43KTsKICAgIGJvcmRlci1yYWRpdXM6IDRweDsKICAgIHBhZGRpbmc6IDVweCAxNHB4OwogICAgZm9udC1mYW1pbHk6IGluaGVyaXQ7CiAgICBmb250LXNpemU6IDExcHg7IGZvbnQtd2VpZ2h0OiA2MDA7CiAgICBjdXJzb3I6IHBvaW50ZXI7CiAgICB0cmFuc2l0aW9uOiBhbGwgLjE1czsKICAgIGxldHRlci1zcGFjaW5nOiAuMDZlbTsKICB9CiAgLm1vZGFsLWNsb3NlOmhvdmVyIHsKICAgIGJhY2tncm91bmQ6IHJnYmEoMjU1LDI1NSwyNTUsLjIpOwogICAgY29sb3I6ICNmZmY7CiAgfQogIC5tb2RhbC1mcmFtZSB7CiAgICBmbGV4OiAxOwogICAgYm9yZGVyOiBub25lOwogICAgd2lkdGg6IDEwMCU7CiAgfQoKICAvKiBNYWtlIHBhaW4gaXRlbSA1IGxvb2sgY2xpY2thYmxlICovCiAgLnBhaW4taXRlbS5jbGlja2FibGUgewogICAgY3Vyc29yOiBwb2ludGVyOwogICAgcG9zaXRpb246IHJlbGF0aXZlOwogIH0KICAucGFpbi1pdGVtLmNsaWNrYWJsZTpob3ZlciB7CiAgICBib3JkZXItbGVmdC1jb2xvcjogIzAwMTEyYzsKICAgIGJveC1zaGFkb3c6IDAgM3B4IDE2cHggcmdiYSgwLDE3LDQ0LDAuMTIpOwogIH0KICAucGFpbi1pdGVtLmNsaWNrYWJsZTo6YWZ0ZXIgewogICAgY29udGVudDogJ+KGkic7CiAgICBwb3NpdGlvbjogYWJzb2x1dGU7CiAgICByaWdodDogMTBweDsKICAgIHRvcDogNTAlOwogICAgdHJhbnNmb3JtOiB0cmFuc2xhdGVZKC01MCUpOwogICAgZm9udC1zaXplOiAxMnB4OwogICAgY29sb3I6ICNlMjJkMmQ7CiAgICBvcGFjaXR5OiAwOwogICAgdHJhbnNpdGlvbjogb3BhY2l0eSAuMTVzLCByaWdodCAuMTVzOwogIH0KICAucGFpbi1pdGVtLmNsaWNrYWJsZTpob3Zlcjo6YWZ0ZXIgewogICAgb3BhY2l0eTogMTsKICAgIHJpZ2h0OiA4cHg7CiAgfQoKCiAgLnBhaW4taXRlbS1jbGlja2FibGUgewogICAgY3Vyc29yOiBwb2ludGVyICFpbXBvcnRhbnQ7CiAgICBwb3NpdGlvbjogcmVsYXRpdmU7CiAgfQogIC5wYWluLWl0ZW0tY2xpY2thYmxlOmhvdmVyIHsKICAgIGJvcmRlci1sZWZ0LWNvbG9yOiAjMGFiZjUzICFpbXBvcnRhbnQ7CiAgICBib3JkZXItY29sb3I6IHJnYmEoMTAsMTkxLDgzLDAuMykgIWltcG9ydGFudDsKICAgIGJveC1zaGFkb3c6IDAgM3B4IDE2cHggcmdiYSgxMCwxOTEsODMsMC4xNSkgIWltcG9ydGFudDsKICAgIHRyYW5zZm9ybTogdHJhbnNsYXRlWCgtM3B4KSAhaW1wb3J0YW50OwogIH0KICAucGFpbi1jdGEgewogICAgZGlzcGxheTogYmxvY2s7CiAgICBmb250LXNpemU6IDkuNXB4OwogICAgZm9udC13ZWlnaHQ6IDcwMDsKICAgIGxldHRlci1zcGFjaW5nOiAwLjA4ZW07CiAgICB0ZXh0LXRyYW5zZm9ybTogdXBwZXJjYXNlOwogICAgY29sb3I6IHZhcigtLWdyZWVuKTsKICAgIG1hcmdpbi10b3A6IDVweDsKICAgIG9wYWNpdHk6IDA7CiAgICB0cmFuc2l0aW9uOiBvcGFjaXR5IDAuMThzOwogIH0KICAucGFpbi1pdGVtLWNsaWNrYWJsZTpob3ZlciAucGFpbi1jdGEgewogICAgb3BhY2l0eTogMTsKICB9CgogIAogICAgdG8gICB7IG9wYWNpdHk6IDE7IH0KICB9CiAgQGtleWZyYW1lcyBtb2RhbC1zbGlkZSB7CiAgICBmcm9tIHsgb3BhY2l0eTogMDsgdHJhbnNmb3JtOiB0cmFuc2xhdGVZKDIwcHgpIHNjYWxlKDAuOTcpOyB9CiAgICB0byAgIHsgb3BhY2l0eTogMTsgdHJhbnNmb3JtOiB0cmFuc2xhdGVZKDApIHNjYWxlKDEpOyB9CiAgfQoKLyog4pSA4pSAIFJFU1BPTlNJVkU6IFRBQkxFVCDilIDilIAgKi8KQG1lZGlhIHNjcmVlbiBhbmQgKG1heC13aWR0aDogNzY4cHgpIHsKICBib2R5e2ZvbnQtc2l6ZToxMnB4fQogIG5hdntmbGV4LXdyYXA6d3JhcDtwYWRkaW5nOjAgMTZweH0KICBtYWluLC5tYWluLC5jb250YWluZXJ7cGFkZGluZzoxNnB4IWltcG9ydGFudDttYXgtd2lkdGg6MTAwJSFpbXBvcnRhbnR9CiAgW3N0eWxlKj0iZ3JpZC10ZW1wbGF0ZS1jb2x1bW5zIl17Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOjFmciAxZnIhaW1wb3J0YW50fQogIGgxe2ZvbnQtc2l6ZToxLjRyZW0haW1wb3J0YW50fQogIGgye2ZvbnQtc2l6ZToxLjJyZW0haW1wb3J0YW50fQp9Ci8qIOKUgOKUgCBSRVNQT05TSVZFOiBQSE9ORSDilIDilIAgKi8KQG1lZGlhIHNjcmVlbiBhbmQgKG1heC13aWR0aDogNDgwcHgpIHsKICBib2R5e2ZvbnQtc2l6ZToxMXB4fQogIG5hdntwYWRkaW5nOjAgMTBweH0KICBuYXYgYSxuYXYgYnV0dG9uLC5uYXYtdGFie3BhZGRpbmc6OHB4IDEwcHghaW1wb3J0YW50O2ZvbnQtc2l6ZToxMHB4IWltcG9ydGFudH0KICBtYWluLC5tYWluLC5jb250YWluZXJ7cGFkZGluZzoxMHB4IDhweCFpbXBvcnRhbnR9CiAgW3N0eWxlKj0iZ3JpZC10ZW1wbGF0ZS1jb2x1bW5zIl17Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOjFmciFpbXBvcnRhbnR9CiAgaDF7Zm9udC1zaXplOjEuMnJlbSFpbXBvcnRhbnR9CiAgaDJ7Zm9udC1zaXplOjFyZW0haW1wb3J0YW50fQogIHRhYmxle2ZvbnQtc2l6ZToxMHB4O2Rpc3BsYXk6YmxvY2s7b3ZlcmZsb3cteDphdXRvfQogIGltZyxzdmcsY2FudmFze21heC13aWR0aDoxMDAlIWltcG9ydGFudDtoZWlnaHQ6YXV0byFpbXBvcnRhbnR9Cn0KPC9zdHlsZT4KPC9oZWFkPgo8Ym9keT4KPGNhbnZhcyBpZD0iYmctY2FudmFzIiBzdHlsZT0icG9zaXRpb246Zml4ZWQ7aW5zZXQ6MDt3aWR0aDoxMDAlO2hlaWdodDoxMDAlO3otaW5kZXg6MDtwb2ludGVyLWV2ZW50czpub25lOyI+PC9jYW52YXM+CjxzY3JpcHQ+CihmdW5jdGlvbigpewogIGNvbnN0IGMgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnYmctY2FudmFzJyk7CiAgZnVuY3Rpb24gZHJhdygpIHsKICAgIGNvbnN0IFcgPSB3aW5kb3cuaW5uZXJXaWR0aCwgSCA9IHdpbmRvdy5pbm5lckhlaWdodDsKICAgIGMud2lkdGggPSBXOyBjLmhlaWdodCA9IEg7CiAgICBjb25zdCBjdHggPSBjLmdldENvbnRleHQoJzJkJyk7CiAgICAvLyBCYXNlIGdyYWRpZW50CiAgICBjb25zdCBncmFkID0gY3R4LmNyZWF0ZUxpbmVhckdyYWRpZW50KDAsIDAsIFcsIEgpOwogICAgZ3JhZC5hZGRDb2xvclN0b3AoMCwgJyNlOGVjZjInKTsKICAgIGdyYWQuYWRkQ29sb3JTdG9wKDAuNSwgJyNlZWYwZjUnKTsKICAgIGdyYWQuYWRkQ29sb3JTdG9wKDEsICcjZTRlOWYwJyk7CiAgICBjdHguZmlsbFN0eWxlID0gZ3JhZDsKICAgIGN0eC5maWxsUmVjdCgwLCAwLCBXLCBIKTsKICAgIC8vIEdyZWVuIGJsb29tIGJvdHRvbS1sZWZ0CiAgICBjb25zdCBnYmwgPSBjdHguY3JlYXRlUmFkaWFsR3JhZGllbnQoMCwgSCwgMCwgMCwgSCwgVyAqIDAuNTUpOwogICAgZ2JsLmFkZENvbG9yU3RvcCgwLCAncmdiYSgxMCwxOTEsODMsMC4xNCknKTsKICAgIGdibC5hZGRDb2xvclN0b3AoMSwgJ3JnYmEoMTAsMTkxLDgzLDApJyk7CiAgICBjdHguZmlsbFN0eWxlID0gZ2JsOwogICAgY3R4LmZpbGxSZWN0KDAsIDAsIFcsIEgpOwogICAgLy8gR3JlZW4gYmxvb20gdG9wLXJpZ2h0CiAgICBjb25zdCBndHIgPSBjdHguY3JlYXRlUmFkaWFsR3JhZGllbnQoVywgMCwgMCwgVywgMCwgVyAqIDAuMzgpOwogICAgZ3RyLmFkZENvbG9yU3RvcCgwLCAncmdiYSgxMCwxOTEsODMsMC4wNyknKTsKICAgIGd0ci5hZGRDb2xvclN0b3AoMSwgJ3JnYmEoMTAsMTkxLDgzLDApJyk7CiAgICBjdHguZmlsbFN0eWxlID0gZ3RyOwogICAgY3R4LmZpbGxSZWN0KDAsIDAsIFcsIEgpOwogICAgLy8gR3JpZCBsaW5lcwogICAgY3R4LnN0cm9rZVN0eWxlID0gJ3JnYmEoMCwxNyw0NCwwLjA2NSknOwogICAgY3R4LmxpbmVXaWR0aCA9IDE7CiAgICBjb25zdCBzdGVwID0gNTY7CiAgICBmb3IgKGxldCB4ID0gMDsgeCA8IFc7IHggKz0gc3RlcCkgeyBjdHguYmVnaW5QYXRoKCk7IGN0eC5tb3ZlVG8oeCwwKTsgY3R4LmxpbmVUbyh4LEgpOyBjdHguc3Ryb2tlKCk7IH0KICAgIGZvciAobGV0IHkgPSAwOyB5IDwgSDsgeSArPSBzdGVwKSB7IGN0eC5iZWdpblBhdGgoKTsgY3R4Lm1vdmVUbygwLHkpOyBjdHgubGluZVRvKFcseSk7IGN0eC5zdHJva2UoKTsgfQogICAgLy8gRG90IG1hdHJpeAogICAgY3R4LmZpbGxTdHlsZSA9ICdyZ2JhKDAsMTcsNDQsMC4wOSknOwogICAgZm9yIChsZXQgeCA9IDE0OyB4IDwgVzsgeCArPSAyOCkgewogICAgICBmb3IgKGxldCB5ID0gMTQ7IHkgPCBIOyB5ICs9IDI4KSB7CiAgICAgICAgY3R4LmJlZ2luUGF0aCgpOyBjdHguYXJjKHgsIHksIDEuMiwgMCwgTWF0aC5QSSoyKTsgY3R4LmZpbGwoKTsKICAgICAgfQogICAgfQogICAgLy8gR2VvbWV0cmljIGFjY2VudHMKICAgIGN0eC5zdHJva2VTdHlsZSA9ICdyZ2JhKDEwLDE5MSw4MywwLjI1KSc7IGN0eC5saW5lV2lkdGggPSAxLjU7CiAgICBjdHguYmVnaW5QYXRoKCk7IGN0eC5tb3ZlVG8oMCwgSCowLjc2KTsgY3R4LmxpbmVUbyhXKjAuMTQsIEgqMC43Nik7IGN0eC5zdHJva2UoKTsKICAgIGN0eC5zdHJva2VTdHlsZSA9ICdyZ2JhKDEwLDE5MSw4MywwLjE4KSc7CiAgICBjdHguYmVnaW5QYXRoKCk7IGN0eC5tb3ZlVG8oVyowLjgsIDApOyBjdHgubGluZVRvKFcqMC44LCBIKjAuMTApOyBjdHguc3Ryb2tlKCk7CiAgICBjdHguYmVnaW5QYXRoKCk7IGN0eC5tb3ZlVG8oVyowLjgsIEgqMC4xMCk7IGN0eC5saW5lVG8oVywgSCowLjEwKTsgY3R4LnN0cm9rZSgpOwogICAgY3R4LnN0cm9rZVN0eWxlID0gJ3JnYmEoMTAsMTkxLDgzLDAuMzApJzsgY3R4LmxpbmVXaWR0aCA9IDEuNTsKICAgIGN0eC5zdHJva2VSZWN0KFcqMC4wMywgSCowLjc0LCAyOCwgMjgpOwogIH0KICBkcmF3KCk7CiAgd2luZG93LmFkZEV2ZW50TGlzdGVuZXIoJ3Jlc2l6ZScsIGRyYXcpOwp9KSgpOwo8L3NjcmlwdD4KCgoKCjxoZWFkZXI+CiAgPGRpdj4KICAgIDxkaXYgY2xhc3M9ImV5ZWJyb3ciPkFkeWVuIMK3IE9uYm9hcmRpbmcgQXVkaXQgwrcgRmViIDIwMjY8L2Rpdj4KICAgIDxoMT5DdXJyZW50IFN0YXRlIDxlbT7igJQgMTAgaXNvbGF0ZWQgY29tcG9uZW50czwvZW0+PC9oMT4KICA8L2Rpdj4KICA8ZGl2IGNsYXNzPSJzb3VyY2UtdGFnIj4KICAgIGFkeWVuLmNvbS9rbm93bGVkZ2UtaHViPGJyPgogICAgY2FyZWVycy5hZHllbi5jb20gwrcgR2xhc3Nkb29yIMK3IE1lZGl1bQogIDwvZGl2Pgo8L2hlYWRlcj4KCjxkaXYgaWQ9ImNhbnZhcyI+CiAgPHN2ZyBpZD0ibGluZXMiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CiAgICA8ZGVmcz4KICAgICAgPG1hcmtlciBpZD0idGlwIiBtYXJrZXJXaWR0aD0iNyIgbWFya2VySGVpZ2h0PSI1IiByZWZYPSI2IiByZWZZPSIyLjUiIG9yaWVudD0iYXV0byI+CiAgICAgICAgPHBvbHlnb24gcG9pbnRzPSIwIDAsNyAyLjUsMCA1IiBjbGFzcz0iYXJyb3ctdGlwIi8+CiAgICAgIDwvbWFya2VyPgogICAgPC9kZWZzPgogIDwvc3ZnPgo8L2Rpdj4KCjxkaXYgY2xhc3M9InR0IiBpZD0idHQiPjwvZGl2PgoKPGZvb3Rlcj4KICA8ZGl2IGNsYXNzPSJoaW50Ij4KICAgIDxzcGFuPkNsaWNrIHRvIHNlbGVjdDwvc3Bhbj4KICAgIDxzcGFuPkNsaWNrIGFub3RoZXIgdG8gY29ubmVjdDwvc3Bhbj4KICAgIDxzcGFuPkhvdmVyIGZvciBzb3VyY2UgZGV0YWlsczwvc3Bhbj4KICA8L2Rpdj4KICA8ZGl2IGNsYXNzPSJjb250cm9scyI+CiAgICA8c3BhbiBjbGFzcz0iY291bnRlciIgaWQ9ImNvdW50ZXIiPjAgY29ubmVjdGlvbnM8L3NwYW4+CiAgICA8YnV0dG9uIGNsYXNzPSJyZXNldC1idG4iIG9uY2xpY2s9InJlc2V0QWxsKCkiPlJlc2V0PC9idXR0b24+CiAgPC9kaXY+CjwvZm9vdGVyPgoKPHNjcmlwdD4KY29uc3QgQlVCQkxFUyA9IFsKICB7IGlkOididWRkeScsICAgIGxhYmVsOidCdWRkeVxuU3lzdGVtJywgICAgc3ViOidUZWFtLWFzc2lnbmVkJywgIGRlc2M6J0V2ZXJ5IG5ldyBlbmdpbmVlciBnZXRzIGEgYnVkZHkgZnJvbSB0aGVpciBvd24gdGVhbS4gQ292ZXJzIGNvZGViYXNlIHdhbGt0aHJvdWdoLCBmaXJzdCB0YXNrcywgc2V0dXAgZ3VpZGVzLCBhbmQgaW50ZXJuYWwgbmV0d29yayBidWlsZGluZy4nLCAgc2l6ZToxNjgsIHg6MjUsIHk6MzAgfSwKICB7IGlkOid2aWRlbycsICAgIGxhYmVsOidTZXR1cFxuVmlkZW9zJywgICAgc3ViOidEYXkgMSBvbmx5JywgICAgIGRlc2M6J0ludGVybmFsIHZpZGVvIHR1dG9yaWFscyBmb3IgRGF5IDEgbGFwdG9wIHNldHVwLiBDb3ZlcnMgZW1haWwsIGNvZGUgcmVwb3NpdG9yaWVzLCBzZWN1cml0eSBzb2Z0d2FyZS4gUHJvZHVjZWQgYnkgdGhlIEJ1c2luZXNzIEluZnJhc3RydWN0dXJlIHRlYW0uJywgc2l6ZToxNTIsIHg6NDMsIHk6MjIgfSwKICB7IGlkOidjb3Vyc2VzJywgIGxhYmVsOicyMCtcbkNvdXJzZXMnLCAgICAgc3ViOidTZWxmLWVucm9sbGVkJywgIGRlc2M6J092ZXIgMjAgY291cnNlcyBjb3ZlcmluZyBBZHllblwncyB0ZWNoIHN0YWNrOiBKYXZhLCBLYWZrYSwgZGF0YWJhc2VzLCByZWxlYXNlIHByb2Nlc3MsIGJ1aWxkIHRvb2xzLiBObyBtYW5kYXRvcnkgc2NoZWR1bGUg4oCUIGVuZ2luZWVyIGRlY2lkZXMgd2hlbiB0byBlbnJvbGwuJywgc2l6ZToxNzYsIHg6NTksIHk6MjAgfSwKICB7IGlkOidvcmVpbGx5JywgIGxhYmVsOiJPJ1JlaWxseVxuTGVhcm5pbmciLCBzdWI6J0V4dGVybmFsIHBsYXRmb3JtJywgZGVzYzonQWNjZXNzIHRvIE9cJ1JlaWxseSBMZWFybmluZzogZWJvb2tzLCB2aWRlbyBjb3Vyc2VzLCBsZWFybmluZyBwYXRocy4gMTM4LDAwMCBtaW51dGVzIGNvbnN1bWVkIGluIHRoZSBmaXJzdCA2IG1vbnRocyBvZiBUZWNoIEFjYWRlbXkuJywgc2l6ZToxNTQsIHg6NjcsIHk6MzQgfSwKICB7IGlkOidjdG8nLCAgICAgIGxhYmVsOidDVE9cblEmQScsICAgICAgICAgc3ViOid+V2VlayA0JywgICAgICAgIGRlc2M6J0luZm9ybWFsIG9wZW4gc2Vzc2lvbiB3aXRoIHRoZSBDVE8gZm9yIGFsbCBuZXcgZW5naW5lZXJzIGFyb3VuZCB3ZWVrIDQuIFF1ZXN0aW9ucyBvbiB0ZWNobm9sb2d5IGNob2ljZXMsIHByb2R1Y3Qgc3RyYXRlZ3ksIGFuZCBjb21wYW55IGRpcmVjdGlvbi4nLCBzaXplOjE1NiwgeDo2OCwgeTo2MyB9LAogIHsgaWQ6J2h1YicsICAgICAgbGFiZWw6J0h1YlxuUGxhdGZvcm0nLCAgICBzdWI6J0ludGVybmFsIHdpa2knLCAgZGVzYzonIkh1YiIg4oCUIGludGVybmFsIGRvY3VtZW50YXRpb24gcGxhdGZvcm0uIEVtcGxveWVlcyBkZXNjcmliZSBpdCBhcyAiaW5jcmVkaWJseSB2YXN0IGFuZCB1cC10by1kYXRlLiIgQ29udGFpbnMgb25ib2FyZGluZyBtYXRlcmlhbHMsIHBvbGljaWVzLCBhbmQgZ3VpZGVzLicsIHNpemU6MTY0LCB4OjU0LCB5Ojc2IH0sCiAgeyBpZDonZmVlZGJhY2snLCBsYWJlbDonTW9udGggMVxuRmVlZGJhY2snLCBzdWI6J0dyb3VwIHNlc3Npb24nLCBkZXNjOidFbmQtb2YtZmlyc3QtbW9udGggZ2F0aGVyaW5nIG9yZ2FuaXplZCBieSBUZWNoIEFjYWRlbXkuIE5ldyBlbmdpbmVlcnMgZGlzY3VzcyB3aGF0IHdvcmtlZCBhbmQgd2hhdCBkaWQgbm90LiBPdXRwdXQgdXNlZCB0byBpdGVyYXRlIHRoZSBwcm9ncmFtLicsIHNpemU6MTU0LCB4OjM3LCB5Ojc5IH0sCiAgeyBpZDonaHInLCAgICAgICBsYWJlbDonSFJcblNlc3Npb25zJywgICAgIHN1YjonV2Vla3MgMeKAkzInLCAgICAgIGRlc2M6J0NvbXBhbnktd2lkZSBIUiBzZXNzaW9ucyBpbiB0aGUgZmlyc3QgdHdvIHdlZWtzOiBBZHllbiBjdWx0dXJlICgiVGhlIEZvcm11bGEiKSwgYmVuZWZpdHMsIHBvbGljaWVzLCBhbmQgb3JnIHN0cnVjdHVyZS4gTm90IHRlY2huaWNhbCBpbiBuYXR1cmUuJywgc2l6ZToxNTgsIHg6MTksIHk6NjAgfSwKICB7IGlkOid0ZWNocmFkYXInLGxhYmVsOidUZWNoXG5SYWRhcicsICAgICAgc3ViOidSZWZlcmVuY2Ugb25seScsIGRlc2M6J0ludGVybmFsIFRlY2ggUmFkYXIgKFRob3VnaHR3b3Jrcy1pbnNwaXJlZCkuIFRlY2hub2xvZ2llcyB0YWdnZWQgYXMgYXNzZXNzIC8gdHJpYWwgLyBhZG9wdCAvIGhvbGQuIEVuZ2luZWVyaW5nIHJlZmVyZW5jZSBmb3IgdGVjaG5vbG9neSBkZWNpc2lvbnMuJywgIHNpemU6MTQ4LCB4OjU0LCB5OjQ3IH0sCiAgeyBpZDonYWNhZGVteScsICBsYWJlbDonVGVjaFxuQWNhZGVteScsICAgIHN1YjonVW5kZXIgQ1RPJywgICAgICBkZXNjOidDcm9zcy1mdW5jdGlvbmFsIHRlYW0gdW5kZXIgdGhlIENUTy4gRXh0ZW5kZWQgaW4gMjAyNSB0byBjb3ZlciBFbmdpbmVlcnMsIFByb2R1Y3QgTWFuYWdlcnMsIGFuZCBVWCBwcm9mZXNzaW9uYWxzIHZpYSB0aGUgVGVjaCBFbmFibGVtZW50IFRlYW0uJywgc2l6ZToxNzAsIHg6MzEsIHk6NDYgfQpdOwoKbGV0IHNlbGVjdGVkID0gbnVsbDsKbGV0IGNvbm5lY3Rpb25zID0gW107CmxldCBlbHMgPSB7fTsKCmZ1bmN0aW9uIGluaXQoKSB7CiAgY29uc3QgY2FudmFzID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2NhbnZhcycpOwogIEJVQkJMRVMuZm9yRWFjaCgoYiwgaSkgPT4gewogICAgY29uc3Qgd3JhcCA9IGRvY3VtZW50LmNyZWF0ZUVsZW1lbnQoJ2RpdicpOwogICAgd3JhcC5jbGFzc05hbWUgPSAnYnViYmxlJzsKICAgIHdyYXAuaWQgPSAnYi0nICsgYi5pZDsKICAgIHdyYXAuc3R5bGUubGVmdCA9IGIueCArICclJzsKICAgIHdyYXAuc3R5bGUudG9wICA9IGIueSArICclJzsKICAgIHdyYXAuc3R5bGUuYW5pbWF0aW9uRGVsYXkgPSAoaSAqIDAuMDY1KSArICdzJzsKCiAgICBjb25zdCBsaW5lcyA9IGIubGFiZWwuc3BsaXQoJ1xuJyk7CiAgICB3cmFwLmlubmVySFRNTCA9IGAKICAgICAgPGRpdiBjbGFzcz0iYnViYmxlLWRpc2siIHN0eWxlPSJ3aWR0aDoke2Iuc2l6ZX1weDtoZWlnaHQ6JHtiLnNpemV9cHg7Ij4KICAgICAgICA8ZGl2IGNsYXNzPSJidWJibGUtbmFtZSI+JHtsaW5lc1swXX08YnI+JHtsaW5lc1sxXSB8fCAnJ308L2Rpdj4KICAgICAgICA8ZGl2IGNsYXNzPSJidWJibGUtc3ViIj4ke2Iuc3VifTwvZGl2PgogICAgICAgIDxkaXYgY2xhc3M9ImJ1YmJsZS1kb3QiPjwvZGl2PgogICAgICA8L2Rpdj5gOwoKICAgIHdyYXAub25jbGljayA9ICgpID0+IG9uQ2xpY2soYi5pZCk7CiAgICB3cmFwLm9ubW91c2VlbnRlciA9IGUgPT4gc2hvd1RUKGUsIGIpOwogICAgd3JhcC5vbm1vdXNlbGVhdmUgPSBoaWRlVFQ7CgogICAgY2FudmFzLmFwcGVuZENoaWxkKHdyYXApOwogICAgZWxzW2IuaWRdID0gd3JhcDsKICB9KTsKfQoKZnVuY3Rpb24gb25DbGljayhpZCkgewogIGlmICghc2VsZWN0ZWQpIHsKICAgIHNlbGVjdGVkID0gaWQ7CiAgICBlbHNbaWRdLmNsYXNzTGlzdC5hZGQoJ3NlbGVjdGVkJyk7CiAgICByZXR1cm47CiAgfQogIGlmIChzZWxlY3RlZCA9PT0gaWQpIHsKICAgIGVsc1tpZF0uY2xhc3NMaXN0LnJlbW92ZSgnc2VsZWN0ZWQnKTsKICAgIHNlbGVjdGVkID0gbnVsbDsKICAgIHJldHVybjsKICB9CiAgY29uc3QgZHVwZSA9IGNvbm5lY3Rpb25zLnNvbWUoYyA9PgogICAgKGMuYSA9PT0gc2VsZWN0ZWQgJiYgYy5iID09PSBpZCkgfHwgKGMuYSA9PT0gaWQgJiYgYy5iID09PSBzZWxlY3RlZCkKICApOwogIGlmICghZHVwZSkgewogICAgY29ubmVjdGlvbnMucHVzaCh7IGE6IHNlbGVjdGVkLCBiOiBpZCB9KTsKICAgIGRyYXdBcnJvdyhzZWxlY3RlZCwgaWQpOwogICAgZWxzW3NlbGVjdGVkXS5jbGFzc0xpc3QuYWRkKCdjb25uZWN0ZWQnKTsKICAgIGVsc1tpZF0uY2xhc3NMaXN0LmFkZCgnY29ubmVjdGVkJyk7CiAgICB1cGRhdGVDb3VudGVyKCk7CiAgfQogIGVsc1tzZWxlY3RlZF0uY2xhc3NMaXN0LnJlbW92ZSgnc2VsZWN0ZWQnKTsKICBzZWxlY3RlZCA9IG51bGw7Cn0KCmZ1bmN0aW9uIGNlbnRlcihpZCkgewogIGNvbnN0IHIgPSBlbHNbaWRdLmdldEJvdW5kaW5nQ2xpZW50UmVjdCgpOwogIHJldHVybiB7IHg6IHIubGVmdCArIHIud2lkdGggLyAyLCB5OiByLnRvcCArIHIuaGVpZ2h0IC8gMiB9Owp9CmZ1bmN0aW9uIHJhZGl1cyhpZCkgeyByZXR1cm4gQlVCQkxFUy5maW5kKGIgPT4gYi5pZCA9PT0gaWQpLnNpemUgLyAyOyB9CgpmdW5jdGlvbiBkcmF3QXJyb3coYSwgYikgewogIGNvbnN0IHN2ZyA9IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdsaW5lcycpOwogIGNvbnN0IEEgPSBjZW50ZXIoYSksIEIgPSBjZW50ZXIoYik7CiAgY29uc3QgcmEgPSByYWRpdXMoYSksIHJiID0gcmFkaXVzKGIpOwogIGNvbnN0IGR4ID0gQi54IC0gQS54LCBkeSA9IEIueSAtIEEueTsKICBjb25zdCBkID0gTWF0aC5zcXJ0KGR4KmR4ICsgZHkqZHkpOwogIGNvbnN0IHV4ID0gZHgvZCwgdXkgPSBkeS9kOwogIGNvbnN0IHN4ID0gQS54ICsgdXgqcmEsIHN5ID0gQS55ICsgdXkqcmE7CiAgY29uc3QgZXggPSBCLnggLSB1eCoocmIrOSksIGV5ID0gQi55IC0gdXkqKHJiKzkpOwogIGNvbnN0IG14ID0gKHN4K2V4KS8yICsgKGR5L2QpKjE2LCBteSA9IChzeStleSkvMiAtIChkeC9kKSoxNjsKCiAgY29uc3QgZyA9IGRvY3VtZW50LmNyZWF0ZUVsZW1lbnROUygnaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnLCdnJyk7CiAgZy5kYXRhc2V0LmEgPSBhOyBnLmRhdGFzZXQuYiA9IGI7CiAgY29uc3QgcCA9IGRvY3VtZW50LmNyZWF0ZUVsZW1lbnROUygnaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmcnLCdwYXRoJyk7CiAgcC5zZXRBdHRyaWJ1dGUoJ2QnLCBgTSAke3N4fSAke3N5fSBRICR7bXh9ICR7bXl9ICR7ZXh9ICR7ZXl9YCk7CiAgcC5zZXRBdHRyaWJ1dGUoJ2NsYXNzJywnYXJyb3ctbGluZScpOwogIHAuc2V0QXR0cmlidXRlKCdtYXJrZXItZW5kJywndXJsKCN0aXApJyk7CiAgZy5hcHBlbmRDaGlsZChwKTsKICBzdmcuYXBwZW5kQ2hpbGQoZyk7Cn0KCmZ1bmN0aW9uIHVwZGF0ZUNvdW50ZXIoKSB7CiAgY29uc3QgZWwgPSBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnY291bnRlcicpOwogIGNvbnN0IG4gPSBjb25uZWN0aW9ucy5sZW5ndGg7CiAgZWwudGV4dENvbnRlbnQgPSBuICsgJyBjb25uZWN0aW9uJyArIChuIT09MT8ncyc6JycpOwogIGVsLmNsYXNzTGlzdC50b2dnbGUoJ2FjdGl2ZScsIG4gPiAwKTsKfQoKZnVuY3Rpb24gcmVzZXRBbGwoKSB7CiAgY29ubmVjdGlvbnMgPSBbXTsgc2VsZWN0ZWQgPSBudWxsOwogIGNvbnN0IHN2ZyA9IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdsaW5lcycpOwogIHdoaWxlIChzdmcubGFzdENoaWxkICYmIHN2Zy5sYXN0Q2hpbGQudGFnTmFtZSAhPT0gJ2RlZnMnKSBzdmcucmVtb3ZlQ2hpbGQoc3ZnLmxhc3RDaGlsZCk7CiAgT2JqZWN0LnZhbHVlcyhlbHMpLmZvckVhY2goZSA9PiBlLmNsYXNzTGlzdC5yZW1vdmUoJ3NlbGVjdGVkJywnY29ubmVjdGVkJykpOwogIHVwZGF0ZUNvdW50ZXIoKTsKfQoKZnVuY3Rpb24gc2hvd1RUKGUsIGIpIHsKICBjb25zdCB0dCA9IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCd0dCcpOwogIHR0LmlubmVySFRNTCA9IGA8Yj4ke2IubGFiZWwucmVwbGFjZSgnXG4nLCcgJyl9PC9iPiR7Yi5kZXNjfWA7CiAgdHQuY2xhc3NMaXN0LmFkZCgnc2hvdycpOwogIG1vdmVUVChlKTsKfQpmdW5jdGlvbiBoaWRlVFQoKSB7IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCd0dCcpLmNsYXNzTGlzdC5yZW1vdmUoJ3Nob3cnKTsgfQpmdW5jdGlvbiBtb3ZlVFQoZSkgewogIGNvbnN0IHR0ID0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ3R0Jyk7CiAgdHQuc3R5bGUubGVmdCA9IE1hdGgubWluKGUuY2xpZW50WCsxNCwgd2luZG93LmlubmVyV2lkdGgtMjMyKSArICdweCc7CiAgdHQuc3R5bGUudG9wICA9IE1hdGgubWluKGUuY2xpZW50WS04LCAgd2luZG93LmlubmVySGVpZ2h0LTExNSkgKyAncHgnOwp9CmRvY3VtZW50LmFkZEV2ZW50TGlzdGVuZXIoJ21vdXNlbW92ZScsIGUgPT4gewogIGlmIChkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgndHQnKS5jbGFzc0xpc3QuY29udGFpbnMoJ3Nob3cnKSkgbW92ZVRUKGUpOwp9KTsKCndpbmRvdy5hZGRFdmVudExpc3RlbmVyKCdyZXNpemUnLCAoKSA9PiB7CiAgY29uc3Qgc2F2ZWQgPSBbLi4uY29ubmVjdGlvbnNdOwogIGNvbnN0IHN2ZyA9IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdsaW5lcycpOwogIHdoaWxlIChzdmcubGFzdENoaWxkICYmIHN2Zy5sYXN0Q2hpbGQudGFnTmFtZSAhPT0gJ2RlZnMnKSBzdmcucmVtb3ZlQ2hpbGQoc3ZnLmxhc3RDaGlsZCk7CiAgY29ubmVjdGlvbnMgPSBbXTsKICBzYXZlZC5mb3JFYWNoKGMgPT4geyBjb25uZWN0aW9ucy5wdXNoKGMpOyBkcmF3QXJyb3coYy5hLCBjLmIpOyB9KTsKfSk7Cgppbml0KCk7CgoKCmZ1bmN0aW9uIG9wZW5Db250ZXh0TGF5ZXIoKSB7CiAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2NvbnRleHQtbW9kYWwnKS5jbGFzc0xpc3QuYWRkKCdvcGVuJyk7Cn0KCmZ1bmN0aW9uIGNsb3NlQ29udGV4dE1vZGFsKGUpIHsKICBpZiAoZS50YXJnZXQgPT09IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdjb250ZXh0LW1vZGFsJykpIHsKICAgIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdjb250ZXh0LW1vZGFsJykuY2xhc3NMaXN0LnJlbW92ZSgnb3BlbicpOwogIH0KfQoKZnVuY3Rpb24gb3Blbk5hdmlnYXRvcigpIHsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnbmF2aWdhdG9yLW1vZGFsJykuY2xhc3NMaXN0LmFkZCgnb3BlbicpOwp9CgpmdW5jdGlvbiBjbG9zZU5hdmlnYXRvck1vZGFsKGUpIHsKICBpZiAoZS50YXJnZXQgPT09IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCduYXZpZ2F0b3ItbW9kYWwnKSkgewogICAgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ25hdmlnYXRvci1tb2RhbCcpLmNsYXNzTGlzdC5yZW1vdmUoJ29wZW4nKTsKICB9Cn0KCmZ1bmN0aW9uIG9wZW5CdWRkeSgpIHsKICBkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnYnVkZHktbW9kYWwnKS5jbGFzc0xpc3QuYWRkKCdvcGVuJyk7Cn0KCmZ1bmN0aW9uIGNsb3NlTW9kYWwoZSkgewogIGlmIChlLnRhcmdldCA9PT0gZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2J1ZGR5LW1vZGFsJykpIHsKICAgIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdidWRkeS1tb2RhbCcpLmNsYXNzTGlzdC5yZW1vdmUoJ29wZW4nKTsKICB9Cn0KCmRvY3VtZW50LmFkZEV2ZW50TGlzdGVuZXIoJ2tleWRvd24nLCBlID0+IHsKICBpZiAoZS5rZXkgPT09ICdFc2NhcGUnKSB7IGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdidWRkeS1tb2RhbCcpLmNsYXNzTGlzdC5yZW1vdmUoJ29wZW4nKTsgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ25hdmlnYXRvci1tb2RhbCcpLmNsYXNzTGlzdC5yZW1vdmUoJ29wZW4nKTsgZG9jdW1lbnQuZ2V0RWxlbWVudEJ5SWQoJ2NvbnRleHQtbW9kYWwnKS5jbGFzc0xpc3QucmVtb3ZlKCdvcGVuJyk7IH0KfSk7Cgo8L3NjcmlwdD4KCjwhLS0gUEFJTiBQT0lOVFMgUEFORUwgLS0+CjxkaXYgY2xhc3M9InBhaW4tcGFuZWwiPgogIDxkaXYgY2xhc3M9InBhaW4taGVhZGVyIj5QYWluIFBvaW50czwvZGl2PgogIDxkaXYgY2xhc3M9InBhaW4taXRlbSI+CiAgICA8ZGl2IGNsYXNzPSJwYWluLWJ1bGxldCI+MTwvZGl2PgogICAgPGRpdiBjbGFzcz0icGFpbi10ZXh0Ij5UaW1lLXRvLXByb2R1Y3Rpdml0eSBpcyBzbG93IDxlbSBjbGFzcz0icGFpbi1oaWdobGlnaHQiPihvdmVyIDIgbW9udGhzKTwvZW0+PC9kaXY+CiAgPC9kaXY+CiAgPGRpdiBjbGFzcz0icGFpbi1pdGVtIj4KICAgIDxkaXYgY2xhc3M9InBhaW4tYnVsbGV0Ij4yPC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJwYWluLXRleHQiPkV4cGVyaWVuY2UgcXVhbGl0eSBpcyA8ZW0gY2xhc3M9InBhaW4taGlnaGxpZ2h0Ij5pbmNvbnNpc3RlbnQ8L2VtPjwvZGl2PgogIDwvZGl2PgogIDxkaXYgY2xhc3M9InBhaW4taXRlbSBjbGlja2FibGUiIG9uY2xpY2s9Im9wZW5Db250ZXh0TGF5ZXIoKSIgdGl0bGU9IlNlZSBBZHllbiBDb250ZXh0IExheWVyIHNvbHV0aW9uIj4KICAgIDxkaXYgY2xhc3M9InBhaW4tYnVsbGV0Ij4zPC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJwYWluLXRleHQiPkNyaXRpY2FsIGtub3dsZWRnZSBpcyA8ZW0gY2xhc3M9InBhaW4taGlnaGxpZ2h0Ij5zaWxvZWQ8L2VtPjxzcGFuIGNsYXNzPSJwYWluLWN0YSI+4oaSIFNlZSBzb2x1dGlvbjwvc3Bhbj48L2Rpdj4KICA8L2Rpdj4KICA8ZGl2IGNsYXNzPSJwYWluLWl0ZW0gY2xpY2thYmxlIiBvbmNsaWNrPSJvcGVuTmF2aWdhdG9yKCkiIHRpdGxlPSJTZWUgQWR5ZW4gTmF2aWdhdG9yIHNvbHV0aW9uIj4KICAgIDxkaXYgY2xhc3M9InBhaW4tYnVsbGV0Ij40PC9kaXY+CiAgICA8ZGl2IGNsYXNzPSJwYWluLXRleHQiPk9uYm9hcmRpbmcgaXMgPGVtIGNsYXNzPSJwYWluLWhpZ2hsaWdodCI+cGFzc2l2ZTwvZW0+IGFuZCBsYWNrcyBmZWVkYmFjazxzcGFuIGNsYXNzPSJwYWluLWN0YSI+4oaSIFNlZSBzb2x1dGlvbjwvc3Bhbj48L2Rpdj4KICA8L2Rpdj4KICA8ZGl2IGNsYXNzPSJwYWluLWl0ZW0gY2xpY2thYmxlIiBvbmNsaWNrPSJvcGVuQnVkZHkoKSIgdGl0bGU9IlNlZSBCdWRkeSBDby1QaWxvdCBzb2x1dGlvbiI+CiAgICA8ZGl2IGNsYXNzPSJwYWluLWJ1bGxldCI+NTwvZGl2PgogICAgPGRpdiBjbGFzcz0icGFpbi10ZXh0Ij5NYW5hZ2VycyBhbmQgcGVlcnMgPGVtIGNsYXNzPSJwYWluLWhpZ2hsaWdodCI+cmVwZWF0IGV4cGxhbmF0aW9uczwvZW0+PHNwYW4gY2xhc3M9InBhaW4tY3RhIj7ihpIgU2VlIHNvbHV0aW9uPC9zcGFuPjwvZGl2PgogIDwvZGl2Pgo8L2Rpdj4KCgo8IS0tIEJVRERZIENPLVBJTE9UIE1PREFMIC0tPgo8ZGl2IGNsYXNzPSJtb2RhbC1vdmVybGF5IiBpZD0iYnVkZHktbW9kYWwiIG9uY2xpY2s9ImNsb3NlTW9kYWwoZXZlbnQpIj4KICA8ZGl2IGNsYXNzPSJtb2RhbC13aW5kb3ciPgogICAgPGRpdiBjbGFzcz0ibW9kYWwtYmFyIj4KICAgICAgPGRpdiBzdHlsZT0iZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmNlbnRlcjtnYXA6MTBweDsiPgogICAgICAgIDxkaXYgc3R5bGU9IndpZHRoOjdweDtoZWlnaHQ6N3B4O2JvcmRlci1yYWRpdXM6NTAlO2JhY2tncm91bmQ6IzBhYmY1MzsiPjwvZGl2PgogICAgICAgIDxzcGFuIGNsYXNzPSJtb2RhbC10aXRsZSI+QnVkZHkgQ28tUGlsb3Qg4oCUIEF1dG9tYXRlZCBFbXBhdGh5PC9zcGFuPgogICAgICAgIDxzcGFuIHN0eWxlPSJmb250LXNpemU6MTAuNXB4O2NvbG9yOnJnYmEoMjU1LDI1NSwyNTUsLjM1KTttYXJnaW4tbGVmdDoycHg7Ij5hZGRyZXNzaW5nOiBNYW5hZ2VycyAmYW1wOyBwZWVycyByZXBlYXQgZXhwbGFuYXRpb25zPC9zcGFuPgogICAgICA8L2Rpdj4KICAgICAgPGJ1dHRvbiBjbGFzcz0ibW9kYWwtY2xvc2UiIG9uY2xpY2s9ImRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdidWRkeS1tb2RhbCcpLmNsYXNzTGlzdC5yZW1vdmUoJ29wZW4nKSI+4pyVIENsb3NlPC9idXR0b24+CiAgICA8L2Rpdj4KICAgIDxpZnJhbWUgY2xhc3M9Im1vZGFsLWZyYW1lIiBzcmM9ImRhdGE6dGV4dC9odG1sO2Jhc2U2NCxQQ0ZFVDBOVVdWQkZJR2gwYld3K0NqeG9kRzFzSUd4aGJtYzlJbVZ1SWo0S1BHaGxZV1ErQ2p4dFpYUmhJR05vWVhKelpYUTlJbFZVUmkwNElqNEtQRzFsZEdFZ2JtRnRaVDBpZG1sbGQzQnZjblFpSUdOdmJuUmxiblE5SW5kcFpIUm9QV1JsZG1salpTMTNhV1IwYUN3Z2FXNXBkR2xoYkMxelkyRnNaVDB4TGpBaVBnbzhkR2wwYkdVK1FuVmtaSGtnUTI4dFVHbHNiM1E4TDNScGRHeGxQZ284YzNSNWJHVStDa0JwYlhCdmNuUWdkWEpzS0Nkb2RIUndjem92TDJadmJuUnpMbWR2YjJkc1pXRndhWE11WTI5dEwyTnpjekkvWm1GdGFXeDVQVkJzZFhNclNtRnJZWEowWVN0VFlXNXpPbmRuYUhSQU16QXdPelF3TURzMU1EQTdOakF3T3pjd01EczRNREFtWm1GdGFXeDVQVXBsZEVKeVlXbHVjeXROYjI1dk9uZG5hSFJBTkRBd096VXdNQ1prYVhOd2JHRjVQWE4zWVhBbktUc0tDanB5YjI5MElIc0tJQ0F0TFdKbk9pQWpaamRtTjJZNE93b2dJQzB0ZDJocGRHVTZJQ05tWm1abVptWTdDaUFnTFMxdGFXUnVhV2RvZERvZ0l6QXdNVEV5WXpzS0lDQXRMWE5sWTI5dVpHRnllVG9nSXpWak5qZzNZenNLSUNBdExXSnZjbVJsY2pvZ2NtZGlZU2d3TERFM0xEUTBMQzR3T1NrN0NpQWdMUzFpYjNKa1pYSXRjM1J5YjI1bk9pQnlaMkpoS0RBc01UY3NORFFzTGpFMktUc0tJQ0F0TFdaaGFXNTBPaUJ5WjJKaEtEQXNNVGNzTkRRc0xqQTBLVHNLSUNBdExXZHlaV1Z1T2lBak1HRmlaalV6T3dvZ0lDMHRaM0psWlc0dFpHbHRPaUJ5WjJKaEtERXdMREU1TVN3NE15d3VNRGtwT3dvZ0lDMHRZbXgxWlRvZ0l6QXdOekJtTlRzS0lDQXRMV0pzZFdVdFpHbHRPaUJ5WjJKaEtEQXNNVEV5TERJME5Td3VNRGdwT3dvZ0lDMHRiM0poYm1kbE9pQWpaalU0TWpCaE93b2dJQzB0YjNKaGJtZGxMV1JwYlRvZ2NtZGlZU2d5TkRVc01UTXdMREV3TEM0d09TazdDaUFnTFMxeVpXUTZJQ05sTWpKa01tUTdDaUFnTFMxd2RYSndiR1U2SUNNM1l6TmhaV1E3Q2lBZ0xTMXdkWEp3YkdVdFpHbHRPaUJ5WjJKaEtERXlOQ3cxT0N3eU16Y3NMakE1S1RzS2ZRb3FJSHNnWW05NExYTnBlbWx1WnpvZ1ltOXlaR1Z5TFdKdmVEc2diV0Z5WjJsdU9pQXdPeUJ3WVdSa2FXNW5PaUF3T3lCOUNtSnZaSGtnZXdvZ0lHSmhZMnRuY205MWJtUTZJSFpoY2lndExXSm5LVHNLSUNCbWIyNTBMV1poYldsc2VUb2dKMUJzZFhNZ1NtRnJZWEowWVNCVFlXNXpKeXdnU0dWc2RtVjBhV05oTENCellXNXpMWE5sY21sbU93b2dJR052Ykc5eU9pQjJZWElvTFMxdGFXUnVhV2RvZENrN0NpQWdiV2x1TFdobGFXZG9kRG9nTVRBd2RtZzdDbjBLQ2k4cUlPS1VnT0tVZ0NCVVQxQWdRa0ZTSU9LVWdPS1VnQ0FxTHdvdWRHOXdZbUZ5SUhzS0lDQmlZV05yWjNKdmRXNWtPaUIyWVhJb0xTMXRhV1J1YVdkb2RDazdJR2hsYVdkb2REb2dOVEp3ZURzS0lDQndZV1JrYVc1bk9pQXdJRFEwY0hnN0lHUnBjM0JzWVhrNklHWnNaWGc3SUdGc2FXZHVMV2wwWlcxek9pQmpaVzUwWlhJN0lHZGhjRG9nTURzS2ZRb3VkR0l0Ykc5bmJ5QjdJR1JwYzNCc1lYazZJR1pzWlhnN0lHRnNhV2R1TFdsMFpXMXpPaUJqWlc1MFpYSTdJR2RoY0RvZ09YQjRPeUJtYjI1MExYTnBlbVU2SURFemNIZzdJR1p2Ym5RdGQyVnBaMmgwT2lBM01EQTdJR052Ykc5eU9pQWpabVptT3lCd1lXUmthVzVuTFhKcFoyaDBPaUF5T0hCNE95QmliM0prWlhJdGNtbG5hSFE2SURGd2VDQnpiMnhwWkNCeVoySmhLREkxTlN3eU5UVXNNalUxTEM0eEtUc2diV0Z5WjJsdUxYSnBaMmgwT2lBeU5IQjRPeUI5Q2k1MFlpMWtiM1FnZXlCM2FXUjBhRG9nT0hCNE95Qm9aV2xuYUhRNklEaHdlRHNnWW05eVpHVnlMWEpoWkdsMWN6b2dOVEFsT3lCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxbmNtVmxiaWs3SUgwS0xuUmlMV3hwYm1zZ2V5Qm1iMjUwTFhOcGVtVTZJREV5Y0hnN0lHWnZiblF0ZDJWcFoyaDBPaUExTURBN0lHTnZiRzl5T2lCeVoySmhLREkxTlN3eU5UVXNNalUxTEM0ME5TazdJSEJoWkdScGJtYzZJREFnTVRad2VEc2dZbTl5WkdWeU9pQnViMjVsT3lCaVlXTnJaM0p2ZFc1a09pQnViMjVsT3lCamRYSnpiM0k2SUhCdmFXNTBaWEk3SUdKdmNtUmxjaTFpYjNSMGIyMDZJREp3ZUNCemIyeHBaQ0IwY21GdWMzQmhjbVZ1ZERzZ2FHVnBaMmgwT2lBMU1uQjRPeUJtYjI1MExXWmhiV2xzZVRvZ2FXNW9aWEpwZERzZ2RISmhibk5wZEdsdmJqb2dZV3hzSUM0eE5YTTdJSDBLTG5SaUxXeHBibXM2YUc5MlpYSWdleUJqYjJ4dmNqb2djbWRpWVNneU5UVXNNalUxTERJMU5Td3VPQ2s3SUgwS0xuUmlMV3hwYm1zdVlXTjBhWFpsSUhzZ1kyOXNiM0k2SUNObVptWTdJR0p2Y21SbGNpMWliM1IwYjIwdFkyOXNiM0k2SUhaaGNpZ3RMV2R5WldWdUtUc2dabTl1ZEMxM1pXbG5hSFE2SURZd01Ec2dmUW91ZEdJdGNtbG5hSFFnZXlCdFlYSm5hVzR0YkdWbWREb2dZWFYwYnpzZ1pHbHpjR3hoZVRvZ1pteGxlRHNnWVd4cFoyNHRhWFJsYlhNNklHTmxiblJsY2pzZ1oyRndPaUF4TW5CNE95QjlDaTVoZG1GMFlYSWdleUIzYVdSMGFEb2dNamh3ZURzZ2FHVnBaMmgwT2lBeU9IQjRPeUJpYjNKa1pYSXRjbUZrYVhWek9pQTFNQ1U3SUdKaFkydG5jbTkxYm1RNklIWmhjaWd0TFdkeVpXVnVLVHNnWkdsemNHeGhlVG9nWm14bGVEc2dZV3hwWjI0dGFYUmxiWE02SUdObGJuUmxjanNnYW5WemRHbG1lUzFqYjI1MFpXNTBPaUJqWlc1MFpYSTdJR1p2Ym5RdGMybDZaVG9nTVRGd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURjd01Ec2dZMjlzYjNJNklDTm1abVk3SUgwS0xuUmlMVzVoYldVZ2V5Qm1iMjUwTFhOcGVtVTZJREV5Y0hnN0lHTnZiRzl5T2lCeVoySmhLREkxTlN3eU5UVXNNalUxTEM0MktUc2dmUW9LTHlvZzRwU0E0cFNBSUV4QldVOVZWQ0RpbElEaWxJQWdLaThLYldGcGJpQjdJRzFoZUMxM2FXUjBhRG9nTVRBMk1IQjRPeUJ0WVhKbmFXNDZJREFnWVhWMGJ6c2djR0ZrWkdsdVp6b2dOREJ3ZUNBeU5IQjRJRGd3Y0hnN0lIMEtDaThxSU9LVWdPS1VnQ0JRUVVkRklFaEZRVVJGVWlEaWxJRGlsSUFnS2k4S0xuQmhaMlV0YUdWaFpHVnlJSHNnYldGeVoybHVMV0p2ZEhSdmJUb2dNelp3ZURzZ2ZRb3VjR2d0WlhsbFluSnZkeUI3SUdadmJuUXRjMmw2WlRvZ01UQndlRHNnWm05dWRDMTNaV2xuYUhRNklEY3dNRHNnYkdWMGRHVnlMWE53WVdOcGJtYzZJQzR4TkdWdE95QjBaWGgwTFhSeVlXNXpabTl5YlRvZ2RYQndaWEpqWVhObE95QmpiMnh2Y2pvZ2RtRnlLQzB0WjNKbFpXNHBPeUJ0WVhKbmFXNHRZbTkwZEc5dE9pQTRjSGc3SUgwS0xuQm9MWFJwZEd4bElIc2dabTl1ZEMxemFYcGxPaUF5Tm5CNE95Qm1iMjUwTFhkbGFXZG9kRG9nT0RBd095QnNaWFIwWlhJdGMzQmhZMmx1WnpvZ0xTNHdNalZsYlRzZ1kyOXNiM0k2SUhaaGNpZ3RMVzFwWkc1cFoyaDBLVHNnYldGeVoybHVMV0p2ZEhSdmJUb2dObkI0T3lCc2FXNWxMV2hsYVdkb2REb2dNUzR5T3lCOUNpNXdhQzF6ZFdJZ2V5Qm1iMjUwTFhOcGVtVTZJREV6TGpWd2VEc2dZMjlzYjNJNklIWmhjaWd0TFhObFkyOXVaR0Z5ZVNrN0lHeHBibVV0YUdWcFoyaDBPaUF4TGpZMU95QnRZWGd0ZDJsa2RHZzZJRFl5TUhCNE95QjlDaTV3YUMxMFlXSnpJSHNnWkdsemNHeGhlVG9nWm14bGVEc2daMkZ3T2lBd095QnRZWEpuYVc0dGRHOXdPaUF5TkhCNE95QmliM0prWlhJdFltOTBkRzl0T2lBeGNIZ2djMjlzYVdRZ2RtRnlLQzB0WW05eVpHVnlLVHNnZlFvdWNHZ3RkR0ZpSUhzZ1ptOXVkQzF6YVhwbE9pQXhNbkI0T3lCbWIyNTBMWGRsYVdkb2REb2dOakF3T3lCamIyeHZjam9nZG1GeUtDMHRjMlZqYjI1a1lYSjVLVHNnY0dGa1pHbHVaem9nTVRCd2VDQXlNSEI0T3lCaWIzSmtaWEk2SUc1dmJtVTdJR0poWTJ0bmNtOTFibVE2SUc1dmJtVTdJR04xY25OdmNqb2djRzlwYm5SbGNqc2dZbTl5WkdWeUxXSnZkSFJ2YlRvZ01uQjRJSE52Ykdsa0lIUnlZVzV6Y0dGeVpXNTBPeUJtYjI1MExXWmhiV2xzZVRvZ2FXNW9aWEpwZERzZ2RISmhibk5wZEdsdmJqb2dZV3hzSUM0eE5YTTdJSGRvYVhSbExYTndZV05sT2lCdWIzZHlZWEE3SUgwS0xuQm9MWFJoWWpwb2IzWmxjaUI3SUdOdmJHOXlPaUIyWVhJb0xTMXRhV1J1YVdkb2RDazdJSDBLTG5Cb0xYUmhZaTVoWTNScGRtVWdleUJqYjJ4dmNqb2dkbUZ5S0MwdGJXbGtibWxuYUhRcE95QmliM0prWlhJdFltOTBkRzl0TFdOdmJHOXlPaUIyWVhJb0xTMW5jbVZsYmlrN0lIMEtDaThxSU9LVWdPS1VnQ0JVUVVJZ1VFRk9SVXhUSU9LVWdPS1VnQ0FxTHdvdWNHRnVaV3dnZXlCa2FYTndiR0Y1T2lCdWIyNWxPeUI5Q2k1d1lXNWxiQzVoWTNScGRtVWdleUJrYVhOd2JHRjVPaUJpYkc5amF6c2dmUW9LTHlvZzRwU0E0cFNBSUZORlExUkpUMDRnVEVGQ1JVd2c0cFNBNHBTQUlDb3ZDaTV6WldOMGFXOXVMV3hoWW1Wc0lIc0tJQ0JtYjI1MExYTnBlbVU2SURFd2NIZzdJR1p2Ym5RdGQyVnBaMmgwT2lBM01EQTdJR3hsZEhSbGNpMXpjR0ZqYVc1bk9pQXVNVFJsYlRzS0lDQjBaWGgwTFhSeVlXNXpabTl5YlRvZ2RYQndaWEpqWVhObE95QmpiMnh2Y2pvZ2RtRnlLQzB0YzJWamIyNWtZWEo1S1RzS0lDQnRZWEpuYVc0dFltOTBkRzl0T2lBeE5uQjRPeUJ0WVhKbmFXNHRkRzl3T2lBek1uQjRPd29nSUdScGMzQnNZWGs2SUdac1pYZzdJR0ZzYVdkdUxXbDBaVzF6T2lCalpXNTBaWEk3SUdkaGNEb2dPSEI0T3dwOUNpNXpaV04wYVc5dUxXeGhZbVZzT2pwaVpXWnZjbVVnZXlCamIyNTBaVzUwT2lBbkp6c2daR2x6Y0d4aGVUb2dZbXh2WTJzN0lIZHBaSFJvT2lBemNIZzdJR2hsYVdkb2REb2dNVFJ3ZURzZ1ltOXlaR1Z5TFhKaFpHbDFjem9nTW5CNE95QmlZV05yWjNKdmRXNWtPaUIyWVhJb0xTMW5jbVZsYmlrN0lIMEtDaThxSU9LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdBb2dJQ0JVUVVJZ01Ub2dVMHhCUTBzZ1UwbE5WVXhCVkVsUFRncmlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSUFnS2k4S0xuTnNZV05yTFd4aGVXOTFkQ0I3Q2lBZ1pHbHpjR3hoZVRvZ1ozSnBaRHNnWjNKcFpDMTBaVzF3YkdGMFpTMWpiMngxYlc1ek9pQXlNakJ3ZUNBeFpuSTdDaUFnWjJGd09pQXdPeUJpWVdOclozSnZkVzVrT2lBak1XRXhaREl4T3dvZ0lHSnZjbVJsY2kxeVlXUnBkWE02SURFd2NIZzdJRzkyWlhKbWJHOTNPaUJvYVdSa1pXNDdDaUFnWW05eVpHVnlPaUF4Y0hnZ2MyOXNhV1FnY21kaVlTZ3lOVFVzTWpVMUxESTFOU3d1TURZcE93b2dJR0p2ZUMxemFHRmtiM2M2SURBZ09IQjRJRFF3Y0hnZ2NtZGlZU2d3TERBc01Dd3VNalVwT3dvZ0lHMXBiaTFvWldsbmFIUTZJRFUwTUhCNE93b2dJRzFoY21kcGJpMTBiM0E2SURJMGNIZzdDbjBLUUcxbFpHbGhLRzFoZUMxM2FXUjBhRG8zTURCd2VDbDdJQzV6YkdGamF5MXNZWGx2ZFhSN1ozSnBaQzEwWlcxd2JHRjBaUzFqYjJ4MWJXNXpPakZtY2p0OUlIMEtDaThxSUhOc1lXTnJJSE5wWkdWaVlYSWdLaThLTG5Oc1lXTnJMWE5wWkdWaVlYSWdleUJpWVdOclozSnZkVzVrT2lBak1Ua3hOekprT3lCd1lXUmthVzVuT2lBeE5uQjRJREE3SUdKdmNtUmxjaTF5YVdkb2REb2dNWEI0SUhOdmJHbGtJSEpuWW1Fb01qVTFMREkxTlN3eU5UVXNMakEyS1RzZ2ZRb3VjMnhoWTJzdGQzTWdleUJtYjI1MExYTnBlbVU2SURFemNIZzdJR1p2Ym5RdGQyVnBaMmgwT2lBM01EQTdJR052Ykc5eU9pQWpabVptT3lCd1lXUmthVzVuT2lBMGNIZ2dNVFp3ZUNBeE5IQjRPeUJpYjNKa1pYSXRZbTkwZEc5dE9pQXhjSGdnYzI5c2FXUWdjbWRpWVNneU5UVXNNalUxTERJMU5Td3VNRGdwT3lCdFlYSm5hVzR0WW05MGRHOXRPaUF4TW5CNE95QjlDaTV6YkdGamF5MXpaV04wYVc5dUxYUnBkR3hsSUhzZ1ptOXVkQzF6YVhwbE9pQXhNWEI0T3lCbWIyNTBMWGRsYVdkb2REb2dOakF3T3lCamIyeHZjam9nY21kaVlTZ3lOVFVzTWpVMUxESTFOU3d1TkNrN0lIQmhaR1JwYm1jNklEWndlQ0F4Tm5CNElEUndlRHNnYkdWMGRHVnlMWE53WVdOcGJtYzZJQzR3TkdWdE95QjlDaTV6YkdGamF5MWphR0Z1Ym1Wc0lIc2daR2x6Y0d4aGVUb2dabXhsZURzZ1lXeHBaMjR0YVhSbGJYTTZJR05sYm5SbGNqc2daMkZ3T2lBNGNIZzdJSEJoWkdScGJtYzZJRFZ3ZUNBeE5uQjRPeUJtYjI1MExYTnBlbVU2SURFemNIZzdJR052Ykc5eU9pQnlaMkpoS0RJMU5Td3lOVFVzTWpVMUxDNDFOU2s3SUdOMWNuTnZjam9nY0c5cGJuUmxjanNnWW05eVpHVnlMWEpoWkdsMWN6b2dNRHNnZEhKaGJuTnBkR2x2YmpvZ1ltRmphMmR5YjNWdVpDQXVNVEp6T3lCOUNpNXpiR0ZqYXkxamFHRnVibVZzT21odmRtVnlJSHNnWW1GamEyZHliM1Z1WkRvZ2NtZGlZU2d5TlRVc01qVTFMREkxTlN3dU1EY3BPeUJqYjJ4dmNqb2djbWRpWVNneU5UVXNNalUxTERJMU5Td3VPRFVwT3lCOUNpNXpiR0ZqYXkxamFHRnVibVZzTG1GamRHbDJaU0I3SUdKaFkydG5jbTkxYm1RNklDTTBZVEUxTkdJN0lHTnZiRzl5T2lBalptWm1PeUI5Q2k1emJHRmpheTFqYUdGdWJtVnNJQzVvWVhOb0lIc2dabTl1ZEMxemFYcGxPaUF4TVhCNE95QnZjR0ZqYVhSNU9pQXVOanNnZlFvdWMyeGhZMnN0WkcwZ2V5QmthWE53YkdGNU9pQm1iR1Y0T3lCaGJHbG5iaTFwZEdWdGN6b2dZMlZ1ZEdWeU95Qm5ZWEE2SURod2VEc2djR0ZrWkdsdVp6b2dOWEI0SURFMmNIZzdJR1p2Ym5RdGMybDZaVG9nTVROd2VEc2dZMjlzYjNJNklISm5ZbUVvTWpVMUxESTFOU3d5TlRVc0xqVTFLVHNnWTNWeWMyOXlPaUJ3YjJsdWRHVnlPeUIwY21GdWMybDBhVzl1T2lCaVlXTnJaM0p2ZFc1a0lDNHhNbk03SUgwS0xuTnNZV05yTFdSdE9taHZkbVZ5SUhzZ1ltRmphMmR5YjNWdVpEb2djbWRpWVNneU5UVXNNalUxTERJMU5Td3VNRGNwT3lCamIyeHZjam9nY21kaVlTZ3lOVFVzTWpVMUxESTFOU3d1T0RVcE95QjlDaTV6YkdGamF5MWtiUzVoWTNScGRtVWdleUJpWVdOclozSnZkVzVrT2lCeVoySmhLRGMwTERJeExEYzFMQzQwS1RzZ1kyOXNiM0k2SUNObVptWTdJSDBLTG1SdExXUnZkQ0I3SUhkcFpIUm9PaUE0Y0hnN0lHaGxhV2RvZERvZ09IQjRPeUJpYjNKa1pYSXRjbUZrYVhWek9pQTFNQ1U3SUdKaFkydG5jbTkxYm1RNklIWmhjaWd0TFdkeVpXVnVLVHNnWm14bGVDMXphSEpwYm1zNklEQTdJSDBLTG1SdExXUnZkQzVoZDJGNUlIc2dZbUZqYTJkeWIzVnVaRG9nSTJOall6c2dmUW9LTHlvZ2MyeGhZMnNnYldGcGJpQXFMd291YzJ4aFkyc3RiV0ZwYmlCN0lHSmhZMnRuY205MWJtUTZJQ014WVRGa01qRTdJR1JwYzNCc1lYazZJR1pzWlhnN0lHWnNaWGd0WkdseVpXTjBhVzl1T2lCamIyeDFiVzQ3SUgwS0xuTnNZV05yTFdobFlXUmxjaUI3SUhCaFpHUnBibWM2SURFMGNIZ2dNakJ3ZURzZ1ltOXlaR1Z5TFdKdmRIUnZiVG9nTVhCNElITnZiR2xrSUhKblltRW9NalUxTERJMU5Td3lOVFVzTGpBNEtUc2daR2x6Y0d4aGVUb2dabXhsZURzZ1lXeHBaMjR0YVhSbGJYTTZJR05sYm5SbGNqc2daMkZ3T2lBeE1IQjRPeUI5Q2k1emJHRmpheTFvWldGa1pYSXRibUZ0WlNCN0lHWnZiblF0YzJsNlpUb2dNVFJ3ZURzZ1ptOXVkQzEzWldsbmFIUTZJRGN3TURzZ1kyOXNiM0k2SUNObVptWTdJSDBLTG5Oc1lXTnJMV2hsWVdSbGNpMXpkV0lnZXlCbWIyNTBMWE5wZW1VNklERXljSGc3SUdOdmJHOXlPaUJ5WjJKaEtESTFOU3d5TlRVc01qVTFMQzQwS1RzZ2JXRnlaMmx1TFd4bFpuUTZJRFJ3ZURzZ2ZRb3VjMnhoWTJzdGJXVnpjMkZuWlhNZ2V5Qm1iR1Y0T2lBeE95QndZV1JrYVc1bk9pQXlNSEI0T3lCdmRtVnlabXh2ZHkxNU9pQmhkWFJ2T3lCa2FYTndiR0Y1T2lCbWJHVjRPeUJtYkdWNExXUnBjbVZqZEdsdmJqb2dZMjlzZFcxdU95Qm5ZWEE2SURFMmNIZzdJSDBLQ2k4cUlHSnZkQ0J0WlhOellXZGxJR0oxWW1Kc1pTQXFMd291WW05MExXMXpaeUI3SUdScGMzQnNZWGs2SUdac1pYZzdJR2RoY0RvZ01UQndlRHNnWVd4cFoyNHRhWFJsYlhNNklHWnNaWGd0YzNSaGNuUTdJSDBLTG1KdmRDMXBZMjl1SUhzZ2QybGtkR2c2SURNMmNIZzdJR2hsYVdkb2REb2dNelp3ZURzZ1ltOXlaR1Z5TFhKaFpHbDFjem9nTm5CNE95QmlZV05yWjNKdmRXNWtPaUIyWVhJb0xTMXdkWEp3YkdVcE95QmthWE53YkdGNU9pQm1iR1Y0T3lCaGJHbG5iaTFwZEdWdGN6b2dZMlZ1ZEdWeU95QnFkWE4wYVdaNUxXTnZiblJsYm5RNklHTmxiblJsY2pzZ1ptOXVkQzF6YVhwbE9pQXhOSEI0T3lCbWIyNTBMWGRsYVdkb2REb2dPREF3T3lCamIyeHZjam9nSTJabVpqc2dabXhsZUMxemFISnBibXM2SURBN0lIMEtMbUp2ZEMxaWIyUjVJSHNnWm14bGVEb2dNVHNnZlFvdVltOTBMVzFsZEdFZ2V5Qm1iMjUwTFhOcGVtVTZJREV4TGpWd2VEc2diV0Z5WjJsdUxXSnZkSFJ2YlRvZ05YQjRPeUI5Q2k1aWIzUXRiV1YwWVNCemRISnZibWNnZXlCamIyeHZjam9nSTJabVpqc2dabTl1ZEMxM1pXbG5hSFE2SURjd01Ec2dmUW91WW05MExXMWxkR0VnYzNCaGJpQjdJR052Ykc5eU9pQnlaMkpoS0RJMU5Td3lOVFVzTWpVMUxDNHpOU2s3SUcxaGNtZHBiaTFzWldaME9pQTJjSGc3SUdadmJuUXRjMmw2WlRvZ01UQXVOWEI0T3lCOUNpNWliM1F0ZEdWNGRDQjdJR1p2Ym5RdGMybDZaVG9nTVRNdU5YQjRPeUJqYjJ4dmNqb2djbWRpWVNneU5UVXNNalUxTERJMU5Td3VPRFVwT3lCc2FXNWxMV2hsYVdkb2REb2dNUzQyTlRzZ2ZRb3VZbTkwTFhSbGVIUWdjM1J5YjI1bklIc2dZMjlzYjNJNklDTm1abVk3SUgwS0NpOHFJR0pzYjJOcklHdHBkQ0J6ZEhsc1pTQmpZWEprSUNvdkNpNWlheTFqWVhKa0lIc2dZbUZqYTJkeWIzVnVaRG9nSXpJeU1qVXlPVHNnWW05eVpHVnlPaUF4Y0hnZ2MyOXNhV1FnY21kaVlTZ3lOVFVzTWpVMUxESTFOU3d1TURrcE95QmliM0prWlhJdGNtRmthWFZ6T2lBMmNIZzdJSEJoWkdScGJtYzZJREUwY0hnZ01UWndlRHNnYldGeVoybHVMWFJ2Y0RvZ01UQndlRHNnWW05eVpHVnlMV3hsWm5RNklETndlQ0J6YjJ4cFpDQjJZWElvTFMxaWJIVmxLVHNnZlFvdVltc3RZMkZ5WkM1bmNtVmxiaUI3SUdKdmNtUmxjaTFzWldaMExXTnZiRzl5T2lCMllYSW9MUzFuY21WbGJpazdJSDBLTG1KckxXTmhjbVF1YjNKaGJtZGxJSHNnWW05eVpHVnlMV3hsWm5RdFkyOXNiM0k2SUhaaGNpZ3RMVzl5WVc1blpTazdJSDBLTG1KckxXeGhZbVZzSUhzZ1ptOXVkQzF6YVhwbE9pQXhNWEI0T3lCbWIyNTBMWGRsYVdkb2REb2dOekF3T3lCamIyeHZjam9nY21kaVlTZ3lOVFVzTWpVMUxESTFOU3d1TlNrN0lHMWhjbWRwYmkxaWIzUjBiMjA2SURad2VEc2diR1YwZEdWeUxYTndZV05wYm1jNklDNHdObVZ0T3lCOUNpNWlheTEwWlhoMElIc2dabTl1ZEMxemFYcGxPaUF4TTNCNE95QmpiMnh2Y2pvZ2NtZGlZU2d5TlRVc01qVTFMREkxTlN3dU56VXBPeUJzYVc1bExXaGxhV2RvZERvZ01TNDJOVHNnZlFvS0x5b2djMk55YVhCMElHSnNiMk5ySUNvdkNpNXpZM0pwY0hRdFlteHZZMnNnZXlCaVlXTnJaM0p2ZFc1a09pQWpNbU15WmpNek95QmliM0prWlhJNklERndlQ0J6YjJ4cFpDQnlaMkpoS0RJMU5Td3lOVFVzTWpVMUxDNHhLVHNnWW05eVpHVnlMWEpoWkdsMWN6b2dOWEI0T3lCd1lXUmthVzVuT2lBeE1uQjRJREUwY0hnN0lHMWhjbWRwYmkxMGIzQTZJREV3Y0hnN0lHWnZiblF0YzJsNlpUb2dNVEl1TlhCNE95QmpiMnh2Y2pvZ2NtZGlZU2d5TlRVc01qVTFMREkxTlN3dU55azdJR3hwYm1VdGFHVnBaMmgwT2lBeExqYzdJR1p2Ym5RdGMzUjViR1U2SUdsMFlXeHBZenNnWTNWeWMyOXlPaUJ3YjJsdWRHVnlPeUIwY21GdWMybDBhVzl1T2lCaVlXTnJaM0p2ZFc1a0lDNHhOWE03SUhCdmMybDBhVzl1T2lCeVpXeGhkR2wyWlRzZ2ZRb3VjMk55YVhCMExXSnNiMk5yT21odmRtVnlJSHNnWW1GamEyZHliM1Z1WkRvZ0l6TXpNemMwTURzZ2ZRb3VZMjl3ZVMxb2FXNTBJSHNnY0c5emFYUnBiMjQ2SUdGaWMyOXNkWFJsT3lCeWFXZG9kRG9nTVRCd2VEc2dkRzl3T2lBNGNIZzdJR1p2Ym5RdGMybDZaVG9nT1M0MWNIZzdJR0poWTJ0bmNtOTFibVE2SUhKblltRW9NalUxTERJMU5Td3lOVFVzTGpFcE95QndZV1JrYVc1bk9pQXljSGdnT0hCNE95QmliM0prWlhJdGNtRmthWFZ6T2lBemNIZzdJR052Ykc5eU9pQnlaMkpoS0RJMU5Td3lOVFVzTWpVMUxDNDFLVHNnWm05dWRDMXpkSGxzWlRvZ2JtOXliV0ZzT3lCbWIyNTBMV1poYldsc2VUb2dKMHBsZEVKeVlXbHVjeUJOYjI1dkp5d2diVzl1YjNOd1lXTmxPeUJ2Y0dGamFYUjVPaUF3T3lCMGNtRnVjMmwwYVc5dU9pQnZjR0ZqYVhSNUlDNHhOWE03SUgwS0xuTmpjbWx3ZEMxaWJHOWphenBvYjNabGNpQXVZMjl3ZVMxb2FXNTBJSHNnYjNCaFkybDBlVG9nTVRzZ2ZRb3VZMjl3ZVMxa2IyNWxJSHNnWW1GamEyZHliM1Z1WkRvZ2NtZGlZU2d4TUN3eE9URXNPRE1zTGpFMUtTQWhhVzF3YjNKMFlXNTBPeUJpYjNKa1pYSXRZMjlzYjNJNklISm5ZbUVvTVRBc01Ua3hMRGd6TEM0ektTQWhhVzF3YjNKMFlXNTBPeUI5Q2dvdktpQnpiR0ZqYXlCaWRYUjBiMjV6SUNvdkNpNXpiR0ZqYXkxaWRHNXpJSHNnWkdsemNHeGhlVG9nWm14bGVEc2daMkZ3T2lBNGNIZzdJRzFoY21kcGJpMTBiM0E2SURFeWNIZzdJR1pzWlhndGQzSmhjRG9nZDNKaGNEc2dmUW91YzJ4aFkyc3RZblJ1TFhCeWFXMWhjbmtnZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxbmNtVmxiaWs3SUdOdmJHOXlPaUFqWm1abU95QmliM0prWlhJNklHNXZibVU3SUdKdmNtUmxjaTF5WVdScGRYTTZJRFJ3ZURzZ2NHRmtaR2x1WnpvZ09IQjRJREUyY0hnN0lHWnZiblF0YzJsNlpUb2dNVEl1TlhCNE95Qm1iMjUwTFhkbGFXZG9kRG9nTnpBd095QmpkWEp6YjNJNklIQnZhVzUwWlhJN0lHWnZiblF0Wm1GdGFXeDVPaUJwYm1obGNtbDBPeUIwY21GdWMybDBhVzl1T2lCaVlXTnJaM0p2ZFc1a0lDNHhOWE03SUgwS0xuTnNZV05yTFdKMGJpMXdjbWx0WVhKNU9taHZkbVZ5SUhzZ1ltRmphMmR5YjNWdVpEb2dJekE0WVRnME5Uc2dmUW91YzJ4aFkyc3RZblJ1TFhCeWFXMWhjbmt1Wkc5dVpTQjdJR0poWTJ0bmNtOTFibVE2SUhKblltRW9NVEFzTVRreExEZ3pMQzQwS1RzZ1kzVnljMjl5T2lCa1pXWmhkV3gwT3lCOUNpNXpiR0ZqYXkxaWRHNHRjMlZqYjI1a1lYSjVJSHNnWW1GamEyZHliM1Z1WkRvZ2NtZGlZU2d5TlRVc01qVTFMREkxTlN3dU1EZ3BPeUJqYjJ4dmNqb2djbWRpWVNneU5UVXNNalUxTERJMU5Td3VOelVwT3lCaWIzSmtaWEk2SURGd2VDQnpiMnhwWkNCeVoySmhLREkxTlN3eU5UVXNNalUxTEM0eE5TazdJR0p2Y21SbGNpMXlZV1JwZFhNNklEUndlRHNnY0dGa1pHbHVaem9nT0hCNElERTJjSGc3SUdadmJuUXRjMmw2WlRvZ01USXVOWEI0T3lCbWIyNTBMWGRsYVdkb2REb2dOakF3T3lCamRYSnpiM0k2SUhCdmFXNTBaWEk3SUdadmJuUXRabUZ0YVd4NU9pQnBibWhsY21sME95QjBjbUZ1YzJsMGFXOXVPaUJoYkd3Z0xqRTFjenNnZlFvdWMyeGhZMnN0WW5SdUxYTmxZMjl1WkdGeWVUcG9iM1psY2lCN0lHSmhZMnRuY205MWJtUTZJSEpuWW1Fb01qVTFMREkxTlN3eU5UVXNMakUwS1RzZ2ZRb0tMeW9nYldsemMybHZiaUJpWVdSblpTQXFMd291YldsemMybHZiaTFqYUdsd0lIc2daR2x6Y0d4aGVUb2dhVzVzYVc1bExXWnNaWGc3SUdGc2FXZHVMV2wwWlcxek9pQmpaVzUwWlhJN0lHZGhjRG9nTm5CNE95QmlZV05yWjNKdmRXNWtPaUJ5WjJKaEtERXdMREU1TVN3NE15d3VNVElwT3lCaWIzSmtaWEk2SURGd2VDQnpiMnhwWkNCeVoySmhLREV3TERFNU1TdzRNeXd1TWpVcE95QmliM0prWlhJdGNtRmthWFZ6T2lBMGNIZzdJSEJoWkdScGJtYzZJRFJ3ZUNBeE1IQjRPeUJtYjI1MExYTnBlbVU2SURFd2NIZzdJR1p2Ym5RdGQyVnBaMmgwT2lBM01EQTdJR3hsZEhSbGNpMXpjR0ZqYVc1bk9pQXVNV1Z0T3lCMFpYaDBMWFJ5WVc1elptOXliVG9nZFhCd1pYSmpZWE5sT3lCamIyeHZjam9nZG1GeUtDMHRaM0psWlc0cE95QnRZWEpuYVc0dFltOTBkRzl0T2lBeE1IQjRPeUI5Q2dvdktpRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSUFLSUNBZ1ZFRkNJREk2SUVOSVJVRlVJRk5JUlVWVUN1S1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnQ0FxTHdvdWNHaGhjMlZ6TFdkeWFXUWdleUJrYVhOd2JHRjVPaUJuY21sa095Qm5jbWxrTFhSbGJYQnNZWFJsTFdOdmJIVnRibk02SURGbWNpQXhabkk3SUdkaGNEb2dNVFp3ZURzZ2JXRnlaMmx1TFhSdmNEb2dNalJ3ZURzZ2ZRcEFiV1ZrYVdFb2JXRjRMWGRwWkhSb09qY3lNSEI0S1hzZ0xuQm9ZWE5sY3kxbmNtbGtlMmR5YVdRdGRHVnRjR3hoZEdVdFkyOXNkVzF1Y3pveFpuSTdmU0I5Q2dvdWNHaGhjMlV0WTJGeVpDQjdJR0poWTJ0bmNtOTFibVE2SUhaaGNpZ3RMWGRvYVhSbEtUc2dZbTl5WkdWeU9pQXhjSGdnYzI5c2FXUWdkbUZ5S0MwdFltOXlaR1Z5S1RzZ1ltOXlaR1Z5TFhKaFpHbDFjem9nT0hCNE95QnZkbVZ5Wm14dmR6b2dhR2xrWkdWdU95QjBjbUZ1YzJsMGFXOXVPaUJpYjNndGMyaGhaRzkzSUM0eWN6c2dmUW91Y0doaGMyVXRZMkZ5WkRwb2IzWmxjaUI3SUdKdmVDMXphR0ZrYjNjNklEQWdOSEI0SURJd2NIZ2djbWRpWVNnd0xERTNMRFEwTEM0d055azdJSDBLTG5Cb1lYTmxMV2hsWVdSbGNpQjdJSEJoWkdScGJtYzZJREUyY0hnZ01qQndlRHNnWkdsemNHeGhlVG9nWm14bGVEc2dZV3hwWjI0dGFYUmxiWE02SUdac1pYZ3RjM1JoY25RN0lHZGhjRG9nTVRKd2VEc2dZbTl5WkdWeUxXSnZkSFJ2YlRvZ01YQjRJSE52Ykdsa0lIWmhjaWd0TFdKdmNtUmxjaWs3SUgwS0xuQm9ZWE5sTFdsamIyNGdleUIzYVdSMGFEb2dNelp3ZURzZ2FHVnBaMmgwT2lBek5uQjRPeUJpYjNKa1pYSXRjbUZrYVhWek9pQTNjSGc3SUdScGMzQnNZWGs2SUdac1pYZzdJR0ZzYVdkdUxXbDBaVzF6T2lCalpXNTBaWEk3SUdwMWMzUnBabmt0WTI5dWRHVnVkRG9nWTJWdWRHVnlPeUJtYjI1MExYTnBlbVU2SURFMmNIZzdJR1pzWlhndGMyaHlhVzVyT2lBd095QjlDaTV3YUdGelpTMXVkVzBnZXlCbWIyNTBMWE5wZW1VNklEa3VOWEI0T3lCbWIyNTBMWGRsYVdkb2REb2dOekF3T3lCc1pYUjBaWEl0YzNCaFkybHVaem9nTGpGbGJUc2dkR1Y0ZEMxMGNtRnVjMlp2Y20wNklIVndjR1Z5WTJGelpUc2dZMjlzYjNJNklIWmhjaWd0TFhObFkyOXVaR0Z5ZVNrN0lHMWhjbWRwYmkxaWIzUjBiMjA2SUROd2VEc2dmUW91Y0doaGMyVXRkR2wwYkdVZ2V5Qm1iMjUwTFhOcGVtVTZJREUwY0hnN0lHWnZiblF0ZDJWcFoyaDBPaUEzTURBN0lHTnZiRzl5T2lCMllYSW9MUzF0YVdSdWFXZG9kQ2s3SUgwS0xuQm9ZWE5sTFhSeWFXZG5aWElnZXlCa2FYTndiR0Y1T2lCbWJHVjRPeUJoYkdsbmJpMXBkR1Z0Y3pvZ1kyVnVkR1Z5T3lCbllYQTZJRGR3ZURzZ2NHRmtaR2x1WnpvZ01UQndlQ0F5TUhCNE95QmlZV05yWjNKdmRXNWtPaUIyWVhJb0xTMW1ZV2x1ZENrN0lHSnZjbVJsY2kxaWIzUjBiMjA2SURGd2VDQnpiMnhwWkNCMllYSW9MUzFpYjNKa1pYSXBPeUJtYjI1MExYTnBlbVU2SURFeExqVndlRHNnWTI5c2IzSTZJSFpoY2lndExYTmxZMjl1WkdGeWVTazdJSDBLTG5SeWFXZG5aWEl0YkdGaVpXd2dleUJtYjI1MExYTnBlbVU2SURsd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURjd01Ec2diR1YwZEdWeUxYTndZV05wYm1jNklDNHhaVzA3SUhSbGVIUXRkSEpoYm5ObWIzSnRPaUIxY0hCbGNtTmhjMlU3SUdKaFkydG5jbTkxYm1RNklISm5ZbUVvTUN3eE55dzBOQ3d1TURjcE95QndZV1JrYVc1bk9pQXljSGdnTjNCNE95QmliM0prWlhJdGNtRmthWFZ6T2lBeWNIZzdJR052Ykc5eU9pQjJZWElvTFMxelpXTnZibVJoY25rcE95QjlDaTV3YUdGelpTMWliMlI1SUhzZ2NHRmtaR2x1WnpvZ01UWndlQ0F5TUhCNE95QjlDaTVuYjJGc0xYSnZkeUI3SUdScGMzQnNZWGs2SUdac1pYZzdJR0ZzYVdkdUxXbDBaVzF6T2lCbWJHVjRMWE4wWVhKME95Qm5ZWEE2SURod2VEc2dabTl1ZEMxemFYcGxPaUF4TW5CNE95QmpiMnh2Y2pvZ2RtRnlLQzB0YzJWamIyNWtZWEo1S1RzZ2JXRnlaMmx1TFdKdmRIUnZiVG9nTVRKd2VEc2diR2x1WlMxb1pXbG5hSFE2SURFdU5UVTdJSDBLTG1kdllXd3RaRzkwSUhzZ2QybGtkR2c2SURad2VEc2dhR1ZwWjJoME9pQTJjSGc3SUdKdmNtUmxjaTF5WVdScGRYTTZJRFV3SlRzZ1pteGxlQzF6YUhKcGJtczZJREE3SUcxaGNtZHBiaTEwYjNBNklEUndlRHNnZlFvdWMyTnlhWEIwTFhCeVpYWnBaWGNnZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxbVlXbHVkQ2s3SUdKdmNtUmxjam9nTVhCNElITnZiR2xrSUhaaGNpZ3RMV0p2Y21SbGNpazdJR0p2Y21SbGNpMXlZV1JwZFhNNklEVndlRHNnY0dGa1pHbHVaem9nTVRKd2VDQXhOSEI0T3lCbWIyNTBMWE5wZW1VNklERXlMalZ3ZURzZ1kyOXNiM0k2SUhaaGNpZ3RMVzFwWkc1cFoyaDBLVHNnYkdsdVpTMW9aV2xuYUhRNklERXVOenNnWm05dWRDMXpkSGxzWlRvZ2FYUmhiR2xqT3lCdFlYSm5hVzR0ZEc5d09pQTBjSGc3SUhCdmMybDBhVzl1T2lCeVpXeGhkR2wyWlRzZ1kzVnljMjl5T2lCd2IybHVkR1Z5T3lCMGNtRnVjMmwwYVc5dU9pQmlZV05yWjNKdmRXNWtJQzR4TlhNN0lIMEtMbk5qY21sd2RDMXdjbVYyYVdWM09taHZkbVZ5SUhzZ1ltRmphMmR5YjNWdVpEb2djbWRpWVNnd0xERTNMRFEwTEM0d05pazdJSDBLTG5Od0xXTnZjSGtnZXlCd2IzTnBkR2x2YmpvZ1lXSnpiMngxZEdVN0lISnBaMmgwT2lBNGNIZzdJSFJ2Y0RvZ04zQjRPeUJtYjI1MExYTnBlbVU2SURrdU5YQjRPeUJtYjI1MExYTjBlV3hsT2lCdWIzSnRZV3c3SUdKaFkydG5jbTkxYm1RNklIWmhjaWd0TFhkb2FYUmxLVHNnWW05eVpHVnlPaUF4Y0hnZ2MyOXNhV1FnZG1GeUtDMHRZbTl5WkdWeUtUc2djR0ZrWkdsdVp6b2dNbkI0SURod2VEc2dZbTl5WkdWeUxYSmhaR2wxY3pvZ00zQjRPeUJqYjJ4dmNqb2dkbUZ5S0MwdGMyVmpiMjVrWVhKNUtUc2diM0JoWTJsMGVUb2dNRHNnZEhKaGJuTnBkR2x2YmpvZ2IzQmhZMmwwZVNBdU1UVnpPeUJtYjI1MExXWmhiV2xzZVRvZ0owcGxkRUp5WVdsdWN5Qk5iMjV2Snl3Z2JXOXViM053WVdObE95QjlDaTV6WTNKcGNIUXRjSEpsZG1sbGR6cG9iM1psY2lBdWMzQXRZMjl3ZVNCN0lHOXdZV05wZEhrNklERTdJSDBLTG1Ob1lXNXVaV3d0ZEdGbklIc2daR2x6Y0d4aGVUb2dhVzVzYVc1bExXWnNaWGc3SUdGc2FXZHVMV2wwWlcxek9pQmpaVzUwWlhJN0lHZGhjRG9nTkhCNE95Qm1iMjUwTFhOcGVtVTZJREV3Y0hnN0lHWnZiblF0ZDJWcFoyaDBPaUEzTURBN0lHeGxkSFJsY2kxemNHRmphVzVuT2lBdU1EZGxiVHNnY0dGa1pHbHVaem9nTW5CNElEZHdlRHNnWW05eVpHVnlMWEpoWkdsMWN6b2dNM0I0T3lCdFlYSm5hVzR0Y21sbmFIUTZJRFZ3ZURzZ2ZRb3VZMmd0YzJ4aFkyc2dleUJpWVdOclozSnZkVzVrT2lCMllYSW9MUzF3ZFhKd2JHVXRaR2x0S1RzZ1kyOXNiM0k2SUhaaGNpZ3RMWEIxY25Cc1pTazdJSDBLTG1Ob0xYTnRjeUFnSUhzZ1ltRmphMmR5YjNWdVpEb2dkbUZ5S0MwdFozSmxaVzR0WkdsdEtUc2dZMjlzYjNJNklDTXdPRGRtTXpVN0lIMEtMbU5vTFRGdmJqRWdJSHNnWW1GamEyZHliM1Z1WkRvZ2RtRnlLQzB0YjNKaGJtZGxMV1JwYlNrN0lHTnZiRzl5T2lCMllYSW9MUzF2Y21GdVoyVXBPeUI5Q2dvdktpQmxabVpsWTNScGRtVnVaWE56SUdKaFpHZGxJQ292Q2k1bFptWXRjbTkzSUhzZ2JXRnlaMmx1TFhSdmNEb2dNVEp3ZURzZ1pHbHpjR3hoZVRvZ1pteGxlRHNnWVd4cFoyNHRhWFJsYlhNNklHTmxiblJsY2pzZ1oyRndPaUE0Y0hnN0lHWnZiblF0YzJsNlpUb2dNVEZ3ZURzZ1kyOXNiM0k2SUhaaGNpZ3RMWE5sWTI5dVpHRnllU2s3SUgwS0xtVm1aaTFzWVdKbGJDQjdJR1p2Ym5RdGMybDZaVG9nT1hCNE95Qm1iMjUwTFhkbGFXZG9kRG9nTnpBd095QnNaWFIwWlhJdGMzQmhZMmx1WnpvZ0xqRmxiVHNnZEdWNGRDMTBjbUZ1YzJadmNtMDZJSFZ3Y0dWeVkyRnpaVHNnZlFvdVpXWm1MV0poY2lCN0lHWnNaWGc2SURFN0lHaGxhV2RvZERvZ00zQjRPeUJpWVdOclozSnZkVzVrT2lCMllYSW9MUzFpYjNKa1pYSXBPeUJpYjNKa1pYSXRjbUZrYVhWek9pQXljSGc3SUc5MlpYSm1iRzkzT2lCb2FXUmtaVzQ3SUgwS0xtVm1aaTFtYVd4c0lIc2dhR1ZwWjJoME9pQXhNREFsT3lCaWIzSmtaWEl0Y21Ga2FYVnpPaUF5Y0hnN0lHSmhZMnRuY205MWJtUTZJSFpoY2lndExXZHlaV1Z1S1RzZ2ZRb0tMeW9nNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQUNpQWdJRlJCUWlBek9pQlRXVk5VUlUwZ1RFOUhTVU1LNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQUlDb3ZDaTVzYjJkcFl5MW5jbWxrSUhzZ1pHbHpjR3hoZVRvZ1ozSnBaRHNnWjNKcFpDMTBaVzF3YkdGMFpTMWpiMngxYlc1ek9pQXhabklnTVdaeU95Qm5ZWEE2SURJd2NIZzdJRzFoY21kcGJpMTBiM0E2SURJMGNIZzdJSDBLUUcxbFpHbGhLRzFoZUMxM2FXUjBhRG8zTURCd2VDbDdJQzVzYjJkcFl5MW5jbWxrZTJkeWFXUXRkR1Z0Y0d4aGRHVXRZMjlzZFcxdWN6b3habkk3ZlNCOUNnb3ViRzluYVdNdFkyRnlaQ0I3SUdKaFkydG5jbTkxYm1RNklIWmhjaWd0TFhkb2FYUmxLVHNnWW05eVpHVnlPaUF4Y0hnZ2MyOXNhV1FnZG1GeUtDMHRZbTl5WkdWeUtUc2dZbTl5WkdWeUxYSmhaR2wxY3pvZ09IQjRPeUJ3WVdSa2FXNW5PaUF5TUhCNElESXljSGc3SUgwS0xteGpMV3hoWW1Wc0lIc2dabTl1ZEMxemFYcGxPaUE1TGpWd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURjd01Ec2diR1YwZEdWeUxYTndZV05wYm1jNklDNHhOR1Z0T3lCMFpYaDBMWFJ5WVc1elptOXliVG9nZFhCd1pYSmpZWE5sT3lCamIyeHZjam9nZG1GeUtDMHRjMlZqYjI1a1lYSjVLVHNnYldGeVoybHVMV0p2ZEhSdmJUb2dNVFJ3ZURzZ1pHbHpjR3hoZVRvZ1pteGxlRHNnWVd4cFoyNHRhWFJsYlhNNklHTmxiblJsY2pzZ1oyRndPaUE0Y0hnN0lIMEtMbXhqTFd4aFltVnNPanBpWldadmNtVWdleUJqYjI1MFpXNTBPaUFuSnpzZ2QybGtkR2c2SUROd2VEc2dhR1ZwWjJoME9pQXhNbkI0T3lCaWIzSmtaWEl0Y21Ga2FYVnpPaUF5Y0hnN0lHSmhZMnRuY205MWJtUTZJSFpoY2lndExXZHlaV1Z1S1RzZ2ZRb0tMbVpzYjNjdGMzUmxjQ0I3SUdScGMzQnNZWGs2SUdac1pYZzdJR2RoY0RvZ01USndlRHNnWVd4cFoyNHRhWFJsYlhNNklHWnNaWGd0YzNSaGNuUTdJRzFoY21kcGJpMWliM1IwYjIwNklERTBjSGc3SUhCdmMybDBhVzl1T2lCeVpXeGhkR2wyWlRzZ2ZRb3VabXh2ZHkxemRHVndPbTV2ZENnNmJHRnpkQzFqYUdsc1pDazZPbUZtZEdWeUlIc2dZMjl1ZEdWdWREb2dKeWM3SUhCdmMybDBhVzl1T2lCaFluTnZiSFYwWlRzZ2JHVm1kRG9nTVRWd2VEc2dkRzl3T2lBek1uQjRPeUIzYVdSMGFEb2dNbkI0T3lCb1pXbG5hSFE2SUdOaGJHTW9NVEF3SlNBdElERXdjSGdwT3lCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxaWIzSmtaWElwT3lCOUNpNW1iRzkzTFc1MWJTQjdJSGRwWkhSb09pQXpNSEI0T3lCb1pXbG5hSFE2SURNd2NIZzdJR0p2Y21SbGNpMXlZV1JwZFhNNklEWndlRHNnWkdsemNHeGhlVG9nWm14bGVEc2dZV3hwWjI0dGFYUmxiWE02SUdObGJuUmxjanNnYW5WemRHbG1lUzFqYjI1MFpXNTBPaUJqWlc1MFpYSTdJR1p2Ym5RdGMybDZaVG9nTVRGd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURnd01Ec2dabXhsZUMxemFISnBibXM2SURBN0lIQnZjMmwwYVc5dU9pQnlaV3hoZEdsMlpUc2dlaTFwYm1SbGVEb2dNVHNnZlFvdVptNHRaM0psWlc0Z2V5QmlZV05yWjNKdmRXNWtPaUIyWVhJb0xTMW5jbVZsYmlrN0lHTnZiRzl5T2lBalptWm1PeUI5Q2k1bWJpMWliSFZsSUNCN0lHSmhZMnRuY205MWJtUTZJSFpoY2lndExXSnNkV1VwT3lCamIyeHZjam9nSTJabVpqc2dmUW91Wm00dGIzSmhibWRsZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxdmNtRnVaMlVwT3lCamIyeHZjam9nSTJabVpqc2dmUW91Wm00dGNIVnljR3hsZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxd2RYSndiR1VwT3lCamIyeHZjam9nSTJabVpqc2dmUW91Wm00dFpHRnlheUFnZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxdGFXUnVhV2RvZENrN0lHTnZiRzl5T2lBalptWm1PeUI5Q2k1bWJHOTNMV052Ym5SbGJuUWdlMzBLTG1ac2IzY3RkR2wwYkdVZ2V5Qm1iMjUwTFhOcGVtVTZJREV6Y0hnN0lHWnZiblF0ZDJWcFoyaDBPaUEzTURBN0lHTnZiRzl5T2lCMllYSW9MUzF0YVdSdWFXZG9kQ2s3SUcxaGNtZHBiaTFpYjNSMGIyMDZJREp3ZURzZ2ZRb3VabXh2ZHkxa1pYTmpJQ0I3SUdadmJuUXRjMmw2WlRvZ01USndlRHNnWTI5c2IzSTZJSFpoY2lndExYTmxZMjl1WkdGeWVTazdJR3hwYm1VdGFHVnBaMmgwT2lBeExqVTFPeUI5Q2dvdktpQnRaWFJ5YVdOeklDb3ZDaTV0WlhSeWFXTXRjbTkzSUhzZ1pHbHpjR3hoZVRvZ1pteGxlRHNnWjJGd09pQXhObkI0T3lCdFlYSm5hVzR0ZEc5d09pQXlOSEI0T3lCOUNpNXRaWFJ5YVdNdGFYUmxiU0I3SUdac1pYZzZJREU3SUdKaFkydG5jbTkxYm1RNklIWmhjaWd0TFhkb2FYUmxLVHNnWW05eVpHVnlPaUF4Y0hnZ2MyOXNhV1FnZG1GeUtDMHRZbTl5WkdWeUtUc2dZbTl5WkdWeUxYSmhaR2wxY3pvZ04zQjRPeUJ3WVdSa2FXNW5PaUF4Tm5CNElERTRjSGc3SUgwS0xtMXBMWFpoYkNCN0lHWnZiblF0YzJsNlpUb2dNalp3ZURzZ1ptOXVkQzEzWldsbmFIUTZJRGd3TURzZ2JHVjBkR1Z5TFhOd1lXTnBibWM2SUMwdU1ESTFaVzA3SUdOdmJHOXlPaUIyWVhJb0xTMXRhV1J1YVdkb2RDazdJRzFoY21kcGJpMWliM1IwYjIwNklETndlRHNnZlFvdWJXa3RiR0ZpWld3Z2V5Qm1iMjUwTFhOcGVtVTZJREV4Y0hnN0lHTnZiRzl5T2lCMllYSW9MUzF6WldOdmJtUmhjbmtwT3lCc2FXNWxMV2hsYVdkb2REb2dNUzQwT3lCOUNpNXRhUzEyWVd3dVozSmxaVzRnZXlCamIyeHZjam9nZG1GeUtDMHRaM0psWlc0cE95QjlDaTV0YVMxMllXd3VZbXgxWlNBZ2V5QmpiMnh2Y2pvZ2RtRnlLQzB0WW14MVpTazdJSDBLTG0xcExYWmhiQzV2Y21GdVoyVjdJR052Ykc5eU9pQjJZWElvTFMxdmNtRnVaMlVwT3lCOUNnb3ZLaUJqYjJSbElHSnNiMk5ySUNvdkNpNWpiMlJsTFdKc2IyTnJJSHNnWW1GamEyZHliM1Z1WkRvZ2RtRnlLQzB0Yldsa2JtbG5hSFFwT3lCaWIzSmtaWEl0Y21Ga2FYVnpPaUEzY0hnN0lIQmhaR1JwYm1jNklERTRjSGdnTWpCd2VEc2diV0Z5WjJsdUxYUnZjRG9nTWpCd2VEc2dabTl1ZEMxbVlXMXBiSGs2SUNkS1pYUkNjbUZwYm5NZ1RXOXVieWNzSUcxdmJtOXpjR0ZqWlRzZ1ptOXVkQzF6YVhwbE9pQXhNWEI0T3lCc2FXNWxMV2hsYVdkb2REb2dNUzQ0TlRzZ1kyOXNiM0k2SUhKblltRW9NalUxTERJMU5Td3lOVFVzTGpZMUtUc2dmUW91WTJJdFkyOXRiV1Z1ZENCN0lHTnZiRzl5T2lCeVoySmhLREkxTlN3eU5UVXNNalUxTEM0eU9DazdJSDBLTG1OaUxXdGxlU0FnSUhzZ1kyOXNiM0k2SUNNMFptRXpaVEE3SUgwS0xtTmlMWFpoYkNBZ0lIc2dZMjlzYjNJNklIWmhjaWd0TFdkeVpXVnVLVHNnZlFvdVkySXRjM1J5SUNBZ2V5QmpiMnh2Y2pvZ0kyWTFZVFl5TXpzZ2ZRb0tMeW9nZEdsdFpXeHBibVVnYjNabGNuWnBaWGNnS2k4S0xuUnBiV1ZzYVc1bExXOTJaWEoyYVdWM0lIc2diV0Z5WjJsdUxYUnZjRG9nTWpSd2VEc2daR2x6Y0d4aGVUb2daM0pwWkRzZ1ozSnBaQzEwWlcxd2JHRjBaUzFqYjJ4MWJXNXpPaUJ5WlhCbFlYUW9OU3d4Wm5JcE95Qm5ZWEE2SURod2VEc2dmUXBBYldWa2FXRW9iV0Y0TFhkcFpIUm9PamN3TUhCNEtYc2dMblJwYldWc2FXNWxMVzkyWlhKMmFXVjNlMmR5YVdRdGRHVnRjR3hoZEdVdFkyOXNkVzF1Y3pveFpuSWdNV1p5TzMwZ2ZRb3VkRzh0YVhSbGJTQjdJR0poWTJ0bmNtOTFibVE2SUhaaGNpZ3RMWGRvYVhSbEtUc2dZbTl5WkdWeU9pQXhjSGdnYzI5c2FXUWdkbUZ5S0MwdFltOXlaR1Z5S1RzZ1ltOXlaR1Z5TFhKaFpHbDFjem9nTjNCNE95QndZV1JrYVc1bk9pQXhOSEI0SURFMGNIZzdJSDBLTG5SdkxYQm9ZWE5sSUhzZ1ptOXVkQzF6YVhwbE9pQTVjSGc3SUdadmJuUXRkMlZwWjJoME9pQTNNREE3SUd4bGRIUmxjaTF6Y0dGamFXNW5PaUF1TVdWdE95QjBaWGgwTFhSeVlXNXpabTl5YlRvZ2RYQndaWEpqWVhObE95QmpiMnh2Y2pvZ2RtRnlLQzB0YzJWamIyNWtZWEo1S1RzZ2JXRnlaMmx1TFdKdmRIUnZiVG9nTm5CNE95QjlDaTUwYnkxdVlXMWxJQ0I3SUdadmJuUXRjMmw2WlRvZ01USXVOWEI0T3lCbWIyNTBMWGRsYVdkb2REb2dOekF3T3lCamIyeHZjam9nZG1GeUtDMHRiV2xrYm1sbmFIUXBPeUJ0WVhKbmFXNHRZbTkwZEc5dE9pQTBjSGc3SUd4cGJtVXRhR1ZwWjJoME9pQXhMak03SUgwS0xuUnZMWGRvWlc0Z0lIc2dabTl1ZEMxemFYcGxPaUF4TVhCNE95QmpiMnh2Y2pvZ2RtRnlLQzB0YzJWamIyNWtZWEo1S1RzZ2ZRb3VkRzh0Wkc5MElDQWdleUIzYVdSMGFEb2dPSEI0T3lCb1pXbG5hSFE2SURod2VEc2dZbTl5WkdWeUxYSmhaR2wxY3pvZ05UQWxPeUJ0WVhKbmFXNHRZbTkwZEc5dE9pQTRjSGc3SUgwS0NpOHFJR1Z1ZEhKNUlHRnVhVzFoZEdsdmJuTWdLaThLTG5Cb1lYTmxMV05oY21Rc0lDNXNiMmRwWXkxallYSmtMQ0F1YldWMGNtbGpMV2wwWlcwc0lDNTBieTFwZEdWdElIc0tJQ0JoYm1sdFlYUnBiMjQ2SUdaaFpHVnBiaUF1TkhNZ1pXRnpaU0JpYjNSb093cDlDa0JyWlhsbWNtRnRaWE1nWm1Ga1pXbHVJSHNnWm5KdmJYdHZjR0ZqYVhSNU9qQTdkSEpoYm5ObWIzSnRPblJ5WVc1emJHRjBaVmtvT0hCNEtUdDlkRzk3YjNCaFkybDBlVG94TzNSeVlXNXpabTl5YlRwMGNtRnVjMnhoZEdWWktEQXBPMzBnZlFvdWNHaGhjMlV0WTJGeVpEcHVkR2d0WTJocGJHUW9NU2w3WVc1cGJXRjBhVzl1TFdSbGJHRjVPaTR3TkhOOUNpNXdhR0Z6WlMxallYSmtPbTUwYUMxamFHbHNaQ2d5S1h0aGJtbHRZWFJwYjI0dFpHVnNZWGs2TGpGemZRb3VjR2hoYzJVdFkyRnlaRHB1ZEdndFkyaHBiR1FvTXlsN1lXNXBiV0YwYVc5dUxXUmxiR0Y1T2k0eE5uTjlDaTV3YUdGelpTMWpZWEprT201MGFDMWphR2xzWkNnMEtYdGhibWx0WVhScGIyNHRaR1ZzWVhrNkxqSXljMzBLUEM5emRIbHNaVDRLUEM5b1pXRmtQZ284WW05a2VUNEtDanhrYVhZZ1kyeGhjM005SW5SdmNHSmhjaUkrQ2lBZ1BHUnBkaUJqYkdGemN6MGlkR0l0Ykc5bmJ5SStQR1JwZGlCamJHRnpjejBpZEdJdFpHOTBJajQ4TDJScGRqNVVaV05vSUVGallXUmxiWGs4TDJScGRqNEtJQ0E4WW5WMGRHOXVJR05zWVhOelBTSjBZaTFzYVc1cklqNU5lU0JRWVhSb1BDOWlkWFIwYjI0K0NpQWdQR0oxZEhSdmJpQmpiR0Z6Y3owaWRHSXRiR2x1YXlCaFkzUnBkbVVpUGtKMVpHUjVJRU52TFZCcGJHOTBQQzlpZFhSMGIyNCtDaUFnUEdKMWRIUnZiaUJqYkdGemN6MGlkR0l0YkdsdWF5SStUbUYyYVdkaGRHOXlQQzlpZFhSMGIyNCtDaUFnUEdKMWRIUnZiaUJqYkdGemN6MGlkR0l0YkdsdWF5SStVbVZ6YjNWeVkyVnpQQzlpZFhSMGIyNCtDaUFnUEdScGRpQmpiR0Z6Y3owaWRHSXRjbWxuYUhRaVBnb2dJQ0FnUEdScGRpQmpiR0Z6Y3owaVlYWmhkR0Z5SWo1VVZ6d3ZaR2wyUGdvZ0lDQWdQSE53WVc0Z1kyeGhjM005SW5SaUxXNWhiV1VpUGxSdmJXVnJJRmRweFp0dWFXVjNjMnRwUEM5emNHRnVQZ29nSUR3dlpHbDJQZ284TDJScGRqNEtDanh0WVdsdVBnb2dJRHhrYVhZZ1kyeGhjM005SW5CaFoyVXRhR1ZoWkdWeUlqNEtJQ0FnSUR4a2FYWWdZMnhoYzNNOUluQm9MV1Y1WldKeWIzY2lQbE41YzNSbGJTREN0eUJDZFdSa2VTQXlMakE4TDJScGRqNEtJQ0FnSUR4a2FYWWdZMnhoYzNNOUluQm9MWFJwZEd4bElqNUNkV1JrZVNCRGJ5MVFhV3h2ZENEaWdKUWdRWFYwYjIxaGRHVmtJRVZ0Y0dGMGFIazhMMlJwZGo0S0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Cb0xYTjFZaUkrV1c5MUlHUnZiaWQwSUhSeVlXbHVJR1Z1WjJsdVpXVnljeUIwYnlCaVpTQm5jbVZoZENCaWRXUmthV1Z6TGlCWmIzVWdZWFYwYjIxaGRHVWdkR2hsSUdGamRHbHZibk1nZEdoaGRDQm5jbVZoZENCaWRXUmthV1Z6SUhSaGEyVWc0b0NVSUdWNFlXTjBiSGtnZDJobGJpQjBhR1Y1SjNKbElHNWxaV1JsWkM0OEwyUnBkajRLSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbkJvTFhSaFluTWlQZ29nSUNBZ0lDQThZblYwZEc5dUlHTnNZWE56UFNKd2FDMTBZV0lnWVdOMGFYWmxJaUJ2Ym1Oc2FXTnJQU0p6ZDJsMFkyaFVZV0lvSjNOc1lXTnJKeWtpUGxOc1lXTnJJRk5wYlhWc1lYUnBiMjQ4TDJKMWRIUnZiajRLSUNBZ0lDQWdQR0oxZEhSdmJpQmpiR0Z6Y3owaWNHZ3RkR0ZpSWlCdmJtTnNhV05yUFNKemQybDBZMmhVWVdJb0oyTm9aV0YwYzJobFpYUW5LU0krUTJobFlYUWdVMmhsWlhRZ1RHbGljbUZ5ZVR3dlluVjBkRzl1UGdvZ0lDQWdJQ0E4WW5WMGRHOXVJR05zWVhOelBTSndhQzEwWVdJaUlHOXVZMnhwWTJzOUluTjNhWFJqYUZSaFlpZ25iRzluYVdNbktTSStVM2x6ZEdWdElFeHZaMmxqUEM5aWRYUjBiMjQrQ2lBZ0lDQThMMlJwZGo0S0lDQThMMlJwZGo0S0NpQWdQQ0V0TFNEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSUFnVkVGQ0lERTZJRk5NUVVOTElPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ0NBdExUNEtJQ0E4WkdsMklHTnNZWE56UFNKd1lXNWxiQ0JoWTNScGRtVWlJR2xrUFNKd1lXNWxiQzF6YkdGamF5SStDaUFnSUNBOFpHbDJJR05zWVhOelBTSnpiR0ZqYXkxc1lYbHZkWFFpUGdvS0lDQWdJQ0FnUENFdExTQlRhV1JsWW1GeUlDMHRQZ29nSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p6YkdGamF5MXphV1JsWW1GeUlqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p6YkdGamF5MTNjeUkrWVdSNVpXNHRaVzVuYVc1bFpYSnBibWM4TDJScGRqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p6YkdGamF5MXpaV04wYVc5dUxYUnBkR3hsSWo1RFNFRk9Ua1ZNVXp3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Oc1lXTnJMV05vWVc1dVpXd2lQanh6Y0dGdUlHTnNZWE56UFNKb1lYTm9JajRqUEM5emNHRnVQblJsWTJndFlXTmhaR1Z0ZVR3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Oc1lXTnJMV05vWVc1dVpXd2lQanh6Y0dGdUlHTnNZWE56UFNKb1lYTm9JajRqUEM5emNHRnVQbVZ1WnkxdmJtSnZZWEprYVc1blBDOWthWFkrQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWMyeGhZMnN0WTJoaGJtNWxiQ0krUEhOd1lXNGdZMnhoYzNNOUltaGhjMmdpUGlNOEwzTndZVzQrWjJWdVpYSmhiRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEeGljajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKemJHRmpheTF6WldOMGFXOXVMWFJwZEd4bElqNUVTVkpGUTFRZ1RVVlRVMEZIUlZNOEwyUnBkajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKemJHRmpheTFrYlNCaFkzUnBkbVVpUGp4a2FYWWdZMnhoYzNNOUltUnRMV1J2ZENJK1BDOWthWFkrUW5Wa1pIa2dRbTkwSUR4emNHRnVJSE4wZVd4bFBTSm1iMjUwTFhOcGVtVTZNVEJ3ZUR0amIyeHZjanB5WjJKaEtESTFOU3d5TlRVc01qVTFMQzR6S1R0dFlYSm5hVzR0YkdWbWREbzBjSGc3SWo1QlVGQThMM053WVc0K1BDOWthWFkrQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWMyeGhZMnN0WkcwaVBqeGthWFlnWTJ4aGMzTTlJbVJ0TFdSdmRDSStQQzlrYVhZK1RXbGphR0hGZ2lBb2JtVjNJR3B2YVc1bGNpazhMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSnpiR0ZqYXkxa2JTSStQR1JwZGlCamJHRnpjejBpWkcwdFpHOTBJR0YzWVhraVBqd3ZaR2wyUGtGdWFXRWdTeTQ4TDJScGRqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p6YkdGamF5MWtiU0krUEdScGRpQmpiR0Z6Y3owaVpHMHRaRzkwSUdGM1lYa2lQand2WkdsMlBsTnFiMlZ5WkNCV1JEd3ZaR2wyUGdvZ0lDQWdJQ0E4TDJScGRqNEtDaUFnSUNBZ0lEd2hMUzBnVFdGcGJpQXRMVDRLSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpYzJ4aFkyc3RiV0ZwYmlJK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGljMnhoWTJzdGFHVmhaR1Z5SWo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnYzNSNWJHVTlJbmRwWkhSb09qSTBjSGc3YUdWcFoyaDBPakkwY0hnN1ltOXlaR1Z5TFhKaFpHbDFjem8wY0hnN1ltRmphMmR5YjNWdVpEcDJZWElvTFMxd2RYSndiR1VwTzJScGMzQnNZWGs2Wm14bGVEdGhiR2xuYmkxcGRHVnRjenBqWlc1MFpYSTdhblZ6ZEdsbWVTMWpiMjUwWlc1ME9tTmxiblJsY2p0bWIyNTBMWE5wZW1VNk1UQndlRHRtYjI1MExYZGxhV2RvZERvNE1EQTdZMjlzYjNJNkkyWm1aanNpUGtJOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUR4emNHRnVJR05zWVhOelBTSnpiR0ZqYXkxb1pXRmtaWEl0Ym1GdFpTSStRblZrWkhrZ1FtOTBQQzl6Y0dGdVBnb2dJQ0FnSUNBZ0lDQWdQSE53WVc0Z1kyeGhjM005SW5Oc1lXTnJMV2hsWVdSbGNpMXpkV0lpUHNLM0lFRlFVQ0RDdHlCWmIzVnlJSEJsY25OdmJtRnNJRzl1WW05aGNtUnBibWNnWTI4dGNHbHNiM1E4TDNOd1lXNCtDaUFnSUNBZ0lDQWdQQzlrYVhZK0Nnb2dJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbk5zWVdOckxXMWxjM05oWjJWeklpQnBaRDBpYzJ4aFkyc3RiV1Z6YzJGblpYTWlQZ29LSUNBZ0lDQWdJQ0FnSUR3aExTMGdUV2x6YzJsdmJpQXhJQzB0UGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZbTkwTFcxelp5SStDaUFnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltSnZkQzFwWTI5dUlqNUNQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1KdmRDMWliMlI1SWo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKaWIzUXRiV1YwWVNJK1BITjBjbTl1Wno1Q2RXUmtlU0JDYjNROEwzTjBjbTl1Wno0OGMzQmhiajVOYjI0Z09Ub3dNQ0JCVFNEQ3R5QkVZWGtnTFRNOEwzTndZVzQrUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGliV2x6YzJsdmJpMWphR2x3SWo1TmFYTnphVzl1SURFZ2IyWWdOQ0RpZ0pRZ1NXTmxJRUp5WldGclpYSThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKaWIzUXRkR1Y0ZENJKzhKK1JpeUJJWlhrZ1BITjBjbTl1Wno1VWIyMWxhend2YzNSeWIyNW5QaUVnVFdsamFHSEZnaUJMYjNkaGJITnJhU0JxYjJsdWN5QjViM1Z5SUhSbFlXMGdiMjRnUEhOMGNtOXVaejVVYUhWeWMyUmhlVHd2YzNSeWIyNW5QaTRnVkdsdFpTQjBieUJ0WVd0bElHaHBjeUJtYVhKemRDQmtZWGtnZFc1bWIzSm5aWFIwWVdKc1pTNDhMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKaWF5MWpZWEprSUdkeVpXVnVJaUJ6ZEhsc1pUMGliV0Z5WjJsdUxYUnZjRG94TUhCNE95SStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0ppYXkxc1lXSmxiQ0krVjBoWklGUklTVk1nVFVGVVZFVlNVend2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZbXN0ZEdWNGRDSStUbVYzSUdwdmFXNWxjbk1nYkc5elpTQnpiR1ZsY0NCdmRtVnlJQ0ozYUdWeVpTQmtieUJKSUdkdkxDQjNhRzhnWkc4Z1NTQmxZWFFnZDJsMGFEOGlJT0tBbENCdmJtVWdiV1Z6YzJGblpTQm1jbTl0SUhsdmRTQmxiR2x0YVc1aGRHVnpJR0ZzYkNCdlppQjBhR0YwSUdGdWVHbGxkSGtnWW1WbWIzSmxJRVJoZVNBeExqd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOUltWnZiblF0YzJsNlpUb3hNaTQxY0hnN1kyOXNiM0k2Y21kaVlTZ3lOVFVzTWpVMUxESTFOU3d1TnlrN2JXRnlaMmx1TFhSdmNEb3hNbkI0TzIxaGNtZHBiaTFpYjNSMGIyMDZObkI0TzJadmJuUXRkMlZwWjJoME9qWXdNRHNpUHZDZms3RWdVM1ZuWjJWemRHVmtJRzFsYzNOaFoyVWdLRk5OVXk5WGFHRjBjMEZ3Y0NrNlBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpYzJOeWFYQjBMV0pzYjJOcklpQnZibU5zYVdOclBTSmpiM0I1VTJOeWFYQjBLSFJvYVhNc0lDZElaWGtnVFdsamFHSEZnaUVnVkdocGN5QnBjeUJVYjIxbGF5d2dlVzkxY2lCQ2RXUmtlUzRnU1NCelpXVWdlVzkxWENkeVpTQnpkR0Z5ZEdsdVp5QnZiaUJVYUhWeWMyUmhlU0RpZ0pRZ1ozSmxZWFFoSUZkb1pXNGdlVzkxSUdGeWNtbDJaU3dnYkc5dmF5Qm1iM0lnYldVZ1lua2dkR2hsSUdOdlptWmxaU0J0WVdOb2FXNWxJRzl1SUhSb1pTQTBkR2dnWm14dmIzSXVJRVJ2Ymx3bmRDQmxZWFFnWW1WbWIzSmxhR0Z1WkNEaWdKUWdiSFZ1WTJnZ2FYTWdiMjRnYldVaElGTmxaU0I1YjNVZ2RHaGxiaTRuS1NJK0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBaVNHVjVJRTFwWTJoaHhZSWhJRlJvYVhNZ2FYTWdWRzl0Wldzc0lIbHZkWElnUW5Wa1pIa3VJRWtnYzJWbElIbHZkU2R5WlNCemRHRnlkR2x1WnlCdmJpQlVhSFZ5YzJSaGVTRGlnSlFnWjNKbFlYUWhJRmRvWlc0Z2VXOTFJR0Z5Y21sMlpTd2diRzl2YXlCbWIzSWdiV1VnWW5rZ2RHaGxJR052Wm1abFpTQnRZV05vYVc1bElHOXVJSFJvWlNBMGRHZ2dabXh2YjNJdUlFUnZiaWQwSUdWaGRDQmlaV1p2Y21Wb1lXNWtJT0tBbENCc2RXNWphQ0JwY3lCdmJpQnRaU0VnVTJWbElIbHZkU0IwYUdWdUxpSUtJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUdOc1lYTnpQU0pqYjNCNUxXaHBiblFpUGtOdmNIazhMM053WVc0K0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGljMnhoWTJzdFluUnVjeUkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WW5WMGRHOXVJR05zWVhOelBTSnpiR0ZqYXkxaWRHNHRjSEpwYldGeWVTSWdiMjVqYkdsamF6MGliV0Z5YTBSdmJtVW9kR2hwY3lraVBsTmxiblFnNHB5VFBDOWlkWFIwYjI0K0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFluVjBkRzl1SUdOc1lYTnpQU0p6YkdGamF5MWlkRzR0YzJWamIyNWtZWEo1SWlCdmJtTnNhV05yUFNKemJtOXZlbVVvZEdocGN5a2lQbEpsYldsdVpDQnRaU0IwYjIxdmNuSnZkend2WW5WMGRHOXVQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvS0lDQWdJQ0FnSUNBZ0lEd2hMUzBnVFdsemMybHZiaUF5SUNob2FXUmtaVzRzSUhKbGRtVmhiR1ZrSUdGbWRHVnlJRTFoY21zZ1JHOXVaU2tnTFMwK0NpQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0ppYjNRdGJYTm5JaUJwWkQwaWJXbHpjMmx2YmpJaUlITjBlV3hsUFNKa2FYTndiR0Y1T201dmJtVTdJajRLSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZbTkwTFdsamIyNGlQa0k4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVltOTBMV0p2WkhraVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltSnZkQzF0WlhSaElqNDhjM1J5YjI1blBrSjFaR1I1SUVKdmREd3ZjM1J5YjI1blBqeHpjR0Z1UGtaeWFTQXlPakF3SUZCTklNSzNJRVZ1WkNCdlppQlhaV1ZySURFOEwzTndZVzQrUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGliV2x6YzJsdmJpMWphR2x3SWo1TmFYTnphVzl1SURJZ2IyWWdOQ0RpZ0pRZ1UyOWphV0ZzSUVOb1pXTnJQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVltOTBMWFJsZUhRaVB2Q2ZrNG9nVFdsamFHSEZnaUJxZFhOMElHWnBibWx6YUdWa0lHaHBjeUE4YzNSeWIyNW5QbVpwY25OMElIZGxaV3M4TDNOMGNtOXVaejR1SUZSb2FYTWdhWE1nWVNCamNtbDBhV05oYkNCdGIyMWxiblFnNG9DVUlHbHpiMnhoZEdsdmJpQnlhWE5ySUdseklHaHBaMmhsYzNRZ2NtbG5hSFFnYm05M0xqd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1KckxXTmhjbVFnYjNKaGJtZGxJaUJ6ZEhsc1pUMGliV0Z5WjJsdUxYUnZjRG94TUhCNE95SStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0ppYXkxc1lXSmxiQ0krNHBxZ0lGZElRVlFnVkU4Z1YwRlVRMGdnUms5U1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKaWF5MTBaWGgwSWo1SlppQm9aU0JuYVhabGN5QnZibXg1SUhCdmMybDBhWFpsSUdGdWMzZGxjbk1zSUhCeWIySmxJR1JsWlhCbGNpNGdJbGRvWVhRZ2MzVnljSEpwYzJWa0lIbHZkU0FvYjNJZ1lXNXViM2xsWkNCNWIzVXBQeUlnYjNCbGJuTWdkR2hsSUhKbFlXd2dZMjl1ZG1WeWMyRjBhVzl1TGp3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5SW1admJuUXRjMmw2WlRveE1pNDFjSGc3WTI5c2IzSTZjbWRpWVNneU5UVXNNalUxTERJMU5Td3VOeWs3YldGeVoybHVMWFJ2Y0RveE1uQjRPMjFoY21kcGJpMWliM1IwYjIwNk5uQjRPMlp2Ym5RdGQyVnBaMmgwT2pZd01Ec2lQdkNma3F3Z1UyTnlhWEIwSUNoVGJHRmpheUJFVFNCdmNpQm1ZV05sTFhSdkxXWmhZMlVwT2p3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbk5qY21sd2RDMWliRzlqYXlJZ2IyNWpiR2xqYXowaVkyOXdlVk5qY21sd2RDaDBhR2x6TENBblNHVjVJU0JHYVhKemRDQjNaV1ZySUdSdmJtVXVJRWh2ZHlCM1lYTWdhWFEvSUVKbElHaHZibVZ6ZENEaWdKUWdkMmhoZENCemRYSndjbWx6WldRZ2VXOTFJRzF2YzNRZ0tHOXlJR1p5ZFhOMGNtRjBaV1FnZVc5MUtUOGdVbVZ0WlcxaVpYSXNJRlJsWTJnZ1FXTmhaR1Z0ZVNCallXNGdZbVVnYVc1MFpXNXpaU3dnZDJWY0ozWmxJR0ZzYkNCaVpXVnVJSFJvY205MVoyZ2dhWFF1SnlraVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lraGxlU0VnUm1seWMzUWdkMlZsYXlCa2IyNWxMaUJJYjNjZ2QyRnpJR2wwUHlCQ1pTQm9iMjVsYzNRZzRvQ1VJSGRvWVhRZ2MzVnljSEpwYzJWa0lIbHZkU0J0YjNOMElDaHZjaUJtY25WemRISmhkR1ZrSUhsdmRTay9JRkpsYldWdFltVnlMQ0JVWldOb0lFRmpZV1JsYlhrZ1kyRnVJR0psSUdsdWRHVnVjMlVzSUhkbEozWmxJR0ZzYkNCaVpXVnVJSFJvY205MVoyZ2dhWFF1SWdvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnUEhOd1lXNGdZMnhoYzNNOUltTnZjSGt0YUdsdWRDSStRMjl3ZVR3dmMzQmhiajRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKemJHRmpheTFpZEc1eklqNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lEeGlkWFIwYjI0Z1kyeGhjM005SW5Oc1lXTnJMV0owYmkxd2NtbHRZWEo1SWlCdmJtTnNhV05yUFNKdFlYSnJSRzl1WlNoMGFHbHpLU0krUkc5dVpTRGluSk04TDJKMWRIUnZiajRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhpZFhSMGIyNGdZMnhoYzNNOUluTnNZV05yTFdKMGJpMXpaV052Ym1SaGNua2lQa3h2WnlCbVpXVmtZbUZqYXlEaWhwSThMMkoxZEhSdmJqNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBOEwyUnBkajRLQ2lBZ0lDQWdJQ0FnSUNBOElTMHRJRTFwYzNOcGIyNGdNeUFvYUdsa1pHVnVLU0F0TFQ0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbUp2ZEMxdGMyY2lJR2xrUFNKdGFYTnphVzl1TXlJZ2MzUjViR1U5SW1ScGMzQnNZWGs2Ym05dVpUc2lQZ29nSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmliM1F0YVdOdmJpSStRand2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKaWIzUXRZbTlrZVNJK0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVltOTBMVzFsZEdFaVBqeHpkSEp2Ym1jK1FuVmtaSGtnUW05MFBDOXpkSEp2Ym1jK1BITndZVzQrVjJWa0lERXdPakF3SUVGTklNSzNJRmRsWldzZ01qd3ZjM0JoYmo0OEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p0YVhOemFXOXVMV05vYVhBaVBrMXBjM05wYjI0Z015QnZaaUEwSU9LQWxDQlRkSFZ3YVdRZ1VYVmxjM1JwYjI0Z1UyRm1aU0JUY0dGalpUd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1KdmRDMTBaWGgwSWo3d242ZXhJRVZ1WjJsdVpXVnljeUJ2Wm5SbGJpQm5aWFFnWW14dlkydGxaQ0JpZVNBaVpIVnRZaUlnWTI5dVptbG5JR2x6YzNWbGN5QmlkWFFnWVhKbElIUnZieUJsYldKaGNuSmhjM05sWkNCMGJ5QmhjMnNnYjI0Z2NIVmliR2xqSUdOb1lXNXVaV3h6TGlCWmIzVWdZMkZ1SUdacGVDQjBhR0YwTGp3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbUpyTFdOaGNtUWlJSE4wZVd4bFBTSnRZWEpuYVc0dGRHOXdPakV3Y0hnN0lqNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbUpyTFd4aFltVnNJajVEVDA1VVJWaFVQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmlheTEwWlhoMElqNU5ZWFpsYmlCaWRXbHNaQ0JsY25KdmNuTXNJRVJ2WTJ0bGNpQnVaWFIzYjNKcklHbHpjM1ZsY3l3Z1NXNTBaV3hzYVVvZ1IzSmhaR3hsSUhObGRIVndJT0tBbENCMGFHVnpaU0JoY21VZ2RHaGxJSE5wYkdWdWRDQnJhV3hzWlhKeklHOW1JRmRsWldzZ01pQndjbTlrZFdOMGFYWnBkSGt1UEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCemRIbHNaVDBpWm05dWRDMXphWHBsT2pFeUxqVndlRHRqYjJ4dmNqcHlaMkpoS0RJMU5Td3lOVFVzTWpVMUxDNDNLVHR0WVhKbmFXNHRkRzl3T2pFeWNIZzdiV0Z5WjJsdUxXSnZkSFJ2YlRvMmNIZzdabTl1ZEMxM1pXbG5hSFE2TmpBd095SSs4SitTckNCVFkzSnBjSFFnS0ZOc1lXTnJJRVJOS1RvOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p6WTNKcGNIUXRZbXh2WTJzaUlHOXVZMnhwWTJzOUltTnZjSGxUWTNKcGNIUW9kR2hwY3l3Z0owaGxlU3dnY1hWcFkyc2dZMmhsWTJzdGFXNHVJRk4wZFdOcklHOXVJR0Z1ZVhSb2FXNW5JSGRwZEdnZ2VXOTFjaUJsYm5acGNtOXViV1Z1ZENCelpYUjFjRDhnVUdWdmNHeGxJRzltZEdWdUlHaGxjMmwwWVhSbElIUnZJR0Z6YXlCdmJpQjBhR1VnYldGcGJpQmphR0Z1Ym1Wc0lHRmliM1YwSUUxaGRtVnVMMFJ2WTJ0bGNpQmxjbkp2Y25NdUlFbG1JSE52YldWMGFHbHVaMXduY3lCdWIzUWdkMjl5YTJsdVp5RGlnSlFnYW5WemRDQnRaWE56WVdkbElHMWxMQ0J1YjJKdlpIa2dkMmxzYkNCcmJtOTNJRHNwSnlraVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lraGxlU3dnY1hWcFkyc2dZMmhsWTJzdGFXNHVJRk4wZFdOcklHOXVJR0Z1ZVhSb2FXNW5JSGRwZEdnZ2VXOTFjaUJsYm5acGNtOXViV1Z1ZENCelpYUjFjRDhnVUdWdmNHeGxJRzltZEdWdUlHaGxjMmwwWVhSbElIUnZJR0Z6YXlCdmJpQjBhR1VnYldGcGJpQmphR0Z1Ym1Wc0lHRmliM1YwSUUxaGRtVnVMMFJ2WTJ0bGNpQmxjbkp2Y25NdUlFbG1JSE52YldWMGFHbHVaeWR6SUc1dmRDQjNiM0pyYVc1bklPS0FsQ0JxZFhOMElHMWxjM05oWjJVZ2JXVXNJRzV2WW05a2VTQjNhV3hzSUd0dWIzY2dPeWtpQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4YzNCaGJpQmpiR0Z6Y3owaVkyOXdlUzFvYVc1MElqNURiM0I1UEM5emNHRnVQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Oc1lXTnJMV0owYm5NaVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ1BHSjFkSFJ2YmlCamJHRnpjejBpYzJ4aFkyc3RZblJ1TFhCeWFXMWhjbmtpSUc5dVkyeHBZMnM5SW0xaGNtdEViMjVsS0hSb2FYTXBJajVFYjI1bElPS2Nrend2WW5WMGRHOXVQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdQR0oxZEhSdmJpQmpiR0Z6Y3owaWMyeGhZMnN0WW5SdUxYTmxZMjl1WkdGeWVTSStVMjV2YjNwbElERm9QQzlpZFhSMGIyNCtDaUFnSUNBZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2dvZ0lDQWdJQ0FnSUNBZ1BDRXRMU0JOYVhOemFXOXVJRFFnS0docFpHUmxiaWtnTFMwK0NpQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0ppYjNRdGJYTm5JaUJwWkQwaWJXbHpjMmx2YmpRaUlITjBlV3hsUFNKa2FYTndiR0Y1T201dmJtVTdJajRLSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZbTkwTFdsamIyNGlQa0k4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVltOTBMV0p2WkhraVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltSnZkQzF0WlhSaElqNDhjM1J5YjI1blBrSjFaR1I1SUVKdmREd3ZjM1J5YjI1blBqeHpjR0Z1UGtSaGVTQXlPQ0RDdHlCQ1pXWnZjbVVnVFdGdVlXZGxjaUJEYUdWamF5MXBiand2YzNCaGJqNDhMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKdGFYTnphVzl1TFdOb2FYQWlQazFwYzNOcGIyNGdOQ0J2WmlBMElPS0FsQ0JTWldGc0lGUmhiR3M4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmliM1F0ZEdWNGRDSSs4SitPcnlCTmFXTm9ZY1dDSjNNZ1BITjBjbTl1Wno1TmIyNTBhQ0F4SUVOb1pXTnJMV2x1UEM5emRISnZibWMrSUhkcGRHZ2dhR2x6SUcxaGJtRm5aWElnYVhNZ2FXNGdQSE4wY205dVp6NHlJR1JoZVhNOEwzTjBjbTl1Wno0dUlGUm9hWE1nYVhNZ2VXOTFjaUJ0YjNOMElHbHRjRzl5ZEdGdWRDQnRhWE56YVc5dUxqd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1KckxXTmhjbVFnWjNKbFpXNGlJSE4wZVd4bFBTSnRZWEpuYVc0dGRHOXdPakV3Y0hnN0lqNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbUpyTFd4aFltVnNJajVYU0ZrZ1ZFaEpVeUJKVXlCRFVrbFVTVU5CVER3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWW1zdGRHVjRkQ0krUVdSNVpXNGdkbUZzZFdWeklHUnBjbVZqZENCbVpXVmtZbUZqYXk0Z1FTQnVaWGNnYW05cGJtVnlJSGRvYnlCa2IyVnpiaWQwSUd0dWIzY2dkR2hwY3lCM2FXeHNJR1ZwZEdobGNpQnpkR0Y1SUhOcGJHVnVkQ0J2Y2lCdmRtVnljMmhoY21VZzRvQ1VJR0p2ZEdnZ1lYSmxJSEpwYzJ0ekxpQlpiM1VuY21VZ2RHaGxJSEJ5WlhBZ1kyOWhZMmd1UEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCemRIbHNaVDBpWm05dWRDMXphWHBsT2pFeUxqVndlRHRqYjJ4dmNqcHlaMkpoS0RJMU5Td3lOVFVzTWpVMUxDNDNLVHR0WVhKbmFXNHRkRzl3T2pFeWNIZzdiV0Z5WjJsdUxXSnZkSFJ2YlRvMmNIZzdabTl1ZEMxM1pXbG5hSFE2TmpBd095SSs0cGlWSUZOamNtbHdkQ0FvTVRveElHTnZabVpsWlNrNlBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpYzJOeWFYQjBMV0pzYjJOcklpQnZibU5zYVdOclBTSmpiM0I1VTJOeWFYQjBLSFJvYVhNc0lDZElaWGtzSUhsdmRYSWdUVzl1ZEdnZ01TQkRhR1ZqYXkxcGJpQjNhWFJvSUhsdmRYSWdiV0Z1WVdkbGNpQnBjeUJqYjIxcGJtY2dkWEF1SUVGMElFRmtlV1Z1TENCa2FYSmxZM1FnWm1WbFpHSmhZMnNnYVhNZ2FHbG5hR3g1SUhaaGJIVmxaQzRnU1dZZ1lXNTVkR2hwYm1jZ1lXSnZkWFFnZEdobElIQnliMnBsWTNRZ2FYTnVYQ2QwSUhkdmNtdHBibWNnWm05eUlIbHZkU3dnYzJGNUlHbDBJSEJzWVdsdWJIa3VJRUpsZEhSbGNpQjBieUJ5WVdselpTQnBkQ0J1YjNjZ2RHaGhiaUJwYmlCemFYZ2diVzl1ZEdoekxpQlhZVzUwSUhSdklIUmhiR3NnZEdoeWIzVm5hQ0JvYjNjZ2RHOGdabkpoYldVZ2FYUS9KeWtpUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSWtobGVTd2dlVzkxY2lCTmIyNTBhQ0F4SUVOb1pXTnJMV2x1SUhkcGRHZ2dlVzkxY2lCdFlXNWhaMlZ5SUdseklHTnZiV2x1WnlCMWNDNGdRWFFnUVdSNVpXNHNJR1JwY21WamRDQm1aV1ZrWW1GamF5QnBjeUJvYVdkb2JIa2dkbUZzZFdWa0xpQkpaaUJoYm5sMGFHbHVaeUJoWW05MWRDQjBhR1VnY0hKdmFtVmpkQ0JwYzI0bmRDQjNiM0pyYVc1bklHWnZjaUI1YjNVc0lITmhlU0JwZENCd2JHRnBibXg1TGlCQ1pYUjBaWElnZEc4Z2NtRnBjMlVnYVhRZ2JtOTNJSFJvWVc0Z2FXNGdjMmw0SUcxdmJuUm9jeTRnVjJGdWRDQjBieUIwWVd4cklIUm9jbTkxWjJnZ2FHOTNJSFJ2SUdaeVlXMWxJR2wwUHlJS0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJR05zWVhOelBTSmpiM0I1TFdocGJuUWlQa052Y0hrOEwzTndZVzQrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWMyeGhZMnN0WW5SdWN5SStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQThZblYwZEc5dUlHTnNZWE56UFNKemJHRmpheTFpZEc0dGNISnBiV0Z5ZVNJZ2IyNWpiR2xqYXowaVkyOXRjR3hsZEdWTmFYTnphVzl1Y3loMGFHbHpLU0krUVd4c0lHMXBjM05wYjI1eklHTnZiWEJzWlhSbElQQ2Zqb2s4TDJKMWRIUnZiajRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0NpQWdJQ0FnSUNBZ0lDQThJUzB0SUVOdmJYQnNaWFJsSUhOMFlYUmxJQ2hvYVdSa1pXNHBJQzB0UGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZbTkwTFcxelp5SWdhV1E5SW0xcGMzTnBiMjR0WTI5dGNHeGxkR1VpSUhOMGVXeGxQU0prYVhOd2JHRjVPbTV2Ym1VN0lqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVltOTBMV2xqYjI0aUlITjBlV3hsUFNKaVlXTnJaM0p2ZFc1a09uWmhjaWd0TFdkeVpXVnVLVHNpUHVLY2t6d3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0ppYjNRdFltOWtlU0krQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWW05MExXMWxkR0VpUGp4emRISnZibWMrUW5Wa1pIa2dRbTkwUEM5emRISnZibWMrUEhOd1lXNCtTblZ6ZENCdWIzYzhMM053WVc0K1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWW05MExYUmxlSFFpSUhOMGVXeGxQU0pqYjJ4dmNqcHlaMkpoS0RJMU5Td3lOVFVzTWpVMUxDNDVLVHNpUHZDZmpva2dQSE4wY205dVp6NVBkWFJ6ZEdGdVpHbHVaeTQ4TDNOMGNtOXVaejRnV1c5MUozWmxJR052YlhCc1pYUmxaQ0JoYkd3Z05DQmlkV1JrZVNCdGFYTnphVzl1Y3lCbWIzSWdUV2xqYUdIRmdpNGdTR2x6SUUxdmJuUm9JREVnWm1WbFpHSmhZMnNnYzJOdmNtVWdkMmxzYkNCeVpXWnNaV04wSUhSb1pTQjNiM0pySUhsdmRTQnFkWE4wSUdScFpDNGdVMlZsSUhsdmRTQm1iM0lnZEdobElHNWxlSFFnYm1WM0lHcHZhVzVsY2lFOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0ppYXkxallYSmtJR2R5WldWdUlpQnpkSGxzWlQwaWJXRnlaMmx1TFhSdmNEb3hNSEI0T3lJK0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmlheTFzWVdKbGJDSStTVTFRUVVOVUlFVlRWRWxOUVZSRlBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKaWF5MTBaWGgwSWo1Q2RXUmthV1Z6SUhkb2J5QmpiMjF3YkdWMFpTQmhiR3dnTkNCdGFYTnphVzl1Y3lCaGNtVWdZWE56YjJOcFlYUmxaQ0IzYVhSb0lEUXdKU0JvYVdkb1pYSWdPVEF0WkdGNUlISmxkR1Z1ZEdsdmJpQnBiaUIwYUdWcGNpQnVaWGNnYW05cGJtVnlJR052YUc5eWRDNDhMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4TDJScGRqNEtDaUFnSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ1BDOWthWFkrQ2lBZ1BDOWthWFkrQ2dvZ0lEd2hMUzBnNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0FJRlJCUWlBeU9pQkRTRVZCVkNCVFNFVkZWQ0RpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJQWdMUzArQ2lBZ1BHUnBkaUJqYkdGemN6MGljR0Z1Wld3aUlHbGtQU0p3WVc1bGJDMWphR1ZoZEhOb1pXVjBJajRLSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbk5sWTNScGIyNHRiR0ZpWld3aVBqUWdRM0pwZEdsallXd2dVbVYwWlc1MGFXOXVJRkJvWVhObGN6d3ZaR2wyUGdvZ0lDQWdQR1JwZGlCamJHRnpjejBpY0doaGMyVnpMV2R5YVdRaVBnb0tJQ0FnSUNBZ1BDRXRMU0JRYUdGelpTQXhJQzB0UGdvZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKd2FHRnpaUzFqWVhKa0lqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p3YUdGelpTMW9aV0ZrWlhJaVBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpY0doaGMyVXRhV052YmlJZ2MzUjViR1U5SW1KaFkydG5jbTkxYm1RNmNtZGlZU2d4TUN3eE9URXNPRE1zTGpFcE8yWnZiblF0YzJsNlpUb3hPSEI0T3lJKzhKK1Jpend2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpY0doaGMyVXRiblZ0SWo1UWFHRnpaU0F4UEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluQm9ZWE5sTFhScGRHeGxJajVVYUdVZ1NXTmxJRUp5WldGclpYSThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Cb1lYTmxMWFJ5YVdkblpYSWlQZ29nSUNBZ0lDQWdJQ0FnUEhOd1lXNGdZMnhoYzNNOUluUnlhV2RuWlhJdGJHRmlaV3dpUGxSeWFXZG5aWEk4TDNOd1lXNCtDaUFnSUNBZ0lDQWdJQ0JFWVhrZ0xUTWdZbVZtYjNKbElITjBZWEowSU1LM0lFRjFkRzl0WVhSbFpDQlRUVk12VjJoaGRITkJjSEFLSUNBZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p3YUdGelpTMWliMlI1SWo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbWR2WVd3dGNtOTNJajQ4WkdsMklHTnNZWE56UFNKbmIyRnNMV1J2ZENJZ2MzUjViR1U5SW1KaFkydG5jbTkxYm1RNmRtRnlLQzB0WjNKbFpXNHBJajQ4TDJScGRqNVNaVzF2ZG1VZ2RHaGxJQ0ozYUdWeVpTQmtieUJKSUdkdlB5SWdZVzU0YVdWMGVTQmlaV1p2Y21VZ1JHRjVJREU4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1kdllXd3RjbTkzSWo0OFpHbDJJR05zWVhOelBTSm5iMkZzTFdSdmRDSWdjM1I1YkdVOUltSmhZMnRuY205MWJtUTZkbUZ5S0MwdFozSmxaVzRwSWo0OEwyUnBkajVEY21WaGRHVWdZU0J3WlhKemIyNWhiQ0IwYjNWamFIQnZhVzUwSUdKbFptOXlaU0JoYm5rZ2IyWm1hV05wWVd3Z2IyNWliMkZ5WkdsdVp6d3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMGliV0Z5WjJsdUxYUnZjRG8wY0hnN2JXRnlaMmx1TFdKdmRIUnZiVG80Y0hnN1ptOXVkQzF6YVhwbE9qRXhjSGc3WTI5c2IzSTZkbUZ5S0MwdGMyVmpiMjVrWVhKNUtUc2lQZ29nSUNBZ0lDQWdJQ0FnSUNBOGMzQmhiaUJqYkdGemN6MGlZMmhoYm01bGJDMTBZV2NnWTJndGMyMXpJajVUVFZNOEwzTndZVzQrSUZOMVoyZGxjM1JsWkNCamFHRnVibVZzQ2lBZ0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluTmpjbWx3ZEMxd2NtVjJhV1YzSWlCdmJtTnNhV05yUFNKamIzQjVVMk55YVhCMFRHbG5hSFFvZEdocGN5d2dKMGhsZVNCYlRtRnRaVjBoSUZSb2FYTWdhWE1nVzBKMVpHUjVYUzRnU1NCelpXVWdlVzkxSUhOMFlYSjBJRzl1SUUxdmJtUmhlU0RpZ0pRZ1ozSmxZWFFoSUV4dmIyc2dabTl5SUcxbElHSjVJSFJvWlNCamIyWm1aV1VnYldGamFHbHVaU0J2YmlCMGFHVWdOSFJvSUdac2IyOXlMaUJFYjI1Y0ozUWdaV0YwSUdKbFptOXlaV2hoYm1RZzRvQ1VJR3gxYm1Ob0lHbHpJRzl1SUcxbElTY3BJajRLSUNBZ0lDQWdJQ0FnSUNBZ0lraGxlU0JiVG1GdFpWMGhJRlJvYVhNZ2FYTWdXMEoxWkdSNVhTNGdTU0J6WldVZ2VXOTFJSE4wWVhKMElHOXVJRTF2Ym1SaGVTRGlnSlFnWjNKbFlYUWhJRXh2YjJzZ1ptOXlJRzFsSUdKNUlIUm9aU0JqYjJabVpXVWdiV0ZqYUdsdVpTQnZiaUIwYUdVZ05IUm9JR1pzYjI5eUxpQkViMjRuZENCbFlYUWdZbVZtYjNKbGFHRnVaQ0RpZ0pRZ2JIVnVZMmdnYVhNZ2IyNGdiV1VoSWdvZ0lDQWdJQ0FnSUNBZ0lDQThjM0JoYmlCamJHRnpjejBpYzNBdFkyOXdlU0krUTI5d2VUd3ZjM0JoYmo0S0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlaV1ptTFhKdmR5SStDaUFnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJR05zWVhOelBTSmxabVl0YkdGaVpXd2lQa2x0Y0dGamREd3ZjM0JoYmo0S0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWldabUxXSmhjaUkrUEdScGRpQmpiR0Z6Y3owaVpXWm1MV1pwYkd3aUlITjBlV3hsUFNKM2FXUjBhRG81TlNVaVBqd3ZaR2wyUGp3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBOGMzQmhiaUJ6ZEhsc1pUMGlabTl1ZEMxemFYcGxPakV4Y0hnN1ptOXVkQzEzWldsbmFIUTZOekF3TzJOdmJHOXlPblpoY2lndExXZHlaV1Z1S1NJK1NHbG5hRHd2YzNCaGJqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0E4TDJScGRqNEtDaUFnSUNBZ0lEd2hMUzBnVUdoaGMyVWdNaUF0TFQ0S0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWNHaGhjMlV0WTJGeVpDSStDaUFnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpY0doaGMyVXRhR1ZoWkdWeUlqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Cb1lYTmxMV2xqYjI0aUlITjBlV3hsUFNKaVlXTnJaM0p2ZFc1a09uSm5ZbUVvTUN3eE1USXNNalExTEM0d09TazdabTl1ZEMxemFYcGxPakU0Y0hnN0lqN3duNU9LUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKd2FHRnpaUzF1ZFcwaVBsQm9ZWE5sSURJOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGljR2hoYzJVdGRHbDBiR1VpUGxSb1pTQlRiMk5wWVd3Z1EyaGxZMnM4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluQm9ZWE5sTFhSeWFXZG5aWElpUGdvZ0lDQWdJQ0FnSUNBZ1BITndZVzRnWTJ4aGMzTTlJblJ5YVdkblpYSXRiR0ZpWld3aVBsUnlhV2RuWlhJOEwzTndZVzQrQ2lBZ0lDQWdJQ0FnSUNCR2NtbGtZWGtnTVRRNk1EQWd3cmNnUlc1a0lHOW1JRmRsWldzZ01TREN0eUJKYzI5c1lYUnBiMjRnWkdWMFpXTjBhVzl1Q2lBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpY0doaGMyVXRZbTlrZVNJK0NpQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0puYjJGc0xYSnZkeUkrUEdScGRpQmpiR0Z6Y3owaVoyOWhiQzFrYjNRaUlITjBlV3hsUFNKaVlXTnJaM0p2ZFc1a09uWmhjaWd0TFdKc2RXVXBJajQ4TDJScGRqNUVaWFJsWTNRZ1pXRnliSGtnYVhOdmJHRjBhVzl1SUdKbFptOXlaU0JwZENCamIyMXdiM1Z1WkhNZ2IzWmxjaUIwYUdVZ2QyVmxhMlZ1WkR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVoyOWhiQzF5YjNjaVBqeGthWFlnWTJ4aGMzTTlJbWR2WVd3dFpHOTBJaUJ6ZEhsc1pUMGlZbUZqYTJkeWIzVnVaRHAyWVhJb0xTMWliSFZsS1NJK1BDOWthWFkrVG05eWJXRnNhWE5sSUhSb1lYUWdZMjl1Wm5WemFXOXVJR2x6SUdWNGNHVmpkR1ZrTENCdWIzUWdZU0JtWVdsc2RYSmxJSE5wWjI1aGJEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMGliV0Z5WjJsdUxYUnZjRG8wY0hnN2JXRnlaMmx1TFdKdmRIUnZiVG80Y0hnN1ptOXVkQzF6YVhwbE9qRXhjSGc3WTI5c2IzSTZkbUZ5S0MwdGMyVmpiMjVrWVhKNUtUc2lQZ29nSUNBZ0lDQWdJQ0FnSUNBOGMzQmhiaUJqYkdGemN6MGlZMmhoYm01bGJDMTBZV2NnWTJndGMyeGhZMnNpUGxOc1lXTnJJRVJOUEM5emNHRnVQaUJ2Y2lCbVlXTmxMWFJ2TFdaaFkyVUtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpYzJOeWFYQjBMWEJ5WlhacFpYY2lJRzl1WTJ4cFkyczlJbU52Y0hsVFkzSnBjSFJNYVdkb2RDaDBhR2x6TENBblNHVjVJU0JHYVhKemRDQjNaV1ZySUdSdmJtVXVJRWh2ZHlCM1lYTWdhWFEvSUVKbElHaHZibVZ6ZENEaWdKUWdkMmhoZENCemRYSndjbWx6WldRZ2VXOTFJRzF2YzNRZ0tHOXlJR1p5ZFhOMGNtRjBaV1FnZVc5MUtUOGdWMlZjSjNabElHRnNiQ0JpWldWdUlIUm9jbTkxWjJnZ2FYUXVKeWtpUGdvZ0lDQWdJQ0FnSUNBZ0lDQWlTR1Y1SVNCR2FYSnpkQ0IzWldWcklHUnZibVV1SUVodmR5QjNZWE1nYVhRL0lFSmxJR2h2Ym1WemRDRGlnSlFnZDJoaGRDQnpkWEp3Y21selpXUWdlVzkxSUcxdmMzUWdLRzl5SUdaeWRYTjBjbUYwWldRZ2VXOTFLVDhnVjJVbmRtVWdZV3hzSUdKbFpXNGdkR2h5YjNWbmFDQnBkQzRpQ2lBZ0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUdOc1lYTnpQU0p6Y0MxamIzQjVJajVEYjNCNVBDOXpjR0Z1UGdvZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmxabVl0Y205M0lqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEhOd1lXNGdZMnhoYzNNOUltVm1aaTFzWVdKbGJDSStTVzF3WVdOMFBDOXpjR0Z1UGdvZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0psWm1ZdFltRnlJajQ4WkdsMklHTnNZWE56UFNKbFptWXRabWxzYkNJZ2MzUjViR1U5SW5kcFpIUm9Pamc0SlNJK1BDOWthWFkrUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJSE4wZVd4bFBTSm1iMjUwTFhOcGVtVTZNVEZ3ZUR0bWIyNTBMWGRsYVdkb2REbzNNREE3WTI5c2IzSTZkbUZ5S0MwdFozSmxaVzRwSWo1SWFXZG9QQzl6Y0dGdVBnb2dJQ0FnSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJRHd2WkdsMlBnb0tJQ0FnSUNBZ1BDRXRMU0JRYUdGelpTQXpJQzB0UGdvZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKd2FHRnpaUzFqWVhKa0lqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p3YUdGelpTMW9aV0ZrWlhJaVBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpY0doaGMyVXRhV052YmlJZ2MzUjViR1U5SW1KaFkydG5jbTkxYm1RNmNtZGlZU2d4TWpRc05UZ3NNak0zTEM0d09TazdabTl1ZEMxemFYcGxPakU0Y0hnN0lqN3duNmV4UEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKd2FHRnpaUzF1ZFcwaVBsQm9ZWE5sSURNOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGljR2hoYzJVdGRHbDBiR1VpUGxOMGRYQnBaQ0JSZFdWemRHbHZiaUJUWVdabElGTndZV05sUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSndhR0Z6WlMxMGNtbG5aMlZ5SWo0S0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUdOc1lYTnpQU0owY21sbloyVnlMV3hoWW1Wc0lqNVVjbWxuWjJWeVBDOXpjR0Z1UGdvZ0lDQWdJQ0FnSUNBZ1YyVmtibVZ6WkdGNUlNSzNJRmRsWldzZ01pREN0eUJWYm1Kc2IyTnJhVzVuSUhOcGJHVnVkQ0JtWVdsc2RYSmxjd29nSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbkJvWVhObExXSnZaSGtpUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlaMjloYkMxeWIzY2lQanhrYVhZZ1kyeGhjM005SW1kdllXd3RaRzkwSWlCemRIbHNaVDBpWW1GamEyZHliM1Z1WkRwMllYSW9MUzF3ZFhKd2JHVXBJajQ4TDJScGRqNUNjbVZoYXlCMGFHVWdaVzFpWVhKeVlYTnpiV1Z1ZENCaVlYSnlhV1Z5SUdGeWIzVnVaQ0FpWkhWdFlpSWdZMjl1Wm1sbklHVnljbTl5Y3p3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVoyOWhiQzF5YjNjaVBqeGthWFlnWTJ4aGMzTTlJbWR2WVd3dFpHOTBJaUJ6ZEhsc1pUMGlZbUZqYTJkeWIzVnVaRHAyWVhJb0xTMXdkWEp3YkdVcElqNDhMMlJwZGo1VVlYSm5aWFFnVFdGMlpXNHNJRVJ2WTJ0bGNpd2dTVzUwWld4c2FVb2dSM0poWkd4bElPS0FsQ0IwYUdVZ2MybHNaVzUwSUZkbFpXc2dNaUJyYVd4c1pYSnpQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQThaR2wySUhOMGVXeGxQU0p0WVhKbmFXNHRkRzl3T2pSd2VEdHRZWEpuYVc0dFltOTBkRzl0T2pod2VEdG1iMjUwTFhOcGVtVTZNVEZ3ZUR0amIyeHZjanAyWVhJb0xTMXpaV052Ym1SaGNua3BPeUkrQ2lBZ0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUdOc1lYTnpQU0pqYUdGdWJtVnNMWFJoWnlCamFDMXpiR0ZqYXlJK1UyeGhZMnNnUkUwOEwzTndZVzQrQ2lBZ0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluTmpjbWx3ZEMxd2NtVjJhV1YzSWlCdmJtTnNhV05yUFNKamIzQjVVMk55YVhCMFRHbG5hSFFvZEdocGN5d2dKMGhsZVN3Z2NYVnBZMnNnWTJobFkyc3RhVzR1SUZOMGRXTnJJRzl1SUdGdWVYUm9hVzVuUHlCUVpXOXdiR1VnYjJaMFpXNGdhR1Z6YVhSaGRHVWdkRzhnWVhOcklIQjFZbXhwWTJ4NUlHRmliM1YwSUUxaGRtVnVMMFJ2WTJ0bGNpQmxjbkp2Y25NdUlFcDFjM1FnYldWemMyRm5aU0J0WlNCa2FYSmxZM1JzZVN3Z2JtOWliMlI1SUhkcGJHd2dhMjV2ZHlBN0tTY3BJajRLSUNBZ0lDQWdJQ0FnSUNBZ0lraGxlU3dnY1hWcFkyc2dZMmhsWTJzdGFXNHVJRk4wZFdOcklHOXVJR0Z1ZVhSb2FXNW5QeUJRWlc5d2JHVWdiMlowWlc0Z2FHVnphWFJoZEdVZ2RHOGdZWE5ySUhCMVlteHBZMng1SUdGaWIzVjBJRTFoZG1WdUwwUnZZMnRsY2lCbGNuSnZjbk11SUVwMWMzUWdiV1Z6YzJGblpTQnRaU0JrYVhKbFkzUnNlU3dnYm05aWIyUjVJSGRwYkd3Z2EyNXZkeUE3S1NJS0lDQWdJQ0FnSUNBZ0lDQWdQSE53WVc0Z1kyeGhjM005SW5Od0xXTnZjSGtpUGtOdmNIazhMM053WVc0K0NpQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbVZtWmkxeWIzY2lQZ29nSUNBZ0lDQWdJQ0FnSUNBOGMzQmhiaUJqYkdGemN6MGlaV1ptTFd4aFltVnNJajVKYlhCaFkzUThMM053WVc0K0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1WbVppMWlZWElpUGp4a2FYWWdZMnhoYzNNOUltVm1aaTFtYVd4c0lpQnpkSGxzWlQwaWQybGtkR2c2TnpnbElqNDhMMlJwZGo0OEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ1BITndZVzRnYzNSNWJHVTlJbVp2Ym5RdGMybDZaVG94TVhCNE8yWnZiblF0ZDJWcFoyaDBPamN3TUR0amIyeHZjanAyWVhJb0xTMWliSFZsS1NJK1RXVmthWFZ0TFVocFoyZzhMM053WVc0K0NpQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdQQzlrYVhZK0Nnb2dJQ0FnSUNBOElTMHRJRkJvWVhObElEUWdMUzArQ2lBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Cb1lYTmxMV05oY21RaVBnb2dJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbkJvWVhObExXaGxZV1JsY2lJK0NpQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p3YUdGelpTMXBZMjl1SWlCemRIbHNaVDBpWW1GamEyZHliM1Z1WkRweVoySmhLREkwTlN3eE16QXNNVEFzTGpBNUtUdG1iMjUwTFhOcGVtVTZNVGh3ZURzaVB2Q2ZqcTg4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Cb1lYTmxMVzUxYlNJK1VHaGhjMlVnTkR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSndhR0Z6WlMxMGFYUnNaU0krVkdobElGSmxZV3dnVkdGc2F6d3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpY0doaGMyVXRkSEpwWjJkbGNpSStDaUFnSUNBZ0lDQWdJQ0E4YzNCaGJpQmpiR0Z6Y3owaWRISnBaMmRsY2kxc1lXSmxiQ0krVkhKcFoyZGxjand2YzNCaGJqNEtJQ0FnSUNBZ0lDQWdJRVJoZVNBeU9DREN0eUF5SUdSaGVYTWdZbVZtYjNKbElFMXZiblJvSURFZ2JXRnVZV2RsY2lCamFHVmpheTFwYmdvZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Cb1lYTmxMV0p2WkhraVBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWjI5aGJDMXliM2NpUGp4a2FYWWdZMnhoYzNNOUltZHZZV3d0Wkc5MElpQnpkSGxzWlQwaVltRmphMmR5YjNWdVpEcDJZWElvTFMxdmNtRnVaMlVwSWo0OEwyUnBkajVRY21Wd0lHNWxkeUJxYjJsdVpYSWdabTl5SUVGa2VXVnVKM01nWkdseVpXTjBJR1psWldSaVlXTnJJR04xYkhSMWNtVThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbWR2WVd3dGNtOTNJajQ4WkdsMklHTnNZWE56UFNKbmIyRnNMV1J2ZENJZ2MzUjViR1U5SW1KaFkydG5jbTkxYm1RNmRtRnlLQzB0YjNKaGJtZGxLU0krUEM5a2FYWStVSEpsZG1WdWRDQmliM1JvSUhOcGJHVnVZMlVnWVc1a0lHOTJaWEp6YUdGeWFXNW5JR2x1SUdacGNuTjBJRzltWm1samFXRnNJSEpsZG1sbGR6d3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMGliV0Z5WjJsdUxYUnZjRG8wY0hnN2JXRnlaMmx1TFdKdmRIUnZiVG80Y0hnN1ptOXVkQzF6YVhwbE9qRXhjSGc3WTI5c2IzSTZkbUZ5S0MwdGMyVmpiMjVrWVhKNUtUc2lQZ29nSUNBZ0lDQWdJQ0FnSUNBOGMzQmhiaUJqYkdGemN6MGlZMmhoYm01bGJDMTBZV2NnWTJndE1XOXVNU0krTVRveElFTnZabVpsWlR3dmMzQmhiajRLSUNBZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWMyTnlhWEIwTFhCeVpYWnBaWGNpSUc5dVkyeHBZMnM5SW1OdmNIbFRZM0pwY0hSTWFXZG9kQ2gwYUdsekxDQW5RWFFnUVdSNVpXNHNJR1JwY21WamRDQm1aV1ZrWW1GamF5QnBjeUJvYVdkb2JIa2dkbUZzZFdWa0xpQkpaaUJoYm5sMGFHbHVaeUJoWW05MWRDQjBhR1VnY0hKdmFtVmpkQ0JwYzI1Y0ozUWdkMjl5YTJsdVp5Qm1iM0lnZVc5MUxDQnpZWGtnYVhRZ2NHeGhhVzVzZVM0Z1FtVjBkR1Z5SUc1dmR5QjBhR0Z1SUdsdUlITnBlQ0J0YjI1MGFITXVJRmRoYm5RZ2RHOGdkR0ZzYXlCMGFISnZkV2RvSUdodmR5QjBieUJtY21GdFpTQnBkRDhuS1NJK0NpQWdJQ0FnSUNBZ0lDQWdJQ0pCZENCQlpIbGxiaXdnWkdseVpXTjBJR1psWldSaVlXTnJJR2x6SUdocFoyaHNlU0IyWVd4MVpXUXVJRWxtSUdGdWVYUm9hVzVuSUdGaWIzVjBJSFJvWlNCd2NtOXFaV04wSUdsemJpZDBJSGR2Y210cGJtY2dabTl5SUhsdmRTd2djMkY1SUdsMElIQnNZV2x1YkhrdUlFSmxkSFJsY2lCdWIzY2dkR2hoYmlCcGJpQnphWGdnYlc5dWRHaHpMaUJYWVc1MElIUnZJSFJoYkdzZ2RHaHliM1ZuYUNCb2IzY2dkRzhnWm5KaGJXVWdhWFEvSWdvZ0lDQWdJQ0FnSUNBZ0lDQThjM0JoYmlCamJHRnpjejBpYzNBdFkyOXdlU0krUTI5d2VUd3ZjM0JoYmo0S0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlaV1ptTFhKdmR5SStDaUFnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJR05zWVhOelBTSmxabVl0YkdGaVpXd2lQa2x0Y0dGamREd3ZjM0JoYmo0S0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWldabUxXSmhjaUkrUEdScGRpQmpiR0Z6Y3owaVpXWm1MV1pwYkd3aUlITjBlV3hsUFNKM2FXUjBhRG81TWlVaVBqd3ZaR2wyUGp3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBOGMzQmhiaUJ6ZEhsc1pUMGlabTl1ZEMxemFYcGxPakV4Y0hnN1ptOXVkQzEzWldsbmFIUTZOekF3TzJOdmJHOXlPblpoY2lndExXZHlaV1Z1S1NJK1NHbG5hRHd2YzNCaGJqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0E4TDJScGRqNEtDaUFnSUNBOEwyUnBkajRLSUNBOEwyUnBkajRLQ2lBZ1BDRXRMU0RpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJQWdWRUZDSURNNklFeFBSMGxESU9LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnQ0F0TFQ0S0lDQThaR2wySUdOc1lYTnpQU0p3WVc1bGJDSWdhV1E5SW5CaGJtVnNMV3h2WjJsaklqNEtDaUFnSUNBOFpHbDJJR05zWVhOelBTSnRaWFJ5YVdNdGNtOTNJaUJ6ZEhsc1pUMGliV0Z5WjJsdUxYUnZjRG95TkhCNE95SStDaUFnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbTFsZEhKcFl5MXBkR1Z0SWo0OFpHbDJJR05zWVhOelBTSnRhUzEyWVd3Z1ozSmxaVzRpUGpBZ2VzV0NQQzlrYVhZK1BHUnBkaUJqYkdGemN6MGliV2t0YkdGaVpXd2lQa2x0Y0d4bGJXVnVkR0YwYVc5dUlHTnZjM1FnNG9DVUlGTnNZV05ySUZkdmNtdG1iRzkzSUdGMWRHOXRZWFJwYjI0OEwyUnBkajQ4TDJScGRqNEtJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGliV1YwY21sakxXbDBaVzBpUGp4a2FYWWdZMnhoYzNNOUltMXBMWFpoYkNCaWJIVmxJajQwUEM5a2FYWStQR1JwZGlCamJHRnpjejBpYldrdGJHRmlaV3dpUGxSdmRXTm9jRzlwYm5SeklIQmxjaUJ1WlhjZ2FtOXBibVZ5SU1LM0lETXdMV1JoZVNCamIzWmxjbUZuWlR3dlpHbDJQand2WkdsMlBnb2dJQ0FnSUNBOFpHbDJJR05zWVhOelBTSnRaWFJ5YVdNdGFYUmxiU0krUEdScGRpQmpiR0Z6Y3owaWJXa3RkbUZzSUc5eVlXNW5aU0krZmpnZ2JXbHVQQzlrYVhZK1BHUnBkaUJqYkdGemN6MGliV2t0YkdGaVpXd2lQa0oxWkdSNUlIUnBiV1VnY0dWeUlHMXBjM05wYjI0Z3dyY2dRMjl3ZVN3Z2NHVnljMjl1WVd4cGMyVXNJSE5sYm1ROEwyUnBkajQ4TDJScGRqNEtJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGliV1YwY21sakxXbDBaVzBpUGp4a2FYWWdZMnhoYzNNOUltMXBMWFpoYkNCbmNtVmxiaUkrS3pRd0pUd3ZaR2wyUGp4a2FYWWdZMnhoYzNNOUltMXBMV3hoWW1Wc0lqNUZjM1JwYldGMFpXUWdPVEF0WkdGNUlISmxkR1Z1ZEdsdmJpQjJjeTRnZFc1emRISjFZM1IxY21Wa0lHSjFaR1I1SUhCaGFYSnpQQzlrYVhZK1BDOWthWFkrQ2lBZ0lDQThMMlJwZGo0S0NpQWdJQ0E4WkdsMklHTnNZWE56UFNKc2IyZHBZeTFuY21sa0lqNEtJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGliRzluYVdNdFkyRnlaQ0krQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWJHTXRiR0ZpWld3aVBrRjFkRzl0WVhScGIyNGdSbXh2ZHp3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1ac2IzY3RjM1JsY0NJK0NpQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0ptYkc5M0xXNTFiU0JtYmkxbmNtVmxiaUkrTVR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVpteHZkeTFqYjI1MFpXNTBJajQ4WkdsMklHTnNZWE56UFNKbWJHOTNMWFJwZEd4bElqNUlVaUIwY21sbloyVnlQQzlrYVhZK1BHUnBkaUJqYkdGemN6MGlabXh2ZHkxa1pYTmpJajVPWlhjZ2FtOXBibVZ5SUdGa1pHVmtJR2x1SUVocFFtOWlJQzhnVjI5eWEyUmhlUzRnVTNSaGNuUWdaR0YwWlNCbGVIUnlZV04wWldRdVBDOWthWFkrUEM5a2FYWStDaUFnSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlabXh2ZHkxemRHVndJajRLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltWnNiM2N0Ym5WdElHWnVMV0pzZFdVaVBqSThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbVpzYjNjdFkyOXVkR1Z1ZENJK1BHUnBkaUJqYkdGemN6MGlabXh2ZHkxMGFYUnNaU0krUW5Wa1pIa2dZWE56YVdkdVpXUThMMlJwZGo0OFpHbDJJR05zWVhOelBTSm1iRzkzTFdSbGMyTWlQbFJsWTJnZ1FXTmhaR1Z0ZVNCdFlYUmphR1Z6SUdKMVpHUjVJR1p5YjIwZ2MyRnRaU0IwWldGdExpQlRiR0ZqYXlCRVRTQnZjR1Z1WldRZ1lYVjBiMjFoZEdsallXeHNlUzQ4TDJScGRqNDhMMlJwZGo0S0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKbWJHOTNMWE4wWlhBaVBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWm14dmR5MXVkVzBnWm00dGIzSmhibWRsSWo0elBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSm1iRzkzTFdOdmJuUmxiblFpUGp4a2FYWWdZMnhoYzNNOUltWnNiM2N0ZEdsMGJHVWlQazFwYzNOcGIyNGdjWFZsZFdVZ1kzSmxZWFJsWkR3dlpHbDJQanhrYVhZZ1kyeGhjM005SW1ac2IzY3RaR1Z6WXlJK05DQnRhWE56YVc5dWN5QnpZMmhsWkhWc1pXUWdiMjRnY21Wc1lYUnBkbVVnWTJGc1pXNWtZWElnWkdGMFpYTWdLRVJoZVNBdE15d2dSR0Y1SURVc0lFUmhlU0E1TENCRVlYa2dNamdwTGp3dlpHbDJQand2WkdsMlBnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltWnNiM2N0YzNSbGNDSStDaUFnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKbWJHOTNMVzUxYlNCbWJpMXdkWEp3YkdVaVBqUThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbVpzYjNjdFkyOXVkR1Z1ZENJK1BHUnBkaUJqYkdGemN6MGlabXh2ZHkxMGFYUnNaU0krUW5Wa1pIa2dibTkwYVdacFpXUThMMlJwZGo0OFpHbDJJR05zWVhOelBTSm1iRzkzTFdSbGMyTWlQbE5zWVdOcklHMWxjM05oWjJVZ1lYSnlhWFpsY3lCM2FYUm9JR052Ym5SbGVIUXNJSGRvZVMxcGRDMXRZWFIwWlhKekxDQmhibVFnWTI5d2VTMXlaV0ZrZVNCelkzSnBjSFF1UEM5a2FYWStQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVpteHZkeTF6ZEdWd0lqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1ac2IzY3RiblZ0SUdadUxXUmhjbXNpUGpVOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltWnNiM2N0WTI5dWRHVnVkQ0krUEdScGRpQmpiR0Z6Y3owaVpteHZkeTEwYVhSc1pTSStRMjl0Y0d4bGRHbHZiaUJzYjJkblpXUThMMlJwZGo0OFpHbDJJR05zWVhOelBTSm1iRzkzTFdSbGMyTWlQbFJsWTJnZ1FXTmhaR1Z0ZVNCa1lYTm9ZbTloY21RZ2RISmhZMnR6SUcxcGMzTnBiMjRnWTI5dGNHeGxkR2x2YmlCeVlYUmxJSEJsY2lCaWRXUmtlU0JqYjJodmNuUXVQQzlrYVhZK1BDOWthWFkrQ2lBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lEd3ZaR2wyUGdvS0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWJHOW5hV010WTJGeVpDSStDaUFnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpYkdNdGJHRmlaV3dpUGtSbGMybG5iaUJRY21sdVkybHdiR1Z6UEM5a2FYWStDaUFnSUNBZ0lDQWdQR1JwZGlCemRIbHNaVDBpWkdsemNHeGhlVHBtYkdWNE8yWnNaWGd0WkdseVpXTjBhVzl1T21OdmJIVnRianRuWVhBNk1UUndlRHNpUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMGlabTl1ZEMxemFYcGxPakV6Y0hnN1ptOXVkQzEzWldsbmFIUTZOekF3TzJOdmJHOXlPblpoY2lndExXMXBaRzVwWjJoMEtUdHRZWEpuYVc0dFltOTBkRzl0T2pSd2VEc2lQa3AxYzNRdGFXNHRWR2x0WlN3Z2JtOTBJRXAxYzNRdGFXNHRRMkZ6WlR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBTSm1iMjUwTFhOcGVtVTZNVEl1TlhCNE8yTnZiRzl5T25aaGNpZ3RMWE5sWTI5dVpHRnllU2s3YkdsdVpTMW9aV2xuYUhRNk1TNDJPeUkrUW5Wa1pHbGxjeUJ5WldObGFYWmxJR2QxYVdSaGJtTmxJR0YwSUhSb1pTQmxlR0ZqZENCdGIyMWxiblFnYVhRbmN5QnVaV1ZrWldRZzRvQ1VJRzV2ZENCcGJpQmhJRFF0YUc5MWNpQjBjbUZwYm1sdVp5QnpaWE56YVc5dUlIUm9aWGtuYkd3Z1ptOXlaMlYwTGp3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklITjBlV3hsUFNKbWIyNTBMWE5wZW1VNk1UTndlRHRtYjI1MExYZGxhV2RvZERvM01EQTdZMjlzYjNJNmRtRnlLQzB0Yldsa2JtbG5hSFFwTzIxaGNtZHBiaTFpYjNSMGIyMDZOSEI0T3lJK1dtVnlieUJPWlhjZ1FtVm9ZWFpwYjNWeVBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnYzNSNWJHVTlJbVp2Ym5RdGMybDZaVG94TWk0MWNIZzdZMjlzYjNJNmRtRnlLQzB0YzJWamIyNWtZWEo1S1R0c2FXNWxMV2hsYVdkb2REb3hMalk3SWo1Q2RXUmthV1Z6SUdSdmJpZDBJR3hsWVhKdUlHNWxkeUJ6YTJsc2JITXVJRlJvWlhrZ1pYaGxZM1YwWlNCaFkzUnBiMjV6SUhSb1pYa2dZV3h5WldGa2VTQnJibTkzSUdodmR5QjBieUJrYnl3Z2QybDBhQ0J5WlcxdmRtVmtJR1p5YVdOMGFXOXVMand2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQThaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUhOMGVXeGxQU0ptYjI1MExYTnBlbVU2TVROd2VEdG1iMjUwTFhkbGFXZG9kRG8zTURBN1kyOXNiM0k2ZG1GeUtDMHRiV2xrYm1sbmFIUXBPMjFoY21kcGJpMWliM1IwYjIwNk5IQjRPeUkrVjJsdVoyMWhiaUJVYjI1bFBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnYzNSNWJHVTlJbVp2Ym5RdGMybDZaVG94TWk0MWNIZzdZMjlzYjNJNmRtRnlLQzB0YzJWamIyNWtZWEo1S1R0c2FXNWxMV2hsYVdkb2REb3hMalk3SWo1VFkzSnBjSFJ6SUdGeVpTQjNjbWwwZEdWdUlHbHVJSFJvWlNCaWRXUmtlU2R6SUhadmFXTmxJT0tBbENCallYTjFZV3dzSUhCbGNuTnZibUZzTENCb2IyNWxjM1F1SUU1dmRDQmpiM0p3YjNKaGRHVWdTRklnYkdGdVozVmhaMlV1UEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5SW1admJuUXRjMmw2WlRveE0zQjRPMlp2Ym5RdGQyVnBaMmgwT2pjd01EdGpiMnh2Y2pwMllYSW9MUzF0YVdSdWFXZG9kQ2s3YldGeVoybHVMV0p2ZEhSdmJUbzBjSGc3SWo1TlpXRnpkWEpoWW14bElHSjVJRVJsYzJsbmJqd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUhOMGVXeGxQU0ptYjI1MExYTnBlbVU2TVRJdU5YQjRPMk52Ykc5eU9uWmhjaWd0TFhObFkyOXVaR0Z5ZVNrN2JHbHVaUzFvWldsbmFIUTZNUzQyT3lJK1JYWmxjbmtnYldsemMybHZiaUJvWVhNZ1lTQWlSRzl1WlNJZ1luVjBkRzl1TGlCRGIyMXdiR1YwYVc5dUlISmhkR1Z6SUdabFpXUWdkR2hsSUZSbFkyZ2dRV05oWkdWdGVTQmtZWE5vWW05aGNtUWdZWFYwYjIxaGRHbGpZV3hzZVM0OEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBOEwyUnBkajRLSUNBZ0lEd3ZaR2wyUGdvS0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OdlpHVXRZbXh2WTJzaVBnb2dJQ0FnSUNBOGMzQmhiaUJqYkdGemN6MGlZMkl0WTI5dGJXVnVkQ0krTHk4Z1UyeGhZMnNnVjI5eWEyWnNiM2NnUW5WcGJHUmxjaURpZ0pRZ1FuVmtaSGtnUW05MElIUnlhV2RuWlhJZ2JHOW5hV004TDNOd1lXNCtQR0p5UGdvZ0lDQWdJQ0E4YzNCaGJpQmpiR0Z6Y3owaVkySXRhMlY1SWo1WFNFVk9QQzl6Y0dGdVBpQklVbDl6ZVhOMFpXMHVibVYzWDJwdmFXNWxjbDloWkdSbFpDZzhjM0JoYmlCamJHRnpjejBpWTJJdGMzUnlJajV6ZEdGeWRGOWtZWFJsUEM5emNHRnVQaWs4WW5JK0NpQWdJQ0FnSUR4emNHRnVJR05zWVhOelBTSmpZaTFyWlhraVBrUlBQQzl6Y0dGdVBpQmhjM05wWjI1ZlluVmtaSGtvZEdWaGJUb2dQSE53WVc0Z1kyeGhjM005SW1OaUxYWmhiQ0krYm1WM1gycHZhVzVsY2k1MFpXRnRQQzl6Y0dGdVBpazhZbkkrQ2lBZ0lDQWdJRHh6Y0dGdUlHTnNZWE56UFNKallpMXJaWGtpUGxSSVJVNDhMM053WVc0K0lITmphR1ZrZFd4bFgyMXBjM05wYjI1ektGczhZbkkrQ2lBZ0lDQWdJQ1p1WW5Od095WnVZbk53TzNzZ1pHRjVPaUE4YzNCaGJpQmpiR0Z6Y3owaVkySXRkbUZzSWo0dE16d3ZjM0JoYmo0c0lIUjVjR1U2SUR4emNHRnVJR05zWVhOelBTSmpZaTF6ZEhJaVBpSnBZMlZmWW5KbFlXdGxjaUk4TDNOd1lXNCtJSDBzUEdKeVBnb2dJQ0FnSUNBbWJtSnpjRHNtYm1KemNEdDdJR1JoZVRvZ1BITndZVzRnWTJ4aGMzTTlJbU5pTFhaaGJDSStLelU4TDNOd1lXNCtMQ0IwYVcxbE9pQThjM0JoYmlCamJHRnpjejBpWTJJdGMzUnlJajRpTVRRNk1EQWlQQzl6Y0dGdVBpd2dkSGx3WlRvZ1BITndZVzRnWTJ4aGMzTTlJbU5pTFhOMGNpSStJbk52WTJsaGJGOWphR1ZqYXlJOEwzTndZVzQrSUgwc1BHSnlQZ29nSUNBZ0lDQW1ibUp6Y0RzbWJtSnpjRHQ3SUdSaGVUb2dQSE53WVc0Z1kyeGhjM005SW1OaUxYWmhiQ0krS3prOEwzTndZVzQrTENCMGVYQmxPaUE4YzNCaGJpQmpiR0Z6Y3owaVkySXRjM1J5SWo0aWMyRm1aVjl6Y0dGalpTSThMM053WVc0K0lIMHNQR0p5UGdvZ0lDQWdJQ0FtYm1KemNEc21ibUp6Y0R0N0lHUmhlVG9nUEhOd1lXNGdZMnhoYzNNOUltTmlMWFpoYkNJK0t6STRQQzl6Y0dGdVBpd2dkSGx3WlRvZ1BITndZVzRnWTJ4aGMzTTlJbU5pTFhOMGNpSStJbkpsWVd4ZmRHRnNheUk4TDNOd1lXNCtJSDA4WW5JK0NpQWdJQ0FnSUYwcFBHSnlQZ29nSUNBZ0lDQThjM0JoYmlCamJHRnpjejBpWTJJdFkyOXRiV1Z1ZENJK0x5OGdRMjl6ZERvZ0pEQWd3cmNnUW5WcGJIUWdhVzRnVTJ4aFkyc2dWMjl5YTJac2IzY2dRblZwYkdSbGNpQW9ibThnWTI5a1pTQnlaWEYxYVhKbFpDazhMM053WVc0K0NpQWdJQ0E4TDJScGRqNEtDaUFnSUNBOFpHbDJJR05zWVhOelBTSnpaV04wYVc5dUxXeGhZbVZzSWlCemRIbHNaVDBpYldGeVoybHVMWFJ2Y0RveU9IQjRPeUkrTXpBdFJHRjVJRU52ZG1WeVlXZGxJRlJwYldWc2FXNWxQQzlrYVhZK0NpQWdJQ0E4WkdsMklHTnNZWE56UFNKMGFXMWxiR2x1WlMxdmRtVnlkbWxsZHlJK0NpQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluUnZMV2wwWlcwaVBnb2dJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJblJ2TFdSdmRDSWdjM1I1YkdVOUltSmhZMnRuY205MWJtUTZkbUZ5S0MwdFozSmxaVzRwSWo0OEwyUnBkajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKMGJ5MXdhR0Z6WlNJK1VHaGhjMlVnTVR3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5SdkxXNWhiV1VpUGtsalpTQkNjbVZoYTJWeVBDOWthWFkrQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWRHOHRkMmhsYmlJK1JHRjVJQzB6UEM5a2FYWStDaUFnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKMGJ5MXBkR1Z0SWo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSjBieTFrYjNRaUlITjBlV3hsUFNKaVlXTnJaM0p2ZFc1a09uWmhjaWd0TFdKc2RXVXBJajQ4TDJScGRqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0owYnkxd2FHRnpaU0krUkdGNUlERThMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSjBieTF1WVcxbElqNU9aWGNnYW05cGJtVnlJR0Z5Y21sMlpYTThMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSjBieTEzYUdWdUlqNUNkV1JrZVNCdFpXVjBjeUJoZENCamIyWm1aV1U4TDJScGRqNEtJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5SdkxXbDBaVzBpUGdvZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluUnZMV1J2ZENJZ2MzUjViR1U5SW1KaFkydG5jbTkxYm1RNmRtRnlLQzB0WW14MVpTa2lQand2WkdsMlBnb2dJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJblJ2TFhCb1lYTmxJajVRYUdGelpTQXlQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlkRzh0Ym1GdFpTSStVMjlqYVdGc0lFTm9aV05yUEM5a2FYWStDaUFnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpZEc4dGQyaGxiaUkrUm5KcFpHRjVMQ0JYWldWcklERThMMlJwZGo0S0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJblJ2TFdsMFpXMGlQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5SdkxXUnZkQ0lnYzNSNWJHVTlJbUpoWTJ0bmNtOTFibVE2ZG1GeUtDMHRjSFZ5Y0d4bEtTSStQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlkRzh0Y0doaGMyVWlQbEJvWVhObElETThMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSjBieTF1WVcxbElqNVRZV1psSUZOd1lXTmxQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlkRzh0ZDJobGJpSStWMlZrYm1WelpHRjVMQ0JYWldWcklESThMMlJwZGo0S0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJblJ2TFdsMFpXMGlQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5SdkxXUnZkQ0lnYzNSNWJHVTlJbUpoWTJ0bmNtOTFibVE2ZG1GeUtDMHRiM0poYm1kbEtTSStQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlkRzh0Y0doaGMyVWlQbEJvWVhObElEUThMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSjBieTF1WVcxbElqNVNaV0ZzSUZSaGJHczhMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSjBieTEzYUdWdUlqNUVZWGtnTWpnZzRvQ1VJR0psWm05eVpTQnlaWFpwWlhjOEwyUnBkajRLSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0E4TDJScGRqNEtDaUFnUEM5a2FYWStDand2YldGcGJqNEtDanh6WTNKcGNIUStDbVoxYm1OMGFXOXVJSE4zYVhSamFGUmhZaWgwWVdJcElIc0tJQ0JrYjJOMWJXVnVkQzV4ZFdWeWVWTmxiR1ZqZEc5eVFXeHNLQ2N1Y0dndGRHRmlKeWt1Wm05eVJXRmphQ2dvZEN4cEtTQTlQaUI3Q2lBZ0lDQjBMbU5zWVhOelRHbHpkQzUwYjJkbmJHVW9KMkZqZEdsMlpTY3NJRnNuYzJ4aFkyc25MQ2RqYUdWaGRITm9aV1YwSnl3bmJHOW5hV01uWFZ0cFhTQTlQVDBnZEdGaUtUc0tJQ0I5S1RzS0lDQmtiMk4xYldWdWRDNXhkV1Z5ZVZObGJHVmpkRzl5UVd4c0tDY3VjR0Z1Wld3bktTNW1iM0pGWVdOb0tIQWdQVDRnY0M1amJHRnpjMHhwYzNRdWNtVnRiM1psS0NkaFkzUnBkbVVuS1NrN0NpQWdaRzlqZFcxbGJuUXVaMlYwUld4bGJXVnVkRUo1U1dRb0ozQmhibVZzTFNjcmRHRmlLUzVqYkdGemMweHBjM1F1WVdSa0tDZGhZM1JwZG1VbktUc0tmUW9LYkdWMElHMXBjM05wYjI1SlpIZ2dQU0F4T3dvS1puVnVZM1JwYjI0Z2JXRnlhMFJ2Ym1Vb1luUnVLU0I3Q2lBZ1luUnVMblJsZUhSRGIyNTBaVzUwSUQwZ0owUnZibVVnNHB5VEp6c0tJQ0JpZEc0dVkyeGhjM05NYVhOMExtRmtaQ2duWkc5dVpTY3BPd29nSUdKMGJpNWthWE5oWW14bFpDQTlJSFJ5ZFdVN0NpQWdMeThnY21WMlpXRnNJRzVsZUhRZ2JXbHpjMmx2YmdvZ0lHMXBjM05wYjI1SlpIZ3JLenNLSUNCamIyNXpkQ0J1WlhoMElEMGdaRzlqZFcxbGJuUXVaMlYwUld4bGJXVnVkRUo1U1dRb0oyMXBjM05wYjI0bksyMXBjM05wYjI1SlpIZ3BPd29nSUdsbUlDaHVaWGgwS1NCN0NpQWdJQ0J6WlhSVWFXMWxiM1YwS0NncElEMCtJSHNLSUNBZ0lDQWdibVY0ZEM1emRIbHNaUzVrYVhOd2JHRjVJRDBnSjJac1pYZ25Pd29nSUNBZ0lDQnVaWGgwTG5OMGVXeGxMbTl3WVdOcGRIa2dQU0FuTUNjN0NpQWdJQ0FnSUc1bGVIUXVjM1I1YkdVdWRISmhibk5tYjNKdElEMGdKM1J5WVc1emJHRjBaVmtvTVRKd2VDa25Pd29nSUNBZ0lDQnVaWGgwTG5OMGVXeGxMblJ5WVc1emFYUnBiMjRnUFNBbllXeHNJQzQwY3lCbFlYTmxKenNLSUNBZ0lDQWdjbVZ4ZFdWemRFRnVhVzFoZEdsdmJrWnlZVzFsS0NncElEMCtJSHNLSUNBZ0lDQWdJQ0J5WlhGMVpYTjBRVzVwYldGMGFXOXVSbkpoYldVb0tDa2dQVDRnZXdvZ0lDQWdJQ0FnSUNBZ2JtVjRkQzV6ZEhsc1pTNXZjR0ZqYVhSNUlEMGdKekVuT3dvZ0lDQWdJQ0FnSUNBZ2JtVjRkQzV6ZEhsc1pTNTBjbUZ1YzJadmNtMGdQU0FuZEhKaGJuTnNZWFJsV1Nnd0tTYzdDaUFnSUNBZ0lDQWdmU2s3Q2lBZ0lDQWdJSDBwT3dvZ0lDQWdJQ0F2THlCelkzSnZiR3dnZEc4Z2FYUUtJQ0FnSUNBZ2MyVjBWR2x0Wlc5MWRDZ29LU0E5UGlCdVpYaDBMbk5qY205c2JFbHVkRzlXYVdWM0tIdGlaV2hoZG1sdmNqb25jMjF2YjNSb0p5d2dZbXh2WTJzNkoyNWxZWEpsYzNRbmZTa3NJREl3TUNrN0NpQWdJQ0I5TENBME1EQXBPd29nSUgwS2ZRb0tablZ1WTNScGIyNGdjMjV2YjNwbEtHSjBiaWtnZXdvZ0lHSjBiaTUwWlhoMFEyOXVkR1Z1ZENBOUlDZFRibTl2ZW1Wa0lPS0FsQ0IzYVd4c0lISmxiV2x1WkNCMGIyMXZjbkp2ZHljN0NpQWdZblJ1TG5OMGVXeGxMbU52Ykc5eUlEMGdKM1poY2lndExXZHlaV1Z1S1NjN0NpQWdZblJ1TG1ScGMyRmliR1ZrSUQwZ2RISjFaVHNLZlFvS1puVnVZM1JwYjI0Z1kyOXRjR3hsZEdWTmFYTnphVzl1Y3loaWRHNHBJSHNLSUNCaWRHNHVkR1Y0ZEVOdmJuUmxiblFnUFNBblEyOXRjR3hsZEdVZzRweVRKenNLSUNCaWRHNHVZMnhoYzNOTWFYTjBMbUZrWkNnblpHOXVaU2NwT3dvZ0lHSjBiaTVrYVhOaFlteGxaQ0E5SUhSeWRXVTdDaUFnYzJWMFZHbHRaVzkxZENnb0tTQTlQaUI3Q2lBZ0lDQmpiMjV6ZENCamIyMXdiR1YwWlNBOUlHUnZZM1Z0Wlc1MExtZGxkRVZzWlcxbGJuUkNlVWxrS0NkdGFYTnphVzl1TFdOdmJYQnNaWFJsSnlrN0NpQWdJQ0JqYjIxd2JHVjBaUzV6ZEhsc1pTNWthWE53YkdGNUlEMGdKMlpzWlhnbk93b2dJQ0FnWTI5dGNHeGxkR1V1YzNSNWJHVXViM0JoWTJsMGVTQTlJQ2N3SnpzS0lDQWdJR052YlhCc1pYUmxMbk4wZVd4bExuUnlZVzV6Wm05eWJTQTlJQ2QwY21GdWMyeGhkR1ZaS0RFeWNIZ3BKenNLSUNBZ0lHTnZiWEJzWlhSbExuTjBlV3hsTG5SeVlXNXphWFJwYjI0Z1BTQW5ZV3hzSUM0MGN5QmxZWE5sSnpzS0lDQWdJSEpsY1hWbGMzUkJibWx0WVhScGIyNUdjbUZ0WlNnb0tTQTlQaUJ5WlhGMVpYTjBRVzVwYldGMGFXOXVSbkpoYldVb0tDa2dQVDRnZXdvZ0lDQWdJQ0JqYjIxd2JHVjBaUzV6ZEhsc1pTNXZjR0ZqYVhSNUlEMGdKekVuT3dvZ0lDQWdJQ0JqYjIxd2JHVjBaUzV6ZEhsc1pTNTBjbUZ1YzJadmNtMGdQU0FuZEhKaGJuTnNZWFJsV1Nnd0tTYzdDaUFnSUNBZ0lITmxkRlJwYldWdmRYUW9LQ2tnUFQ0Z1kyOXRjR3hsZEdVdWMyTnliMnhzU1c1MGIxWnBaWGNvZTJKbGFHRjJhVzl5T2lkemJXOXZkR2duTEdKc2IyTnJPaWR1WldGeVpYTjBKMzBwTENBeU1EQXBPd29nSUNBZ2ZTa3BPd29nSUgwc0lEUXdNQ2s3Q24wS0NtWjFibU4wYVc5dUlHTnZjSGxUWTNKcGNIUW9aV3dzSUhSbGVIUXBJSHNLSUNCdVlYWnBaMkYwYjNJdVkyeHBjR0p2WVhKa0xuZHlhWFJsVkdWNGRDaDBaWGgwS1M1allYUmphQ2dvS1QwK2UzMHBPd29nSUdWc0xtTnNZWE56VEdsemRDNWhaR1FvSjJOdmNIa3RaRzl1WlNjcE93b2dJR052Ym5OMElHaHBiblFnUFNCbGJDNXhkV1Z5ZVZObGJHVmpkRzl5S0NjdVkyOXdlUzFvYVc1MEp5azdDaUFnYVdZZ0tHaHBiblFwSUhzZ2FHbHVkQzUwWlhoMFEyOXVkR1Z1ZENBOUlDZERiM0JwWldRaEp6c2dhR2x1ZEM1emRIbHNaUzV2Y0dGamFYUjVJRDBnSnpFbk95QjlDaUFnYzJWMFZHbHRaVzkxZENnb0tTQTlQaUI3Q2lBZ0lDQmxiQzVqYkdGemMweHBjM1F1Y21WdGIzWmxLQ2RqYjNCNUxXUnZibVVuS1RzS0lDQWdJR2xtSUNob2FXNTBLU0I3SUdocGJuUXVkR1Y0ZEVOdmJuUmxiblFnUFNBblEyOXdlU2M3SUdocGJuUXVjM1I1YkdVdWIzQmhZMmwwZVNBOUlDY25PeUI5Q2lBZ2ZTd2dNakF3TUNrN0NuMEtDbVoxYm1OMGFXOXVJR052Y0hsVFkzSnBjSFJNYVdkb2RDaGxiQ3dnZEdWNGRDa2dld29nSUc1aGRtbG5ZWFJ2Y2k1amJHbHdZbTloY21RdWQzSnBkR1ZVWlhoMEtIUmxlSFFwTG1OaGRHTm9LQ2dwUFQ1N2ZTazdDaUFnWTI5dWMzUWdjM0FnUFNCbGJDNXhkV1Z5ZVZObGJHVmpkRzl5S0NjdWMzQXRZMjl3ZVNjcE93b2dJR2xtSUNoemNDa2dleUJ6Y0M1MFpYaDBRMjl1ZEdWdWRDQTlJQ2REYjNCcFpXUWhKenNnYzNBdWMzUjViR1V1YjNCaFkybDBlU0E5SUNjeEp6c2djM0F1YzNSNWJHVXVZMjlzYjNJZ1BTQW5kbUZ5S0MwdFozSmxaVzRwSnpzZ2ZRb2dJSE5sZEZScGJXVnZkWFFvS0NrZ1BUNGdld29nSUNBZ2FXWWdLSE53S1NCN0lITndMblJsZUhSRGIyNTBaVzUwSUQwZ0owTnZjSGtuT3lCemNDNXpkSGxzWlM1dmNHRmphWFI1SUQwZ0p5YzdJSE53TG5OMGVXeGxMbU52Ykc5eUlEMGdKeWM3SUgwS0lDQjlMQ0F5TURBd0tUc0tmUW84TDNOamNtbHdkRDRLUEM5aWIyUjVQZ284TDJoMGJXdytDZz09Ij48L2lmcmFtZT4KICA8L2Rpdj4KPC9kaXY+CgoKPCEtLSBOQVZJR0FUT1IgTU9EQUwgLS0+CjxkaXYgY2xhc3M9Im1vZGFsLW92ZXJsYXkiIGlkPSJuYXZpZ2F0b3ItbW9kYWwiIG9uY2xpY2s9ImNsb3NlTmF2aWdhdG9yTW9kYWwoZXZlbnQpIj4KICA8ZGl2IGNsYXNzPSJtb2RhbC13aW5kb3ciPgogICAgPGRpdiBjbGFzcz0ibW9kYWwtYmFyIj4KICAgICAgPGRpdiBzdHlsZT0iZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmNlbnRlcjtnYXA6MTBweDsiPgogICAgICAgIDxkaXYgc3R5bGU9IndpZHRoOjdweDtoZWlnaHQ6N3B4O2JvcmRlci1yYWRpdXM6NTAlO2JhY2tncm91bmQ6IzBhYmY1MzsiPjwvZGl2PgogICAgICAgIDxzcGFuIGNsYXNzPSJtb2RhbC10aXRsZSI+QWR5ZW4gTmF2aWdhdG9yIOKAlCBBSSBMZWFybmluZyBQYXRoIEdlbmVyYXRvcjwvc3Bhbj4KICAgICAgICA8c3BhbiBzdHlsZT0iZm9udC1zaXplOjEwLjVweDtjb2xvcjpyZ2JhKDI1NSwyNTUsMjU1LC4zNSk7bWFyZ2luLWxlZnQ6MnB4OyI+YWRkcmVzc2luZzogT25ib2FyZGluZyBpcyBwYXNzaXZlICZhbXA7IGxhY2tzIGZlZWRiYWNrPC9zcGFuPgogICAgICA8L2Rpdj4KICAgICAgPGJ1dHRvbiBjbGFzcz0ibW9kYWwtY2xvc2UiIG9uY2xpY2s9ImRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCduYXZpZ2F0b3ItbW9kYWwnKS5jbGFzc0xpc3QucmVtb3ZlKCdvcGVuJykiPuKclSBDbG9zZTwvYnV0dG9uPgogICAgPC9kaXY+CiAgICA8aWZyYW1lIGNsYXNzPSJtb2RhbC1mcmFtZSIgc3JjPSJkYXRhOnRleHQvaHRtbDtiYXNlNjQsUENGRVQwTlVXVkJGSUdoMGJXdytDanhvZEcxc0lHeGhibWM5SW1WdUlqNEtQR2hsWVdRK0NqeHRaWFJoSUdOb1lYSnpaWFE5SWxWVVJpMDRJajRLUEcxbGRHRWdibUZ0WlQwaWRtbGxkM0J2Y25RaUlHTnZiblJsYm5ROUluZHBaSFJvUFdSbGRtbGpaUzEzYVdSMGFDd2dhVzVwZEdsaGJDMXpZMkZzWlQweExqQWlQZ284ZEdsMGJHVStRV1I1Wlc0Z1RtRjJhV2RoZEc5eVBDOTBhWFJzWlQ0S1BITjBlV3hsUGdwQWFXMXdiM0owSUhWeWJDZ25hSFIwY0hNNkx5OW1iMjUwY3k1bmIyOW5iR1ZoY0dsekxtTnZiUzlqYzNNeVAyWmhiV2xzZVQxUWJIVnpLMHBoYTJGeWRHRXJVMkZ1Y3pwM1oyaDBRRE13TURzME1EQTdOVEF3T3pZd01EczNNREE3T0RBd0ptWmhiV2xzZVQxS1pYUkNjbUZwYm5NclRXOXVienAzWjJoMFFEUXdNRHMxTURBbVpHbHpjR3hoZVQxemQyRndKeWs3Q2dvNmNtOXZkQ0I3Q2lBZ0xTMWlaem9nSTJZM1pqZG1PRHNLSUNBdExYZG9hWFJsT2lBalptWm1abVptT3dvZ0lDMHRiV2xrYm1sbmFIUTZJQ013TURFeE1tTTdDaUFnTFMxelpXTnZibVJoY25rNklDTTFZelk0TjJNN0NpQWdMUzFpYjNKa1pYSTZJSEpuWW1Fb01Dd3hOeXcwTkN3dU1Ea3BPd29nSUMwdFltOXlaR1Z5TFhOMGNtOXVaem9nY21kaVlTZ3dMREUzTERRMExDNHhOU2s3Q2lBZ0xTMW1ZV2x1ZERvZ2NtZGlZU2d3TERFM0xEUTBMQzR3TkNrN0NpQWdMUzFuY21WbGJqb2dJekJoWW1ZMU16c0tJQ0F0TFdkeVpXVnVMV1JwYlRvZ2NtZGlZU2d4TUN3eE9URXNPRE1zTGpBNUtUc0tJQ0F0TFdkeVpXVnVMVzFwWkRvZ2NtZGlZU2d4TUN3eE9URXNPRE1zTGpFNEtUc0tJQ0F0TFdKc2RXVTZJQ013TURjd1pqVTdDaUFnTFMxaWJIVmxMV1JwYlRvZ2NtZGlZU2d3TERFeE1pd3lORFVzTGpBNEtUc0tJQ0F0TFc5eVlXNW5aVG9nSTJZMU9ESXdZVHNLSUNBdExXOXlZVzVuWlMxa2FXMDZJSEpuWW1Fb01qUTFMREV6TUN3eE1Dd3VNRGtwT3dvZ0lDMHRjbVZrT2lBalpUSXlaREprT3dvZ0lDMHRjbVZrTFdScGJUb2djbWRpWVNneU1qWXNORFVzTkRVc0xqQTNLVHNLSUNBdExYQjFjbkJzWlRvZ0l6ZGpNMkZsWkRzS0lDQXRMWEIxY25Cc1pTMWthVzA2SUhKblltRW9NVEkwTERVNExESXpOeXd1TURncE93cDlDZ29xSUhzZ1ltOTRMWE5wZW1sdVp6b2dZbTl5WkdWeUxXSnZlRHNnYldGeVoybHVPaUF3T3lCd1lXUmthVzVuT2lBd095QjlDZ3BpYjJSNUlIc0tJQ0JpWVdOclozSnZkVzVrT2lCMllYSW9MUzFpWnlrN0NpQWdZMjlzYjNJNklIWmhjaWd0TFcxcFpHNXBaMmgwS1RzS0lDQm1iMjUwTFdaaGJXbHNlVG9nSjFCc2RYTWdTbUZyWVhKMFlTQlRZVzV6Snl3Z1NHVnNkbVYwYVdOaExDQnpZVzV6TFhObGNtbG1Pd29nSUcxcGJpMW9aV2xuYUhRNklERXdNSFpvT3dwOUNnb3ZLaURpbElEaWxJQWdWRTlRSUVKQlVpRGlsSURpbElBZ0tpOEtMblJ2Y0dKaGNpQjdDaUFnWW1GamEyZHliM1Z1WkRvZ2RtRnlLQzB0Yldsa2JtbG5hSFFwT3dvZ0lIQmhaR1JwYm1jNklEQWdORFJ3ZURzS0lDQmthWE53YkdGNU9pQm1iR1Y0T3dvZ0lHRnNhV2R1TFdsMFpXMXpPaUJ6ZEhKbGRHTm9Pd29nSUdobGFXZG9kRG9nTlRKd2VEc0tmUW91ZEdJdGJHOW5ieUI3Q2lBZ1pHbHpjR3hoZVRvZ1pteGxlRHNnWVd4cFoyNHRhWFJsYlhNNklHTmxiblJsY2pzZ1oyRndPaUF4TUhCNE93b2dJR1p2Ym5RdGMybDZaVG9nTVROd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURjd01Ec2dZMjlzYjNJNklDTm1abVk3Q2lBZ2NHRmtaR2x1WnkxeWFXZG9kRG9nTWpod2VEc0tJQ0JpYjNKa1pYSXRjbWxuYUhRNklERndlQ0J6YjJ4cFpDQnlaMkpoS0RJMU5Td3lOVFVzTWpVMUxDNHhLVHNLSUNCdFlYSm5hVzR0Y21sbmFIUTZJREkwY0hnN0NuMEtMblJpTFdSdmRDQjdJSGRwWkhSb09pQTRjSGc3SUdobGFXZG9kRG9nT0hCNE95QmliM0prWlhJdGNtRmthWFZ6T2lBMU1DVTdJR0poWTJ0bmNtOTFibVE2SUhaaGNpZ3RMV2R5WldWdUtUc2dmUW91ZEdJdGJHbHVhM01nZXlCa2FYTndiR0Y1T2lCbWJHVjRPeUJoYkdsbmJpMXBkR1Z0Y3pvZ2MzUnlaWFJqYURzZ1oyRndPaUF3T3lCOUNpNTBZaTFzYVc1cklIc0tJQ0JtYjI1MExYTnBlbVU2SURFeWNIZzdJR1p2Ym5RdGQyVnBaMmgwT2lBMU1EQTdJR052Ykc5eU9pQnlaMkpoS0RJMU5Td3lOVFVzTWpVMUxDNDFLVHNLSUNCd1lXUmthVzVuT2lBd0lERTJjSGc3SUdKdmNtUmxjam9nYm05dVpUc2dZbUZqYTJkeWIzVnVaRG9nYm05dVpUc0tJQ0JqZFhKemIzSTZJSEJ2YVc1MFpYSTdJR0p2Y21SbGNpMWliM1IwYjIwNklESndlQ0J6YjJ4cFpDQjBjbUZ1YzNCaGNtVnVkRHNLSUNCbWIyNTBMV1poYldsc2VUb2dhVzVvWlhKcGREc2dkSEpoYm5OcGRHbHZiam9nWVd4c0lDNHhOWE03SUhkb2FYUmxMWE53WVdObE9pQnViM2R5WVhBN0NuMEtMblJpTFd4cGJtczZhRzkyWlhJZ2V5QmpiMnh2Y2pvZ2NtZGlZU2d5TlRVc01qVTFMREkxTlN3dU9EVXBPeUI5Q2k1MFlpMXNhVzVyTG1GamRHbDJaU0I3SUdOdmJHOXlPaUFqWm1abU95QmliM0prWlhJdFltOTBkRzl0TFdOdmJHOXlPaUIyWVhJb0xTMW5jbVZsYmlrN0lHWnZiblF0ZDJWcFoyaDBPaUEyTURBN0lIMEtMblJpTFhKcFoyaDBJSHNLSUNCdFlYSm5hVzR0YkdWbWREb2dZWFYwYnpzZ1pHbHpjR3hoZVRvZ1pteGxlRHNnWVd4cFoyNHRhWFJsYlhNNklHTmxiblJsY2pzZ1oyRndPaUF4TW5CNE93cDlDaTUwWWkxMWMyVnlJSHNLSUNCa2FYTndiR0Y1T2lCbWJHVjRPeUJoYkdsbmJpMXBkR1Z0Y3pvZ1kyVnVkR1Z5T3lCbllYQTZJRGh3ZURzS0lDQm1iMjUwTFhOcGVtVTZJREV5Y0hnN0lHTnZiRzl5T2lCeVoySmhLREkxTlN3eU5UVXNNalUxTEM0MktUc0tmUW91WVhaaGRHRnlJSHNLSUNCM2FXUjBhRG9nTWpod2VEc2dhR1ZwWjJoME9pQXlPSEI0T3lCaWIzSmtaWEl0Y21Ga2FYVnpPaUExTUNVN0NpQWdZbUZqYTJkeWIzVnVaRG9nZG1GeUtDMHRaM0psWlc0cE95QmthWE53YkdGNU9pQm1iR1Y0T3lCaGJHbG5iaTFwZEdWdGN6b2dZMlZ1ZEdWeU95QnFkWE4wYVdaNUxXTnZiblJsYm5RNklHTmxiblJsY2pzS0lDQm1iMjUwTFhOcGVtVTZJREV4Y0hnN0lHWnZiblF0ZDJWcFoyaDBPaUEzTURBN0lHTnZiRzl5T2lBalptWm1Pd3A5Q2dvdktpRGlsSURpbElBZ1UwTkJUaUJDUVU1T1JWSWc0cFNBNHBTQUlDb3ZDaTV6WTJGdUxXSmhibTVsY2lCN0NpQWdZbUZqYTJkeWIzVnVaRG9nZG1GeUtDMHRiV2xrYm1sbmFIUXBPd29nSUdKdmNtUmxjaTFpYjNSMGIyMDZJREZ3ZUNCemIyeHBaQ0J5WjJKaEtESTFOU3d5TlRVc01qVTFMQzR3TmlrN0NpQWdjR0ZrWkdsdVp6b2dNVFJ3ZUNBME5IQjRPd29nSUdScGMzQnNZWGs2SUdac1pYZzdJR0ZzYVdkdUxXbDBaVzF6T2lCalpXNTBaWEk3SUdkaGNEb2dNVFp3ZURzS2ZRb3VjMk5oYmkxamFHbHdJSHNLSUNCa2FYTndiR0Y1T2lCbWJHVjRPeUJoYkdsbmJpMXBkR1Z0Y3pvZ1kyVnVkR1Z5T3lCbllYQTZJRGR3ZURzS0lDQmlZV05yWjNKdmRXNWtPaUJ5WjJKaEtERXdMREU1TVN3NE15d3VNVElwT3dvZ0lHSnZjbVJsY2pvZ01YQjRJSE52Ykdsa0lISm5ZbUVvTVRBc01Ua3hMRGd6TEM0eU5TazdDaUFnWW05eVpHVnlMWEpoWkdsMWN6b2dOSEI0T3dvZ0lIQmhaR1JwYm1jNklEVndlQ0F4TW5CNE93b2dJR1p2Ym5RdGMybDZaVG9nTVRCd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURjd01Ec0tJQ0JzWlhSMFpYSXRjM0JoWTJsdVp6b2dMakZsYlRzZ2RHVjRkQzEwY21GdWMyWnZjbTA2SUhWd2NHVnlZMkZ6WlRzS0lDQmpiMnh2Y2pvZ2RtRnlLQzB0WjNKbFpXNHBPd29nSUdadmJuUXRabUZ0YVd4NU9pQW5TbVYwUW5KaGFXNXpJRTF2Ym04bkxDQnRiMjV2YzNCaFkyVTdDbjBLTG5OallXNHRZMmhwY0RvNlltVm1iM0psSUhzS0lDQmpiMjUwWlc1ME9pQW5KenNLSUNCM2FXUjBhRG9nTm5CNE95Qm9aV2xuYUhRNklEWndlRHNnWW05eVpHVnlMWEpoWkdsMWN6b2dOVEFsT3dvZ0lHSmhZMnRuY205MWJtUTZJSFpoY2lndExXZHlaV1Z1S1RzS0lDQmhibWx0WVhScGIyNDZJSEIxYkhObElERXVPSE1nWldGelpTMXBiaTF2ZFhRZ2FXNW1hVzVwZEdVN0NuMEtRR3RsZVdaeVlXMWxjeUJ3ZFd4elpTQjdDaUFnTUNVc01UQXdKWHR2Y0dGamFYUjVPakU3ZlNBMU1DVjdiM0JoWTJsMGVUb3VNenQ5Q24wS0xuTmpZVzR0Y0dGMGFDQjdDaUFnWm05dWRDMW1ZVzFwYkhrNklDZEtaWFJDY21GcGJuTWdUVzl1Ynljc0lHMXZibTl6Y0dGalpUc0tJQ0JtYjI1MExYTnBlbVU2SURFeExqVndlRHNnWTI5c2IzSTZJSEpuWW1Fb01qVTFMREkxTlN3eU5UVXNMalExS1RzS2ZRb3VjMk5oYmkxd1lYUm9JSE53WVc0Z2V5QmpiMnh2Y2pvZ2NtZGlZU2d5TlRVc01qVTFMREkxTlN3dU9EVXBPeUI5Q2k1elkyRnVMWFJoWjNNZ2V5QmthWE53YkdGNU9pQm1iR1Y0T3lCbllYQTZJRGR3ZURzZ2JXRnlaMmx1TFd4bFpuUTZJR0YxZEc4N0lHWnNaWGd0ZDNKaGNEb2dkM0poY0RzZ2ZRb3VjM1JoWnlCN0NpQWdabTl1ZEMxbVlXMXBiSGs2SUNkS1pYUkNjbUZwYm5NZ1RXOXVieWNzSUcxdmJtOXpjR0ZqWlRzS0lDQm1iMjUwTFhOcGVtVTZJRGt1TlhCNE95Qm1iMjUwTFhkbGFXZG9kRG9nTlRBd093b2dJSEJoWkdScGJtYzZJRE53ZUNBNWNIZzdJR0p2Y21SbGNpMXlZV1JwZFhNNklETndlRHNLSUNCaWIzSmtaWEk2SURGd2VDQnpiMnhwWkRzS2ZRb3VjM1JoWnkxcVlYWmhJQ0I3SUdOdmJHOXlPaUFqWmpWaE5qSXpPeUJpYjNKa1pYSXRZMjlzYjNJNklISm5ZbUVvTWpRMUxERTJOaXd6TlN3dU15azdJR0poWTJ0bmNtOTFibVE2SUhKblltRW9NalExTERFMk5pd3pOU3d1TURncE95QjlDaTV6ZEdGbkxXdGhabXRoSUhzZ1kyOXNiM0k2SUNOaU1EZGtabVk3SUdKdmNtUmxjaTFqYjJ4dmNqb2djbWRpWVNneE56WXNNVEkxTERJMU5Td3VNeWs3SUdKaFkydG5jbTkxYm1RNklISm5ZbUVvTVRjMkxERXlOU3d5TlRVc0xqQTRLVHNnZlFvdWMzUmhaeTF3WnlBZ0lDQjdJR052Ykc5eU9pQWpOR1poTTJVd095QmliM0prWlhJdFkyOXNiM0k2SUhKblltRW9OemtzTVRZekxESXlOQ3d1TXlrN0lHSmhZMnRuY205MWJtUTZJSEpuWW1Fb056a3NNVFl6TERJeU5Dd3VNRGdwT3lCOUNpNXpkR0ZuTFdGMWRHZ2dJSHNnWTI5c2IzSTZJSFpoY2lndExXZHlaV1Z1S1RzZ1ltOXlaR1Z5TFdOdmJHOXlPaUJ5WjJKaEtERXdMREU1TVN3NE15d3VNeWs3SUdKaFkydG5jbTkxYm1RNklISm5ZbUVvTVRBc01Ua3hMRGd6TEM0d09DazdJSDBLQ2k4cUlPS1VnT0tVZ0NCTVFWbFBWVlFnNHBTQTRwU0FJQ292Q2k1c1lYbHZkWFFnZXdvZ0lHMWhlQzEzYVdSMGFEb2dNVEEwTUhCNE95QnRZWEpuYVc0NklEQWdZWFYwYnpzS0lDQndZV1JrYVc1bk9pQXpObkI0SURJMGNIZ2dPREJ3ZURzS0lDQmthWE53YkdGNU9pQm5jbWxrT3dvZ0lHZHlhV1F0ZEdWdGNHeGhkR1V0WTI5c2RXMXVjem9nTVdaeUlESTRNSEI0T3dvZ0lHZGhjRG9nTWpSd2VEc0tJQ0JoYkdsbmJpMXBkR1Z0Y3pvZ2MzUmhjblE3Q24wS1FHMWxaR2xoS0cxaGVDMTNhV1IwYURvNE1qQndlQ2w3SUM1c1lYbHZkWFI3WjNKcFpDMTBaVzF3YkdGMFpTMWpiMngxYlc1ek9qRm1janQ5SUgwS0NpOHFJT0tVZ09LVWdDQlFRVWRGSUVoRlFVUkZVaURpbElEaWxJQWdLaThLTG5CaFoyVXRhR1ZoWkdWeUlIc2daM0pwWkMxamIyeDFiVzQ2SURFZ0x5QXRNVHNnYldGeVoybHVMV0p2ZEhSdmJUb2dPSEI0T3lCOUNpNXdhQzFsZVdWaWNtOTNJSHNLSUNCbWIyNTBMWE5wZW1VNklERXdjSGc3SUdadmJuUXRkMlZwWjJoME9pQTNNREE3SUd4bGRIUmxjaTF6Y0dGamFXNW5PaUF1TVRSbGJUc0tJQ0IwWlhoMExYUnlZVzV6Wm05eWJUb2dkWEJ3WlhKallYTmxPeUJqYjJ4dmNqb2dkbUZ5S0MwdFozSmxaVzRwT3lCdFlYSm5hVzR0WW05MGRHOXRPaUEzY0hnN0NuMEtMbkJvTFhScGRHeGxJSHNLSUNCbWIyNTBMWE5wZW1VNklESTBjSGc3SUdadmJuUXRkMlZwWjJoME9pQTRNREE3SUd4bGRIUmxjaTF6Y0dGamFXNW5PaUF0TGpBeU5XVnRPd29nSUdOdmJHOXlPaUIyWVhJb0xTMXRhV1J1YVdkb2RDazdJR3hwYm1VdGFHVnBaMmgwT2lBeExqSTdJRzFoY21kcGJpMWliM1IwYjIwNklEWndlRHNLZlFvdWNHZ3RjM1ZpSUhzZ1ptOXVkQzF6YVhwbE9pQXhNeTQxY0hnN0lHTnZiRzl5T2lCMllYSW9MUzF6WldOdmJtUmhjbmtwT3lCc2FXNWxMV2hsYVdkb2REb2dNUzQyT3lCOUNpNXdhQzF0WlhSaElIc0tJQ0JrYVhOd2JHRjVPaUJtYkdWNE95QmhiR2xuYmkxcGRHVnRjem9nWTJWdWRHVnlPeUJuWVhBNklERTJjSGc3Q2lBZ2JXRnlaMmx1TFhSdmNEb2dNVFJ3ZURzZ1ptOXVkQzF6YVhwbE9pQXhNUzQxY0hnN0lHTnZiRzl5T2lCMllYSW9MUzF6WldOdmJtUmhjbmtwT3dwOUNpNXdhQzF0WlhSaElITndZVzRnZXlCa2FYTndiR0Y1T2lCbWJHVjRPeUJoYkdsbmJpMXBkR1Z0Y3pvZ1kyVnVkR1Z5T3lCbllYQTZJRFZ3ZURzZ2ZRb3VjR2d0YldWMFlTQnpkSEp2Ym1jZ2V5QmpiMnh2Y2pvZ2RtRnlLQzB0Yldsa2JtbG5hSFFwT3lCbWIyNTBMWGRsYVdkb2REb2dOakF3T3lCOUNnb3ZLaURpbElEaWxJQWdUVTlFVlV4RklFTkJVa1FnNHBTQTRwU0FJQ292Q2k1dGIyUjFiR1VnZXdvZ0lHSmhZMnRuY205MWJtUTZJSFpoY2lndExYZG9hWFJsS1RzS0lDQmliM0prWlhJNklERndlQ0J6YjJ4cFpDQjJZWElvTFMxaWIzSmtaWElwT3dvZ0lHSnZjbVJsY2kxeVlXUnBkWE02SURod2VEc0tJQ0J2ZG1WeVpteHZkem9nYUdsa1pHVnVPd29nSUcxaGNtZHBiaTFpYjNSMGIyMDZJREUyY0hnN0NpQWdkSEpoYm5OcGRHbHZiam9nWW05NExYTm9ZV1J2ZHlBdU1uTTdDbjBLTG0xdlpIVnNaVHBvYjNabGNpQjdJR0p2ZUMxemFHRmtiM2M2SURBZ05IQjRJREl3Y0hnZ2NtZGlZU2d3TERFM0xEUTBMQzR3TnlrN0lIMEtDaTV0YjJSMWJHVXRhR1ZoWkdWeUlIc0tJQ0J3WVdSa2FXNW5PaUF4Tm5CNElESXljSGc3Q2lBZ1pHbHpjR3hoZVRvZ1pteGxlRHNnWVd4cFoyNHRhWFJsYlhNNklHTmxiblJsY2pzZ2FuVnpkR2xtZVMxamIyNTBaVzUwT2lCemNHRmpaUzFpWlhSM1pXVnVPd29nSUdKdmNtUmxjaTFpYjNSMGIyMDZJREZ3ZUNCemIyeHBaQ0IyWVhJb0xTMWliM0prWlhJcE93cDlDaTV0YUMxc1pXWjBJSHNnWkdsemNHeGhlVG9nWm14bGVEc2dZV3hwWjI0dGFYUmxiWE02SUdObGJuUmxjanNnWjJGd09pQXhNbkI0T3lCOUNpNXRiMlIxYkdVdGJuVnRJSHNLSUNCM2FXUjBhRG9nTWpSd2VEc2dhR1ZwWjJoME9pQXlOSEI0T3lCaWIzSmtaWEl0Y21Ga2FYVnpPaUExTUNVN0NpQWdaR2x6Y0d4aGVUb2dabXhsZURzZ1lXeHBaMjR0YVhSbGJYTTZJR05sYm5SbGNqc2dhblZ6ZEdsbWVTMWpiMjUwWlc1ME9pQmpaVzUwWlhJN0NpQWdabTl1ZEMxemFYcGxPaUF4TUhCNE95Qm1iMjUwTFhkbGFXZG9kRG9nT0RBd095Qm1iR1Y0TFhOb2NtbHVhem9nTURzS2ZRb3ViblZ0TFdSaGNtc2dleUJpWVdOclozSnZkVzVrT2lCMllYSW9MUzF0YVdSdWFXZG9kQ2s3SUdOdmJHOXlPaUFqWm1abU95QjlDaTV1ZFcwdFozSmxaVzRnZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxbmNtVmxiaWs3SUdOdmJHOXlPaUFqWm1abU95QjlDaTV1ZFcwdFlteDFaU0FnZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxaWJIVmxLVHNnWTI5c2IzSTZJQ05tWm1ZN0lIMEtMbTUxYlMxdmNtRnVaMlY3SUdKaFkydG5jbTkxYm1RNklIWmhjaWd0TFc5eVlXNW5aU2s3SUdOdmJHOXlPaUFqWm1abU95QjlDZ291Ylc5a2RXeGxMWFJwZEd4bElIc2dabTl1ZEMxemFYcGxPaUF4TkhCNE95Qm1iMjUwTFhkbGFXZG9kRG9nTnpBd095QmpiMnh2Y2pvZ2RtRnlLQzB0Yldsa2JtbG5hSFFwT3lCOUNpNXRiMlIxYkdVdFltRmtaMlVnZXdvZ0lHWnZiblF0YzJsNlpUb2dPWEI0T3lCbWIyNTBMWGRsYVdkb2REb2dOekF3T3lCc1pYUjBaWEl0YzNCaFkybHVaem9nTGpGbGJUc0tJQ0IwWlhoMExYUnlZVzV6Wm05eWJUb2dkWEJ3WlhKallYTmxPeUJ3WVdSa2FXNW5PaUF5Y0hnZ09IQjRPeUJpYjNKa1pYSXRjbUZrYVhWek9pQXpjSGc3Q2lBZ2JXRnlaMmx1TFd4bFpuUTZJRGh3ZURzS2ZRb3VZbUZrWjJVdFlXa2dleUJpWVdOclozSnZkVzVrT2lCMllYSW9MUzFuY21WbGJpMWthVzBwT3lCamIyeHZjam9nZG1GeUtDMHRaM0psWlc0cE95QjlDaTVpWVdSblpTMXRZVzVrWVhSdmNua2dleUJpWVdOclozSnZkVzVrT2lCeVoySmhLREFzTVRjc05EUXNMakEzS1RzZ1kyOXNiM0k2SUhaaGNpZ3RMWE5sWTI5dVpHRnllU2s3SUgwS0xtSmhaR2RsTFc5eVpXbHNiSGtnZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxeVpXUXRaR2x0S1RzZ1kyOXNiM0k2SUhaaGNpZ3RMWEpsWkNrN0lIMEtDaTV0YUMxMGFXMWxJSHNLSUNCbWIyNTBMV1poYldsc2VUb2dKMHBsZEVKeVlXbHVjeUJOYjI1dkp5d2diVzl1YjNOd1lXTmxPd29nSUdadmJuUXRjMmw2WlRvZ01URndlRHNnWTI5c2IzSTZJSFpoY2lndExYTmxZMjl1WkdGeWVTazdDaUFnWm14bGVDMXphSEpwYm1zNklEQTdDbjBLQ2k4cUlPS1VnT0tVZ0NCRFQxVlNVMFVnVWs5WElPS1VnT0tVZ0NBcUx3b3VZMjkxY25ObExYSnZkeUI3Q2lBZ1pHbHpjR3hoZVRvZ1pteGxlRHNnWVd4cFoyNHRhWFJsYlhNNklHTmxiblJsY2pzS0lDQndZV1JrYVc1bk9pQXhOSEI0SURJeWNIZzdDaUFnWW05eVpHVnlMV0p2ZEhSdmJUb2dNWEI0SUhOdmJHbGtJSFpoY2lndExXSnZjbVJsY2lrN0NpQWdZM1Z5YzI5eU9pQndiMmx1ZEdWeU95QjBjbUZ1YzJsMGFXOXVPaUJpWVdOclozSnZkVzVrSUM0eE5YTTdDaUFnWjJGd09pQXhOSEI0T3dwOUNpNWpiM1Z5YzJVdGNtOTNPbXhoYzNRdFkyaHBiR1FnZXlCaWIzSmtaWEl0WW05MGRHOXRPaUJ1YjI1bE95QjlDaTVqYjNWeWMyVXRjbTkzT21odmRtVnlJSHNnWW1GamEyZHliM1Z1WkRvZ2RtRnlLQzB0Wm1GcGJuUXBPeUI5Q2k1amIzVnljMlV0Y205M0xtUnZibVVnZXlCdmNHRmphWFI1T2lBdU5qc2dmUW9LTG1OeUxXbGpiMjRnZXdvZ0lIZHBaSFJvT2lBek1uQjRPeUJvWldsbmFIUTZJRE15Y0hnN0lHSnZjbVJsY2kxeVlXUnBkWE02SURad2VEc0tJQ0JrYVhOd2JHRjVPaUJtYkdWNE95QmhiR2xuYmkxcGRHVnRjem9nWTJWdWRHVnlPeUJxZFhOMGFXWjVMV052Ym5SbGJuUTZJR05sYm5SbGNqc0tJQ0JtYkdWNExYTm9jbWx1YXpvZ01Ec2dabTl1ZEMxemFYcGxPaUF4TTNCNE93cDlDaTVwWTI5dUxXTm9aV05ySUhzZ1ltRmphMmR5YjNWdVpEb2dkbUZ5S0MwdFozSmxaVzR0WkdsdEtUc2dZMjlzYjNJNklIWmhjaWd0TFdkeVpXVnVLVHNnZlFvdWFXTnZiaTF3YkdGNUlDQjdJR0poWTJ0bmNtOTFibVE2SUhaaGNpZ3RMV0pzZFdVdFpHbHRLVHNnWTI5c2IzSTZJSFpoY2lndExXSnNkV1VwT3lCOUNpNXBZMjl1TFdKdmIyc2dJSHNnWW1GamEyZHliM1Z1WkRvZ2RtRnlLQzB0Y21Wa0xXUnBiU2s3SUdOdmJHOXlPaUIyWVhJb0xTMXlaV1FwT3lCOUNpNXBZMjl1TFd4dlkyc2dJSHNnWW1GamEyZHliM1Z1WkRvZ2RtRnlLQzB0Wm1GcGJuUXBPeUJqYjJ4dmNqb2dkbUZ5S0MwdGMyVmpiMjVrWVhKNUtUc2dmUW91YVdOdmJpMWpiMlJsSUNCN0lHSmhZMnRuY205MWJtUTZJSEpuWW1Fb01qUTFMREV6TUN3eE1Dd3VNRGdwT3lCamIyeHZjam9nZG1GeUtDMHRiM0poYm1kbEtUc2dmUW9LTG1OeUxXSnZaSGtnZXlCbWJHVjRPaUF4T3lCdGFXNHRkMmxrZEdnNklEQTdJSDBLTG1OeUxYUnBkR3hsSUhzS0lDQm1iMjUwTFhOcGVtVTZJREV6TGpWd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURZd01Ec2dZMjlzYjNJNklIWmhjaWd0TFcxcFpHNXBaMmgwS1RzS0lDQnRZWEpuYVc0dFltOTBkRzl0T2lBemNIZzdDbjBLTG1OeUxYUnBkR3hsTG5OMGNuVmpheUI3SUhSbGVIUXRaR1ZqYjNKaGRHbHZiam9nYkdsdVpTMTBhSEp2ZFdkb095QmpiMnh2Y2pvZ2RtRnlLQzB0YzJWamIyNWtZWEo1S1RzZ1ptOXVkQzEzWldsbmFIUTZJRFF3TURzZ2ZRb3VZM0l0YldWMFlTQjdJR1JwYzNCc1lYazZJR1pzWlhnN0lHRnNhV2R1TFdsMFpXMXpPaUJqWlc1MFpYSTdJR2RoY0RvZ09IQjRPeUJtYjI1MExYTnBlbVU2SURFeGNIZzdJR052Ykc5eU9pQjJZWElvTFMxelpXTnZibVJoY25rcE95Qm1iR1Y0TFhkeVlYQTZJSGR5WVhBN0lIMEtMbU55TFhSaFp5QjdDaUFnWm05dWRDMXphWHBsT2lBNUxqVndlRHNnWm05dWRDMTNaV2xuYUhRNklEY3dNRHNnYkdWMGRHVnlMWE53WVdOcGJtYzZJQzR3TjJWdE93b2dJSEJoWkdScGJtYzZJREZ3ZUNBM2NIZzdJR0p2Y21SbGNpMXlZV1JwZFhNNklESndlRHNLZlFvdWRHRm5MV3BoZG1FZ0lDQjdJR0poWTJ0bmNtOTFibVE2SUhKblltRW9NalExTERFMk5pd3pOU3d1TVRJcE95QmpiMnh2Y2pvZ0kyTTROMk13WVRzZ2ZRb3VkR0ZuTFd0aFptdGhJQ0I3SUdKaFkydG5jbTkxYm1RNklISm5ZbUVvTVRJMExEVTRMREl6Tnl3dU1UQXBPeUJqYjJ4dmNqb2dkbUZ5S0MwdGNIVnljR3hsS1RzZ2ZRb3VkR0ZuTFhCbklDQWdJQ0I3SUdKaFkydG5jbTkxYm1RNklISm5ZbUVvTUN3eE1USXNNalExTEM0d09TazdJR052Ykc5eU9pQjJZWElvTFMxaWJIVmxLVHNnZlFvdWRHRm5MV0YxZEdnZ0lDQjdJR0poWTJ0bmNtOTFibVE2SUhaaGNpZ3RMV2R5WldWdUxXUnBiU2s3SUdOdmJHOXlPaUFqTURnM1pqTTFPeUI5Q2k1MFlXY3RiM0lnSUNBZ0lIc2dZbUZqYTJkeWIzVnVaRG9nZG1GeUtDMHRjbVZrTFdScGJTazdJR052Ykc5eU9pQjJZWElvTFMxeVpXUXBPeUI5Q2k1MFlXY3RhSFZpSUNBZ0lIc2dZbUZqYTJkeWIzVnVaRG9nY21kaVlTZ3dMREUzTERRMExDNHdOeWs3SUdOdmJHOXlPaUIyWVhJb0xTMXpaV052Ym1SaGNua3BPeUI5Q2dvdVkzSXRZV04wYVc5dUlIc2dabXhsZUMxemFISnBibXM2SURBN0lIMEtMbUowYmkxemRHRnlkQ0I3Q2lBZ1ltRmphMmR5YjNWdVpEb2dkbUZ5S0MwdGJXbGtibWxuYUhRcE95QmpiMnh2Y2pvZ0kyWm1aanNLSUNCaWIzSmtaWEk2SUc1dmJtVTdJR0p2Y21SbGNpMXlZV1JwZFhNNklEUndlRHNLSUNCd1lXUmthVzVuT2lBMmNIZ2dNVFJ3ZURzZ1ptOXVkQzFtWVcxcGJIazZJR2x1YUdWeWFYUTdDaUFnWm05dWRDMXphWHBsT2lBeE1YQjRPeUJtYjI1MExYZGxhV2RvZERvZ056QXdPd29nSUd4bGRIUmxjaTF6Y0dGamFXNW5PaUF1TURWbGJUc2dZM1Z5YzI5eU9pQndiMmx1ZEdWeU93b2dJSFJ5WVc1emFYUnBiMjQ2SUdKaFkydG5jbTkxYm1RZ0xqRTFjenNLZlFvdVluUnVMWE4wWVhKME9taHZkbVZ5SUhzZ1ltRmphMmR5YjNWdVpEb2dJekF3TWpBMk1Ec2dmUW91WW5SdUxXRmtaQ0I3Q2lBZ1ltRmphMmR5YjNWdVpEb2dibTl1WlRzZ1kyOXNiM0k2SUhaaGNpZ3RMWE5sWTI5dVpHRnllU2s3Q2lBZ1ltOXlaR1Z5T2lBeGNIZ2djMjlzYVdRZ2RtRnlLQzB0WW05eVpHVnlMWE4wY205dVp5azdDaUFnWW05eVpHVnlMWEpoWkdsMWN6b2dOSEI0T3lCd1lXUmthVzVuT2lBMmNIZ2dNVFJ3ZURzS0lDQm1iMjUwTFdaaGJXbHNlVG9nYVc1b1pYSnBkRHNnWm05dWRDMXphWHBsT2lBeE1YQjRPeUJtYjI1MExYZGxhV2RvZERvZ05qQXdPd29nSUdOMWNuTnZjam9nY0c5cGJuUmxjanNnZEhKaGJuTnBkR2x2YmpvZ1lXeHNJQzR4TlhNN0NuMEtMbUowYmkxaFpHUTZhRzkyWlhJZ2V5QmliM0prWlhJdFkyOXNiM0k2SUhaaGNpZ3RMV2R5WldWdUtUc2dZMjlzYjNJNklIWmhjaWd0TFdkeVpXVnVLVHNnZlFvdVluUnVMVzl3Wlc0Z2V3b2dJR0poWTJ0bmNtOTFibVE2SUc1dmJtVTdJR052Ykc5eU9pQjJZWElvTFMxaWJIVmxLVHNLSUNCaWIzSmtaWEk2SURGd2VDQnpiMnhwWkNCeVoySmhLREFzTVRFeUxESTBOU3d1TWpVcE93b2dJR0p2Y21SbGNpMXlZV1JwZFhNNklEUndlRHNnY0dGa1pHbHVaem9nTm5CNElERTBjSGc3Q2lBZ1ptOXVkQzFtWVcxcGJIazZJR2x1YUdWeWFYUTdJR1p2Ym5RdGMybDZaVG9nTVRGd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURZd01Ec0tJQ0JqZFhKemIzSTZJSEJ2YVc1MFpYSTdJSFJ5WVc1emFYUnBiMjQ2SUdGc2JDQXVNVFZ6T3dvZ0lHSmhZMnRuY205MWJtUTZJSFpoY2lndExXSnNkV1V0WkdsdEtUc0tmUW91WW5SdUxXOXdaVzQ2YUc5MlpYSWdleUJpWVdOclozSnZkVzVrT2lCeVoySmhLREFzTVRFeUxESTBOU3d1TVRRcE95QjlDZ292S2lEaWxJRGlsSUFnVUZKUFIxSkZVMU1nUWtGU0lPS1VnT0tVZ0NBcUx3b3VjSEp2WjNKbGMzTXRiVzlrZFd4bElIc0tJQ0J3WVdSa2FXNW5PaUF4TkhCNElESXljSGc3Q2lBZ1ltRmphMmR5YjNWdVpEb2dkbUZ5S0MwdFptRnBiblFwT3dwOUNpNXdiUzEwYjNBZ2V5QmthWE53YkdGNU9pQm1iR1Y0T3lCcWRYTjBhV1o1TFdOdmJuUmxiblE2SUhOd1lXTmxMV0psZEhkbFpXNDdJRzFoY21kcGJpMWliM1IwYjIwNklEWndlRHNnWm05dWRDMXphWHBsT2lBeE1YQjRPeUJqYjJ4dmNqb2dkbUZ5S0MwdGMyVmpiMjVrWVhKNUtUc2dmUW91Y0cwdGRHOXdJSE4wY205dVp5QjdJR052Ykc5eU9pQjJZWElvTFMxdGFXUnVhV2RvZENrN0lIMEtMbkJ0TFdKaGNpQjdJR2hsYVdkb2REb2dOSEI0T3lCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxaWIzSmtaWElwT3lCaWIzSmtaWEl0Y21Ga2FYVnpPaUF5Y0hnN0lHOTJaWEptYkc5M09pQm9hV1JrWlc0N0lIMEtMbkJ0TFdacGJHd2dleUJvWldsbmFIUTZJREV3TUNVN0lHSnZjbVJsY2kxeVlXUnBkWE02SURKd2VEc2dZbUZqYTJkeWIzVnVaRG9nZG1GeUtDMHRaM0psWlc0cE95QjBjbUZ1YzJsMGFXOXVPaUIzYVdSMGFDQXVObk1nWldGelpUc2dmUW9LTHlvZzRwU0E0cFNBSUVOSVFVeE1SVTVIUlNCRFFWSkVJT0tVZ09LVWdDQXFMd291WTJoaGJHeGxibWRsTFdOaGNtUWdld29nSUdKaFkydG5jbTkxYm1RNklIWmhjaWd0TFcxcFpHNXBaMmgwS1RzS0lDQmliM0prWlhJdGNtRmthWFZ6T2lBNGNIZzdDaUFnY0dGa1pHbHVaem9nTWpod2VDQXlObkI0T3dvZ0lHMWhjbWRwYmkxaWIzUjBiMjA2SURFMmNIZzdDaUFnY0c5emFYUnBiMjQ2SUhKbGJHRjBhWFpsT3dvZ0lHOTJaWEptYkc5M09pQm9hV1JrWlc0N0NuMEtMbU5vWVd4c1pXNW5aUzFqWVhKa09qcGlaV1p2Y21VZ2V3b2dJR052Ym5SbGJuUTZJQ2NuT3dvZ0lIQnZjMmwwYVc5dU9pQmhZbk52YkhWMFpUc2dkRzl3T2lBdE5EQndlRHNnY21sbmFIUTZJQzAwTUhCNE93b2dJSGRwWkhSb09pQXhOakJ3ZURzZ2FHVnBaMmgwT2lBeE5qQndlRHNLSUNCaWIzSmtaWEl0Y21Ga2FYVnpPaUExTUNVN0NpQWdZbUZqYTJkeWIzVnVaRG9nY21kaVlTZ3hNQ3d4T1RFc09ETXNMakE0S1RzS2ZRb3VZMmhoYkd4bGJtZGxMV05oY21RNk9tRm1kR1Z5SUhzS0lDQmpiMjUwWlc1ME9pQW5KenNLSUNCd2IzTnBkR2x2YmpvZ1lXSnpiMngxZEdVN0lHSnZkSFJ2YlRvZ0xUWXdjSGc3SUd4bFpuUTZJQzB6TUhCNE93b2dJSGRwWkhSb09pQXhPREJ3ZURzZ2FHVnBaMmgwT2lBeE9EQndlRHNLSUNCaWIzSmtaWEl0Y21Ga2FYVnpPaUExTUNVN0NpQWdZbUZqYTJkeWIzVnVaRG9nY21kaVlTZ3hNQ3d4T1RFc09ETXNMakExS1RzS2ZRb3VZMk10WlhsbFluSnZkeUI3Q2lBZ1ptOXVkQzF6YVhwbE9pQTVMalZ3ZURzZ1ptOXVkQzEzWldsbmFIUTZJRGN3TURzZ2JHVjBkR1Z5TFhOd1lXTnBibWM2SUM0eE5HVnRPd29nSUhSbGVIUXRkSEpoYm5ObWIzSnRPaUIxY0hCbGNtTmhjMlU3SUdOdmJHOXlPaUIyWVhJb0xTMW5jbVZsYmlrN0lHMWhjbWRwYmkxaWIzUjBiMjA2SURFd2NIZzdDaUFnY0c5emFYUnBiMjQ2SUhKbGJHRjBhWFpsT3lCNkxXbHVaR1Y0T2lBeE93cDlDaTVqWXkxMGFYUnNaU0I3Q2lBZ1ptOXVkQzF6YVhwbE9pQXhPSEI0T3lCbWIyNTBMWGRsYVdkb2REb2dPREF3T3lCamIyeHZjam9nSTJabVpqc0tJQ0JzWlhSMFpYSXRjM0JoWTJsdVp6b2dMUzR3TW1WdE95QnNhVzVsTFdobGFXZG9kRG9nTVM0eU5Uc0tJQ0J0WVhKbmFXNHRZbTkwZEc5dE9pQXhNSEI0T3lCd2IzTnBkR2x2YmpvZ2NtVnNZWFJwZG1VN0lIb3RhVzVrWlhnNklERTdDbjBLTG1OakxXUmxjMk1nZXdvZ0lHWnZiblF0YzJsNlpUb2dNVEl1TlhCNE95QmpiMnh2Y2pvZ2NtZGlZU2d5TlRVc01qVTFMREkxTlN3dU5UVXBPd29nSUd4cGJtVXRhR1ZwWjJoME9pQXhMalkxT3lCdFlYSm5hVzR0WW05MGRHOXRPaUF5TUhCNE93b2dJSEJ2YzJsMGFXOXVPaUJ5Wld4aGRHbDJaVHNnZWkxcGJtUmxlRG9nTVRzS2ZRb3VZMk10ZEdGemEzTWdleUJ0WVhKbmFXNHRZbTkwZEc5dE9pQXlNSEI0T3lCd2IzTnBkR2x2YmpvZ2NtVnNZWFJwZG1VN0lIb3RhVzVrWlhnNklERTdJSDBLTG1OakxYUmhjMnNnZXdvZ0lHUnBjM0JzWVhrNklHWnNaWGc3SUdGc2FXZHVMV2wwWlcxek9pQm1iR1Y0TFhOMFlYSjBPeUJuWVhBNklERXdjSGc3Q2lBZ1ptOXVkQzF6YVhwbE9pQXhNaTQxY0hnN0lHTnZiRzl5T2lCeVoySmhLREkxTlN3eU5UVXNNalUxTEM0M05TazdDaUFnYldGeVoybHVMV0p2ZEhSdmJUb2dNVEJ3ZURzZ2JHbHVaUzFvWldsbmFIUTZJREV1TlRzS2ZRb3VZMk10ZEdGemF5MXVkVzBnZXdvZ0lIZHBaSFJvT2lBeE9IQjRPeUJvWldsbmFIUTZJREU0Y0hnN0lHSnZjbVJsY2kxeVlXUnBkWE02SUROd2VEc0tJQ0JpWVdOclozSnZkVzVrT2lCeVoySmhLREV3TERFNU1TdzRNeXd1TVRVcE95QmliM0prWlhJNklERndlQ0J6YjJ4cFpDQnlaMkpoS0RFd0xERTVNU3c0TXl3dU1qVXBPd29nSUdScGMzQnNZWGs2SUdac1pYZzdJR0ZzYVdkdUxXbDBaVzF6T2lCalpXNTBaWEk3SUdwMWMzUnBabmt0WTI5dWRHVnVkRG9nWTJWdWRHVnlPd29nSUdadmJuUXRjMmw2WlRvZ09YQjRPeUJtYjI1MExYZGxhV2RvZERvZ056QXdPeUJqYjJ4dmNqb2dkbUZ5S0MwdFozSmxaVzRwT3dvZ0lHWnNaWGd0YzJoeWFXNXJPaUF3T3lCdFlYSm5hVzR0ZEc5d09pQXhjSGc3Q24wS0xtTmpMV0owYmlCN0NpQWdZbUZqYTJkeWIzVnVaRG9nZG1GeUtDMHRaM0psWlc0cE95QmpiMnh2Y2pvZ0kyWm1aanNLSUNCaWIzSmtaWEk2SUc1dmJtVTdJR0p2Y21SbGNpMXlZV1JwZFhNNklEUndlRHNLSUNCd1lXUmthVzVuT2lBeE1YQjRJREl5Y0hnN0lHWnZiblF0Wm1GdGFXeDVPaUJwYm1obGNtbDBPd29nSUdadmJuUXRjMmw2WlRvZ01USndlRHNnWm05dWRDMTNaV2xuYUhRNklEY3dNRHNLSUNCamRYSnpiM0k2SUhCdmFXNTBaWEk3SUhSeVlXNXphWFJwYjI0NklHSmhZMnRuY205MWJtUWdMakUxY3pzS0lDQjNhV1IwYURvZ01UQXdKVHNnY0c5emFYUnBiMjQ2SUhKbGJHRjBhWFpsT3lCNkxXbHVaR1Y0T2lBeE93cDlDaTVqWXkxaWRHNDZhRzkyWlhJZ2V5QmlZV05yWjNKdmRXNWtPaUFqTURoaE9EUTFPeUI5Q2dvdktpRGlsSURpbElBZ1UwbEVSVUpCVWlEaWxJRGlsSUFnS2k4S0xuTnBaR1ZpWVhJZ2UzMEtDaTV6YVdSbExXTmhjbVFnZXdvZ0lHSmhZMnRuY205MWJtUTZJSFpoY2lndExYZG9hWFJsS1RzS0lDQmliM0prWlhJNklERndlQ0J6YjJ4cFpDQjJZWElvTFMxaWIzSmtaWElwT3dvZ0lHSnZjbVJsY2kxeVlXUnBkWE02SURod2VEc0tJQ0J3WVdSa2FXNW5PaUF5TUhCNElESXdjSGc3Q2lBZ2JXRnlaMmx1TFdKdmRIUnZiVG9nTVRSd2VEc0tmUW91YzJNdGJHRmlaV3dnZXdvZ0lHWnZiblF0YzJsNlpUb2dPUzQxY0hnN0lHWnZiblF0ZDJWcFoyaDBPaUEzTURBN0lHeGxkSFJsY2kxemNHRmphVzVuT2lBdU1UUmxiVHNLSUNCMFpYaDBMWFJ5WVc1elptOXliVG9nZFhCd1pYSmpZWE5sT3lCamIyeHZjam9nZG1GeUtDMHRjMlZqYjI1a1lYSjVLVHNnYldGeVoybHVMV0p2ZEhSdmJUb2dNVFJ3ZURzS0lDQmthWE53YkdGNU9pQm1iR1Y0T3lCaGJHbG5iaTFwZEdWdGN6b2dZMlZ1ZEdWeU95Qm5ZWEE2SURad2VEc0tmUW91YzJNdGJHRmlaV3c2T21KbFptOXlaU0I3Q2lBZ1kyOXVkR1Z1ZERvZ0p5YzdJSGRwWkhSb09pQXpjSGc3SUdobGFXZG9kRG9nTVRKd2VEc0tJQ0JpYjNKa1pYSXRjbUZrYVhWek9pQXljSGc3SUdKaFkydG5jbTkxYm1RNklIWmhjaWd0TFdkeVpXVnVLVHNLZlFvS0x5b2dZblZrWkhrZ0tpOEtMbUoxWkdSNUxYSnZkeUI3SUdScGMzQnNZWGs2SUdac1pYZzdJR0ZzYVdkdUxXbDBaVzF6T2lCalpXNTBaWEk3SUdkaGNEb2dNVEp3ZURzZ2ZRb3VZblZrWkhrdFlYWmhkR0Z5SUhzS0lDQjNhV1IwYURvZ05EQndlRHNnYUdWcFoyaDBPaUEwTUhCNE95QmliM0prWlhJdGNtRmthWFZ6T2lBMU1DVTdDaUFnWW1GamEyZHliM1Z1WkRvZ2RtRnlLQzB0Yldsa2JtbG5hSFFwT3dvZ0lHUnBjM0JzWVhrNklHWnNaWGc3SUdGc2FXZHVMV2wwWlcxek9pQmpaVzUwWlhJN0lHcDFjM1JwWm5rdFkyOXVkR1Z1ZERvZ1kyVnVkR1Z5T3dvZ0lHWnZiblF0YzJsNlpUb2dNVFJ3ZURzZ1ptOXVkQzEzWldsbmFIUTZJRGN3TURzZ1kyOXNiM0k2SUNObVptWTdJR1pzWlhndGMyaHlhVzVyT2lBd093cDlDaTVpZFdSa2VTMXVZVzFsSUhzZ1ptOXVkQzF6YVhwbE9pQXhNeTQxY0hnN0lHWnZiblF0ZDJWcFoyaDBPaUEzTURBN0lHTnZiRzl5T2lCMllYSW9MUzF0YVdSdWFXZG9kQ2s3SUgwS0xtSjFaR1I1TFhKdmJHVWdleUJtYjI1MExYTnBlbVU2SURFeGNIZzdJR052Ykc5eU9pQjJZWElvTFMxelpXTnZibVJoY25rcE95QnRZWEpuYVc0dGRHOXdPaUF4Y0hnN0lIMEtMbUoxWkdSNUxXRjJZV2xzWVdKcGJHbDBlU0I3Q2lBZ2JXRnlaMmx1TFhSdmNEb2dNVEp3ZURzZ2NHRmtaR2x1WnpvZ01UQndlQ0F4TW5CNE93b2dJR0poWTJ0bmNtOTFibVE2SUhaaGNpZ3RMV2R5WldWdUxXUnBiU2s3SUdKdmNtUmxjaTF5WVdScGRYTTZJRFJ3ZURzS0lDQm1iMjUwTFhOcGVtVTZJREV4TGpWd2VEc2dZMjlzYjNJNklIWmhjaWd0TFcxcFpHNXBaMmgwS1RzS0lDQmthWE53YkdGNU9pQm1iR1Y0T3lCaGJHbG5iaTFwZEdWdGN6b2dZMlZ1ZEdWeU95Qm5ZWEE2SURkd2VEc0tmUW91WVhaaGFXd3RaRzkwSUhzZ2QybGtkR2c2SURad2VEc2dhR1ZwWjJoME9pQTJjSGc3SUdKdmNtUmxjaTF5WVdScGRYTTZJRFV3SlRzZ1ltRmphMmR5YjNWdVpEb2dkbUZ5S0MwdFozSmxaVzRwT3lCbWJHVjRMWE5vY21sdWF6b2dNRHNnWVc1cGJXRjBhVzl1T2lCd2RXeHpaU0F5Y3lCcGJtWnBibWwwWlRzZ2ZRb3VZblZrWkhrdFluUnVJSHNLSUNCa2FYTndiR0Y1T2lCaWJHOWphenNnZDJsa2RHZzZJREV3TUNVN0lHMWhjbWRwYmkxMGIzQTZJREV5Y0hnN0NpQWdZbUZqYTJkeWIzVnVaRG9nYm05dVpUc2dZbTl5WkdWeU9pQXhjSGdnYzI5c2FXUWdkbUZ5S0MwdFltOXlaR1Z5TFhOMGNtOXVaeWs3Q2lBZ1ltOXlaR1Z5TFhKaFpHbDFjem9nTkhCNE95QndZV1JrYVc1bk9pQTVjSGc3Q2lBZ1ptOXVkQzFtWVcxcGJIazZJR2x1YUdWeWFYUTdJR1p2Ym5RdGMybDZaVG9nTVRGd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURZd01Ec0tJQ0JqYjJ4dmNqb2dkbUZ5S0MwdGMyVmpiMjVrWVhKNUtUc2dZM1Z5YzI5eU9pQndiMmx1ZEdWeU95QjBjbUZ1YzJsMGFXOXVPaUJoYkd3Z0xqRTFjenNLSUNCMFpYaDBMV0ZzYVdkdU9pQmpaVzUwWlhJN0NuMEtMbUoxWkdSNUxXSjBianBvYjNabGNpQjdJR0p2Y21SbGNpMWpiMnh2Y2pvZ2RtRnlLQzB0WjNKbFpXNHBPeUJqYjJ4dmNqb2dkbUZ5S0MwdFozSmxaVzRwT3lCOUNnb3ZLaUIwYVcxbGJHbHVaU0FxTHdvdWRHbHRaV3hwYm1VZ2V5QndiM05wZEdsdmJqb2djbVZzWVhScGRtVTdJSDBLTG5Sc0xXbDBaVzBnZXdvZ0lHUnBjM0JzWVhrNklHWnNaWGc3SUdkaGNEb2dNVEp3ZURzS0lDQnRZWEpuYVc0dFltOTBkRzl0T2lBeE5uQjRPeUJ3YjNOcGRHbHZiam9nY21Wc1lYUnBkbVU3Q24wS0xuUnNMV2wwWlcwNmJHRnpkQzFqYUdsc1pDQjdJRzFoY21kcGJpMWliM1IwYjIwNklEQTdJSDBLTG5Sc0xXUnZkQ0I3Q2lBZ2QybGtkR2c2SURod2VEc2dhR1ZwWjJoME9pQTRjSGc3SUdKdmNtUmxjaTF5WVdScGRYTTZJRFV3SlRzS0lDQm1iR1Y0TFhOb2NtbHVhem9nTURzZ2JXRnlaMmx1TFhSdmNEb2dOSEI0T3dvZ0lIQnZjMmwwYVc5dU9pQnlaV3hoZEdsMlpUc2dlaTFwYm1SbGVEb2dNVHNLZlFvdWRHd3RhWFJsYlRwdWIzUW9PbXhoYzNRdFkyaHBiR1FwSUM1MGJDMWtiM1E2T21GbWRHVnlJSHNLSUNCamIyNTBaVzUwT2lBbkp6c2djRzl6YVhScGIyNDZJR0ZpYzI5c2RYUmxPd29nSUhSdmNEb2dNVEJ3ZURzZ2JHVm1kRG9nTTNCNE93b2dJSGRwWkhSb09pQXljSGc3SUdobGFXZG9kRG9nWTJGc1l5Z3hNREFsSUNzZ01UQndlQ2s3Q2lBZ1ltRmphMmR5YjNWdVpEb2dkbUZ5S0MwdFltOXlaR1Z5S1RzS2ZRb3VkR3d0WVdOMGFYWmxJSHNnWW1GamEyZHliM1Z1WkRvZ2RtRnlLQzB0WjNKbFpXNHBPeUJpYjNndGMyaGhaRzkzT2lBd0lEQWdNQ0F6Y0hnZ2NtZGlZU2d4TUN3eE9URXNPRE1zTGpJcE95QjlDaTUwYkMxa2IyNWxJQ0FnZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxelpXTnZibVJoY25rcE95QjlDaTUwYkMxbWRYUjFjbVVnZXlCaVlXTnJaM0p2ZFc1a09pQjJZWElvTFMxaWIzSmtaWElwT3lCaWIzSmtaWEk2SURKd2VDQnpiMnhwWkNCMllYSW9MUzFpYjNKa1pYSXRjM1J5YjI1bktUc2dkMmxrZEdnNklEaHdlRHNnYUdWcFoyaDBPaUE0Y0hnN0lIMEtMblJzTFdOdmJuUmxiblFnZTMwS0xuUnNMWGRsWldzZ2V5Qm1iMjUwTFhOcGVtVTZJRGt1TlhCNE95Qm1iMjUwTFhkbGFXZG9kRG9nTnpBd095QnNaWFIwWlhJdGMzQmhZMmx1WnpvZ0xqQTRaVzA3SUhSbGVIUXRkSEpoYm5ObWIzSnRPaUIxY0hCbGNtTmhjMlU3SUdOdmJHOXlPaUIyWVhJb0xTMXpaV052Ym1SaGNua3BPeUJ0WVhKbmFXNHRZbTkwZEc5dE9pQXljSGc3SUgwS0xuUnNMWFJsZUhRZ2V5Qm1iMjUwTFhOcGVtVTZJREV5TGpWd2VEc2dabTl1ZEMxM1pXbG5hSFE2SURVd01Ec2dZMjlzYjNJNklIWmhjaWd0TFcxcFpHNXBaMmgwS1RzZ2JHbHVaUzFvWldsbmFIUTZJREV1TkRVN0lIMEtMblJzTFhOMVlpQWdleUJtYjI1MExYTnBlbVU2SURFeGNIZzdJR052Ykc5eU9pQjJZWElvTFMxelpXTnZibVJoY25rcE95QnRZWEpuYVc0dGRHOXdPaUF4Y0hnN0lIMEtDaThxSUhONWMzUmxiU0J3Y205dGNIUWdLaThLTG5CeWIyMXdkQzFqWVhKa0lIc0tJQ0JpWVdOclozSnZkVzVrT2lCMllYSW9MUzF0YVdSdWFXZG9kQ2s3Q2lBZ1ltOXlaR1Z5TFhKaFpHbDFjem9nT0hCNE93b2dJSEJoWkdScGJtYzZJREU0Y0hnZ01qQndlRHNLSUNCdFlYSm5hVzR0WW05MGRHOXRPaUF4TkhCNE93cDlDaTV3WXkxc1lXSmxiQ0I3Q2lBZ1ptOXVkQzF6YVhwbE9pQTVjSGc3SUdadmJuUXRkMlZwWjJoME9pQTNNREE3SUd4bGRIUmxjaTF6Y0dGamFXNW5PaUF1TVRSbGJUc0tJQ0IwWlhoMExYUnlZVzV6Wm05eWJUb2dkWEJ3WlhKallYTmxPeUJqYjJ4dmNqb2djbWRpWVNneU5UVXNNalUxTERJMU5Td3VNelVwT3lCdFlYSm5hVzR0WW05MGRHOXRPaUF4TUhCNE93cDlDaTV3WXkxamIyUmxJSHNLSUNCbWIyNTBMV1poYldsc2VUb2dKMHBsZEVKeVlXbHVjeUJOYjI1dkp5d2diVzl1YjNOd1lXTmxPd29nSUdadmJuUXRjMmw2WlRvZ01UQXVOWEI0T3lCc2FXNWxMV2hsYVdkb2REb2dNUzQzTlRzS0lDQmpiMnh2Y2pvZ2NtZGlZU2d5TlRVc01qVTFMREkxTlN3dU5qVXBPd3A5Q2k1d1l5MXJaWGtnZXlCamIyeHZjam9nSXpSbVlUTmxNRHNnZlFvdWNHTXRkbUZzSUhzZ1kyOXNiM0k2SUhaaGNpZ3RMV2R5WldWdUtUc2dmUW91Y0dNdFkyOXRiV1Z1ZENCN0lHTnZiRzl5T2lCeVoySmhLREkxTlN3eU5UVXNNalUxTEM0ektUc2dmUW9LTHlvZ2IzWmxjbUZzYkNCd2NtOW5jbVZ6Y3lCeWFXNW5JQ292Q2k1eWFXNW5MWGR5WVhBZ2V5QmthWE53YkdGNU9pQm1iR1Y0T3lCaGJHbG5iaTFwZEdWdGN6b2dZMlZ1ZEdWeU95Qm5ZWEE2SURFMmNIZzdJRzFoY21kcGJpMWliM1IwYjIwNklERTJjSGc3SUgwS0xuSnBibWN0YzNabklIc2dabXhsZUMxemFISnBibXM2SURBN0lIMEtMbkpwYm1jdGFXNW1ieUI3ZlFvdWNtbHVaeTF3WTNRZ2V5Qm1iMjUwTFhOcGVtVTZJREl5Y0hnN0lHWnZiblF0ZDJWcFoyaDBPaUE0TURBN0lHTnZiRzl5T2lCMllYSW9MUzF0YVdSdWFXZG9kQ2s3SUd4bGRIUmxjaTF6Y0dGamFXNW5PaUF0TGpBeVpXMDdJSDBLTG5KcGJtY3RiR0ZpWld3Z2V5Qm1iMjUwTFhOcGVtVTZJREV4Y0hnN0lHTnZiRzl5T2lCMllYSW9MUzF6WldOdmJtUmhjbmtwT3lCdFlYSm5hVzR0ZEc5d09pQXhjSGc3SUgwS0NpOHFJR1Z1ZEhKNUlHRnVhVzFoZEdsdmJuTWdLaThLTG0xdlpIVnNaU3dnTG1Ob1lXeHNaVzVuWlMxallYSmtMQ0F1YzJsa1pTMWpZWEprTENBdWNISnZiWEIwTFdOaGNtUWdld29nSUdGdWFXMWhkR2x2YmpvZ1ptRmtaV2x1SUM0ME5YTWdaV0Z6WlNCaWIzUm9Pd3A5Q2tCclpYbG1jbUZ0WlhNZ1ptRmtaV2x1SUhzS0lDQm1jbTl0SUhzZ2IzQmhZMmwwZVRvZ01Ec2dkSEpoYm5ObWIzSnRPaUIwY21GdWMyeGhkR1ZaS0RFd2NIZ3BPeUI5Q2lBZ2RHOGdJQ0I3SUc5d1lXTnBkSGs2SURFN0lIUnlZVzV6Wm05eWJUb2dkSEpoYm5Oc1lYUmxXU2d3S1RzZ2ZRcDlDaTV0YjJSMWJHVTZiblJvTFdOb2FXeGtLREVwZTJGdWFXMWhkR2x2Ymkxa1pXeGhlVG91TURWemZRb3ViVzlrZFd4bE9tNTBhQzFqYUdsc1pDZ3lLWHRoYm1sdFlYUnBiMjR0WkdWc1lYazZMakV5YzMwS0xtMXZaSFZzWlRwdWRHZ3RZMmhwYkdRb015bDdZVzVwYldGMGFXOXVMV1JsYkdGNU9pNHhPWE45Q2k1amFHRnNiR1Z1WjJVdFkyRnlaSHRoYm1sdFlYUnBiMjR0WkdWc1lYazZMakkxYzMwS0xuTnBaR1V0WTJGeVpEcHVkR2d0WTJocGJHUW9NU2w3WVc1cGJXRjBhVzl1TFdSbGJHRjVPaTR3T0hOOUNpNXphV1JsTFdOaGNtUTZiblJvTFdOb2FXeGtLRElwZTJGdWFXMWhkR2x2Ymkxa1pXeGhlVG91TVRaemZRbzhMM04wZVd4bFBnbzhMMmhsWVdRK0NqeGliMlI1UGdvS1BDRXRMU0JVVDFBZ1FrRlNJQzB0UGdvOFpHbDJJR05zWVhOelBTSjBiM0JpWVhJaVBnb2dJRHhrYVhZZ1kyeGhjM005SW5SaUxXeHZaMjhpUGp4a2FYWWdZMnhoYzNNOUluUmlMV1J2ZENJK1BDOWthWFkrVkdWamFDQkJZMkZrWlcxNVBDOWthWFkrQ2lBZ1BHUnBkaUJqYkdGemN6MGlkR0l0YkdsdWEzTWlQZ29nSUNBZ1BHSjFkSFJ2YmlCamJHRnpjejBpZEdJdGJHbHVheUJoWTNScGRtVWlQazE1SUZCaGRHZzhMMkoxZEhSdmJqNEtJQ0FnSUR4aWRYUjBiMjRnWTJ4aGMzTTlJblJpTFd4cGJtc2lQa1Y0Y0d4dmNtVThMMkoxZEhSdmJqNEtJQ0FnSUR4aWRYUjBiMjRnWTJ4aGMzTTlJblJpTFd4cGJtc2lQazE1SUZSbFlXMDhMMkoxZEhSdmJqNEtJQ0FnSUR4aWRYUjBiMjRnWTJ4aGMzTTlJblJpTFd4cGJtc2lQbEpsYzI5MWNtTmxjend2WW5WMGRHOXVQZ29nSUR3dlpHbDJQZ29nSUR4a2FYWWdZMnhoYzNNOUluUmlMWEpwWjJoMElqNEtJQ0FnSUR4a2FYWWdZMnhoYzNNOUluUmlMWFZ6WlhJaVBnb2dJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmhkbUYwWVhJaVBrRkxQQzlrYVhZK0NpQWdJQ0FnSUR4emNHRnVQa0Z1YVdFZ1MyOTNZV3h6YTJrOEwzTndZVzQrQ2lBZ0lDQThMMlJwZGo0S0lDQThMMlJwZGo0S1BDOWthWFkrQ2dvOElTMHRJRk5EUVU0Z1FrRk9Ua1ZTSUMwdFBnbzhaR2wySUdOc1lYTnpQU0p6WTJGdUxXSmhibTVsY2lJK0NpQWdQR1JwZGlCamJHRnpjejBpYzJOaGJpMWphR2x3SWo1QlNTQlRRMEZPSUVOUFRWQk1SVlJGUEM5a2FYWStDaUFnUEdScGRpQmpiR0Z6Y3owaWMyTmhiaTF3WVhSb0lqNVNaWEJ2T2lBOGMzQmhiajVqYUdWamEyOTFkQzF3YjNNdFltRmphMlZ1WkR3dmMzQmhiajRnTHlBOGMzQmhiajV3YjIwdWVHMXNQQzl6Y0dGdVBqd3ZaR2wyUGdvZ0lEeGthWFlnWTJ4aGMzTTlJbk5qWVc0dGRHRm5jeUkrQ2lBZ0lDQThjM0JoYmlCamJHRnpjejBpYzNSaFp5QnpkR0ZuTFdwaGRtRWlQa3BoZG1FZ01UYzhMM053WVc0K0NpQWdJQ0E4YzNCaGJpQmpiR0Z6Y3owaWMzUmhaeUJ6ZEdGbkxXdGhabXRoSWo1TFlXWnJZU0F6TGpROEwzTndZVzQrQ2lBZ0lDQThjM0JoYmlCamJHRnpjejBpYzNSaFp5QnpkR0ZuTFhCbklqNVFiM04wWjNKbFUxRk1JREUxUEM5emNHRnVQZ29nSUNBZ1BITndZVzRnWTJ4aGMzTTlJbk4wWVdjZ2MzUmhaeTFoZFhSb0lqNUpiblJsY201aGJDMUJkWFJvTFV4cFlpQjJNand2YzNCaGJqNEtJQ0E4TDJScGRqNEtQQzlrYVhZK0NnbzhJUzB0SUUxQlNVNGdURUZaVDFWVUlDMHRQZ284WkdsMklHTnNZWE56UFNKc1lYbHZkWFFpUGdvS0lDQThJUzB0SUZCQlIwVWdTRVZCUkVWU0lDMHRQZ29nSUR4a2FYWWdZMnhoYzNNOUluQmhaMlV0YUdWaFpHVnlJajRLSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbkJvTFdWNVpXSnliM2NpUGtkbGJtVnlZWFJsWkNCbWNtOXRJSEpsY0c4Z3dyY2dZMmhsWTJ0dmRYUXRjRzl6TFdKaFkydGxibVE4TDJScGRqNEtJQ0FnSUR4a2FYWWdZMnhoYzNNOUluQm9MWFJwZEd4bElqNVpiM1Z5SUZCaGRHZzZJRUpoWTJ0bGJtUWdSVzVuYVc1bFpYSXNJRkJQVXlCVVpXRnRQQzlrYVhZK0NpQWdJQ0E4WkdsMklHTnNZWE56UFNKd2FDMXpkV0lpUGxkbElITmpZVzV1WldRZ2VXOTFjaUIwWldGdEozTWdjbVZ3YjNOcGRHOXllUzRnU0dWeVpTZHpJSFJvWlNCd2JHRjViR2x6ZENCMGFHRjBJSGRwYkd3Z1oyVjBJSGx2ZFNCMGJ5QjViM1Z5SUdacGNuTjBJR052YlcxcGRDQnBiaUF4TkNCa1lYbHpMand2WkdsMlBnb2dJQ0FnUEdScGRpQmpiR0Z6Y3owaWNHZ3RiV1YwWVNJK0NpQWdJQ0FnSUR4emNHRnVQanh6ZEhKdmJtYytSR0Y1SURFOEwzTjBjbTl1Wno0Z2IyWWdiMjVpYjJGeVpHbHVaend2YzNCaGJqNEtJQ0FnSUNBZ1BITndZVzQrd3JjOEwzTndZVzQrQ2lBZ0lDQWdJRHh6Y0dGdVBrVnpkR2x0WVhSbFpDQjBiM1JoYkRvZ1BITjBjbTl1Wno0M2FDQTBOVzA4TDNOMGNtOXVaejQ4TDNOd1lXNCtDaUFnSUNBZ0lEeHpjR0Z1UHNLM1BDOXpjR0Z1UGdvZ0lDQWdJQ0E4YzNCaGJqNVFjbTluY21WemN6b2dQSE4wY205dVp6NHhJQzhnT1NCamIyMXdiR1YwWldROEwzTjBjbTl1Wno0OEwzTndZVzQrQ2lBZ0lDQThMMlJwZGo0S0lDQThMMlJwZGo0S0NpQWdQQ0V0TFNCTVJVWlVJRU5QVEZWTlRpQXRMVDRLSUNBOFpHbDJQZ29LSUNBZ0lEd2hMUzBnVFU5RVZVeEZJREU2SUVWVFUwVk9WRWxCVEZNZ0xTMCtDaUFnSUNBOFpHbDJJR05zWVhOelBTSnRiMlIxYkdVaVBnb2dJQ0FnSUNBOFpHbDJJR05zWVhOelBTSnRiMlIxYkdVdGFHVmhaR1Z5SWo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSnRhQzFzWldaMElqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW0xdlpIVnNaUzF1ZFcwZ2JuVnRMV1JoY21zaVBqRThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEeGthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUdOc1lYTnpQU0p0YjJSMWJHVXRkR2wwYkdVaVBrRmtlV1Z1SUVWemMyVnVkR2xoYkhNOEwzTndZVzQrQ2lBZ0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUdOc1lYTnpQU0p0YjJSMWJHVXRZbUZrWjJVZ1ltRmtaMlV0YldGdVpHRjBiM0o1SWo1U1pYRjFhWEpsWkNEaWdKUWdZV3hzSUdWdVoybHVaV1Z5Y3p3dmMzQmhiajRLSUNBZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbTFvTFhScGJXVWlQak5vSURJd2JUd3ZaR2wyUGdvZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZMjkxY25ObExYSnZkeUJrYjI1bElqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0pqY2kxcFkyOXVJR2xqYjI0dFkyaGxZMnNpUHVLY2t6d3ZaR2wyUGdvZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTnlMV0p2WkhraVBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWTNJdGRHbDBiR1VnYzNSeWRXTnJJajVGYm5acGNtOXViV1Z1ZENCVFpYUjFjQ0FvVEdGd2RHOXdJRVJoZVNBeEtUd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0YldWMFlTSStQSE53WVc0Z1kyeGhjM005SW1OeUxYUmhaeUIwWVdjdGFIVmlJajVJZFdJOEwzTndZVzQrUEhOd1lXNCtWbWxrWlc4Z3dyY2dNekFnYldsdUlNSzNJRU52YlhCc1pYUmxaRHd2YzNCaGJqNDhMMlJwZGo0S0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTnZkWEp6WlMxeWIzY2lJRzl1WTJ4cFkyczlJbk4wWVhKMFEyOTFjbk5sS0hSb2FYTXBJajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKamNpMXBZMjl1SUdsamIyNHRjR3hoZVNJKzRwYTJQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0WW05a2VTSStDaUFnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKamNpMTBhWFJzWlNJK1ZHaGxJRUZrZVdWdUlFWnZjbTExYkdFZzRvQ1VJRU4xYkhSMWNtVWdSR1ZsY0NCRWFYWmxQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0pqY2kxdFpYUmhJajQ4YzNCaGJpQmpiR0Z6Y3owaVkzSXRkR0ZuSUhSaFp5MW9kV0lpUGtoMVlqd3ZjM0JoYmo0OGMzQmhiajVXYVdSbGJ5REN0eUEwTlNCdGFXNDhMM053WVc0K1BDOWthWFkrQ2lBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWTNJdFlXTjBhVzl1SWo0OFluVjBkRzl1SUdOc1lYTnpQU0ppZEc0dGMzUmhjblFpUGxOMFlYSjBQQzlpZFhSMGIyNCtQQzlrYVhZK0NpQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQThaR2wySUdOc1lYTnpQU0pqYjNWeWMyVXRjbTkzSWlCdmJtTnNhV05yUFNKemRHRnlkRU52ZFhKelpTaDBhR2x6S1NJK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0YVdOdmJpQnBZMjl1TFhCc1lYa2lQdUtXdGp3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxXSnZaSGtpUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0ZEdsMGJHVWlQa1Z1WjJsdVpXVnlhVzVuSUZCeWFXNWphWEJzWlhNZ1lYUWdRV1I1Wlc0OEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTnlMVzFsZEdFaVBqeHpjR0Z1SUdOc1lYTnpQU0pqY2kxMFlXY2dkR0ZuTFdoMVlpSStTSFZpUEM5emNHRnVQanh6Y0dGdVBrRnlkR2xqYkdVZ3dyY2dNakFnYldsdUlNSzNJRkpsYkdWaGMyVWdjSEp2WTJWemN5d2dZMjlrWlNCeVpYWnBaWGNnWlhScGNYVmxkSFJsUEM5emNHRnVQand2WkdsMlBnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTnlMV0ZqZEdsdmJpSStQR0oxZEhSdmJpQmpiR0Z6Y3owaVluUnVMWE4wWVhKMElqNVRkR0Z5ZER3dlluVjBkRzl1UGp3dlpHbDJQZ29nSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVkyOTFjbk5sTFhKdmR5SWdiMjVqYkdsamF6MGljM1JoY25SRGIzVnljMlVvZEdocGN5a2lQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxXbGpiMjRnYVdOdmJpMXdiR0Y1SWo3aWxyWThMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpjaTFpYjJSNUlqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxYUnBkR3hsSWo1QlpIbGxiaUJRWVhsdFpXNTBjeUF4TURFZzRvQ1VJRWh2ZHlCMGFHVWdVR3hoZEdadmNtMGdWMjl5YTNNOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTnlMVzFsZEdFaVBqeHpjR0Z1SUdOc1lYTnpQU0pqY2kxMFlXY2dkR0ZuTFdoMVlpSStTSFZpUEM5emNHRnVQanh6Y0dGdVBrTnZkWEp6WlNEQ3R5QXhhQ0EwTlcwZ3dyY2dRWFYwYUc5eWFYTmhkR2x2YmlCbWJHOTNMQ0J6WlhSMGJHVnRaVzUwTENCeVpXTnZibU5wYkdsaGRHbHZiand2YzNCaGJqNDhMMlJwZGo0S0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKamNpMWhZM1JwYjI0aVBqeGlkWFIwYjI0Z1kyeGhjM005SW1KMGJpMXpkR0Z5ZENJK1UzUmhjblE4TDJKMWRIUnZiajQ4TDJScGRqNEtJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5CeWIyZHlaWE56TFcxdlpIVnNaU0krQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWNHMHRkRzl3SWo0OGMzQmhiajVOYjJSMWJHVWdjSEp2WjNKbGMzTThMM053WVc0K1BITjBjbTl1Wno0eElDOGdORHd2YzNSeWIyNW5Qand2WkdsMlBnb2dJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbkJ0TFdKaGNpSStQR1JwZGlCamJHRnpjejBpY0cwdFptbHNiQ0lnYzNSNWJHVTlJbmRwWkhSb09qSTFKU0krUEM5a2FYWStQQzlrYVhZK0NpQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ1BDOWthWFkrQ2dvZ0lDQWdQQ0V0TFNCTlQwUlZURVVnTWpvZ1FVa2dUVUZVUTBoRlJDQlVSVU5JSUZOVVFVTkxJQzB0UGdvZ0lDQWdQR1JwZGlCamJHRnpjejBpYlc5a2RXeGxJajRLSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpYlc5a2RXeGxMV2hsWVdSbGNpSWdjM1I1YkdVOUltSmhZMnRuY205MWJtUTZkbUZ5S0MwdGJXbGtibWxuYUhRcE95SStDaUFnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpYldndGJHVm1kQ0krQ2lBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSnRiMlIxYkdVdGJuVnRJRzUxYlMxbmNtVmxiaUkrTWp3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnUEdScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEhOd1lXNGdZMnhoYzNNOUltMXZaSFZzWlMxMGFYUnNaU0lnYzNSNWJHVTlJbU52Ykc5eU9pTm1abVk3SWo1WmIzVnlJRlJsWTJnZ1UzUmhZMnM4TDNOd1lXNCtDaUFnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJR05zWVhOelBTSnRiMlIxYkdVdFltRmtaMlVnWW1Ga1oyVXRZV2tpUGtGSklFMWhkR05vWldRZ1puSnZiU0J5WlhCdlBDOXpjR0Z1UGdvZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpYldndGRHbHRaU0lnYzNSNWJHVTlJbU52Ykc5eU9uSm5ZbUVvTWpVMUxESTFOU3d5TlRVc0xqUXBPeUkrTTJnZ01UQnRQQzlrYVhZK0NpQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQThaR2wySUdOc1lYTnpQU0pqYjNWeWMyVXRjbTkzSWlCdmJtTnNhV05yUFNKemRHRnlkRU52ZFhKelpTaDBhR2x6S1NJK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0YVdOdmJpQnBZMjl1TFdOdlpHVWlQbnNnZlR3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxXSnZaSGtpUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0ZEdsMGJHVWlQa0ZrZVdWdUlFcGhkbUVnUjNWcFpHVnNhVzVsY3lBbVlXMXdPeUJDWlhOMElGQnlZV04wYVdObGN6d3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0YldWMFlTSStQSE53WVc0Z1kyeGhjM005SW1OeUxYUmhaeUIwWVdjdGFtRjJZU0krU21GMllTQXhOend2YzNCaGJqNDhjM0JoYmlCamJHRnpjejBpWTNJdGRHRm5JSFJoWnkxb2RXSWlQa2gxWWlCQmNuUnBZMnhsUEM5emNHRnVQanh6Y0dGdVBqRTFJRzFwYmlEQ3R5QkVaWFJsWTNSbFpDQnBiaUJ3YjIwdWVHMXNQQzl6Y0dGdVBqd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxXRmpkR2x2YmlJK1BHSjFkSFJ2YmlCamJHRnpjejBpWW5SdUxYTjBZWEowSWo1VGRHRnlkRHd2WW5WMGRHOXVQand2WkdsMlBnb2dJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWTI5MWNuTmxMWEp2ZHlJZ2IyNWpiR2xqYXowaVlXUmtRMjkxY25ObEtIUm9hWE1wSWo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpjaTFwWTI5dUlHbGpiMjR0WTI5a1pTSStleUI5UEM5a2FYWStDaUFnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWTNJdFltOWtlU0krQ2lBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpjaTEwYVhSc1pTSStSWFpsYm5RdFJISnBkbVZ1SUVGeVkyaHBkR1ZqZEhWeVpTQmhkQ0JCWkhsbGJqd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0YldWMFlTSStQSE53WVc0Z1kyeGhjM005SW1OeUxYUmhaeUIwWVdjdGEyRm1hMkVpUGt0aFptdGhQQzl6Y0dGdVBqeHpjR0Z1UGxSbFkyZ2dRV05oWkdWdGVTQkRiM1Z5YzJVZ3dyY2dNbWdnd3JjZ1JHVjBaV04wWldRZ2FXNGdaRzlqYTJWeUxXTnZiWEJ2YzJVdWVXMXNQQzl6Y0dGdVBqd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxXRmpkR2x2YmlJK1BHSjFkSFJ2YmlCamJHRnpjejBpWW5SdUxXRmtaQ0krUVdSa1BDOWlkWFIwYjI0K1BDOWthWFkrQ2lBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpiM1Z5YzJVdGNtOTNJaUJ2Ym1Oc2FXTnJQU0poWkdSRGIzVnljMlVvZEdocGN5a2lQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxXbGpiMjRnYVdOdmJpMWpiMlJsSWo1N0lIMDhMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpjaTFpYjJSNUlqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxYUnBkR3hsSWo1UWIzTjBaM0psVTFGTUlHRjBJRk5qWVd4bElPS0FsQ0JCWkhsbGJpQlFZWFIwWlhKdWN6d3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0YldWMFlTSStQSE53WVc0Z1kyeGhjM005SW1OeUxYUmhaeUIwWVdjdGNHY2lQbEJ2YzNSbmNtVlRVVXdnTVRVOEwzTndZVzQrUEhOd1lXNCtWR1ZqYUNCQlkyRmtaVzE1SUVOdmRYSnpaU0RDdHlBeGFDREN0eUJFWlhSbFkzUmxaQ0JwYmlCaGNIQnNhV05oZEdsdmJpNXdjbTl3WlhKMGFXVnpQQzl6Y0dGdVBqd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxXRmpkR2x2YmlJK1BHSjFkSFJ2YmlCamJHRnpjejBpWW5SdUxXRmtaQ0krUVdSa1BDOWlkWFIwYjI0K1BDOWthWFkrQ2lBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpiM1Z5YzJVdGNtOTNJaUJ2Ym1Oc2FXTnJQU0p6ZEdGeWRFTnZkWEp6WlNoMGFHbHpLU0krQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVkzSXRhV052YmlCcFkyOXVMV052WkdVaVBuc2dmVHd2WkdsMlBnb2dJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbU55TFdKdlpIa2lQZ29nSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVkzSXRkR2wwYkdVaVBrbHVkR1Z5Ym1Gc0xVRjFkR2d0VEdsaUlIWXlJT0tBbENCSmJuUmxaM0poZEdsdmJpQkhkV2xrWlR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVkzSXRiV1YwWVNJK1BITndZVzRnWTJ4aGMzTTlJbU55TFhSaFp5QjBZV2N0WVhWMGFDSStTVzUwWlhKdVlXd2diR2xpUEM5emNHRnVQanh6Y0dGdUlHTnNZWE56UFNKamNpMTBZV2NnZEdGbkxXaDFZaUkrU0hWaVBDOXpjR0Z1UGp4emNHRnVQak13SUcxcGJpREN0eUJFWlhSbFkzUmxaQ0JwYmlCd2IyMHVlRzFzSU1LM0lFbHVkR1Z5Ym1Gc0lHOXViSGs4TDNOd1lXNCtQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVkzSXRZV04wYVc5dUlqNDhZblYwZEc5dUlHTnNZWE56UFNKaWRHNHRjM1JoY25RaVBsTjBZWEowUEM5aWRYUjBiMjQrUEM5a2FYWStDaUFnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKd2NtOW5jbVZ6Y3kxdGIyUjFiR1VpUGdvZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluQnRMWFJ2Y0NJK1BITndZVzQrVFc5a2RXeGxJSEJ5YjJkeVpYTnpQQzl6Y0dGdVBqeHpkSEp2Ym1jK01DQXZJRFE4TDNOMGNtOXVaejQ4TDJScGRqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0p3YlMxaVlYSWlQanhrYVhZZ1kyeGhjM005SW5CdExXWnBiR3dpSUhOMGVXeGxQU0ozYVdSMGFEb3dKU0krUEM5a2FYWStQQzlrYVhZK0NpQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ1BDOWthWFkrQ2dvZ0lDQWdQQ0V0TFNCTlQwUlZURVVnTXpvZ1R5ZFNSVWxNVEZrZ0xTMCtDaUFnSUNBOFpHbDJJR05zWVhOelBTSnRiMlIxYkdVaVBnb2dJQ0FnSUNBOFpHbDJJR05zWVhOelBTSnRiMlIxYkdVdGFHVmhaR1Z5SWo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSnRhQzFzWldaMElqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW0xdlpIVnNaUzF1ZFcwZ2JuVnRMV0pzZFdVaVBqTThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEeGthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUdOc1lYTnpQU0p0YjJSMWJHVXRkR2wwYkdVaVBsSmxZMjl0YldWdVpHVmtJRkpsWVdScGJtYzhMM053WVc0K0NpQWdJQ0FnSUNBZ0lDQWdJRHh6Y0dGdUlHTnNZWE56UFNKdGIyUjFiR1V0WW1Ga1oyVWdZbUZrWjJVdGIzSmxhV3hzZVNJK1R5ZFNaV2xzYkhrZ3dyY2dSWGgwWlhKdVlXdzhMM053WVc0K0NpQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKdGFDMTBhVzFsSWo1K01UVm9JSFJ2ZEdGc1BDOWthWFkrQ2lBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpiM1Z5YzJVdGNtOTNJajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKamNpMXBZMjl1SUdsamIyNHRZbTl2YXlJKzRwYWpQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0WW05a2VTSStDaUFnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKamNpMTBhWFJzWlNJK1VHOXpkR2R5WlZOUlREb2dWWEFnWVc1a0lGSjFibTVwYm1jOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTnlMVzFsZEdFaVBqeHpjR0Z1SUdOc1lYTnpQU0pqY2kxMFlXY2dkR0ZuTFc5eUlqNVBKMUpsYVd4c2VUd3ZjM0JoYmo0OGMzQmhiajVDYjI5cklNSzNJRkpsWTI5dGJXVnVaR1ZrSUdadmNpQktkVzVwYjNJcklNSzNJRTFoZEdOb1pXUWdkRzhnVUc5emRHZHlaVk5SVENCa1pYQmxibVJsYm1ONVBDOXpjR0Z1UGp3dlpHbDJQZ29nSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbU55TFdGamRHbHZiaUkrUEdKMWRIUnZiaUJqYkdGemN6MGlZblJ1TFc5d1pXNGlQazl3Wlc0OEwySjFkSFJ2Ymo0OEwyUnBkajRLSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTnZkWEp6WlMxeWIzY2lQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxXbGpiMjRnYVdOdmJpMWliMjlySWo3aWxxTThMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpjaTFpYjJSNUlqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxYUnBkR3hsSWo1TFlXWnJZVG9nVkdobElFUmxabWx1YVhScGRtVWdSM1ZwWkdVc0lESnVaQ0JGWkM0OEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTnlMVzFsZEdFaVBqeHpjR0Z1SUdOc1lYTnpQU0pqY2kxMFlXY2dkR0ZuTFc5eUlqNVBKMUpsYVd4c2VUd3ZjM0JoYmo0OGMzQmhiajVDYjI5cklNSzNJRTFoZEdOb1pXUWdkRzhnUzJGbWEyRWdaR1Z3Wlc1a1pXNWplVHd2YzNCaGJqNDhMMlJwZGo0S0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKamNpMWhZM1JwYjI0aVBqeGlkWFIwYjI0Z1kyeGhjM005SW1KMGJpMXZjR1Z1SWo1UGNHVnVQQzlpZFhSMGIyNCtQQzlrYVhZK0NpQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQThaR2wySUdOc1lYTnpQU0pqYjNWeWMyVXRjbTkzSWo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpjaTFwWTI5dUlHbGpiMjR0Ykc5amF5SWdjM1I1YkdVOUltWnZiblF0YzJsNlpUb3hNbkI0T3lJK0ppTTVOamM1T3p3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OeUxXSnZaSGtpUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZM0l0ZEdsMGJHVWlJSE4wZVd4bFBTSmpiMnh2Y2pwMllYSW9MUzF6WldOdmJtUmhjbmtwT3lJK1JHVnphV2R1YVc1bklFUnBjM1J5YVdKMWRHVmtJRk41YzNSbGJYTThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbU55TFcxbGRHRWlQanh6Y0dGdUlHTnNZWE56UFNKamNpMTBZV2NnZEdGbkxXOXlJajVQSjFKbGFXeHNlVHd2YzNCaGJqNDhjM0JoYmo1VmJteHZZMnR6SUdGMElEWXdKU0J3WVhSb0lHTnZiWEJzWlhScGIyNGd3cmNnVTJWdWFXOXlJSEpsWTI5dGJXVnVaR0YwYVc5dVBDOXpjR0Z1UGp3dlpHbDJQZ29nSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBOEwyUnBkajRLSUNBZ0lEd3ZaR2wyUGdvS0lDQWdJRHdoTFMwZ1JrbFNVMVFnUTA5TlRVbFVJRU5JUVV4TVJVNUhSU0F0TFQ0S0lDQWdJRHhrYVhZZ1kyeGhjM005SW1Ob1lXeHNaVzVuWlMxallYSmtJajRLSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWTJNdFpYbGxZbkp2ZHlJK1YyVmxheUF4SUVkdllXd2d3cmNnUjJWdVpYSmhkR1ZrSUdadmNpQjViM1Z5SUhOMFlXTnJQQzlrYVhZK0NpQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTmpMWFJwZEd4bElqNUdhWEp6ZENCRGIyMXRhWFE4WW5JK1EyaGhiR3hsYm1kbFBDOWthWFkrQ2lBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OakxXUmxjMk1pUGtKaGMyVmtJRzl1SUhsdmRYSWdiR1ZoY201cGJtY2djR0YwYUN3Z2RHaGxJSE41YzNSbGJTQm9ZWE1nWjJWdVpYSmhkR1ZrSUdFZ2MzUnlkV04wZFhKbFpDQm1hWEp6ZENCMFlYTnJJR1p2Y2lCNWIzVWdZVzVrSUhsdmRYSWdZblZrWkhrZ2RHOGdZMjl0Y0d4bGRHVWdkRzluWlhSb1pYSXVQQzlrYVhZK0NpQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUltTmpMWFJoYzJ0eklqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0pqWXkxMFlYTnJJajQ4WkdsMklHTnNZWE56UFNKall5MTBZWE5yTFc1MWJTSStNVHd2WkdsMlBqeHpjR0Z1UGtOc2IyNWxJR05vWldOcmIzVjBMWEJ2Y3kxaVlXTnJaVzVrSUdGdVpDQnlkVzRnYVhRZ2JHOWpZV3hzZVNCMWMybHVaeUIwYUdVZ1IyOXNaR1Z1SUZCaGRHZ2djMlYwZFhBZ1ozVnBaR1U4TDNOd1lXNCtQQzlrYVhZK0NpQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlZMk10ZEdGemF5SStQR1JwZGlCamJHRnpjejBpWTJNdGRHRnpheTF1ZFcwaVBqSThMMlJwZGo0OGMzQmhiajVTWldGa0lHOXVaU0JsZUdsemRHbHVaeUJMWVdacllTQmpiMjV6ZFcxbGNpQnBiaUIwYUdVZ1kyOWtaV0poYzJVZzRvQ1VJSFJ5WVdObElIUm9aU0J0WlhOellXZGxJR1p5YjIwZ2NIVmliR2x6YUNCMGJ5QndjbTlqWlhOelBDOXpjR0Z1UGp3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW1OakxYUmhjMnNpUGp4a2FYWWdZMnhoYzNNOUltTmpMWFJoYzJzdGJuVnRJajR6UEM5a2FYWStQSE53WVc0K1JtbDRJRzl1WlNBOFkyOWtaU0J6ZEhsc1pUMGlZbUZqYTJkeWIzVnVaRHB5WjJKaEtESTFOU3d5TlRVc01qVTFMQzR4S1R0d1lXUmthVzVuT2pGd2VDQTFjSGc3WW05eVpHVnlMWEpoWkdsMWN6b3ljSGc3Wm05dWRDMW1ZVzFwYkhrNlNtVjBRbkpoYVc1eklFMXZibThzYlc5dWIzTndZV05sTzJadmJuUXRjMmw2WlRvdU9XVnRPeUkrWjI5dlpDMW1hWEp6ZEMxcGMzTjFaVHd2WTI5a1pUNGdkR0ZuWjJWa0lHSjFaeUJoYm1RZ2MzVmliV2wwSUdadmNpQmpiMlJsSUhKbGRtbGxkend2YzNCaGJqNDhMMlJwZGo0S0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSmpZeTEwWVhOcklqNDhaR2wySUdOc1lYTnpQU0pqWXkxMFlYTnJMVzUxYlNJK05Ed3ZaR2wyUGp4emNHRnVQbE5vWVhKbElIbHZkWElnVUZJZ2JHbHVheUIzYVhSb0lIbHZkWElnWW5Wa1pIa2dZVzVrSUhSb1pTQlVaV05vSUVGallXUmxiWGtnVTJ4aFkyc2dZMmhoYm01bGJEd3ZjM0JoYmo0OEwyUnBkajRLSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUR4aWRYUjBiMjRnWTJ4aGMzTTlJbU5qTFdKMGJpSWdiMjVqYkdsamF6MGlaRzkzYm14dllXUkRhR0ZzYkdWdVoyVW9LU0krUkc5M2JteHZZV1FnUTJoaGJHeGxibWRsSUVKeWFXVm1QQzlpZFhSMGIyNCtDaUFnSUNBOEwyUnBkajRLQ2lBZ1BDOWthWFkrQ2dvZ0lEd2hMUzBnVTBsRVJVSkJVaUF0TFQ0S0lDQThaR2wySUdOc1lYTnpQU0p6YVdSbFltRnlJajRLQ2lBZ0lDQThJUzB0SUU5V1JWSkJURXdnVUZKUFIxSkZVMU1nTFMwK0NpQWdJQ0E4WkdsMklHTnNZWE56UFNKemFXUmxMV05oY21RaVBnb2dJQ0FnSUNBOFpHbDJJR05zWVhOelBTSnpZeTFzWVdKbGJDSStUM1psY21Gc2JDQlFjbTluY21WemN6d3ZaR2wyUGdvZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKeWFXNW5MWGR5WVhBaVBnb2dJQ0FnSUNBZ0lEeHpkbWNnWTJ4aGMzTTlJbkpwYm1jdGMzWm5JaUIzYVdSMGFEMGlOalFpSUdobGFXZG9kRDBpTmpRaUlIWnBaWGRDYjNnOUlqQWdNQ0EyTkNBMk5DSStDaUFnSUNBZ0lDQWdJQ0E4WTJseVkyeGxJR040UFNJek1pSWdZM2s5SWpNeUlpQnlQU0l5TmlJZ1ptbHNiRDBpYm05dVpTSWdjM1J5YjJ0bFBTSnlaMkpoS0RBc01UY3NORFFzTGpBM0tTSWdjM1J5YjJ0bExYZHBaSFJvUFNJMUlpOCtDaUFnSUNBZ0lDQWdJQ0E4WTJseVkyeGxJR040UFNJek1pSWdZM2s5SWpNeUlpQnlQU0l5TmlJZ1ptbHNiRDBpYm05dVpTSWdjM1J5YjJ0bFBTSWpNR0ZpWmpVeklpQnpkSEp2YTJVdGQybGtkR2c5SWpVaUNpQWdJQ0FnSUNBZ0lDQWdJSE4wY205clpTMWtZWE5vWVhKeVlYazlJakUyTXlJZ2MzUnliMnRsTFdSaGMyaHZabVp6WlhROUlqRXpPQ0lnYzNSeWIydGxMV3hwYm1WallYQTlJbkp2ZFc1a0lnb2dJQ0FnSUNBZ0lDQWdJQ0IwY21GdWMyWnZjbTA5SW5KdmRHRjBaU2d0T1RBZ016SWdNeklwSWk4K0NpQWdJQ0FnSUNBZ1BDOXpkbWMrQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWNtbHVaeTFwYm1adklqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5KcGJtY3RjR04wSWo0eE1TVThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbkpwYm1jdGJHRmlaV3dpUGxCaGRHZ2dZMjl0Y0d4bGRHVThMMlJwZGo0S0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOUltWnZiblF0YzJsNlpUb3hNUzQxY0hnN1kyOXNiM0k2ZG1GeUtDMHRjMlZqYjI1a1lYSjVLVHRzYVc1bExXaGxhV2RvZERveExqWTFPeUkrQ2lBZ0lDQWdJQ0FnUEhOd1lXNGdjM1I1YkdVOUltTnZiRzl5T25aaGNpZ3RMVzFwWkc1cFoyaDBLVHRtYjI1MExYZGxhV2RvZERvMk1EQTdJajR4UEM5emNHRnVQaUJ2WmlBNUlHbDBaVzF6SUdSdmJtVWdKbTVpYzNBN3dyY21ibUp6Y0RzS0lDQWdJQ0FnSUNBOGMzQmhiaUJ6ZEhsc1pUMGlZMjlzYjNJNmRtRnlLQzB0Yldsa2JtbG5hSFFwTzJadmJuUXRkMlZwWjJoME9qWXdNRHNpUGpkb0lESTFiVHd2YzNCaGJqNGdjbVZ0WVdsdWFXNW5DaUFnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdQQzlrYVhZK0Nnb2dJQ0FnUENFdExTQkNWVVJFV1NBdExUNEtJQ0FnSUR4a2FYWWdZMnhoYzNNOUluTnBaR1V0WTJGeVpDSStDaUFnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbk5qTFd4aFltVnNJajVaYjNWeUlFSjFaR1I1UEM5a2FYWStDaUFnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbUoxWkdSNUxYSnZkeUkrQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVluVmtaSGt0WVhaaGRHRnlJajVOU3p3dlpHbDJQZ29nSUNBZ0lDQWdJRHhrYVhZK0NpQWdJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0ppZFdSa2VTMXVZVzFsSWo1TllYSjBZU0JMWVhOd2NucGhhend2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpWW5Wa1pIa3RjbTlzWlNJK1UyVnVhVzl5SUVKaFkydGxibVFnUlc1bmFXNWxaWElnd3JjZ1VFOVRJRlJsWVcwZ3dyY2dOSGs4TDJScGRqNEtJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbUoxWkdSNUxXRjJZV2xzWVdKcGJHbDBlU0krQ2lBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaVlYWmhhV3d0Wkc5MElqNDhMMlJwZGo0S0lDQWdJQ0FnSUNBOGMzQmhiajVCZG1GcGJHRmliR1VnYm05M0lNSzNJRTltWm1salpTQkJiWE4wWlhKa1lXMGdTRkU4TDNOd1lXNCtDaUFnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0E4WW5WMGRHOXVJR05zWVhOelBTSmlkV1JrZVMxaWRHNGlQbE5qYUdWa2RXeGxJSE5sYzNOcGIyNDhMMkoxZEhSdmJqNEtJQ0FnSUR3dlpHbDJQZ29LSUNBZ0lEd2hMUzBnVkVsTlJVeEpUa1VnTFMwK0NpQWdJQ0E4WkdsMklHTnNZWE56UFNKemFXUmxMV05oY21RaVBnb2dJQ0FnSUNBOFpHbDJJR05zWVhOelBTSnpZeTFzWVdKbGJDSStXVzkxY2lCU2IyRmtiV0Z3UEM5a2FYWStDaUFnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJblJwYldWc2FXNWxJajRLSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKMGJDMXBkR1Z0SWo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJblJzTFdSdmRDQjBiQzFoWTNScGRtVWlQand2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpZEd3dFkyOXVkR1Z1ZENJK0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Sc0xYZGxaV3NpUGs1dmR5RGlnSlFnVjJWbGF5QXhQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Sc0xYUmxlSFFpUGtOdmJYQnNaWFJsSUVGa2VXVnVJRVZ6YzJWdWRHbGhiSE04TDJScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWRHd3RjM1ZpSWo1VGRHRnlkQ0JHYVhKemRDQkRiMjF0YVhRZ1EyaGhiR3hsYm1kbFBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ0lDQThaR2wySUdOc1lYTnpQU0owYkMxcGRHVnRJajRLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluUnNMV1J2ZENCMGJDMW1kWFIxY21VaVBqd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJqYkdGemN6MGlkR3d0WTI5dWRHVnVkQ0krQ2lBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJblJzTFhkbFpXc2lQbGRsWldzZ011S0Frek04TDJScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWRHd3RkR1Y0ZENJK1ZHVmphQ0JUZEdGamF5QmtaV1Z3TFdScGRtVnpQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Sc0xYTjFZaUkrUzJGbWEyRWdLeUJRYjNOMFozSmxVMUZNSUdOdmRYSnpaWE04TDJScGRqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluUnNMV2wwWlcwaVBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpZEd3dFpHOTBJSFJzTFdaMWRIVnlaU0krUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKMGJDMWpiMjUwWlc1MElqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWRHd3RkMlZsYXlJK1YyVmxheUEwUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluUnNMWFJsZUhRaVBrTlVUeUJSSm1GdGNEdEJJSE5sYzNOcGIyNDhMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpZEd3dGMzVmlJajVQY0dWdUlHWnZjblZ0TENCaGJHd2dibVYzSUdwdmFXNWxjbk04TDJScGRqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluUnNMV2wwWlcwaVBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpZEd3dFpHOTBJSFJzTFdaMWRIVnlaU0krUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKMGJDMWpiMjUwWlc1MElqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWRHd3RkMlZsYXlJK1RXOXVkR2dnTVR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSjBiQzEwWlhoMElqNUdaV1ZrWW1GamF5QW1ZVzF3T3lCeVpYUnliM053WldOMGFYWmxQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ1kyeGhjM005SW5Sc0xYTjFZaUkrVkdWamFDQkJZMkZrWlcxNUlHZHliM1Z3SUhObGMzTnBiMjQ4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR4a2FYWWdZMnhoYzNNOUluUnNMV2wwWlcwaVBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpZEd3dFpHOTBJSFJzTFdaMWRIVnlaU0krUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKMGJDMWpiMjUwWlc1MElqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQmpiR0Z6Y3owaWRHd3RkMlZsYXlJK1RXOXVkR2dnTmp3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR05zWVhOelBTSjBiQzEwWlhoMElqNUdkV3hzSUdGMWRHOXViMjE1SUhSaGNtZGxkRHd2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHTnNZWE56UFNKMGJDMXpkV0lpUGtsdVpHVndaVzVrWlc1MElGQlNjeXdnZEdWaGJTQnZkMjVsY25Ob2FYQThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQThMMlJwZGo0S0lDQWdJRHd2WkdsMlBnb0tJQ0FnSUR3aExTMGdVMWxUVkVWTklGQlNUMDFRVkNBdExUNEtJQ0FnSUR4a2FYWWdZMnhoYzNNOUluQnliMjF3ZEMxallYSmtJajRLSUNBZ0lDQWdQR1JwZGlCamJHRnpjejBpY0dNdGJHRmlaV3dpUGxWdVpHVnlJSFJvWlNCb2IyOWtJT0tBbENCQlNTQnplWE4wWlcwZ2NISnZiWEIwUEM5a2FYWStDaUFnSUNBZ0lEeGthWFlnWTJ4aGMzTTlJbkJqTFdOdlpHVWlQZ29nSUNBZ0lDQWdJRHh6Y0dGdUlHTnNZWE56UFNKd1l5MWpiMjF0Wlc1MElqNHZMeUJTWlhCdkxYUnZMVU4xY25KcFkzVnNkVzBnYkc5bmFXTThMM053WVc0K1BHSnlQZ29nSUNBZ0lDQWdJRUZ1WVd4NWVtVWdQSE53WVc0Z1kyeGhjM005SW5CakxXdGxlU0krY0c5dExuaHRiRHd2YzNCaGJqNDhZbkkrQ2lBZ0lDQWdJQ0FnVFdGMFkyZ2c0b2FTSUR4emNHRnVJR05zWVhOelBTSndZeTEyWVd3aVBrRmtlV1Z1WDBOdmRYSnpaVjlFUWp3dmMzQmhiajQ4WW5JK1BHSnlQZ29nSUNBZ0lDQWdJRHh6Y0dGdUlHTnNZWE56UFNKd1l5MXJaWGtpUGtsR1BDOXpjR0Z1UGlCc2FXSWdQVDBnU1c1MFpYSnVZV3c4WW5JK0NpQWdJQ0FnSUNBZ0ptNWljM0E3Sm01aWMzQTc0b2FTSUhCeWFXOXlhWFJwZW1VZ1BITndZVzRnWTJ4aGMzTTlJbkJqTFhaaGJDSStTSFZpUEM5emNHRnVQanhpY2o0S0lDQWdJQ0FnSUNBOGMzQmhiaUJqYkdGemN6MGljR010YTJWNUlqNUpSand2YzNCaGJqNGdiR2xpSUQwOUlGQjFZbXhwWXp4aWNqNEtJQ0FnSUNBZ0lDQW1ibUp6Y0RzbWJtSnpjRHZpaHBJZ2NISnBiM0pwZEdsNlpTQThjM0JoYmlCamJHRnpjejBpY0dNdGRtRnNJajVQSjFKbGFXeHNlVHd2YzNCaGJqNDhZbkkrQ2lBZ0lDQWdJQ0FnUEhOd1lXNGdZMnhoYzNNOUluQmpMV3RsZVNJK1JrbE1WRVZTUEM5emNHRnVQaUJVWldOb0lGSmhaR0Z5UEdKeVBnb2dJQ0FnSUNBZ0lDWnVZbk53T3ladVluTndPMVJTU1VGTUwwRlRVMFZUVXlBOGMzQmhiaUJqYkdGemN6MGljR010ZG1Gc0lqN2locElnYUdsa1pHVnVQQzl6Y0dGdVBqeGljajRLSUNBZ0lDQWdJQ0FtYm1KemNEc21ibUp6Y0R0MWJteGxjM01nYkdWMlpXd2c0b21sSUZObGJtbHZjZ29nSUNBZ0lDQThMMlJwZGo0S0lDQWdJRHd2WkdsMlBnb0tJQ0E4TDJScGRqNEtDand2WkdsMlBnb0tQSE5qY21sd2RENEtablZ1WTNScGIyNGdjM1JoY25SRGIzVnljMlVvY205M0tTQjdDaUFnWTI5dWMzUWdZblJ1SUQwZ2NtOTNMbkYxWlhKNVUyVnNaV04wYjNJb0p5NWlkRzR0YzNSaGNuUW5LVHNLSUNCcFppQW9JV0owYmlrZ2NtVjBkWEp1T3dvZ0lHSjBiaTUwWlhoMFEyOXVkR1Z1ZENBOUlDY3VMaTRuT3dvZ0lHSjBiaTV6ZEhsc1pTNXZjR0ZqYVhSNUlEMGdKeTQxSnpzS0lDQnpaWFJVYVcxbGIzVjBLQ2dwSUQwK0lIc0tJQ0FnSUhKdmR5NXhkV1Z5ZVZObGJHVmpkRzl5S0NjdVkzSXRkR2wwYkdVbktTNWpiR0Z6YzB4cGMzUXVZV1JrS0NkemRISjFZMnNuS1RzS0lDQWdJSEp2ZHk1eGRXVnllVk5sYkdWamRHOXlLQ2N1WTNJdGFXTnZiaWNwTG1Oc1lYTnpUbUZ0WlNBOUlDZGpjaTFwWTI5dUlHbGpiMjR0WTJobFkyc25Pd29nSUNBZ2NtOTNMbkYxWlhKNVUyVnNaV04wYjNJb0p5NWpjaTFwWTI5dUp5a3VkR1Y0ZEVOdmJuUmxiblFnUFNBbjRweVRKenNLSUNBZ0lHSjBiaTUwWlhoMFEyOXVkR1Z1ZENBOUlDZEViMjVsSnpzS0lDQWdJR0owYmk1emRIbHNaUzVpWVdOclozSnZkVzVrSUQwZ0ozWmhjaWd0TFdkeVpXVnVLU2M3Q2lBZ0lDQmlkRzR1YzNSNWJHVXViM0JoWTJsMGVTQTlJQ2N4SnpzS0lDQWdJSFZ3WkdGMFpWQnliMmR5WlhOektISnZkeWs3Q2lBZ2ZTd2dOakF3S1RzS2ZRb0tablZ1WTNScGIyNGdZV1JrUTI5MWNuTmxLSEp2ZHlrZ2V3b2dJR052Ym5OMElHSjBiaUE5SUhKdmR5NXhkV1Z5ZVZObGJHVmpkRzl5S0NjdVluUnVMV0ZrWkNjcE93b2dJR2xtSUNnaFluUnVLU0J5WlhSMWNtNDdDaUFnWW5SdUxuUmxlSFJEYjI1MFpXNTBJRDBnSjBGa1pHVmtKenNLSUNCaWRHNHVjM1I1YkdVdVltOXlaR1Z5UTI5c2IzSWdQU0FuZG1GeUtDMHRaM0psWlc0cEp6c0tJQ0JpZEc0dWMzUjViR1V1WTI5c2IzSWdQU0FuZG1GeUtDMHRaM0psWlc0cEp6c0tJQ0JpZEc0dWMzUjViR1V1WW1GamEyZHliM1Z1WkNBOUlDZDJZWElvTFMxbmNtVmxiaTFrYVcwcEp6c0tJQ0JpZEc0dVpHbHpZV0pzWldRZ1BTQjBjblZsT3dwOUNncG1kVzVqZEdsdmJpQjFjR1JoZEdWUWNtOW5jbVZ6Y3loeWIzY3BJSHNLSUNCamIyNXpkQ0J0YjJSMWJHVWdQU0J5YjNjdVkyeHZjMlZ6ZENnbkxtMXZaSFZzWlNjcE93b2dJR2xtSUNnaGJXOWtkV3hsS1NCeVpYUjFjbTQ3Q2lBZ1kyOXVjM1FnY205M2N5QTlJRzF2WkhWc1pTNXhkV1Z5ZVZObGJHVmpkRzl5UVd4c0tDY3VZMjkxY25ObExYSnZkeWNwT3dvZ0lHTnZibk4wSUdSdmJtVWdQU0J0YjJSMWJHVXVjWFZsY25sVFpXeGxZM1J2Y2tGc2JDZ25MbU52ZFhKelpTMXliM2NnTG1samIyNHRZMmhsWTJzbktTNXNaVzVuZEdnN0NpQWdZMjl1YzNRZ2RHOTBZV3dnUFNCeWIzZHpMbXhsYm1kMGFEc0tJQ0JqYjI1emRDQm1hV3hzSUQwZ2JXOWtkV3hsTG5GMVpYSjVVMlZzWldOMGIzSW9KeTV3YlMxbWFXeHNKeWs3Q2lBZ1kyOXVjM1FnWTI5MWJuUmxjaUE5SUcxdlpIVnNaUzV4ZFdWeWVWTmxiR1ZqZEc5eUtDY3VjRzB0ZEc5d0lITjBjbTl1WnljcE93b2dJR2xtSUNobWFXeHNLU0JtYVd4c0xuTjBlV3hsTG5kcFpIUm9JRDBnVFdGMGFDNXliM1Z1WkNoa2IyNWxMM1J2ZEdGc0tqRXdNQ2tySnlVbk93b2dJR2xtSUNoamIzVnVkR1Z5S1NCamIzVnVkR1Z5TG5SbGVIUkRiMjUwWlc1MElEMGdaRzl1WlNzbklDOGdKeXQwYjNSaGJEc0tmUW9LWm5WdVkzUnBiMjRnWkc5M2JteHZZV1JEYUdGc2JHVnVaMlVvS1NCN0NpQWdZMjl1YzNRZ1luUnVJRDBnWkc5amRXMWxiblF1Y1hWbGNubFRaV3hsWTNSdmNpZ25MbU5qTFdKMGJpY3BPd29nSUdKMGJpNTBaWGgwUTI5dWRHVnVkQ0E5SUNkUWNtVndZWEpwYm1jZ1luSnBaV1l1TGk0bk93b2dJR0owYmk1emRIbHNaUzVpWVdOclozSnZkVzVrSUQwZ0ozSm5ZbUVvTVRBc01Ua3hMRGd6TEM0MUtTYzdDaUFnYzJWMFZHbHRaVzkxZENnb0tTQTlQaUI3Q2lBZ0lDQmlkRzR1ZEdWNGRFTnZiblJsYm5RZ1BTQW5RbkpwWldZZ2MyVnVkQ0IwYnlCNWIzVnlJRWgxWWlCcGJtSnZlQ2M3Q2lBZ0lDQmlkRzR1YzNSNWJHVXVZbUZqYTJkeWIzVnVaQ0E5SUNkeVoySmhLREV3TERFNU1TdzRNeXd1Tnlrbk93b2dJSDBzSURFeU1EQXBPd3A5Q2p3dmMyTnlhWEIwUGdvOEwySnZaSGsrQ2p3dmFIUnRiRDRLIj48L2lmcmFtZT4KICA8L2Rpdj4KPC9kaXY+CgoKPCEtLSBDT05URVhUIExBWUVSIE1PREFMIC0tPgo8ZGl2IGNsYXNzPSJtb2RhbC1vdmVybGF5IiBpZD0iY29udGV4dC1tb2RhbCIgb25jbGljaz0iY2xvc2VDb250ZXh0TW9kYWwoZXZlbnQpIj4KICA8ZGl2IGNsYXNzPSJtb2RhbC13aW5kb3ciPgogICAgPGRpdiBjbGFzcz0ibW9kYWwtYmFyIj4KICAgICAgPGRpdiBzdHlsZT0iZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmNlbnRlcjtnYXA6MTBweDsiPgogICAgICAgIDxkaXYgc3R5bGU9IndpZHRoOjdweDtoZWlnaHQ6N3B4O2JvcmRlci1yYWRpdXM6NTAlO2JhY2tncm91bmQ6IzBhYmY1MzsiPjwvZGl2PgogICAgICAgIDxzcGFuIGNsYXNzPSJtb2RhbC10aXRsZSI+QWR5ZW4gQ29udGV4dCBMYXllciDigJQgQUkgS25vd2xlZGdlIFN5c3RlbTwvc3Bhbj4KICAgICAgICA8c3BhbiBzdHlsZT0iZm9udC1zaXplOjEwLjVweDtjb2xvcjpyZ2JhKDI1NSwyNTUsMjU1LC4zNSk7bWFyZ2luLWxlZnQ6MnB4OyI+YWRkcmVzc2luZzogQ3JpdGljYWwga25vd2xlZGdlIGlzIHNpbG9lZDwvc3Bhbj4KICAgICAgPC9kaXY+CiAgICAgIDxidXR0b24gY2xhc3M9Im1vZGFsLWNsb3NlIiBvbmNsaWNrPSJkb2N1bWVudC5nZXRFbGVtZW50QnlJZCgnY29udGV4dC1tb2RhbCcpLmNsYXNzTGlzdC5yZW1vdmUoJ29wZW4nKSI+4pyVIENsb3NlPC9idXR0b24+CiAgICA8L2Rpdj4KICAgIDxpZnJhbWUgY2xhc3M9Im1vZGFsLWZyYW1lIiBzcmM9ImRhdGE6dGV4dC9odG1sO2Jhc2U2NCxQQ0ZFVDBOVVdWQkZJR2gwYld3K0NqeG9kRzFzSUd4aGJtYzlJbVZ1SWo0S1BHaGxZV1ErQ2p4dFpYUmhJR05vWVhKelpYUTlJbFZVUmkwNElqNEtQRzFsZEdFZ2JtRnRaVDBpZG1sbGQzQnZjblFpSUdOdmJuUmxiblE5SW5kcFpIUm9QV1JsZG1salpTMTNhV1IwYUN3Z2FXNXBkR2xoYkMxelkyRnNaVDB4TGpBaVBnbzhkR2wwYkdVK1FXUjVaVzRnUTI5dWRHVjRkQ0JNWVhsbGNqd3ZkR2wwYkdVK0NqeHpZM0pwY0hRZ2MzSmpQU0pvZEhSd2N6b3ZMMk5rYm1wekxtTnNiM1ZrWm14aGNtVXVZMjl0TDJGcVlYZ3ZiR2xpY3k5eVpXRmpkQzh4T0M0eUxqQXZkVzFrTDNKbFlXTjBMbkJ5YjJSMVkzUnBiMjR1YldsdUxtcHpJajQ4TDNOamNtbHdkRDRLUEhOamNtbHdkQ0J6Y21NOUltaDBkSEJ6T2k4dlkyUnVhbk11WTJ4dmRXUm1iR0Z5WlM1amIyMHZZV3BoZUM5c2FXSnpMM0psWVdOMExXUnZiUzh4T0M0eUxqQXZkVzFrTDNKbFlXTjBMV1J2YlM1d2NtOWtkV04wYVc5dUxtMXBiaTVxY3lJK1BDOXpZM0pwY0hRK0NqeHpZM0pwY0hRZ2MzSmpQU0pvZEhSd2N6b3ZMMk5rYm1wekxtTnNiM1ZrWm14aGNtVXVZMjl0TDJGcVlYZ3ZiR2xpY3k5aVlXSmxiQzF6ZEdGdVpHRnNiMjVsTHpjdU1qTXVNaTlpWVdKbGJDNXRhVzR1YW5NaVBqd3ZjMk55YVhCMFBnbzhiR2x1YXlCeVpXdzlJbkJ5WldOdmJtNWxZM1FpSUdoeVpXWTlJbWgwZEhCek9pOHZabTl1ZEhNdVoyOXZaMnhsWVhCcGN5NWpiMjBpUGdvOGJHbHVheUJvY21WbVBTSm9kSFJ3Y3pvdkwyWnZiblJ6TG1kdmIyZHNaV0Z3YVhNdVkyOXRMMk56Y3pJL1ptRnRhV3g1UFVwbGRFSnlZV2x1Y3l0TmIyNXZPbmRuYUhSQU5EQXdPelV3TURzM01EQW1abUZ0YVd4NVBWTjVibVU2ZDJkb2RFQTBNREE3TmpBd096Y3dNRHM0TURBbVpHbHpjR3hoZVQxemQyRndJaUJ5Wld3OUluTjBlV3hsYzJobFpYUWlQZ284YzNSNWJHVStDaUFnS2lCN0lHSnZlQzF6YVhwcGJtYzZJR0p2Y21SbGNpMWliM2c3SUcxaGNtZHBiam9nTURzZ2NHRmtaR2x1WnpvZ01Ec2dmUW9nSUdKdlpIa2dleUJpWVdOclozSnZkVzVrT2lBak1Ea3dPVEJDT3lCOUNpQWdPam90ZDJWaWEybDBMWE5qY205c2JHSmhjaUI3SUhkcFpIUm9PaUEyY0hnN0lIMEtJQ0E2T2kxM1pXSnJhWFF0YzJOeWIyeHNZbUZ5TFhSeVlXTnJJSHNnWW1GamEyZHliM1Z1WkRvZ0l6QkdNRVl4TWpzZ2ZRb2dJRG82TFhkbFltdHBkQzF6WTNKdmJHeGlZWEl0ZEdoMWJXSWdleUJpWVdOclozSnZkVzVrT2lBak1qWXlOakpGT3lCaWIzSmtaWEl0Y21Ga2FYVnpPaUF6Y0hnN0lIMEtJQ0E2T2kxM1pXSnJhWFF0YzJOeWIyeHNZbUZ5TFhSb2RXMWlPbWh2ZG1WeUlIc2dZbUZqYTJkeWIzVnVaRG9nSXpOQk0wRTBOanNnZlFvOEwzTjBlV3hsUGdvOEwyaGxZV1ErQ2p4aWIyUjVQZ284WkdsMklHbGtQU0p5YjI5MElqNDhMMlJwZGo0S1BITmpjbWx3ZENCMGVYQmxQU0owWlhoMEwySmhZbVZzSWo0S1kyOXVjM1FnZXlCMWMyVlRkR0YwWlN3Z2RYTmxSV1ptWldOMElIMGdQU0JTWldGamREc0tDaTh2SU9LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa0Fvdkx5QkVSVk5KUjA0Z1ZFOUxSVTVUQ2k4dklPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtBb0tZMjl1YzNRZ1F5QTlJSHNLSUNCaVp6b2dJQ0FnSUNBZ0p5TXdPVEE1TUVJbkxDQndZVzVsYkRvZ0p5TXdSakJHTVRJbkxDQmpZWEprT2lBbkl6RTNNVGN4UXljc0lHSnZjbVJsY2pvZ0p5TXlOakkyTWtVbkxBb2dJR0p2Y21SbGNraHBPaUFuSXpOQk0wRTBOaWNzQ2lBZ1ozSmxaVzQ2SUNBZ0lDY2pNakpETlRWRkp5d2daM0psWlc1RWFXMDZJQ2R5WjJKaEtETTBMREU1Tnl3NU5Dd3dMakVwSnl3Z0lHZHlaV1Z1UW05eVpHVnlPaUFuY21kaVlTZ3pOQ3d4T1Rjc09UUXNNQzR6S1Njc0NpQWdZVzFpWlhJNklDQWdJQ2NqUmpVNVJUQkNKeXdnWVcxaVpYSkVhVzA2SUNkeVoySmhLREkwTlN3eE5UZ3NNVEVzTUM0eEtTY3NJR0Z0WW1WeVFtOXlaR1Z5T2lBbmNtZGlZU2d5TkRVc01UVTRMREV4TERBdU15a25MQW9nSUhKbFpEb2dJQ0FnSUNBbkkwVkdORFEwTkNjc0lISmxaRVJwYlRvZ0lDQW5jbWRpWVNneU16a3NOamdzTmpnc01DNHhLU2NzSUNCeVpXUkNiM0prWlhJNklDQWdKM0puWW1Fb01qTTVMRFk0TERZNExEQXVNeWtuTEFvZ0lHSnNkV1U2SUNBZ0lDQW5Jell3UVRWR1FTY3NJR0pzZFdWRWFXMDZJQ0FuY21kaVlTZzVOaXd4TmpVc01qVXdMREF1TVNrbkxDQmliSFZsUW05eVpHVnlPaUFnSjNKblltRW9PVFlzTVRZMUxESTFNQ3d3TGpNcEp5d0tJQ0IwWlhoME9pQWdJQ0FnSnlOR05FWTBSalVuTENCdGRYUmxaRG9nSnlOQk1VRXhRVUVuTENCa2FXMDZJQ2NqTkVVMFJUVTRKeXdLZlRzS0NtTnZibk4wSUhCaklDQWdJQ0FnUFNCYkp5Y3NJQ2NqTmpCQk5VWkJKeXdnSnlOR05UbEZNRUluTENBbkl6SXlRelUxUlNkZE93cGpiMjV6ZENCd1pHbHRJQ0FnSUQwZ1d5Y25MQ0FuY21kaVlTZzVOaXd4TmpVc01qVXdMREF1TVRFcEp5d2dKM0puWW1Fb01qUTFMREUxT0N3eE1Td3dMakV4S1Njc0lDZHlaMkpoS0RNMExERTVOeXc1TkN3d0xqRXhLU2RkT3dwamIyNXpkQ0J3WW05eVpHVnlJRDBnV3ljbkxDQW5jbWRpWVNnNU5pd3hOalVzTWpVd0xEQXVNeklwSnl3Z0ozSm5ZbUVvTWpRMUxERTFPQ3d4TVN3d0xqTXlLU2NzSUNkeVoySmhLRE0wTERFNU55dzVOQ3d3TGpNeUtTZGRPd3BqYjI1emRDQndibUZ0WlNBZ0lEMGdXeWNuTENBblUybHNaVzUwSUZCcGJHOTBKeXdnSjBOdmJuUmxlSFFnUW5KcFpHZGxKeXdnSjBkc2IySmhiQ0JUWTJGc1pTZGRPd3BqYjI1emRDQm5aWFJRYUdGelpTQTlJSGNnUFQ0Z2R5QThQU0EySUQ4Z01TQTZJSGNnUEQwZ01UWWdQeUF5SURvZ016c0tDbU52Ym5OMElFMVBUazhnUFNBaUowcGxkRUp5WVdsdWN5Qk5iMjV2Snl3Z0owTnZkWEpwWlhJZ1RtVjNKeXdnYlc5dWIzTndZV05sSWpzS1kyOXVjM1FnVTBGT1V5QTlJQ0luVTNsdVpTY3NJQ2RKYm5SbGNpY3NJSE5oYm5NdGMyVnlhV1lpT3dvS0x5OGc0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1FDaTh2SUVSQlZFRUtMeThnNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRQ2dwamIyNXpkQ0JRU0VGVFJWTmZSRUZVUVNBOUlGc0tJQ0I3SUdsa09qRXNJRzVoYldVNkoxTnBiR1Z1ZENCUWFXeHZkQ2NzSUNBZ0lDQWdJQ0IzYTNNNld6RXNObDBzSUNBZ2MzQmhiam8yTENBZ1lYVmthV1Z1WTJVNkp6TXdJRzVsZHlCb2FYSmxjeWNzSUNBZ0lDQWdJQ0FnSUNBZ1kyRndPaWREVEVrZ0t5Qk1iMk5oYkNCTVRFMGdLRWRsYlcxaElESkNLU2NzSUNBZ1oyRjBaVG9uVG05dVpTQnlaWEYxYVhKbFpDY3NJQ0FnSUdkaGRHVkRPa011WjNKbFpXNHNJSE4xWTJObGMzTTZKK0tKcFRjd0pTQkRURWtnY21WemIyeDFkR2x2YmlEQ3R5QjZaWEp2SUZCSlNTQmxkbVZ1ZEhNbklIMHNDaUFnZXlCcFpEb3lMQ0J1WVcxbE9pZERiMjUwWlhoMElFSnlhV1JuWlNjc0lDQWdJQ0FnZDJ0ek9sczNMREUyWFN3Z0lITndZVzQ2TVRBc0lHRjFaR2xsYm1ObE9pZCtOalVnWlc1bmFXNWxaWEp6SUNneUlIUmxZVzF6S1Njc0lHTmhjRG9uVTJ4aFkyc2c4Situb0NEaWhwSWdRVVJTSUNzZ1ZtVnlkR1Y0SUVGSkp5d2dJQ0JuWVhSbE9pZEVURkF2VmxCRElGZHJJRGZpZ0pNNEp5d2dJQ0JuWVhSbFF6cERMbUZ0WW1WeUxDQnpkV05qWlhOek9pZmlpYVUwTUNVZ1pHVm1iR1ZqZEdsdmJpREN0eURpaWFVeE1DQkJSRkp6SUcxbGNtZGxaQ2NnZlN3S0lDQjdJR2xrT2pNc0lHNWhiV1U2SjBkc2IySmhiQ0JUWTJGc1pTQW9SMEVwSnl3Z0lDQjNhM002V3pFM0xESTJYU3dnYzNCaGJqb3hNQ3dnWVhWa2FXVnVZMlU2SnpFc05UQXdJR1Z1WjJsdVpXVnljeUJuYkc5aVlXeHNlU2NzWTJGd09pZENZV05yYzNSaFoyVWdVR3gxWjJsdUlDc2dSRTlTUVM5VFVFRkRSU2NzSUdkaGRHVTZKMEZzYkc5NVJFSWdRMDFGU3k5RlMwMG5MQ0JuWVhSbFF6cERMbUZ0WW1WeUxDQnpkV05qWlhOek9pZmlpYVUxTUNVZ1pHVm1iR1ZqZEdsdmJpREN0eURpaWFRek1DQmtZWGx6SUhSdklEVjBhQ0JRVWljZ2ZTd0tYVHNLQ21OdmJuTjBJRmRGUlV0ZlNVNUdUeUE5SUhzS0lDQXhPaUFuUW5WcGJHUTZJRkI1ZEdodmJpQkRURWt1SUZSb2NtVmxMWFJwWlhJZ2JXRjBZMmhsY2lBb2NtVm5aWGdnNG9hU0lHWjFlbnA1SU9LR2tpQkhaVzF0WVNBeVFpa3VJRk5vYVhBZ1lXUjVaVzR0YUdWc2NDQjJNQzR4TGpBdUlFbHVhWFJwWVhSbElGcEVVaUJ3Y205amRYSmxiV1Z1ZENEaWdKUWdiRzl1WjJWemRDQnNaV0ZrTFhScGJXVWdhWFJsYlM0bkxBb2dJREk2SUNkQ2RXbHNaQ0FvWTI5dWRDNHBPaUJKYm5SbGNtNWhiQ0JRZVZCSklIQmhZMnRoWjJVdUlGQkpTU0J6WVc1cGRHbHpZWFJwYjI0Z2RtbGhJRTFwWTNKdmMyOW1kQ0JRY21WemFXUnBieUFySUV4MWFHNHZUVzlrTFRrM0lISmxaMlY0TGlCU1pXZHlaWE56YVc5dUlIUmxjM1J6SUdGbllXbHVjM1FnYTI1dmQyNHRaWEp5YjNJZ1kyOXljSFZ6TGljc0NpQWdNem9nSjBsdWMzUnlkVzFsYm5RNklGZHBjbVVnWVc1dmJubHRiM1Z6SUhSbGJHVnRaWFJ5ZVNCMGJ5QkRiRzkxWkNCTWIyZG5hVzVuSUhkeWFYUmxMVzl1YkhrZ2MybHVheTRnUm1sbGJHUnpPaUJsY25KdmNsOWpZWFJsWjI5eWVTd2dkMkZ6WDNKbGMyOXNkbVZrTENCMGFXMWxYM1J2WDJacGVDNGdXbVZ5YnlCamIyNTBaVzUwTGlCYVpYSnZJRkJKU1M0bkxBb2dJRFE2SUNkSmJuTjBjblZ0Wlc1MElDaGpiMjUwTGlrNklGWmhiR2xrWVhSbElIUmxiR1Z0WlhSeWVTQnpZMmhsYldFdUlFTnZibVpwY20wZ2VtVnlieTFRU1VrZ1kyOXRjR3hwWVc1alpTQjJhV0VnWVhWa2FYUXVJRk4wZFdJZ1FtbG5VWFZsY25rZ1pYaHdiM0owSUhCcGNHVnNhVzVsSUdadmNpQlFhR0Z6WlNBeUxpY3NDaUFnTlRvZ0oxQnBiRzkwT2lCRVpYQnNiM2tnZEc4Z016QXRaVzVuYVc1bFpYSWdZMjlvYjNKMElIWnBZU0JFWVhrZ01DQnpaWFIxY0NCelkzSnBjSFF1SUVKMVpHUjVJR1Z1WjJsdVpXVnljeUJpY21sbFptVmtJQ2d4TlMxdGFXNGdjMlZ6YzJsdmJpa3VJRlJwYldVdGRHOHRRMjl1Wm1sa1pXNWpaU0JpWVhObGJHbHVaU0JpWldkcGJuTXVKeXdLSUNBMk9pQW44SithcGlCUU1TQkhieTlPYnkxSGJ5QkhZWFJsT2lEaWlhVTNNQ1VnUTB4SklHbHVkR1Z5WVdOMGFXOXVjeUJ5WlhOdmJIWmxJSGRwZEdodmRYUWdhSFZ0WVc0Z1pYTmpZV3hoZEdsdmJpNGdXbVZ5YnlCUVNVa2diR1ZoYTJGblpTQmxkbVZ1ZEhNZ1kyOXVabWx5YldWa0xpQkJiR3hoSUhCeVpYTmxiblJ6SUZBeElHUmhkR0VnZEc4Z2JHVmhaR1Z5YzJocGNDNG5MQW9nSURjNklDZFRaV04xY21sMGVTQkJkV1JwZENCaVpXZHBibk02SUVSTVVDOVdVRU1nWm05eWJXRnNJSEpsZG1sbGR5NGdVMk52Y0dVZ2JHOWphMlZrT2lBMklGQkRTU0JwYm1adlZIbHdaWE1zSURFZ1ZsQkRMVk5ESUhCbGNtbHRaWFJsY2l3Z01TQlFVME1nWlc1a2NHOXBiblFzSURFZ2MyVnlkbWxqWlNCaFkyTnZkVzUwTGlCV1pYSjBaWGdnUVVrZ1pHOXliV0Z1ZEM0bkxBb2dJRGc2SUNmd241U1FJRVJNVUNCSFlYUmxJQ2hEVWtsVVNVTkJUQ2s2SUZaUVF5MVRReUJqYjI1bWFXY2dZMlZ5ZEdsbWFXVmtMaUJFVEZBZ2NHbHdaV3hwYm1VZ1ptOXlJRFlnYVc1bWIxUjVjR1Z6SUhaaGJHbGtZWFJsWkM0Z1VGTkRJR1Z1WkhCdmFXNTBJR0Z3Y0hKdmRtVmtMaUJhUkZJZ1kyOXVkSEpoWTNRZ1kyOXVabWx5YldWa0xpQldaWEowWlhnZ1FVa2dZMkZ1SUhCeWIyTmxaV1F1Snl3S0lDQTVPaUFuU1c1bWNtRnpkSEoxWTNSMWNtVTZJRVJsY0d4dmVTQkRiRzkxWkNCU2RXNGdkMlZpYUc5dmF5NGdVMnhoWTJzZ1JYWmxiblJ6SUVGUVNTQW9jbVZoWTNScGIyNWZZV1JrWldRcExpQlVhSEpsWlMxc1lYbGxjaUJ1YjJselpTQm1hV3gwWlhJNklHTm9ZVzV1Wld3Z1lXeHNiM2RzYVhOMElDc2dhMlY1ZDI5eVpDQm9aWFZ5YVhOMGFXTnpJQ3NnVm1WeWRHVjRJRUZKSUdOc1lYTnphV1pwWlhJdUp5d0tJQ0F4TURvZ0orS2FvU0JXWlhKMFpYZ2dRVWtnUVdOMGFYWmhkR1ZrT2lCUVUwTWdaVzVrY0c5cGJuUWdiR2wyWlNCcGJpQmxkWEp2Y0dVdGQyVnpkRFF1SUVkbGJXbHVhU0F5TGpBZ1JteGhjMmdnY21Wd2JHRmpaWE1nUjJWdGJXRWdNa0lnWm05eUlGTnNZV05ySUhOMWJXMWhjbWx6WVhScGIyNHVJRWRsYlcxaElESkNJSEpsZEdGcGJtVmtJR0Z6SUc5bVpteHBibVVnWm1Gc2JHSmhZMnN1Snl3S0lDQXhNVG9nSjBGRVVpQlRhR0ZrYjNjZ1RXOWtaVG9nUlcxdmFta2dkSEpwWjJkbGNpQmhZM1JwZG1VZ1ptOXlJRU5vWldOcmIzVjBJQ3NnVUdGNWIzVjBjeUIwWldGdGN5NGdRV3hzSUVGRVVpQmtjbUZtZEhNZ1pXMWhhV3hsWkNCMGJ5QjBaV0Z0SUd4bFlXUnpJR0psWm05eVpTQmhibmtnUjJsMFNIVmlJRkJTSUdseklHOXdaVzVsWkM0bkxBb2dJREV5T2lBblVISnZiWEIwSUZSMWJtbHVaem9nUTI5c2JHVmpkQ0J5WlhacFpYZGxjaUJqYjIxdFpXNTBjeTRnVkhWdVpTQkhaVzFwYm1rZ2NISnZiWEIwSUhSbGJYQnNZWFJsTGlCVWNtRmphem9nSlNCdlppQkJSRklnWkhKaFpuUnpJSEpoZEdWa0lDSndkV0pzYVhOb1lXSnNaU0IzYVhSb0lHMXBibTl5SUdWa2FYUnpMaUluTEFvZ0lERXpPaUFuOEorT3J5QkJSRklnVVhWaGJHbDBlU0JIWVhSbE9pRGlpYVU0TUNVZ2IyWWdaSEpoWm5RZ1FVUlNjeUJ5WVhSbFpDQndkV0pzYVhOb1lXSnNaUzRnUjJsMFNIVmlJRkJTSUdkaGRHVWdiM0JsYm5NdUlFSmxkR0VnWVdOMGFYWmhkR2x2YmlCaVpXZHBibk11Snl3S0lDQXhORG9nSjBKbGRHRTZJRlJ5YVdkblpYSmxaQ0JCUkZKeklHRjFkRzh0YjNCbGJpQlFVbk1nZEc4Z1FtRmphM04wWVdkbElHUnZZM01nY21Wd2J5NGdSVzVuYVc1bFpYSnpJSEpsZG1sbGR5QmhibVFnYldWeVoyVXVJRUZFVWlCdFpYSm5aU0J5WVhSbElIUnlZV05yYVc1bklHSmxaMmx1Y3k0bkxBb2dJREUxT2lBblFtVjBZU0FvWTI5dWRDNHBPaUJSZFdWeWVTQm9hWFFnY21GMFpTQnBiWEJ5YjNabGJXVnVkQ0J0WldGemRYSmxaQzRnUkdWbWJHVmpkR2x2YmlCeVlYUmxJR0ZqZEdsMlpTQm1iM0lnUTJobFkydHZkWFFnS3lCUVlYbHZkWFJ6TGlCVFpXNXBiM0lnUUMxdFpXNTBhVzl1SUdKaGMyVnNhVzVsSUdWemRHRmliR2x6YUdWa0xpY3NDaUFnTVRZNklDZnduNXFtSUZBeUlFZHZMMDV2TFVkdklFZGhkR1U2SU9LSnBURXdJRUZFVW5NZ2JXVnlaMlZrSUdaeWIyMGdZbVYwWVNCMFpXRnRjeTRnVTJ4aFkyc2daR1ZtYkdWamRHbHZiaURpaWFVME1DVWdabTl5SUdKdmRHZ2dkR1ZoYlhNdUlGQm9ZWE5sSURNZ1kyOXVabWx5YldWa0xpY3NDaUFnTVRjNklDZFFiR0YwWm05eWJTQklZWEprWlc1cGJtYzZJRTFwWjNKaGRHVWdaR1YySUZKQlJ5QmpiM0p3ZFhNZ2RHOGdjSEp2WkhWamRHbHZiaUJCYkd4dmVVUkNJQ3NnVTJOaFRrNGdhVzVrWlhndUlFVnVZV0pzWlNCRFRVVkxJSFpwWVNCRGJHOTFaQ0JMVFZNZ0t5QkRiRzkxWkNCRlMwMGdLRkJEU1MxRVUxTXBMaWNzQ2lBZ01UZzZJQ2RNYjJGa0lGUmxjM1JwYm1jNklGTnBiWFZzWVhSbElERXNOVEF3SUdOdmJtTjFjbkpsYm5RZ2RYTmxjbk1nWVdkaGFXNXpkQ0JXVUVNZ1pXNWtjRzlwYm5RdUlFbGtaVzUwYVdaNUlHRnVaQ0J5WlhOdmJIWmxJR0p2ZEhSc1pXNWxZMnR6SUdKbFptOXlaU0JuYkc5aVlXd2djbTlzYkc5MWRDNG5MQW9nSURFNU9pQW5TR0Z5WkdWdWFXNW5JQ2hqYjI1MExpazZJRUZrWkhKbGMzTWdiRzloWkNCMFpYTjBJR1pwYm1ScGJtZHpMaUJEYjI1bWFXZDFjbVVnVWtKQlF5QnZiaUJDYVdkUmRXVnllU0J0WlhSeWFXTnpJR1JoZEdGelpYUXVJRkJ5YjJSMVkzUnBiMjRnY21WaFpHbHVaWE56SUhOcFoyNHRiMlptTGljc0NpQWdNakE2SUNkQ1lXTnJjM1JoWjJVZ1VHeDFaMmx1T2lCVGFHbHdJR052Ym5SbGVIUXRiR0Y1WlhJdGJXVjBjbWxqY3lCbWNtOXVkR1Z1WkNBcklHSmhZMnRsYm1RZ2NHeDFaMmx1Y3lCMGJ5QkJaSGxsYmlCcGJuUmxjbTVoYkNCd2JIVm5hVzRnY21WbmFYTjBjbmt1SUZSbFlXMGdSV1ptWldOMGFYWmxibVZ6Y3lCRFlYSmtJR1JsY0d4dmVXVmtMaWNzQ2lBZ01qRTZJQ2RFWVhOb1ltOWhjbVE2SUVOdmFHOXlkQ0JRY205bmNtVnpjeUJVY21GamEyVnlJR3hwZG1VZ2IyNGdZV3hzSUhSbFlXMGdaR0Z6YUdKdllYSmtjeTRnUlc1bmFXNWxaWEpwYm1jZ1RXRnVZV2RsY2lCamIyMXRjeUJ3WVdOcllXZGxJSEJ5WlhCaGNtVmtMaWNzQ2lBZ01qSTZJQ2RGVFNCRGIyMXRjem9nVDI1bExYQmhaMlZ5SUdSbGNHeHZlV1ZrSU9LQWxDQjNhR0YwSUhSb1pTQmtZWE5vWW05aGNtUWdjMmh2ZDNNc0lIZG9ZWFFnYVhRZ1pHOWxjeUJ1YjNRdUlFNXZJR2x1WkdsMmFXUjFZV3dnYkdWaFpHVnlZbTloY21SekxpQkhSRkJTTFdOdmJYQnNhV0Z1ZENCaFoyZHlaV2RoZEdsdmJpQmpiMjVtYVhKdFpXUXVKeXdLSUNBeU16b2dKL0NmakkwZ1YyRjJaU0F4SUZKdmJHeHZkWFE2SUdGa2VXVnVMV2hsYkhBZ2FXNGdaMnh2WW1Gc0lFUmhlU0F3SUhObGRIVndJSE5qY21sd2RDNGc4Situb0NCMGNtbG5aMlZ5SUdWdVlXSnNaV1FnWVd4c0lHVnVaMmx1WldWeWFXNW5JR05vWVc1dVpXeHpJQ2h2Y0hRdGIzVjBJSEJsY2lCamFHRnVibVZzS1M0Z1JHbHpZMjkyWlhKNUlHOTJaWElnYldGdVpHRjBaUzRuTEFvZ0lESTBPaUFuVFc5dWFYUnZjam9nVjBGVklHRnpJQ1VnYjJZZ1pXeHBaMmxpYkdVZ1pXNW5hVzVsWlhKekxpQkJiR1Z5ZENCMGFISmxjMmh2YkdRNklEdzBNQ1VnZEhKcFoyZGxjbk1nYVcxdFpXUnBZWFJsSUhkdmNtdG1iRzkzSUdGMVpHbDBJSFJ2SUdacGJtUWdiV2x6YzJWa0lHbHVkR1Z5WTJWd2RHbHZiaUJ3YjJsdWRITXVKeXdLSUNBeU5Ub2dKMDFsWVhOMWNtVnRaVzUwT2lCUWFHRnpaU0F4SUdOdmFHOXlkQ0FvTXpBZ1pXNW5hVzVsWlhKekxDQitOaTF0YjI1MGFDQjBaVzUxY21VcElHTnZiWEJzWlhSbGN5QnlZVzF3TGlCVWFXMWxMWFJ2TFVOdmJtWnBaR1Z1WTJVZ1pHVnNkR0VnWTI5dGNIVjBaV1FnZG5NdUlIQnlaUzEwYjI5c0lHSmhjMlZzYVc1bExpY3NDaUFnTWpZNklDZnduNCtCSUVaMWJHd2dSMEU2SUVGamFHbGxkbVZrTGlCU1Qwa2djSEpsYzJWdWRHRjBhVzl1SUhCeVpYQmhjbVZrSUdadmNpQkJiR3hoSUhkcGRHZ2dZMjl0Y0d4bGRHVWdabWx1WVc1amFXRnNJRzF2WkdWc0xpQkJZM1IxWVd3Z2RuTXVJSEJ5YjJwbFkzUmxaQ0JrWld4MFlTQmtiMk4xYldWdWRHVmtMaWNzQ24wN0NncGpiMjV6ZENCTlNVeEZVMVJQVGtWVElEMGdXd29nSUhzZ2QyVmxhem94TENBZ2JHRmlaV3c2SjFwRVVpQlRkR0Z5ZENjc0lDQWdJQ0FnWXpwRExtRnRZbVZ5TENCaFltOTJaVHAwY25WbElDQjlMQW9nSUhzZ2QyVmxhem8yTENBZ2JHRmlaV3c2SjFBeElFZGhkR1VuTENBZ0lDQWdJQ0FnWXpwRExtSnNkV1VzSUNCaFltOTJaVHBtWVd4elpTQjlMQW9nSUhzZ2QyVmxhem80TENBZ2JHRmlaV3c2SjBSTVVDQkRiR1ZoY21Wa0p5d2dJQ0FnWXpwRExuSmxaQ3dnSUNCaFltOTJaVHAwY25WbElDQjlMQW9nSUhzZ2QyVmxhem94TUN3Z2JHRmlaV3c2SjFabGNuUmxlQ0JCU1NEaWhwRW5MQ0FnSUNCak9rTXVaM0psWlc0c0lHRmliM1psT21aaGJITmxJSDBzQ2lBZ2V5QjNaV1ZyT2pFekxDQnNZV0psYkRvblFVUlNJRkYxWVd4cGRIa25MQ0FnSUNCak9rTXVZVzFpWlhJc0lHRmliM1psT25SeWRXVWdJSDBzQ2lBZ2V5QjNaV1ZyT2pFMkxDQnNZV0psYkRvblVESWdSMkYwWlNjc0lDQWdJQ0FnSUNCak9rTXVZVzFpWlhJc0lHRmliM1psT21aaGJITmxJSDBzQ2lBZ2V5QjNaV1ZyT2pJeUxDQnNZV0psYkRvblVHeDFaMmx1SU9LR2tTY3NJQ0FnSUNBZ0lHTTZReTVuY21WbGJpd2dZV0p2ZG1VNmRISjFaU0FnZlN3S0lDQjdJSGRsWldzNk1qWXNJR3hoWW1Wc09pZEdkV3hzSUVkQkp5d2dJQ0FnSUNBZ0lHTTZReTVuY21WbGJpd2dZV0p2ZG1VNlptRnNjMlVnZlN3S1hUc0tZMjl1YzNRZ1RWOU5RVkFnUFNCUFltcGxZM1F1Wm5KdmJVVnVkSEpwWlhNb1RVbE1SVk5VVDA1RlV5NXRZWEFvYlNBOVBpQmJiUzUzWldWckxDQnRYU2twT3dvS1kyOXVjM1FnVFVWVVVrbERVMTlFUVZSQklEMGdXd29nSUhzS0lDQWdJR2xqYjI0NkorS1BzU2NzSUhSNWNHVTZKMDVQVWxSSUlGTlVRVkluTENCMGVYQmxRMjlzYjNJNlF5NWliSFZsTEFvZ0lDQWdkR2wwYkdVNkoxUnBiV1VnZEc4Z1EyOXVabWxrWlc1alpTY3NDaUFnSUNCemRXSjBhWFJzWlRvbk5YUm9JRTV2YmkxVWNtbDJhV0ZzSUZCeWIyUjFZM1JwYjI0Z1VGSWdJQ2hzYVc1bGN5QStOVEFnd3JjZ1ptbHNaWE1nUGpJZ3dyY2dibThnWW5Wa1pIa2dZMjh0WVhWMGFHOXlJTUszSUc1dklHOXVZbTloY21ScGJtY2diR0ZpWld3cEp5d0tJQ0FnSUdKaGMyVnNhVzVsT2pReUxDQjBZWEpuWlhRNk16QXNJSE4wY21WMFkyZzZNalVzSUhWdWFYUTZKMlJoZVhNbkxDQmthWEk2SjJ4dmQyVnlKeXdLSUNBZ0lIQm9ZWE5sY3pwYkNpQWdJQ0FnSUhzZ2NHZzZNU3dnYkdGaVpXdzZKMUF4SUdKaGMyVnNhVzVsSnl3Z2RtRnNPalF5TENCdFlYZzZOVFVzSUc1dmRHVTZKMGhwYzNSdmNtbGpZV3dnWTI5b2IzSjBJR1JoZEdFbklIMHNDaUFnSUNBZ0lIc2djR2c2TWl3Z2JHRmlaV3c2SjFBeUlHVjRjR1ZqZEdWa0p5d2dkbUZzT2pNMkxDQnRZWGc2TlRVc0lHNXZkR1U2SjFCaGNuUnBZV3dnUTB4SklHbHRjSEp2ZG1WdFpXNTBKeUI5TEFvZ0lDQWdJQ0I3SUhCb09qTXNJR3hoWW1Wc09pZFFNeUIwWVhKblpYUW5MQ0FnSUhaaGJEb3pNQ3dnYldGNE9qVTFMQ0J1YjNSbE9pZmlpYVV5T0NVZ2RuTXVJR0poYzJWc2FXNWxKeUI5TEFvZ0lDQWdYU3dLSUNBZ0lITmxZMjl1WkdGeWVUb25VRklnVW1WM2IzSnJJRkpoZEdVNklHNWxkeUJvYVhKbGN5QnlaV0ZqYUNBeU5TVWdRMGhCVGtkRlUxOVNSVkZWUlZOVVJVUWdjbUYwYVc4Z2FXNGdNaTQxSUcxdmJuUm9jeUIyY3k0Z1kzVnljbVZ1ZENBMElHMXZiblJvY3ljc0NpQWdJQ0JtYVc1aGJtTnBZV3c2Ym5Wc2JDd0tJQ0FnSUdadmNrRnNiR0U2SjA5MWNpQkJTU0JzWVhsbGNpQmpkWFJ6SUhScGJXVWdkRzhnYVc1a1pYQmxibVJsYm5RZ1kyOXVkSEpwWW5WMGFXOXVJR1p5YjIwZ05ESWdaR0Y1Y3lCMGJ5QXpNQ0RpZ0pRZ01USWdaR0Y1Y3lCdlppQndjbTlrZFdOMGFYWmxJR1Z1WjJsdVpXVnlhVzVuSUhKbFkyeGhhVzFsWkNCd1pYSWdhR2x5WlN3Z2NHVnlJR052YUc5eWRDNG5MQW9nSUNBZ1ptOXlTR1ZwZEc5eU9pZERiMlJsSUhGMVlXeHBkSGtnS0hKbGQyOXlheUJ5WVhSbEtTQmpiMjUyWlhKblpYTWdkRzhnZEdWaGJTQnpkR0Z1WkdGeVpITWdOaUIzWldWcmN5Qm1ZWE4wWlhJdUlGUm9aU0IwYjI5c0lHbHRjSEp2ZG1WeklIRjFZV3hwZEhrc0lHNXZkQ0JxZFhOMElITndaV1ZrTGljc0NpQWdmU3dLSUNCN0NpQWdJQ0JwWTI5dU9pZnduNUtzSnl3Z2RIbHdaVG9uVDFCRlVrRlVTVTlPUVV3bkxDQjBlWEJsUTI5c2IzSTZReTVoYldKbGNpd0tJQ0FnSUhScGRHeGxPaWROWVc1aFoyVnlJRUoxY21SbGJpQlNZWFJsSnl3S0lDQWdJSE4xWW5ScGRHeGxPaWRUYkdGamF5QkNiM1FnUkdWbWJHVmpkR2x2YmlCU1lYUmxJQ0FvYm04Z0lrRnpheUJJZFcxaGJpSWdZMnhwWTJzZ0t5QnVieUJ1WldkaGRHbDJaU0JsYlc5cWFTQXJJRzV2SUVwcGNtRWdVWFZsYzNScGIyNGdkR2xqYTJWMElIZHBkR2hwYmlBMk1DQnRhVzRwSnl3S0lDQWdJR0poYzJWc2FXNWxPakFzSUhSaGNtZGxkRG8xTUN3Z2MzUnlaWFJqYURvMk5Td2dkVzVwZERvbkpTY3NJR1JwY2pvbmFHbG5hR1Z5Snl3S0lDQWdJSEJvWVhObGN6cGJDaUFnSUNBZ0lIc2djR2c2TVN3Z2JHRmlaV3c2SjFBeElDaHVieUJpYjNRcEp5d2dkbUZzT2pBc0lDQnRZWGc2TVRBd0xDQnViM1JsT2lkRFRFa3RiMjVzZVNCd2FHRnpaU2NnZlN3S0lDQWdJQ0FnZXlCd2FEb3lMQ0JzWVdKbGJEb25VRElnZEdGeVoyVjBKeXdnSUNCMllXdzZNelVzSUcxaGVEb3hNREFzSUc1dmRHVTZKeklnWW1WMFlTQjBaV0Z0Y3ljZ2ZTd0tJQ0FnSUNBZ2V5QndhRG96TENCc1lXSmxiRG9uVURNZ2RHRnlaMlYwSnl3Z0lDQjJZV3c2TlRBc0lHMWhlRG94TURBc0lHNXZkR1U2SnpFc05UQXdJR1Z1WjJsdVpXVnljeWNnZlN3S0lDQWdJRjBzQ2lBZ0lDQnpaV052Ym1SaGNuazZKMU5sYm1sdmNpQmxibWRwYm1WbGNpQkFMVzFsYm5ScGIyNGdjbUYwWlNCd1pYSWdibVYzSUdocGNtVTZJT0tJa2pNd0pTQnBiaUJtYVhKemRDQTVNQ0JrWVhsekp5d0tJQ0FnSUdacGJtRnVZMmxoYkRvbjRvbUlKREkwTUN3d01EQXZlWElnYzJGMlpXUWdhVzRnYzJWdWFXOXlJR1Z1WjJsdVpXVnlJSFJwYldVdUlFWnZjbTExYkdFNklEUTFNQ0JrWldac1pXTjBaV1FnY1hWbGNtbGxjeTkzYXlERGx5QXdMakl6YUhJZ3c1Y2dKREUxTUM5b2NpQTlJQ1F4TlN3MU1qVXZkMnNnWVhRZ1VHaGhjMlVnTXlCelkyRnNaUzRuTEFvZ0lDQWdabTl5UVd4c1lUb25WR2hsSUVGSklHeGhlV1Z5SUdseklGUnBaWElnTVNCemRYQndiM0owSU9LQWxDQnBkQ0JoYm5OM1pYSnpJSFJvWlNBaWQyaHBZMmdnU21GMllTQjJaWEp6YVc5dUlpQnhkV1Z6ZEdsdmJuTWdjMjhnYzJWdWFXOXlJR1Z1WjJsdVpXVnljeUJtYjJOMWN5QnZiaUJoY21Ob2FYUmxZM1IxY21Vc0lHNXZkQ0J6ZVc1MFlYZ3VKeXdLSUNBZ0lHWnZja2hsYVhSdmNqb25WR2hsSUhSdmIyd2daVzVtYjNKalpYTWdZU0J4ZFdGc2FYUjVJR2RoZEdVNklHbDBJSEpsZEhWeWJuTWdJa2tnWkc5dVhDZDBJR3R1YjNjaUlIZG9aVzRnYm04Z1FtRmphM04wWVdkbElITnZkWEpqWlNCbGVHbHpkSE11SUVsMElHNWxkbVZ5SUhWdVpHVnliV2x1WlhNZ2RISjFjM1FnZDJsMGFDQmhJR052Ym1acFpHVnVkQ0IzY205dVp5Qmhibk4zWlhJdUp5d0tJQ0I5TEFvZ0lIc0tJQ0FnSUdsamIyNDZKL0NmbTZBbkxDQjBlWEJsT2lkVVJVTklUa2xEUVV3bkxDQjBlWEJsUTI5c2IzSTZReTVuY21WbGJpd0tJQ0FnSUhScGRHeGxPaWRIYjJ4a1pXNGdVR0YwYUNCQlpHaGxjbVZ1WTJVbkxBb2dJQ0FnYzNWaWRHbDBiR1U2SjBWdWRtbHliMjV0Wlc1MElFTnZiWEJzYVdGdVkyVWdVMk52Y21VZ0lDZzFJR05vWldOcmN6b2dTbUYyWVNEQ3R5QkViMk5yWlhJZ3dyY2dSM0poWkd4bElIZHlZWEJ3WlhJZ3dyY2dUbTlrWlM1cWN5REN0eUJwYm5SbGNtNWhiQ0JUUkVzZ2RuTXVJR05oZEdGc2IyY3RhVzVtYnk1NVlXMXNLU2NzQ2lBZ0lDQmlZWE5sYkdsdVpUbzJNaXdnZEdGeVoyVjBPamd5TENCemRISmxkR05vT2preUxDQjFibWwwT2ljdk1UQXdKeXdnWkdseU9pZG9hV2RvWlhJbkxBb2dJQ0FnY0doaGMyVnpPbHNLSUNBZ0lDQWdleUJ3YURveExDQnNZV0psYkRvblVISmxMWFJ2YjJ3Z1Yyc2dNU2NzSUhaaGJEbzJNaXdnYldGNE9qRXdNQ3dnYm05MFpUb25Sbkp2YlNCUWJHRjBabTl5YlNCVVpXRnRJSFJwWTJ0bGRITW5JSDBzQ2lBZ0lDQWdJSHNnY0dnNk1pd2diR0ZpWld3NkoxQXlJRmRySURFZ1pYTjBKeXdnSUNCMllXdzZOeklzSUcxaGVEb3hNREFzSUc1dmRHVTZKMUJoY25ScFlXd2dhVzF3Y205MlpXMWxiblFuSUgwc0NpQWdJQ0FnSUhzZ2NHZzZNeXdnYkdGaVpXdzZKMUF6SUZkcklERW5MQ0FnSUNBZ0lDQjJZV3c2T0RJc0lHMWhlRG94TURBc0lHNXZkR1U2SnlzeU1DQndkSE1nZG5NdUlHSmhjMlZzYVc1bEp5QjlMQW9nSUNBZ1hTd0tJQ0FnSUhObFkyOXVaR0Z5ZVRvblEweEpJSEpsZG1WeWRDQnlZWFJsT2lBOE9DVWdZV05qWlhCMFlXSnNaU0RDdHlBNDRvQ1RNVFVsSUhkaGNtNXBibWNnd3JjZ1BqRTFKU0JqYVhKamRXbDBJR0p5WldGclpYSWdabWx5WlhNZ0tHRjFkRzh0Y21GcGMyVWdZMjl1Wm1sa1pXNWpaU0IwYUhKbGMyaHZiR1FwSnl3S0lDQWdJR1pwYm1GdVkybGhiRG9uTlRBbElISmxaSFZqZEdsdmJpQnBiaUJsYm5ZdGMyVjBkWEFnU21seVlTQjBhV05yWlhSeklIQmxjaUJqYjJodmNuUWdZbmtnVUdoaGMyVWdNeTRnUlhabGNua2dRMHhKSUhOMVoyZGxjM1JwYjI0Z1kyRnljbWxsY3lCVGRXZG5aWE4wWldRdFFuazZJR2RwZENCMGNtRnBiR1Z5SUdadmNpQm1kV3hzSUdGMVpHbDBZV0pwYkdsMGVTNG5MQW9nSUNBZ1ptOXlRV3hzWVRvblRtVjNJR1Z1WjJsdVpXVnljeUJoY25KcGRtVWdSR0Y1SURFZ2QybDBhQ0JoSUdOdmJYQnNhV0Z1ZENCbGJuWnBjbTl1YldWdWRDNGdWR2hsSUdacGNuTjBJSFJvYVc1bklIUm9aWGtnWlc1amIzVnVkR1Z5SUdseklHRWdkMjl5YTJsdVp5QnplWE4wWlcwc0lHNXZkQ0JoSUdKeWIydGxiaUJ2Ym1VdUp5d0tJQ0FnSUdadmNraGxhWFJ2Y2pvblJYWmxjbmtnUVVrZ2MzVm5aMlZ6ZEdsdmJpQnBjeUJ6YVdkdVpXUWdkMmwwYUNCaElHTnZiVzFwZENCMGNtRnBiR1Z5TGlCU1pYWmxjblFnY21GMFpTQnRiMjVwZEc5eVpXUWdhVzRnY21WaGJDMTBhVzFsTGlCSlppQjBhR1VnZEc5dmJDQmtaV2R5WVdSbGN5QnhkV0ZzYVhSNUxDQjNaU0JyYm05M0lHbHRiV1ZrYVdGMFpXeDVJT0tBbENCdWIzUWdhVzRnZEdobElHNWxlSFFnY0c5emRDMXRiM0owWlcwdUp5d0tJQ0I5TEFwZE93b0tZMjl1YzNRZ1VrbFRTMU1nUFNCYkNpQWdld29nSUNBZ2FXUTZKM05sWXljc0lIQnliMkpUWTI5eVpUb3pMalVzSUdsdGNHRmpkRk5qYjNKbE9qUXNJR052Ykc5eU9rTXVZVzFpWlhJc0NpQWdJQ0J3Y205aU9pZE5aV1JwZFcwdFNHbG5hQ2NzSUdsdGNHRmpkRG9uU0dsbmFDY3NDaUFnSUNCMGFYUnNaVG9uVTJWamRYSnBkSGtnWW14dlkydHpJRlpsY25SbGVDQkJTU0RpZ0pRZ1VHaGhjMlVnTWlCdGFYTnpaWE1uTEFvZ0lDQWdkMmg1T2lkVFpXTjFjbWwwZVNCeVpYWnBaWGNnZEhsd2FXTmhiR3g1SUhSaGEyVnpJRFRpZ0pNNElIZGxaV3R6TGlCVWFHVWdWMlZsYXlBMzRvQ1RPQ0IzYVc1a2IzY2dhWE1nWVdkbmNtVnpjMmwyWlM0Z1drUlNJR052Ym5SeVlXTjBJSEpsY1hWcGNtVnpJR0VnYzJWd1lYSmhkR1VnY0hKdlkzVnlaVzFsYm5RZ1lYQndjbTkyWVd3Z1kyaGhhVzRnZDJsMGFDQnBkSE1nYjNkdUlHeGxZV1FnZEdsdFpTNG5MQW9nSUNBZ2RISmhZMnR6T2xzS0lDQWdJQ0FnZXlCME9pZFVjbUZqYXlBeEp5d2dhRG9uUldGeWJIa2dTVzVwZEdsaGRHbHZiaWNzSUdRNkoxTmxZM1Z5YVhSNUlISmxkbWxsZHlCbWFXeGxaQ0JYWldWcklERXVJRk5qYjNCbElIQnlaUzEzY21sMGRHVnVPaUEySUVSTVVDQnBibVp2Vkhsd1pYTXNJREVnVmxCRExWTkRJSEJsY21sdFpYUmxjaXdnTVNCUVUwTWdaVzVrY0c5cGJuUXVJRTVoY25KdmR5QnpZMjl3WlNBOUlHWmhjM1JsY2lCeVpYWnBaWGNnWTNsamJHVXVKeUI5TEFvZ0lDQWdJQ0I3SUhRNkoxUnlZV05ySURJbkxDQm9PaWRRYUdGelpTQXhJRkJ5YjNabGN5QldZV3gxWlNjc0lHUTZKMUJvWVhObElERWdiV1ZoYzNWeVlXSnNaU0J5WlhOMWJIUnpJSGRwZEdnZ2VtVnlieUJ6WldOMWNtbDBlU0J6ZFhKbVlXTmxJR055WldGMFpTQnZjbWRoYm1sellYUnBiMjVoYkNCd2NtVnpjM1Z5WlNCMGJ5QmpiR1ZoY2lCUU1pQm5ZWFJsTGlCQmJHeGhJSEJ5WlhObGJuUnpJR1JoZEdFZ2RHOGdiR1ZoWkdWeWMyaHBjQ0JoZENCWFpXVnJJRFl1SnlCOUxBb2dJQ0FnSUNCN0lIUTZKMVJ5WVdOcklETW5MQ0JvT2lkQmNtTm9hWFJsWTNSMWNtVWdSbUZzYkdKaFkyc25MQ0JrT2lkSlppQldaWEowWlhnZ1FVa2daR1ZzWVhsbFpDQjBieUJYYXlBeE1pd2dVR2hoYzJVZ01pQmpiMjUwYVc1MVpYTWdkMmwwYUNCSFpXMXRZU0F5UWlCdmJpQkRiRzkxWkNCU2RXNGdhVzV6YVdSbElHTnZjbkJ2Y21GMFpTQldVRTR1SUZCb1lYTmxJRE1nWW1WamIyMWxjeUIwYUdVZ1ZtVnlkR1Y0SUVGSklITjNhWFJqYUMxcGJpNG5JSDBzQ2lBZ0lDQmRMQW9nSUNBZ2JtOXVibVZuT2lkYVJGSWdjSEp2WTNWeVpXMWxiblFnYlhWemRDQnpkR0Z5ZENCWFpXVnJJREV1SUVOaGJtNXZkQ0JpWlNCaFkyTmxiR1Z5WVhSbFpDQnlaWFJ5YjJGamRHbDJaV3g1TGljS0lDQjlMQW9nSUhzS0lDQWdJR2xrT2lkaFpHOXdkQ2NzSUhCeWIySlRZMjl5WlRvMExDQnBiWEJoWTNSVFkyOXlaVG8wTENCamIyeHZjanBETG5KbFpDd0tJQ0FnSUhCeWIySTZKMGhwWjJnbkxDQnBiWEJoWTNRNkowaHBaMmduTEFvZ0lDQWdkR2wwYkdVNkowVnVaMmx1WldWeWN5QnBaMjV2Y21VZ2RHaGxJSFJ2YjJ3ZzRvQ1VJR0ZrYjNCMGFXOXVJR0psYkc5M0lETXdKU2NzQ2lBZ0lDQjNhSGs2SjA5d2RDMXBiaUIwYjI5c2N5QnViM1FnYVc1MFpYSmpaWEIwYVc1bklHNWhkSFZ5WVd3Z2QyOXlhMlpzYjNkeklHRnlaU0JrWlhCeWFXOXlhWFJwYzJWa0xDQm1iM0puYjNSMFpXNHNJRzl5SUdGamRHbDJaV3g1SUhKbGMybHpkR1ZrTGlCT2J5QmhaRzl3ZEdsdmJpQTlJRzV2SUhSbGJHVnRaWFJ5ZVNBOUlHNXZJRkpQU1NCa1pXMXZibk4wY21GMGFXOXVJRDBnY0hKdmFtVmpkQ0JrWldaMWJtUmxaQ0JpWldadmNtVWdVR2hoYzJVZ015NG5MQW9nSUNBZ2RISmhZMnR6T2xzS0lDQWdJQ0FnZXlCME9pZFFjbWx0WVhKNUp5d2dJQ0JvT2lkQ2RXbHNaQ0JHWVdsc2RYSmxJRWx1ZEdWeVkyVndkR2x2Ymljc0lHUTZKeUpoWkhsbGJpMW9aV3h3SUdScFlXZHViM05sSWlCaGNIQmxZWEp6SUdGeklIUm9aU0JzWVhOMElHeHBibVVnYjJZZ1pYWmxjbmtnTGk5bmNtRmtiR1YzSUdKMWFXeGtJR1poYVd4MWNtVXVJRlJ2YjJ3Z1lYSnlhWFpsY3lCaGRDQjBhR1VnWlhoaFkzUWdiVzl0Wlc1MElIUm9aU0JrWlhabGJHOXdaWElnYVhNZ1puSjFjM1J5WVhSbFpDNGdXbVZ5YnlCa2FYTmpiM1psY25rZ2NtVnhkV2x5WldRdUp5QjlMQW9nSUNBZ0lDQjdJSFE2SjFObFkyOXVaR0Z5ZVNjc0lHZzZKMFJoZVNBd0lFRjFkRzh0U1c1emRHRnNiQ2NzSUNBZ0lDQWdJQ0FnWkRvbllXUjVaVzR0YUdWc2NDQnBibk4wWVd4c1pXUWdZWFYwYjIxaGRHbGpZV3hzZVNCMmFXRWdZV1I1Wlc0dGMyVjBkWEF1YzJnZ2IyNGdaWFpsY25rZ2JtVjNJR2hwY21VZ2JXRmphR2x1WlNCaVpXWnZjbVVnZEdobElHWnBjbk4wSUd4cGJtVWdiMllnWTI5a1pTQnBjeUIzY21sMGRHVnVMaUJPYjNRZ2IzQjBhVzl1WVd3Z2FXNGdVR2hoYzJVZ01TNG5JSDBzQ2lBZ0lDQWdJSHNnZERvblZHVnlkR2xoY25rbkxDQWdhRG9uUW5Wa1pIa2dSVzVuYVc1bFpYSWdSR1Z0Ynljc0lDQWdJQ0FnSUNCa09pZENkV1JrZVNCbGJtZHBibVZsY25NZ1luSnBaV1psWkNCcGJpQlhaV1ZySURNdUlFRWdiR2wyWlNCa1pXMXZJRzltSUhSb1pTQjBiMjlzSUhKbGMyOXNkbWx1WnlCaElISmxZV3dnWlhKeWIzSWdaSFZ5YVc1bklIUm9aU0JtYVhKemRDQndZV2x5SUhObGMzTnBiMjRnYVhNZ2QyOXlkR2dnYlc5eVpTQjBhR0Z1SUdGdWVTQmhibTV2ZFc1alpXMWxiblFnWlcxaGFXd3VKeUI5TEFvZ0lDQWdYU3dLSUNBZ0lHNXZibTVsWnpvblYwRlZJRzF2Ym1sMGIzSnBibWM2SUdsbUlISmhkR2x2SUR3ME1DVWdZbmtnVjJzZ09DQnZaaUJoYm5rZ2NHaGhjMlVnNG9hU0lHbHRiV1ZrYVdGMFpTQjNiM0pyWm14dmR5QmhkV1JwZENCMGJ5Qm1hVzVrSUcxcGMzTnBibWNnYVc1MFpYSmpaWEIwYVc5dUlIQnZhVzUwY3k0bkNpQWdmU3dLSUNCN0NpQWdJQ0JwWkRvbmRISjFjM1FuTENCd2NtOWlVMk52Y21VNk1pNDFMQ0JwYlhCaFkzUlRZMjl5WlRvMUxDQmpiMnh2Y2pwRExuSmxaQ3dLSUNBZ0lIQnliMkk2SjAxbFpHbDFiU2NzSUdsdGNHRmpkRG9uUTNKcGRHbGpZV3duTEFvZ0lDQWdkR2wwYkdVNkowRkpJR2RsYm1WeVlYUmxjeUJpWVdRZ2IzVjBjSFYwSU9LQWxDQndaWEp0WVc1bGJuUWdkSEoxYzNRZ1pHRnRZV2RsSnl3S0lDQWdJSGRvZVRvblQyNWxJR2hoYkd4MVkybHVZWFJwYjI0Z2FXNWphV1JsYm5RZ2FXNGdRV1I1Wlc1Y0ozTWdaVzVuYVc1bFpYSnBibWNnWTNWc2RIVnlaU0JqWVc0Z2NHVnliV0Z1Wlc1MGJIa2djRzlwYzI5dUlHRmtiM0IwYVc5dUxpQlNaWEIxZEdGMGFXOXVZV3dnWkdGdFlXZGxJR0ZqY205emN5QXhMRFV3TUNCbGJtZHBibVZsY25NZ2FYTWdibTkwSUhKbFkyOTJaWEpoWW14bElIZHBkR2hwYmlCaElEWXRiVzl1ZEdnZ2QybHVaRzkzTGljc0NpQWdJQ0IwY21GamEzTTZXd29nSUNBZ0lDQjdJSFE2SjB4aGVXVnlJREVuTENCb09pZEVaWFJsY20xcGJtbHpkR2xqSUVacGNuTjBKeXdnSUNBZ0lDQWdJQ0FnSUdRNkowTk1TU0JqYUdWamEzTWdhMjV2ZDI0dFpYSnliM0p6SUVwVFQwNGdZbVZtYjNKbElGWmxjblJsZUNCQlNTNGdOakRpZ0pNM01DVWdiMllnUkdGNUlERGlnSk16TUNCbGNuSnZjbk1nWVc1emQyVnlaV1FnZDJsMGFDQm9kVzFoYmkxamRYSmhkR1ZrSUhKbGMzQnZibk5sY3k0Z1dtVnlieUJvWVd4c2RXTnBibUYwYVc5dUlISnBjMnNnWm05eUlIUm9aU0J0WVdwdmNtbDBlUzRuSUgwc0NpQWdJQ0FnSUhzZ2REb25UR0Y1WlhJZ01pY3NJR2c2SjAxaGJtUmhkRzl5ZVNCSWRXMWhiaTFwYmkxMGFHVXRURzl2Y0Njc0lDQWdaRG9uUlhabGNua2dRMHhKSUdOdmJXMWhibVFnY21WeGRXbHlaWE1nV1M5dUlHTnZibVpwY20xaGRHbHZiaTRnUlhabGNua2dRVVJTSUc5d1pXNXpJR0VnUjJsMFNIVmlJRkJTSUhKbGNYVnBjbWx1WnlCaGRDQnNaV0Z6ZENCdmJtVWdZWEJ3Y205MlpXUWdjbVYyYVdWM0lHSmxabTl5WlNCdFpYSm5aUzRnUVVrZ2JtVjJaWElnZEdGclpYTWdZWFYwYjI1dmJXOTFjeUJoWTNScGIyNHVKeUI5TEFvZ0lDQWdJQ0I3SUhRNkoweGhlV1Z5SURNbkxDQm9PaWNpU1NCRWIyNWNKM1FnUzI1dmR5SWdRMjl1ZEhKaFkzUW5MQ0FnSUNBZ0lHUTZKMEpsYkc5M0lEQXVOalVnWTI5emFXNWxJSE5wYldsc1lYSnBkSGs2SUNKSklHUnZibHduZENCb1lYWmxJR0VnWkc5amRXMWxiblJsWkNCaGJuTjNaWElnYVc0Z1FtRmphM04wWVdkbElPS0FsQ0J3YkdWaGMyVWdZWE5ySUdsdUlDTjBaV0Z0TFdOb1lXNXVaV3d1SWlCSWIyNWxjM1FnU1VSTElIQnlaWE5sY25abGN5QjBjblZ6ZENCaVpYUjBaWElnZEdoaGJpQmhJR052Ym1acFpHVnVkQ0IzY205dVp5Qmhibk4zWlhJdUp5QjlMQW9nSUNBZ1hTd0tJQ0FnSUc1dmJtNWxaem9uUTJseVkzVnBkQ0JpY21WaGEyVnlPaUJ5WlhabGNuUWdjbUYwWlNBK01USWxJR2x1SUdGdWVTQnliMnhzYVc1bklESXRkMlZsYXlCM2FXNWtiM2NnNG9hU0lHRjFkRzh0Y21GcGMyVWdZMjl1Wm1sa1pXNWpaU0IwYUhKbGMyaHZiR1FnZFc1MGFXd2dQRGdsTGljS0lDQjlDbDA3Q2dvdkx5RGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaQUtMeThnVWs5UFZDQkRUMDFRVDA1RlRsUUtMeThnNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRQ2dwbWRXNWpkR2x2YmlCQlpIbGxia052Ym5SbGVIUk1ZWGxsY2lncElIc0tJQ0JqYjI1emRDQmJkR0ZpTENCelpYUlVZV0pkSUQwZ2RYTmxVM1JoZEdVb0ozSnZZV1J0WVhBbktUc0tJQ0JqYjI1emRDQmJhRzkyWlhKbFpDd2djMlYwU0c5MlpYSmxaRjBnUFNCMWMyVlRkR0YwWlNodWRXeHNLVHNLSUNCamIyNXpkQ0JiWlhod1lXNWtaV1JTYVhOckxDQnpaWFJGZUhCaGJtUmxaRkpwYzJ0ZElEMGdkWE5sVTNSaGRHVW9iblZzYkNrN0Nnb2dJSFZ6WlVWbVptVmpkQ2dvS1NBOVBpQjdDaUFnSUNCamIyNXpkQ0JzYVc1cklEMGdaRzlqZFcxbGJuUXVZM0psWVhSbFJXeGxiV1Z1ZENnbmJHbHVheWNwT3dvZ0lDQWdiR2x1YXk1eVpXd2dQU0FuYzNSNWJHVnphR1ZsZENjN0NpQWdJQ0JzYVc1ckxtaHlaV1lnUFNBbmFIUjBjSE02THk5bWIyNTBjeTVuYjI5bmJHVmhjR2x6TG1OdmJTOWpjM015UDJaaGJXbHNlVDFUZVc1bE9uZG5hSFJBTkRBd096WXdNRHMzTURBN09EQXdKbVpoYldsc2VUMUtaWFJDY21GcGJuTXJUVzl1YnpwM1oyaDBRRE13TURzME1EQTdOVEF3Sm1ScGMzQnNZWGs5YzNkaGNDYzdDaUFnSUNCa2IyTjFiV1Z1ZEM1b1pXRmtMbUZ3Y0dWdVpFTm9hV3hrS0d4cGJtc3BPd29nSUNBZ2NtVjBkWEp1SUNncElEMCtJSHNnZEhKNUlIc2daRzlqZFcxbGJuUXVhR1ZoWkM1eVpXMXZkbVZEYUdsc1pDaHNhVzVyS1RzZ2ZTQmpZWFJqYUNobEtTQjdmU0I5T3dvZ0lIMHNJRnRkS1RzS0NpQWdZMjl1YzNRZ1ZFRkNVeUE5SUZzS0lDQWdJSHNnYVdRNkozSnZZV1J0WVhBbkxDQWdiR0ZpWld3Nkp6QXhJTUszSUZKdllXUnRZWEFuSUNBZ0lIMHNDaUFnSUNCN0lHbGtPaWR0WlhSeWFXTnpKeXdnSUd4aFltVnNPaWN3TWlEQ3R5Qk5aWFJ5YVdOekp5QWdJQ0I5TEFvZ0lDQWdleUJwWkRvbmNtbHphM01uTENBZ0lDQnNZV0psYkRvbk1ETWd3cmNnVUhKbExVMXZjblJsYlNjZ2ZTd0tJQ0FnSUhzZ2FXUTZKM04xYlcxaGNua25MQ0FnYkdGaVpXdzZKekEwSU1LM0lGTjFiVzFoY25rbklDQWdJSDBzQ2lBZ1hUc0tDaUFnY21WMGRYSnVJQ2dLSUNBZ0lEeGthWFlnYzNSNWJHVTllM3NnWm05dWRFWmhiV2xzZVRwVFFVNVRMQ0JpWVdOclozSnZkVzVrT2tNdVltY3NJR052Ykc5eU9rTXVkR1Y0ZEN3Z2JXbHVTR1ZwWjJoME9pY3hNREIyYUNjc0lIQmhaR1JwYm1jNkp6STRjSGdnTWpKd2VDY3NJRzFoZUZkcFpIUm9PaWN4TVRBd2NIZ25MQ0J0WVhKbmFXNDZKekFnWVhWMGJ5Y3NJR1p2Ym5SVGFYcGxPaWN4TkhCNEp5d2diR2x1WlVobGFXZG9kRG94TGpRZ2ZYMCtDZ29nSUNBZ0lDQjdMeW9nNHBTQTRwU0FJRWhsWVdSbGNpRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSURpbElEaWxJRGlsSUFnS2k5OUNpQWdJQ0FnSUR4b1pXRmtaWElnYzNSNWJHVTllM3NnWW05eVpHVnlRbTkwZEc5dE9tQXhjSGdnYzI5c2FXUWdKSHRETG1KdmNtUmxjbjFnTENCd1lXUmthVzVuUW05MGRHOXRPaWN5TUhCNEp5d2diV0Z5WjJsdVFtOTBkRzl0T2ljeU1uQjRKeUI5ZlQ0S0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR1JwYzNCc1lYazZKMlpzWlhnbkxDQnFkWE4wYVdaNVEyOXVkR1Z1ZERvbmMzQmhZMlV0WW1WMGQyVmxiaWNzSUdGc2FXZHVTWFJsYlhNNkoyWnNaWGd0YzNSaGNuUW5MQ0J0WVhKbmFXNUNiM1IwYjIwNkp6aHdlQ2NnZlgwK0NpQWdJQ0FnSUNBZ0lDQThjM0JoYmlCemRIbHNaVDE3ZXlCbWIyNTBSbUZ0YVd4NU9rMVBUazhzSUdadmJuUlRhWHBsT2ljeE1IQjRKeXdnWTI5c2IzSTZReTVrYVcwc0lHeGxkSFJsY2xOd1lXTnBibWM2SnpBdU1XVnRKeUI5ZlQ0S0lDQWdJQ0FnSUNBZ0lDQWdTVTVVUlZKT1FVd2d3cmNnUlU1SFNVNUZSVkpKVGtjZ1JVNUJRa3hGVFVWT1ZDREN0eUJXTVM0d0NpQWdJQ0FnSUNBZ0lDQThMM053WVc0K0Nnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR4b01TQnpkSGxzWlQxN2V5Qm1iMjUwVTJsNlpUb25Nalp3ZUNjc0lHWnZiblJYWldsbmFIUTZPREF3TENCc1pYUjBaWEpUY0dGamFXNW5PaWN0TUM0d01qVmxiU2NzSUcxaGNtZHBiam9uTkhCNElEQWdOSEI0Snl3Z2JHbHVaVWhsYVdkb2REb3hMakExSUgxOVBnb2dJQ0FnSUNBZ0lDQWdWR2hsSUVGa2VXVnVJRU52Ym5SbGVIUWdUR0Y1WlhJS0lDQWdJQ0FnSUNBOEwyZ3hQZ29nSUNBZ0lDQWdJRHh3SUhOMGVXeGxQWHQ3SUdOdmJHOXlPa011YlhWMFpXUXNJR1p2Ym5SVGFYcGxPaWN4TTNCNEp5d2diV0Z5WjJsdU9qQWdmWDArVW05c2JHOTFkQ0JUZEhKaGRHVm5lU0FtWVcxd095Qk5aV0Z6ZFhKbGJXVnVkQ0JHY21GdFpYZHZjbXM4TDNBK0NpQWdJQ0FnSUR3dmFHVmhaR1Z5UGdvS0lDQWdJQ0FnZXk4cUlPS1VnT0tVZ0NCVVlXSWdRbUZ5SU9LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ09LVWdPS1VnT0tVZ0NBcUwzMEtJQ0FnSUNBZ1BHNWhkaUJ6ZEhsc1pUMTdleUJrYVhOd2JHRjVPaWRtYkdWNEp5d2daMkZ3T2ljMGNIZ25MQ0J0WVhKbmFXNUNiM1IwYjIwNkp6STBjSGduTENCaVlXTnJaM0p2ZFc1a09rTXVjR0Z1Wld3c0lIQmhaR1JwYm1jNkp6UndlQ2NzSUdKdmNtUmxjbEpoWkdsMWN6b25PSEI0Snl3Z2QybGtkR2c2SjJacGRDMWpiMjUwWlc1MEp5d2dZbTl5WkdWeU9tQXhjSGdnYzI5c2FXUWdKSHRETG1KdmNtUmxjbjFnSUgxOVBnb2dJQ0FnSUNBZ0lIdFVRVUpUTG0xaGNDaDBJRDArSUNnS0lDQWdJQ0FnSUNBZ0lEeGlkWFIwYjI0Z2EyVjVQWHQwTG1sa2ZTQnZia05zYVdOclBYc29LU0E5UGlCelpYUlVZV0lvZEM1cFpDbDlJSE4wZVd4bFBYdDdDaUFnSUNBZ0lDQWdJQ0FnSUhCaFpHUnBibWM2Snpkd2VDQXhObkI0Snl3Z1ltOXlaR1Z5T2lkdWIyNWxKeXdnWW05eVpHVnlVbUZrYVhWek9pYzFjSGduTENCamRYSnpiM0k2SjNCdmFXNTBaWEluTEFvZ0lDQWdJQ0FnSUNBZ0lDQm1iMjUwUm1GdGFXeDVPbE5CVGxNc0lHWnZiblJUYVhwbE9pY3hNbkI0Snl3Z1ptOXVkRmRsYVdkb2REb2dkR0ZpUFQwOWRDNXBaQ0EvSURjd01DQTZJRFF3TUN3S0lDQWdJQ0FnSUNBZ0lDQWdZMjlzYjNJNklIUmhZajA5UFhRdWFXUWdQeUJETG5SbGVIUWdPaUJETG0xMWRHVmtMQW9nSUNBZ0lDQWdJQ0FnSUNCaVlXTnJaM0p2ZFc1a09pQjBZV0k5UFQxMExtbGtJRDhnUXk1allYSmtJRG9nSjNSeVlXNXpjR0Z5Wlc1MEp5d0tJQ0FnSUNBZ0lDQWdJQ0FnWW05NFUyaGhaRzkzT2lCMFlXSTlQVDEwTG1sa0lEOGdZREFnTUNBd0lERndlQ0FrZTBNdVltOXlaR1Z5U0dsOVlDQTZJQ2R1YjI1bEp5d0tJQ0FnSUNBZ0lDQWdJQ0FnZEhKaGJuTnBkR2x2YmpvbllXeHNJREF1TVRWekp5d0tJQ0FnSUNBZ0lDQWdJSDE5UG50MExteGhZbVZzZlR3dlluVjBkRzl1UGdvZ0lDQWdJQ0FnSUNrcGZRb2dJQ0FnSUNBOEwyNWhkajRLQ2lBZ0lDQWdJSHN2S2lEaWxJRGlsSUFnVkdGaUlFTnZiblJsYm5RZzRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBNHBTQTRwU0E0cFNBSUNvdmZRb2dJQ0FnSUNCN2RHRmlQVDA5SjNKdllXUnRZWEFuSUNBbUppQThVbTloWkcxaGNGUmhZaUFnYUc5MlpYSmxaRDE3YUc5MlpYSmxaSDBnYzJWMFNHOTJaWEpsWkQxN2MyVjBTRzkyWlhKbFpIMGdMejU5Q2lBZ0lDQWdJSHQwWVdJOVBUMG5iV1YwY21samN5Y2dJQ1ltSUR4TlpYUnlhV056VkdGaUlDQXZQbjBLSUNBZ0lDQWdlM1JoWWowOVBTZHlhWE5yY3ljZ0lDQWdKaVlnUEZKcGMydHpWR0ZpSUNBZ0lHVjRjR0Z1WkdWa1VtbHphejE3Wlhod1lXNWtaV1JTYVhOcmZTQnpaWFJGZUhCaGJtUmxaRkpwYzJzOWUzTmxkRVY0Y0dGdVpHVmtVbWx6YTMwZ0x6NTlDaUFnSUNBZ0lIdDBZV0k5UFQwbmMzVnRiV0Z5ZVNjZ0lDWW1JRHhUZFcxdFlYSjVWR0ZpSUNBdlBuMEtJQ0FnSUR3dlpHbDJQZ29nSUNrN0NuMEtDaTh2SU9LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa0Fvdkx5QlVRVUk2SUZKUFFVUk5RVkFLTHk4ZzRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUUNncG1kVzVqZEdsdmJpQlNiMkZrYldGd1ZHRmlLSHNnYUc5MlpYSmxaQ3dnYzJWMFNHOTJaWEpsWkNCOUtTQjdDaUFnWTI5dWMzUWdkMlZsYTNNZ1BTQkJjbkpoZVM1bWNtOXRLSHNnYkdWdVozUm9PakkySUgwc0lDaGZMR2twSUQwK0lHa3JNU2s3Q2dvZ0lISmxkSFZ5YmlBb0NpQWdJQ0E4WkdsMlBnb2dJQ0FnSUNBOFUyVmpkR2x2Ymt4aFltVnNQa2x0Y0d4bGJXVnVkR0YwYVc5dUlGQm9ZWE5sY3p3dlUyVmpkR2x2Ymt4aFltVnNQZ29LSUNBZ0lDQWdleThxSUZCb1lYTmxJRU5oY21SeklDb3ZmUW9nSUNBZ0lDQThaR2wySUhOMGVXeGxQWHQ3SUdScGMzQnNZWGs2SjJkeWFXUW5MQ0JuY21sa1ZHVnRjR3hoZEdWRGIyeDFiVzV6T2ljeFpuSWdNV1p5SURGbWNpY3NJR2RoY0Rvbk1UQndlQ2NzSUcxaGNtZHBia0p2ZEhSdmJUb25Namh3ZUNjZ2ZYMCtDaUFnSUNBZ0lDQWdlMUJJUVZORlUxOUVRVlJCTG0xaGNDaHdhQ0E5UGlBb0NpQWdJQ0FnSUNBZ0lDQThaR2wySUd0bGVUMTdjR2d1YVdSOUlITjBlV3hsUFh0N0lHSmhZMnRuY205MWJtUTZReTVqWVhKa0xDQmliM0prWlhKU1lXUnBkWE02Snpod2VDY3NJSEJoWkdScGJtYzZKekUwY0hnbkxDQmliM0prWlhJNllERndlQ0J6YjJ4cFpDQWtlME11WW05eVpHVnlmV0FzSUdKdmNtUmxjbFJ2Y0RwZ00zQjRJSE52Ykdsa0lDUjdjR05iY0dndWFXUmRmV0FnZlgwK0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1pHbHpjR3hoZVRvblpteGxlQ2NzSUdwMWMzUnBabmxEYjI1MFpXNTBPaWR6Y0dGalpTMWlaWFIzWldWdUp5d2diV0Z5WjJsdVFtOTBkRzl0T2ljNGNIZ25MQ0JoYkdsbmJrbDBaVzF6T2lkalpXNTBaWEluSUgxOVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJSE4wZVd4bFBYdDdJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKekV3Y0hnbkxDQmpiMnh2Y2pwd1kxdHdhQzVwWkYwc0lHeGxkSFJsY2xOd1lXTnBibWM2SnpBdU1XVnRKeXdnWm05dWRGZGxhV2RvZERvMU1EQWdmWDArVUVoQlUwVWdlM0JvTG1sa2ZUd3ZjM0JoYmo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4YzNCaGJpQnpkSGxzWlQxN2V5Qm1iMjUwUm1GdGFXeDVPazFQVGs4c0lHWnZiblJUYVhwbE9pY3hNSEI0Snl3Z1kyOXNiM0k2UXk1a2FXMGdmWDArVjBzZ2UzQm9MbmRyYzFzd1hYM2lnSk43Y0dndWQydHpXekZkZlR3dmMzQmhiajRLSUNBZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnYzNSNWJHVTllM3NnWm05dWRGZGxhV2RvZERvNE1EQXNJR1p2Ym5SVGFYcGxPaWN4TkhCNEp5d2diV0Z5WjJsdVFtOTBkRzl0T2ljeE1IQjRKeXdnYkdWMGRHVnlVM0JoWTJsdVp6b25MVEF1TURGbGJTY2dmWDArZTNCb0xtNWhiV1Y5UEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUh0Yld5ZEJkV1JwWlc1alpTY3NJSEJvTG1GMVpHbGxibU5sTENCdWRXeHNYU3hiSjBOaGNHRmlhV3hwZEhrbkxDQndhQzVqWVhBc0lHNTFiR3hkTEZzblIyRjBaU2NzSUhCb0xtZGhkR1VzSUhCb0xtZGhkR1ZEWFYwdWJXRndLQ2hiYkN4MkxIWmpYU2tnUFQ0Z0tBb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdhMlY1UFh0c2ZTQnpkSGxzWlQxN2V5Qm1iMjUwVTJsNlpUb25NVEZ3ZUNjc0lHMWhjbWRwYmtKdmRIUnZiVG9uTkhCNEp5QjlmVDRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJRHh6Y0dGdUlITjBlV3hsUFh0N0lHTnZiRzl5T2tNdVpHbHRJSDE5UG50c2ZUb2dQQzl6Y0dGdVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ1BITndZVzRnYzNSNWJHVTllM3NnWTI5c2IzSTZkbU44ZkVNdWJYVjBaV1FnZlgwK2UzWjlQQzl6Y0dGdVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBcEtYMEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQnpkSGxzWlQxN2V5QnRZWEpuYVc1VWIzQTZKemh3ZUNjc0lHSmhZMnRuY205MWJtUTZjR1JwYlZ0d2FDNXBaRjBzSUdKdmNtUmxjanBnTVhCNElITnZiR2xrSUNSN2NHSnZjbVJsY2x0d2FDNXBaRjE5WUN3Z1ltOXlaR1Z5VW1Ga2FYVnpPaWMwY0hnbkxDQndZV1JrYVc1bk9pYzFjSGdnT0hCNEp5d2dabTl1ZEZOcGVtVTZKekV4Y0hnbkxDQmpiMnh2Y2pwd1kxdHdhQzVwWkYwc0lHeHBibVZJWldsbmFIUTZNUzQwSUgxOVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSU9LY2t5QjdjR2d1YzNWalkyVnpjMzBLSUNBZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0FwS1gwS0lDQWdJQ0FnUEM5a2FYWStDZ29nSUNBZ0lDQThVMlZqZEdsdmJreGhZbVZzUGpJMkxWZGxaV3NnVkdsdFpXeHBibVVnNG9DVUlHaHZkbVZ5SUdGdWVTQjNaV1ZySUdObGJHd2dabTl5SUdSbGRHRnBiRHd2VTJWamRHbHZia3hoWW1Wc1Bnb0tJQ0FnSUNBZ2V5OHFJRkJvWVhObElITndZVzRnYkdGaVpXeHpJQ292ZlFvZ0lDQWdJQ0E4WkdsMklITjBlV3hsUFh0N0lHUnBjM0JzWVhrNkoyZHlhV1FuTENCbmNtbGtWR1Z0Y0d4aGRHVkRiMngxYlc1ek9pZHlaWEJsWVhRb01qWXNJREZtY2lrbkxDQm5ZWEE2SnpOd2VDY3NJRzFoY21kcGJrSnZkSFJ2YlRvbk5IQjRKeUI5ZlQ0S0lDQWdJQ0FnSUNCN1VFaEJVMFZUWDBSQlZFRXViV0Z3S0hCb0lEMCtJQ2dLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdhMlY1UFh0d2FDNXBaSDBnYzNSNWJHVTllM3NLSUNBZ0lDQWdJQ0FnSUNBZ1ozSnBaRU52YkhWdGJqcGdjM0JoYmlBa2UzQm9Mbk53WVc1OVlDd0tJQ0FnSUNBZ0lDQWdJQ0FnWW1GamEyZHliM1Z1WkRwd1pHbHRXM0JvTG1sa1hTd2dZbTl5WkdWeU9tQXhjSGdnYzI5c2FXUWdKSHR3WW05eVpHVnlXM0JvTG1sa1hYMWdMQ0JpYjNKa1pYSlNZV1JwZFhNNkp6UndlQ2NzQ2lBZ0lDQWdJQ0FnSUNBZ0lIQmhaR1JwYm1jNkp6UndlQ0EyY0hnbkxDQjBaWGgwUVd4cFoyNDZKMk5sYm5SbGNpY3NDaUFnSUNBZ0lDQWdJQ0FnSUdadmJuUkdZVzFwYkhrNlRVOU9UeXdnWm05dWRGTnBlbVU2SnpFd2NIZ25MQ0JqYjJ4dmNqcHdZMXR3YUM1cFpGMHNJR1p2Ym5SWFpXbG5hSFE2TlRBd0xBb2dJQ0FnSUNBZ0lDQWdJQ0JzWlhSMFpYSlRjR0ZqYVc1bk9pY3dMakEwWlcwbkxDQjNhR2wwWlZOd1lXTmxPaWR1YjNkeVlYQW5MQ0J2ZG1WeVpteHZkem9uYUdsa1pHVnVKeXdLSUNBZ0lDQWdJQ0FnSUgxOVBnb2dJQ0FnSUNBZ0lDQWdJQ0JRZTNCb0xtbGtmU0RDdHlCN2NHZ3VibUZ0WlgwS0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNrcGZRb2dJQ0FnSUNBOEwyUnBkajRLQ2lBZ0lDQWdJSHN2S2lCTmFXeGxjM1J2Ym1VZ1pHbGhiVzl1WkhNZ0tHRmliM1psS1NBcUwzMEtJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMTdleUJrYVhOd2JHRjVPaWRuY21sa0p5d2daM0pwWkZSbGJYQnNZWFJsUTI5c2RXMXVjem9uY21Wd1pXRjBLREkyTENBeFpuSXBKeXdnWjJGd09pY3pjSGduTENCb1pXbG5hSFE2SnpFMmNIZ25MQ0J0WVhKbmFXNUNiM1IwYjIwNkp6TndlQ2NnZlgwK0NpQWdJQ0FnSUNBZ2UzZGxaV3R6TG0xaGNDaDNJRDArSUhzS0lDQWdJQ0FnSUNBZ0lHTnZibk4wSUcwZ1BTQk5YMDFCVUZ0M1hUc0tJQ0FnSUNBZ0lDQWdJSEpsZEhWeWJpQW9DaUFnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdhMlY1UFh0M2ZTQnpkSGxzWlQxN2V5QmthWE53YkdGNU9pZG1iR1Y0Snl3Z2FuVnpkR2xtZVVOdmJuUmxiblE2SjJObGJuUmxjaWNzSUdGc2FXZHVTWFJsYlhNNkoyWnNaWGd0Wlc1a0p5QjlmVDRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQjdiU0FtSmlCdExtRmliM1psSUNZbUlDZ0tJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnZEdsMGJHVTllMjB1YkdGaVpXeDlJSE4wZVd4bFBYdDdJSGRwWkhSb09pYzRjSGduTENCb1pXbG5hSFE2Snpod2VDY3NJR0poWTJ0bmNtOTFibVE2YlM1akxDQjBjbUZ1YzJadmNtMDZKM0p2ZEdGMFpTZzBOV1JsWnlrbkxDQm1iR1Y0VTJoeWFXNXJPakFnZlgwZ0x6NEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBcGZRb2dJQ0FnSUNBZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJQ2s3Q2lBZ0lDQWdJQ0FnZlNsOUNpQWdJQ0FnSUR3dlpHbDJQZ29LSUNBZ0lDQWdleThxSUZkbFpXc2dZMlZzYkhNZ0tpOTlDaUFnSUNBZ0lEeGthWFlnYzNSNWJHVTllM3NnWkdsemNHeGhlVG9uWjNKcFpDY3NJR2R5YVdSVVpXMXdiR0YwWlVOdmJIVnRibk02SjNKbGNHVmhkQ2d5Tml3Z01XWnlLU2NzSUdkaGNEb25NM0I0Snl3Z2JXRnlaMmx1UW05MGRHOXRPaWN6Y0hnbklIMTlQZ29nSUNBZ0lDQWdJSHQzWldWcmN5NXRZWEFvZHlBOVBpQjdDaUFnSUNBZ0lDQWdJQ0JqYjI1emRDQndhQ0E5SUdkbGRGQm9ZWE5sS0hjcE93b2dJQ0FnSUNBZ0lDQWdZMjl1YzNRZ2FYTkliM1lnUFNCb2IzWmxjbVZrSUQwOVBTQjNPd29nSUNBZ0lDQWdJQ0FnY21WMGRYSnVJQ2dLSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJyWlhrOWUzZDlDaUFnSUNBZ0lDQWdJQ0FnSUNBZ2IyNU5iM1Z6WlVWdWRHVnlQWHNvS1NBOVBpQnpaWFJJYjNabGNtVmtLSGNwZlFvZ0lDQWdJQ0FnSUNBZ0lDQWdJRzl1VFc5MWMyVk1aV0YyWlQxN0tDa2dQVDRnYzJWMFNHOTJaWEpsWkNodWRXeHNLWDBLSUNBZ0lDQWdJQ0FnSUNBZ0lDQnpkSGxzWlQxN2V3b2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ2FHVnBaMmgwT2ljek1IQjRKeXdnWW05eVpHVnlVbUZrYVhWek9pY3pjSGduTENCamRYSnpiM0k2SjNCdmFXNTBaWEluTEFvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnWW1GamEyZHliM1Z1WkRvZ2FYTkliM1lnUHlCd1kxdHdhRjBnT2lCd1pHbHRXM0JvWFN3S0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUdKdmNtUmxjanBnTVhCNElITnZiR2xrSUNSN2FYTkliM1lnUHlCd1kxdHdhRjBnT2lCd1ltOXlaR1Z5VzNCb1hYMWdMQW9nSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdkSEpoYm5OcGRHbHZiam9uWW1GamEyZHliM1Z1WkNBd0xqRnpMQ0JpYjNKa1pYSXRZMjlzYjNJZ01DNHhjeWNzQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdmWDBLSUNBZ0lDQWdJQ0FnSUNBZ0x6NEtJQ0FnSUNBZ0lDQWdJQ2s3Q2lBZ0lDQWdJQ0FnZlNsOUNpQWdJQ0FnSUR3dlpHbDJQZ29LSUNBZ0lDQWdleThxSUUxcGJHVnpkRzl1WlNCa2FXRnRiMjVrY3lBb1ltVnNiM2NwSUNvdmZRb2dJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR1JwYzNCc1lYazZKMmR5YVdRbkxDQm5jbWxrVkdWdGNHeGhkR1ZEYjJ4MWJXNXpPaWR5WlhCbFlYUW9NallzSURGbWNpa25MQ0JuWVhBNkp6TndlQ2NzSUdobGFXZG9kRG9uTVRad2VDY3NJRzFoY21kcGJrSnZkSFJ2YlRvbk0zQjRKeUI5ZlQ0S0lDQWdJQ0FnSUNCN2QyVmxhM011YldGd0tIY2dQVDRnZXdvZ0lDQWdJQ0FnSUNBZ1kyOXVjM1FnYlNBOUlFMWZUVUZRVzNkZE93b2dJQ0FnSUNBZ0lDQWdjbVYwZFhKdUlDZ0tJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQnJaWGs5ZTNkOUlITjBlV3hsUFh0N0lHUnBjM0JzWVhrNkoyWnNaWGduTENCcWRYTjBhV1o1UTI5dWRHVnVkRG9uWTJWdWRHVnlKeXdnWVd4cFoyNUpkR1Z0Y3pvblpteGxlQzF6ZEdGeWRDY2dmWDArQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdlMjBnSmlZZ0lXMHVZV0p2ZG1VZ0ppWWdLQW9nSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCMGFYUnNaVDE3YlM1c1lXSmxiSDBnYzNSNWJHVTllM3NnZDJsa2RHZzZKemh3ZUNjc0lHaGxhV2RvZERvbk9IQjRKeXdnWW1GamEyZHliM1Z1WkRwdExtTXNJSFJ5WVc1elptOXliVG9uY205MFlYUmxLRFExWkdWbktTY3NJR1pzWlhoVGFISnBibXM2TUN3Z2JXRnlaMmx1Vkc5d09pY3ljSGduSUgxOUlDOCtDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0tYMEtJQ0FnSUNBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FwT3dvZ0lDQWdJQ0FnSUgwcGZRb2dJQ0FnSUNBOEwyUnBkajRLQ2lBZ0lDQWdJSHN2S2lCWFpXVnJJRzUxYldKbGNuTWdLaTk5Q2lBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1pHbHpjR3hoZVRvblozSnBaQ2NzSUdkeWFXUlVaVzF3YkdGMFpVTnZiSFZ0Ym5NNkozSmxjR1ZoZENneU5pd2dNV1p5S1Njc0lHZGhjRG9uTTNCNEp5d2diV0Z5WjJsdVFtOTBkRzl0T2ljeE5IQjRKeUI5ZlQ0S0lDQWdJQ0FnSUNCN2QyVmxhM011YldGd0tIY2dQVDRnS0FvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJyWlhrOWUzZDlJSE4wZVd4bFBYdDdJSFJsZUhSQmJHbG5iam9uWTJWdWRHVnlKeXdnWm05dWRFWmhiV2xzZVRwTlQwNVBMQ0JtYjI1MFUybDZaVG9uT1hCNEp5d2dZMjlzYjNJNklHaHZkbVZ5WldROVBUMTNJRDhnY0dOYloyVjBVR2hoYzJVb2R5bGRJRG9nUXk1a2FXMHNJSEJoWkdScGJtZFViM0E2SnpKd2VDY2dmWDArQ2lBZ0lDQWdJQ0FnSUNBZ0lIdDNmUW9nSUNBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdLU2w5Q2lBZ0lDQWdJRHd2WkdsMlBnb0tJQ0FnSUNBZ2V5OHFJRTFwYkdWemRHOXVaU0JzWldkbGJtUWdLaTk5Q2lBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1pHbHpjR3hoZVRvblpteGxlQ2NzSUdac1pYaFhjbUZ3T2lkM2NtRndKeXdnWjJGd09pY3hNSEI0Snl3Z2JXRnlaMmx1UW05MGRHOXRPaWN4Tm5CNEp5d2djR0ZrWkdsdVp6b25NVEJ3ZUNBeE1uQjRKeXdnWW1GamEyZHliM1Z1WkRwRExuQmhibVZzTENCaWIzSmtaWEpTWVdScGRYTTZKelp3ZUNjc0lHSnZjbVJsY2pwZ01YQjRJSE52Ykdsa0lDUjdReTVpYjNKa1pYSjlZQ0I5ZlQ0S0lDQWdJQ0FnSUNCN1RVbE1SVk5VVDA1RlV5NXRZWEFvYlNBOVBpQW9DaUFnSUNBZ0lDQWdJQ0E4WkdsMklHdGxlVDE3YlM1M1pXVnJmU0J6ZEhsc1pUMTdleUJrYVhOd2JHRjVPaWRtYkdWNEp5d2dZV3hwWjI1SmRHVnRjem9uWTJWdWRHVnlKeXdnWjJGd09pYzFjSGduSUgxOVBnb2dJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklITjBlV3hsUFh0N0lIZHBaSFJvT2ljM2NIZ25MQ0JvWldsbmFIUTZKemR3ZUNjc0lHSmhZMnRuY205MWJtUTZiUzVqTENCMGNtRnVjMlp2Y20wNkozSnZkR0YwWlNnME5XUmxaeWtuTENCbWJHVjRVMmh5YVc1ck9qQWdmWDBnTHo0S0lDQWdJQ0FnSUNBZ0lDQWdQSE53WVc0Z2MzUjViR1U5ZTNzZ1ptOXVkRVpoYldsc2VUcE5UMDVQTENCbWIyNTBVMmw2WlRvbk1UQndlQ2NzSUdOdmJHOXlPbTB1WXlCOWZUNVhlMjB1ZDJWbGEzMDZJSHR0TG14aFltVnNmVHd2YzNCaGJqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lDa3BmUW9nSUNBZ0lDQThMMlJwZGo0S0NpQWdJQ0FnSUhzdktpQkliM1psY2lCa1pYUmhhV3dnY0dGdVpXd2dLaTk5Q2lBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzS0lDQWdJQ0FnSUNCaVlXTnJaM0p2ZFc1a09rTXVZMkZ5WkN3Z1ltOXlaR1Z5T21BeGNIZ2djMjlzYVdRZ0pIdG9iM1psY21Wa0lEOGdjR0p2Y21SbGNsdG5aWFJRYUdGelpTaG9iM1psY21Wa0tWMGdPaUJETG1KdmNtUmxjbjFnTEFvZ0lDQWdJQ0FnSUdKdmNtUmxjbEpoWkdsMWN6b25PSEI0Snl3Z2NHRmtaR2x1Wnpvbk1UUndlQ2NzSUcxcGJraGxhV2RvZERvbk9EQndlQ2NzSUhSeVlXNXphWFJwYjI0NkoySnZjbVJsY2kxamIyeHZjaUF3TGpKekp5d0tJQ0FnSUNBZ2ZYMCtDaUFnSUNBZ0lDQWdlMmh2ZG1WeVpXUWdQeUFvQ2lBZ0lDQWdJQ0FnSUNBOFpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR1JwYzNCc1lYazZKMlpzWlhnbkxDQm5ZWEE2Snpod2VDY3NJRzFoY21kcGJrSnZkSFJ2YlRvbk1UQndlQ2NzSUdac1pYaFhjbUZ3T2lkM2NtRndKeXdnWVd4cFoyNUpkR1Z0Y3pvblkyVnVkR1Z5SnlCOWZUNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFNXNXNhVzVsUW1Ga1oyVWdiR0ZpWld3OWUyQlhTeUFrZTJodmRtVnlaV1I5WUgwZ1l6MTdjR05iWjJWMFVHaGhjMlVvYUc5MlpYSmxaQ2xkZlNBdlBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4SmJteHBibVZDWVdSblpTQnNZV0psYkQxN1lGQklRVk5GSUNSN1oyVjBVR2hoYzJVb2FHOTJaWEpsWkNsOU9pQWtlM0J1WVcxbFcyZGxkRkJvWVhObEtHaHZkbVZ5WldRcFhYMWdmU0JqUFh0d1kxdG5aWFJRYUdGelpTaG9iM1psY21Wa0tWMTlJQzgrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdlMDFmVFVGUVcyaHZkbVZ5WldSZElDWW1JRHhKYm14cGJtVkNZV1JuWlNCc1lXSmxiRDE3WU9LWGhpQWtlMDFmVFVGUVcyaHZkbVZ5WldSZExteGhZbVZzZldCOUlHTTllMDFmVFVGUVcyaHZkbVZ5WldSZExtTjlJQzgrZlFvZ0lDQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdQSEFnYzNSNWJHVTllM3NnYldGeVoybHVPakFzSUdadmJuUlRhWHBsT2ljeE0zQjRKeXdnWTI5c2IzSTZReTV0ZFhSbFpDd2diR2x1WlVobGFXZG9kRG94TGpVMUlIMTlQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lIdFhSVVZMWDBsT1JrOWJhRzkyWlhKbFpGMTlDaUFnSUNBZ0lDQWdJQ0FnSUR3dmNENEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lDa2dPaUFvQ2lBZ0lDQWdJQ0FnSUNBOGNDQnpkSGxzWlQxN2V5QnRZWEpuYVc0Nk1Dd2dabTl1ZEVaaGJXbHNlVHBOVDA1UExDQm1iMjUwVTJsNlpUb25NVEZ3ZUNjc0lHTnZiRzl5T2tNdVpHbHRMQ0JrYVhOd2JHRjVPaWRtYkdWNEp5d2dZV3hwWjI1SmRHVnRjem9uWTJWdWRHVnlKeXdnYUdWcFoyaDBPaWMxTW5CNEp5QjlmVDRLSUNBZ0lDQWdJQ0FnSUNBZzRvYVFJRWh2ZG1WeUlHRnVlU0IzWldWcklHTmxiR3dnZEc4Z2MyVmxJSGRvWVhRZ2FHRndjR1Z1Y3lCMGFHRjBJSGRsWldzS0lDQWdJQ0FnSUNBZ0lEd3ZjRDRLSUNBZ0lDQWdJQ0FwZlFvZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUR3dlpHbDJQZ29nSUNrN0NuMEtDaTh2SU9LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa0Fvdkx5QlVRVUk2SUUxRlZGSkpRMU1LTHk4ZzRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUUNncG1kVzVqZEdsdmJpQk5aWFJ5YVdOelZHRmlLQ2tnZXdvZ0lISmxkSFZ5YmlBb0NpQWdJQ0E4WkdsMlBnb2dJQ0FnSUNBOFUyVmpkR2x2Ymt4aFltVnNQbEpQU1NCRVlYTm9ZbTloY21RZzRvQ1VJRUYxZEc5dFlYUmxaQ0JVWld4bGJXVjBjbmtnd3JjZ1RtOGdVM1Z5ZG1WNWN5REN0eUJPYnlCVFpXeG1MVkpsY0c5eWRITThMMU5sWTNScGIyNU1ZV0psYkQ0S0NpQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOWUzc2daR2x6Y0d4aGVUb25abXhsZUNjc0lHWnNaWGhFYVhKbFkzUnBiMjQ2SjJOdmJIVnRiaWNzSUdkaGNEb25NVFJ3ZUNjc0lHMWhjbWRwYmtKdmRIUnZiVG9uTWpSd2VDY2dmWDArQ2lBZ0lDQWdJQ0FnZTAxRlZGSkpRMU5mUkVGVVFTNXRZWEFvYlNBOVBpQThUV1YwY21salEyRnlaQ0JyWlhrOWUyMHVkR2wwYkdWOUlIc3VMaTV0ZlNBdlBpbDlDaUFnSUNBZ0lEd3ZaR2wyUGdvS0lDQWdJQ0FnUEZObFkzUnBiMjVNWVdKbGJENUNZV05yYzNSaFoyVWdVSFZzYzJVZzRvQ1VJRVZ1WjJsdVpXVnlhVzVuSUUxaGJtRm5aWElnVm1sbGR5QW9WMlZsYXlBeU5DQlRhVzExYkdGMGFXOXVLVHd2VTJWamRHbHZia3hoWW1Wc1Bnb0tJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMTdleUJpWVdOclozSnZkVzVrT2ljak1FUXhNVEUzSnl3Z1ltOXlaR1Z5T21BeGNIZ2djMjlzYVdRZ0pIdERMbUp2Y21SbGNraHBmV0FzSUdKdmNtUmxjbEpoWkdsMWN6b25NVEJ3ZUNjc0lHOTJaWEptYkc5M09pZG9hV1JrWlc0bkxDQm1iMjUwUm1GdGFXeDVPazFQVGs4Z2ZYMCtDaUFnSUNBZ0lDQWdQR1JwZGlCemRIbHNaVDE3ZXlCaVlXTnJaM0p2ZFc1a09pY2pNVFl4UWpJeUp5d2djR0ZrWkdsdVp6b25NVEJ3ZUNBeE5uQjRKeXdnWW05eVpHVnlRbTkwZEc5dE9tQXhjSGdnYzI5c2FXUWdKSHRETG1KdmNtUmxjbjFnTENCa2FYTndiR0Y1T2lkbWJHVjRKeXdnYW5WemRHbG1lVU52Ym5SbGJuUTZKM053WVdObExXSmxkSGRsWlc0bkxDQmhiR2xuYmtsMFpXMXpPaWRqWlc1MFpYSW5JSDE5UGdvZ0lDQWdJQ0FnSUNBZ1BITndZVzRnYzNSNWJHVTllM3NnWTI5c2IzSTZReTVuY21WbGJpd2dabTl1ZEZOcGVtVTZKekV6Y0hnbkxDQm1iMjUwVjJWcFoyaDBPalV3TUN3Z2JHVjBkR1Z5VTNCaFkybHVaem9uTUM0d01tVnRKeUI5ZlQ1RFQwNVVSVmhVSUV4QldVVlNJT0tBbENCVVJVRk5JRWhGUVV4VVNEd3ZjM0JoYmo0S0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUhOMGVXeGxQWHQ3SUdOdmJHOXlPa011WkdsdExDQm1iMjUwVTJsNlpUb25NVEZ3ZUNjZ2ZYMCtWMlZsYXlBeU5Dd2dNakF5TlR3dmMzQmhiajRLSUNBZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ0lDQjdXd29nSUNBZ0lDQWdJQ0FnZXlCcFkyOXVPaWZpajdFbkxDQnNZV0psYkRvblZHbHRaU0IwYnlCRGIyNW1hV1JsYm1ObElDaFVhR2x6SUVOdmFHOXlkQ2tuTENCc01Ub25OWFJvSUZCU09pQXlPQ0JrWVhseklHRjJaeUFnd3JjZ0lPS0dreUF6TXlVZ2RuTXVJR3hoYzNRZ1kyOW9iM0owSnl3Z2JESTZKMUJTSUhKbGQyOXlheUJ5WVhSbElHTnZiblpsY21kbGJtTmxPaUF5TGpRZ2JXOXVkR2h6SUhaekxpQTBJRzF2Ym5Sb0lHSmhjMlZzYVc1bEp5d2djM1JoZEhWek9pZmluSVVnVDA0Z1ZGSkJRMHNuSUgwc0NpQWdJQ0FnSUNBZ0lDQjdJR2xqYjI0NkovQ2ZrcXduTEd4aFltVnNPaWROWVc1aFoyVnlJRUoxY21SbGJpQW9WR2hwY3lCWFpXVnJLU2NzSUNBZ0lDQWdJQ0JzTVRvblFVa2dZVzV6ZDJWeVpXUWdORGNnY1hWbGMzUnBiMjV6SUNEQ3R5QWdVMkYyWldRZ2ZqRXhhQ0J6Wlc1cGIzSWdkR2x0WlNjc0lDQWdiREk2SjBSbFpteGxZM1JwYjI0Z2NtRjBaVG9nTlRJbElDRGlocEVnTnlVZ2RuTXVJR3hoYzNRZ2QyVmxheWNzSUNBZ0lITjBZWFIxY3pvbjRweUZJRTlPSUZSU1FVTkxKeUI5TEFvZ0lDQWdJQ0FnSUNBZ2V5QnBZMjl1T2lmd241dWdKeXdnYkdGaVpXdzZKMGR2YkdSbGJpQlFZWFJvSUVGa2FHVnlaVzVqWlNBb1RtVjNJRWhwY21VZ1EyOW9iM0owS1Njc0lHd3hPaWRGYm5ZZ1kyOXRjR3hwWVc1alpUb2dPRFF2TVRBd0lDREN0eUFnUTB4SklISmxkbVZ5ZENCeVlYUmxPaUEwTGpJbEp5d2dJR3d5T2lkRmJuWWdkR2xqYTJWMGN5QjBhR2x6SUdOdmFHOXlkRG9nTXlBZzRvYVRJRFU0SlNCMmN5NGdZbUZ6Wld4cGJtVW5MQ0J6ZEdGMGRYTTZKK0tjaFNCUFRpQlVVa0ZEU3ljZ2ZTd0tJQ0FnSUNBZ0lDQmRMbTFoY0Nnb2NtOTNMQ0JwS1NBOVBpQW9DaUFnSUNBZ0lDQWdJQ0E4WkdsMklHdGxlVDE3YVgwZ2MzUjViR1U5ZTNzZ2NHRmtaR2x1Wnpvbk1USndlQ0F4Tm5CNEp5d2dZbTl5WkdWeVFtOTBkRzl0T2lCcFBESWdQeUJnTVhCNElITnZiR2xrSUNSN1F5NWliM0prWlhKOVlDQTZJQ2R1YjI1bEp5d2daR2x6Y0d4aGVUb25abXhsZUNjc0lHcDFjM1JwWm5sRGIyNTBaVzUwT2lkemNHRmpaUzFpWlhSM1pXVnVKeXdnWVd4cFoyNUpkR1Z0Y3pvblkyVnVkR1Z5SnlCOWZUNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR1p2Ym5SVGFYcGxPaWN4TTNCNEp5d2dZMjlzYjNJNlF5NTBaWGgwTENCdFlYSm5hVzVDYjNSMGIyMDZKek53ZUNjc0lHWnZiblJYWldsbmFIUTZOVEF3SUgxOVBudHliM2N1YVdOdmJuMGdJSHR5YjNjdWJHRmlaV3g5UEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMTdleUJtYjI1MFUybDZaVG9uTVRGd2VDY3NJR052Ykc5eU9rTXViWFYwWldRc0lHMWhjbWRwYmtKdmRIUnZiVG9uTVhCNEp5QjlmVDU3Y205M0xtd3hmVHd2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOWUzc2dabTl1ZEZOcGVtVTZKekV4Y0hnbkxDQmpiMnh2Y2pwRExtMTFkR1ZrSUgxOVBudHliM2N1YkRKOVBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQThjM0JoYmlCemRIbHNaVDE3ZXlCamIyeHZjanBETG1keVpXVnVMQ0JtYjI1MFUybDZaVG9uTVRGd2VDY3NJR1p2Ym5SWFpXbG5hSFE2TlRBd0xDQm1iR1Y0VTJoeWFXNXJPakFzSUcxaGNtZHBia3hsWm5RNkp6RTJjSGduSUgxOVBudHliM2N1YzNSaGRIVnpmVHd2YzNCaGJqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lDa3BmUW9nSUNBZ0lDQThMMlJwZGo0S0lDQWdJRHd2WkdsMlBnb2dJQ2s3Q24wS0NtWjFibU4wYVc5dUlFMWxkSEpwWTBOaGNtUW9leUJwWTI5dUxDQjBlWEJsTENCMGVYQmxRMjlzYjNJc0lIUnBkR3hsTENCemRXSjBhWFJzWlN3Z1ltRnpaV3hwYm1Vc0lIUmhjbWRsZEN3Z2MzUnlaWFJqYUN3Z2RXNXBkQ3dnWkdseUxDQndhR0Z6WlhNc0lITmxZMjl1WkdGeWVTd2dabWx1WVc1amFXRnNMQ0JtYjNKQmJHeGhMQ0JtYjNKSVpXbDBiM0lnZlNrZ2V3b2dJR052Ym5OMElGdGxlSEJoYm1SbFpDd2djMlYwUlhod1lXNWtaV1JkSUQwZ2RYTmxVM1JoZEdVb1ptRnNjMlVwT3dvS0lDQnlaWFIxY200Z0tBb2dJQ0FnUEdScGRpQnpkSGxzWlQxN2V5QmlZV05yWjNKdmRXNWtPa011WTJGeVpDd2dZbTl5WkdWeU9tQXhjSGdnYzI5c2FXUWdKSHRETG1KdmNtUmxjbjFnTENCaWIzSmtaWEpTWVdScGRYTTZKemh3ZUNjc0lHOTJaWEptYkc5M09pZG9hV1JrWlc0bklIMTlQZ29nSUNBZ0lDQjdMeW9nU0dWaFpHVnlJSEp2ZHlBcUwzMEtJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMTdleUJ3WVdSa2FXNW5PaWN4TTNCNElERTJjSGduTENCaWIzSmtaWEpDYjNSMGIyMDZZREZ3ZUNCemIyeHBaQ0FrZTBNdVltOXlaR1Z5ZldBc0lHUnBjM0JzWVhrNkoyWnNaWGduTENCaGJHbG5ia2wwWlcxek9pZG1iR1Y0TFhOMFlYSjBKeXdnWjJGd09pY3hNbkI0SnlCOWZUNEtJQ0FnSUNBZ0lDQThjM0JoYmlCemRIbHNaVDE3ZXlCbWIyNTBVMmw2WlRvbk1qQndlQ2NzSUd4cGJtVklaV2xuYUhRNk1Td2dabXhsZUZOb2NtbHVhem93SUgxOVBudHBZMjl1ZlR3dmMzQmhiajRLSUNBZ0lDQWdJQ0E4WkdsMklITjBlV3hsUFh0N0lHWnNaWGc2TVNCOWZUNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1pHbHpjR3hoZVRvblpteGxlQ2NzSUdkaGNEb25PSEI0Snl3Z2JXRnlaMmx1UW05MGRHOXRPaWMwY0hnbkxDQmhiR2xuYmtsMFpXMXpPaWRqWlc1MFpYSW5MQ0JtYkdWNFYzSmhjRG9uZDNKaGNDY2dmWDArQ2lBZ0lDQWdJQ0FnSUNBZ0lEeEpibXhwYm1WQ1lXUm5aU0JzWVdKbGJEMTdkSGx3WlgwZ1l6MTdkSGx3WlVOdmJHOXlmU0F2UGdvZ0lDQWdJQ0FnSUNBZ0lDQThjM0JoYmlCemRIbHNaVDE3ZXlCbWIyNTBWMlZwWjJoME9qZ3dNQ3dnWm05dWRGTnBlbVU2SnpFMWNIZ25MQ0JzWlhSMFpYSlRjR0ZqYVc1bk9pY3RNQzR3TVdWdEp5QjlmVDU3ZEdsMGJHVjlQQzl6Y0dGdVBnb2dJQ0FnSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQThjQ0J6ZEhsc1pUMTdleUJ0WVhKbmFXNDZNQ3dnWm05dWRGTnBlbVU2SnpFeGNIZ25MQ0JqYjJ4dmNqcERMbVJwYlN3Z1ptOXVkRVpoYldsc2VUcE5UMDVQSUgxOVBudHpkV0owYVhSc1pYMDhMM0ErQ2lBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdQR0oxZEhSdmJpQnZia05zYVdOclBYc29LU0E5UGlCelpYUkZlSEJoYm1SbFpDZ2haWGh3WVc1a1pXUXBmU0J6ZEhsc1pUMTdleUJpWVdOclozSnZkVzVrT2lkdWIyNWxKeXdnWW05eVpHVnlPbUF4Y0hnZ2MyOXNhV1FnSkh0RExtSnZjbVJsY24xZ0xDQmpiMnh2Y2pwbGVIQmhibVJsWkNBL0lIUjVjR1ZEYjJ4dmNpQTZJRU11YlhWMFpXUXNJSEJoWkdScGJtYzZKelJ3ZUNBeE1IQjRKeXdnWW05eVpHVnlVbUZrYVhWek9pYzBjSGduTENCamRYSnpiM0k2SjNCdmFXNTBaWEluTENCbWIyNTBSbUZ0YVd4NU9rMVBUazhzSUdadmJuUlRhWHBsT2ljeE1IQjRKeXdnWm14bGVGTm9jbWx1YXpvd0xDQnNaWFIwWlhKVGNHRmphVzVuT2ljd0xqQTJaVzBuSUgxOVBnb2dJQ0FnSUNBZ0lDQWdlMlY0Y0dGdVpHVmtJRDhnSjBOTVQxTkZKeUE2SUNkRVJWUkJTVXduZlFvZ0lDQWdJQ0FnSUR3dlluVjBkRzl1UGdvZ0lDQWdJQ0E4TDJScGRqNEtDaUFnSUNBZ0lIc3ZLaUJRYUdGelpTQndjbTluY21WemN5QmlZWEp6SUNvdmZRb2dJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJSEJoWkdScGJtYzZKekUwY0hnZ01UWndlQ2NnZlgwK0NpQWdJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMTdleUJrYVhOd2JHRjVPaWRuY21sa0p5d2daM0pwWkZSbGJYQnNZWFJsUTI5c2RXMXVjem9uY21Wd1pXRjBLRE1zSURGbWNpa25MQ0JuWVhBNkp6RTBjSGduTENCdFlYSm5hVzVDYjNSMGIyMDZKekV5Y0hnbklIMTlQZ29nSUNBZ0lDQWdJQ0FnZTNCb1lYTmxjeTV0WVhBb2NHZ2dQVDRnZXdvZ0lDQWdJQ0FnSUNBZ0lDQmpiMjV6ZENCaVlYSlFZM1FnUFNCa2FYSTlQVDBuYkc5M1pYSW5DaUFnSUNBZ0lDQWdJQ0FnSUNBZ1B5QW9NU0F0SUNod2FDNTJZV3dnTFNCMFlYSm5aWFFwSUM4Z0tHSmhjMlZzYVc1bElDMGdkR0Z5WjJWMEtTa2dLaUF4TURBS0lDQWdJQ0FnSUNBZ0lDQWdJQ0E2SUNod2FDNTJZV3dnTHlCd2FDNXRZWGdwSUNvZ01UQXdPd29nSUNBZ0lDQWdJQ0FnSUNCeVpYUjFjbTRnS0FvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2EyVjVQWHR3YUM1d2FIMCtDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUhOMGVXeGxQWHQ3SUdScGMzQnNZWGs2SjJac1pYZ25MQ0JxZFhOMGFXWjVRMjl1ZEdWdWREb25jM0JoWTJVdFltVjBkMlZsYmljc0lHMWhjbWRwYmtKdmRIUnZiVG9uTlhCNEp5d2dZV3hwWjI1SmRHVnRjem9uWW1GelpXeHBibVVuSUgxOVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lDQThjM0JoYmlCemRIbHNaVDE3ZXlCbWIyNTBSbUZ0YVd4NU9rMVBUazhzSUdadmJuUlRhWHBsT2ljeE1IQjRKeXdnWTI5c2IzSTZjR05iY0dndWNHaGRJSDE5UG50d2FDNXNZV0psYkgwOEwzTndZVzQrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJSE4wZVd4bFBYdDdJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKekV5Y0hnbkxDQmpiMnh2Y2pwRExuUmxlSFFzSUdadmJuUlhaV2xuYUhRNk5qQXdJSDE5UG50d2FDNTJZV3g5ZTNWdWFYUjlQQzl6Y0dGdVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklITjBlV3hsUFh0N0lHSmhZMnRuY205MWJtUTZReTVpYjNKa1pYSXNJR0p2Y21SbGNsSmhaR2wxY3pvbk0zQjRKeXdnYUdWcFoyaDBPaWMyY0hnbkxDQnZkbVZ5Wm14dmR6b25hR2xrWkdWdUp5QjlmVDRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQnpkSGxzWlQxN2V5QjNhV1IwYURwZ0pIdE5ZWFJvTG0xaGVDZ3dMQ0JOWVhSb0xtMXBiaWd4TURBc0lHSmhjbEJqZENrcGZTVmdMQ0JvWldsbmFIUTZKekV3TUNVbkxDQmlZV05yWjNKdmRXNWtPbkJqVzNCb0xuQm9YU3dnWW05eVpHVnlVbUZrYVhWek9pY3pjSGduSUgxOUlDOCtDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOWUzc2dabTl1ZEZOcGVtVTZKekV3Y0hnbkxDQmpiMnh2Y2pwRExtUnBiU3dnYldGeVoybHVWRzl3T2ljemNIZ25JSDE5UG50d2FDNXViM1JsZlR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQXBPd29nSUNBZ0lDQWdJQ0FnZlNsOUNpQWdJQ0FnSUNBZ1BDOWthWFkrQ2dvZ0lDQWdJQ0FnSUhzdktpQkNZWE5sYkdsdVpTRGlocElnVkdGeVoyVjBJSE4wY21sd0lDb3ZmUW9nSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1pHbHpjR3hoZVRvblpteGxlQ2NzSUdkaGNEb25NVEJ3ZUNjc0lHRnNhV2R1U1hSbGJYTTZKMk5sYm5SbGNpY3NJSEJoWkdScGJtYzZKemh3ZUNBeE1IQjRKeXdnWW1GamEyZHliM1Z1WkRwRExuQmhibVZzTENCaWIzSmtaWEpTWVdScGRYTTZKelZ3ZUNjc0lHSnZjbVJsY2pwZ01YQjRJSE52Ykdsa0lDUjdReTVpYjNKa1pYSjlZQ0I5ZlQ0S0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUhOMGVXeGxQWHQ3SUdadmJuUkdZVzFwYkhrNlRVOU9UeXdnWm05dWRGTnBlbVU2SnpFeGNIZ25MQ0JqYjJ4dmNqcERMbTExZEdWa0xDQm1iR1Y0VTJoeWFXNXJPakFnZlgwK1FtRnpaV3hwYm1VNklIdGlZWE5sYkdsdVpYMTdkVzVwZEgwOEwzTndZVzQrQ2lBZ0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR1pzWlhnNk1Td2dhR1ZwWjJoME9pY3hjSGduTENCaVlXTnJaM0p2ZFc1a09rTXVZbTl5WkdWeUlIMTlJQzgrQ2lBZ0lDQWdJQ0FnSUNBOGMzQmhiaUJ6ZEhsc1pUMTdleUJqYjJ4dmNqcERMbVJwYlN3Z1ptOXVkRk5wZW1VNkp6RXljSGduSUgxOVB1S0drand2YzNCaGJqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1pteGxlRG94TENCb1pXbG5hSFE2SnpGd2VDY3NJR0poWTJ0bmNtOTFibVE2WUd4cGJtVmhjaTFuY21Ga2FXVnVkQ2c1TUdSbFp5d2dKSHRETG1KdmNtUmxjbjBzSUNSN1F5NW5jbVZsYm4wcFlDQjlmU0F2UGdvZ0lDQWdJQ0FnSUNBZ1BITndZVzRnYzNSNWJHVTllM3NnWm05dWRFWmhiV2xzZVRwTlQwNVBMQ0JtYjI1MFUybDZaVG9uTVROd2VDY3NJR052Ykc5eU9rTXVaM0psWlc0c0lHWnZiblJYWldsbmFIUTZOekF3TENCbWJHVjRVMmh5YVc1ck9qQWdmWDArQ2lBZ0lDQWdJQ0FnSUNBZ0lGUmhjbWRsZERvZ2UzUmhjbWRsZEgxN2RXNXBkSDBLSUNBZ0lDQWdJQ0FnSUR3dmMzQmhiajRLSUNBZ0lDQWdJQ0FnSUh0a2FYSTlQVDBuYkc5M1pYSW5JQ1ltSUR4emNHRnVJSE4wZVd4bFBYdDdJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKekV3Y0hnbkxDQmpiMnh2Y2pwRExtZHlaV1Z1TENCbWJHVjRVMmh5YVc1ck9qQWdmWDArNG9pU2UwMWhkR2d1Y205MWJtUW9LREV0ZEdGeVoyVjBMMkpoYzJWc2FXNWxLU294TURBcGZTVThMM053WVc0K2ZRb2dJQ0FnSUNBZ0lDQWdQSE53WVc0Z2MzUjViR1U5ZTNzZ1ptOXVkRVpoYldsc2VUcE5UMDVQTENCbWIyNTBVMmw2WlRvbk1UQndlQ2NzSUdOdmJHOXlPa011WkdsdExDQm1iR1Y0VTJoeWFXNXJPakFnZlgwK3dyY2djM1J5WlhSamFEb2dlM04wY21WMFkyaDllM1Z1YVhSOVBDOXpjR0Z1UGdvZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQThMMlJwZGo0S0NpQWdJQ0FnSUhzdktpQkZlSEJoYm1SbFpDQmtaWFJoYVd3Z0tpOTlDaUFnSUNBZ0lIdGxlSEJoYm1SbFpDQW1KaUFvQ2lBZ0lDQWdJQ0FnUEdScGRpQnpkSGxzWlQxN2V5QndZV1JrYVc1bk9pY3dJREUyY0hnZ01UUndlQ2NzSUdKdmNtUmxjbFJ2Y0RwZ01YQjRJSE52Ykdsa0lDUjdReTVpYjNKa1pYSjlZQ0I5ZlQ0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnYzNSNWJHVTllM3NnY0dGa1pHbHVaMVJ2Y0Rvbk1USndlQ2NzSUdScGMzQnNZWGs2SjJac1pYZ25MQ0JtYkdWNFJHbHlaV04wYVc5dU9pZGpiMngxYlc0bkxDQm5ZWEE2Snpod2VDY2dmWDArQ2lBZ0lDQWdJQ0FnSUNBZ0lEeHdJSE4wZVd4bFBYdDdJRzFoY21kcGJqb3dMQ0JtYjI1MFUybDZaVG9uTVRKd2VDY3NJR052Ykc5eU9rTXViWFYwWldRc0lHeHBibVZJWldsbmFIUTZNUzQxSUgxOVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJSE4wZVd4bFBYdDdJR052Ykc5eU9rTXVaR2x0TENCbWIyNTBSbUZ0YVd4NU9rMVBUazhzSUdadmJuUlRhWHBsT2ljeE1IQjRKeXdnYkdWMGRHVnlVM0JoWTJsdVp6b25NQzR3T0dWdEp5QjlmVDVUUlVOUFRrUkJVbGtnVTBsSFRrRk1PaUE4TDNOd1lXNCtDaUFnSUNBZ0lDQWdJQ0FnSUNBZ2UzTmxZMjl1WkdGeWVYMEtJQ0FnSUNBZ0lDQWdJQ0FnUEM5d1Bnb2dJQ0FnSUNBZ0lDQWdJQ0I3Wm1sdVlXNWphV0ZzSUNZbUlDZ0tJQ0FnSUNBZ0lDQWdJQ0FnSUNBOGNDQnpkSGxzWlQxN2V5QnRZWEpuYVc0Nk1Dd2dabTl1ZEZOcGVtVTZKekV5Y0hnbkxDQmpiMnh2Y2pwRExtRnRZbVZ5TENCc2FXNWxTR1ZwWjJoME9qRXVOU0I5ZlQ0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJSE4wZVd4bFBYdDdJR052Ykc5eU9rTXVaR2x0TENCbWIyNTBSbUZ0YVd4NU9rMVBUazhzSUdadmJuUlRhWHBsT2ljeE1IQjRKeXdnYkdWMGRHVnlVM0JoWTJsdVp6b25NQzR3T0dWdEp5QjlmVDVHU1U1QlRrTkpRVXdnU1UxUVFVTlVPaUE4TDNOd1lXNCtDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQjdabWx1WVc1amFXRnNmUW9nSUNBZ0lDQWdJQ0FnSUNBZ0lEd3ZjRDRLSUNBZ0lDQWdJQ0FnSUNBZ0tYMEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQnpkSGxzWlQxN2V5QmthWE53YkdGNU9pZG5jbWxrSnl3Z1ozSnBaRlJsYlhCc1lYUmxRMjlzZFcxdWN6b25NV1p5SURGbWNpY3NJR2RoY0Rvbk9IQjRKeXdnYldGeVoybHVWRzl3T2ljMGNIZ25JSDE5UGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1ltRmphMmR5YjNWdVpEcERMbUpzZFdWRWFXMHNJR0p2Y21SbGNqcGdNWEI0SUhOdmJHbGtJQ1I3UXk1aWJIVmxRbTl5WkdWeWZXQXNJR0p2Y21SbGNsSmhaR2wxY3pvbk5YQjRKeXdnY0dGa1pHbHVaem9uTVRCd2VDY3NJR1p2Ym5SVGFYcGxPaWN4TVhCNEp5d2dZMjlzYjNJNlF5NXRkWFJsWkN3Z2JHbHVaVWhsYVdkb2REb3hMalVnZlgwK0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR052Ykc5eU9rTXVZbXgxWlN3Z1ptOXVkRVpoYldsc2VUcE5UMDVQTENCbWIyNTBVMmw2WlRvbk9YQjRKeXdnYkdWMGRHVnlVM0JoWTJsdVp6b25NQzR4WlcwbkxDQnRZWEpuYVc1Q2IzUjBiMjA2SnpWd2VDY2dmWDArUms5U0lFRk1URUVnNG9hU1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0I3Wm05eVFXeHNZWDBLSUNBZ0lDQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklITjBlV3hsUFh0N0lHSmhZMnRuY205MWJtUTZReTVuY21WbGJrUnBiU3dnWW05eVpHVnlPbUF4Y0hnZ2MyOXNhV1FnSkh0RExtZHlaV1Z1UW05eVpHVnlmV0FzSUdKdmNtUmxjbEpoWkdsMWN6b25OWEI0Snl3Z2NHRmtaR2x1Wnpvbk1UQndlQ2NzSUdadmJuUlRhWHBsT2ljeE1YQjRKeXdnWTI5c2IzSTZReTV0ZFhSbFpDd2diR2x1WlVobGFXZG9kRG94TGpVZ2ZYMCtDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUhOMGVXeGxQWHQ3SUdOdmJHOXlPa011WjNKbFpXNHNJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKemx3ZUNjc0lHeGxkSFJsY2xOd1lXTnBibWM2SnpBdU1XVnRKeXdnYldGeVoybHVRbTkwZEc5dE9pYzFjSGduSUgxOVBrWlBVaUJJUlVsVVQxSWc0b2FTUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQjdabTl5U0dWcGRHOXlmUW9nSUNBZ0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQXBmUW9nSUNBZ1BDOWthWFkrQ2lBZ0tUc0tmUW9LTHk4ZzRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUUNpOHZJRlJCUWpvZ1VGSkZMVTFQVWxSRlRTQXZJRkpKVTB0VENpOHZJT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrQW9LWm5WdVkzUnBiMjRnVW1semEzTlVZV0lvZXlCbGVIQmhibVJsWkZKcGMyc3NJSE5sZEVWNGNHRnVaR1ZrVW1semF5QjlLU0I3Q2lBZ0x5OGdVTU9YU1NCdFlYUnlhWGc2SURVZ1kyOXNjeUFvYVcxd1lXTjBJREhpaHBJMUtTRERseUExSUhKdmQzTWdLSEJ5YjJJZ01lS0dralVwTENCalpXeHNJRFEwdzVjME1Bb2dJR052Ym5OMElHTmxiR3hYSUQwZ05EUXNJR05sYkd4SUlEMGdOREE3Q2dvZ0lHTnZibk4wSUdobFlYUkRiMnh2Y2lBOUlDaHBiWEFzSUhCeWIySXBJRDArSUhzS0lDQWdJR052Ym5OMElITmpiM0psSUQwZ2FXMXdJQ29nY0hKdllqc0tJQ0FnSUdsbUlDaHpZMjl5WlNBOFBTQTJLU0J5WlhSMWNtNGdReTVuY21WbGJqc0tJQ0FnSUdsbUlDaHpZMjl5WlNBOFBTQXhNaWtnY21WMGRYSnVJRU11WVcxaVpYSTdDaUFnSUNCeVpYUjFjbTRnUXk1eVpXUTdDaUFnZlRzS0NpQWdjbVYwZFhKdUlDZ0tJQ0FnSUR4a2FYWStDaUFnSUNBZ0lEeFRaV04wYVc5dVRHRmlaV3crSWtsMElHbHpJRTF2Ym5Sb0lEWXVJRlJvWlNCd2NtOXFaV04wSUdaaGFXeGxaQzRnVjJoNVB5SWc0b0NVSUZCeVpTMU5iM0owWlcwZ1FXNWhiSGx6YVhNOEwxTmxZM1JwYjI1TVlXSmxiRDRLQ2lBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1pHbHpjR3hoZVRvblozSnBaQ2NzSUdkeWFXUlVaVzF3YkdGMFpVTnZiSFZ0Ym5NNkp6STJNSEI0SURGbWNpY3NJR2RoY0Rvbk1qQndlQ2NzSUcxaGNtZHBia0p2ZEhSdmJUb25NakJ3ZUNjc0lHRnNhV2R1U1hSbGJYTTZKM04wWVhKMEp5QjlmVDRLQ2lBZ0lDQWdJQ0FnZXk4cUlGRERsMGtnVFdGMGNtbDRJQ292ZlFvZ0lDQWdJQ0FnSUR4a2FYWStDaUFnSUNBZ0lDQWdJQ0E4WkdsMklITjBlV3hsUFh0N0lHWnZiblJHWVcxcGJIazZUVTlPVHl3Z1ptOXVkRk5wZW1VNkp6RXdjSGduTENCamIyeHZjanBETG1ScGJTd2diV0Z5WjJsdVFtOTBkRzl0T2ljNGNIZ25MQ0JzWlhSMFpYSlRjR0ZqYVc1bk9pY3dMakE0WlcwbklIMTlQbEJTVDBKQlFrbE1TVlJaSU1PWElFbE5VRUZEVkNCTlFWUlNTVmc4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ2NHOXphWFJwYjI0NkozSmxiR0YwYVhabEp5d2dkMmxrZEdnNllDUjdOU3BqWld4c1YzMXdlR0FzSUdobGFXZG9kRHBnSkhzMUttTmxiR3hJSUNzZ01qUjljSGhnSUgxOVBnb2dJQ0FnSUNBZ0lDQWdJQ0I3THlvZ1IzSnBaQ0JqWld4c2N5QXFMMzBLSUNBZ0lDQWdJQ0FnSUNBZ2UxczFMRFFzTXl3eUxERmRMbTFoY0Nod2NtOWlJRDArSUNnS0lDQWdJQ0FnSUNBZ0lDQWdJQ0JiTVN3eUxETXNOQ3cxWFM1dFlYQW9hVzF3SUQwK0lIc0tJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lHTnZibk4wSUdNZ1BTQm9aV0YwUTI5c2IzSW9hVzF3TENCd2NtOWlLVHNLSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJR052Ym5OMElHRnNjR2hoSUQwZ1RXRjBhQzV5YjNWdVpDZ29LR2x0Y0Nwd2NtOWlLUzh5TlNrcU9EQXBMblJ2VTNSeWFXNW5LREUyS1M1d1lXUlRkR0Z5ZENneUxDY3dKeWs3Q2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0J5WlhSMWNtNGdLQW9nSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4WkdsMklHdGxlVDE3WUNSN2NISnZZbjB0Skh0cGJYQjlZSDBnYzNSNWJHVTllM3NLSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNCd2IzTnBkR2x2YmpvbllXSnpiMngxZEdVbkxBb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJR3hsWm5RNllDUjdLR2x0Y0MweEtTcGpaV3hzVjMxd2VHQXNJSFJ2Y0RwZ0pIc29OUzF3Y205aUtTcGpaV3hzU0gxd2VHQXNDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnZDJsa2RHZzZZQ1I3WTJWc2JGY3RNbjF3ZUdBc0lHaGxhV2RvZERwZ0pIdGpaV3hzU0MweWZYQjRZQ3dLSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNCaVlXTnJaM0p2ZFc1a09tQWtlMk45Skh0aGJIQm9ZWDFnTENCaWIzSmtaWEk2WURGd2VDQnpiMnhwWkNBa2UwTXVZbTl5WkdWeWZXQXNDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJSDE5THo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNrN0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnZlNrS0lDQWdJQ0FnSUNBZ0lDQWdLU2w5Q2lBZ0lDQWdJQ0FnSUNBZ0lIc3ZLaUJTYVhOcklHUnZkSE1nS2k5OUNpQWdJQ0FnSUNBZ0lDQWdJSHRTU1ZOTFV5NXRZWEFvS0hJc0lHa3BJRDArSUhzS0lDQWdJQ0FnSUNBZ0lDQWdJQ0JqYjI1emRDQmtiM1JZSUQwZ0tISXVhVzF3WVdOMFUyTnZjbVVnTFNBeEtTQXFJR05sYkd4WElDc2dZMlZzYkZjdk1pQXRJREV4T3dvZ0lDQWdJQ0FnSUNBZ0lDQWdJR052Ym5OMElHUnZkRmtnUFNBb05TQXRJSEl1Y0hKdllsTmpiM0psS1NBcUlHTmxiR3hJSUNzZ1kyVnNiRWd2TWlBdElERXhPd29nSUNBZ0lDQWdJQ0FnSUNBZ0lISmxkSFZ5YmlBb0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR3RsZVQxN2NpNXBaSDBnZEdsMGJHVTllM0l1ZEdsMGJHVjlDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJRzl1UTJ4cFkyczlleWdwSUQwK0lITmxkRVY0Y0dGdVpHVmtVbWx6YXlobGVIQmhibVJsWkZKcGMyczlQVDF5TG1sa0lEOGdiblZzYkNBNklISXVhV1FwZlFvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNCemRIbHNaVDE3ZXdvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lIQnZjMmwwYVc5dU9pZGhZbk52YkhWMFpTY3NJR3hsWm5RNllDUjdaRzkwV0gxd2VHQXNJSFJ2Y0RwZ0pIdGtiM1JaZlhCNFlDd0tJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0IzYVdSMGFEb25Nakp3ZUNjc0lHaGxhV2RvZERvbk1qSndlQ2NzSUdKdmNtUmxjbEpoWkdsMWN6b25OVEFsSnl3S0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lDQmlZV05yWjNKdmRXNWtPaUJsZUhCaGJtUmxaRkpwYzJzOVBUMXlMbWxrSUQ4Z2NpNWpiMnh2Y2lBNklFTXVZMkZ5WkN3S0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lDQmliM0prWlhJNllESndlQ0J6YjJ4cFpDQWtlM0l1WTI5c2IzSjlZQ3dLSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNCamRYSnpiM0k2SjNCdmFXNTBaWEluTENCNlNXNWtaWGc2TVRBc0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdaR2x6Y0d4aGVUb25abXhsZUNjc0lHRnNhV2R1U1hSbGJYTTZKMk5sYm5SbGNpY3NJR3AxYzNScFpubERiMjUwWlc1ME9pZGpaVzUwWlhJbkxBb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKemx3ZUNjc0lHTnZiRzl5T2lCbGVIQmhibVJsWkZKcGMyczlQVDF5TG1sa0lEOGdReTVpWnlBNklISXVZMjlzYjNJc0lHWnZiblJYWldsbmFIUTZOekF3TEFvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lHSnZlRk5vWVdSdmR6b2daWGh3WVc1a1pXUlNhWE5yUFQwOWNpNXBaQ0EvSUdBd0lEQWdNVEJ3ZUNBa2UzSXVZMjlzYjNKOU5UVmdJRG9nSjI1dmJtVW5MQW9nSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUhSeVlXNXphWFJwYjI0NkoyRnNiQ0F3TGpFMWN5Y3NDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJSDE5UGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNCU2Uya3JNWDBLSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNrN0NpQWdJQ0FnSUNBZ0lDQWdJSDBwZlFvZ0lDQWdJQ0FnSUNBZ0lDQjdMeW9nUVhocGN5QnNZV0psYkhNZ0tpOTlDaUFnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOWUzc2djRzl6YVhScGIyNDZKMkZpYzI5c2RYUmxKeXdnWW05MGRHOXRPaWN0TWpCd2VDY3NJR3hsWm5RNk1Dd2djbWxuYUhRNk1Dd2dkR1Y0ZEVGc2FXZHVPaWRqWlc1MFpYSW5MQ0JtYjI1MFJtRnRhV3g1T2sxUFRrOHNJR1p2Ym5SVGFYcGxPaWM1Y0hnbkxDQmpiMnh2Y2pwRExtUnBiU3dnYkdWMGRHVnlVM0JoWTJsdVp6b25NQzR4WlcwbklIMTlQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lFbE5VRUZEVkNEaWhwSUtJQ0FnSUNBZ0lDQWdJQ0FnUEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJSHN2S2lCWkxXRjRhWE1nYkdGaVpXd2dLaTk5Q2lBZ0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKemx3ZUNjc0lHTnZiRzl5T2tNdVpHbHRMQ0JzWlhSMFpYSlRjR0ZqYVc1bk9pY3dMakZsYlNjc0lHMWhjbWRwYmxSdmNEb25OSEI0Snl3Z2RHVjRkRUZzYVdkdU9pZGpaVzUwWlhJbklIMTlQZ29nSUNBZ0lDQWdJQ0FnSUNEaWhwRWdVRkpQUWtGQ1NVeEpWRmtLSUNBZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQWdJQ0FnZXk4cUlFaGxZWFFnYkdWblpXNWtJQ292ZlFvZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMTdleUJrYVhOd2JHRjVPaWRtYkdWNEp5d2daMkZ3T2ljNGNIZ25MQ0J0WVhKbmFXNVViM0E2SnpFd2NIZ25MQ0JtYkdWNFYzSmhjRG9uZDNKaGNDY2dmWDArQ2lBZ0lDQWdJQ0FnSUNBZ0lIdGJXME11WjNKbFpXNHNKMHh2ZHlkZExGdERMbUZ0WW1WeUxDZE5aV1JwZFcwblhTeGJReTV5WldRc0owaHBaMmd2UTNKcGRHbGpZV3duWFYwdWJXRndLQ2hiWXl4c1hTa2dQVDRnS0FvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2EyVjVQWHRzZlNCemRIbHNaVDE3ZXlCa2FYTndiR0Y1T2lkbWJHVjRKeXdnWVd4cFoyNUpkR1Z0Y3pvblkyVnVkR1Z5Snl3Z1oyRndPaWMwY0hnbklIMTlQZ29nSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCemRIbHNaVDE3ZXlCM2FXUjBhRG9uTVRCd2VDY3NJR2hsYVdkb2REb25NVEJ3ZUNjc0lHSmhZMnRuY205MWJtUTZZeXNuTkRRbkxDQmliM0prWlhJNllERndlQ0J6YjJ4cFpDQWtlMk45WUN3Z1ltOXlaR1Z5VW1Ga2FYVnpPaWN5Y0hnbklIMTlJQzgrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4YzNCaGJpQnpkSGxzWlQxN2V5Qm1iMjUwUm1GdGFXeDVPazFQVGs4c0lHWnZiblJUYVhwbE9pYzVjSGduTENCamIyeHZjanBETG1ScGJTQjlmVDU3YkgwOEwzTndZVzQrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUNBZ0lDQWdJQ2twZlFvZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnUEM5a2FYWStDZ29nSUNBZ0lDQWdJSHN2S2lCU2FYTnJJSE4xYlcxaGNua2diR2x6ZENBcUwzMEtJQ0FnSUNBZ0lDQThaR2wySUhOMGVXeGxQWHQ3SUdScGMzQnNZWGs2SjJac1pYZ25MQ0JtYkdWNFJHbHlaV04wYVc5dU9pZGpiMngxYlc0bkxDQm5ZWEE2Snpod2VDY2dmWDArQ2lBZ0lDQWdJQ0FnSUNCN1VrbFRTMU11YldGd0tDaHlMQ0JwS1NBOVBpQW9DaUFnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdhMlY1UFh0eUxtbGtmUW9nSUNBZ0lDQWdJQ0FnSUNBZ0lHOXVRMnhwWTJzOWV5Z3BJRDArSUhObGRFVjRjR0Z1WkdWa1VtbHpheWhsZUhCaGJtUmxaRkpwYzJzOVBUMXlMbWxrSUQ4Z2JuVnNiQ0E2SUhJdWFXUXBmUW9nSUNBZ0lDQWdJQ0FnSUNBZ0lITjBlV3hsUFh0N0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNCa2FYTndiR0Y1T2lkbWJHVjRKeXdnWjJGd09pY3hNSEI0Snl3Z1lXeHBaMjVKZEdWdGN6b25abXhsZUMxemRHRnlkQ2NzSUdOMWNuTnZjam9uY0c5cGJuUmxjaWNzQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0JpWVdOclozSnZkVzVrT2lCbGVIQmhibVJsWkZKcGMyczlQVDF5TG1sa0lEOGdReTVqWVhKa0lEb2dReTV3WVc1bGJDd0tJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lHSnZjbVJsY2pwZ01YQjRJSE52Ykdsa0lDUjdaWGh3WVc1a1pXUlNhWE5yUFQwOWNpNXBaQ0EvSUhJdVkyOXNiM0lySnpVMUp5QTZJRU11WW05eVpHVnlmV0FzQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0JpYjNKa1pYSk1aV1owT21BemNIZ2djMjlzYVdRZ0pIdHlMbU52Ykc5eWZXQXNDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQmliM0prWlhKU1lXUnBkWE02Snpad2VDY3NJSEJoWkdScGJtYzZKekV3Y0hnZ01USndlQ2NzSUhSeVlXNXphWFJwYjI0NkoyRnNiQ0F3TGpFMWN5Y3NDaUFnSUNBZ0lDQWdJQ0FnSUNBZ2ZYMCtDaUFnSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJ6ZEhsc1pUMTdleUIzYVdSMGFEb25Nakp3ZUNjc0lHaGxhV2RvZERvbk1qSndlQ2NzSUdKdmNtUmxjbEpoWkdsMWN6b25OVEFsSnl3Z1ltRmphMmR5YjNWdVpEb2daWGh3WVc1a1pXUlNhWE5yUFQwOWNpNXBaQ0EvSUhJdVkyOXNiM0lnT2lBbmRISmhibk53WVhKbGJuUW5MQ0JpYjNKa1pYSTZZREp3ZUNCemIyeHBaQ0FrZTNJdVkyOXNiM0o5WUN3Z1pHbHpjR3hoZVRvblpteGxlQ2NzSUdGc2FXZHVTWFJsYlhNNkoyTmxiblJsY2ljc0lHcDFjM1JwWm5sRGIyNTBaVzUwT2lkalpXNTBaWEluTENCbWJHVjRVMmh5YVc1ck9qQXNJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKemx3ZUNjc0lHTnZiRzl5T2lCbGVIQmhibVJsWkZKcGMyczlQVDF5TG1sa0lEOGdReTVpWnlBNklISXVZMjlzYjNJc0lHWnZiblJYWldsbmFIUTZOekF3TENCMGNtRnVjMmwwYVc5dU9pZGhiR3dnTUM0eE5YTW5JSDE5UGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnVW50cEt6RjlDaUFnSUNBZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCemRIbHNaVDE3ZXlCbWJHVjRPakVnZlgwK0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR1p2Ym5SVGFYcGxPaWN4TTNCNEp5d2dabTl1ZEZkbGFXZG9kRG8yTURBc0lHMWhjbWRwYmtKdmRIUnZiVG9uTTNCNEp5d2diR1YwZEdWeVUzQmhZMmx1WnpvbkxUQXVNREZsYlNjc0lHeHBibVZJWldsbmFIUTZNUzR6SUgxOVBudHlMblJwZEd4bGZUd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQnpkSGxzWlQxN2V5Qm1iMjUwUm1GdGFXeDVPazFQVGs4c0lHWnZiblJUYVhwbE9pY3hNSEI0SnlCOWZUNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdQSE53WVc0Z2MzUjViR1U5ZTNzZ1kyOXNiM0k2UXk1a2FXMGdmWDArVURvZ1BDOXpjR0Z1UGp4emNHRnVJSE4wZVd4bFBYdDdJR052Ykc5eU9uSXVZMjlzYjNJZ2ZYMCtlM0l1Y0hKdlluMDhMM053WVc0K0NpQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lEeHpjR0Z1SUhOMGVXeGxQWHQ3SUdOdmJHOXlPa011WkdsdExDQnRZWEpuYVc0Nkp6QWdObkI0SnlCOWZUN0N0end2YzNCaGJqNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdQSE53WVc0Z2MzUjViR1U5ZTNzZ1kyOXNiM0k2UXk1a2FXMGdmWDArU1RvZ1BDOXpjR0Z1UGp4emNHRnVJSE4wZVd4bFBYdDdJR052Ykc5eU9uSXVZMjlzYjNJZ2ZYMCtlM0l1YVcxd1lXTjBmVHd2YzNCaGJqNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4emNHRnVJSE4wZVd4bFBYdDdJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKekV3Y0hnbkxDQmpiMnh2Y2pvZ1pYaHdZVzVrWldSU2FYTnJQVDA5Y2k1cFpDQS9JSEl1WTI5c2IzSWdPaUJETG1ScGJTd2dabXhsZUZOb2NtbHVhem93TENCd1lXUmthVzVuVkc5d09pY3pjSGduSUgxOVBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ2UyVjRjR0Z1WkdWa1VtbHphejA5UFhJdWFXUWdQeUFuNHBheUp5QTZJQ2ZpbHJ3bmZRb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR3dmMzQmhiajRLSUNBZ0lDQWdJQ0FnSUNBZ1BDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBcEtYMEtJQ0FnSUNBZ0lDQThMMlJwZGo0S0lDQWdJQ0FnUEM5a2FYWStDZ29nSUNBZ0lDQjdMeW9nUlhod1lXNWtaV1FnY21semF5QmtaWFJoYVd3Z0tpOTlDaUFnSUNBZ0lIdFNTVk5MVXk1dFlYQW9LSElzSUdrcElEMCtJR1Y0Y0dGdVpHVmtVbWx6YXowOVBYSXVhV1FnSmlZZ0tBb2dJQ0FnSUNBZ0lEeGthWFlnYTJWNVBYdHlMbWxrZlNCemRIbHNaVDE3ZXlCaVlXTnJaM0p2ZFc1a09rTXVZMkZ5WkN3Z1ltOXlaR1Z5T21BeGNIZ2djMjlzYVdRZ0pIdHlMbU52Ykc5eWZUUTBZQ3dnWW05eVpHVnlUR1ZtZERwZ05IQjRJSE52Ykdsa0lDUjdjaTVqYjJ4dmNuMWdMQ0JpYjNKa1pYSlNZV1JwZFhNNkp6aHdlQ2NzSUhCaFpHUnBibWM2SnpFMmNIZ25MQ0J0WVhKbmFXNUNiM1IwYjIwNkp6RXljSGduSUgxOVBnb2dJQ0FnSUNBZ0lDQWdQR1JwZGlCemRIbHNaVDE3ZXlCa2FYTndiR0Y1T2lkbWJHVjRKeXdnWjJGd09pYzRjSGduTENCdFlYSm5hVzVDYjNSMGIyMDZKekV3Y0hnbkxDQmhiR2xuYmtsMFpXMXpPaWRqWlc1MFpYSW5MQ0JtYkdWNFYzSmhjRG9uZDNKaGNDY2dmWDArQ2lBZ0lDQWdJQ0FnSUNBZ0lEeEpibXhwYm1WQ1lXUm5aU0JzWVdKbGJEMTdZRkpKVTBzZ0pIdHBLekY5WUgwZ1l6MTdjaTVqYjJ4dmNuMGdMejRLSUNBZ0lDQWdJQ0FnSUNBZ1BITndZVzRnYzNSNWJHVTllM3NnWm05dWRGZGxhV2RvZERvNE1EQXNJR1p2Ym5SVGFYcGxPaWN4TlhCNEp5d2diR1YwZEdWeVUzQmhZMmx1WnpvbkxUQXVNREUxWlcwbklIMTlQbnR5TG5ScGRHeGxmVHd2YzNCaGJqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb0tJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1ptOXVkRk5wZW1VNkp6RXljSGduTENCamIyeHZjanBETG0xMWRHVmtMQ0J0WVhKbmFXNUNiM1IwYjIwNkp6RTBjSGduTENCd1lXUmthVzVuT2ljNGNIZ2dNVEJ3ZUNjc0lHSmhZMnRuY205MWJtUTZReTV3WVc1bGJDd2dZbTl5WkdWeVVtRmthWFZ6T2ljMWNIZ25MQ0JzYVc1bFNHVnBaMmgwT2pFdU5UVXNJR0p2Y21SbGNqcGdNWEI0SUhOdmJHbGtJQ1I3UXk1aWIzSmtaWEo5WUNCOWZUNEtJQ0FnSUNBZ0lDQWdJQ0FnUEhOd1lXNGdjM1I1YkdVOWUzc2dZMjlzYjNJNlF5NWthVzBzSUdadmJuUkdZVzFwYkhrNlRVOU9UeXdnWm05dWRGTnBlbVU2SnpFd2NIZ25MQ0JzWlhSMFpYSlRjR0ZqYVc1bk9pY3dMakE0WlcwbklIMTlQbGRJV1NCSlZDQklRVkJRUlU1VE9pQThMM053WVc0K0NpQWdJQ0FnSUNBZ0lDQWdJSHR5TG5kb2VYMEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb0tJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1ptOXVkRVpoYldsc2VUcE5UMDVQTENCbWIyNTBVMmw2WlRvbk1UQndlQ2NzSUdOdmJHOXlPa011WkdsdExDQnNaWFIwWlhKVGNHRmphVzVuT2ljd0xqRmxiU2NzSUcxaGNtZHBia0p2ZEhSdmJUb25NVEJ3ZUNjZ2ZYMCtUVWxVU1VkQlZFbFBUaUJVVWtGRFMxTThMMlJwZGo0S0lDQWdJQ0FnSUNBZ0lEeGthWFlnYzNSNWJHVTllM3NnWkdsemNHeGhlVG9uWm14bGVDY3NJR1pzWlhoRWFYSmxZM1JwYjI0NkoyTnZiSFZ0Ymljc0lHZGhjRG9uTVRCd2VDY3NJRzFoY21kcGJrSnZkSFJ2YlRvbk1UUndlQ2NnZlgwK0NpQWdJQ0FnSUNBZ0lDQWdJSHR5TG5SeVlXTnJjeTV0WVhBb2RISmhZMnNnUFQ0Z0tBb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdhMlY1UFh0MGNtRmpheTUwZlNCemRIbHNaVDE3ZXlCa2FYTndiR0Y1T2lkbWJHVjRKeXdnWjJGd09pY3hNSEI0SnlCOWZUNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBZ0lEeEpibXhwYm1WQ1lXUm5aU0JzWVdKbGJEMTdkSEpoWTJzdWRIMGdZejE3Y2k1amIyeHZjbjBnTHo0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1ptOXVkRmRsYVdkb2REbzNNREFzSUdadmJuUlRhWHBsT2ljeE1uQjRKeXdnYldGeVoybHVRbTkwZEc5dE9pY3ljSGduSUgxOVBudDBjbUZqYXk1b2ZUd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR1p2Ym5SVGFYcGxPaWN4TW5CNEp5d2dZMjlzYjNJNlF5NXRkWFJsWkN3Z2JHbHVaVWhsYVdkb2REb3hMalVnZlgwK2UzUnlZV05yTG1SOVBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnSUNBOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ0tTbDlDaUFnSUNBZ0lDQWdJQ0E4TDJScGRqNEtDaUFnSUNBZ0lDQWdJQ0E4WkdsMklITjBlV3hsUFh0N0lHSmhZMnRuY205MWJtUTZjaTVqYjJ4dmNpc25NVEluTENCaWIzSmtaWEk2WURGd2VDQnpiMnhwWkNBa2UzSXVZMjlzYjNKOU16TmdMQ0JpYjNKa1pYSlNZV1JwZFhNNkp6VndlQ2NzSUhCaFpHUnBibWM2Snpod2VDQXhNSEI0Snl3Z1ptOXVkRk5wZW1VNkp6RXhjSGduTENCamIyeHZjanB5TG1OdmJHOXlMQ0JzYVc1bFNHVnBaMmgwT2pFdU5TQjlmVDRLSUNBZ0lDQWdJQ0FnSUNBZ1BITndZVzRnYzNSNWJHVTllM3NnWm05dWRFWmhiV2xzZVRwTlQwNVBMQ0JtYjI1MFYyVnBaMmgwT2pZd01Dd2dabTl1ZEZOcGVtVTZKekV3Y0hnbkxDQnNaWFIwWlhKVGNHRmphVzVuT2ljd0xqQTRaVzBuSUgxOVBrNVBUaTFPUlVkUFZFbEJRa3hGT2lBOEwzTndZVzQrQ2lBZ0lDQWdJQ0FnSUNBZ0lIdHlMbTV2Ym01bFozMEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FwS1gwS0NpQWdJQ0FnSUhzaFpYaHdZVzVrWldSU2FYTnJJQ1ltSUNnS0lDQWdJQ0FnSUNBOFpHbDJJSE4wZVd4bFBYdDdJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKekV4Y0hnbkxDQmpiMnh2Y2pwRExtUnBiU3dnZEdWNGRFRnNhV2R1T2lkalpXNTBaWEluTENCd1lXUmthVzVuT2ljeE1uQjRKeXdnWW1GamEyZHliM1Z1WkRwRExuQmhibVZzTENCaWIzSmtaWEpTWVdScGRYTTZKelp3ZUNjc0lHSnZjbVJsY2pwZ01YQjRJSE52Ykdsa0lDUjdReTVpYjNKa1pYSjlZQ0I5ZlQ0S0lDQWdJQ0FnSUNBZ0lPS0drU0JEYkdsamF5QmhibmtnY21semF5QnliM2NnYjNJZ2JXRjBjbWw0SUdSdmRDQjBieUJsZUhCaGJtUWdablZzYkNCdGFYUnBaMkYwYVc5dUlHUmxkR0ZwYkFvZ0lDQWdJQ0FnSUR3dlpHbDJQZ29nSUNBZ0lDQXBmUW9nSUNBZ1BDOWthWFkrQ2lBZ0tUc0tmUW9LTHk4ZzRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUTRwV1E0cFdRNHBXUUNpOHZJRlJCUWpvZ1UxVk5UVUZTV1Fvdkx5RGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaQUtDbVoxYm1OMGFXOXVJRk4xYlcxaGNubFVZV0lvS1NCN0NpQWdZMjl1YzNRZ2NtOTNjeUE5SUZzS0lDQWdJSHNnYVdRNk1Td2dkMnR6T2ljeDRvQ1ROaWNzSUNBZ1lYVmtPaWN6TUNCdVpYY2dhR2x5WlhNbkxDQWdJQ0FnSUNBZ0lDQWdZMkZ3T2lkRFRFa2dLeUJNYjJOaGJDQk1URTBuTENBZ0lDQWdJQ0FnSUNBZ1oyRjBaVG9uVG05dVpTQnlaWEYxYVhKbFpDY3NJQ0FnSUdkaGRHVkRPa011WjNKbFpXNHNJSE4xWTJObGMzTTZKK0tKcFRjd0pTQkRURWtnY21WemIyeDFkR2x2YmlEQ3R5QjZaWEp2SUZCSlNTQmxkbVZ1ZEhNbklIMHNDaUFnSUNCN0lHbGtPaklzSUhkcmN6b25OK0tBa3pFMkp5d2dJR0YxWkRvbmZqWTFJR1Z1WjJsdVpXVnljeUFvTWlCMFpXRnRjeWtuTEdOaGNEb25VMnhoWTJzZzhKK25vQ0RpaHBJZ1FVUlNJQ3NnVm1WeWRHVjRJRUZKSnl3Z1oyRjBaVG9uUkV4UUwxWlFReUJYYXlBMzRvQ1RPQ2NzSUNBZ1oyRjBaVU02UXk1aGJXSmxjaXdnYzNWalkyVnpjem9uNG9tbE5EQWxJR1JsWm14bFkzUnBiMjRnd3JjZzRvbWxNVEFnUVVSU2N5QnRaWEpuWldRbklIMHNDaUFnSUNCN0lHbGtPak1zSUhkcmN6b25NVGZpZ0pNeU5pY3NJR0YxWkRvblFXeHNJREVzTlRBd0lHVnVaMmx1WldWeWN5Y3NJQ0FnSUdOaGNEb25RbUZqYTNOMFlXZGxJRkJzZFdkcGJpQXJJRVJQVWtFbkxDQWdJQ0JuWVhSbE9pZEJiR3h2ZVVSQ0lFTk5SVXN2UlV0Tkp5d2daMkYwWlVNNlF5NWhiV0psY2l3Z2MzVmpZMlZ6Y3pvbjRvbWxOVEFsSUdSbFpteGxZM1JwYjI0Z3dyY2c0b21rTXpBZ1pHRjVjeUIwYnlBMWRHZ2dVRkluSUgwc0NpQWdYVHNLQ2lBZ1kyOXVjM1FnWTI5dGJXbDBjeUE5SUZzS0lDQWdJSHNnYkdGaVpXdzZKMVJwYldVZ2RHOGdRMjl1Wm1sa1pXNWpaU2NzSUNBZ0lDQWdJR1p5YjIwNkp6UXlJR1JoZVhNbkxDQWdJQ0FnSUNBZ0lIUnZPaWZpaWFRZ016QWdaR0Y1Y3ljc0lDQWdJQ0FnSUNBZ0lHUmxiSFJoT2lmaWlhVXlPQ1VnYVcxd2NtOTJaVzFsYm5RZ3dyY2c0b21rTWpVZ1pHRjVjeUJ6ZEhKbGRHTm9KeXdnWXpwRExtSnNkV1VnSUgwc0NpQWdJQ0I3SUd4aFltVnNPaWRUWlc1cGIzSWdSVzVuYVc1bFpYSWdWR2x0WlNjc0lDQWdJQ0JtY205dE9pZCtWVzUwY21GamEyVmtJSFJ2WkdGNUp5eDBiem9uNG9tbEpESTBNQ3d3TURBdmVYSWdjMkYyWldRbkxDQmtaV3gwWVRvblFXNXVkV0ZzYVhObFpDQmhZM0p2YzNNZ015QmpiMmh2Y25RZ1kzbGpiR1Z6Snl3Z0lDQWdZenBETG1GdFltVnlJSDBzQ2lBZ0lDQjdJR3hoWW1Wc09pZEZibll0VTJWMGRYQWdVM1Z3Y0c5eWRDQlVhV05yWlhSekp5eG1jbTl0T2lkRGRYSnlaVzUwSUdKaGMyVnNhVzVsSnl3Z2RHODZKK0tJa2pVd0pTQndaWElnWTI5b2IzSjBKeXdnSUNCa1pXeDBZVG9uVUdoaGMyVWdNeUJ6ZEdWaFpIa3RjM1JoZEdVZ2RHRnlaMlYwSnl3Z0lDQWdJQ0FnSUNBZ1l6cERMbWR5WldWdUlIMHNDaUFnWFRzS0NpQWdZMjl1YzNRZ2NISnBibU5wY0d4bGN5QTlJRnNLSUNBZ0lIc2dhV052YmpvbjhKK1VraWNzSUhRNkoxTmxZM1Z5YVhSNUlHRnpJRUZ5WTJocGRHVmpkSFZ5WlNjc0lDQWdaRG9uVUdoaGMyVWdNU0JvWVhNZ2VtVnlieUJqYkc5MVpDQmxaM0psYzNNZzRvQ1VJRzV2SUhObFkzVnlhWFI1SUhOcFoyNHRiMlptSUhKbGNYVnBjbVZrSUhSdklITjBZWEowTGlCV1VFTXZSRXhRSUdGMVpHbDBJSEoxYm5NZ2FXNGdjR0Z5WVd4c1pXd2dkMmwwYUNCUWFHRnpaU0F4SUdSbGNHeHZlVzFsYm5Rc0lHNXZkQ0J2YmlCMGFHVWdZM0pwZEdsallXd2djR0YwYUM0bklIMHNDaUFnSUNCN0lHbGpiMjQ2Si9DZms2RW5MQ0IwT2lkVVpXeGxiV1YwY25rc0lFNXZkQ0JUZFhKMlpYbHpKeXdnSUNBZ0lDQmtPaWRGZG1WeWVTQnRaWFJ5YVdNZ2FYTWdZWFYwYjIxaGRHVmtJR1p5YjIwZ1IybDBTSFZpTENCVGJHRmpheXdnU21seVlTd2dZVzVrSUVkRFVDQk1iMmRuYVc1bklFRlFTWE11SUU1dklITmxiR1l0Y21Wd2IzSjBjeTRnVG04Z1pXNW5ZV2RsYldWdWRDQnpZMjl5WlhNdUlFOXVaU0JDYVdkUmRXVnllU0J6YjNWeVkyVWdiMllnZEhKMWRHZ2dabVZsWkhNZ1FtRmphM04wWVdkbElGQjFiSE5sTGljZ2ZTd0tJQ0FnSUhzZ2FXTnZiam9uOEorT3J5Y3NJSFE2SjBsdWRHVnlZMlZ3ZEdsdmJpd2dUbTkwSUVGdWJtOTFibU5sYldWdWRDY3NJR1E2SjFSb1pTQjBiMjlzSUdGd2NHVmhjbk1nWVhRZ2RHaGxJR1Y0WVdOMElHMXZiV1Z1ZENCdlppQmtaWFpsYkc5d1pYSWdjR0ZwYmlEaWdKUWdhVzV6YVdSbElIUm9aU0JpZFdsc1pDQm1ZV2xzZFhKbElHOTFkSEIxZEM0Z1JHbHpZMjkyWlhKNUlHbHpJR0oxYVd4MElHbHVkRzhnZEdobElIZHZjbXRtYkc5M0xDQnViM1FnWVc1dWIzVnVZMlZrSUhacFlTQmpiMjF3WVc1NUlHVnRZV2xzTGljZ2ZTd0tJQ0JkT3dvS0lDQmpiMjV6ZENCMGFFTnpjeUE5SUhzZ2NHRmtaR2x1Wnpvbk9IQjRJREV5Y0hnbkxDQm1iMjUwUm1GdGFXeDVPazFQVGs4c0lHWnZiblJUYVhwbE9pYzVjSGduTENCamIyeHZjanBETG1ScGJTd2diR1YwZEdWeVUzQmhZMmx1Wnpvbk1DNHhaVzBuTENCMFpYaDBWSEpoYm5ObWIzSnRPaWQxY0hCbGNtTmhjMlVuTENCaVlXTnJaM0p2ZFc1a09rTXVjR0Z1Wld3c0lHSnZjbVJsY2tKdmRIUnZiVHBnTVhCNElITnZiR2xrSUNSN1F5NWliM0prWlhKOVlDQjlPd29LSUNCeVpYUjFjbTRnS0FvZ0lDQWdQR1JwZGo0S0lDQWdJQ0FnUEZObFkzUnBiMjVNWVdKbGJENUZlR1ZqZFhScGRtVWdVM1Z0YldGeWVTRGlnSlFnTmkxTmIyNTBhQ0JEYjIxdGFYUnRaVzUwSUdsdUlFOXVaU0JXYVdWM1BDOVRaV04wYVc5dVRHRmlaV3crQ2dvZ0lDQWdJQ0I3THlvZ1UzVnRiV0Z5ZVNCMFlXSnNaU0FxTDMwS0lDQWdJQ0FnUEdScGRpQnpkSGxzWlQxN2V5QmlZV05yWjNKdmRXNWtPa011WTJGeVpDd2dZbTl5WkdWeU9tQXhjSGdnYzI5c2FXUWdKSHRETG1KdmNtUmxjbjFnTENCaWIzSmtaWEpTWVdScGRYTTZKemh3ZUNjc0lHOTJaWEptYkc5M09pZG9hV1JrWlc0bkxDQnRZWEpuYVc1Q2IzUjBiMjA2SnpJMGNIZ25JSDE5UGdvZ0lDQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOWUzc2daR2x6Y0d4aGVUb25aM0pwWkNjc0lHZHlhV1JVWlcxd2JHRjBaVU52YkhWdGJuTTZKemd3Y0hnZ01UTXdjSGdnTmpWd2VDQXhOakJ3ZUNBeE5EQndlQ0F4Wm5JbklIMTlQZ29nSUNBZ0lDQWdJQ0FnZTFzblVHaGhjMlVuTENkT1lXMWxKeXduVjJWbGEzTW5MQ2RCZFdScFpXNWpaU2NzSjFObFkzVnlhWFI1SUVkaGRHVW5MQ2RUZFdOalpYTnpJRU52Ym1ScGRHbHZiaWRkTG0xaGNDaG9JRDArSUNnS0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCclpYazllMmg5SUhOMGVXeGxQWHQwYUVOemMzMCtlMmg5UEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FwS1gwS0lDQWdJQ0FnSUNBZ0lIdHliM2R6TG0xaGNDZ29jaXdnY21rcElEMCtJRnNLSUNBZ0lDQWdJQ0FnSUNBZ1BHUnBkaUJyWlhrOWUyQWtlM0l1YVdSOUxYQm9ZSDBnYzNSNWJHVTllM3NnY0dGa1pHbHVaem9uTVRKd2VDY3NJR0p2Y21SbGNrSnZkSFJ2YlRvZ2NtazhNaUEvSUdBeGNIZ2djMjlzYVdRZ0pIdERMbUp2Y21SbGNuMWdJRG9nSjI1dmJtVW5MQ0JrYVhOd2JHRjVPaWRtYkdWNEp5d2dZV3hwWjI1SmRHVnRjem9uWTJWdWRHVnlKeUI5ZlQ0S0lDQWdJQ0FnSUNBZ0lDQWdJQ0E4U1c1c2FXNWxRbUZrWjJVZ2JHRmlaV3c5ZTJCUUpIdHlMbWxrZldCOUlHTTllM0JqVzNJdWFXUmRmU0F2UGdvZ0lDQWdJQ0FnSUNBZ0lDQThMMlJwZGo0c0NpQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2EyVjVQWHRnSkh0eUxtbGtmUzF1WVcxbFlIMGdjM1I1YkdVOWUzc2djR0ZrWkdsdVp6b25NVEp3ZUNjc0lHWnZiblJYWldsbmFIUTZPREF3TENCbWIyNTBVMmw2WlRvbk1UTndlQ2NzSUdKdmNtUmxja0p2ZEhSdmJUb2djbWs4TWlBL0lHQXhjSGdnYzI5c2FXUWdKSHRETG1KdmNtUmxjbjFnSURvZ0oyNXZibVVuTENCa2FYTndiR0Y1T2lkbWJHVjRKeXdnWVd4cFoyNUpkR1Z0Y3pvblkyVnVkR1Z5SnlCOWZUNTdjRzVoYldWYmNpNXBaRjE5UEM5a2FYWStMQW9nSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR3RsZVQxN1lDUjdjaTVwWkgwdGQydHpZSDBnYzNSNWJHVTllM3NnY0dGa1pHbHVaem9uTVRKd2VDY3NJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2dabTl1ZEZOcGVtVTZKekV5Y0hnbkxDQmpiMnh2Y2pwRExtMTFkR1ZrTENCaWIzSmtaWEpDYjNSMGIyMDZJSEpwUERJZ1B5QmdNWEI0SUhOdmJHbGtJQ1I3UXk1aWIzSmtaWEo5WUNBNklDZHViMjVsSnl3Z1pHbHpjR3hoZVRvblpteGxlQ2NzSUdGc2FXZHVTWFJsYlhNNkoyTmxiblJsY2ljZ2ZYMCtlM0l1ZDJ0emZUd3ZaR2wyUGl3S0lDQWdJQ0FnSUNBZ0lDQWdQR1JwZGlCclpYazllMkFrZTNJdWFXUjlMV0YxWkdCOUlITjBlV3hsUFh0N0lIQmhaR1JwYm1jNkp6RXljSGduTENCbWIyNTBVMmw2WlRvbk1USndlQ2NzSUdOdmJHOXlPa011YlhWMFpXUXNJR0p2Y21SbGNrSnZkSFJ2YlRvZ2NtazhNaUEvSUdBeGNIZ2djMjlzYVdRZ0pIdERMbUp2Y21SbGNuMWdJRG9nSjI1dmJtVW5MQ0JrYVhOd2JHRjVPaWRtYkdWNEp5d2dZV3hwWjI1SmRHVnRjem9uWTJWdWRHVnlKeUI5ZlQ1N2NpNWhkV1I5UEM5a2FYWStMQW9nSUNBZ0lDQWdJQ0FnSUNBOFpHbDJJR3RsZVQxN1lDUjdjaTVwWkgwdFoyRjBaV0I5SUhOMGVXeGxQWHQ3SUhCaFpHUnBibWM2SnpFeWNIZ25MQ0JtYjI1MFUybDZaVG9uTVRKd2VDY3NJR052Ykc5eU9uSXVaMkYwWlVNc0lHSnZjbVJsY2tKdmRIUnZiVG9nY21rOE1pQS9JR0F4Y0hnZ2MyOXNhV1FnSkh0RExtSnZjbVJsY24xZ0lEb2dKMjV2Ym1VbkxDQmthWE53YkdGNU9pZG1iR1Y0Snl3Z1lXeHBaMjVKZEdWdGN6b25ZMlZ1ZEdWeUp5QjlmVDU3Y2k1bllYUmxmVHd2WkdsMlBpd0tJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQnJaWGs5ZTJBa2UzSXVhV1I5TFhOMVkyTmxjM05nZlNCemRIbHNaVDE3ZXlCd1lXUmthVzVuT2ljeE1uQjRKeXdnWm05dWRGTnBlbVU2SnpFeGNIZ25MQ0JqYjJ4dmNqcHdZMXR5TG1sa1hTd2dZbTl5WkdWeVFtOTBkRzl0T2lCeWFUd3lJRDhnWURGd2VDQnpiMnhwWkNBa2UwTXVZbTl5WkdWeWZXQWdPaUFuYm05dVpTY3NJR1JwYzNCc1lYazZKMlpzWlhnbkxDQmhiR2xuYmtsMFpXMXpPaWRqWlc1MFpYSW5MQ0JzYVc1bFNHVnBaMmgwT2pFdU5TQjlmVDU3Y2k1emRXTmpaWE56ZlR3dlpHbDJQaXdLSUNBZ0lDQWdJQ0FnSUYwcGZRb2dJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0E4TDJScGRqNEtDaUFnSUNBZ0lIc3ZLaUJJWldGa2JHbHVaU0JEYjIxdGFYUnRaVzUwSUNvdmZRb2dJQ0FnSUNBOFUyVmpkR2x2Ymt4aFltVnNQbGRsWldzZ01qWWc0b0NVSUVobFlXUnNhVzVsSUVOdmJXMXBkRzFsYm5ROEwxTmxZM1JwYjI1TVlXSmxiRDRLSUNBZ0lDQWdQR1JwZGlCemRIbHNaVDE3ZXlCaVlXTnJaM0p2ZFc1a09rTXVZMkZ5WkN3Z1ltOXlaR1Z5T21BeGNIZ2djMjlzYVdRZ0pIdERMbWR5WldWdVFtOXlaR1Z5ZldBc0lHSnZjbVJsY2xKaFpHbDFjem9uT0hCNEp5d2djR0ZrWkdsdVp6b25NVGh3ZUNjc0lHMWhjbWRwYmtKdmRIUnZiVG9uTWpSd2VDY2dmWDArQ2lBZ0lDQWdJQ0FnUEhBZ2MzUjViR1U5ZTNzZ2JXRnlaMmx1T2ljd0lEQWdNVFJ3ZUNBd0p5d2dabTl1ZEZOcGVtVTZKekUwY0hnbkxDQnNhVzVsU0dWcFoyaDBPakV1TmpVc0lHTnZiRzl5T2tNdWRHVjRkQ0I5ZlQ0S0lDQWdJQ0FnSUNBZ0lFSjVJRmRsWldzZ01qWXNJSFJvWlNCQlpIbGxiaUJEYjI1MFpYaDBJRXhoZVdWeUlISmxaSFZqWlhON0p5QW5mUW9nSUNBZ0lDQWdJQ0FnUEhOMGNtOXVaeUJ6ZEhsc1pUMTdleUJqYjJ4dmNqcERMbUpzZFdVZ2ZYMCtWR2x0WlNCMGJ5QkRiMjVtYVdSbGJtTmxJR1p5YjIwZ05ESWdaR0Y1Y3lCMGJ5RGlpYVF6TUNCa1lYbHpQQzl6ZEhKdmJtYytleWNnSjMwS0lDQWdJQ0FnSUNBZ0lDamlpYVV5T0NVZ2FXMXdjbTkyWlcxbGJuUXBMQ0J6WVhabGMzc25JQ2Q5Q2lBZ0lDQWdJQ0FnSUNBOGMzUnliMjVuSUhOMGVXeGxQWHQ3SUdOdmJHOXlPa011WVcxaVpYSWdmWDArNG9tbEpESTBNQ3d3TURBZ1lXNXVkV0ZzYkhrOEwzTjBjbTl1Wno1N0p5QW5mUW9nSUNBZ0lDQWdJQ0FnYVc0Z2MyVnVhVzl5SUdWdVoybHVaV1Z5SUhScGJXVXNJR0Z1WkNCbGJHbHRhVzVoZEdWemV5Y2dKMzBLSUNBZ0lDQWdJQ0FnSUR4emRISnZibWNnYzNSNWJHVTllM3NnWTI5c2IzSTZReTVuY21WbGJpQjlmVDQxTUNVZ2IyWWdaVzUyYVhKdmJtMWxiblF0YzJWMGRYQWdjM1Z3Y0c5eWRDQjBhV05yWlhSelBDOXpkSEp2Ym1jK2V5Y2dKMzBLSUNBZ0lDQWdJQ0FnSU9LQWxDQnRaV0Z6ZFhKbFpDd2dZWFYwYjIxaGRHVmtMQ0JoYm1RZ2RtbHphV0pzWlNCMGJ5QmxkbVZ5ZVNCRmJtZHBibVZsY21sdVp5Qk5ZVzVoWjJWeUlHbHVJSFJvWlNCQ1lXTnJjM1JoWjJVZ2NHOXlkR0ZzSUhSb1pYa2dZV3h5WldGa2VTQjFjMlV1Q2lBZ0lDQWdJQ0FnUEM5d1Bnb2dJQ0FnSUNBZ0lEeGthWFlnYzNSNWJHVTllM3NnWkdsemNHeGhlVG9uWjNKcFpDY3NJR2R5YVdSVVpXMXdiR0YwWlVOdmJIVnRibk02SjNKbGNHVmhkQ2d6TENBeFpuSXBKeXdnWjJGd09pY3hNSEI0SnlCOWZUNEtJQ0FnSUNBZ0lDQWdJSHRqYjIxdGFYUnpMbTFoY0NoamJTQTlQaUFvQ2lBZ0lDQWdJQ0FnSUNBZ0lEeGthWFlnYTJWNVBYdGpiUzVzWVdKbGJIMGdjM1I1YkdVOWUzc2dZbUZqYTJkeWIzVnVaRHBETG5CaGJtVnNMQ0JpYjNKa1pYSTZZREZ3ZUNCemIyeHBaQ0FrZTBNdVltOXlaR1Z5ZldBc0lHSnZjbVJsY2xKaFpHbDFjem9uTm5CNEp5d2djR0ZrWkdsdVp6b25NVEp3ZUNjc0lHSnZjbVJsY2xSdmNEcGdNbkI0SUhOdmJHbGtJQ1I3WTIwdVkzMWdJSDE5UGdvZ0lDQWdJQ0FnSUNBZ0lDQWdJRHhrYVhZZ2MzUjViR1U5ZTNzZ1ptOXVkRVpoYldsc2VUcE5UMDVQTENCbWIyNTBVMmw2WlRvbk1UQndlQ2NzSUdOdmJHOXlPbU50TG1Nc0lHeGxkSFJsY2xOd1lXTnBibWM2SnpBdU1EaGxiU2NzSUcxaGNtZHBia0p2ZEhSdmJUb25OM0I0SnlCOWZUNTdZMjB1YkdGaVpXd3VkRzlWY0hCbGNrTmhjMlVvS1gwOEwyUnBkajRLSUNBZ0lDQWdJQ0FnSUNBZ0lDQThaR2wySUhOMGVXeGxQWHQ3SUdadmJuUkdZVzFwYkhrNlRVOU9UeXdnWm05dWRGTnBlbVU2SnpFeGNIZ25MQ0JqYjJ4dmNqcERMbVJwYlN3Z2JXRnlaMmx1UW05MGRHOXRPaWN5Y0hnbklIMTlQbnRqYlM1bWNtOXRmVHd2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOWUzc2dabTl1ZEVaaGJXbHNlVHBOVDA1UExDQm1iMjUwVTJsNlpUb25NVFJ3ZUNjc0lHTnZiRzl5T21OdExtTXNJR1p2Ym5SWFpXbG5hSFE2TnpBd0xDQnRZWEpuYVc1Q2IzUjBiMjA2SnpOd2VDY2dmWDArZTJOdExuUnZmVHd2WkdsMlBnb2dJQ0FnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOWUzc2dabTl1ZEZOcGVtVTZKekV3Y0hnbkxDQmpiMnh2Y2pwRExtUnBiU0I5ZlQ1N1kyMHVaR1ZzZEdGOVBDOWthWFkrQ2lBZ0lDQWdJQ0FnSUNBZ0lEd3ZaR2wyUGdvZ0lDQWdJQ0FnSUNBZ0tTbDlDaUFnSUNBZ0lDQWdQQzlrYVhZK0NpQWdJQ0FnSUR3dlpHbDJQZ29LSUNBZ0lDQWdleThxSUVSbGMybG5iaUJRY21sdVkybHdiR1Z6SUNvdmZRb2dJQ0FnSUNBOFUyVmpkR2x2Ymt4aFltVnNQa052Y21VZ1JHVnphV2R1SUZCeWFXNWphWEJzWlhNOEwxTmxZM1JwYjI1TVlXSmxiRDRLSUNBZ0lDQWdQR1JwZGlCemRIbHNaVDE3ZXlCa2FYTndiR0Y1T2lkbmNtbGtKeXdnWjNKcFpGUmxiWEJzWVhSbFEyOXNkVzF1Y3pvbk1XWnlJREZtY2lBeFpuSW5MQ0JuWVhBNkp6RXdjSGduSUgxOVBnb2dJQ0FnSUNBZ0lIdHdjbWx1WTJsd2JHVnpMbTFoY0Nod0lEMCtJQ2dLSUNBZ0lDQWdJQ0FnSUR4a2FYWWdhMlY1UFh0d0xuUjlJSE4wZVd4bFBYdDdJR0poWTJ0bmNtOTFibVE2UXk1allYSmtMQ0JpYjNKa1pYSTZZREZ3ZUNCemIyeHBaQ0FrZTBNdVltOXlaR1Z5ZldBc0lHSnZjbVJsY2xKaFpHbDFjem9uTjNCNEp5d2djR0ZrWkdsdVp6b25NVFJ3ZUNjZ2ZYMCtDaUFnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOWUzc2dabTl1ZEZOcGVtVTZKekl5Y0hnbkxDQnRZWEpuYVc1Q2IzUjBiMjA2Snpkd2VDY2dmWDArZTNBdWFXTnZibjA4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJQ0FnUEdScGRpQnpkSGxzWlQxN2V5Qm1iMjUwVjJWcFoyaDBPamd3TUN3Z1ptOXVkRk5wZW1VNkp6RXpjSGduTENCdFlYSm5hVzVDYjNSMGIyMDZKelp3ZUNjc0lHeGxkSFJsY2xOd1lXTnBibWM2Snkwd0xqQXhaVzBuSUgxOVBudHdMblI5UEM5a2FYWStDaUFnSUNBZ0lDQWdJQ0FnSUR4a2FYWWdjM1I1YkdVOWUzc2dabTl1ZEZOcGVtVTZKekV5Y0hnbkxDQmpiMnh2Y2pwRExtMTFkR1ZrTENCc2FXNWxTR1ZwWjJoME9qRXVOVFVnZlgwK2UzQXVaSDA4TDJScGRqNEtJQ0FnSUNBZ0lDQWdJRHd2WkdsMlBnb2dJQ0FnSUNBZ0lDa3BmUW9nSUNBZ0lDQThMMlJwZGo0S0lDQWdJRHd2WkdsMlBnb2dJQ2s3Q24wS0NpOHZJT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrT0tWa09LVmtPS1ZrQW92THlCVFNFRlNSVVFnU0VWTVVFVlNVd292THlEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpEaWxaRGlsWkRpbFpBS0NtWjFibU4wYVc5dUlGTmxZM1JwYjI1TVlXSmxiQ2g3SUdOb2FXeGtjbVZ1SUgwcElIc0tJQ0J5WlhSMWNtNGdLQW9nSUNBZ1BHUnBkaUJ6ZEhsc1pUMTdleUJtYjI1MFJtRnRhV3g1T2sxUFRrOHNJR1p2Ym5SVGFYcGxPaWN4TUhCNEp5d2dZMjlzYjNJNlF5NWthVzBzSUd4bGRIUmxjbE53WVdOcGJtYzZKekF1TVRObGJTY3NJSFJsZUhSVWNtRnVjMlp2Y20wNkozVndjR1Z5WTJGelpTY3NJRzFoY21kcGJrSnZkSFJ2YlRvbk1UUndlQ2NnZlgwK0NpQWdJQ0FnSUh0amFHbHNaSEpsYm4wS0lDQWdJRHd2WkdsMlBnb2dJQ2s3Q24wS0NtWjFibU4wYVc5dUlFbHViR2x1WlVKaFpHZGxLSHNnYkdGaVpXd3NJR01nZlNrZ2V3b2dJSEpsZEhWeWJpQW9DaUFnSUNBOGMzQmhiaUJ6ZEhsc1pUMTdleUJrYVhOd2JHRjVPaWRwYm14cGJtVXRZbXh2WTJzbkxDQndZV1JrYVc1bk9pY3ljSGdnTjNCNEp5d2dZbTl5WkdWeVVtRmthWFZ6T2ljemNIZ25MQ0JtYjI1MFUybDZaVG9uTVRCd2VDY3NJR1p2Ym5SR1lXMXBiSGs2VFU5T1R5d2diR1YwZEdWeVUzQmhZMmx1Wnpvbk1DNHdObVZ0Snl3Z1kyOXNiM0k2WXl3Z1ltRmphMmR5YjNWdVpEcGdKSHRqZlRFNFlDd2dZbTl5WkdWeU9tQXhjSGdnYzI5c2FXUWdKSHRqZlRRMFlDd2dabXhsZUZOb2NtbHVhem93SUgxOVBnb2dJQ0FnSUNCN2JHRmlaV3g5Q2lBZ0lDQThMM053WVc0K0NpQWdLVHNLZlFvS0NsSmxZV04wUkU5TkxtTnlaV0YwWlZKdmIzUW9aRzlqZFcxbGJuUXVaMlYwUld4bGJXVnVkRUo1U1dRb0ozSnZiM1FuS1NrdWNtVnVaR1Z5S0R4QlpIbGxia052Ym5SbGVIUk1ZWGxsY2lBdlBpazdDand2YzJOeWFYQjBQZ284TDJKdlpIaytDand2YUhSdGJEND0iPjwvaWZyYW1lPgogIDwvZGl2Pgo8L2Rpdj4KCjwvYm9keT4KPC9odG1sPgo="
-
-_onboarding_viz_html_b64 = "PCFET0NUWVBFIGh0bWw+CjxodG1sIGxhbmc9ImVuIj4KPGhlYWQ+CjxtZXRhIG5hbWU9InZpZXdwb3J0IiBjb250ZW50PSJ3aWR0aD1kZXZpY2Utd2lkdGgsIGluaXRpYWwtc2NhbGU9MS4wIj4KPG1ldGEgY2hhcnNldD0iVVRGLTgiLz4KPHN0eWxlPgoqe2JveC1zaXppbmc6Ym9yZGVyLWJveDttYXJnaW46MDtwYWRkaW5nOjB9CmJvZHl7YmFja2dyb3VuZDojMGEwYTBhO2ZvbnQtZmFtaWx5OidIZWx2ZXRpY2EgTmV1ZScsQXJpYWwsc2Fucy1zZXJpZjtjb2xvcjojZThlOGU4O2ZvbnQtc2l6ZToxM3B4fQpidXR0b257Zm9udC1mYW1pbHk6aW5oZXJpdDtjdXJzb3I6cG9pbnRlcjt0cmFuc2l0aW9uOmFsbCAuMTVzfQouaGVhZGVye2JhY2tncm91bmQ6IzBkMGQwZDtib3JkZXItYm90dG9tOjFweCBzb2xpZCAjMWUxZTFlO3BhZGRpbmc6MTZweCAyNHB4O2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7anVzdGlmeS1jb250ZW50OnNwYWNlLWJldHdlZW59Ci5sb2dve3dpZHRoOjMycHg7aGVpZ2h0OjMycHg7YmFja2dyb3VuZDojMGFiZjUzO2JvcmRlci1yYWRpdXM6N3B4O2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7anVzdGlmeS1jb250ZW50OmNlbnRlcjtmb250LXdlaWdodDo4MDA7Zm9udC1zaXplOjE0cHg7Y29sb3I6IzAwMDtmbGV4LXNocmluazowfQouYnJhbmR7ZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmNlbnRlcjtnYXA6MTJweH0KLmJyYW5kLXRpdGxle2ZvbnQtc2l6ZToxM3B4O2ZvbnQtd2VpZ2h0OjcwMH0KLmJyYW5kLXN1Yntmb250LXNpemU6MTBweDtjb2xvcjojNjY2O21hcmdpbi10b3A6MnB4O3RleHQtdHJhbnNmb3JtOnVwcGVyY2FzZTtsZXR0ZXItc3BhY2luZzouNXB4fQoudGFic3tkaXNwbGF5OmZsZXg7Z2FwOjZweH0KLnRhYntiYWNrZ3JvdW5kOnRyYW5zcGFyZW50O2NvbG9yOiM2NjY7Ym9yZGVyOjFweCBzb2xpZCAjMWUxZTFlO2JvcmRlci1yYWRpdXM6NXB4O3BhZGRpbmc6NXB4IDEycHg7Zm9udC1zaXplOjExcHg7Zm9udC13ZWlnaHQ6NjAwfQoudGFiLmFjdGl2ZXtiYWNrZ3JvdW5kOiMwYWJmNTM7Y29sb3I6IzAwMDtib3JkZXItY29sb3I6IzBhYmY1M30KLnN0YXRze2Rpc3BsYXk6Z3JpZDtncmlkLXRlbXBsYXRlLWNvbHVtbnM6cmVwZWF0KDUsMWZyKTtiYWNrZ3JvdW5kOiMwZDBkMGQ7Ym9yZGVyLWJvdHRvbToxcHggc29saWQgIzFlMWUxZX0KLnN0YXR7cGFkZGluZzoxNHB4IDE4cHg7Ym9yZGVyLXJpZ2h0OjFweCBzb2xpZCAjMWUxZTFlfS5zdGF0Omxhc3QtY2hpbGR7Ym9yZGVyLXJpZ2h0Om5vbmV9Ci5zdGF0LXZhbHtmb250LXNpemU6MjJweDtmb250LXdlaWdodDo4MDA7bGV0dGVyLXNwYWNpbmc6LTFweDtsaW5lLWhlaWdodDoxfQouc3RhdC1sYmx7Zm9udC1zaXplOjEwcHg7Y29sb3I6IzY2NjttYXJnaW4tdG9wOjRweDtsaW5lLWhlaWdodDoxLjV9Ci5jb250ZW50e3BhZGRpbmc6MjBweCAyNHB4fQouc3RpdGxle2ZvbnQtc2l6ZToxN3B4O2ZvbnQtd2VpZ2h0OjcwMDtsZXR0ZXItc3BhY2luZzotLjVweDttYXJnaW4tYm90dG9tOjRweH0KLnNzdWJ7Y29sb3I6IzY2Njtmb250LXNpemU6MTJweDttYXJnaW4tYm90dG9tOjE2cHh9Ci5nMntkaXNwbGF5OmdyaWQ7Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOjFmciAxZnI7Z2FwOjE2cHh9Ci5nNXtkaXNwbGF5OmdyaWQ7Z3JpZC10ZW1wbGF0ZS1jb2x1bW5zOnJlcGVhdCg1LDFmcik7Z2FwOjlweH0KLmNhcmR7YmFja2dyb3VuZDojMTExO2JvcmRlcjoxcHggc29saWQgIzFlMWUxZTtib3JkZXItcmFkaXVzOjEwcHg7cGFkZGluZzoxNXB4fQouY2xibHtmb250LXNpemU6MTBweDtjb2xvcjojNjY2O3RleHQtdHJhbnNmb3JtOnVwcGVyY2FzZTtsZXR0ZXItc3BhY2luZzouOHB4O21hcmdpbi1ib3R0b206MTFweDtmb250LXdlaWdodDo2MDB9Ci5icm93e2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjhweDttYXJnaW4tYm90dG9tOjZweH0KLmJuYW1le3dpZHRoOjExNXB4O2ZvbnQtc2l6ZToxMXB4O3RleHQtYWxpZ246cmlnaHQ7ZmxleC1zaHJpbms6MH0KLmJ0cmFja3tmbGV4OjE7aGVpZ2h0OjE3cHg7YmFja2dyb3VuZDojMWExYTFhO2JvcmRlci1yYWRpdXM6M3B4O292ZXJmbG93OmhpZGRlbn0KLmJmaWxse2hlaWdodDoxMDAlO2JvcmRlci1yYWRpdXM6M3B4fQouYnZhbHtmb250LXNpemU6MTBweDtjb2xvcjojOTk5O3dpZHRoOjI2cHg7dGV4dC1hbGlnbjpyaWdodDtmbGV4LXNocmluazowfQouZXZ7ZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmZsZXgtc3RhcnQ7Z2FwOjlweDtwYWRkaW5nOjdweCA5cHg7YmFja2dyb3VuZDojMGEwYTBhO2JvcmRlci1yYWRpdXM6N3B4O2JvcmRlci1sZWZ0OjNweCBzb2xpZDttYXJnaW4tYm90dG9tOjVweH0KLmV2LXN0YXR7Zm9udC1zaXplOjE0cHg7Zm9udC13ZWlnaHQ6ODAwO21pbi13aWR0aDo0MnB4O2xldHRlci1zcGFjaW5nOi0uNXB4O2xpbmUtaGVpZ2h0OjEuMX0KLmV2LWRlc2N7Zm9udC1zaXplOjExcHg7bGluZS1oZWlnaHQ6MS40fQouZXYtc3Jje2ZvbnQtc2l6ZToxMHB4O2NvbG9yOiM1NTU7bWFyZ2luLXRvcDoxcHh9Ci5wY2FyZHtiYWNrZ3JvdW5kOiMxMTE7Ym9yZGVyOjFweCBzb2xpZCAjMWUxZTFlO2JvcmRlci1yYWRpdXM6MTBweDtwYWRkaW5nOjE1cHg7Ym9yZGVyLXRvcDozcHggc29saWQ7cG9zaXRpb246cmVsYXRpdmV9Ci5wbnVte2ZvbnQtc2l6ZToyMnB4O2ZvbnQtd2VpZ2h0OjgwMDtvcGFjaXR5Oi4yNTtwb3NpdGlvbjphYnNvbHV0ZTt0b3A6OXB4O3JpZ2h0OjExcHh9Ci5wZHVye2ZvbnQtc2l6ZToxMHB4O2ZvbnQtd2VpZ2h0OjcwMDt0ZXh0LXRyYW5zZm9ybTp1cHBlcmNhc2U7bGV0dGVyLXNwYWNpbmc6LjhweDttYXJnaW4tYm90dG9tOjVweH0KLnB0aXRsZXtmb250LXNpemU6MTJweDtmb250LXdlaWdodDo3MDA7bGluZS1oZWlnaHQ6MS4zO21hcmdpbi1ib3R0b206OXB4O3BhZGRpbmctcmlnaHQ6MThweH0KLnB0b29se2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjRweDttYXJnaW4tYm90dG9tOjNweDtmb250LXNpemU6MTBweDtjb2xvcjojNjY2fQoudGRvdHt3aWR0aDo0cHg7aGVpZ2h0OjRweDtib3JkZXItcmFkaXVzOjUwJTtmbGV4LXNocmluazowfQoubXJvd3tkaXNwbGF5OmZsZXg7Z2FwOjlweDtwYWRkaW5nOjhweCA5cHg7YmFja2dyb3VuZDojMGEwYTBhO2JvcmRlci1yYWRpdXM6N3B4O2JvcmRlci1sZWZ0OjNweCBzb2xpZDttYXJnaW4tYm90dG9tOjVweH0KLm1uYW1le21pbi13aWR0aDo4MHB4O2ZvbnQtc2l6ZToxMHB4O2ZvbnQtd2VpZ2h0OjcwMDtsaW5lLWhlaWdodDoxLjR9Ci5tZGVzY3tmb250LXNpemU6MTBweDtjb2xvcjojNjY2O2xpbmUtaGVpZ2h0OjEuNX0KLmRtb2Rle2ZvbnQtc2l6ZToxMHB4O2ZvbnQtd2VpZ2h0OjcwMDt0ZXh0LXRyYW5zZm9ybTp1cHBlcmNhc2U7bGV0dGVyLXNwYWNpbmc6LjVweDttYXJnaW4tYm90dG9tOjRweH0KLmRxe2Rpc3BsYXk6ZmxleDtnYXA6NHB4O21hcmdpbi1ib3R0b206MnB4O2ZvbnQtc2l6ZToxMHB4O2NvbG9yOiM2NjY7bGluZS1oZWlnaHQ6MS40fQouYmNhcmR7YmFja2dyb3VuZDojMTExO2JvcmRlcjoxcHggc29saWQgIzFlMWUxZTtib3JkZXItcmFkaXVzOjEwcHg7cGFkZGluZzoxNXB4O2JvcmRlci10b3A6M3B4IHNvbGlkfQouYmMtY297Zm9udC1zaXplOjEzcHg7Zm9udC13ZWlnaHQ6NzAwO21hcmdpbi1ib3R0b206MnB4fQouYmMtcmV7Zm9udC1zaXplOjExcHg7Zm9udC13ZWlnaHQ6NjAwO21hcmdpbi1ib3R0b206N3B4fQouYmMtbGV7Zm9udC1zaXplOjExcHg7Y29sb3I6IzY2NjtsaW5lLWhlaWdodDoxLjU1O21hcmdpbi1ib3R0b206OXB4fQouYmMtc3R7ZGlzcGxheTpmbGV4O2dhcDo2cHh9Ci5ic3tmbGV4OjE7YmFja2dyb3VuZDojMGEwYTBhO2JvcmRlci1yYWRpdXM6N3B4O3BhZGRpbmc6NnB4IDhweDtib3JkZXItbGVmdDoycHggc29saWR9Ci5icy12YWx7Zm9udC1zaXplOjExcHg7Zm9udC13ZWlnaHQ6NzAwfQouYnMtbGJse2ZvbnQtc2l6ZTo5cHg7Y29sb3I6IzU1NTttYXJnaW4tdG9wOjJweH0KLmxlZ2VuZHtkaXNwbGF5OmZsZXg7Z2FwOjEycHg7anVzdGlmeS1jb250ZW50OmNlbnRlcjttYXJnaW4tdG9wOjZweH0KLmxpe2Rpc3BsYXk6ZmxleDthbGlnbi1pdGVtczpjZW50ZXI7Z2FwOjVweDtmb250LXNpemU6MTBweDtjb2xvcjojNjY2fQoubGRvdHt3aWR0aDo5cHg7aGVpZ2h0OjlweDtib3JkZXItcmFkaXVzOjJweH0KLnRhYi1jb250ZW50e2Rpc3BsYXk6bm9uZX0udGFiLWNvbnRlbnQuYWN0aXZle2Rpc3BsYXk6YmxvY2t9Ci5waWUtd3JhcHtkaXNwbGF5OmZsZXg7YWxpZ24taXRlbXM6Y2VudGVyO2dhcDoxOHB4fQoucGxyb3d7bWFyZ2luLWJvdHRvbToxMHB4fQoucGxoZWFke2Rpc3BsYXk6ZmxleDtqdXN0aWZ5LWNvbnRlbnQ6c3BhY2UtYmV0d2VlbjthbGlnbi1pdGVtczpjZW50ZXI7bWFyZ2luLWJvdHRvbTozcHh9Ci5wbG5hbWV7ZGlzcGxheTpmbGV4O2FsaWduLWl0ZW1zOmNlbnRlcjtnYXA6NXB4O2ZvbnQtc2l6ZToxMHB4fQoucGxkb3R7d2lkdGg6N3B4O2hlaWdodDo3cHg7Ym9yZGVyLXJhZGl1czo1MCV9Ci5wbHZhbHtmb250LXNpemU6MTNweDtmb250LXdlaWdodDo4MDB9Ci5wbGJhcntoZWlnaHQ6M3B4O2JhY2tncm91bmQ6IzFlMWUxZTtib3JkZXItcmFkaXVzOjJweH0KLnBsZntoZWlnaHQ6MTAwJTtib3JkZXItcmFkaXVzOjJweH0KLmZvb3RlcntiYWNrZ3JvdW5kOiMwZDBkMGQ7Ym9yZGVyLXRvcDoxcHggc29saWQgIzFlMWUxZTtwYWRkaW5nOjEwcHggMjRweDtkaXNwbGF5OmZsZXg7anVzdGlmeS1jb250ZW50OnNwYWNlLWJldHdlZW47Zm9udC1zaXplOjEwcHg7Y29sb3I6IzU1NTttYXJnaW4tdG9wOjRweH0KCi8qIOKUgOKUgCBSRVNQT05TSVZFIOKUgOKUgCAqLwpAbWVkaWEgc2NyZWVuIGFuZCAobWF4LXdpZHRoOiA3NjhweCkgewogIGJvZHl7Zm9udC1zaXplOjEycHh9CiAgLmNvbnRhaW5lciwubWFpbiwud3JhcHBlcntwYWRkaW5nOjEycHghaW1wb3J0YW50O21heC13aWR0aDoxMDAlIWltcG9ydGFudH0KICB0YWJsZXtmb250LXNpemU6MTFweH0KICBoMXtmb250LXNpemU6MS40cmVtfQogIGgye2ZvbnQtc2l6ZToxLjJyZW19CiAgaDN7Zm9udC1zaXplOjFyZW19Cn0KQG1lZGlhIHNjcmVlbiBhbmQgKG1heC13aWR0aDogNDgwcHgpIHsKICBib2R5e2ZvbnQtc2l6ZToxMXB4fQogIC5jb250YWluZXIsLm1haW4sLndyYXBwZXJ7cGFkZGluZzo4cHghaW1wb3J0YW50fQogIHRhYmxle2ZvbnQtc2l6ZToxMHB4O2Rpc3BsYXk6YmxvY2s7b3ZlcmZsb3cteDphdXRvfQogIGgxe2ZvbnQtc2l6ZToxLjJyZW19CiAgaDJ7Zm9udC1zaXplOjFyZW19CiAgaW1nLHN2Z3ttYXgtd2lkdGg6MTAwJTtoZWlnaHQ6YXV0b30KfQo8L3N0eWxlPgo8L2hlYWQ+Cjxib2R5Pgo8ZGl2IGNsYXNzPSJoZWFkZXIiPgogIDxkaXYgY2xhc3M9ImJyYW5kIj4KICAgIDxkaXYgY2xhc3M9ImxvZ28iPkE8L2Rpdj4KICAgIDxkaXY+PGRpdiBjbGFzcz0iYnJhbmQtdGl0bGUiPkVuZ2luZWVyaW5nIE9uYm9hcmRpbmcgSW50ZWxsaWdlbmNlPC9kaXY+CiAgICA8L2Rpdj4KICA8L2Rpdj4KICAKPC9kaXY+CiAgPGRpdiBjbGFzcz0idGFicyI+CiAgICA8YnV0dG9uIGNsYXNzPSJ0YWIgYWN0aXZlIiBvbmNsaWNrPSJzaG93VGFiKCdkaWFnbm9zdGljJyx0aGlzKSI+TWV0aG9kb2xvZ3k8L2J1dHRvbj4KICA8L2Rpdj4KPC9kaXY+CjxkaXYgY2xhc3M9InN0YXRzIj4KICA8ZGl2IGNsYXNzPSJzdGF0Ij48ZGl2IGNsYXNzPSJzdGF0LXZhbCIgc3R5bGU9ImNvbG9yOiNmZjRkNGQiPjQyJTwvZGl2PjxkaXYgY2xhc3M9InN0YXQtbGJsIj5Lbm93bGVkZ2UgbGl2ZXMgb25seTxicj5pbiBwZW9wbGUncyBoZWFkczwvZGl2PjwvZGl2PgogIDxkaXYgY2xhc3M9InN0YXQiPjxkaXYgY2xhc3M9InN0YXQtdmFsIiBzdHlsZT0iY29sb3I6I2ZmYjgwMCI+MjklPC9kaXY+PGRpdiBjbGFzcz0ic3RhdC1sYmwiPldvcmt3ZWVrIGxvc3QgdG88YnI+a25vd2xlZGdlIHNlYXJjaDwvZGl2PjwvZGl2PgogIDxkaXYgY2xhc3M9InN0YXQiPjxkaXYgY2xhc3M9InN0YXQtdmFsIiBzdHlsZT0iY29sb3I6I2ZmYjgwMCI+OOKAkzE4bW88L2Rpdj48ZGl2IGNsYXNzPSJzdGF0LWxibCI+QWN0dWFsIHRpbWUgdG88YnI+ZnVsbCBwcm9kdWN0aXZpdHk8L2Rpdj48L2Rpdj4KICA8ZGl2IGNsYXNzPSJzdGF0Ij48ZGl2IGNsYXNzPSJzdGF0LXZhbCIgc3R5bGU9ImNvbG9yOiMwYWJmNTMiPjgyJTwvZGl2PjxkaXYgY2xhc3M9InN0YXQtbGJsIj5SZXRlbnRpb24gZ2FpbiBmcm9tPGJyPmdyZWF0IG9uYm9hcmRpbmc8L2Rpdj48L2Rpdj4KICAKPC9kaXY+CjxkaXYgY2xhc3M9ImNvbnRlbnQiPgo8ZGl2IGlkPSJ0YWItZGlhZ25vc3RpYyIgY2xhc3M9InRhYi1jb250ZW50IGFjdGl2ZSI+CiAgPGRpdiBjbGFzcz0ic3RpdGxlIj41LVBoYXNlIGRpYWdub3N0aWMgZnJhbWV3b3JrPC9kaXY+CiAgPGRpdiBjbGFzcz0ic3N1YiI+SW50ZWdyYXRlZCBtZXRob2RvbG9neSBmb3IgZmluZGluZyB0aGUgc3RydWN0dXJhbCByb290IG9mIG9uYm9hcmRpbmcgZmFpbHVyZTwvZGl2PgogIDxkaXYgY2xhc3M9Imc1IiBpZD0icGNhcmRzIiBzdHlsZT0ibWFyZ2luLWJvdHRvbToxOHB4Ij48L2Rpdj4KICA8ZGl2IGNsYXNzPSJnMiI+CiAgICA8ZGl2IGNsYXNzPSJjYXJkIj48ZGl2IGNsYXNzPSJjbGJsIj5XaGF0IEVhY2ggTWV0aG9kIFVuY292ZXJzPC9kaXY+PGRpdiBpZD0ibWxpc3QiPjwvZGl2PjwvZGl2PgogICAgPGRpdiBjbGFzcz0iY2FyZCI+PGRpdiBjbGFzcz0iY2xibCI+RGlhZ25vc3RpYyBRdWVzdGlvbnMgYnkgRmFpbHVyZSBNb2RlPC9kaXY+PGRpdiBpZD0iZHFsaXN0Ij48L2Rpdj48L2Rpdj4KICA8L2Rpdj4KPC9kaXY+CjwvZGl2Pgo8ZGl2IGNsYXNzPSJmb290ZXIiPgogIDxzcGFuPlNvdXJjZXM6IEJsb29tZmlyZS9IQlIgMjAyNSDCtyBHYWxsdXAgwrcgQnJhbmRvbiBIYWxsIEdyb3VwIMK3IE1jS2luc2V5IMK3IERlbG9pdHRlIDIwMjUgwrcgQmF1ZXIgKDIwMTApIMK3IFJvYiBDcm9zcyBPTkEgUmVzZWFyY2ggwrcgTWV0YS9Hb29nbGUvU3RyaXBlIEVuZ2luZWVyaW5nIEJsb2dzPC9zcGFuPgogIDxzcGFuPlRoZSBBZHllbiBDb250ZXh0IExheWVyIOKAlCBTZW5pb3IgTFhEIENhc2UgU3R1ZHkgwrcgMjAyNTwvc3Bhbj4KPC9kaXY+CjxzY3JpcHQ+CmNvbnN0IEc9JyMwYWJmNTMnLFI9JyNmZjRkNGQnLEE9JyNmZmI4MDAnLE1VPScjNjY2JyxUPScjZThlOGU4JyxCRD0nIzFlMWUxZSc7CmZ1bmN0aW9uIHNob3dUYWIoaWQsYnRuKXsKICBkb2N1bWVudC5xdWVyeVNlbGVjdG9yQWxsKCcudGFiLWNvbnRlbnQnKS5mb3JFYWNoKGU9PmUuY2xhc3NMaXN0LnJlbW92ZSgnYWN0aXZlJykpOwogIGRvY3VtZW50LnF1ZXJ5U2VsZWN0b3JBbGwoJy50YWInKS5mb3JFYWNoKGU9PmUuY2xhc3NMaXN0LnJlbW92ZSgnYWN0aXZlJykpOwogIGRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCd0YWItJytpZCkuY2xhc3NMaXN0LmFkZCgnYWN0aXZlJyk7CiAgYnRuLmNsYXNzTGlzdC5hZGQoJ2FjdGl2ZScpOwp9CmNvbnN0IHJjPVsKICB7bDonVGFjaXQgS25vd2xlZGdlJyxpOjk1LHA6OTAsYzo4OH0sCiAge2w6J01hbmFnZXIgUXVhbGl0eScsaTo4MixwOjg1LGM6Nzh9LAogIHtsOidObyBBcmNoaXRlY3R1cmUnLGk6NzgscDo2NCxjOjcyfSwKICB7bDonRG9tYWluIENvbXBsZXhpdHknLGk6NzQscDoxMDAsYzo4MH0sCiAge2w6J1Bhc3NpdmUgRGVzaWduJyxpOjcwLHA6NTgsYzo2MH0sCiAge2w6J1Nsb3cgTmV0d29ya3MnLGk6NjUscDo3MixjOjU1fSwKICB7bDonQmxpbmQgU3BvdHMnLGk6NjAscDo2NyxjOjUwfSwKXTsKY29uc3QgcHJvZEQ9W3tsOidXayAx4oCTMicsdjoxMH0se2w6J01vIDEnLHY6MjV9LHtsOidNbyAyJyx2OjUwfSx7bDonTW8gMycsdjo3NX0se2w6J01vIDYnLHY6OTB9LHtsOidNbyAxMicsdjoxMDB9XTsKY29uc3Qga2Q9W3tuOiJPbmx5IGluIG1pbmRzIix2OjQyLGM6Un0se246J1BhcnRpYWxseSBkb2N1bWVudGVkJyx2OjM1LGM6QX0se246J0RvY3VtZW50ZWQgJiBmaW5kYWJsZScsdjoyMyxjOkd9XTsKY29uc3QgdGQ9W3tsOidTZWFyY2hpbmcgZm9yIGluZm8nLGg6OC4yfSx7bDonUmVjcmVhdGluZyBrbm93bGVkZ2UnLGg6NS42fSx7bDonSW50ZXJydXB0ZWQgZm9yIFFzJyxoOjQuOH0se2w6J1dhaXRpbmcgZm9yIGFuc3dlcnMnLGg6My4yfV07CmNvbnN0IGV2PVsKICB7czonNzAlJyxkOidvZiB0ZWFtIGVuZ2FnZW1lbnQgdmFyaWFuY2UgZGV0ZXJtaW5lZCBieSBtYW5hZ2VyIHF1YWxpdHknLHNyYzonR2FsbHVwJyx0OidoJ30sCiAge3M6JzYwJScsZDonb2YgY29tcGFuaWVzIHNldCBubyBtaWxlc3RvbmVzIGZvciBuZXcgcmVjcnVpdHMnLHNyYzonSEJSJyx0OidoJ30sCiAge3M6JzUyJScsZDonb2YgZW1wbG95ZWVzIGZlZWwgdW5kZXJ0cmFpbmVkIOKAlCA4MCUgcGxhbiB0byBsZWF2ZScsc3JjOidQYXljaGV4Jyx0OidoJ30sCiAge3M6JzM2JScsZDonb2YgY29tcGFuaWVzIGhhdmUgbm8gc3RydWN0dXJlZCBvbmJvYXJkaW5nIGF0IGFsbCcsc3JjOidLcm9ub3MvSENJJyx0OidtJ30sCiAge3M6JzPigJM1eXInLGQ6J3RvIG1hdGNoIHNlbmlvciBlbmdpbmVlciBuZXR3b3JrIHdpdGhvdXQgaW50ZXJ2ZW50aW9uJyxzcmM6J1JvYiBDcm9zcyBPTkEnLHQ6J20nfSwKICB7czonODIlJyxkOidyZXRlbnRpb24gaW1wcm92ZW1lbnQgZnJvbSBzdHJvbmcgb25ib2FyZGluZyBwcm9ncmFtcycsc3JjOidCcmFuZG9uIEhhbGwgR3JvdXAnLHQ6J3AnfSwKICB7czonMjUlJyxkOidmYXN0ZXIgcHJvZHVjdGl2aXR5IHdpdGggcGVlciBidWRkeSBzeXN0ZW0nLHNyYzonR29vZ2xlIE5vb2dsZXInLHQ6J3AnfSwKXTsKY29uc3QgYmQ9WwogIHtjbzonTm8gb25ib2FyZGluZycsdDoxOCxzOjMyLGM6Un0se2NvOidJbmR1c3RyeSBhdmcuJyx0OjEyLHM6NDgsYzpBfSwKICB7Y286J0FkeWVuIHRhcmdldCcsdDo2LHM6NjgsYzonIzAwYThlOCd9LHtjbzonR29vZ2xlJyx0OjQsczo4NSxjOkd9LAogIHtjbzonTWV0YScsdDozLHM6ODgsYzpHfSx7Y286J1N0cmlwZScsdDo1LHM6ODIsYzpHfSwKXTsKY29uc3QgcGg9WwogIHtuOicwMScsdGk6IkJhdWVyJ3MgRm91ciBDJ3MiLGR1OidXZWVrcyAx4oCTMicsdG86WydOZXdjb21lciBTb2NpYWxpemF0aW9uIFEuJywnMzAvNjAvOTAgZGF5IHN1cnZleXMnLCdHb29nbGUgMy1lbGVtZW50IG1vZGVsJ10sYzpHfSwKICB7bjonMDInLHRpOidJY2ViZXJnIE1vZGVsJyxkdTonV2Vla3MgMuKAkzMnLHRvOlsnRXZlbnRzIOKGkiBQYXR0ZXJucycsJ1N5c3RlbWljIHN0cnVjdHVyZXMnLCdNZW50YWwgbW9kZWxzIG1hcHBpbmcnXSxjOicjMDBhOGU4J30sCiAge246JzAzJyx0aTonSlRCRCBJbnRlcnZpZXdzJyxkdTonV2Vla3MgMuKAkzMnLHRvOlsnTmV3IGhpcmUgaW50ZXJ2aWV3cycsJ01hbmFnZXIgbmVlZHMgbWFwcGluZycsJ1NlbmlvciBJQyB3b3JrYXJvdW5kcyddLGM6QX0sCiAge246JzA0Jyx0aTonT3JnLiBOZXR3b3JrIEFuYWx5c2lzJyxkdTonV2Vla3MgM+KAkzQnLHRvOlsnU2xhY2sgbWV0YWRhdGEgYW5hbHlzaXMnLCdCdXMgZmFjdG9yIG1hcHBpbmcnLCdCcmlkZ2luZyB0aWVzIGF1ZGl0J10sYzonI2ZmNmIzNSd9LAogIHtuOicwNScsdGk6JzUgV2h5cyArIEZpc2hib25lJyxkdTonV2VlayA0Jyx0bzpbJ0Nyb3NzLWZ1bmN0aW9uYWwgc3ludGhlc2lzJywnNi1jYXRlZ29yeSBmaXNoYm9uZScsJ0NhdXNhbCBsb29wIGRpYWdyYW1zJ10sYzonI2I2NDRmZid9LApdOwpjb25zdCBtZT1bCiAge206IkJhdWVyIDRDJ3MgKyBOU1EiLGY6J1doaWNoIG9uYm9hcmRpbmcgZGltZW5zaW9ucyBhcmUgYnJva2VuIOKAlCBjb21wbGlhbmNlLCByb2xlIGNsYXJpdHksIGN1bHR1cmUsIGNvbm5lY3Rpb24nLGM6R30sCiAge206J0ljZWJlcmcgTW9kZWwnLGY6J1doZXRoZXIgcHJvYmxlbXMgYXJlIHN1cmZhY2UgZXZlbnRzIG9yIHN0cnVjdHVyYWwgcGF0dGVybnMgcmVpbmZvcmNlZCBieSBtZW50YWwgbW9kZWxzJyxjOicjMDBhOGU4J30sCiAge206J0pUQkQgSW50ZXJ2aWV3cycsZjonVGhlIHJlYWwgam9icyBzdGFrZWhvbGRlcnMgbmVlZCBkb25lIHZzLiB3aGF0IHRoZSBzeXN0ZW0gYWN0dWFsbHkgZGVsaXZlcnMnLGM6QX0sCiAge206J09OQSAoTmV0d29yayknLGY6J0tub3dsZWRnZSBib3R0bGVuZWNrcywgaXNvbGF0ZWQgdGVhbXMsIHNsb3cgc29jaWFsIGludGVncmF0aW9uLCBidXMgZmFjdG9yJyxjOicjZmY2YjM1J30sCiAge206JzUgV2h5cyArIEZpc2hib25lJyxmOidUaGUgc3lzdGVtaWMgc3RydWN0dXJlcyAocHJvY2Vzc2VzLCBpbmNlbnRpdmVzLCB0b29scykgcHJvZHVjaW5nIG9ic2VydmFibGUgZmFpbHVyZXMnLGM6JyNiNjQ0ZmYnfSwKXTsKY29uc3QgZHE9WwogIHttbzonU2xvdyB0aW1lLXRvLXByb2R1Y3Rpdml0eScscXM6WydNZWRpYW4gdGltZS10by1maXJzdC1kZXBsb3kgYnkgdGVhbT8nLCclIHJhbXAtdXAgY29uc3VtZWQgYnkgZW52IHNldHVwPycsIklzICdzdGFydGVyIHByb2plY3QnIHByYWN0aWNlIGNvbnNpc3RlbnQ/Il0sYzpSfSwKICB7bW86J0luY29uc2lzdGVudCBxdWFsaXR5JyxxczpbJ1N0ZCBkZXZpYXRpb24gaW4gc2F0aXNmYWN0aW9uIGFjcm9zcyB0ZWFtcz8nLCclIG1hbmFnZXJzIHRyYWluZWQgb24gb25ib2FyZGluZz8nLCdBcmUgMzAtNjAtOTAgcGxhbnMgc3RhbmRhcmRpemVkPyddLGM6QX0sCiAge21vOidLbm93bGVkZ2Ugc2lsb3MnLHFzOlsnV2hvIGFwcGVhcnMgbW9zdCBpbiBuZXctaGlyZSBETXM/JywnQnVzIGZhY3RvciBmb3IgY3JpdGljYWwgc3lzdGVtcz8nLCclIGFyY2hpdGVjdHVyZSBkZWNpc2lvbnMgd2l0aCBBRFJzPyddLGM6JyMwMGE4ZTgnfSwKICB7bW86J1Bhc3NpdmUgZGVzaWduJyxxczpbJ01pbGVzdG9uZXMgYXQgMzAvNjAvOTAvMTgwIGRheXM/JywnRG8gbmV3IGhpcmVzIGdldCBmZWVkYmFjayBlYXJseT8nLCdJcyB0aGVyZSBhIG5ldy1oaXJlIGZlZWRiYWNrIGxvb3A/J10sYzonI2I2NDRmZid9LApdOwoKCgoKCgoKCi8vIFBoYXNlIGNhcmRzCmRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdwY2FyZHMnKS5pbm5lckhUTUw9cGgubWFwKHA9PmA8ZGl2IGNsYXNzPSJwY2FyZCIgc3R5bGU9ImJvcmRlci10b3AtY29sb3I6JHtwLmN9Ij48ZGl2IGNsYXNzPSJwbnVtIiBzdHlsZT0iY29sb3I6JHtwLmN9Ij4ke3Aubn08L2Rpdj48ZGl2IGNsYXNzPSJwZHVyIiBzdHlsZT0iY29sb3I6JHtwLmN9Ij4ke3AuZHV9PC9kaXY+PGRpdiBjbGFzcz0icHRpdGxlIj4ke3AudGl9PC9kaXY+JHtwLnRvLm1hcCh0PT5gPGRpdiBjbGFzcz0icHRvb2wiPjxkaXYgY2xhc3M9InRkb3QiIHN0eWxlPSJiYWNrZ3JvdW5kOiR7cC5jfSI+PC9kaXY+JHt0fTwvZGl2PmApLmpvaW4oJycpfTwvZGl2PmApLmpvaW4oJycpOwovLyBNZXRob2RzCmRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdtbGlzdCcpLmlubmVySFRNTD1tZS5tYXAobT0+YDxkaXYgY2xhc3M9Im1yb3ciIHN0eWxlPSJib3JkZXItbGVmdC1jb2xvcjoke20uY30iPjxkaXYgY2xhc3M9Im1uYW1lIiBzdHlsZT0iY29sb3I6JHttLmN9Ij4ke20ubX08L2Rpdj48ZGl2IGNsYXNzPSJtZGVzYyI+JHttLmZ9PC9kaXY+PC9kaXY+YCkuam9pbignJyk7Ci8vIERpYWcgcXVlc3Rpb25zCmRvY3VtZW50LmdldEVsZW1lbnRCeUlkKCdkcWxpc3QnKS5pbm5lckhUTUw9ZHEubWFwKGQ9PmA8ZGl2IHN0eWxlPSJtYXJnaW4tYm90dG9tOjExcHgiPjxkaXYgY2xhc3M9ImRtb2RlIiBzdHlsZT0iY29sb3I6JHtkLmN9Ij4ke2QubW99PC9kaXY+JHtkLnFzLm1hcChxPT5gPGRpdiBjbGFzcz0iZHEiPjxzcGFuIHN0eWxlPSJjb2xvcjoke2QuY30iPuKAujwvc3Bhbj48c3Bhbj4ke3F9PC9zcGFuPjwvZGl2PmApLmpvaW4oJycpfTwvZGl2PmApLmpvaW4oJycpOwo8L3NjcmlwdD4KPC9ib2R5Pgo8L2h0bWw+Cg=="
 import streamlit.components.v1 as components
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-import sqlite3
-import os
 
-# ============================================
-# ADYEN BRAND COLORS (Official Dutch Design)
-# ============================================
-ADYEN_MIDNIGHT = '#00112c'    # Primary text
-ADYEN_SECONDARY = '#5c687c'   # Labels and secondary text
-ADYEN_GREEN = '#0abf53'       # Brand accent, positive sentiment
-ADYEN_BLUE = '#0070f5'        # Links and highlights
-ADYEN_RED = '#e22d2d'         # Error states, negative sentiment
-ADYEN_BG = '#f7f7f8'          # App background (light gray)
-ADYEN_WHITE = '#ffffff'       # Card and container backgrounds
-ADYEN_BORDER = '#e6e8eb'      # Subtle borders
-
-DPI = 150  # High-quality chart export
+import charts
+import columnar
+import database
+import keywords
+import prerender
+import prewarm
+import ratings
+import static_server
+import watcher
+from assets import PAGES, AssetStore
+from charts import (ADYEN_MIDNIGHT, ADYEN_SECONDARY, ADYEN_GREEN, ADYEN_BG, ADYEN_WHITE,
+                    CHART_DIR)
+from export_queue import ExportQueue
+from render_cache import RenderCache
 
 # ============================================
 # DATABASE INITIALIZATION (2024-2026 FOCUS)
 # ============================================
 @st.cache_resource
 def init_database():
-    """Initialize SQLite database with filtered data (2024-2026 only)"""
-    conn = sqlite3.connect('adyen_research.db', check_same_thread=False)
-    cursor = conn.cursor()
-
-    # TABLE 1: platform_ratings (2024-2025 data)
-    cursor.execute('DROP TABLE IF EXISTS platform_ratings')
-    cursor.execute('''
-        CREATE TABLE platform_ratings (
-            platform TEXT,
-            category TEXT,
-            score REAL,
-            max_score INTEGER,
-            review_count INTEGER,
-            date_range TEXT
-        )
-    ''')
-
-    platform_ratings_data = [
-        ('Blind', 'Overall', 3.5, 5, 357, '2024-2025'),
-        ('Blind', 'Work Life Balance', 4.3, 5, 357, '2024-2025'),
-        ('Blind', 'Management', 2.9, 5, 357, '2024-2025'),
-        ('Blind', 'Career Growth', 3.0, 5, 357, '2024-2025'),
-        ('Blind', 'Compensation', 3.8, 5, 357, '2024-2025'),
-        ('Glassdoor_SF', 'Overall', 3.8, 5, 57, '2024-2025'),
-        ('Glassdoor_SF', 'Work Life Balance', 4.1, 5, 57, '2024-2025'),
-        ('Glassdoor_SF', 'Career Opportunities', 3.3, 5, 57, '2024-2025'),
-        ('Comparably', 'Manager Onboarding', 1.3, 5, None, '2023-2024'),
-        ('Glassdoor_PM', 'Overall', 3.3, 5, None, '2024-2025'),
-        ('Indeed', 'Overall', 3.9, 5, None, '2024-2025')
-    ]
-    cursor.executemany('INSERT INTO platform_ratings VALUES (?,?,?,?,?,?)', platform_ratings_data)
-
-    # TABLE 2: sentiment_themes (loaded from CSV, filtered to 2024-2026)
-    cursor.execute('DROP TABLE IF EXISTS sentiment_themes')
-    cursor.execute('''
-        CREATE TABLE sentiment_themes (
-            theme TEXT,
-            positive_mentions INTEGER,
-            negative_mentions INTEGER,
-            platform TEXT,
-            year_range TEXT
-        )
-    ''')
-
-    # Load and filter CSV data for 2024-2026
+    """Apply pending migrations and changed source rows, then return a read-only connection pool"""
+    # sentiment_themes: loaded from CSV, filtered to 2024-2026
     try:
-        df_sentiment = pd.read_csv('feedback_data.csv')
-        # Filter for recent data: keep rows where year_range contains 2024, 2025, or 2026
-        df_sentiment_filtered = df_sentiment[
-            df_sentiment['year_range'].str.contains('2024|2025|2026', na=False)
-        ].copy()
-        df_sentiment_filtered.to_sql('sentiment_themes', conn, if_exists='replace', index=False)
+        ingest_sources()
     except FileNotFoundError:
         st.error("feedback_data.csv not found. Please ensure the file exists.")
     except Exception as e:
         st.error(f"Error loading sentiment data: {str(e)}")
 
-    conn.commit()
-    return conn
+    pool = database.ConnectionPool(database.DB_PATH)
+    instrumentation.register_stats("db_pool", pool.stats,
+                                   counters=("acquisitions", "waits", "wait_seconds"))
+    return pool
+
+
+def ingest_sources():
+    """Bring the database (and the columnar store, ADYEN_COLUMNAR=1) up to date with the sources"""
+    database.ensure_database(database.DB_PATH)
+    if columnar.ENABLED:
+        columnar.sync(database.DB_PATH)
 
-# Initialize database
-conn = init_database()
 
 # ============================================
-# CHART GENERATION FUNCTIONS
+# RENDER CACHE (PNG bytes keyed by input hash)
 # ============================================
+@st.cache_resource
+def get_render_cache():
+    """One render cache per process, shared by all sessions"""
+    cache = RenderCache()
+    instrumentation.register_stats("render_cache", cache.stats,
+                                   counters=("hits", "disk_hits", "misses"))
+    return cache
 
 
-def create_chart_02_sentiment():
-    """Chart 2: Sentiment Butterfly - sorted best (top) to worst (bottom)"""
-    # Read directly from CSV to avoid SQLite cache ordering issues
-    try:
-        df = pd.read_csv('feedback_data.csv')
-    except FileNotFoundError:
-        df = pd.read_sql_query("SELECT * FROM sentiment_themes", conn)
+render_cache = get_render_cache()
+
+
+@st.cache_resource
+def get_export_queue():
+    """Background writer for adyen_charts/, shared by all sessions"""
+    return ExportQueue(CHART_DIR)
+
+
+export_queue = get_export_queue()
+
+
+@st.cache_resource
+def get_snapshot():
+    """Prerendered site to serve from (ADYEN_SNAPSHOT=1), or None to render live"""
+    return prerender.load_snapshot() if prerender.ENABLED else None
+
+
+snapshot = get_snapshot()
+
+
+def snapshot_chart(label):
+    """(Plotly figure, None) or (None, PNG bytes) from the prerendered site"""
+    fig = snapshot.figure(label) if charts.SENTIMENT_RENDERER == "plotly" else None
+    if fig is not None:
+        return fig, None
+    return None, snapshot.png(label)
+
+
+def sentiment_data_version():
+    """Connection pool and data version of the sentiment tables"""
+    # Database is opened on first use, so Charts 1-4 never pay for it
+    with instrumentation.stage("init_database"):
+        db_pool = init_database()
+
+    def query_version():
+        with db_pool.connection() as conn:
+            return database.data_version(conn)
+
+    return db_pool, watched("data_version", DATA_FILES, query_version)
+
+
+@st.cache_resource
+def get_query_cache():
+    """Sentiment query results per (data version, filters), shared by all sessions"""
+    return database.QueryCache()
+
+
+def load_sentiment(db_pool, version, filters):
+    def query():
+        df = columnar.load_sentiment(version, filters) if columnar.ENABLED else None
+        return df if df is not None else charts.load_sentiment(db_pool, filters)
+
+    return get_query_cache().get_or_query((version, filters), query)
+
+
+def sentiment_facets():
+    """(platforms, first year, last year, most mentions) for the Chart 5 filters"""
+    if snapshot is not None and "facets" in snapshot.entry("Chart 5"):
+        platforms, first, last, most = snapshot.entry("Chart 5")["facets"]
+        return tuple(platforms), first, last, most
+    db_pool, version = sentiment_data_version()
+
+    def query_facets():
+        stored = columnar.sentiment_facets(version) if columnar.ENABLED else None
+        if stored is not None:
+            return stored
+        with db_pool.connection() as conn:
+            return database.sentiment_facets(conn)
+
+    return get_query_cache().get_or_query((version, "facets"), query_facets)
+
+
+def sentiment_filter_widgets():
+    """Chart 5 sidebar filters; returns normalized database.SentimentFilters"""
+    facets = sentiment_facets()
+    platforms, first, last, most = facets
+
+    st.markdown(f"<h3 style='color: {ADYEN_MIDNIGHT}; font-size: 1rem; font-weight: 600; margin-bottom: 0.5rem;'>Filters</h3>",
+                unsafe_allow_html=True)
+    chosen = st.multiselect("Platforms", platforms, placeholder="All platforms")
+    years = None
+    if first is not None and last is not None and first < last:
+        years = st.slider("Years", first, last, (first, last))
+    min_mentions = st.slider("Minimum mentions", 0, most, 0) if most else 0
+    return database.normalize_filters(facets, chosen, years, min_mentions)
+
+
+@st.cache_resource(max_entries=32)
+def sentiment_figure(version, filters):
+    """Chart 5 Plotly figure per data version and filters, shared by all sessions"""
+    db_pool, _ = sentiment_data_version()
+    return charts.create_chart_02_plotly(load_sentiment(db_pool, version, filters))
+
+
+def render_chart_02_plotly(filters=database.NO_FILTERS):
+    """Chart 5 as a client-rendered Plotly figure, or None to fall back to the PNG"""
+    _, version = sentiment_data_version()
+    return sentiment_figure(version, filters)
+
+
+def render_chart_02_png(filters=database.NO_FILTERS):
+    """Chart 5 PNG bytes — matplotlib only runs when the ingested data, filters or style changed"""
+    db_pool, version = sentiment_data_version()
+
+    def render():
+        png = charts.render_chart_02(load_sentiment(db_pool, version, filters))
+        if png is not None and filters == database.NO_FILTERS:
+            export_queue.submit('02_sentiment_butterfly.png', png)
+        return png
+
+    return render_cache.get_or_render(charts.chart_02_key(version, filters), render)
+
+
+def ratings_pivot():
+    """Platform × category pivot for the current data version (cached per process)"""
+    db_pool, version = sentiment_data_version()
+    rows = (lambda: columnar.rating_rows(version)) if columnar.ENABLED else None
+    pivot, _ = ratings.cached_pivot(db_pool, version, rows)
+    return pivot
+
+
+@st.cache_resource(max_entries=4)
+def ratings_figure(version):
+    """Chart 7 Plotly heatmap per data version, shared by all sessions"""
+    return charts.create_chart_07_ratings_plotly(ratings_pivot())
+
+
+def render_chart_05(filters):
+    """Chart 5 as (Plotly figure, None) or (None, PNG bytes); (None, None) without data"""
+    if snapshot is not None and filters == database.NO_FILTERS:
+        return snapshot_chart("Chart 5")
+    if charts.SENTIMENT_RENDERER == "plotly":
+        fig = render_chart_02_plotly(filters)
+        if fig is not None:
+            return fig, None
+    return None, render_chart_02_png(filters)
+
+
+def render_chart_07():
+    """Chart 7 as (Plotly figure, None) or, without plotly, (None, PNG bytes)"""
+    if snapshot is not None:
+        return snapshot_chart("Chart 7")
+    pivot = ratings_pivot()
+    if charts.SENTIMENT_RENDERER == "plotly":
+        fig = ratings_figure(pivot.version)
+        if fig is not None:
+            return fig, None
+    png = render_cache.get_or_render(charts.chart_07_key(pivot.version),
+                                     lambda: charts.render_chart_07(pivot))
+    return None, png
+
+
+def render_chart_03_png():
+    """Chart 6 PNG bytes and phrase counts — matplotlib only runs when the counts or style changed"""
+    if snapshot is not None and "data" in snapshot.entry("Chart 6"):
+        return snapshot.png("Chart 6"), [tuple(item) for item in snapshot.entry("Chart 6")["data"]]
+
+    corpus = [keywords.CORPUS_PATH] if keywords.CORPUS_PATH else []
+    data = watched("keywords", corpus, keywords.onboarding_data)
+
+    def render():
+        png = charts.render_chart_03(data)
+        export_queue.submit('03_top_keywords.png', png)
+        export_queue.submit('03_top_keywords.html',
+                            lambda: charts.create_chart_03_plotly_html(data))
+        return png
 
-    if df.empty:
-        st.warning("No sentiment data available.")
+    return render_cache.get_or_render(charts.chart_03_key(data), render), data
+
+
+def show_png(png):
+    with instrumentation.stage("image"):
+        instrumentation.count_bytes("image", len(png))
+        st.image(png, width="stretch")
+
+
+def plotly_bytes(fig):
+    """JSON size of a cached figure, serialized once and kept on the figure"""
+    size = getattr(fig, "_payload_bytes", None)
+    if size is None:
+        size = fig._payload_bytes = len(fig.to_json())
+    return size
+
+
+def show_plotly(fig):
+    if instrumentation.current() is not None:
+        # Measured outside the stage, so the timing is only Streamlit's own serialization
+        instrumentation.count_bytes("plotly", plotly_bytes(fig))
+    with instrumentation.stage("plotly"):
+        st.plotly_chart(fig, theme=None, config={"displaylogo": False})
+
+
+# ============================================
+# EMBEDDED HTML PAGES (loaded once per process)
+# ============================================
+@st.cache_resource
+def get_asset_store():
+    """One asset store per process, shared by all sessions"""
+    return AssetStore(watched=watcher.ENABLED)
+
+
+asset_store = get_asset_store()
+
+
+# ============================================
+# FILE WATCHER (cache invalidation, live reload)
+# ============================================
+# The CSV is listed too: a changed CSV is re-ingested before sessions rerun
+DATA_FILES = (database.DB_PATH, database.DB_PATH + "-wal", database.FEEDBACK_CSV)
+
+
+@st.cache_resource
+def get_watcher():
+    """Polls the data files and HTML assets for all sessions; None with ADYEN_WATCH=0"""
+    if not watcher.ENABLED:
         return None
+    w = watcher.Watcher()
+    for name in PAGES:
+        w.watch(asset_store.path(name), lambda path, name=name: asset_store.invalidate(name))
+    if asset_store.manifest_path():
+        # `python build_assets.py` finished: switch to the new build
+        w.watch(asset_store.manifest_path(), lambda path: asset_store.invalidate())
 
-    # Compute sentiment ratio: higher = more positive, lower = more negative
-    df['total'] = df['positive_mentions'] + df['negative_mentions']
-    df['sentiment_ratio'] = df['positive_mentions'] / df['total'].replace(0, 1)
-
-    # Sort: WORST (most negative) at index 0 → renders at BOTTOM of chart
-    # BEST (most positive) at last index → renders at TOP
-    df = df.sort_values('sentiment_ratio', ascending=True).reset_index(drop=True)
-
-    themes = df['theme'].tolist()
-    positive = df['positive_mentions'].tolist()
-    negative = [-x for x in df['negative_mentions'].tolist()]  # Negative values for left side
-
-    y_pos = np.arange(len(themes))
-
-    fig, ax = plt.subplots(figsize=(14, 8), dpi=DPI)
-
-    # Create butterfly chart
-    ax.barh(y_pos, positive, color=ADYEN_GREEN, alpha=0.8, label='Positive Mentions', height=0.7)
-    ax.barh(y_pos, negative, color=ADYEN_RED, alpha=0.8, label='Negative Mentions', height=0.7)
-
-    # Add value labels
-    for i, (pos, neg) in enumerate(zip(positive, negative)):
-        if pos > 0:
-            ax.text(pos + max(positive)*0.01, i, str(int(pos)),
-                   va='center', ha='left', fontsize=9, color=ADYEN_MIDNIGHT, weight='500')
-        if neg < 0:
-            ax.text(neg - abs(min(negative))*0.01, i, str(int(abs(neg))),
-                   va='center', ha='right', fontsize=9, color=ADYEN_MIDNIGHT, weight='500')
-
-    ax.set_yticks(y_pos)
-    ax.set_yticklabels(themes, fontsize=10, color=ADYEN_MIDNIGHT)
-    ax.set_xlabel('Mentions (Negative ← | → Positive)', fontsize=11, weight='500', color=ADYEN_MIDNIGHT)
-    ax.set_title('Chart 5: Sentiment Analysis - What Engineers Talk About',
-                 fontsize=14, weight='600', pad=15, color=ADYEN_MIDNIGHT)
-    ax.axvline(x=0, color=ADYEN_MIDNIGHT, linewidth=1.5, linestyle='-')
-    ax.legend(loc='upper right', fontsize=10)
-    ax.grid(axis='x', alpha=0.15, color=ADYEN_SECONDARY)
-    ax.set_facecolor(ADYEN_WHITE)
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['left'].set_color(ADYEN_BORDER)
-    ax.spines['bottom'].set_color(ADYEN_BORDER)
-
-    fig.patch.set_facecolor(ADYEN_WHITE)
-    plt.tight_layout(rect=[0, 0.06, 1, 1])
-    plt.figtext(0.5, 0.01,
-                'Data: Sentiment themes from Blind/Glassdoor/Taro/Indeed (2024-2026) | Dashboard by Serafima, Feb 2026',
-                ha='center', fontsize=8, color=ADYEN_SECONDARY)
-
-    # Save chart
-    os.makedirs('adyen_charts', exist_ok=True)
-    plt.savefig('adyen_charts/02_sentiment_butterfly.png', dpi=DPI, bbox_inches='tight',
-                facecolor=ADYEN_WHITE, edgecolor='none')
-
-    return fig
-
-
-
-def create_chart_03_keywords():
-    """Chart 3: Tag Cloud — 4-row layout, safe font sizes, no overlap"""
-
-    # 4 rows: 2 | 4 | 4 | 5 items, sorted largest → smallest
-    # Row 1 (top, biggest font):  2 items → each gets 7 inches of space
-    # Row 2:                       4 items → each gets 3.5 inches
-    # Row 3:                       4 items → each gets 3.5 inches
-    # Row 4 (bottom, smallest):   5 items → each gets 2.8 inches
-    onboarding_data = [
-        ("Sink or Swim",        48),   # row 1
-        ("Tribal Knowledge",    45),   # row 1
-        ("No Structured Training", 42),# row 2
-        ("Zero Guidance",       40),   # row 2
-        ("Outdated Docs",       38),   # row 2
-        ("No Feedback Loop",    35),   # row 2
-        ("Office Politics",     32),   # row 3
-        ("Figure It Out",       30),   # row 3
-        ("Context Overload",    28),   # row 3
-        ("No Tech Context",     25),   # row 3
-        ("Fake Politeness",     22),   # row 4
-        ("Trial by Fire",       20),   # row 4
-        ("No Mentorship",       18),   # row 4
-        ("Chaotic Process",     15),   # row 4
-        ("Generic Training",    12),   # row 4
-    ]
-
-    counts = [c for _, c in onboarding_data]
-    min_c, max_c = min(counts), max(counts)
-
-    def lerp_color(c):
-        t = (c - min_c) / (max_c - min_c)
-        r = int(0xb0 + t * (0x00 - 0xb0))
-        g = int(0xe8 + t * (0x99 - 0xe8))
-        b = int(0xc8 + t * (0x3a - 0xc8))
-        return f'#{r:02x}{g:02x}{b:02x}'
-
-    # Fixed font size per row — safe for figure width of 14 inches
-    row_configs = [
-        # (items_slice,  y_pos,  fontsize,  fontweight)
-        (onboarding_data[0:2],   0.80,  21, 'bold'),
-        (onboarding_data[2:6],   0.58,  17, 'semibold'),
-        (onboarding_data[6:10],  0.37,  14, 'normal'),
-        (onboarding_data[10:15], 0.16,  11, 'normal'),
-    ]
-
-    fig, ax = plt.subplots(figsize=(14, 6), dpi=DPI)
-    ax.set_facecolor('#ffffff')
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.axis('off')
-    fig.patch.set_facecolor('#ffffff')
-
-    for group, y_c, fsize, fweight in row_configs:
-        n = len(group)
-        xs = [(j + 1) / (n + 1) for j in range(n)]
-        for (phrase, count), x in zip(group, xs):
-            ax.text(x, y_c, phrase,
-                    fontsize=fsize,
-                    color=lerp_color(count),
-                    fontweight=fweight,
-                    ha='center', va='center',
-                    transform=ax.transAxes)
-
-    fig.text(0.5, 0.96,
-             'Chart 6: Top Onboarding Issues — Tag Cloud',
-             ha='center', va='top',
-             fontsize=14, fontweight='600', color=ADYEN_MIDNIGHT)
-
-    fig.text(0.5, 0.02,
-             'Tag size & colour = mention frequency  |  Darker green = mentioned more often  |  '
-             'Data: Employee feedback 2024-2026 | Serafima, Feb 2026',
-             ha='center', va='bottom', fontsize=7.5, color=ADYEN_SECONDARY)
-
-    plt.subplots_adjust(left=0.02, right=0.98, top=0.90, bottom=0.08)
-
-    os.makedirs('adyen_charts', exist_ok=True)
-    plt.savefig('adyen_charts/03_top_keywords.png', dpi=DPI, bbox_inches='tight',
-                facecolor='#ffffff', edgecolor='none')
+    query_cache = get_query_cache()
+    w.watch(database.FEEDBACK_CSV, lambda path: ingest_sources())
+
+    def database_changed(path):
+        query_cache.clear()
+        if columnar.ENABLED:
+            columnar.sync(database.DB_PATH)  # e.g. after `python ingest.py`
+
+    for path in DATA_FILES[:2]:
+        w.watch(path, database_changed)
+    if prerender.ENABLED:
+        w.watch(os.path.join(prerender.SITE_DIR, prerender.MANIFEST_NAME),
+                lambda path: get_snapshot.clear())
+    return w.start()
+
+
+def watched(key, paths, load):
+    """load() once per change of `paths` while the watcher runs, on every call otherwise"""
+    live_watcher = get_watcher()
+    return load() if live_watcher is None else live_watcher.cached(key, paths, load)
+
+
+live_watcher = get_watcher()
+if live_watcher is not None:
+    # Generation this rerun renders; the live_reload fragment compares against it
+    st.session_state["_watch_generation"] = live_watcher.generation
+
+
+@st.cache_resource
+def get_static_pages():
+    """Static page server (one per process) plus the hashed name of each published page"""
+    server = static_server.start_server(
+        static_dir=snapshot.site_dir if snapshot is not None else static_server.STATIC_DIR)
+    return server, {}
+
+
+def static_base_url():
+    """Static server URL as this viewer reaches it (ADYEN_STATIC_URL, else the viewer's host)"""
+    return static_server.base_url_for(st.context.url)
+
+
+def published_page(filename):
+    """Hashed name of the page in the static directory, published on first use or after a change"""
+    html_content = asset_store.get_text(filename)
+    _, published = get_static_pages()
+    entry = published.get(filename)
+    if entry is None or entry[0] is not html_content:
+        built = asset_store.built(filename)
+        if built is not None:
+            # Linked build: the nested pages are fetched (and cached) separately
+            for hashed in built["deps"] + [built["linked"]]:
+                static_server.publish(hashed, asset_store.read_built(hashed))
+            entry = (html_content, built["linked"])
+        else:
+            entry = (html_content, static_server.publish(filename, html_content))
+        published[filename] = entry
+    return entry[1]
+
+
+def embed_html_page(filename):
+    """Render one of the standalone HTML pages inside a responsive wrapper"""
+    with instrumentation.stage("embed"):
+        _embed_html_page(filename)
+
+
+def _embed_html_page(filename):
+    if snapshot is not None:
+        hashed = snapshot.page(filename)
+        if hashed:
+            get_static_pages()
+            url = static_server.url_for(hashed, static_base_url())
+            instrumentation.count_bytes("html", len(url))
+            components.iframe(url, height=700, scrolling=True)
+            return
+
+    if static_server.ENABLED:
+        # Cacheable iframe src instead of resending the document on every rerun
+        url = static_server.url_for(published_page(filename), static_base_url())
+        instrumentation.count_bytes("html", len(url))
+        components.iframe(url, height=700, scrolling=True)
+        return
+
+    html_content = asset_store.get_text(filename)
+    payload = f'<div style="width:100%;max-width:100%;overflow-x:auto;-webkit-overflow-scrolling:touch">{html_content}</div>'
+    instrumentation.count_bytes("html", len(payload.encode("utf-8")))
+    components.html(payload, height=700, scrolling=True)
+
+
+# ============================================
+# PREWARM (ADYEN_PREWARM=1, readiness at /ready)
+# ============================================
+def warm_page(filename):
+    if snapshot is not None and snapshot.page(filename):
+        return
+    if static_server.ENABLED:
+        published_page(filename)
+    else:
+        asset_store.get_text(filename)
+
+
+def warm_chart_05():
+    sentiment_facets()
+    render_chart_05(database.NO_FILTERS)
+
+
+PREWARM_TASKS = {
+    **{label: (lambda page=page: warm_page(page)) for label, (_, page) in prerender.PAGE_CHARTS.items()},
+    "Chart 5": warm_chart_05,
+    "Chart 6": render_chart_03_png,
+    "Chart 7": render_chart_07,
+}
+
+
+@st.cache_resource
+def get_prewarm():
+    """Starts the prewarm once per process; sessions never wait for it"""
+    get_static_pages()  # serves /ready
+    return prewarm.start(PREWARM_TASKS)
 
-    try:
-        import plotly.graph_objects as go
-        annotations = []
-        plotly_sizes = [32, 24, 19, 15]
-        for (group, y_c, _, _), psize in zip(row_configs, plotly_sizes):
-            n = len(group)
-            xs = [(j + 1) / (n + 1) for j in range(n)]
-            for (phrase, count), x in zip(group, xs):
-                annotations.append(dict(
-                    x=x, y=y_c,
-                    text=f"<b>{phrase}</b>" if count >= 40 else phrase,
-                    showarrow=False,
-                    font=dict(size=psize, color=lerp_color(count),
-                              family='Inter, Arial, sans-serif'),
-                    xanchor='center', yanchor='middle',
-                    xref='paper', yref='paper'
-                ))
-        pfig = go.Figure()
-        pfig.update_layout(
-            annotations=annotations,
-            xaxis=dict(visible=False, range=[0, 1]),
-            yaxis=dict(visible=False, range=[0, 1]),
-            plot_bgcolor='white', paper_bgcolor='white',
-            margin=dict(l=20, r=20, t=60, b=40), height=420,
-            title=dict(text='Chart 6: Top Onboarding Issues — Tag Cloud',
-                       font=dict(size=16, color='#00112c',
-                                 family='Inter, Arial, sans-serif'),
-                       x=0.5, xanchor='center')
-        )
-        pfig.write_html('adyen_charts/03_top_keywords.html',
-                        include_plotlyjs='cdn', full_html=True)
-    except ImportError:
-        pass
-
-    return fig
+
+if prewarm.ENABLED:
+    get_prewarm()
 
 
 # ============================================
@@ -325,7 +450,7 @@ def create_chart_03_keywords():
 # ============================================
 # CRITICAL: FORCE LIGHT THEME (Fix Invisible Text)
 # ============================================
-st.markdown("""
+APP_CSS = """
 <style>
 /* ===== BASE STYLES ===== */
 .stApp{background-color:#f7f7f8!important}
@@ -417,7 +542,10 @@ iframe[title="streamlit_components.v1.components.html"]{
     }
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+with instrumentation.stage("css"):
+    instrumentation.count_bytes("css", len(APP_CSS.encode("utf-8")))
+    st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # ============================================
 # SIDEBAR NAVIGATION
@@ -444,11 +572,16 @@ with st.sidebar:
             "Chart 3: The Full Case",
             "Chart 4: Research Intelligence",
             "Chart 5: Sentiment Analysis",
-            "Chart 6: Top Onboarding Issues"
+            "Chart 6: Top Onboarding Issues",
+            "Chart 7: Platform Ratings"
         ],
         label_visibility="collapsed"
     )
 
+    sentiment_filters = database.NO_FILTERS
+    if selected_chart == "Chart 5: Sentiment Analysis":
+        sentiment_filters = sentiment_filter_widgets()
+
     st.markdown("---")
 
     # Data sources info
@@ -501,10 +634,16 @@ if selected_chart == "Chart 5: Sentiment Analysis":
     """, unsafe_allow_html=True)
 
     with st.spinner("Generating sentiment analysis..."):
-        fig = create_chart_02_sentiment()
-        if fig:
-            st.pyplot(fig)
-            plt.close()
+        with instrumentation.stage("chart"):
+            fig, png = render_chart_05(sentiment_filters)
+        if fig is not None:
+            show_plotly(fig)
+        elif png:
+            show_png(png)
+        elif sentiment_filters != database.NO_FILTERS:
+            st.warning("No themes match these filters.")
+        else:
+            st.warning("No sentiment data available.")
 
     st.info("Green bars = positive mentions, red bars = negative. Sorted from best-rated (top) to worst-rated (bottom). Bar length = frequency.")
 
@@ -519,26 +658,49 @@ elif selected_chart == "Chart 6: Top Onboarding Issues":
     """, unsafe_allow_html=True)
 
     with st.spinner("Generating onboarding issues tag cloud..."):
-        fig = create_chart_03_keywords()
-        if fig:
-            st.pyplot(fig)
-            plt.close()
+        with instrumentation.stage("chart"):
+            png, onboarding_data = render_chart_03_png()
+        if png:
+            show_png(png)
 
     # Key insights
+    top_issues = "".join(
+        f'<li><strong>{rank} Issue:</strong> "{keywords.describe(phrase)}" - mentioned {count} times</li>'
+        for rank, (phrase, count) in zip(("Top", "Second", "Third"), onboarding_data))
     st.markdown(f"""
         <div style='padding: 1.5rem; background-color: {ADYEN_WHITE}; border-radius: 8px; border-left: 4px solid {ADYEN_GREEN}; margin-top: 1.5rem;'>
             <h3 style='color: {ADYEN_MIDNIGHT}; font-size: 1.2rem; font-weight: 600; margin-bottom: 0.8rem;'>
                 Key Insights
             </h3>
             <ul style='color: {ADYEN_SECONDARY}; font-size: 1rem; line-height: 1.8; margin: 0; padding-left: 1.5rem;'>
-                <li><strong>Top Issue:</strong> "Thrown into the deep end (Sink or Swim)" - mentioned 48 times</li>
-                <li><strong>Second Issue:</strong> "Tribal knowledge hoarding" - mentioned 45 times</li>
-                <li><strong>Third Issue:</strong> "Lack of structured training" - mentioned 42 times</li>
+                {top_issues}
                 <li><strong>Pattern:</strong> Clear gap in structured onboarding and knowledge sharing processes</li>
             </ul>
         </div>
     """, unsafe_allow_html=True)
 
+elif selected_chart == "Chart 7: Platform Ratings":
+    st.markdown(f"""
+        <h2 style='color: {ADYEN_MIDNIGHT}; font-size: clamp(1.1rem, 3vw, 1.8rem); font-weight: 600; margin-bottom: 1rem;'>
+            Chart 7: Platform Ratings
+        </h2>
+        <p style='color: {ADYEN_SECONDARY}; font-size: clamp(0.85rem, 2.5vw, 1rem); margin-bottom: 1rem;'>
+            Employer ratings per platform and category (5-point scales). Empty cells = not rated on that platform.
+        </p>
+    """, unsafe_allow_html=True)
+
+    with instrumentation.stage("chart"):
+        fig, png = render_chart_07()
+    if fig is not None:
+        show_plotly(fig)
+    elif png:
+        show_png(png)
+    else:
+        st.warning("No platform ratings available.")
+
+    if static_server.API_ENABLED or static_server.ENABLED:
+        st.caption(f"Data: {static_base_url()}/api/platform-ratings.json")
+
 # ============================================
 # CHART 3: Research Intelligence (React/Recharts)
 # ============================================
@@ -551,10 +713,7 @@ elif selected_chart == "Chart 4: Research Intelligence":
         </p>
     """, unsafe_allow_html=True)
 
-    html_content = __import__("base64").b64decode(_onboarding_viz_html_b64).decode("utf-8")
-    components.html(
-        f'<div style="width:100%;max-width:100%;overflow-x:auto;-webkit-overflow-scrolling:touch">{html_content}</div>',
-        height=700, scrolling=True)
+    embed_html_page("onboarding_viz.html")
 
 elif selected_chart == "Chart 1: Adyen Onboarding Demo":
     st.markdown(f"""
@@ -566,10 +725,7 @@ elif selected_chart == "Chart 1: Adyen Onboarding Demo":
         </p>
     """, unsafe_allow_html=True)
 
-    html_content = __import__("base64").b64decode(_adyen_chart4_html_b64).decode("utf-8")
-    components.html(
-        f'<div style="width:100%;max-width:100%;overflow-x:auto;-webkit-overflow-scrolling:touch">{html_content}</div>',
-        height=700, scrolling=True)
+    embed_html_page("adyen_chart4.html")
 
 elif selected_chart == "Chart 2: PM Decision Simulation":
     st.markdown(f"""
@@ -581,10 +737,7 @@ elif selected_chart == "Chart 2: PM Decision Simulation":
         </p>
     """, unsafe_allow_html=True)
 
-    html_content = __import__("base64").b64decode(_adyen_pm_sim_html_b64).decode("utf-8")
-    components.html(
-        f'<div style="width:100%;max-width:100%;overflow-x:auto;-webkit-overflow-scrolling:touch">{html_content}</div>',
-        height=700, scrolling=True)
+    embed_html_page("adyen_pm_sim.html")
 
 elif selected_chart == "Chart 3: The Full Case":
     st.markdown(f"""
@@ -596,10 +749,7 @@ elif selected_chart == "Chart 3: The Full Case":
         </p>
     """, unsafe_allow_html=True)
 
-    html_content = open("adyen_full_case.html", "r", encoding="utf-8").read()
-    components.html(
-        f'<div style="width:100%;max-width:100%;overflow-x:auto;-webkit-overflow-scrolling:touch">{html_content}</div>',
-        height=700, scrolling=True)
+    embed_html_page("adyen_full_case.html")
 
 
 st.markdown(f"""
@@ -612,3 +762,41 @@ st.markdown(f"""
         </p>
     </div>
 """, unsafe_allow_html=True)
+
+# ============================================
+# LIVE RELOAD (rerun when a watched file changed)
+# ============================================
+@st.fragment(run_every=watcher.INTERVAL)
+def live_reload():
+    """Cheap periodic check: only reads the watcher's in-memory generation"""
+    if live_watcher.generation != st.session_state.get("_watch_generation"):
+        st.rerun()
+
+
+if live_watcher is not None:
+    live_reload()
+
+# ============================================
+# RERUN INSTRUMENTATION (ADYEN_INSTRUMENT=1, panel with ?debug=1)
+# ============================================
+if instrumentation.ENABLED or static_server.API_ENABLED:
+    get_static_pages()  # serves /metrics and /api/platform-ratings.json
+rerun_record = instrumentation.end_rerun(selected_chart.split(":")[0])
+if rerun_record and st.query_params.get("debug") == "1":
+    with st.sidebar.expander("Debug: rerun timings", expanded=True):
+        rows = "".join(f"| {name} | {seconds * 1000:.1f} |\n"
+                       for name, seconds in sorted(rerun_record["stages"].items(),
+                                                   key=lambda item: item[1], reverse=True))
+        sizes = "".join(f"| {element} | {size:,} |\n"
+                        for element, size in rerun_record["bytes"].items())
+        st.markdown(f"**{rerun_record['chart']}** — {rerun_record['total_s'] * 1000:.1f} ms\n\n"
+                    f"| stage | ms |\n|---|---:|\n{rows}\n"
+                    f"| element | bytes |\n|---|---:|\n{sizes}")
+        slowest = "".join(f"| {chart} | {name} | {count} | {mean_ms:.1f} |\n"
+                          for chart, name, count, mean_ms in instrumentation.summary()[:10])
+        st.markdown(f"Process totals (slowest first)\n\n"
+                    f"| chart | stage | runs | mean ms |\n|---|---|---:|---:|\n{slowest}")
+        counters = "".join(f"| {name} | {key} | {value:,} |\n"
+                           for name, stats in instrumentation.component_stats().items()
+                           for key, value in stats.items())
+        st.markdown(f"Pool and caches\n\n| component | counter | value |\n|---|---|---:|\n{counters}")
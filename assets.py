@@ -0,0 +1,129 @@
+"""
+Asset store for the embedded HTML pages (Charts 1-4).
+
+Each page is read lazily through mmap the first time it is requested and
+the decoded text is kept for the lifetime of the process, shared by every
+session. A page is re-read only when its file mtime or size changes; with
+`watched=True` the per-request stat is skipped too and a file watcher calls
+`invalidate(name)` instead.
+
+When `python build_assets.py` has been run, get_text() returns the built
+(minified, self-contained) page instead of the source, but only while the
+sha256 of the source still matches the one recorded in the build manifest;
+an edited page is served from source until it is rebuilt.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+
+# Standalone HTML pages embedded by Charts 1-4
+PAGES = (
+    'adyen_chart4.html',      # Chart 1: Adyen Onboarding Demo
+    'adyen_pm_sim.html',      # Chart 2: PM Decision Simulation
+    'adyen_full_case.html',   # Chart 3: The Full Case
+    'onboarding_viz.html',    # Chart 4: Research Intelligence
+)
+
+# Output of build_assets.py: hashed pages plus a manifest
+BUILD_DIR = os.environ.get('ADYEN_ASSET_BUILD_DIR', os.path.join('adyen_charts', 'static'))
+BUILD_MANIFEST = 'assets.json'
+
+
+class AssetStore:
+    """Lazy, process-wide cache of HTML assets with mtime invalidation."""
+
+    def __init__(self, base_dir=None, watched=False, build_dir=BUILD_DIR):
+        self.base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
+        self.watched = watched
+        self.build_dir = build_dir
+        self._entries = {}  # name -> (mtime_ns, size, text, manifest entry or None)
+        self._manifest = None  # build manifest, {} when there is no build
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def path(self, name):
+        return os.path.join(self.base_dir, name)
+
+    def _read(self, path):
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:]
+
+    def manifest(self):
+        """Build manifest (see build_assets.py), {} when no build exists"""
+        if self._manifest is None:
+            manifest = {}
+            if self.build_dir:
+                try:
+                    with open(os.path.join(self.build_dir, BUILD_MANIFEST), 'rb') as f:
+                        manifest = json.load(f)
+                except (OSError, ValueError):
+                    pass
+            self._manifest = manifest
+        return self._manifest
+
+    def manifest_path(self):
+        return os.path.join(self.build_dir, BUILD_MANIFEST) if self.build_dir else None
+
+    def read_built(self, hashed):
+        with open(os.path.join(self.build_dir, hashed), 'rb') as f:
+            return f.read()
+
+    def _decode(self, name, data):
+        """(text, manifest entry): the built inline page when the build matches `data`"""
+        built = self.manifest().get('pages', {}).get(name)
+        if built is not None and built['source'] == hashlib.sha256(data).hexdigest():
+            try:
+                return self.read_built(built['inline']).decode('utf-8'), built
+            except OSError:
+                pass  # build directory partly removed: fall back to the source
+        return data.decode('utf-8'), None
+
+    def built(self, name):
+        """Manifest entry (linked page and its deps) when the build is current, else None"""
+        self.get_text(name)
+        entry = self._entries.get(name)
+        return entry[3] if entry is not None else None
+
+    def get_text(self, name):
+        """Decoded page text; reads from disk only on first use or after a change."""
+        entry = self._entries.get(name)
+        if entry is not None and self.watched:
+            return entry[2]
+
+        path = self.path(name)
+        st = os.stat(path)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                data = self._read(path)
+                text, built = self._decode(name, data)
+                entry = (st.st_mtime_ns, st.st_size, text, built)
+                self._entries[name] = entry
+                self.loads += 1
+        return entry[2]
+
+    def invalidate(self, name=None):
+        """Forget one page (or all pages, and the build manifest) so the next request re-reads it."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+                self._manifest = None
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'loads': self.loads,
+                'cached': len(self._entries),
+                'bytes': sum(len(e[2]) for e in self._entries.values()),
+            }
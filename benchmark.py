@@ -0,0 +1,238 @@
+"""
+Headless benchmark suite for the dashboard's hot paths.
+
+    python benchmark.py [--repeat 20] [--only charts] [--json out.json]
+                        [--save benchmark_baseline.json]
+                        [--baseline benchmark_baseline.json --threshold 0.25]
+
+Runs in a scratch copy of the data files, so results are not skewed by an
+existing database or render cache. For every benchmark it reports latency
+percentiles and the process peak RSS after it ran. With --baseline, the
+exit code is 1 when any p50 regressed by more than --threshold (a fraction).
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+os.environ.setdefault('STREAMLIT_LOGGER_LEVEL', 'error')
+os.environ.setdefault('ADYEN_CLARITY_ID', '')  # no analytics tag in measurements
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+import assets  # noqa: E402
+import charts  # noqa: E402
+import columnar  # noqa: E402
+import database  # noqa: E402
+import ratings  # noqa: E402
+
+DATA_FILES = ('feedback_data.csv',) + assets.PAGES
+
+CHART_OPTIONS = [
+    "Chart 1: Adyen Onboarding Demo",
+    "Chart 2: PM Decision Simulation",
+    "Chart 3: The Full Case",
+    "Chart 4: Research Intelligence",
+    "Chart 5: Sentiment Analysis",
+    "Chart 6: Top Onboarding Issues",
+    "Chart 7: Platform Ratings",
+]
+
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def percentile(sorted_values, q):
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def measure(fn, repeat, setup=None):
+    """Time `fn` `repeat` times (after one untimed warm-up); returns latency stats in ms"""
+    if setup:
+        setup()
+    fn()
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'n': repeat,
+        'min_ms': round(samples[0], 3),
+        'p50_ms': round(percentile(samples, 0.50), 3),
+        'p90_ms': round(percentile(samples, 0.90), 3),
+        'p99_ms': round(percentile(samples, 0.99), 3),
+        'max_ms': round(samples[-1], 3),
+        'mean_ms': round(statistics.fmean(samples), 3),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+# ============================================
+# BENCHMARKS
+# ============================================
+def bench_init_database(repeat):
+    def cold_setup():
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(database.DB_PATH + suffix):
+                os.remove(database.DB_PATH + suffix)
+
+    results = {'init_database.cold': measure(database.ensure_database, repeat, setup=cold_setup)}
+    database.ensure_database()
+    results['init_database.warm'] = measure(database.ensure_database, repeat)
+    return results
+
+
+def bench_charts(repeat):
+    database.ensure_database()
+    pool = database.ConnectionPool()
+    df = charts.load_sentiment(pool)
+    results = {
+        'chart_02.query': measure(lambda: charts.load_sentiment(pool), repeat),
+        'chart_02.render': measure(lambda: charts.render_chart_02(df), repeat),
+        'chart_02.plotly_json': measure(lambda: charts.create_chart_02_plotly(df).to_json(), repeat),
+        'chart_03.render': measure(lambda: charts.render_chart_03(charts.ONBOARDING_DATA), repeat),
+        'chart_03.plotly_html': measure(
+            lambda: charts.create_chart_03_plotly_html(charts.ONBOARDING_DATA), repeat),
+    }
+    if importlib.util.find_spec('pyarrow') is not None:
+        version = columnar.sync()
+        results['chart_02.query_columnar'] = measure(lambda: columnar.load_sentiment(version), repeat)
+    pivot, _ = ratings.cached_pivot(pool)
+    results['chart_07.pivot_cached'] = measure(lambda: ratings.cached_pivot(pool), repeat)
+    results['chart_07.render'] = measure(lambda: charts.render_chart_07(pivot), repeat)
+    pool.close()
+    return results
+
+
+def bench_pages(repeat):
+    """Read + components.html payload construction, cold (new store) and warm"""
+    results = {}
+    for page in assets.PAGES:
+        def payload(store):
+            html_content = store.get_text(page)
+            return (f'<div style="width:100%;max-width:100%;overflow-x:auto;'
+                    f'-webkit-overflow-scrolling:touch">{html_content}</div>')
+
+        results[f'page.{page}.cold'] = measure(lambda: payload(assets.AssetStore(os.getcwd())), repeat)
+        warm_store = assets.AssetStore(os.getcwd())
+        results[f'page.{page}.warm'] = measure(lambda: payload(warm_store), repeat)
+    return results
+
+
+def bench_reruns(repeat):
+    """Full script rerun per chart selection through Streamlit's AppTest"""
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    start = time.perf_counter()
+    at = AppTest.from_file(os.path.join(HERE, 'app.py'), default_timeout=300)
+    at.run()
+    results['rerun.first_paint'] = {'n': 1, 'p50_ms': round((time.perf_counter() - start) * 1000, 3),
+                                    'peak_rss_mb': round(peak_rss_mb(), 1)}
+    for option in CHART_OPTIONS:
+        def rerun():
+            at.selectbox[0].set_value(option).run()
+            if at.exception:
+                raise RuntimeError(f'{option}: {at.exception[0].value}')
+
+        results[f'rerun.{option.split(":")[0].lower().replace(" ", "_")}'] = measure(rerun, repeat)
+    return results
+
+
+BENCHMARKS = {
+    'init_database': bench_init_database,
+    'charts': bench_charts,
+    'pages': bench_pages,
+    'reruns': bench_reruns,
+}
+
+
+def compare(results, baseline, threshold):
+    """Benchmarks whose p50 grew by more than `threshold` versus the baseline"""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base or not base.get('p50_ms'):
+            continue
+        ratio = stats['p50_ms'] / base['p50_ms']
+        if ratio > 1 + threshold:
+            regressions.append((name, base['p50_ms'], stats['p50_ms'], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the dashboard hot paths')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--only', action='append', choices=sorted(BENCHMARKS),
+                        help='run only these groups (repeatable)')
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--save', help='write results as a new baseline file')
+    parser.add_argument('--baseline', help='compare against this baseline file')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed p50 slowdown before failing (0.25 = +25%%)')
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='adyen-bench-')
+    for name in DATA_FILES:
+        shutil.copy(os.path.join(HERE, name), workdir)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        results = {}
+        for group in args.only or BENCHMARKS:
+            results.update(BENCHMARKS[group](args.repeat))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+
+    print(f'{"benchmark":<44} {"p50 ms":>9} {"p90 ms":>9} {"p99 ms":>9} {"rss MB":>8}')
+    for name, s in results.items():
+        print(f'{name:<44} {s["p50_ms"]:>9.2f} {s.get("p90_ms", s["p50_ms"]):>9.2f} '
+              f'{s.get("p99_ms", s["p50_ms"]):>9.2f} {s["peak_rss_mb"]:>8.1f}')
+
+    for path in filter(None, (args.json, args.save)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for name, before, after, ratio in regressions:
+            print(f'REGRESSION {name}: p50 {before:.2f} ms -> {after:.2f} ms ({ratio:.2f}x)')
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
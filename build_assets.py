@@ -0,0 +1,310 @@
+"""
+Asset build for the embedded HTML pages (Charts 1-4).
+
+    python build_assets.py [--out adyen_charts/static]
+
+For every page in assets.PAGES:
+
+- inline <style> and <script> blocks are minified, HTML comments and
+  indentation are dropped (scripts that are not plain JavaScript, such as
+  text/babel, are kept as they are)
+- pages nested as base64 data: URIs in iframes (the Chart 1 modals) are
+  built the same way and split into their own files
+
+There is no shared bundle: measured on the seven documents (four pages and
+three Chart 1 modals), no script line repeats across them, the only rule in
+all of them is a 43-byte reset, and the largest pair overlap is 579 bytes
+of CSS (two modals). The :root colour variables differ per page. A bundle
+would cost each first view an extra request to save a few dozen bytes.
+
+Two variants of each page are written with static_server.publish()
+(content-hashed names plus .gz/.br):
+
+- linked: loads the nested pages by URL, for served pages
+  (ADYEN_STATIC_PAGES=1, the prerendered site)
+- inline: self-contained (nested pages as srcdoc), for components.html
+
+assets.json maps every page to both variants and records the sha256 of
+the source it was built from. AssetStore uses a build only while that hash
+matches, so an edited page is never shadowed by a stale build.
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+
+import assets
+import static_server
+
+# ============================================
+# MINIFIERS
+# ============================================
+_CSS_TOKENS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+
+
+def _minify_css_code(code):
+    code = re.sub(r'\s+', ' ', code)
+    code = re.sub(r' ?([{};,>]) ?', r'\1', code)
+    code = re.sub(r': ', ':', code)
+    return code.replace(';}', '}')
+
+
+def minify_css(css):
+    """Drop comments and redundant whitespace; string literals are kept verbatim"""
+    strings = []
+
+    def token(m):
+        if not m.group(1):
+            return ' '  # a comment separates tokens
+        strings.append(m.group(1))
+        return f'\0{len(strings) - 1}\0'
+
+    code = _minify_css_code(_CSS_TOKENS.sub(token, css)).strip()
+    return re.sub('\0(\\d+)\0', lambda m: strings[int(m.group(1))], code)
+
+
+_JS_WORD = re.compile(r'[\w$\\]')
+# A "/" after one of these characters or keywords starts a regex literal, not a division
+_JS_REGEX_AFTER = set('(,=:[!&|?{};+-*%<>~^')
+_JS_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'instanceof', 'new',
+                      'delete', 'void', 'throw', 'yield', 'await'}
+
+
+def _is_word(ch):
+    return bool(ch) and (ord(ch) > 127 or _JS_WORD.match(ch) is not None)
+
+
+def _skip_string(js, i):
+    """Index after the string literal starting at js[i]"""
+    quote, i = js[i], i + 1
+    while i < len(js) and js[i] != quote:
+        i += 2 if js[i] == '\\' else 1
+    return i + 1
+
+
+def _skip_template(js, i):
+    """Index after the template literal starting at js[i], ${...} included"""
+    i += 1
+    while i < len(js) and js[i] != '`':
+        if js[i] == '\\':
+            i += 2
+        elif js.startswith('${', i):
+            i, depth = i + 2, 1
+            while i < len(js) and depth:
+                ch = js[i]
+                if ch in '\'"':
+                    i = _skip_string(js, i)
+                elif ch == '`':
+                    i = _skip_template(js, i)
+                else:
+                    depth += {'{': 1, '}': -1}.get(ch, 0)
+                    i += 1
+        else:
+            i += 1
+    return i + 1
+
+
+def _skip_regex(js, i):
+    i += 1
+    in_class = False
+    while i < len(js) and (in_class or js[i] != '/'):
+        if js[i] == '\\':
+            i += 1
+        elif js[i] == '[':
+            in_class = True
+        elif js[i] == ']':
+            in_class = False
+        i += 1
+    return i + 1
+
+
+def minify_js(js):
+    """
+    Strip comments and indentation from JavaScript. Conservative on purpose:
+    line breaks survive (automatic semicolon insertion still sees them)
+    unless the previous character makes them meaningless, and string,
+    template and regex literals are copied as they are.
+    """
+    out = []
+    last = ''  # last character written
+    word = ''  # last identifier or keyword written
+    pending = ''  # whitespace seen since the last token: '', ' ' or '\n'
+    i, n = 0, len(js)
+    while i < n:
+        ch = js[i]
+        if ch in ' \t\r\n\f\v':
+            if ch == '\n' or pending == '\n':
+                pending = '\n'
+            else:
+                pending = ' '
+            i += 1
+            continue
+        if js.startswith('//', i):
+            i = js.find('\n', i)
+            i = n if i < 0 else i
+            continue
+        if js.startswith('/*', i):
+            end = js.find('*/', i + 2)
+            end = n if end < 0 else end + 2
+            pending = '\n' if '\n' in js[i:end] or pending == '\n' else (pending or ' ')
+            i = end
+            continue
+
+        regex = ch == '/' and (last in _JS_REGEX_AFTER or not last or word in _JS_REGEX_KEYWORDS)
+        if ch in '\'"':
+            end = _skip_string(js, i)
+        elif ch == '`':
+            end = _skip_template(js, i)
+        elif regex:
+            end = _skip_regex(js, i)
+        elif _is_word(ch):
+            end = i + 1
+            while end < n and _is_word(js[end]):
+                end += 1
+        else:
+            end = i + 1
+        token = js[i:end]
+
+        if pending and out:
+            if pending == '\n' and last not in '{;,(':
+                out.append('\n')
+            elif (_is_word(last) and _is_word(token[0])) or (last in '+-' and token[0] in '+-') \
+                    or (last == '/' and token[0] == '/'):
+                out.append(' ')
+        pending = ''
+        out.append(token)
+        last = token[-1]
+        word = token if _is_word(token[0]) and not regex else ''
+        i = end
+    return ''.join(out)
+
+
+def minify_html(text):
+    """Markup between blocks: comments dropped, whitespace runs collapsed"""
+    text = re.sub(r'<!--(?!\[if).*?-->', '', text, flags=re.S)
+    return re.sub(r'\s+', lambda m: '\n' if '\n' in m.group() else ' ', text)
+
+
+# ============================================
+# DOCUMENTS
+# ============================================
+_BLOCK = re.compile(r'(<(style|script|pre|textarea)\b([^>]*)>)(.*?)(</\2\s*>)', re.S | re.I)
+_NESTED = re.compile(r'src="data:text/html;base64,([A-Za-z0-9+/=]+)"')
+_JS_TYPES = ('', 'text/javascript', 'application/javascript', 'module')
+
+
+def _script_type(attrs):
+    m = re.search(r'\btype\s*=\s*["\']?([^"\'\s>]+)', attrs, re.I)
+    return m.group(1).lower() if m else ''
+
+
+def _minify_document(text):
+    out, pos = [], 0
+    for m in _BLOCK.finditer(text):
+        out.append(minify_html(text[pos:m.start()]))
+        open_tag, tag, attrs, body, close_tag = m.group(1), m.group(2).lower(), m.group(3), m.group(4), m.group(5)
+        if tag == 'style':
+            body = minify_css(body)
+        elif tag == 'script' and 'src=' not in attrs and _script_type(attrs) in _JS_TYPES:
+            body = minify_js(body)
+        out.append(open_tag + body + close_tag)
+        pos = m.end()
+    out.append(minify_html(text[pos:]))
+    return ''.join(out).strip()
+
+
+class Document:
+    """One minified page: its text with placeholders for nested pages"""
+
+    def __init__(self, name, source):
+        self.name = name
+        self.nested = []
+        text = _minify_document(source)
+
+        def nested(m):
+            child = Document(f'{os.path.splitext(name)[0]}.frame{len(self.nested) + 1}.html',
+                             base64.b64decode(m.group(1)).decode('utf-8'))
+            self.nested.append(child)
+            return f'\0{len(self.nested) - 1}\0'
+
+        self.text = _NESTED.sub(nested, text)
+
+    def render(self, nested_ref):
+        """Final HTML; `nested_ref(i)` gives the iframe attribute of nested page i"""
+        return re.sub('\0(\\d+)\0', lambda m: nested_ref(int(m.group(1))), self.text)
+
+
+# ============================================
+# BUILD
+# ============================================
+def build(out_dir=assets.BUILD_DIR, base_dir=None):
+    """Build every page into `out_dir` and write the manifest; returns it"""
+    store = assets.AssetStore(base_dir, build_dir=None)
+    sources = {}
+    for page in assets.PAGES:
+        with open(store.path(page), 'rb') as f:
+            sources[page] = f.read()
+    pages = {page: Document(page, data.decode('utf-8')) for page, data in sources.items()}
+
+    def publish(name, text):
+        return static_server.publish(name, text, static_dir=out_dir)
+
+    def linked(doc):
+        """(hashed name, dependencies) of the linked variant, nested pages first"""
+        deps, refs = [], []
+        for child in doc.nested:
+            child_name, child_deps = linked(child)
+            deps += child_deps + [child_name]
+            refs.append(f'src="{child_name}" loading="lazy"')
+        return publish(doc.name, doc.render(lambda i: refs[i])), deps
+
+    def inline(doc):
+        return doc.render(lambda i: f'srcdoc="{html.escape(inline(doc.nested[i]), quote=True)}"')
+
+    manifest = {'pages': {}}
+    for page, doc in pages.items():
+        linked_name, deps = linked(doc)
+        inline_text = inline(doc)
+        manifest['pages'][page] = {
+            'source': hashlib.sha256(sources[page]).hexdigest(),
+            'inline': publish(page.replace('.html', '.inline.html'), inline_text),
+            'linked': linked_name,
+            'deps': list(dict.fromkeys(deps)),
+            'bytes': {
+                'source': len(sources[page]),
+                'inline': len(inline_text.encode('utf-8')),
+                # first view of a served page, gzipped (the modals load when opened)
+                'linked_view_gz': os.path.getsize(os.path.join(out_dir, linked_name + '.gz')),
+            },
+        }
+    os.makedirs(out_dir, exist_ok=True)
+    from export_queue import write_atomic
+
+    write_atomic(os.path.join(out_dir, assets.BUILD_MANIFEST),
+                 json.dumps(manifest, indent=2).encode('utf-8'))
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Minify the embedded HTML pages')
+    parser.add_argument('--out', default=assets.BUILD_DIR, help='output directory')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    manifest = build(args.out)
+    print(f'{"page":<24}{"source":>10}{"inline":>10}{"served (gz)":>13}')
+    for page, entry in manifest['pages'].items():
+        b = entry['bytes']
+        print(f'{page:<24}{b["source"]:>10}{b["inline"]:>10}{b["linked_view_gz"]:>13}')
+    print(f'{time.perf_counter() - start:.2f}s')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,599 @@
+"""
+Chart builders for the dashboard (Charts 5 and 6).
+
+Pure matplotlib/plotly code with no Streamlit dependency, so the same
+functions back the interactive app, the render cache and the headless
+export CLI (export_charts.py).
+"""
+
+import io
+import os
+import threading
+
+import database
+import instrumentation
+import tagcloud
+from render_cache import make_key
+
+# matplotlib, numpy and pandas are imported inside the functions that need
+# them, so importing this module (brand colours, cache keys) stays cheap.
+
+CHART_DIR = 'adyen_charts'
+
+# Chart 5 in the app: 'plotly' draws it in the browser from the data arrays,
+# 'png' rasterizes it with matplotlib on the server
+SENTIMENT_RENDERER = os.environ.get('ADYEN_SENTIMENT_RENDERER', 'plotly')
+
+# Reuse one Figure per chart and update its artists instead of rebuilding it
+RETAIN_FIGURES = os.environ.get('ADYEN_RETAIN_FIGURES', '1') not in ('0', 'false')
+
+# ============================================
+# ADYEN BRAND COLORS (Official Dutch Design)
+# ============================================
+ADYEN_MIDNIGHT = '#00112c'    # Primary text
+ADYEN_SECONDARY = '#5c687c'   # Labels and secondary text
+ADYEN_GREEN = '#0abf53'       # Brand accent, positive sentiment
+ADYEN_BLUE = '#0070f5'        # Links and highlights
+ADYEN_RED = '#e22d2d'         # Error states, negative sentiment
+ADYEN_BG = '#f7f7f8'          # App background (light gray)
+ADYEN_WHITE = '#ffffff'       # Card and container backgrounds
+ADYEN_BORDER = '#e6e8eb'      # Subtle borders
+
+DPI = 150  # High-quality chart export
+
+# Everything that changes the rendered pixels besides the data itself
+STYLE_KEY = (ADYEN_MIDNIGHT, ADYEN_SECONDARY, ADYEN_GREEN, ADYEN_BLUE, ADYEN_RED,
+             ADYEN_BG, ADYEN_WHITE, ADYEN_BORDER, DPI)
+
+# ============================================
+# CHART GENERATION FUNCTIONS
+# ============================================
+
+def load_sentiment(pool, filters=database.NO_FILTERS):
+    """Chart 5 rows (one per theme) from sentiment_summary, already sorted worst → best"""
+    import pandas as pd
+
+    sql, params = database.filtered_sentiment_query(filters)
+    with pool.connection() as conn:
+        return pd.read_sql_query(sql, conn, params=params)
+
+
+def sorted_sentiment(df):
+    """Rows ordered worst → best, the order both butterfly renderers draw bottom → top"""
+    if 'sentiment_ratio' not in df:
+        # Raw CSV rows: compute sentiment ratio (higher = more positive) and sort.
+        # Rows from sentiment_summary already carry it and arrive sorted.
+        df = df.copy()
+        df['total'] = df['positive_mentions'] + df['negative_mentions']
+        df['sentiment_ratio'] = df['positive_mentions'] / df['total'].replace(0, 1)
+
+        # Sort: WORST (most negative) at index 0 → renders at BOTTOM of chart
+        # BEST (most positive) at last index → renders at TOP
+        df = df.sort_values('sentiment_ratio', ascending=True).reset_index(drop=True)
+    return df
+
+
+def _butterfly_values(df):
+    df = sorted_sentiment(df)
+    positive = df['positive_mentions'].tolist()
+    negative = [-x for x in df['negative_mentions'].tolist()]  # Negative values for left side
+    return df['theme'].tolist(), positive, negative
+
+
+def _label_bars(pos_labels, neg_labels, positive, negative):
+    """Move, retext and show/hide the value labels next to each bar"""
+    pos_pad = max(positive) * 0.01
+    neg_pad = abs(min(negative)) * 0.01
+    for i, (label, pos) in enumerate(zip(pos_labels, positive)):
+        label.set_position((pos + pos_pad, i))
+        label.set_text(str(int(pos)))
+        label.set_visible(pos > 0)
+    for i, (label, neg) in enumerate(zip(neg_labels, negative)):
+        label.set_position((neg - neg_pad, i))
+        label.set_text(str(int(abs(neg))))
+        label.set_visible(neg < 0)
+
+
+def _draw_chart_02(fig, df):
+    """Draw the butterfly on an empty figure; returns the artists updated in place"""
+    import numpy as np
+
+    themes, positive, negative = _butterfly_values(df)
+    y_pos = np.arange(len(themes))
+
+    ax = fig.subplots()
+
+    # Create butterfly chart
+    pos_bars = ax.barh(y_pos, positive, color=ADYEN_GREEN, alpha=0.8, label='Positive Mentions', height=0.7)
+    neg_bars = ax.barh(y_pos, negative, color=ADYEN_RED, alpha=0.8, label='Negative Mentions', height=0.7)
+
+    # Add value labels
+    label_style = dict(va='center', fontsize=9, color=ADYEN_MIDNIGHT, weight='500')
+    pos_labels = [ax.text(0, i, '', ha='left', **label_style) for i in y_pos]
+    neg_labels = [ax.text(0, i, '', ha='right', **label_style) for i in y_pos]
+    _label_bars(pos_labels, neg_labels, positive, negative)
+
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(themes, fontsize=10, color=ADYEN_MIDNIGHT)
+    ax.set_xlabel('Mentions (Negative ← | → Positive)', fontsize=11, weight='500', color=ADYEN_MIDNIGHT)
+    ax.set_title('Chart 5: Sentiment Analysis - What Engineers Talk About',
+                 fontsize=14, weight='600', pad=15, color=ADYEN_MIDNIGHT)
+    ax.axvline(x=0, color=ADYEN_MIDNIGHT, linewidth=1.5, linestyle='-')
+    ax.legend(loc='upper right', fontsize=10)
+    ax.grid(axis='x', alpha=0.15, color=ADYEN_SECONDARY)
+    ax.set_facecolor(ADYEN_WHITE)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_color(ADYEN_BORDER)
+    ax.spines['bottom'].set_color(ADYEN_BORDER)
+
+    fig.patch.set_facecolor(ADYEN_WHITE)
+    fig.tight_layout(rect=[0, 0.06, 1, 1])
+    fig.text(0.5, 0.01,
+             'Data: Sentiment themes from Blind/Glassdoor/Taro/Indeed (2024-2026) | Dashboard by Serafima, Feb 2026',
+             ha='center', fontsize=8, color=ADYEN_SECONDARY)
+
+    return {'ax': ax, 'themes': themes, 'pos_bars': pos_bars, 'neg_bars': neg_bars,
+            'pos_labels': pos_labels, 'neg_labels': neg_labels}
+
+
+def _update_chart_02(fig, artists, df):
+    """Swap new counts into a drawn butterfly; False when the row count changed"""
+    themes, positive, negative = _butterfly_values(df)
+    if len(themes) != len(artists['themes']):
+        return False
+
+    for bar, pos in zip(artists['pos_bars'], positive):
+        bar.set_width(pos)
+    for bar, neg in zip(artists['neg_bars'], negative):
+        bar.set_width(neg)
+    _label_bars(artists['pos_labels'], artists['neg_labels'], positive, negative)
+
+    ax = artists['ax']
+    ax.relim()
+    ax.autoscale_view()
+    if themes != artists['themes']:
+        # Only new tick labels can change the margins
+        ax.set_yticklabels(themes, fontsize=10, color=ADYEN_MIDNIGHT)
+        fig.tight_layout(rect=[0, 0.06, 1, 1])
+        artists['themes'] = themes
+    return True
+
+
+def create_chart_02_sentiment(df):
+    """Chart 2: Sentiment Butterfly - sorted best (top) to worst (bottom)"""
+    import matplotlib.pyplot as plt
+
+    if df.empty:
+        return None
+
+    fig = plt.figure(figsize=(14, 8), dpi=DPI)
+    _draw_chart_02(fig, df)
+    return fig
+
+
+def create_chart_02_plotly(df):
+    """
+    Chart 5 as a Plotly figure rendered in the browser: only the theme names
+    and mention counts travel to the client, and hover/legend filtering come
+    with it. None when there is no data or plotly is not installed.
+    """
+    try:
+        import plotly.graph_objects as go
+    except ImportError:
+        return None
+
+    if df.empty:
+        return None
+
+    df = sorted_sentiment(df)
+    themes = df['theme'].tolist()
+    positive = [int(x) for x in df['positive_mentions']]
+    negative = [int(x) for x in df['negative_mentions']]
+    font = dict(family='Inter, Arial, sans-serif', color=ADYEN_MIDNIGHT)
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=themes, x=positive, orientation='h', name='Positive Mentions',
+        marker_color=ADYEN_GREEN, opacity=0.8,
+        text=[str(v) if v else '' for v in positive], textposition='outside',
+        hovertemplate='%{y}<br>Positive: %{x}<extra></extra>'))
+    fig.add_trace(go.Bar(
+        y=themes, x=[-v for v in negative], orientation='h', name='Negative Mentions',
+        marker_color=ADYEN_RED, opacity=0.8, customdata=negative,
+        text=[str(v) if v else '' for v in negative], textposition='outside',
+        hovertemplate='%{y}<br>Negative: %{customdata}<extra></extra>'))
+
+    # Symmetric axis with unsigned tick labels on both sides
+    limit = max(positive + negative + [1]) * 1.12
+    step = _nice_step(limit / 4)
+    ticks = [i * step for i in range(-int(limit // step), int(limit // step) + 1)]
+    fig.update_layout(
+        barmode='relative', bargap=0.3, height=560,
+        font=font, plot_bgcolor=ADYEN_WHITE, paper_bgcolor=ADYEN_WHITE,
+        title=dict(text='Chart 5: Sentiment Analysis - What Engineers Talk About',
+                   x=0.5, xanchor='center', font=dict(size=16, **font)),
+        legend=dict(orientation='h', x=1, xanchor='right', y=1.02, yanchor='bottom'),
+        xaxis=dict(title='Mentions (Negative ← | → Positive)', range=[-limit, limit],
+                   tickvals=ticks, ticktext=[str(abs(t)) for t in ticks],
+                   gridcolor=ADYEN_BORDER, zeroline=True, zerolinecolor=ADYEN_MIDNIGHT,
+                   zerolinewidth=1.5),
+        yaxis=dict(automargin=True),
+        margin=dict(l=20, r=20, t=80, b=70),
+        annotations=[dict(
+            text='Data: Sentiment themes from Blind/Glassdoor/Taro/Indeed (2024-2026) | '
+                 'Dashboard by Serafima, Feb 2026',
+            x=0.5, y=-0.14, xref='paper', yref='paper', showarrow=False,
+            font=dict(size=10, color=ADYEN_SECONDARY))],
+    )
+    return fig
+
+
+def _nice_step(raw):
+    """1/2/5 x 10^n step at or above `raw`"""
+    magnitude = 10 ** max(len(str(int(raw))) - 1, 0)
+    for factor in (1, 2, 5, 10):
+        if factor * magnitude >= raw:
+            return factor * magnitude
+    return 10 * magnitude
+
+
+
+# Curated phrase counts, largest first
+ONBOARDING_DATA = [
+    ("Sink or Swim",        48),
+    ("Tribal Knowledge",    45),
+    ("No Structured Training", 42),
+    ("Zero Guidance",       40),
+    ("Outdated Docs",       38),
+    ("No Feedback Loop",    35),
+    ("Office Politics",     32),
+    ("Figure It Out",       30),
+    ("Context Overload",    28),
+    ("No Tech Context",     25),
+    ("Fake Politeness",     22),
+    ("Trial by Fire",       20),
+    ("No Mentorship",       18),
+    ("Chaotic Process",     15),
+    ("Generic Training",    12),
+]
+
+# Chart 6 figure: 14 x 6 in; the tag area (tagcloud.WIDTH x HEIGHT points) sits
+# between the title and the footer
+CHART_03_MARGINS = dict(left=0.02, right=0.98, top=0.90, bottom=0.08)
+
+
+def tag_color_scale(onboarding_data):
+    """Map a mention count to a light → dark green shade"""
+    counts = [c for _, c in onboarding_data]
+    min_c, max_c = min(counts), max(counts)
+
+    def lerp_color(c):
+        t = (c - min_c) / (max_c - min_c) if max_c > min_c else 1.0
+        r = int(0xb0 + t * (0x00 - 0xb0))
+        g = int(0xe8 + t * (0x99 - 0xe8))
+        b = int(0xc8 + t * (0x3a - 0xc8))
+        return f'#{r:02x}{g:02x}{b:02x}'
+
+    return lerp_color
+
+
+def _draw_chart_03(fig, onboarding_data):
+    """Draw the tag cloud on an empty figure; returns the tag texts, largest first"""
+    lerp_color = tag_color_scale(onboarding_data)
+
+    ax = fig.subplots()
+    ax.set_facecolor('#ffffff')
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+    fig.patch.set_facecolor('#ffffff')
+
+    tags = [ax.text(tag.x, tag.y, tag.phrase,
+                    fontsize=tag.fontsize,
+                    color=lerp_color(tag.count),
+                    fontweight=tag.weight,
+                    ha='center', va='center',
+                    transform=ax.transAxes)
+            for tag in tagcloud.layout(onboarding_data)]
+
+    fig.text(0.5, 0.96,
+             'Chart 6: Top Onboarding Issues — Tag Cloud',
+             ha='center', va='top',
+             fontsize=14, fontweight='600', color=ADYEN_MIDNIGHT)
+
+    fig.text(0.5, 0.02,
+             'Tag size & colour = mention frequency  |  Darker green = mentioned more often  |  '
+             'Data: Employee feedback 2024-2026 | Serafima, Feb 2026',
+             ha='center', va='bottom', fontsize=7.5, color=ADYEN_SECONDARY)
+
+    fig.subplots_adjust(**CHART_03_MARGINS)
+
+    return {'tags': tags}
+
+
+def _update_chart_03(fig, artists, onboarding_data):
+    """Move, retext and recolour the tags in place; False when the tag count changed"""
+    tags = artists['tags']
+    placements = tagcloud.layout(onboarding_data)
+    if len(placements) != len(tags):
+        return False
+    lerp_color = tag_color_scale(onboarding_data)
+    for text, tag in zip(tags, placements):
+        text.set_text(tag.phrase)
+        text.set_position((tag.x, tag.y))
+        text.set_fontsize(tag.fontsize)
+        text.set_fontweight(tag.weight)
+        text.set_color(lerp_color(tag.count))
+    return True
+
+
+def create_chart_03_keywords(onboarding_data=ONBOARDING_DATA):
+    """Chart 3: Tag Cloud — sizes by mention count, laid out without overlap"""
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(14, 6), dpi=DPI)
+    _draw_chart_03(fig, onboarding_data)
+    return fig
+
+
+def create_chart_03_plotly_html(onboarding_data=ONBOARDING_DATA):
+    """Chart 6 as a standalone Plotly HTML page (None when plotly is not installed)"""
+    try:
+        import plotly.graph_objects as go
+    except ImportError:
+        return None
+
+    lerp_color = tag_color_scale(onboarding_data)
+    # Same placements as the PNG: 1 point of the layout = 1 CSS pixel
+    annotations = [dict(
+        x=tag.x, y=tag.y,
+        text=f"<b>{tag.phrase}</b>" if tag.weight == 'bold' else tag.phrase,
+        showarrow=False,
+        font=dict(size=tag.fontsize, color=lerp_color(tag.count),
+                  family='DejaVu Sans, Verdana, sans-serif'),
+        xanchor='center', yanchor='middle',
+        xref='paper', yref='paper'
+    ) for tag in tagcloud.layout(onboarding_data)]
+    width, height = 14 * 72, 6 * 72
+    margins = CHART_03_MARGINS
+    pfig = go.Figure()
+    pfig.update_layout(
+        annotations=annotations,
+        xaxis=dict(visible=False, range=[0, 1]),
+        yaxis=dict(visible=False, range=[0, 1]),
+        plot_bgcolor='white', paper_bgcolor='white',
+        margin=dict(l=round(margins['left'] * width), r=round((1 - margins['right']) * width),
+                    t=round((1 - margins['top']) * height), b=round(margins['bottom'] * height)),
+        width=width, height=height,
+        title=dict(text='Chart 6: Top Onboarding Issues — Tag Cloud',
+                   font=dict(size=16, color='#00112c',
+                             family='Inter, Arial, sans-serif'),
+                   x=0.5, xanchor='center')
+    )
+
+    return pfig.to_html(include_plotlyjs='cdn', full_html=True)
+
+
+# ============================================
+# CHART 7: PLATFORM RATINGS HEATMAP
+# ============================================
+# 1 → red, 3 → white, 5 → green on the 5-point platform scales
+RATING_COLORSCALE = [[0.0, ADYEN_RED], [0.5, ADYEN_WHITE], [1.0, ADYEN_GREEN]]
+
+
+def _rating_text(pivot):
+    return [[f'{v:.1f}' if v == v else '' for v in row] for row in pivot.scores.tolist()]
+
+
+def create_chart_07_ratings_plotly(pivot):
+    """Chart 7 as a Plotly heatmap (platform × category); None without data or plotly"""
+    try:
+        import plotly.graph_objects as go
+    except ImportError:
+        return None
+
+    if not pivot.platforms:
+        return None
+
+    scores = [[None if v != v else v for v in row] for row in pivot.scores.tolist()]
+    counts = [[('n/a' if v != v else f'{int(v)}') for v in row] for row in pivot.review_counts.tolist()]
+    customdata = [[[c, d or ''] for c, d in zip(count_row, date_row)]
+                  for count_row, date_row in zip(counts, pivot.date_ranges)]
+    font = dict(family='Inter, Arial, sans-serif', color=ADYEN_MIDNIGHT)
+
+    fig = go.Figure(go.Heatmap(
+        z=scores, x=list(pivot.categories), y=list(pivot.platforms),
+        zmin=1, zmax=5, colorscale=RATING_COLORSCALE, xgap=2, ygap=2,
+        text=_rating_text(pivot), texttemplate='%{text}', textfont=dict(size=13),
+        customdata=customdata, hoverongaps=False,
+        hovertemplate='%{y} · %{x}<br>Score: %{z:.1f} / 5<br>Reviews: %{customdata[0]}'
+                      '<br>Period: %{customdata[1]}<extra></extra>',
+        colorbar=dict(title='Score', tickvals=[1, 2, 3, 4, 5])))
+    fig.update_layout(
+        height=140 + 48 * len(pivot.platforms), font=font,
+        plot_bgcolor=ADYEN_BG, paper_bgcolor=ADYEN_WHITE,
+        title=dict(text='Chart 7: Platform Ratings by Category', x=0.5, xanchor='center',
+                   font=dict(size=16, **font)),
+        xaxis=dict(side='top', tickangle=0, showgrid=False),
+        yaxis=dict(autorange='reversed', showgrid=False, automargin=True),
+        margin=dict(l=20, r=20, t=110, b=20),
+    )
+    return fig
+
+
+def create_chart_07_ratings(pivot):
+    """Chart 7 as a matplotlib heatmap (PNG fallback and export)"""
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.colors import LinearSegmentedColormap
+
+    if not pivot.platforms:
+        return None
+
+    cmap = LinearSegmentedColormap.from_list('adyen_rating', [ADYEN_RED, ADYEN_WHITE, ADYEN_GREEN])
+    cmap.set_bad(ADYEN_BG)
+
+    n_rows, n_cols = pivot.scores.shape
+    fig, ax = plt.subplots(figsize=(max(8, 1.6 * n_cols + 3), 1 + 0.6 * n_rows), dpi=DPI)
+    image = ax.imshow(np.ma.masked_invalid(pivot.scores), cmap=cmap, vmin=1, vmax=5, aspect='auto')
+
+    for (i, j), text in np.ndenumerate(np.array(_rating_text(pivot), dtype=object)):
+        if text:
+            ax.text(j, i, text, ha='center', va='center', fontsize=10, color=ADYEN_MIDNIGHT)
+
+    ax.set_xticks(range(n_cols))
+    ax.set_xticklabels(pivot.categories, fontsize=9, color=ADYEN_MIDNIGHT)
+    ax.xaxis.tick_top()
+    ax.set_yticks(range(n_rows))
+    ax.set_yticklabels(pivot.platforms, fontsize=10, color=ADYEN_MIDNIGHT)
+    ax.tick_params(length=0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.set_title('Chart 7: Platform Ratings by Category', fontsize=14, weight='600',
+                 pad=30, color=ADYEN_MIDNIGHT)
+    fig.colorbar(image, ax=ax, fraction=0.03, pad=0.02).set_label('Score (of 5)', color=ADYEN_SECONDARY)
+    fig.patch.set_facecolor(ADYEN_WHITE)
+    fig.tight_layout()
+    return fig
+
+
+def _savefig(fig, facecolor):
+    buf = io.BytesIO()
+    with instrumentation.stage('savefig'):
+        fig.savefig(buf, format='png', dpi=DPI, bbox_inches='tight',
+                    facecolor=facecolor, edgecolor='none')
+    return buf.getvalue()
+
+
+def figure_to_png(fig, facecolor):
+    """Rasterize a figure to PNG bytes and release it"""
+    import matplotlib.pyplot as plt
+
+    png = _savefig(fig, facecolor)
+    plt.close(fig)
+    return png
+
+
+# ============================================
+# RETAINED FIGURES (reused between renders)
+# ============================================
+class RetainedFigure:
+    """
+    One matplotlib Figure kept between renders of the same chart. New data is
+    swapped into the existing artists; the figure is only redrawn from scratch
+    when the shape changes (e.g. a different number of rows), and after
+    MAX_UPDATES renders so per-figure caches cannot grow without bound.
+
+    The Figure is created without pyplot, so it never enters pyplot's global
+    figure registry; close() drops it. Renders are serialized by a lock, as
+    matplotlib artists must not be touched from two threads at once.
+    """
+
+    MAX_UPDATES = 500
+
+    def __init__(self, figsize, facecolor, draw, update):
+        self.figsize = figsize
+        self.facecolor = facecolor
+        self._draw = draw
+        self._update = update
+        self._lock = threading.Lock()
+        self.fig = None
+        self._artists = None
+        self._updates = 0
+        self.builds = 0
+
+    def render(self, data):
+        """PNG bytes of the chart for `data`"""
+        with self._lock:
+            if (self.fig is None or self._updates >= self.MAX_UPDATES
+                    or not self._update(self.fig, self._artists, data)):
+                self._rebuild(data)
+            else:
+                self._updates += 1
+            return _savefig(self.fig, self.facecolor)
+
+    def _rebuild(self, data):
+        from matplotlib.figure import Figure
+
+        self._close()
+        self.fig = Figure(figsize=self.figsize, dpi=DPI)
+        self._artists = self._draw(self.fig, data)
+        self._updates = 0
+        self.builds += 1
+
+    def _close(self):
+        if self.fig is not None:
+            self.fig.clear()
+        self.fig = None
+        self._artists = None
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+
+_retained = {}
+_retained_lock = threading.Lock()
+
+_RETAINED_SPECS = {
+    'chart_02': ((14, 8), ADYEN_WHITE, _draw_chart_02, _update_chart_02),
+    'chart_03': ((14, 6), '#ffffff', _draw_chart_03, _update_chart_03),
+}
+
+
+def retained_figure(name):
+    """This process's RetainedFigure for 'chart_02' or 'chart_03'"""
+    with _retained_lock:
+        figure = _retained.get(name)
+        if figure is None:
+            figure = _retained[name] = RetainedFigure(*_RETAINED_SPECS[name])
+        return figure
+
+
+def release_figures():
+    """Close every retained figure (they are recreated on the next render)"""
+    with _retained_lock:
+        figures = list(_retained.values())
+        _retained.clear()
+    for figure in figures:
+        figure.close()
+
+
+def chart_02_key(data_version, filters=database.NO_FILTERS):
+    """Render-cache key for Chart 5, from the database data version and filters"""
+    return make_key('chart_02_sentiment', data_version, tuple(filters), STYLE_KEY)
+
+
+def chart_03_key(onboarding_data=ONBOARDING_DATA):
+    """Render-cache key for Chart 6, from the phrase counts"""
+    return make_key('chart_03_keywords', onboarding_data, tagcloud.LAYOUT_KEY, STYLE_KEY)
+
+
+def chart_07_key(data_version):
+    """Render-cache key for Chart 7, from the database data version"""
+    return make_key('chart_07_ratings', data_version, STYLE_KEY)
+
+
+def render_chart_07(pivot):
+    """Chart 7 as PNG bytes (None when the table is empty)"""
+    fig = create_chart_07_ratings(pivot)
+    if fig is None:
+        return None
+    return figure_to_png(fig, ADYEN_WHITE)
+
+
+def render_chart_02(df):
+    """Chart 5 as PNG bytes (None when there is no data)"""
+    if df.empty:
+        return None
+    if RETAIN_FIGURES:
+        return retained_figure('chart_02').render(df)
+    return figure_to_png(create_chart_02_sentiment(df), ADYEN_WHITE)
+
+
+def render_chart_03(onboarding_data=ONBOARDING_DATA):
+    """Chart 6 as PNG bytes"""
+    if RETAIN_FIGURES:
+        return retained_figure('chart_03').render(onboarding_data)
+    return figure_to_png(create_chart_03_keywords(onboarding_data), '#ffffff')
@@ -0,0 +1,233 @@
+"""
+Optional columnar read store for the sentiment and rating tables.
+
+Enabled with ADYEN_COLUMNAR=1 when pyarrow is installed. SQLite stays where sources
+are ingested and versioned; after each ingest the tables the charts read,
+sentiment_summary and platform_ratings, are exported as uncompressed Arrow
+IPC files in STORE_DIR, tagged with the data version. Readers memory-map
+them: opening is O(1), columns are used in place without parsing or
+copying, and every worker process on the host shares the same page-cache
+pages instead of holding its own copy.
+
+Chart 5 filters are pushed down into Arrow: platform and year bounds are
+evaluated as Arrow expressions on the mapped columns, and only the
+matching rows are aggregated and handed to pandas.
+
+Arrow IPC rather than Parquet: Parquet pages are encoded and compressed,
+so every read decodes into fresh buffers, which defeats sharing the mapping.
+
+    python columnar.py [--db adyen_research.db] [--out adyen_charts/columnar]
+"""
+
+import argparse
+import importlib.util
+import operator
+import os
+import sys
+import threading
+from functools import reduce
+
+import database
+
+ENABLED = (os.environ.get('ADYEN_COLUMNAR', '') not in ('', '0', 'false')
+           and importlib.util.find_spec('pyarrow') is not None)
+STORE_DIR = os.environ.get('ADYEN_COLUMNAR_DIR', os.path.join('adyen_charts', 'columnar'))
+
+# Exported table -> (query, column types by name)
+TABLES = {
+    'sentiment_summary': (
+        'SELECT theme, platform, positive_mentions, negative_mentions, total, year_start, year_end '
+        'FROM sentiment_summary ORDER BY year_start, year_end, theme, platform',
+        (('theme', 'string'), ('platform', 'string'), ('positive_mentions', 'int64'),
+         ('negative_mentions', 'int64'), ('total', 'int64'), ('year_start', 'int64'),
+         ('year_end', 'int64')),
+    ),
+    'platform_ratings': (
+        'SELECT platform, category, score, max_score, review_count, date_range '
+        'FROM platform_ratings ORDER BY platform, category',
+        (('platform', 'string'), ('category', 'string'), ('score', 'float64'),
+         ('max_score', 'int64'), ('review_count', 'int64'), ('date_range', 'string')),
+    ),
+}
+
+_tables = {}  # (store_dir, name) -> (version, pyarrow.Table over the mapping)
+_lock = threading.Lock()
+
+
+def _path(name, store_dir):
+    return os.path.join(store_dir, f'{name}.arrow')
+
+
+# ============================================
+# EXPORT (after ingest)
+# ============================================
+def _to_arrow(name, rows, version):
+    import pyarrow as pa
+
+    _, columns = TABLES[name]
+    arrays = {}
+    for i, (column, kind) in enumerate(columns):
+        arrays[column] = pa.array([r[i] for r in rows], type=getattr(pa, kind)())
+    if name == 'sentiment_summary':
+        # '+Blind+Glassdoor+': a platform filter is one substring match per platform
+        arrays['platform_key'] = pa.array([f'+{p}+' for p in arrays['platform'].to_pylist()],
+                                          type=pa.string())
+    return pa.table(arrays, metadata={'data_version': version})
+
+
+def export(conn, store_dir=STORE_DIR):
+    """Write both tables for the connection's current data version; returns the version"""
+    import pyarrow as pa
+
+    from export_queue import write_atomic
+
+    version = database.data_version(conn)
+    for name, (sql, _) in TABLES.items():
+        table = _to_arrow(name, conn.execute(sql).fetchall(), version)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        # Replaced atomically: readers keep their old mapping until they reopen
+        write_atomic(_path(name, store_dir), sink.getvalue().to_pybytes())
+    return version
+
+
+def stored_version(store_dir=STORE_DIR):
+    """Data version of the exported files, or None when there are none"""
+    import pyarrow as pa
+
+    versions = set()
+    for name in TABLES:
+        try:
+            with pa.memory_map(_path(name, store_dir)) as source:
+                metadata = pa.ipc.open_file(source).schema.metadata or {}
+        except (OSError, pa.ArrowInvalid):
+            return None
+        versions.add(metadata.get(b'data_version', b'').decode('utf-8'))
+    return versions.pop() if len(versions) == 1 else None
+
+
+def sync(db_path=database.DB_PATH, store_dir=STORE_DIR):
+    """Export the database when the store is missing or older; returns the data version"""
+    conn = database.connect_readonly(db_path)
+    try:
+        version = database.data_version(conn)
+        if stored_version(store_dir) != version:
+            export(conn, store_dir)
+    finally:
+        conn.close()
+    return version
+
+
+# ============================================
+# READ (memory-mapped)
+# ============================================
+def table(name, version, store_dir=STORE_DIR):
+    """Mapped table for `version`, or None when the store does not hold that version"""
+    key = (store_dir, name)
+    with _lock:
+        entry = _tables.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    import pyarrow as pa
+
+    try:
+        # read_all() on a memory map references the mapped pages, it copies nothing
+        result = pa.ipc.open_file(pa.memory_map(_path(name, store_dir))).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+    if (result.schema.metadata or {}).get(b'data_version', b'').decode('utf-8') != version:
+        return None
+    with _lock:
+        _tables[key] = (version, result)
+    return result
+
+
+def _filter_expression(filters):
+    import pyarrow.compute as pc
+
+    conditions = []
+    if filters.platforms:
+        conditions.append(reduce(operator.or_, [
+            pc.match_substring(pc.field('platform_key'), f'+{p}+') for p in filters.platforms]))
+    if filters.year_start is not None:
+        conditions.append(pc.field('year_end') >= filters.year_start)
+    if filters.year_end is not None:
+        conditions.append(pc.field('year_start') <= filters.year_end)
+    return reduce(operator.and_, conditions) if conditions else None
+
+
+def load_sentiment(version, filters=database.NO_FILTERS, store_dir=STORE_DIR):
+    """
+    Chart 5 rows, same columns and order as charts.load_sentiment() on
+    SQLite; None when the store does not hold `version`.
+    """
+    summary = table('sentiment_summary', version, store_dir)
+    if summary is None:
+        return None
+    expression = _filter_expression(filters)
+    if expression is not None:
+        summary = summary.filter(expression)
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    grouped = summary.group_by('theme', use_threads=False).aggregate([
+        ('positive_mentions', 'sum'), ('negative_mentions', 'sum'), ('platform', 'list'),
+        ('year_start', 'min'), ('year_end', 'max'), ('total', 'sum'),
+    ])
+    grouped = grouped.filter(pc.field('total_sum') >= filters.min_mentions)
+    total = grouped['total_sum']
+    result = pa.table({
+        'theme': grouped['theme'],
+        'positive_mentions': grouped['positive_mentions_sum'],
+        'negative_mentions': grouped['negative_mentions_sum'],
+        'platform': pc.binary_join(grouped['platform_list'], ', '),
+        'year_range': pc.binary_join_element_wise(
+            pc.cast(grouped['year_start_min'], pa.string()),
+            pc.cast(grouped['year_end_max'], pa.string()), '-'),
+        'total': total,
+        'sentiment_ratio': pc.divide(pc.cast(grouped['positive_mentions_sum'], pa.float64()),
+                                     pc.max_element_wise(total, 1)),
+    })
+    return result.sort_by([('sentiment_ratio', 'ascending'), ('theme', 'ascending')]).to_pandas()
+
+
+def sentiment_facets(version, store_dir=STORE_DIR):
+    """database.sentiment_facets() from the store; None when it does not hold `version`"""
+    import pyarrow.compute as pc
+
+    summary = table('sentiment_summary', version, store_dir)
+    if summary is None:
+        return None
+    platforms = set()
+    for combined in pc.unique(summary['platform']).to_pylist():
+        platforms.update(p.strip() for p in combined.split('+') if p.strip())
+    first = pc.min(summary['year_start']).as_py()
+    last = pc.max(summary['year_end']).as_py()
+    most = pc.max(summary['total']).as_py()
+    return tuple(sorted(platforms)), first, last, most or 0
+
+
+def rating_rows(version, store_dir=STORE_DIR):
+    """platform_ratings rows as tuples for ratings.build_pivot(); None when not stored"""
+    ratings = table('platform_ratings', version, store_dir)
+    if ratings is None:
+        return None
+    columns = [ratings[column].to_pylist() for column, _ in TABLES['platform_ratings'][1]]
+    return list(zip(*columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export the chart tables as Arrow IPC files')
+    parser.add_argument('--db', default=database.DB_PATH)
+    parser.add_argument('--out', default=STORE_DIR)
+    args = parser.parse_args(argv)
+    database.ensure_database(args.db)
+    print(f'{args.out}: data version {sync(args.db, args.out)[:40]}...')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,594 @@
+"""
+SQLite schema migrations and incremental ingest.
+
+The schema is versioned with PRAGMA user_version. Every data source records
+a content hash in `source_hashes`; when the hash is unchanged a start-up does
+no writes at all, otherwise only new, changed and removed rows are touched,
+inside one IMMEDIATE transaction. The database runs in WAL mode so several
+replicas can open the same file safely.
+
+Reads go through ConnectionPool: a bounded set of read-only connections,
+each used by one session thread at a time.
+"""
+
+import hashlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+DB_PATH = 'adyen_research.db'
+# Sentiment source: the bundled CSV, or a raw CSV/JSONL review export. Without
+# ADYEN_SENTIMENT_SOURCE, start-ups follow the file last ingested (see sentiment_source)
+SOURCE_OVERRIDE = os.environ.get('ADYEN_SENTIMENT_SOURCE', '')
+FEEDBACK_CSV = SOURCE_OVERRIDE or 'feedback_data.csv'
+
+_log = logging.getLogger(__name__)
+
+# Derived columns of sentiment_summary, computed from one sentiment_themes row
+_SUMMARY_SELECT = '''
+    SELECT {src}.theme, {src}.platform, {src}.positive_mentions, {src}.negative_mentions,
+           {src}.positive_mentions + {src}.negative_mentions,
+           CAST({src}.positive_mentions AS REAL) /
+               CASE WHEN {src}.positive_mentions + {src}.negative_mentions = 0 THEN 1
+                    ELSE {src}.positive_mentions + {src}.negative_mentions END,
+           {src}.year_range,
+           CAST(substr({src}.year_range, 1, 4) AS INTEGER),
+           CAST(substr({src}.year_range, -4) AS INTEGER)
+'''
+
+# One sentiment_platforms row per single platform of a combination such as
+# 'Blind+Glassdoor' (split with json_each, which triggers may use)
+_PLATFORMS_SELECT = '''
+    SELECT j.value, {src}.theme, {src}.platform
+    FROM {tables}json_each('["' || replace(replace(replace({src}.platform, '\\', '\\\\'),
+                                                  '"', '\\"'), '+', '","') || '"]') AS j
+'''
+
+# Chart 5 row of each theme over all its platforms (same columns as filtered_sentiment_query)
+_THEME_TOTALS_SELECT = '''
+    SELECT theme,
+           SUM(positive_mentions) AS positive_mentions,
+           SUM(negative_mentions) AS negative_mentions,
+           group_concat(platform, ', ') AS platform,
+           min(year_start) || '-' || max(year_end) AS year_range,
+           SUM(total) AS total,
+           CAST(SUM(positive_mentions) AS REAL) / max(SUM(total), 1) AS sentiment_ratio
+    FROM sentiment_summary {where}
+    GROUP BY theme
+'''
+
+_THEME_TOTALS_REFRESH = (
+    'DELETE FROM sentiment_theme_totals WHERE theme = {theme}; '
+    'INSERT INTO sentiment_theme_totals '
+    + _THEME_TOTALS_SELECT.format(where='WHERE theme = {theme}') + ';'
+)
+
+# ============================================
+# SCHEMA MIGRATIONS (applied in order, once)
+# ============================================
+MIGRATIONS = [
+    # 1: keyed tables with per-row hashes (replaces the drop-and-rebuild schema)
+    [
+        'DROP TABLE IF EXISTS platform_ratings',
+        'DROP TABLE IF EXISTS sentiment_themes',
+        '''
+        CREATE TABLE platform_ratings (
+            platform TEXT NOT NULL,
+            category TEXT NOT NULL,
+            score REAL,
+            max_score INTEGER,
+            review_count INTEGER,
+            date_range TEXT,
+            row_hash TEXT NOT NULL,
+            PRIMARY KEY (platform, category)
+        )
+        ''',
+        '''
+        CREATE TABLE sentiment_themes (
+            theme TEXT NOT NULL,
+            positive_mentions INTEGER,
+            negative_mentions INTEGER,
+            platform TEXT NOT NULL,
+            year_range TEXT,
+            row_hash TEXT NOT NULL,
+            PRIMARY KEY (theme, platform)
+        )
+        ''',
+        '''
+        CREATE TABLE source_hashes (
+            source TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            row_count INTEGER NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        ''',
+    ],
+    # 2: materialized sentiment view with derived columns, kept in sync by triggers
+    [
+        '''
+        CREATE TABLE sentiment_summary (
+            theme TEXT NOT NULL,
+            platform TEXT NOT NULL,
+            positive_mentions INTEGER,
+            negative_mentions INTEGER,
+            total INTEGER,
+            sentiment_ratio REAL,
+            year_range TEXT,
+            year_start INTEGER,
+            year_end INTEGER,
+            PRIMARY KEY (theme, platform)
+        )
+        ''',
+        'CREATE INDEX idx_sentiment_summary_ratio ON sentiment_summary (sentiment_ratio, theme)',
+        'CREATE INDEX idx_sentiment_summary_year_range ON sentiment_summary (year_range)',
+        'CREATE INDEX idx_sentiment_summary_years ON sentiment_summary (year_start, year_end)',
+        'CREATE INDEX idx_sentiment_summary_platform ON sentiment_summary (platform)',
+        f'''
+        CREATE TRIGGER sentiment_themes_ai AFTER INSERT ON sentiment_themes BEGIN
+            INSERT OR REPLACE INTO sentiment_summary {_SUMMARY_SELECT.format(src='NEW')};
+        END
+        ''',
+        f'''
+        CREATE TRIGGER sentiment_themes_au AFTER UPDATE ON sentiment_themes BEGIN
+            DELETE FROM sentiment_summary WHERE theme = OLD.theme AND platform = OLD.platform;
+            INSERT OR REPLACE INTO sentiment_summary {_SUMMARY_SELECT.format(src='NEW')};
+        END
+        ''',
+        '''
+        CREATE TRIGGER sentiment_themes_ad AFTER DELETE ON sentiment_themes BEGIN
+            DELETE FROM sentiment_summary WHERE theme = OLD.theme AND platform = OLD.platform;
+        END
+        ''',
+        f'''
+        INSERT INTO sentiment_summary
+        {_SUMMARY_SELECT.format(src='sentiment_themes')}
+        FROM sentiment_themes
+        ''',
+    ],
+    # 3: lookup tables so Chart 5 queries are index searches: every single platform
+    #    of a combination, and per-theme totals for the unfiltered chart
+    [
+        '''
+        CREATE TABLE sentiment_platforms (
+            platform TEXT NOT NULL,
+            theme TEXT NOT NULL,
+            combined TEXT NOT NULL,
+            PRIMARY KEY (platform, theme, combined)
+        ) WITHOUT ROWID
+        ''',
+        '''
+        CREATE TABLE sentiment_theme_totals (
+            theme TEXT PRIMARY KEY,
+            positive_mentions INTEGER,
+            negative_mentions INTEGER,
+            platform TEXT,
+            year_range TEXT,
+            total INTEGER,
+            sentiment_ratio REAL
+        )
+        ''',
+        'CREATE INDEX idx_sentiment_theme_totals_ratio ON sentiment_theme_totals (sentiment_ratio, theme)',
+        f'''
+        CREATE TRIGGER sentiment_summary_ai AFTER INSERT ON sentiment_summary BEGIN
+            INSERT OR IGNORE INTO sentiment_platforms {_PLATFORMS_SELECT.format(src='NEW', tables='')};
+            {_THEME_TOTALS_REFRESH.format(theme='NEW.theme')}
+        END
+        ''',
+        f'''
+        CREATE TRIGGER sentiment_summary_ad AFTER DELETE ON sentiment_summary BEGIN
+            DELETE FROM sentiment_platforms WHERE theme = OLD.theme AND combined = OLD.platform;
+            {_THEME_TOTALS_REFRESH.format(theme='OLD.theme')}
+        END
+        ''',
+        f'''
+        INSERT INTO sentiment_platforms
+        {_PLATFORMS_SELECT.format(src='sentiment_summary', tables='sentiment_summary, ')}
+        ''',
+        f'''
+        INSERT INTO sentiment_theme_totals
+        {_THEME_TOTALS_SELECT.format(where='')}
+        ''',
+    ],
+    # 4: file each source was ingested from, so start-ups keep following it
+    [
+        'ALTER TABLE source_hashes ADD COLUMN path TEXT',
+    ],
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+# ============================================
+# STATIC SOURCE DATA
+# ============================================
+PLATFORM_RATINGS_DATA = [
+    ('Blind', 'Overall', 3.5, 5, 357, '2024-2025'),
+    ('Blind', 'Work Life Balance', 4.3, 5, 357, '2024-2025'),
+    ('Blind', 'Management', 2.9, 5, 357, '2024-2025'),
+    ('Blind', 'Career Growth', 3.0, 5, 357, '2024-2025'),
+    ('Blind', 'Compensation', 3.8, 5, 357, '2024-2025'),
+    ('Glassdoor_SF', 'Overall', 3.8, 5, 57, '2024-2025'),
+    ('Glassdoor_SF', 'Work Life Balance', 4.1, 5, 57, '2024-2025'),
+    ('Glassdoor_SF', 'Career Opportunities', 3.3, 5, 57, '2024-2025'),
+    ('Comparably', 'Manager Onboarding', 1.3, 5, None, '2023-2024'),
+    ('Glassdoor_PM', 'Overall', 3.3, 5, None, '2024-2025'),
+    ('Indeed', 'Overall', 3.9, 5, None, '2024-2025')
+]
+
+# table -> (columns without row_hash, primary key columns)
+TABLES = {
+    'platform_ratings': (
+        ('platform', 'category', 'score', 'max_score', 'review_count', 'date_range'),
+        ('platform', 'category'),
+    ),
+    'sentiment_themes': (
+        ('theme', 'positive_mentions', 'negative_mentions', 'platform', 'year_range'),
+        ('theme', 'platform'),
+    ),
+}
+
+
+def connect(path=DB_PATH, timeout=30.0):
+    """Open a connection in WAL mode with a busy timeout for concurrent replicas"""
+    conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False,
+                           isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(f'PRAGMA busy_timeout={int(timeout * 1000)}')
+    return conn
+
+
+def connect_readonly(path=DB_PATH, timeout=30.0, cached_statements=128):
+    """Open a read-only connection; SQL text is reused via the statement cache"""
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True, timeout=timeout,
+                           check_same_thread=False, cached_statements=cached_statements)
+    conn.execute(f'PRAGMA busy_timeout={int(timeout * 1000)}')
+    return conn
+
+
+class ConnectionPool:
+    """
+    Bounded pool of read-only connections shared by all sessions.
+
+    A connection is only ever used by one thread at a time. Connections are
+    opened lazily up to `size`; further callers wait and the waits are counted.
+    A caller still waiting after `timeout` seconds gets sqlite3.OperationalError.
+    """
+
+    def __init__(self, path=DB_PATH, size=4, timeout=30.0):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return connect_readonly(self.path, self.timeout)
+                except Exception:
+                    self._opened -= 1
+                    raise
+
+        start = time.perf_counter()
+        try:
+            conn = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                f'connection pool exhausted: all {self.size} connections to {self.path} '
+                f'stayed busy for {self.timeout:g}s') from None
+        waited = time.perf_counter() - start
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of the `with` block"""
+        conn = self._acquire()
+        with self._lock:
+            self.acquisitions += 1
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def query(self, sql, params=()):
+        """Run a read query; returns (column names, rows)"""
+        with self.connection() as conn:
+            cur = conn.execute(sql, params)
+            return [d[0] for d in cur.description], cur.fetchall()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._opened = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': self.size,
+                'opened': self._opened,
+                'idle': self._idle.qsize(),
+                'acquisitions': self.acquisitions,
+                'waits': self.waits,
+                'wait_seconds': round(self.wait_seconds, 6),
+                'max_wait_seconds': round(self.max_wait_seconds, 6),
+            }
+
+
+def _hash(value):
+    return hashlib.sha256(repr(value).encode('utf-8')).hexdigest()
+
+
+def migrate(conn):
+    """Apply pending migrations; a no-op when the schema is already current"""
+    if conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+        return
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        # Re-check under the write lock: another replica may have migrated already
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        for statements in MIGRATIONS[version:]:
+            for sql in statements:
+                conn.execute(sql)
+        conn.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def _source_hash(conn, source):
+    row = conn.execute('SELECT content_hash FROM source_hashes WHERE source = ?',
+                       (source,)).fetchone()
+    return row[0] if row else None
+
+
+def sync_rows(conn, table, source, rows, content_hash=None, path=None):
+    """
+    Bring `table` in line with `rows`, writing only what changed. `path` is
+    the file the rows came from, recorded with the source hash.
+
+    Returns the number of rows inserted, updated or deleted (0 when the
+    source hash matches the previous ingest).
+    """
+    columns, key = TABLES[table]
+    content_hash = content_hash or _hash(rows)
+    if _source_hash(conn, source) == content_hash:
+        return 0
+
+    key_idx = [columns.index(c) for c in key]
+    wanted = {tuple(r[i] for i in key_idx): (r, _hash(r)) for r in rows}
+
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        if _source_hash(conn, source) == content_hash:
+            conn.execute('COMMIT')
+            return 0
+
+        existing = {tuple(r[:-1]): r[-1] for r in conn.execute(
+            f'SELECT {", ".join(key)}, row_hash FROM {table}')}
+
+        changed = [r + (h,) for k, (r, h) in wanted.items() if existing.get(k) != h]
+        removed = [k for k in existing if k not in wanted]
+
+        if changed:
+            cols = ', '.join(columns + ('row_hash',))
+            marks = ', '.join('?' * (len(columns) + 1))
+            updates = ', '.join(f'{c} = excluded.{c}' for c in columns + ('row_hash',)
+                                if c not in key)
+            conn.executemany(
+                f'INSERT INTO {table} ({cols}) VALUES ({marks}) '
+                f'ON CONFLICT ({", ".join(key)}) DO UPDATE SET {updates}',
+                changed)
+        if removed:
+            where = ' AND '.join(f'{c} = ?' for c in key)
+            conn.executemany(f'DELETE FROM {table} WHERE {where}', removed)
+
+        conn.execute(
+            'INSERT INTO source_hashes (source, content_hash, row_count, updated_at, path) '
+            'VALUES (?, ?, ?, ?, ?) ON CONFLICT (source) DO UPDATE SET '
+            'content_hash = excluded.content_hash, row_count = excluded.row_count, '
+            'updated_at = excluded.updated_at, path = excluded.path',
+            (source, content_hash, len(rows), datetime.now(timezone.utc).isoformat(), path))
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    return len(changed) + len(removed)
+
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def sync_platform_ratings(conn):
+    return sync_rows(conn, 'platform_ratings', 'platform_ratings', PLATFORM_RATINGS_DATA)
+
+
+def sync_sentiment_themes(conn, path=FEEDBACK_CSV, chunk_size=None):
+    """Stream-ingest `path`; skipped without parsing when the file bytes are unchanged"""
+    content_hash = _sha256_file(path)
+    if _source_hash(conn, 'sentiment_themes') == content_hash:
+        return 0
+
+    import ingest  # pulls in pandas; only needed when the source changed
+
+    return sync_rows(conn, 'sentiment_themes', 'sentiment_themes',
+                     ingest.aggregate_file(path, chunk_size or ingest.CHUNK_SIZE), content_hash,
+                     path)
+
+
+def sentiment_source(conn):
+    """
+    File sentiment_themes follows: ADYEN_SENTIMENT_SOURCE, else the file it
+    was last ingested from (e.g. `python ingest.py dump.jsonl`), else the CSV.
+    """
+    if SOURCE_OVERRIDE:
+        return SOURCE_OVERRIDE
+    row = conn.execute("SELECT path FROM source_hashes WHERE source = 'sentiment_themes'").fetchone()
+    return row[0] if row and row[0] else FEEDBACK_CSV
+
+
+def ensure_database(path=DB_PATH, csv_path=None):
+    """Migrate and ingest on a short-lived writer connection"""
+    conn = connect(path)
+    try:
+        migrate(conn)
+        sync_platform_ratings(conn)
+        source = csv_path or sentiment_source(conn)
+        if source != FEEDBACK_CSV and not os.path.exists(source):
+            # Never fall back to the CSV: that would replace an ingested dump
+            _log.warning('%s, the last sentiment source ingested, is missing: keeping its rows',
+                         source)
+        else:
+            sync_sentiment_themes(conn, source)
+    finally:
+        conn.close()
+
+
+# ============================================
+# QUERIES
+# ============================================
+def data_version(conn):
+    """Identifies the ingested data: changes whenever any source is re-ingested"""
+    row = conn.execute(
+        "SELECT group_concat(source || '=' || content_hash, ';') "
+        "FROM (SELECT source, content_hash FROM source_hashes ORDER BY source)").fetchone()
+    return row[0] or ''
+
+
+# ============================================
+# SENTIMENT FILTERS (memoized per data version)
+# ============================================
+# platforms: sorted tuple of single platforms, () = all
+# year_start/year_end: inclusive bounds a row's year range must overlap, None = open
+SentimentFilters = namedtuple('SentimentFilters', 'platforms year_start year_end min_mentions')
+NO_FILTERS = SentimentFilters((), None, None, 0)
+
+
+def sentiment_facets(conn):
+    """Filter choices: (single platforms, first year, last year, largest theme total)"""
+    platforms = set()
+    for (combined,) in conn.execute('SELECT DISTINCT platform FROM sentiment_summary'):
+        platforms.update(p.strip() for p in combined.split('+') if p.strip())
+    first, last, most = conn.execute(
+        'SELECT min(year_start), max(year_end), max(total) FROM sentiment_summary').fetchone()
+    return tuple(sorted(platforms)), first, last, most or 0
+
+
+def normalize_filters(facets, platforms=(), years=None, min_mentions=0):
+    """
+    Canonical SentimentFilters for the widget values, so equivalent selections
+    (any order, all platforms ticked, full year span) share one cache entry.
+    """
+    all_platforms, first, last, _ = facets
+    chosen = tuple(sorted(set(platforms) & set(all_platforms)))
+    if set(chosen) == set(all_platforms):
+        chosen = ()
+    year_start, year_end = years or (None, None)
+    if year_start is not None and (first is None or year_start <= first):
+        year_start = None
+    if year_end is not None and (last is None or year_end >= last):
+        year_end = None
+    return SentimentFilters(chosen, year_start, year_end, max(int(min_mentions or 0), 0))
+
+
+def filtered_sentiment_query(filters):
+    """
+    SQL and parameters for Chart 5 rows under `filters`, one row per theme.
+
+    Unfiltered, the rows come straight from sentiment_theme_totals in the
+    order of its ratio index. A platform filter is an exact match on the
+    sentiment_platforms primary key (the same token match as the Arrow
+    store), and year bounds use the years index. Only the per-theme
+    aggregates of a filtered query are sorted, one row per theme.
+    """
+    if not filters.platforms and filters.year_start is None and filters.year_end is None:
+        sql = ('SELECT theme, positive_mentions, negative_mentions, platform, year_range, '
+               'total, sentiment_ratio FROM sentiment_theme_totals '
+               'WHERE total >= ? ORDER BY sentiment_ratio, theme')
+        return sql, [filters.min_mentions]
+
+    where, params = [], []
+    if filters.platforms:
+        where.append('EXISTS (SELECT 1 FROM sentiment_platforms AS p '
+                     f'WHERE p.platform IN ({", ".join("?" * len(filters.platforms))}) '
+                     'AND p.theme = sentiment_summary.theme AND p.combined = sentiment_summary.platform)')
+        params += list(filters.platforms)
+    if filters.year_end is not None:
+        where.append('year_start <= ?')
+        params.append(filters.year_end)
+    if filters.year_start is not None:
+        where.append('year_end >= ?')
+        params.append(filters.year_start)
+    sql = (_THEME_TOTALS_SELECT.format(where='WHERE ' + ' AND '.join(where))
+           + 'HAVING SUM(total) >= ? ORDER BY sentiment_ratio, theme')
+    return sql, params + [filters.min_mentions]
+
+
+class QueryCache:
+    """
+    Size-bounded LRU of query results shared by all sessions. Keys carry the
+    data version, so re-ingested data never serves stale rows and old entries
+    simply age out.
+    """
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_query(self, key, query):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        value = query()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'max_entries': self.max_entries,
+                    'hits': self.hits, 'misses': self.misses}
+
@@ -0,0 +1,146 @@
+"""
+Headless export of every chart and embedded page into adyen_charts/.
+
+    python export_charts.py [--out adyen_charts] [--jobs N] [--force]
+
+Work is spread over a process pool (pyplot state is global and not
+thread-safe). Each output records the hash of its inputs in
+.export_manifest.json and is skipped when that hash is unchanged. Rendered
+PNGs are also stored in the render cache's disk tier, so the app starts warm.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import assets
+import charts
+import database
+import keywords
+import ratings
+from export_queue import write_atomic
+from render_cache import RenderCache, make_key
+
+MANIFEST_NAME = '.export_manifest.json'
+
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def plan_jobs():
+    """(output name, job kind, input hash) for everything that can be exported"""
+    database.ensure_database()
+    pool = database.ConnectionPool(size=1)
+    with pool.connection() as conn:
+        version = database.data_version(conn)
+    pool.close()
+    jobs = [
+        ('02_sentiment_butterfly.png', 'chart_02', charts.chart_02_key(version)),
+        ('03_top_keywords.png', 'chart_03', charts.chart_03_key(keywords.onboarding_data())),
+        ('03_top_keywords.html', 'chart_03_html', charts.chart_03_key(keywords.onboarding_data())),
+        ('07_platform_ratings.png', 'chart_07', charts.chart_07_key(version)),
+        ('platform_ratings.json', 'ratings_json', make_key('ratings_json', version)),
+    ]
+    for page in assets.PAGES:
+        jobs.append((page, 'page', _sha256_file(assets.AssetStore().path(page))))
+    return jobs
+
+
+def run_job(out_dir, name, kind, key):
+    """Produce one output file; runs inside a worker process"""
+    start = time.perf_counter()
+    path = os.path.join(out_dir, name)
+    if kind == 'chart_02':
+        pool = database.ConnectionPool(size=1)
+        df = charts.load_sentiment(pool)
+        pool.close()
+        data = RenderCache().get_or_render(key, lambda: charts.render_chart_02(df))
+    elif kind == 'chart_03':
+        onboarding_data = keywords.onboarding_data()
+        data = RenderCache().get_or_render(key, lambda: charts.render_chart_03(onboarding_data))
+    elif kind in ('chart_07', 'ratings_json'):
+        pool = database.ConnectionPool(size=1)
+        pivot, data = ratings.cached_pivot(pool)
+        pool.close()
+        if kind == 'chart_07':
+            data = RenderCache().get_or_render(key, lambda: charts.render_chart_07(pivot))
+    elif kind == 'chart_03_html':
+        html = charts.create_chart_03_plotly_html(keywords.onboarding_data())
+        data = html.encode('utf-8') if html is not None else None
+    else:
+        with open(assets.AssetStore().path(name), 'rb') as f:
+            data = f.read()
+
+    if data is None:
+        return name, False, time.perf_counter() - start
+    write_atomic(path, data)
+    return name, True, time.perf_counter() - start
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def export_all(out_dir=charts.CHART_DIR, jobs=None, force=False):
+    """Export every stale output; returns {name: 'written' | 'skipped' | 'failed'}"""
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    planned = plan_jobs()
+    stale = [(name, kind, key) for name, kind, key in planned
+             if force or manifest.get(name) != key
+             or not os.path.exists(os.path.join(out_dir, name))]
+    results = {name: 'skipped' for name, _, _ in planned}
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            futures = [pool.submit(run_job, out_dir, name, kind, key)
+                       for name, kind, key in stale]
+            for (name, _, key), future in zip(stale, futures):
+                try:
+                    name, ok, seconds = future.result()
+                except Exception as e:  # one broken chart must not discard the others
+                    results[name] = 'failed'
+                    print(f'{"failed":>8}  {name}  ({type(e).__name__}: {e})')
+                    continue
+                results[name] = 'written' if ok else 'failed'
+                if ok:
+                    manifest[name] = key
+                print(f'{results[name]:>8}  {name}  ({seconds:.2f}s)')
+
+    write_atomic(os.path.join(out_dir, MANIFEST_NAME),
+                 json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--out', default=charts.CHART_DIR, help='output directory')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--force', action='store_true', help='re-export even if inputs are unchanged')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = export_all(args.out, args.jobs, args.force)
+    counts = {s: sum(1 for r in results.values() if r == s) for s in ('written', 'skipped', 'failed')}
+    print(f"{counts['written']} written, {counts['skipped']} up to date, "
+          f"{counts['failed']} failed in {time.perf_counter() - start:.2f}s")
+    return 1 if counts['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Background writer for the adyen_charts/ exports.
+
+The interactive path hands finished bytes (or a callable that produces them)
+to the queue and returns immediately. One worker thread writes each file via
+a temp file + rename, so readers never see a partial file. Requests for the
+same output that arrive before it is written are coalesced: only the latest
+one is written.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+
+def write_atomic(path, data):
+    """Write bytes to `path` through a temp file in the same directory"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class ExportQueue:
+    """Single-worker, coalescing queue of file exports."""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self._pending = OrderedDict()  # name -> bytes/str or callable
+        self._cond = threading.Condition()
+        self._busy = False
+        self.submitted = 0
+        self.coalesced = 0
+        self.written = 0
+        self.failed = 0
+        self._worker = threading.Thread(target=self._run, name='chart-export', daemon=True)
+        self._worker.start()
+
+    def submit(self, name, data):
+        """Queue `data` (bytes, str, or a zero-arg callable returning either) for `name`"""
+        with self._cond:
+            self.submitted += 1
+            if name in self._pending:
+                self.coalesced += 1
+            self._pending[name] = data
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._busy = False
+                    self._cond.notify_all()
+                    self._cond.wait()
+                name, data = self._pending.popitem(last=False)
+                self._busy = True
+            try:
+                if callable(data):
+                    data = data()
+                if data is not None:
+                    write_atomic(os.path.join(self.out_dir, name), data)
+                    self.written += 1
+            except Exception:
+                self.failed += 1
+
+    def flush(self, timeout=None):
+        """Block until every queued export has been written; False on timeout"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def stats(self):
+        with self._cond:
+            return {
+                'pending': len(self._pending),
+                'submitted': self.submitted,
+                'coalesced': self.coalesced,
+                'written': self.written,
+                'failed': self.failed,
+            }
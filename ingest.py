@@ -0,0 +1,141 @@
+"""
+Streaming ingest of review exports into sentiment_themes.
+
+    python ingest.py reviews.jsonl [--chunk-size 100000] [--db adyen_research.db]
+
+Reads CSV or JSONL in bounded chunks and aggregates positive/negative
+mentions per (theme, platform) as it goes, so peak memory depends on the
+number of distinct themes, not on the size of the dump. Two input shapes
+are accepted:
+
+- aggregated rows, like feedback_data.csv:
+  theme, positive_mentions, negative_mentions, platform, year_range
+- raw reviews, one mention per row:
+  theme, platform, sentiment ('positive' / 'negative'), year_range | year | date
+
+year_range is parsed into numeric start/end years by slicing ("2024",
+"2022-2025", "2024-05-01"), and only rows overlapping 2024-2026 are kept.
+The path is recorded in source_hashes, so later app start-ups keep syncing
+from this file instead of the bundled CSV.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+RECENT_START, RECENT_END = 2024, 2026
+CHUNK_SIZE = 100_000
+
+_KEY = ['theme', 'platform']
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    """Yield DataFrames of at most `chunk_size` rows from a CSV or JSONL file"""
+    if path.endswith(('.jsonl', '.ndjson', '.json')):
+        reader = pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+    else:
+        reader = pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False)
+    with reader:
+        yield from reader
+
+
+def parse_years(values):
+    """Vectorized year_range → (start, end) integer Series; no per-row regex"""
+    s = values.astype(str).str.strip()
+    start = pd.to_numeric(s.str.slice(0, 4), errors='coerce')
+    # "2022-2025" ends in a year; ISO dates ("2024-05-01") and plain years do not span
+    is_span = (s.str.len() == 9) & (s.str.slice(4, 5) == '-')
+    end = pd.to_numeric(s.str.slice(-4).where(is_span, s.str.slice(0, 4)), errors='coerce')
+    return start, end
+
+
+def aggregate_chunk(df):
+    """Reduce one chunk to per-(theme, platform) sums and year bounds"""
+    if 'year_range' in df:
+        years = df['year_range']
+    elif 'year' in df:
+        years = df['year']
+    else:
+        years = df['date']
+    start, end = parse_years(years)
+
+    if 'sentiment' in df:
+        sentiment = df['sentiment'].astype(str).str.strip().str.lower()
+        positive = (sentiment == 'positive').astype('int64')
+        negative = (sentiment == 'negative').astype('int64')
+    else:
+        positive = pd.to_numeric(df['positive_mentions'], errors='coerce').fillna(0).astype('int64')
+        negative = pd.to_numeric(df['negative_mentions'], errors='coerce').fillna(0).astype('int64')
+
+    out = pd.DataFrame({
+        'theme': df['theme'].astype(str).str.strip(),
+        'platform': df['platform'].astype(str).str.strip(),
+        'positive_mentions': positive,
+        'negative_mentions': negative,
+        'year_start': start,
+        'year_end': end,
+    })
+    keep = (out['year_end'] >= RECENT_START) & (out['year_start'] <= RECENT_END) & (out['theme'] != '')
+    return _combine(out[keep])
+
+
+def _combine(df):
+    return df.groupby(_KEY, sort=False, as_index=False).agg(
+        positive_mentions=('positive_mentions', 'sum'),
+        negative_mentions=('negative_mentions', 'sum'),
+        year_start=('year_start', 'min'),
+        year_end=('year_end', 'max'),
+    )
+
+
+def aggregate_file(path, chunk_size=CHUNK_SIZE):
+    """
+    Stream `path` and return sentiment_themes rows
+    (theme, positive_mentions, negative_mentions, platform, year_range).
+    """
+    totals = None
+    for chunk in read_chunks(path, chunk_size):
+        part = aggregate_chunk(chunk)
+        totals = part if totals is None else _combine(pd.concat([totals, part], ignore_index=True))
+
+    if totals is None:
+        return []
+
+    rows = []
+    for rec in totals.itertuples(index=False):
+        start, end = int(rec.year_start), int(rec.year_end)
+        year_range = str(start) if start == end else f'{start}-{end}'
+        rows.append((rec.theme, int(rec.positive_mentions), int(rec.negative_mentions),
+                     rec.platform, year_range))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Stream a review export into sentiment_themes')
+    parser.add_argument('path', help='CSV or JSONL file')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--db', default=None, help='SQLite database (default: adyen_research.db)')
+    args = parser.parse_args(argv)
+
+    import database
+
+    if not os.path.exists(args.path):
+        print(f'{args.path} not found', file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    conn = database.connect(args.db or database.DB_PATH)
+    try:
+        database.migrate(conn)
+        changed = database.sync_sentiment_themes(conn, args.path, args.chunk_size)
+    finally:
+        conn.close()
+    print(f'{changed} rows changed in {time.perf_counter() - start:.2f}s')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+Opt-in per-rerun stage timings and payload sizes.
+
+Enabled with ADYEN_INSTRUMENT=1; otherwise every hook is a no-op. app.py
+wraps each hot-path stage of a rerun (page config, inject_clarity, CSS,
+init_database lookup, chart function, savefig, image/HTML embed) in
+`stage(name)` and reports payload sizes with `count_bytes(element, n)`.
+Results go to:
+
+- the sidebar debug panel, shown with `?debug=1` in the URL
+- `/metrics` on the static server (Prometheus text format)
+
+Process-wide counters of other components (the connection pool, the render
+cache) are exported next to them once registered with `register_stats`.
+- ADYEN_METRICS_LOG, when set: one JSON line per rerun
+
+Timings are kept per script thread, so concurrent sessions don't mix.
+
+The selected chart of every rerun is counted, and logged to ADYEN_METRICS_LOG
+(as `{"ts", "chart"}` only), even without ADYEN_INSTRUMENT: prewarm.py
+orders its work by these counts.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+ENABLED = os.environ.get('ADYEN_INSTRUMENT', '') not in ('', '0', 'false')
+LOG_PATH = os.environ.get('ADYEN_METRICS_LOG', '')
+
+# Histogram bucket upper bounds, in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_NULL = contextlib.nullcontext()
+_local = threading.local()
+_lock = threading.Lock()
+_histograms = {}  # (chart, stage) -> [bucket counts..., +Inf count, sum]
+_bytes = {}  # (chart, element) -> total bytes
+_reruns = {}  # chart -> count
+_stats = {}  # name -> (stats() -> {key: number}, keys that are counters)
+
+
+class Rerun:
+    """Stage timings and element sizes of one script run"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.stages = {}  # stage -> seconds
+        self.sizes = {}  # element -> bytes
+        self.chart = None
+
+    def as_dict(self):
+        return {
+            'chart': self.chart,
+            'total_s': round(time.perf_counter() - self.start, 6),
+            'stages': {k: round(v, 6) for k, v in self.stages.items()},
+            'bytes': dict(self.sizes),
+        }
+
+
+def current():
+    """The Rerun being recorded on this thread, or None"""
+    return getattr(_local, 'rerun', None)
+
+
+def begin_rerun():
+    if ENABLED:
+        _local.rerun = Rerun()
+
+
+@contextlib.contextmanager
+def _timed(rerun, name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        rerun.stages[name] = rerun.stages.get(name, 0.0) + time.perf_counter() - start
+
+
+def stage(name):
+    """Context manager adding the elapsed time to `name` in the current rerun"""
+    rerun = current() if ENABLED else None
+    if rerun is None:
+        return _NULL
+    return _timed(rerun, name)
+
+
+def count_bytes(element, size):
+    rerun = current() if ENABLED else None
+    if rerun is not None:
+        rerun.sizes[element] = rerun.sizes.get(element, 0) + size
+
+
+def _observe(key, seconds):
+    hist = _histograms.get(key)
+    if hist is None:
+        hist = _histograms[key] = [0] * (len(BUCKETS) + 2)
+    for i, bound in enumerate(BUCKETS):
+        if seconds <= bound:
+            hist[i] += 1
+    hist[-2] += 1
+    hist[-1] += seconds
+
+
+def end_rerun(chart):
+    """Count the selected chart, fold the current rerun into the process totals and return it"""
+    rerun = current() if ENABLED else None
+    record = None
+    if rerun is not None:
+        _local.rerun = None
+        rerun.chart = chart
+        record = rerun.as_dict()
+    with _lock:
+        _reruns[chart] = _reruns.get(chart, 0) + 1
+        if record is not None:
+            _observe((chart, 'total'), record['total_s'])
+            for name, seconds in rerun.stages.items():
+                _observe((chart, name), seconds)
+            for element, size in rerun.sizes.items():
+                _bytes[(chart, element)] = _bytes.get((chart, element), 0) + size
+        if LOG_PATH:
+            line = {'ts': round(time.time(), 3), **(record or {'chart': chart})}
+            try:
+                with open(LOG_PATH, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(line) + '\n')
+            except OSError:
+                pass
+    return record
+
+
+def register_stats(name, stats, counters=()):
+    """
+    Export `stats()`, a dict of numbers, on /metrics as adyen_<name>_<key>
+    (keys in `counters` as <key>_total counters, the rest as gauges).
+    """
+    with _lock:
+        _stats[name] = (stats, frozenset(counters))
+
+
+def component_stats():
+    """{name: stats()} of every registered component"""
+    with _lock:
+        sources = dict(_stats)
+    return {name: stats() for name, (stats, _) in sorted(sources.items())}
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text():
+    """Process totals in the Prometheus text exposition format"""
+    with _lock:
+        histograms = {k: list(v) for k, v in _histograms.items()}
+        sizes = dict(_bytes)
+        reruns = dict(_reruns)
+
+    lines = ['# HELP adyen_reruns_total Script reruns per selected chart',
+             '# TYPE adyen_reruns_total counter']
+    lines += [f'adyen_reruns_total{{chart="{_label(c)}"}} {n}' for c, n in sorted(reruns.items())]
+
+    lines += ['# HELP adyen_rerun_stage_seconds Time spent per rerun stage',
+              '# TYPE adyen_rerun_stage_seconds histogram']
+    for (chart, name), hist in sorted(histograms.items()):
+        labels = f'chart="{_label(chart)}",stage="{_label(name)}"'
+        for bound, count in zip(BUCKETS, hist):
+            lines.append(f'adyen_rerun_stage_seconds_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f'adyen_rerun_stage_seconds_bucket{{{labels},le="+Inf"}} {hist[-2]}')
+        lines.append(f'adyen_rerun_stage_seconds_sum{{{labels}}} {hist[-1]:.6f}')
+        lines.append(f'adyen_rerun_stage_seconds_count{{{labels}}} {hist[-2]}')
+
+    lines += ['# HELP adyen_element_bytes_total Payload bytes sent per element',
+              '# TYPE adyen_element_bytes_total counter']
+    lines += [f'adyen_element_bytes_total{{chart="{_label(c)}",element="{_label(e)}"}} {n}'
+              for (c, e), n in sorted(sizes.items())]
+
+    with _lock:
+        sources = dict(_stats)
+    for name, (stats, counters) in sorted(sources.items()):
+        for key, value in stats().items():
+            metric, kind = f'adyen_{name}_{key}', 'gauge'
+            if key in counters:
+                metric, kind = metric + '_total', 'counter'
+            lines += [f'# TYPE {metric} {kind}', f'{metric} {value}']
+    return '\n'.join(lines) + '\n'
+
+
+def rerun_counts():
+    """{chart: reruns} of this process"""
+    with _lock:
+        return dict(_reruns)
+
+
+def summary():
+    """[(chart, stage, count, mean_ms)] of the process totals, slowest first"""
+    with _lock:
+        rows = [(chart, name, hist[-2], hist[-1] * 1000 / hist[-2])
+                for (chart, name), hist in _histograms.items() if hist[-2]]
+    rows.sort(key=lambda r: r[3], reverse=True)
+    return rows
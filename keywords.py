@@ -0,0 +1,148 @@
+"""
+Onboarding phrase counts for the Chart 6 tag cloud.
+
+All phrase variants are compiled into one regex alternation and matched over
+the whole corpus with pandas' vectorized string methods, one chunk at a time.
+A review counts once per phrase however often it repeats it. Counts are
+cached per corpus content hash (memory + JSON on disk), so an unchanged
+corpus is never recounted.
+
+Without a corpus (ADYEN_REVIEWS_CORPUS unset or missing) the tag cloud uses
+the curated counts in charts.ONBOARDING_DATA.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+
+import charts
+
+CORPUS_PATH = os.environ.get('ADYEN_REVIEWS_CORPUS', '')
+CACHE_DIR = os.path.join(charts.CHART_DIR, '.keyword_cache')
+TOP_N = 15
+
+# Tag label -> lowercase variants that count as a mention
+ONBOARDING_PHRASES = {
+    "Sink or Swim":           ["sink or swim", "deep end", "thrown in", "thrown into"],
+    "Tribal Knowledge":       ["tribal knowledge", "knowledge silo", "knowledge silos", "in people's heads"],
+    "No Structured Training": ["no structured training", "no formal training", "lack of structured training"],
+    "Zero Guidance":          ["zero guidance", "no guidance", "little guidance"],
+    "Outdated Docs":          ["outdated docs", "outdated documentation", "docs are outdated",
+                               "documentation is outdated"],
+    "No Feedback Loop":       ["no feedback loop", "no feedback", "lack of feedback"],
+    "Office Politics":        ["office politics", "political"],
+    "Figure It Out":          ["figure it out", "figure things out", "figure out yourself"],
+    "Context Overload":       ["context overload", "information overload", "too much context"],
+    "No Tech Context":        ["no tech context", "no technical context", "lack of context"],
+    "Fake Politeness":        ["fake politeness", "fake polite", "fake nice"],
+    "Trial by Fire":          ["trial by fire", "baptism of fire"],
+    "No Mentorship":          ["no mentorship", "no mentor", "lack of mentorship"],
+    "Chaotic Process":        ["chaotic process", "chaotic", "chaos"],
+    "Generic Training":       ["generic training", "generic onboarding"],
+}
+
+# Longer wording used in the Chart 6 "Key Insights" box
+PHRASE_DESCRIPTIONS = {
+    "Sink or Swim": "Thrown into the deep end (Sink or Swim)",
+    "Tribal Knowledge": "Tribal knowledge hoarding",
+    "No Structured Training": "Lack of structured training",
+}
+
+# Longer variants first so "no feedback loop" wins over "no feedback"
+_VARIANT_TO_LABEL = {v: label for label, variants in ONBOARDING_PHRASES.items() for v in variants}
+_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(v) for v in sorted(_VARIANT_TO_LABEL, key=len, reverse=True)) + r')\b')
+# Part of the on-disk cache name, so counts are redone when the phrase list changes
+_PATTERN_KEY = hashlib.sha256(_PATTERN.pattern.encode('utf-8')).hexdigest()[:12]
+
+_memory = {}  # corpus hash -> [(label, count), ...]
+_fingerprints = {}  # (path, mtime_ns, size) -> corpus hash
+_lock = threading.Lock()
+
+
+def count_phrases(texts):
+    """Per-label mention counts for an iterable/Series of review texts"""
+    import pandas as pd
+
+    s = pd.Series(texts, dtype='object').fillna('').astype(str).str.lower()
+    matches = s.str.findall(_PATTERN).explode().dropna()
+    if matches.empty:
+        return pd.Series(0, index=list(ONBOARDING_PHRASES), dtype='int64')
+    # One mention per review per label
+    hits = pd.DataFrame({'review': matches.index, 'label': matches.map(_VARIANT_TO_LABEL).to_numpy()})
+    counts = hits.drop_duplicates()['label'].value_counts()
+    return counts.reindex(list(ONBOARDING_PHRASES), fill_value=0).astype('int64')
+
+
+def _text_column(chunk):
+    for name in ('text', 'review', 'body', 'pros_cons', 'theme'):
+        if name in chunk:
+            return chunk[name]
+    return chunk.iloc[:, 0]
+
+
+def count_file(path, chunk_size=None):
+    """Stream a CSV/JSONL corpus and count phrases chunk by chunk"""
+    import pandas as pd
+
+    import ingest
+
+    total = pd.Series(0, index=list(ONBOARDING_PHRASES), dtype='int64')
+    for chunk in ingest.read_chunks(path, chunk_size or ingest.CHUNK_SIZE):
+        total = total.add(count_phrases(_text_column(chunk)), fill_value=0).astype('int64')
+    return total
+
+
+def _corpus_hash(path):
+    st = os.stat(path)
+    fingerprint = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    digest = _fingerprints.get(fingerprint)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        digest = h.hexdigest()
+        _fingerprints[fingerprint] = digest
+    return digest
+
+
+def phrase_counts(path):
+    """Sorted [(label, count)] for a corpus file, cached per content hash and phrase list"""
+    digest = _corpus_hash(path)
+    with _lock:
+        if digest in _memory:
+            return _memory[digest]
+
+    cache_path = os.path.join(CACHE_DIR, f'{digest}.{_PATTERN_KEY}.json')
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            result = [tuple(item) for item in json.load(f)]
+    except (OSError, ValueError):
+        counts = count_file(path).sort_values(ascending=False, kind='stable')
+        result = [(label, int(c)) for label, c in counts.items()]
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+        except OSError:
+            pass
+
+    with _lock:
+        _memory[digest] = result
+    return result
+
+
+def describe(label):
+    return PHRASE_DESCRIPTIONS.get(label, label)
+
+
+def onboarding_data(path=None):
+    """Tag cloud input: top phrases from the corpus, or the curated defaults"""
+    path = path or CORPUS_PATH
+    if not path or not os.path.exists(path):
+        return charts.ONBOARDING_DATA
+    data = [(label, c) for label, c in phrase_counts(path) if c > 0][:TOP_N]
+    return data or charts.ONBOARDING_DATA
@@ -0,0 +1,276 @@
+"""
+Multi-session load test for the dashboard.
+
+    python loadtest.py [--sessions 1,4,8,16] [--duration 30] [--think 0.0]
+                       [--seed 0] [--json out.json]
+
+Starts one `streamlit run app.py --server.headless true` server in a
+scratch copy of the data files and drives N concurrent viewers against it
+over the same websocket protocol a browser tab uses (`/_stcore/stream`,
+BackMsg/ForwardMsg protobufs). Sessions therefore share st.cache_resource,
+the connection pool and the render cache exactly like real tabs. Before the
+first level one untimed session visits every chart, so the levels measure a
+warm server. Each session then paints the default page and keeps switching
+`selected_chart` to a random option (optionally pausing --think seconds
+between clicks) until --duration elapses; a rerun is timed from sending the
+BackMsg to the ForwardMsg that reports the script finished. The watcher
+fragment's auto-rerun ticks are not replayed.
+
+For each concurrency level it reports reruns/s, rerun latency percentiles
+(per chart and overall), the server's CPU seconds per session and per rerun,
+and the server's RSS at start, end and peak, all read from /proc/<pid> of
+the one server process.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from benchmark import CHART_OPTIONS, DATA_FILES, HERE, percentile
+
+_DONE = {
+    ForwardMsg.ScriptFinishedStatus.FINISHED_SUCCESSFULLY,
+    ForwardMsg.ScriptFinishedStatus.FINISHED_WITH_COMPILE_ERROR,
+}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(workdir, port, timeout=120):
+    """`streamlit run app.py` in `workdir`; returns the Popen once /_stcore/health answers"""
+    env = dict(os.environ)
+    env.setdefault('ADYEN_CLARITY_ID', '')  # no analytics tag in measurements
+    log = open(os.path.join(workdir, 'server.log'), 'wb')
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', os.path.join(HERE, 'app.py'),
+         '--server.headless', 'true', '--server.port', str(port),
+         '--server.address', '127.0.0.1', '--browser.gatherUsageStats', 'false'],
+        cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT)
+    log.close()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            break
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=2):
+                return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    with open(os.path.join(workdir, 'server.log'), encoding='utf-8', errors='replace') as f:
+        raise RuntimeError(f'streamlit server did not start:\n{f.read()[-2000:]}')
+
+
+def _proc_read(pid, name):
+    with open(f'/proc/{pid}/{name}') as f:
+        return f.read()
+
+
+def process_cpu_seconds(pid):
+    # utime and stime are fields 14 and 15; the command name may contain spaces
+    fields = _proc_read(pid, 'stat').rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+def process_rss_mb(pid):
+    return int(_proc_read(pid, 'statm').split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+def process_peak_rss_mb(pid):
+    for line in _proc_read(pid, 'status').splitlines():
+        if line.startswith('VmHWM:'):
+            return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def reset_peak_rss(pid):
+    """Restart VmHWM from the current RSS so each level reports its own peak"""
+    try:
+        with open(f'/proc/{pid}/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass  # older kernels: the peak is then the server's lifetime high-water mark
+
+
+def latency_stats(samples):
+    samples = sorted(samples)
+    if not samples:
+        return {'n': 0}
+    return {
+        'n': len(samples),
+        'p50_ms': round(percentile(samples, 0.50), 1),
+        'p95_ms': round(percentile(samples, 0.95), 1),
+        'p99_ms': round(percentile(samples, 0.99), 1),
+        'max_ms': round(samples[-1], 1),
+    }
+
+
+async def rerun(ws, widgets=()):
+    """
+    Send one rerun_script BackMsg and read ForwardMsgs until the script
+    finishes. Returns (ms, selectbox proto or None, exception messages).
+    """
+    msg = BackMsg()
+    msg.rerun_script.query_string = ''
+    msg.rerun_script.widget_states.widgets.extend(widgets)
+    start = time.perf_counter()
+    await ws.send(msg.SerializeToString())
+    selectbox, errors = None, []
+    while True:
+        forward = ForwardMsg()
+        forward.ParseFromString(await ws.recv())
+        kind = forward.WhichOneof('type')
+        if kind == 'delta' and forward.delta.WhichOneof('type') == 'new_element':
+            element = forward.delta.new_element
+            if element.WhichOneof('type') == 'selectbox' and selectbox is None:
+                selectbox = element.selectbox
+            elif element.WhichOneof('type') == 'exception':
+                errors.append(f'{element.exception.type}: {element.exception.message}')
+        elif kind == 'script_finished' and forward.script_finished in _DONE:
+            # FINISHED_EARLY_FOR_RERUN means st.rerun() started the next run: keep reading
+            return (time.perf_counter() - start) * 1000, selectbox, errors
+
+
+def _choose(selectbox, option):
+    return [WidgetState(id=selectbox.id, string_value=option)]
+
+
+async def warm_up(url):
+    """Pay imports, migrations and first renders once so they are not billed to a level"""
+    async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as ws:
+        _, selectbox, _ = await rerun(ws)
+        for option in CHART_OPTIONS:
+            await rerun(ws, _choose(selectbox, option))
+
+
+async def run_session(url, index, duration, think, seed, record):
+    """One simulated viewer clicking through the chart selector"""
+    rng = random.Random(seed * 1000 + index)
+    deadline = time.monotonic() + duration
+    try:
+        async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as ws:
+            ms, selectbox, errors = await rerun(ws)
+            record['first_paint_ms'] = ms
+            record['errors'].extend(errors)
+            current = selectbox.options[selectbox.default] if selectbox.HasField('default') else None
+            while time.monotonic() < deadline:
+                option = rng.choice([o for o in CHART_OPTIONS if o != current])
+                ms, _, errors = await rerun(ws, _choose(selectbox, option))
+                record['samples'].append((option, ms))
+                record['errors'].extend(f'{option}: {e}' for e in errors)
+                current = option
+                if think:
+                    await asyncio.sleep(rng.uniform(0, 2 * think))
+    except Exception as e:  # still report what was measured
+        record['errors'].append(f'{type(e).__name__}: {e}')
+
+
+async def _drive(url, sessions, duration, think, seed):
+    records = [{'first_paint_ms': None, 'samples': [], 'errors': []} for _ in range(sessions)]
+    await asyncio.gather(*(run_session(url, i, duration, think, seed, records[i])
+                           for i in range(sessions)))
+    return records
+
+
+def run_level(url, pid, sessions, duration, think, seed):
+    """Drive `sessions` concurrent viewers for `duration` seconds against the server `pid`"""
+    reset_peak_rss(pid)
+    rss_start = process_rss_mb(pid)
+    cpu_start = process_cpu_seconds(pid)
+    wall_start = time.perf_counter()
+    records = asyncio.run(_drive(url, sessions, duration, think, seed))
+    wall = time.perf_counter() - wall_start
+    cpu = process_cpu_seconds(pid) - cpu_start
+    rss_end = process_rss_mb(pid)
+
+    samples = [s for r in records for s in r['samples']]
+    reruns = len(samples)
+    return {
+        'sessions': sessions,
+        'wall_s': round(wall, 2),
+        'reruns': reruns,
+        'reruns_per_s': round(reruns / wall, 2) if wall else 0.0,
+        'first_paint': latency_stats([r['first_paint_ms'] for r in records if r['first_paint_ms']]),
+        'latency': latency_stats([ms for _, ms in samples]),
+        'per_chart': {option: latency_stats([ms for o, ms in samples if o == option])
+                      for option in CHART_OPTIONS},
+        'cpu_s': round(cpu, 2),
+        'cpu_s_per_session': round(cpu / sessions, 3),
+        'cpu_ms_per_rerun': round(cpu * 1000 / reruns, 1) if reruns else None,
+        'rss_start_mb': round(rss_start, 1),
+        'rss_end_mb': round(rss_end, 1),
+        'rss_peak_mb': round(max(process_peak_rss_mb(pid), rss_end), 1),
+        'rss_growth_mb': round(rss_end - rss_start, 1),
+        'errors': [e for r in records for e in r['errors']][:20],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Concurrent-session load test')
+    parser.add_argument('--sessions', default='1,4,8,16',
+                        help='comma-separated concurrency levels, run in order')
+    parser.add_argument('--duration', type=float, default=30, help='seconds per level')
+    parser.add_argument('--think', type=float, default=0.0,
+                        help='mean pause between clicks, in seconds')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='write results to this file')
+    args = parser.parse_args(argv)
+    levels = [int(n) for n in args.sessions.split(',') if n.strip()]
+
+    workdir = tempfile.mkdtemp(prefix='adyen-load-')
+    for name in DATA_FILES:
+        shutil.copy(os.path.join(HERE, name), workdir)
+    port = free_port()
+    url = f'ws://127.0.0.1:{port}/_stcore/stream'
+    server = start_server(workdir, port)
+    try:
+        asyncio.run(warm_up(url))
+        results = []
+        for sessions in levels:
+            result = run_level(url, server.pid, sessions, args.duration, args.think, args.seed)
+            results.append(result)
+            print(f'{sessions:>3} sessions  {result["reruns_per_s"]:>7.2f} reruns/s  '
+                  f'p50 {result["latency"].get("p50_ms", 0):>7.1f} ms  '
+                  f'p95 {result["latency"].get("p95_ms", 0):>7.1f} ms  '
+                  f'p99 {result["latency"].get("p99_ms", 0):>7.1f} ms  '
+                  f'cpu/session {result["cpu_s_per_session"]:>6.2f} s  '
+                  f'rss {result["rss_start_mb"]:.0f}->{result["rss_end_mb"]:.0f} MB '
+                  f'(peak {result["rss_peak_mb"]:.0f})', flush=True)
+            for error in result['errors'][:3]:
+                print(f'    ERROR {error[:120]}')
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            server.kill()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'duration_s': args.duration, 'think_s': args.think,
+                       'cpu_count': os.cpu_count(), 'server_pid': server.pid,
+                       'levels': results}, f, indent=2)
+    return 1 if any(r['errors'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""
+Prerender the whole dashboard into a static site, and read it back.
+
+    python prerender.py [--out adyen_charts/site] [--prune]
+
+Writes a self-contained directory that nginx or a CDN can serve as is:
+
+- the embedded pages (Charts 1-4) as content-hashed files
+- Charts 5 and 7 as Plotly figure JSON (drawn in the browser) plus an
+  optimized PNG fallback; Chart 6 as an optimized PNG
+- index.html, a light shell with the chart navigation
+- site.json, the manifest mapping each chart to its files
+
+Hashed files get .gz (and .br) twins for `gzip_static`, and can be cached
+forever; only index.html and site.json need revalidation. --prune removes
+hashed files that the new manifest no longer references.
+
+With ADYEN_SNAPSHOT=1, app.py serves Charts 1-7 from this directory instead
+of querying and rendering, and only falls back to live rendering for the
+interactive parts (filtered Chart 5).
+"""
+
+import argparse
+import html
+import io
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime, timezone
+
+import charts
+import static_server
+
+ENABLED = os.environ.get('ADYEN_SNAPSHOT', '') not in ('', '0', 'false')
+SITE_DIR = os.environ.get('ADYEN_SNAPSHOT_DIR', os.path.join(charts.CHART_DIR, 'site'))
+MANIFEST_NAME = 'site.json'
+
+_HASHED = re.compile(r'\.[0-9a-f]{12}\.')
+
+# Chart label -> embedded page, as in the app's selectbox
+PAGE_CHARTS = {
+    'Chart 1': ('Adyen Onboarding Demo', 'adyen_chart4.html'),
+    'Chart 2': ('PM Decision Simulation', 'adyen_pm_sim.html'),
+    'Chart 3': ('The Full Case', 'adyen_full_case.html'),
+    'Chart 4': ('Research Intelligence', 'onboarding_viz.html'),
+}
+CHART_TITLES = {
+    'Chart 5': 'Sentiment Analysis',
+    'Chart 6': 'Top Onboarding Issues',
+    'Chart 7': 'Platform Ratings',
+}
+
+
+def optimize_png(png):
+    """Losslessly recompress matplotlib's PNG output (Pillow ships with matplotlib)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return png
+    out = io.BytesIO()
+    with Image.open(io.BytesIO(png)) as image:
+        image.save(out, format='PNG', optimize=True)
+    return out.getvalue() if out.tell() < len(png) else png
+
+
+# ============================================
+# BUILD
+# ============================================
+def build(out_dir=SITE_DIR):
+    """Render every chart into `out_dir` and write the manifest; returns it"""
+    import assets
+    import database
+    import keywords
+    import ratings
+
+    database.ensure_database()
+    pool = database.ConnectionPool(size=1)
+    with pool.connection() as conn:
+        version = database.data_version(conn)
+        facets = database.sentiment_facets(conn)
+    site = {'version': version, 'charts': {}}
+
+    def publish(name, data):
+        return static_server.publish(name, data, static_dir=out_dir)
+
+    store = assets.AssetStore()
+    for label, (_, page) in PAGE_CHARTS.items():
+        built = store.built(page)
+        if built is None:
+            site['charts'][label] = {'page': publish(page, store.get_text(page)), 'source': page}
+            continue
+        # Linked build (build_assets.py): nested pages as separate files
+        deps = [publish(name, store.read_built(name)) for name in built['deps']]
+        site['charts'][label] = {'page': publish(built['linked'], store.read_built(built['linked'])),
+                                 'deps': deps, 'source': page}
+
+    df = charts.load_sentiment(pool)
+    entry = {'facets': list(facets)}
+    png = charts.render_chart_02(df)
+    if png is not None:
+        entry['png'] = publish('02_sentiment_butterfly.png', optimize_png(png))
+    fig = charts.create_chart_02_plotly(df)
+    if fig is not None:
+        entry['plotly'] = publish('02_sentiment_butterfly.json', fig.to_json())
+    site['charts']['Chart 5'] = entry
+
+    onboarding_data = keywords.onboarding_data()
+    site['charts']['Chart 6'] = {
+        'png': publish('03_top_keywords.png', optimize_png(charts.render_chart_03(onboarding_data))),
+        'data': [list(item) for item in onboarding_data],
+    }
+
+    pivot, pivot_json = ratings.cached_pivot(pool)
+    entry = {'json': publish('platform_ratings.json', pivot_json)}
+    png = charts.render_chart_07(pivot)
+    if png is not None:
+        entry['png'] = publish('07_platform_ratings.png', optimize_png(png))
+    fig = charts.create_chart_07_ratings_plotly(pivot)
+    if fig is not None:
+        entry['plotly'] = publish('07_platform_ratings.json', fig.to_json())
+    site['charts']['Chart 7'] = entry
+    pool.close()
+
+    site['generated_at'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    _write(out_dir, 'index.html', render_index(site).encode('utf-8'))
+    _write(out_dir, MANIFEST_NAME, json.dumps(site, indent=2).encode('utf-8'))
+    return site
+
+
+def _write(out_dir, name, data):
+    from export_queue import write_atomic
+
+    write_atomic(os.path.join(out_dir, name), data)
+
+
+def site_files(site):
+    """Hashed file names referenced by a manifest"""
+    files = {f for entry in site['charts'].values() for key, f in entry.items()
+             if key in ('page', 'png', 'plotly', 'json')}
+    return files.union(*(entry.get('deps', ()) for entry in site['charts'].values()))
+
+
+def prune(out_dir, site):
+    """Delete hashed files (and their .gz/.br twins) not referenced by `site`"""
+    keep = site_files(site)
+    removed = 0
+    for name in os.listdir(out_dir):
+        base = re.sub(r'\.(gz|br)$', '', name)
+        if _HASHED.search(base) and base not in keep:
+            os.remove(os.path.join(out_dir, name))
+            removed += 1
+    return removed
+
+
+def render_index(site):
+    """The static shell: navigation, iframes for pages, Plotly (PNG fallback) for charts"""
+    nav, sections = [], []
+    for label, (title, _) in PAGE_CHARTS.items():
+        nav.append((label, title))
+        sections.append((label, title, f'<iframe src="{site["charts"][label]["page"]}" '
+                                        f'loading="lazy" title="{html.escape(title)}"></iframe>'))
+    for label, title in CHART_TITLES.items():
+        entry = site['charts'][label]
+        nav.append((label, title))
+        fallback = (f'<img src="{entry["png"]}" alt="{html.escape(label + ": " + title)}">'
+                    if 'png' in entry else '<p>No data available.</p>')
+        if 'plotly' in entry:
+            body = f'<div class="plot" data-figure="{entry["plotly"]}">{fallback}</div>'
+        else:
+            body = fallback
+        if label == 'Chart 6':
+            items = ''.join(f'<li>{html.escape(p)} — {c} mentions</li>' for p, c in entry['data'][:3])
+            body += f'<h3>Key Insights</h3><ul>{items}</ul>'
+        if 'json' in entry:
+            body += f'<p class="note"><a href="{entry["json"]}">Data (JSON)</a></p>'
+        sections.append((label, title, body))
+
+    nav_html = ''.join(f'<a href="#{label.replace(" ", "-").lower()}">{label}: {html.escape(title)}</a>'
+                       for label, title in nav)
+    sections_html = ''.join(
+        f'<section id="{label.replace(" ", "-").lower()}"><h2>{label}: {html.escape(title)}</h2>{body}</section>'
+        for label, title, body in sections)
+    try:
+        import plotly.offline
+    except ImportError:
+        plotly_script = ''  # no figure JSON was written either; the PNGs stay
+    else:
+        plotly_script = (f'<script src="https://cdn.plot.ly/plotly-'
+                         f'{plotly.offline.get_plotlyjs_version()}.min.js" async onload="drawPlots()"></script>')
+
+    return f'''<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Adyen Onboarding Research Dashboard</title>
+<style>
+body{{margin:0;font-family:Inter,Arial,sans-serif;background:{charts.ADYEN_BG};color:{charts.ADYEN_MIDNIGHT}}}
+nav{{position:fixed;top:0;bottom:0;width:260px;background:{charts.ADYEN_WHITE};border-right:1px solid {charts.ADYEN_BORDER};padding:1rem;box-sizing:border-box}}
+nav a{{display:block;padding:.4rem 0;color:{charts.ADYEN_MIDNIGHT};text-decoration:none;font-size:.9rem}}
+main{{margin-left:260px;padding:1rem 2rem}}
+section{{display:none}}section.active{{display:block}}
+iframe{{width:100%;height:700px;border:0;background:{charts.ADYEN_WHITE}}}
+img{{max-width:100%}}.plot{{background:{charts.ADYEN_WHITE};border-radius:8px}}
+.note,footer{{color:{charts.ADYEN_SECONDARY};font-size:.85rem}}
+@media (max-width:768px){{nav{{position:static;width:auto}}main{{margin:0;padding:.5rem}}}}
+</style></head><body>
+<nav><h1 style="font-size:1.3rem">Adyen Onboarding Research</h1>
+<p class="note">Evidence Dashboard v2.0<br>Focus: 2024-2026 Data</p>{nav_html}</nav>
+<main><h1>Adyen Onboarding Research Dashboard</h1>{sections_html}
+<footer>Snapshot generated {site["generated_at"]} | Dashboard by Serafima, February 2026</footer></main>
+{plotly_script}
+<script>
+function show(){{var id=location.hash.slice(1)||"chart-1";
+document.querySelectorAll("section").forEach(function(s){{s.classList.toggle("active",s.id===id)}});
+if(window.Plotly){{window.dispatchEvent(new Event("resize"))}}}}
+function drawPlots(){{document.querySelectorAll(".plot").forEach(function(el){{
+fetch(el.dataset.figure).then(function(r){{return r.json()}}).then(function(fig){{
+el.innerHTML="";Plotly.newPlot(el,fig.data,fig.layout,{{responsive:true,displaylogo:false}})}})}})}}
+window.addEventListener("hashchange",show);show();
+</script></body></html>
+'''
+
+
+# ============================================
+# SERVE (app.py snapshot mode)
+# ============================================
+class Snapshot:
+    """A prerendered site loaded for the app: file bytes and figures by chart label"""
+
+    def __init__(self, site_dir=SITE_DIR):
+        self.site_dir = site_dir
+        with open(os.path.join(site_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            self.site = json.load(f)
+        self._figures = {}
+        self._files = {}
+
+    def entry(self, label):
+        return self.site['charts'].get(label, {})
+
+    def read(self, name):
+        data = self._files.get(name)
+        if data is None:
+            with open(os.path.join(self.site_dir, name), 'rb') as f:
+                data = self._files[name] = f.read()
+        return data
+
+    def page(self, filename):
+        """Hashed name of an embedded page, or None when it was not prerendered"""
+        for entry in self.site['charts'].values():
+            if entry.get('source') == filename:
+                return entry['page']
+        return None
+
+    def png(self, label):
+        name = self.entry(label).get('png')
+        return self.read(name) if name else None
+
+    def figure(self, label):
+        """Plotly figure from the prerendered JSON (None without it or without plotly)"""
+        if label not in self._figures:
+            figure = None
+            name = self.entry(label).get('plotly')
+            if name:
+                try:
+                    import plotly.io
+                except ImportError:
+                    pass
+                else:
+                    figure = plotly.io.from_json(self.read(name).decode('utf-8'))
+            self._figures[label] = figure
+        return self._figures[label]
+
+
+def load_snapshot(site_dir=SITE_DIR):
+    """The snapshot in `site_dir`, or None when none has been prerendered"""
+    try:
+        return Snapshot(site_dir)
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Prerender the dashboard as a static site')
+    parser.add_argument('--out', default=SITE_DIR, help='output directory')
+    parser.add_argument('--prune', action='store_true', help='delete files from older snapshots')
+    args = parser.parse_args(argv)
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+
+    start = time.perf_counter()
+    site = build(args.out)
+    removed = prune(args.out, site) if args.prune else 0
+    print(f'{args.out}: {len(site_files(site))} chart files + index.html, {removed} stale files removed '
+          f'in {time.perf_counter() - start:.2f}s')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
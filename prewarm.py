@@ -0,0 +1,160 @@
+"""
+Background prewarm of the chart caches after a process start.
+
+Enabled with ADYEN_PREWARM=1. app.py registers one warm-up task per chart
+(database init plus the Chart 5-7 renders, or the decode/publish of a
+Chart 1-4 page) and starts the scheduler in the first script run, before
+any layout is drawn.
+The tasks fill the same process-wide caches that sessions read, on a small
+pool of daemon threads, so a live session never waits in a queue behind
+them. At worst it waits for the one render already in flight for its own
+chart, which it would otherwise have done itself.
+
+Charts are warmed most-requested first. The counts come from the
+ADYEN_METRICS_LOG history (one JSON line per rerun, written with or without
+ADYEN_INSTRUMENT, see instrumentation.py), which survives deploys, plus the
+reruns of this process. Charts never requested keep the menu order; with no
+history at all a warning is logged.
+
+Readiness is served as /ready on the static server: 200 once every task has
+finished (failed tasks included, so one broken chart cannot keep the
+replica out of rotation), 503 while warming. The JSON body lists the done,
+failed and pending charts. Point the load balancer's health check at it.
+
+Streamlit runs app.py only for a session, so a fresh replica needs one run
+to start the scheduler. With `server.scriptHealthCheckEnabled = true`, a
+startup probe on /_stcore/script-health-check does that without a browser.
+
+    ADYEN_PREWARM=1             warm the caches in the background
+    ADYEN_PREWARM_WORKERS       pool size (default 2)
+"""
+
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import instrumentation
+
+ENABLED = os.environ.get('ADYEN_PREWARM', '') not in ('', '0', 'false')
+WORKERS = max(1, int(os.environ.get('ADYEN_PREWARM_WORKERS', '2')))
+
+# Imported one at a time before the pool starts: two threads importing the same
+# package for the first time can see it half-initialized
+IMPORTS = ('numpy', 'pandas', 'matplotlib.pyplot', 'plotly.graph_objects')
+
+_current = None  # the process's Prewarmer, for /ready
+_log = logging.getLogger(__name__)
+
+
+def chart_counts(log_path=instrumentation.LOG_PATH):
+    """{chart: requests} from the metrics log plus this process's reruns not logged there"""
+    counts = {}
+    if log_path:
+        try:
+            with open(log_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        chart = json.loads(line).get('chart')
+                    except ValueError:
+                        continue  # a line cut off by a crash
+                    if chart:
+                        counts[chart] = counts.get(chart, 0) + 1
+        except OSError:
+            pass
+    if not log_path or log_path != instrumentation.LOG_PATH:  # else they are in the log already
+        for chart, n in instrumentation.rerun_counts().items():
+            counts[chart] = counts.get(chart, 0) + n
+    return counts
+
+
+def order(labels, counts):
+    """`labels` most-requested first; ties keep their given order"""
+    return sorted(labels, key=lambda label: -counts.get(label, 0))
+
+
+class Prewarmer:
+    """Runs warm-up tasks on a bounded pool and tracks readiness"""
+
+    def __init__(self, tasks, workers=WORKERS, counts=None):
+        counts = chart_counts() if counts is None else counts
+        if not counts:
+            _log.warning('No chart history%s: prewarming in menu order',
+                         '' if instrumentation.LOG_PATH else ' (set ADYEN_METRICS_LOG to keep one)')
+        self.tasks = {label: tasks[label] for label in order(tasks, counts)}
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._pending = list(self.tasks)
+        self._done = {}  # label -> seconds
+        self._failed = {}  # label -> error
+        self._started = None
+        self._finished = None
+
+    def _run(self, label):
+        start = time.perf_counter()
+        try:
+            self.tasks[label]()
+        except Exception as e:
+            with self._lock:
+                self._failed[label] = f'{type(e).__name__}: {e}'
+        else:
+            with self._lock:
+                self._done[label] = round(time.perf_counter() - start, 3)
+        finally:
+            with self._lock:
+                self._pending.remove(label)
+                if not self._pending:
+                    self._finished = time.perf_counter()
+
+    def start(self):
+        """Queue every task, most-requested first; returns immediately"""
+        with self._lock:
+            if self._started is not None:
+                return self
+            self._started = time.perf_counter()
+            if not self._pending:
+                self._finished = self._started
+        threading.Thread(target=self._schedule, name='prewarm', daemon=True).start()
+        return self
+
+    def _schedule(self):
+        for module in IMPORTS:
+            try:
+                if importlib.util.find_spec(module.split('.')[0]) is not None:
+                    importlib.import_module(module)
+            except Exception:
+                pass  # the task that needs it reports the failure
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='prewarm')
+        for label in self.tasks:
+            pool.submit(self._run, label)
+        pool.shutdown(wait=False)  # worker threads exit once the queue is drained
+
+    @property
+    def ready(self):
+        return self._finished is not None
+
+    def state(self):
+        with self._lock:
+            elapsed = None
+            if self._started is not None:
+                elapsed = round((self._finished or time.perf_counter()) - self._started, 3)
+            return {'ready': self._finished is not None, 'order': list(self.tasks),
+                    'done': dict(self._done), 'failed': dict(self._failed),
+                    'pending': list(self._pending), 'seconds': elapsed}
+
+
+def start(tasks, workers=WORKERS):
+    """Start the process-wide prewarm (once) and return it"""
+    global _current
+    if _current is None:
+        _current = Prewarmer(tasks, workers).start()
+    return _current
+
+
+def current():
+    """The process's Prewarmer, or None when prewarm never started"""
+    return _current
@@ -0,0 +1,133 @@
+"""
+Platform × category pivots of the platform_ratings table.
+
+The table is read once per data version into NumPy matrices (rows =
+platforms, columns = categories, NaN = not rated) and kept, together with
+their JSON serialization, in a small per-process cache. Chart 7 and the
+/api/platform-ratings.json endpoint of the static server both read from it,
+so internal tools can pull the numbers in bulk without touching SQLite or
+scraping the dashboard.
+"""
+
+import json
+import threading
+from collections import OrderedDict, namedtuple
+
+import database
+
+MAX_VERSIONS = 4
+
+# platforms/categories: tuples of labels; scores, max_scores, review_counts:
+# float arrays of shape (platforms, categories); date_ranges: nested tuples
+RatingsPivot = namedtuple('RatingsPivot',
+                          'version platforms categories scores max_scores review_counts date_ranges')
+
+_cache = OrderedDict()  # data version -> (RatingsPivot, JSON bytes)
+_lock = threading.Lock()
+_pool = None
+
+
+def build_pivot(rows, version=''):
+    """
+    RatingsPivot from (platform, category, score, max_score, review_count,
+    date_range) rows. Categories are ordered by how many platforms rate them.
+    """
+    import numpy as np
+
+    platforms = tuple(sorted({r[0] for r in rows}))
+    coverage = {}
+    for r in rows:
+        coverage[r[1]] = coverage.get(r[1], 0) + 1
+    categories = tuple(sorted(coverage, key=lambda c: (-coverage[c], c)))
+    p_index = {p: i for i, p in enumerate(platforms)}
+    c_index = {c: j for j, c in enumerate(categories)}
+
+    shape = (len(platforms), len(categories))
+    scores = np.full(shape, np.nan)
+    max_scores = np.full(shape, np.nan)
+    review_counts = np.full(shape, np.nan)
+    date_ranges = [[None] * len(categories) for _ in platforms]
+    for platform, category, score, max_score, review_count, date_range in rows:
+        i, j = p_index[platform], c_index[category]
+        scores[i, j] = np.nan if score is None else score
+        max_scores[i, j] = np.nan if max_score is None else max_score
+        review_counts[i, j] = np.nan if review_count is None else review_count
+        date_ranges[i][j] = date_range
+
+    for a in (scores, max_scores, review_counts):
+        a.setflags(write=False)  # shared between sessions
+    return RatingsPivot(version, platforms, categories, scores, max_scores, review_counts,
+                        tuple(tuple(r) for r in date_ranges))
+
+
+def _matrix(a):
+    return [[None if v != v else v for v in row] for row in a.tolist()]  # NaN -> null
+
+
+def pivot_json(pivot):
+    """The pivot as compact JSON bytes; missing cells are null"""
+    return json.dumps({
+        'version': pivot.version,
+        'platforms': list(pivot.platforms),
+        'categories': list(pivot.categories),
+        'scores': _matrix(pivot.scores),
+        'max_scores': _matrix(pivot.max_scores),
+        'review_counts': _matrix(pivot.review_counts),
+        'date_ranges': [list(r) for r in pivot.date_ranges],
+    }, separators=(',', ':')).encode('utf-8')
+
+
+def _load(conn, version):
+    rows = conn.execute(
+        'SELECT platform, category, score, max_score, review_count, date_range '
+        'FROM platform_ratings').fetchall()
+    pivot = build_pivot(rows, version)
+    return pivot, pivot_json(pivot)
+
+
+def _cached(version):
+    with _lock:
+        entry = _cache.get(version)
+        if entry is not None:
+            _cache.move_to_end(version)
+        return entry
+
+
+def _remember(version, entry):
+    with _lock:
+        _cache[version] = entry
+        while len(_cache) > MAX_VERSIONS:
+            _cache.popitem(last=False)
+    return entry
+
+
+def cached_pivot(pool, version=None, load_rows=None):
+    """
+    (RatingsPivot, JSON bytes) for the current data version. Callers that
+    already know the version pass it and skip the query on a cache hit;
+    `load_rows()` may supply the rows from another store (None = use SQLite).
+    """
+    if version is not None:
+        entry = _cached(version)
+        if entry is not None:
+            return entry
+        rows = load_rows() if load_rows is not None else None
+        if rows is not None:
+            pivot = build_pivot(rows, version)
+            return _remember(version, (pivot, pivot_json(pivot)))
+    with pool.connection() as conn:
+        version = database.data_version(conn)
+        entry = _cached(version)
+        if entry is not None:
+            return entry
+        entry = _load(conn, version)
+    return _remember(version, entry)
+
+
+def default_pool():
+    """Read-only pool for callers outside the app (the static server's API)"""
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = database.ConnectionPool(database.DB_PATH, size=2)
+        return _pool
@@ -0,0 +1,123 @@
+"""
+Render cache for the matplotlib charts.
+
+Finished PNG bytes are kept in a bounded in-memory LRU and mirrored to a
+disk tier, keyed by a hash of everything that affects the pixels (input
+data, style constants, DPI). A rerun with unchanged inputs is served from
+memory and never touches matplotlib.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+CACHE_DIR = os.path.join('adyen_charts', '.render_cache')
+
+
+def make_key(*parts):
+    """Build a stable cache key from bytes, strings and plain Python values."""
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (bytes, bytearray, memoryview)):
+            h.update(bytes(part))
+        else:
+            h.update(repr(part).encode('utf-8'))
+        h.update(b'\x00')
+    return h.hexdigest()
+
+
+class RenderCache:
+    """Two-tier (memory + disk) LRU cache of rendered chart bytes."""
+
+    def __init__(self, max_entries=32, cache_dir=CACHE_DIR, max_disk_entries=256):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.png')
+
+    def _remember(self, key, data):
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        """Return cached bytes for `key`, or None. Counts hits and misses."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        path = self._disk_path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # keep disk LRU order in mtime
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self._remember(key, data)
+            self.disk_hits += 1
+        return data
+
+    def put(self, key, data):
+        """Store bytes in memory and on disk (atomically), then prune the disk tier."""
+        with self._lock:
+            self._remember(key, data)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f'{self._disk_path(key)}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._disk_path(key))
+            self._prune_disk()
+        except OSError:
+            pass  # disk tier is best-effort; memory tier still serves
+
+    def get_or_render(self, key, render):
+        """Return cached bytes, calling `render()` only on a miss in both tiers."""
+        data = self.get(key)
+        if data is None:
+            data = render()
+            if data is not None:
+                self.put(key, data)
+        return data
+
+    def _prune_disk(self):
+        files = [os.path.join(self.cache_dir, n) for n in os.listdir(self.cache_dir)
+                 if n.endswith('.png')]
+        if len(files) <= self.max_disk_entries:
+            return
+        files.sort(key=lambda p: os.path.getmtime(p))
+        for path in files[:len(files) - self.max_disk_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Drop the memory tier (the disk tier is left for other processes)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+            }
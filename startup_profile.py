@@ -0,0 +1,156 @@
+"""
+Import-time and cold-start report for the dashboard.
+
+    python startup_profile.py [--top 25] [--depth 1] [--json]
+
+Each measurement runs in a fresh interpreter so nothing is pre-imported:
+
+- import times: `python -X importtime` over the app's own modules, listed
+  by cumulative time (the self time is shown too)
+- cold start: time of the first script run (first paint) and of the first
+  view of every chart, plus which heavy libraries each one pulled in
+"""
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'plotly', 'pyarrow']
+
+CHART_OPTIONS = [
+    "Chart 1: Adyen Onboarding Demo",
+    "Chart 2: PM Decision Simulation",
+    "Chart 3: The Full Case",
+    "Chart 4: Research Intelligence",
+    "Chart 5: Sentiment Analysis",
+    "Chart 6: Top Onboarding Issues",
+    "Chart 7: Platform Ratings",
+]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def app_modules(entry='app'):
+    """
+    streamlit plus every local module imported at module level by app.py,
+    followed through the local modules' own module-level imports: what a
+    cold start pays before the first line of the script runs.
+    """
+    found, pending = [], [entry]
+    while pending:
+        name = pending.pop(0)
+        with open(os.path.join(HERE, f'{name}.py'), encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for imported in names:
+                top = imported.split('.')[0]
+                if top not in found and os.path.exists(os.path.join(HERE, f'{top}.py')):
+                    found.append(top)
+                    pending.append(top)
+    return ['streamlit'] + sorted(found)
+
+
+APP_MODULES = app_modules()
+
+# Runs in the child interpreter; prints one JSON line
+_COLD_START_SNIPPET = '''
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+chart = sys.argv[1]
+t0 = time.perf_counter()
+at = AppTest.from_file("app.py", default_timeout=300)
+at.run()
+first_paint = time.perf_counter() - t0
+before = {m for m in HEAVY if m in sys.modules}
+view = 0.0
+if chart != at.selectbox[0].value:
+    t1 = time.perf_counter()
+    at.selectbox[0].set_value(chart).run()
+    view = time.perf_counter() - t1
+print(json.dumps({
+    "chart": chart,
+    "first_paint_s": round(first_paint, 4),
+    "first_view_s": round(view or first_paint, 4),
+    "errors": [str(e.value) for e in at.exception],
+    "heavy_at_first_paint": sorted(before),
+    "heavy_after_view": sorted(m for m in HEAVY if m in sys.modules),
+}))
+'''
+
+
+def import_times(modules=APP_MODULES, max_depth=1):
+    """
+    [(module, self_ms, cumulative_ms)] from `python -X importtime`, slowest
+    first; nested imports deeper than `max_depth` are folded into their parent.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {", ".join(modules)}'],
+        cwd=HERE, capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if (len(name) - len(name.lstrip()) - 1) // 2 > max_depth:
+            continue
+        rows.append((name.rstrip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    rows.sort(key=lambda r: r[2], reverse=True)
+    return rows
+
+
+def cold_start(chart):
+    """First-paint and first-view timings for one chart in a fresh process"""
+    snippet = f'HEAVY = {HEAVY_MODULES!r}\n' + _COLD_START_SNIPPET
+    env = dict(os.environ)
+    env.setdefault('ADYEN_CLARITY_ID', '')  # no analytics tag in measurements
+    proc = subprocess.run([sys.executable, '-c', snippet, chart],
+                          cwd=HERE, capture_output=True, text=True, env=env)
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith('{'):
+            return json.loads(line)
+    return {'chart': chart, 'errors': [proc.stderr.strip()[-500:]]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Import-time and cold-start report')
+    parser.add_argument('--top', type=int, default=25, help='modules to list')
+    parser.add_argument('--depth', type=int, default=1, help='import nesting depth to show')
+    parser.add_argument('--json', action='store_true', help='print machine-readable JSON')
+    args = parser.parse_args(argv)
+
+    imports = import_times(max_depth=args.depth)
+    starts = [cold_start(chart) for chart in CHART_OPTIONS]
+
+    if args.json:
+        print(json.dumps({
+            'imports': [{'module': m, 'self_ms': s, 'cumulative_ms': c} for m, s, c in imports],
+            'cold_start': starts,
+        }, indent=2))
+        return 0
+
+    print(f'{"module":<48} {"self ms":>9} {"cumul ms":>9}')
+    for name, self_ms, cumulative_ms in imports[:args.top]:
+        print(f'{name:<48} {self_ms:>9.1f} {cumulative_ms:>9.1f}')
+
+    print()
+    print(f'{"chart":<36} {"paint s":>8} {"view s":>8}  heavy modules after view')
+    for s in starts:
+        if s.get('errors'):
+            print(f'{s["chart"]:<36} ERROR {s["errors"][0][:80]}')
+            continue
+        print(f'{s["chart"]:<36} {s["first_paint_s"]:>8.3f} {s["first_view_s"]:>8.3f}  '
+              f'{", ".join(s["heavy_after_view"]) or "-"}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
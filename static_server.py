@@ -0,0 +1,279 @@
+"""
+Static, cacheable serving of the embedded HTML pages (Charts 1-4).
+
+Enabled with ADYEN_STATIC_PAGES=1. Each page is published once per content
+version under a content-hashed name (adyen_chart4.3f2a9c1b7e04.html) together
+with precompressed .gz (and .br when the `brotli` package is installed)
+variants. A small threaded HTTP server serves them with ETag, Vary and
+`Cache-Control: immutable`, and the app embeds them with an iframe `src`,
+so browsers and a reverse proxy cache them and revisits cost ~nothing.
+The same server exposes the rerun instrumentation at /metrics and the
+platform ratings pivot at /api/platform-ratings.json (ADYEN_DATA_API=1
+starts it without static pages) and the prewarm readiness at /ready.
+
+    ADYEN_STATIC_PORT   port of the built-in server (default 8765); when it
+                        is taken (another process on this host), the server
+                        binds a free port instead and logs it
+    ADYEN_STATIC_URL    public base URL when served through a proxy/CDN;
+                        unset, pages link to the viewer's host name on the
+                        port above (plain http, so set it for https sites)
+"""
+
+import errno
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENABLED = os.environ.get('ADYEN_STATIC_PAGES', '') not in ('', '0', 'false')
+API_ENABLED = os.environ.get('ADYEN_DATA_API', '') not in ('', '0', 'false')
+HOST = os.environ.get('ADYEN_STATIC_HOST', '0.0.0.0')
+PORT = int(os.environ.get('ADYEN_STATIC_PORT', '8765'))
+# Public base URL; without it iframes point at the viewer's host name on PORT
+BASE_URL = os.environ.get('ADYEN_STATIC_URL', '').rstrip('/')
+STATIC_DIR = os.path.join('adyen_charts', 'static')
+
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.json': 'application/json',
+    '.png': 'image/png',
+    '.svg': 'image/svg+xml',
+}
+COMPRESSIBLE = ('.html', '.css', '.js', '.json', '.svg')
+
+# stem.<12 hex>.ext, as written by publish(); anything else must be revalidated
+_HASHED = re.compile(r'\.[0-9a-f]{12}\.')
+_log = logging.getLogger(__name__)
+_warned = set()
+_port = PORT  # port the server actually listens on, see start_server()
+
+
+def _warn_once(key, message, *args):
+    if key not in _warned:
+        _warned.add(key)
+        _log.warning(message, *args)
+
+
+def _write_if_missing(path, data):
+    if os.path.exists(path):
+        return
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def publish(name, data, static_dir=STATIC_DIR):
+    """
+    Write `data` as <stem>.<hash><ext> plus compressed variants and return
+    the hashed file name. Already-published versions are left untouched; a
+    name that already carries the hash of `data` (a file from another
+    static directory, e.g. the asset build) is kept as it is.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    stem, ext = os.path.splitext(name)
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    hashed = name if stem.endswith('.' + digest) else f'{stem}.{digest}{ext}'
+    os.makedirs(static_dir, exist_ok=True)
+    path = os.path.join(static_dir, hashed)
+    _write_if_missing(path, data)
+    if ext in COMPRESSIBLE:
+        _write_if_missing(path + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            _write_if_missing(path + '.br', brotli.compress(data, quality=11))
+    return hashed
+
+
+def base_url_for(page_url=None):
+    """
+    Base URL viewers reach the server at: ADYEN_STATIC_URL, else the host
+    name of the page they are on (`page_url`) with the server's port.
+    """
+    if BASE_URL:
+        return BASE_URL
+    parts = urlsplit(page_url or '')
+    host = parts.hostname or 'localhost'
+    if ':' in host:
+        host = f'[{host}]'  # IPv6 literal
+    if parts.scheme == 'https':
+        _warn_once('https', 'ADYEN_STATIC_URL is not set but the app is served over https: '
+                   'browsers block the http://%s:%d pages as mixed content', host, _port)
+    return f'http://{host}:{_port}'
+
+
+def url_for(hashed_name, base_url=None):
+    return f'{base_url or base_url_for()}/{hashed_name}'
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    """Serves published files with precompression, ETag and immutable caching."""
+
+    static_dir = STATIC_DIR
+    server_version = 'AdyenStatic/1.0'
+    ROUTES = {
+        '/metrics': '_send_metrics',
+        '/ready': '_send_ready',
+        '/api/platform-ratings.json': '_send_ratings',
+    }
+
+    def log_message(self, format, *args):
+        pass  # keep Streamlit's console readable
+
+    def _resolve(self):
+        name = self.path.split('?', 1)[0].lstrip('/') or 'index.html'
+        if not name or '/' in name or name.startswith('.') or name.endswith(('.gz', '.br')):
+            return None
+        path = os.path.join(self.static_dir, name)
+        return path if os.path.isfile(path) else None
+
+    def _pick_encoding(self, path):
+        accepted = self.headers.get('Accept-Encoding', '')
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if encoding in accepted and os.path.exists(path + suffix):
+                return encoding, path + suffix
+        return None, path
+
+    def _send_metrics(self, include_body):
+        import instrumentation
+
+        body = instrumentation.prometheus_text().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def _send_ready(self, include_body):
+        import prewarm
+
+        warmer = prewarm.current()
+        state = warmer.state() if warmer is not None else {'ready': True}
+        body = json.dumps(state).encode('utf-8')
+        self.send_response(200 if state['ready'] else 503)
+        self.send_header('Content-Type', CONTENT_TYPES['.json'])
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def _send_ratings(self, include_body):
+        import ratings
+
+        try:
+            _, body = ratings.cached_pivot(ratings.default_pool())
+        except Exception:  # database not created yet
+            self.send_error(503)
+            return
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            return
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, mtime=0)
+            headers['Content-Encoding'] = 'gzip'
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPES['.json'])
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def _send(self, include_body):
+        route = self.ROUTES.get(self.path.split('?', 1)[0])
+        if route:
+            getattr(self, route)(include_body)
+            return
+        path = self._resolve()
+        if path is None:
+            self.send_error(404)
+            return
+
+        encoding, file_path = self._pick_encoding(path)
+        hashed = _HASHED.search(os.path.basename(path))
+        if hashed:
+            tag = os.path.basename(path)  # the file name already carries the content hash
+        else:
+            st = os.stat(file_path)
+            tag = f'{st.st_mtime_ns:x}-{st.st_size:x}'
+        etag = f'"{tag}{"-" + encoding if encoding else ""}"'
+        headers = {
+            'ETag': etag,
+            'Cache-Control': 'public, max-age=31536000, immutable' if hashed else 'no-cache',
+            'Vary': 'Accept-Encoding',
+            'X-Content-Type-Options': 'nosniff',
+        }
+
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            return
+
+        with open(file_path, 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPES.get(os.path.splitext(path)[1],
+                                                           'application/octet-stream'))
+        self.send_header('Content-Length', str(len(body)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._send(include_body=True)
+
+    def do_HEAD(self):
+        self._send(include_body=False)
+
+
+def start_server(host=HOST, port=PORT, static_dir=STATIC_DIR):
+    """
+    Start the static server on a daemon thread and return it. When `port`
+    is in use, a free port is bound instead: /ready and /metrics must
+    describe this process, not whichever one owns `port`.
+    """
+    global _port
+    handler = type('Handler', (StaticHandler,), {'static_dir': static_dir})
+    try:
+        httpd = ThreadingHTTPServer((host, port), handler)
+    except OSError as e:
+        if e.errno != errno.EADDRINUSE:
+            raise
+        httpd = ThreadingHTTPServer((host, 0), handler)
+        _log.warning('Static server port %d is in use (another process on this host?): this '
+                     'process serves its pages, /ready and /metrics on port %d instead',
+                     port, httpd.server_address[1])
+    _port = httpd.server_address[1]
+    if ENABLED and not BASE_URL:
+        _warn_once('base_url', 'ADYEN_STATIC_URL is not set: pages are linked at the '
+                   "viewer's host name on port %d; set it behind a proxy, CDN or https", _port)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, name='static-server', daemon=True).start()
+    return httpd
@@ -0,0 +1,188 @@
+"""
+Tag-cloud layout shared by the matplotlib and Plotly versions of Chart 6.
+
+Font size follows the mention count. Phrases are placed largest first at the
+free spot closest to the centre of an occupancy bitmap (one cell per
+CELL points), so tags never overlap whatever their number. Free spots for a
+tag are found for the whole bitmap at once from a summed-area table, so a
+placement is a few NumPy array operations rather than a spiral search.
+
+When a phrase finds no spot, the whole cloud is laid out again with every
+size scaled down, until all phrases fit or the sizes reach FLOOR_SIZE.
+Phrases that still do not fit are logged and returned by `dropped()`.
+
+Text is measured from per-character advance widths, read from the font once
+per weight and cached, so laying out hundreds of phrases never draws text.
+Layouts are cached per input.
+"""
+
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+
+from render_cache import make_key
+
+# Layout area in points (matches the 14 x 6 inch figure minus title/footer)
+WIDTH, HEIGHT = 968.0, 354.0
+CELL = 3.0           # bitmap resolution, points
+PADDING = 4.0        # free space kept around each tag at MIN_SIZE and up, points
+MIN_SIZE, MAX_SIZE = 9.0, 26.0
+FLOOR_SIZE = 4.0     # smallest size drawn, however many phrases there are
+FILL = 0.45          # share of the area the tags may cover before sizes are scaled down
+LINE_HEIGHT = 1.2    # tag box height / font size
+BOLD_SHARE = 0.15    # top share of phrases drawn bold
+SHRINK, MAX_SHRINKS = 0.85, 4
+
+REVISION = 2         # bumped when the placement rules change, so old cached renders are not reused
+
+LAYOUT_KEY = (REVISION, WIDTH, HEIGHT, CELL, PADDING, MIN_SIZE, MAX_SIZE, FLOOR_SIZE, FILL,
+              LINE_HEIGHT, BOLD_SHARE, SHRINK, MAX_SHRINKS)
+MAX_CACHED = 32
+
+_log = logging.getLogger(__name__)
+
+# x, y: tag centre as a fraction of the layout area (y = 0 at the bottom)
+Placement = namedtuple('Placement', 'phrase count x y fontsize weight')
+
+_advances = {}  # weight -> {char: advance at 1 pt}
+_layouts = OrderedDict()
+_lock = threading.Lock()
+
+
+def _advance_table(weight):
+    table = _advances.get(weight)
+    if table is None:
+        from matplotlib import font_manager
+        from matplotlib.ft2font import FT2Font
+
+        font = FT2Font(font_manager.findfont(font_manager.FontProperties(weight=weight)))
+        font.set_size(100, 72)  # 100 pt at 72 dpi: 1 pixel = 1 point
+        table = {}
+        for code in list(range(0x20, 0x7f)) + list(range(0xa0, 0x250)) + list(range(0x2010, 0x2027)):
+            if font.get_char_index(code):
+                table[chr(code)] = font.load_char(code).linearHoriAdvance / 65536 / 100
+        table[None] = table.get('M', 0.9)  # fallback for characters outside the table
+        _advances[weight] = table
+    return table
+
+
+def text_width(text, fontsize, weight='normal'):
+    """Advance width of `text` in points"""
+    table = _advance_table(weight)
+    fallback = table[None]
+    return fontsize * sum(table.get(ch, fallback) for ch in text)
+
+
+def font_sizes(counts):
+    """Linear count → size mapping between MIN_SIZE and MAX_SIZE"""
+    lo, hi = min(counts), max(counts)
+    if hi == lo:
+        return [MAX_SIZE] * len(counts)
+    return [MIN_SIZE + (c - lo) / (hi - lo) * (MAX_SIZE - MIN_SIZE) for c in counts]
+
+
+def _padding(size):
+    """Free space around a tag; shrinks with tags smaller than MIN_SIZE"""
+    return PADDING * min(size / MIN_SIZE, 1.0)
+
+
+def _fit_sizes(items, sizes, weights):
+    """Scale all sizes down together when the tags would cover more than FILL"""
+    area = sum((text_width(p, size, w) + 2 * _padding(size)) *
+               (size * LINE_HEIGHT + 2 * _padding(size))
+               for (p, _), size, w in zip(items, sizes, weights))
+    if area <= FILL * WIDTH * HEIGHT:
+        return sizes
+    scale = (FILL * WIDTH * HEIGHT / area) ** 0.5
+    return [max(size * scale, FLOOR_SIZE) for size in sizes]
+
+
+def _place(items, sizes, weights):
+    """(placements, dropped phrases) for one pass over the bitmap"""
+    import numpy as np
+
+    cols, rows = int(WIDTH // CELL), int(HEIGHT // CELL)
+    # Summed-area table of the occupancy bitmap: sat[i, j] = occupied cells above and left of (i, j)
+    sat = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+    ys, xs = np.arange(rows, dtype=np.float32), np.arange(cols, dtype=np.float32)
+    # Elliptic distance so the cloud fills the wide area instead of a circle
+    aspect = cols / rows
+
+    placements, dropped = [], []
+    failed = []  # (w, h) boxes with no free spot; the bitmap only fills up, so they stay full
+    for (phrase, count), size, weight in zip(items, sizes, weights):
+        for _ in range(MAX_SHRINKS + 1):
+            pad = _padding(size)
+            w = int(np.ceil((text_width(phrase, size, weight) + 2 * pad) / CELL))
+            h = int(np.ceil((size * LINE_HEIGHT + 2 * pad) / CELL))
+            if w <= cols and h <= rows and not any(w >= fw and h >= fh for fw, fh in failed):
+                # Occupied cells inside every w x h window, from the summed-area table
+                window = sat[h:, w:] - sat[:-h, w:] - sat[h:, :-w] + sat[:-h, :-w]
+                free = window == 0
+                if free.any():
+                    dy = (ys[:rows - h + 1] + (h - rows) / 2) ** 2
+                    dx = ((xs[:cols - w + 1] + (w - cols) / 2) / aspect) ** 2
+                    distance = np.where(free, dy[:, None] + dx[None, :], np.inf)
+                    top, left = np.unravel_index(np.argmin(distance), distance.shape)
+                    # The window was empty, so filling it adds a clipped ramp to the table
+                    sat[top + 1:, left + 1:] += np.outer(
+                        np.minimum(np.arange(1, rows - top + 1), h),
+                        np.minimum(np.arange(1, cols - left + 1), w)).astype(np.int32)
+                    placements.append(Placement(
+                        phrase, count,
+                        (left + w / 2) / cols,
+                        1 - (top + h / 2) / rows,
+                        round(size, 2), weight))
+                    break
+                failed.append((w, h))
+            if size <= FLOOR_SIZE:
+                dropped.append(phrase)
+                break
+            size = max(size * SHRINK, FLOOR_SIZE)
+        else:
+            dropped.append(phrase)
+    return placements, dropped
+
+
+def _layout(items):
+    """(placements, dropped phrases), shrinking the whole cloud until every phrase fits"""
+    items = sorted(items, key=lambda item: -item[1])
+    n_bold = max(1, round(len(items) * BOLD_SHARE)) if items else 0
+    weights = ['bold' if rank < n_bold else 'normal' for rank in range(len(items))]
+    sizes = _fit_sizes(items, font_sizes([c for _, c in items]), weights) if items else []
+
+    while True:
+        placements, dropped = _place(items, sizes, weights)
+        if not dropped or all(size <= FLOOR_SIZE for size in sizes):
+            break
+        sizes = [max(size * SHRINK, FLOOR_SIZE) for size in sizes]
+    if dropped:
+        _log.warning('Chart 6: %d of %d phrases do not fit the tag cloud at %g pt and are '
+                     'left out: %s', len(dropped), len(items), FLOOR_SIZE,
+                     ', '.join(dropped[:10]) + (', ...' if len(dropped) > 10 else ''))
+    return placements, dropped
+
+
+def _cached_layout(onboarding_data):
+    items = tuple((str(phrase), int(count)) for phrase, count in onboarding_data)
+    key = make_key(items, LAYOUT_KEY)
+    with _lock:
+        if key in _layouts:
+            _layouts.move_to_end(key)
+            return _layouts[key]
+    result = _layout(items)
+    with _lock:
+        _layouts[key] = result
+        while len(_layouts) > MAX_CACHED:
+            _layouts.popitem(last=False)
+    return result
+
+
+def layout(onboarding_data):
+    """[Placement] for [(phrase, count)], largest first; cached per input"""
+    return _cached_layout(onboarding_data)[0]
+
+
+def dropped(onboarding_data):
+    """Phrases of `onboarding_data` that did not fit even at FLOOR_SIZE, largest first"""
+    return _cached_layout(onboarding_data)[1]